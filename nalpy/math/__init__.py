@@ -65,7 +65,51 @@ from nalpy.math._c_extensions.functions import move_towards as move_towards
 from nalpy.math._c_extensions.functions import move_towards_angle as move_towards_angle
 from nalpy.math._c_extensions.functions import ping_pong as ping_pong
 
+from nalpy.math._c_extensions.functions import round_to_nearest_n as round_to_nearest_n
+from nalpy.math._c_extensions.functions import floor_to_nearest_n as floor_to_nearest_n
+from nalpy.math._c_extensions.functions import ceil_to_nearest_n as ceil_to_nearest_n
+from nalpy.math._c_extensions.functions import round_to_digits as round_to_digits
+from nalpy.math._c_extensions.functions import floor_to_digits as floor_to_digits
+from nalpy.math._c_extensions.functions import ceil_to_digits as ceil_to_digits
+from nalpy.math._c_extensions.functions import round_to_nearest_n_to_digits as round_to_nearest_n_to_digits
+from nalpy.math._c_extensions.functions import floor_to_nearest_n_to_digits as floor_to_nearest_n_to_digits
+from nalpy.math._c_extensions.functions import ceil_to_nearest_n_to_digits as ceil_to_nearest_n_to_digits
+
 from nalpy.math._c_extensions.functions import kahan_sum as kahan_sum
+
+from nalpy.math._c_extensions.reductions import sum as sum
+from nalpy.math._c_extensions.reductions import mean as mean
+from nalpy.math._c_extensions.reductions import variance as variance
+from nalpy.math._c_extensions.reductions import dot as dot
+from nalpy.math._c_extensions.reductions import norm as norm
+from nalpy.math._c_extensions.reductions import CompensatedStats as CompensatedStats
+
+from nalpy.math._c_extensions.functions import remap_many as remap_many
+from nalpy.math._c_extensions.functions import remap01_many as remap01_many
+from nalpy.math._c_extensions.functions import clamp_many as clamp_many
+from nalpy.math._c_extensions.functions import clamp01_many as clamp01_many
+from nalpy.math._c_extensions.functions import delta_angle_many as delta_angle_many
+from nalpy.math._c_extensions.functions import sign_many as sign_many
+
+from nalpy.math._c_extensions.functions import lerp_many as lerp_many
+from nalpy.math._c_extensions.functions import lerp_unclamped_many as lerp_unclamped_many
+from nalpy.math._c_extensions.functions import inverse_lerp_many as inverse_lerp_many
+from nalpy.math._c_extensions.functions import smooth_step_many as smooth_step_many
+from nalpy.math._c_extensions.functions import move_towards_many as move_towards_many
+from nalpy.math._c_extensions.functions import ping_pong_many as ping_pong_many
+
+from nalpy.math._c_extensions.functions import round_to_nearest_n_many as round_to_nearest_n_many
+from nalpy.math._c_extensions.functions import floor_to_nearest_n_many as floor_to_nearest_n_many
+from nalpy.math._c_extensions.functions import ceil_to_nearest_n_many as ceil_to_nearest_n_many
+from nalpy.math._c_extensions.functions import round_to_digits_many as round_to_digits_many
+from nalpy.math._c_extensions.functions import floor_to_digits_many as floor_to_digits_many
+from nalpy.math._c_extensions.functions import ceil_to_digits_many as ceil_to_digits_many
+from nalpy.math._c_extensions.functions import round_to_nearest_n_to_digits_many as round_to_nearest_n_to_digits_many
+from nalpy.math._c_extensions.functions import floor_to_nearest_n_to_digits_many as floor_to_nearest_n_to_digits_many
+from nalpy.math._c_extensions.functions import ceil_to_nearest_n_to_digits_many as ceil_to_nearest_n_to_digits_many
+
+from nalpy.math._c_extensions.functions import closest_many as closest_many
+from nalpy.math._c_extensions.functions import furthest_many as furthest_many
 #endregion
 
 # Public component imports at the bottom
@@ -123,90 +167,65 @@ def is_negative_inf(__x: __typing.SupportsFloat) -> bool:
     return isinf(x) and x < 0 # faster than f == NEGATIVE_INFINITY, supposedly
 #endregion
 
-#region Rounding
-#region Nearest n
-def round_to_nearest_n(__x: __typing.SupportsFloat, n: int) -> int:
-    """
-    Round a number to the nearest multiple of ``n``.
-    When a number is halfway between two multiples of n, it's rounded toward the nearest number that's away from zero.
-    """
-    if n == 0: # Prevent division by zero. Any multiple of zero is always zero.
-        return 0
-    return round(float(__x) / n) * n
-
-def floor_to_nearest_n(__x: __typing.SupportsFloat, n: int) -> int:
-    """Floor a number to the nearest multiple of ``n``."""
-    if n == 0: # Prevent division by zero. Any multiple of zero is always zero.
-        return 0
-    return floor(float(__x) / n) * n
-
-def ceil_to_nearest_n(__x: __typing.SupportsFloat, n: int) -> int:
-    """Ceil a number to the nearest multiple of ``n``."""
-    if n == 0: # Prevent division by zero. Any multiple of zero is always zero.
-        return 0
-    return ceil(float(__x) / n) * n
-#endregion
-
-#region Round to digits
-def ceil_to_digits(__x: __typing.SupportsFloat, digits: int = 0) -> float:
-    """Return the ceiling of x as a float with specified decimal accuracy."""
-    pow10: float = pow(10.0, digits)
-    return ceil(float(__x) * pow10) / pow10 # dividing changes output to float
-
-def floor_to_digits(__x: __typing.SupportsFloat, digits: int = 0) -> float:
-    """Return the floor of x as a float with specified decimal accuracy."""
-    pow10: float = pow(10.0, digits)
-    return floor(float(__x) * pow10) / pow10 # dividing changes output to float
-
-
-def round_to_digits(__x: __typing.SupportsFloat, digits: int = 0) -> float:
+#region Iterables
+def closest(value: int | float, iterable: __typing.Iterable[_NumberT]) -> _NumberT:
     """
-    Round a number to a given precision in decimal digits.
-    When a number is halfway between two others, it's rounded toward the nearest number that's away from zero.
+    Return the value in the iterable that is closest to the given value.
 
-    ``digits`` may be negative.
+    For many values use ``closest_many`` or build a ``SortedValues`` of the candidates instead.
     """
-    pow10: float = pow(10.0, digits)
-    return round(float(__x) * pow10) / pow10 # dividing changes output to float
-
-
-def round_to_nearest_n_to_digits(__x: __typing.SupportsFloat, n: int, digits: int = 0) -> float:
-    """Round a number to the nearest multiple of ``n`` with specified decimal accuracy."""
-    pow10: float = pow(10.0, digits)
-    return round_to_nearest_n(float(__x) * pow10, n) / pow10 # dividing changes output to float
-
-def floor_to_nearest_n_to_digits(__x: __typing.SupportsFloat, n: int, digits: int = 0) -> float:
-    """Floor a number to the nearest multiple of ``n`` with specified decimal accuracy."""
-    pow10: float = pow(10.0, digits)
-    return floor_to_nearest_n(float(__x) * pow10, n) / pow10 # dividing changes output to float
-
-def ceil_to_nearest_n_to_digits(__x: __typing.SupportsFloat, n: int, digits: int = 0) -> float:
-    """Ceil a number to the nearest multiple of ``n`` with specified decimal accuracy."""
-    pow10: float = pow(10.0, digits)
-    return ceil_to_nearest_n(float(__x) * pow10, n) / pow10 # dividing changes output to float
-#endregion
-#endregion
-
-#region Iterables
-def closest(value: int | float, iterable: __typing.Iterable[_NumberT]) -> _NumberT:
-    """Return the value in the iterable that is closest to the given value."""
     return min(iterable, key=lambda k: abs(k - value))
 
 def furthest(value: int | float, iterable: __typing.Iterable[_NumberT]) -> _NumberT:
-    """Return the value in the iterable that is furthest from the given value."""
+    """
+    Return the value in the iterable that is furthest from the given value.
+
+    For many values use ``furthest_many`` or build a ``SortedValues`` of the candidates instead.
+    """
     return max(iterable, key=lambda k: abs(k - value))
 #endregion
 
 #region Public imports of components
 from nalpy.math._c_extensions.vector2 import Vector2 as Vector2
 from nalpy.math._c_extensions.vector2_int import Vector2Int as Vector2Int
+from nalpy.math._c_extensions.vector2_int_overflow import CheckedVector2Int as CheckedVector2Int
+from nalpy.math._c_extensions.vector2_int_overflow import SaturatingVector2Int as SaturatingVector2Int
 from nalpy.math._c_extensions.mvector2 import MVector2 as MVector2
 from nalpy.math._c_extensions.mvector2_int import MVector2Int as MVector2Int
-
-from nalpy.math._rect.rect import Rect as Rect
-from nalpy.math._rect.rect_int import RectInt as RectInt
-from nalpy.math._rect.rect_offset import RectOffset as RectOffset
-from nalpy.math._rect.rect_offset_int import RectOffsetInt as RectOffsetInt
+from nalpy.math._c_extensions.vector2_array import Vector2Array as Vector2Array
+from nalpy.math._c_extensions.vector2_int_buffer import Vector2IntBuffer as Vector2IntBuffer
+from nalpy.math._c_extensions.vector_codec import pack_vectors as pack_vectors
+from nalpy.math._c_extensions.vector_codec import unpack_vectors as unpack_vectors
+
+from nalpy.math._c_extensions.vector3 import Vector3 as Vector3
+from nalpy.math._c_extensions.vector3_int import Vector3Int as Vector3Int
+from nalpy.math._c_extensions.mvector3 import MVector3 as MVector3
+from nalpy.math._c_extensions.mvector3_int import MVector3Int as MVector3Int
+from nalpy.math._c_extensions.vector3_array import Vector3Array as Vector3Array
+from nalpy.math._c_extensions.vector3_int_buffer import Vector3IntBuffer as Vector3IntBuffer
+
+from nalpy.math._c_extensions.matrix3x2 import Matrix3x2 as Matrix3x2
+from nalpy.math._c_extensions.matrix4x4 import Matrix4x4 as Matrix4x4
+
+from nalpy.math._c_extensions.quaternion import Quaternion as Quaternion
+from nalpy.math._c_extensions.quaternion_array import QuaternionArray as QuaternionArray
+
+from nalpy.math._c_extensions.rect import Rect as Rect
+from nalpy.math._c_extensions.rect_int import RectInt as RectInt
+from nalpy.math._c_extensions.rect_int import GridOrder as GridOrder
+from nalpy.math._c_extensions.rect_array import RectArray as RectArray
+from nalpy.math._c_extensions.rect_int_array import RectIntArray as RectIntArray
+from nalpy.math._c_extensions.rect_offset import RectOffset as RectOffset
+from nalpy.math._c_extensions.rect_offset_int import RectOffsetInt as RectOffsetInt
+
+from nalpy.math._c_extensions.path2 import Path2 as Path2
+
+from nalpy.math._c_extensions.spatial_index import SpatialIndex as SpatialIndex
+from nalpy.math._c_extensions.spatial_index import QuadTree as QuadTree
+from nalpy.math._c_extensions.spatial_index import SpatialHash as SpatialHash
+from nalpy.math._c_extensions.sweep_and_prune import SweepAndPrune as SweepAndPrune
+
+from nalpy.math._c_extensions.sorted_values import SortedValues as SortedValues
 #endregion
 
 #region Private imports of legacy components
@@ -214,4 +233,9 @@ from nalpy.math._legacy_vector2.vector2 import Vector2 as _Legacy_Vector2
 from nalpy.math._legacy_vector2.vector2_int import Vector2Int as _Legacy_Vector2Int
 from nalpy.math._legacy_vector2.mvector2 import MVector2 as _Legacy_MVector2
 from nalpy.math._legacy_vector2.mvector2_int import MVector2Int as _Legacy_MVector2Int
+
+from nalpy.math._legacy_rect.rect import Rect as _Legacy_Rect
+from nalpy.math._legacy_rect.rect_int import RectInt as _Legacy_RectInt
+from nalpy.math._legacy_rect.rect_offset import RectOffset as _Legacy_RectOffset
+from nalpy.math._legacy_rect.rect_offset_int import RectOffsetInt as _Legacy_RectOffsetInt
 #endregion
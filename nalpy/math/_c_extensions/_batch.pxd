@@ -0,0 +1,82 @@
+#cython: language_level=3
+
+# Shared helpers for functions that operate on buffers of values.
+
+from cpython.array cimport array, clone
+from cpython.buffer cimport PyObject_CheckBuffer
+
+cdef struct DoubleOperand:
+    const double* data
+    Py_ssize_t length # -1 when a single value is broadcast
+    Py_ssize_t step # 0 when a single value is broadcast
+    double scalar
+
+cdef inline object double_operand(object obj, DoubleOperand* op):
+    # Accepts a float or any one-dimensional contiguous buffer of doubles.
+    # Returns the object that owns op.data. It must be kept alive while op is in use.
+    cdef const double[::1] view
+    if isinstance(obj, (float, int)):
+        op.scalar = obj
+        op.data = &op.scalar
+        op.length = -1
+        op.step = 0
+        return None
+
+    view = obj
+    op.length = view.shape[0]
+    op.step = 1
+    op.data = &view[0] if op.length > 0 else &op.scalar
+    return view
+
+cdef inline Py_ssize_t broadcast_length(Py_ssize_t a, Py_ssize_t b) except -2:
+    if a == -1:
+        return b
+    if b == -1 or a == b:
+        return a
+    raise ValueError(f"Operands could not be broadcast together with lengths {a} and {b}.")
+
+cdef inline Py_ssize_t resolve_length(Py_ssize_t length) except -1:
+    if length == -1:
+        raise ValueError("At least one operand must be a buffer.")
+    return length
+
+cdef inline int check_length(Py_ssize_t length, Py_ssize_t out_length) except -1:
+    if out_length != length:
+        raise ValueError(f"Output buffer has length {out_length}, expected {length}.")
+    return 0
+
+cdef inline array new_double_array(Py_ssize_t length):
+    return clone(array("d"), length, False)
+
+cdef inline int check_pairs(Py_ssize_t columns) except -1:
+    if columns != 2:
+        raise ValueError(f"Expected a buffer of shape (n, 2), got (n, {columns}).")
+    return 0
+
+cdef inline int check_triples(Py_ssize_t columns) except -1:
+    if columns != 3:
+        raise ValueError(f"Expected a buffer of shape (n, 3), got (n, {columns}).")
+    return 0
+
+cdef inline int check_quadruples(Py_ssize_t columns) except -1:
+    if columns != 4:
+        raise ValueError(f"Expected a buffer of shape (n, 4), got (n, {columns}).")
+    return 0
+
+cdef inline const double[::1] as_doubles(object values):
+    # Buffers are used directly, other iterables are collected into an array first.
+    if not PyObject_CheckBuffer(values):
+        values = array("d", values)
+    return values
+
+cdef inline object numpy_array(object obj, object dtype, object copy):
+    # Implements __array__ with the NumPy 2 copy semantics: True always copies, None copies only if dtype requires it and False never copies.
+    import numpy # Optional dependency, only needed when converting to a NumPy array.
+    if copy:
+        return numpy.array(memoryview(obj), dtype=dtype)
+    arr = numpy.asarray(memoryview(obj))
+    if dtype is not None and arr.dtype != numpy.dtype(dtype):
+        if copy is not None:
+            raise ValueError("Unable to avoid copy while creating an array as requested.")
+        arr = arr.astype(dtype)
+    return arr
@@ -0,0 +1,212 @@
+#cython: language_level=3
+
+# Portable replacements for the libm functions whose results differ between platforms.
+# Only +, -, *, / and sqrt are used for rounding-sensitive math. IEEE 754 requires those to be correctly rounded.
+# The extensions that use these must be compiled without floating point contraction, see setup.py.
+# acos and atan2 are ports of fdlibm 5.3 (e_acos.c, s_atan.c and e_atan2.c), errors are below 1 ulp.
+
+cimport cython
+from libc.math cimport sqrt, fabs, frexp, ldexp, trunc, copysign, isnan, isinf, INFINITY
+from libc.stdint cimport int32_t, uint32_t, uint64_t
+from libc.string cimport memcpy
+
+cdef inline int32_t _high_word(double x) noexcept nogil:
+    cdef uint64_t bits
+    memcpy(&bits, &x, sizeof(double))
+    return <int32_t>(<uint32_t>(bits >> 32))
+
+cdef inline uint32_t _low_word(double x) noexcept nogil:
+    cdef uint64_t bits
+    memcpy(&bits, &x, sizeof(double))
+    return <uint32_t>bits
+
+cdef inline double _clear_low_word(double x) noexcept nogil:
+    cdef uint64_t bits
+    memcpy(&bits, &x, sizeof(double))
+    bits &= 0xFFFFFFFF00000000ULL
+    memcpy(&x, &bits, sizeof(double))
+    return x
+
+@cython.cdivision(True)
+cdef inline double det_hypot(double x, double y) noexcept nogil:
+    x = fabs(x)
+    y = fabs(y)
+    if isinf(x) or isinf(y): # hypot(inf, nan) is inf
+        return INFINITY
+    if isnan(x) or isnan(y):
+        return x + y
+    if x < y:
+        x, y = y, x
+    if y == 0.0:
+        return x
+
+    # Scale by a power of two so that squaring can't overflow or underflow. Scaling is exact.
+    cdef int exponent
+    frexp(x, &exponent)
+    x = ldexp(x, -exponent)
+    y = ldexp(y, -exponent)
+    return ldexp(sqrt(x * x + y * y), exponent)
+
+cdef extern from *:
+    """
+    static const double nalpy_det_pi = 3.14159265358979311600e+00;
+    static const double nalpy_det_pio2_hi = 1.57079632679489655800e+00;
+    static const double nalpy_det_pio2_lo = 6.12323399573676603587e-17;
+    static const double nalpy_det_pio4 = 7.85398163397448278999e-01;
+    static const double nalpy_det_pi_lo = 1.22464679914735317720e-16;
+    static const double nalpy_det_atan_hi[4] = {4.63647609000806093515e-01, 7.85398163397448278999e-01, 9.82793723247329054082e-01, 1.57079632679489655800e+00};
+    static const double nalpy_det_atan_lo[4] = {2.26987774529616870924e-17, 3.06161699786838301793e-17, 1.39033110312309984516e-17, 6.12323399573676603587e-17};
+    """
+    const double _PI "nalpy_det_pi"
+    const double _PIO2_HI "nalpy_det_pio2_hi"
+    const double _PIO2_LO "nalpy_det_pio2_lo"
+    const double _PIO4 "nalpy_det_pio4"
+    const double _PI_LO "nalpy_det_pi_lo"
+    const double* _ATAN_HI "nalpy_det_atan_hi"
+    const double* _ATAN_LO "nalpy_det_atan_lo"
+
+@cython.cdivision(True)
+cdef inline double _acos_rational(double z) noexcept nogil:
+    cdef double p = z * (1.66666666666666657415e-01 + z * (-3.25565818622400915405e-01 + z * (2.01212532134862925881e-01 + z * (-4.00555345006794114027e-02 + z * (7.91534994289814532176e-04 + z * 3.47933107596021167570e-05)))))
+    cdef double q = 1.0 + z * (-2.40339491173441421878e+00 + z * (2.02094576023350569471e+00 + z * (-6.88283971605453293030e-01 + z * 7.70381505559019352791e-02)))
+    return p / q
+
+@cython.cdivision(True)
+cdef inline double det_acos(double x) noexcept nogil:
+    cdef int32_t hx = _high_word(x)
+    cdef int32_t ix = hx & 0x7fffffff
+    cdef double z, s, r, w, df, c
+
+    if ix >= 0x3ff00000: # |x| >= 1
+        if ((ix - 0x3ff00000) | <int32_t>_low_word(x)) == 0: # |x| == 1
+            if hx > 0:
+                return 0.0
+            return _PI + 2.0 * _PIO2_LO
+        return (x - x) / (x - x) # nan
+
+    if ix < 0x3fe00000: # |x| < 0.5
+        if ix <= 0x3c600000: # |x| < 2 ** -57
+            return _PIO2_HI + _PIO2_LO
+        r = _acos_rational(x * x)
+        return _PIO2_HI - (x - (_PIO2_LO - x * r))
+
+    if hx < 0: # x < -0.5
+        z = (1.0 + x) * 0.5
+        s = sqrt(z)
+        w = _acos_rational(z) * s - _PIO2_LO
+        return _PI - 2.0 * (s + w)
+
+    # x > 0.5
+    z = (1.0 - x) * 0.5
+    s = sqrt(z)
+    df = _clear_low_word(s)
+    c = (z - df * df) / (s + df)
+    w = _acos_rational(z) * s + c
+    return 2.0 * (df + w)
+
+@cython.cdivision(True)
+cdef inline double _atan(double x) noexcept nogil:
+    cdef int32_t hx = _high_word(x)
+    cdef int32_t ix = hx & 0x7fffffff
+    cdef int index
+    cdef double z, w, s1, s2
+
+    if ix >= 0x44100000: # |x| >= 2 ** 66
+        if isnan(x):
+            return x + x
+        return _ATAN_HI[3] + _ATAN_LO[3] if hx > 0 else -_ATAN_HI[3] - _ATAN_LO[3]
+
+    if ix < 0x3fdc0000: # |x| < 0.4375
+        if ix < 0x3e400000: # |x| < 2 ** -27
+            return x
+        index = -1
+    else:
+        x = fabs(x)
+        if ix < 0x3ff30000: # |x| < 1.1875
+            if ix < 0x3fe60000: # 7/16 <= |x| < 11/16
+                index = 0
+                x = (2.0 * x - 1.0) / (2.0 + x)
+            else: # 11/16 <= |x| < 19/16
+                index = 1
+                x = (x - 1.0) / (x + 1.0)
+        elif ix < 0x40038000: # |x| < 2.4375
+            index = 2
+            x = (x - 1.5) / (1.0 + 1.5 * x)
+        else: # 2.4375 <= |x| < 2 ** 66
+            index = 3
+            x = -1.0 / x
+
+    z = x * x
+    w = z * z
+    s1 = z * (3.33333333333329318027e-01 + w * (1.42857142725034663711e-01 + w * (9.09088713343650656196e-02 + w * (6.66107313738753120669e-02 + w * (4.97687799461593236017e-02 + w * 1.62858201153657823623e-02)))))
+    s2 = w * (-1.99999999998764832476e-01 + w * (-1.11111104054623557880e-01 + w * (-7.69187620504482999495e-02 + w * (-5.83357013379057348645e-02 + w * -3.65315727442169155270e-02))))
+    if index < 0:
+        return x - x * (s1 + s2)
+
+    z = _ATAN_HI[index] - ((x * (s1 + s2) - _ATAN_LO[index]) - x)
+    return -z if hx < 0 else z
+
+@cython.cdivision(True)
+cdef inline double det_atan2(double y, double x) noexcept nogil:
+    if isnan(x) or isnan(y):
+        return x + y
+    if x == 1.0:
+        return _atan(y)
+
+    cdef int32_t hx = _high_word(x)
+    cdef int32_t hy = _high_word(y)
+    cdef int32_t ix = hx & 0x7fffffff
+    cdef int32_t iy = hy & 0x7fffffff
+    cdef int quadrant = (1 if hy < 0 else 0) | (2 if hx < 0 else 0) # Sign of y | sign of x
+
+    if y == 0.0:
+        if quadrant < 2:
+            return y # atan2(+-0, +anything) = +-0
+        return _PI if quadrant == 2 else -_PI
+    if x == 0.0:
+        return -_PIO2_HI if hy < 0 else _PIO2_HI
+
+    if isinf(x):
+        if isinf(y):
+            if quadrant == 0:
+                return _PIO4
+            if quadrant == 1:
+                return -_PIO4
+            if quadrant == 2:
+                return 3.0 * _PIO4
+            return -3.0 * _PIO4
+        if quadrant == 0:
+            return 0.0
+        if quadrant == 1:
+            return -0.0
+        if quadrant == 2:
+            return _PI
+        return -_PI
+    if isinf(y):
+        return -_PIO2_HI if hy < 0 else _PIO2_HI
+
+    cdef double z
+    cdef int32_t k = (iy - ix) >> 20 # Difference of the exponents
+    if k > 60: # |y / x| > 2 ** 60
+        z = _PIO2_HI + 0.5 * _PI_LO
+        quadrant &= 1 # The sign of x doesn't matter, fix from FreeBSD msun
+    elif hx < 0 and k < -60: # |y| / x < -2 ** -60
+        z = 0.0
+    else:
+        z = _atan(fabs(y / x))
+
+    if quadrant == 0:
+        return z
+    if quadrant == 1:
+        return -z
+    if quadrant == 2:
+        return _PI - (z - _PI_LO)
+    return (z - _PI_LO) - _PI
+
+cdef inline double det_round(double x) noexcept nogil:
+    # Half away from zero like llround, but keeps the result a double so that out of range values don't depend on the platform.
+    # x - trunc(x) is exact, unlike x + 0.5 which rounds 0.49999999999999994 up.
+    cdef double t = trunc(x)
+    if fabs(x - t) >= 0.5:
+        t += copysign(1.0, x)
+    return t
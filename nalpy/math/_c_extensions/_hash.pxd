@@ -0,0 +1,50 @@
+#cython: language_level=3
+
+# Tuple compatible hashing for types that compare equal to tuples.
+# Adapted from tuplehash https://github.com/python/cpython/blob/3.11/Objects/tupleobject.c#L321
+
+cdef extern from "Python.h":
+    int SIZEOF_PY_HASH_T
+
+ctypedef unsigned long long int _uhash_t
+
+cdef inline _uhash_t _xxrotate(_uhash_t x) noexcept:
+    return ((x << 31) | (x >> 33)) # Rotate left 31 bits
+
+cdef inline _uhash_t _add_lane(_uhash_t acc, object value) except? 0:
+    cdef _uhash_t lane = <_uhash_t>hash(value)
+    acc += lane * 14029467366897019727ULL
+    acc = _xxrotate(acc)
+    acc *= 11400714785074694791ULL
+    return acc
+
+cdef inline Py_hash_t hash3(object a, object b, object c) except? -1:
+    # Same as hash((a, b, c))
+    if SIZEOF_PY_HASH_T != 8:
+        raise RuntimeError("64 bit hash type required.")
+
+    cdef _uhash_t acc = 2870177450012600261ULL
+    acc = _add_lane(acc, a)
+    acc = _add_lane(acc, b)
+    acc = _add_lane(acc, c)
+    acc += (<_uhash_t>3) ^ (2870177450012600261ULL ^ 3527539UL)
+
+    if acc == <_uhash_t>-1:
+        return 1546275796
+    return <Py_hash_t>acc
+
+cdef inline Py_hash_t hash4(object a, object b, object c, object d) except? -1:
+    # Same as hash((a, b, c, d))
+    if SIZEOF_PY_HASH_T != 8:
+        raise RuntimeError("64 bit hash type required.")
+
+    cdef _uhash_t acc = 2870177450012600261ULL
+    acc = _add_lane(acc, a)
+    acc = _add_lane(acc, b)
+    acc = _add_lane(acc, c)
+    acc = _add_lane(acc, d)
+    acc += (<_uhash_t>4) ^ (2870177450012600261ULL ^ 3527539UL)
+
+    if acc == <_uhash_t>-1:
+        return 1546275796
+    return <Py_hash_t>acc
@@ -0,0 +1,93 @@
+#cython: language_level=3
+
+# Overflow aware 64-bit integer arithmetic for the checked and saturating integer vectors.
+# The checked functions return True if the exact result doesn't fit into out.
+
+cimport cython
+from libc.limits cimport LLONG_MIN, LLONG_MAX
+
+cdef extern from *:
+    """
+    #include <limits.h>
+    #if defined(__GNUC__) || defined(__clang__)
+    #define nalpy_add_overflow(a, b, out) __builtin_add_overflow(a, b, out)
+    #define nalpy_sub_overflow(a, b, out) __builtin_sub_overflow(a, b, out)
+    #define nalpy_mul_overflow(a, b, out) __builtin_mul_overflow(a, b, out)
+    #else
+    /* Portable fallbacks, the operation is only done when it can't overflow */
+    static int nalpy_add_overflow(long long a, long long b, long long* out) {
+        if ((b > 0 && a > LLONG_MAX - b) || (b < 0 && a < LLONG_MIN - b)) return 1;
+        *out = a + b;
+        return 0;
+    }
+    static int nalpy_sub_overflow(long long a, long long b, long long* out) {
+        if ((b < 0 && a > LLONG_MAX + b) || (b > 0 && a < LLONG_MIN + b)) return 1;
+        *out = a - b;
+        return 0;
+    }
+    static int nalpy_mul_overflow(long long a, long long b, long long* out) {
+        if (a > 0 ? (b > 0 ? a > LLONG_MAX / b : b < LLONG_MIN / a)
+                  : (b > 0 ? a < LLONG_MIN / b : (a != 0 && b < LLONG_MAX / a))) return 1;
+        *out = a * b;
+        return 0;
+    }
+    #endif
+    """
+    bint checked_add "nalpy_add_overflow"(long long a, long long b, long long* out) noexcept nogil
+    bint checked_sub "nalpy_sub_overflow"(long long a, long long b, long long* out) noexcept nogil
+    bint checked_mul "nalpy_mul_overflow"(long long a, long long b, long long* out) noexcept nogil
+
+cdef inline bint checked_neg(long long a, long long* out) noexcept nogil:
+    if a == LLONG_MIN:
+        return True
+    out[0] = -a
+    return False
+
+cdef inline bint checked_abs(long long a, long long* out) noexcept nogil:
+    if a == LLONG_MIN:
+        return True
+    out[0] = -a if a < 0 else a
+    return False
+
+@cython.cdivision(True)
+cdef inline bint checked_floordiv_mod(long long a, long long b, long long* quotient, long long* remainder) noexcept nogil:
+    # Floor division and modulo with the semantics of Python integers. b must not be zero.
+    # LLONG_MIN // -1 is the only quotient that overflows, its remainder is 0. Dividing it in C would trap.
+    if b == -1:
+        remainder[0] = 0
+        return checked_neg(a, quotient)
+
+    cdef long long q = a / b # Rounds towards zero
+    cdef long long r = a % b
+    if r != 0 and (r < 0) != (b < 0):
+        q -= 1
+        r += b
+    quotient[0] = q
+    remainder[0] = r
+    return False
+
+cdef inline long long saturating_add(long long a, long long b) noexcept nogil:
+    cdef long long out
+    if checked_add(a, b, &out):
+        return LLONG_MAX if b > 0 else LLONG_MIN
+    return out
+
+cdef inline long long saturating_sub(long long a, long long b) noexcept nogil:
+    cdef long long out
+    if checked_sub(a, b, &out):
+        return LLONG_MAX if b < 0 else LLONG_MIN
+    return out
+
+cdef inline long long saturating_mul(long long a, long long b) noexcept nogil:
+    cdef long long out
+    if checked_mul(a, b, &out):
+        return LLONG_MAX if (a < 0) == (b < 0) else LLONG_MIN
+    return out
+
+cdef inline long long saturating_neg(long long a) noexcept nogil:
+    return LLONG_MAX if a == LLONG_MIN else -a
+
+cdef inline long long saturating_abs(long long a) noexcept nogil:
+    if a == LLONG_MIN:
+        return LLONG_MAX
+    return -a if a < 0 else a
@@ -0,0 +1,146 @@
+#cython: language_level=3
+
+# Kernels shared by RectArray and RectIntArray.
+# Rects are passed as pointers to x, y, w, h so that both element types share the exact same math.
+
+from libc.stdlib cimport qsort
+from libc.string cimport memcpy
+
+ctypedef fused rect_t:
+    double
+    long long
+
+cdef inline bint rect_empty(const rect_t* r) noexcept nogil:
+    # Rects without a positive width and height cover no area. Written this way so that NaN sizes are empty as well.
+    return not (r[2] > 0 and r[3] > 0)
+
+cdef inline bint rect_overlaps(const rect_t* a, const rect_t* b) noexcept nogil:
+    # Same as Rect.overlaps
+    return b[0] + b[2] > a[0] and b[0] < a[0] + a[2] and b[1] + b[3] > a[1] and b[1] < a[1] + a[3]
+
+cdef inline bint rect_contains(const rect_t* r, rect_t px, rect_t py) noexcept nogil:
+    # Same as Rect.contains
+    return px >= r[0] and px < r[0] + r[2] and py >= r[1] and py < r[1] + r[3]
+
+cdef inline rect_t rect_area(const rect_t* r) noexcept nogil:
+    if rect_empty(r):
+        return 0
+    return r[2] * r[3]
+
+cdef inline void rect_intersect(const rect_t* a, const rect_t* b, rect_t* out) noexcept nogil:
+    # out may alias a or b. Rects that don't overlap intersect into an empty rect with zero width and height.
+    cdef rect_t x = a[0] if a[0] > b[0] else b[0]
+    cdef rect_t y = a[1] if a[1] > b[1] else b[1]
+    cdef rect_t xmax = a[0] + a[2] if a[0] + a[2] < b[0] + b[2] else b[0] + b[2]
+    cdef rect_t ymax = a[1] + a[3] if a[1] + a[3] < b[1] + b[3] else b[1] + b[3]
+    out[0] = x
+    out[1] = y
+    if xmax > x and ymax > y:
+        out[2] = xmax - x
+        out[3] = ymax - y
+    else:
+        out[2] = out[3] = 0
+
+cdef inline void rect_union(const rect_t* a, const rect_t* b, rect_t* out) noexcept nogil:
+    # Smallest rect that contains both a and b. out may alias a or b.
+    # Empty rects are ignored so that they don't stretch the result towards an arbitrary position.
+    if rect_empty(a):
+        memcpy(out, b, 4 * sizeof(rect_t))
+        return
+    if rect_empty(b):
+        memcpy(out, a, 4 * sizeof(rect_t))
+        return
+
+    cdef rect_t x = a[0] if a[0] < b[0] else b[0]
+    cdef rect_t y = a[1] if a[1] < b[1] else b[1]
+    cdef rect_t xmax = a[0] + a[2] if a[0] + a[2] > b[0] + b[2] else b[0] + b[2]
+    cdef rect_t ymax = a[1] + a[3] if a[1] + a[3] > b[1] + b[3] else b[1] + b[3]
+    out[0] = x
+    out[1] = y
+    out[2] = xmax - x
+    out[3] = ymax - y
+
+#region Sorting
+cdef inline int _compare_x_double(const void* a, const void* b) noexcept nogil:
+    cdef double ax = (<const double*>a)[0]
+    cdef double bx = (<const double*>b)[0]
+    return (ax > bx) - (ax < bx)
+
+cdef inline int _compare_x_long_long(const void* a, const void* b) noexcept nogil:
+    cdef long long ax = (<const long long*>a)[0]
+    cdef long long bx = (<const long long*>b)[0]
+    return (ax > bx) - (ax < bx)
+
+cdef inline void sort_by_x(rect_t* data, Py_ssize_t length) noexcept nogil:
+    if rect_t is double:
+        qsort(data, length, 4 * sizeof(double), _compare_x_double)
+    else:
+        qsort(data, length, 4 * sizeof(long long), _compare_x_long_long)
+
+cdef inline Py_ssize_t first_x_at_least(const rect_t* sorted_data, Py_ssize_t length, rect_t x) noexcept nogil:
+    # Binary search over rects sorted by x
+    cdef Py_ssize_t lo = 0
+    cdef Py_ssize_t hi = length
+    cdef Py_ssize_t mid
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if sorted_data[4 * mid] < x:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+#endregion
+
+cdef inline bint overlaps_sorted(const rect_t* r, const rect_t* sorted_data, Py_ssize_t length, rect_t max_w) noexcept nogil:
+    # Whether r overlaps any of the rects sorted by x. max_w is the largest width among them.
+    # Only rects with x in [r.x - max_w, r.xmax) can reach r on the x axis.
+    cdef Py_ssize_t i = first_x_at_least(sorted_data, length, r[0] - max_w)
+    while i < length and sorted_data[4 * i] < r[0] + r[2]:
+        if rect_overlaps(r, sorted_data + 4 * i):
+            return True
+        i += 1
+    return False
+
+cdef inline Py_ssize_t merge_overlapping(rect_t* data, Py_ssize_t length, Py_ssize_t* active) noexcept nogil:
+    # Replaces overlapping rects with their union in place until no two rects overlap. Empty rects are dropped.
+    # Returns the new amount of rects. active must have room for length indices.
+    cdef Py_ssize_t count = 0
+    cdef Py_ssize_t i, j, k, active_count, kept
+    for i in range(length):
+        if not rect_empty(data + 4 * i):
+            if count != i:
+                memcpy(data + 4 * count, data + 4 * i, 4 * sizeof(rect_t))
+            count += 1
+
+    cdef rect_t[4] r
+    cdef bint merged = True
+    cdef bint found
+    while merged: # A grown rect can overlap a rect it was already compared against, repeat until nothing changes
+        merged = False
+        sort_by_x(data, count)
+        k = 0
+        active_count = 0
+        for i in range(count):
+            memcpy(r, data + 4 * i, 4 * sizeof(rect_t))
+
+            # Sweep along x: rects that end before r starts can't overlap r or any rect after it
+            kept = 0
+            for j in range(active_count):
+                if data[4 * active[j]] + data[4 * active[j] + 2] > r[0]:
+                    active[kept] = active[j]
+                    kept += 1
+            active_count = kept
+
+            found = False
+            for j in range(active_count):
+                if rect_overlaps(data + 4 * active[j], r):
+                    rect_union(data + 4 * active[j], r, data + 4 * active[j])
+                    merged = found = True
+                    break
+            if not found: # Results are written over already visited rects, k never passes i
+                memcpy(data + 4 * k, r, 4 * sizeof(rect_t))
+                active[active_count] = k
+                active_count += 1
+                k += 1
+        count = k
+    return count
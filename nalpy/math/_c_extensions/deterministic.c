@@ -0,0 +1,13313 @@
+/* Generated by Cython 3.0.11 */
+
+#ifndef PY_SSIZE_T_CLEAN
+#define PY_SSIZE_T_CLEAN
+#endif /* PY_SSIZE_T_CLEAN */
+#if defined(CYTHON_LIMITED_API) && 0
+  #ifndef Py_LIMITED_API
+    #if CYTHON_LIMITED_API+0 > 0x03030000
+      #define Py_LIMITED_API CYTHON_LIMITED_API
+    #else
+      #define Py_LIMITED_API 0x03030000
+    #endif
+  #endif
+#endif
+
+#include "Python.h"
+#ifndef Py_PYTHON_H
+    #error Python headers needed to compile C extensions, please install development version of Python.
+#elif PY_VERSION_HEX < 0x02070000 || (0x03000000 <= PY_VERSION_HEX && PY_VERSION_HEX < 0x03030000)
+    #error Cython requires Python 2.7+ or Python 3.3+.
+#else
+#if defined(CYTHON_LIMITED_API) && CYTHON_LIMITED_API
+#define __PYX_EXTRA_ABI_MODULE_NAME "limited"
+#else
+#define __PYX_EXTRA_ABI_MODULE_NAME ""
+#endif
+#define CYTHON_ABI "3_0_11" __PYX_EXTRA_ABI_MODULE_NAME
+#define __PYX_ABI_MODULE_NAME "_cython_" CYTHON_ABI
+#define __PYX_TYPE_MODULE_PREFIX __PYX_ABI_MODULE_NAME "."
+#define CYTHON_HEX_VERSION 0x03000BF0
+#define CYTHON_FUTURE_DIVISION 1
+#include <stddef.h>
+#ifndef offsetof
+  #define offsetof(type, member) ( (size_t) & ((type*)0) -> member )
+#endif
+#if !defined(_WIN32) && !defined(WIN32) && !defined(MS_WINDOWS)
+  #ifndef __stdcall
+    #define __stdcall
+  #endif
+  #ifndef __cdecl
+    #define __cdecl
+  #endif
+  #ifndef __fastcall
+    #define __fastcall
+  #endif
+#endif
+#ifndef DL_IMPORT
+  #define DL_IMPORT(t) t
+#endif
+#ifndef DL_EXPORT
+  #define DL_EXPORT(t) t
+#endif
+#define __PYX_COMMA ,
+#ifndef HAVE_LONG_LONG
+  #define HAVE_LONG_LONG
+#endif
+#ifndef PY_LONG_LONG
+  #define PY_LONG_LONG LONG_LONG
+#endif
+#ifndef Py_HUGE_VAL
+  #define Py_HUGE_VAL HUGE_VAL
+#endif
+#define __PYX_LIMITED_VERSION_HEX PY_VERSION_HEX
+#if defined(GRAALVM_PYTHON)
+  /* For very preliminary testing purposes. Most variables are set the same as PyPy.
+     The existence of this section does not imply that anything works or is even tested */
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_LIMITED_API 0
+  #define CYTHON_COMPILING_IN_GRAAL 1
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #undef CYTHON_USE_TYPE_SLOTS
+  #define CYTHON_USE_TYPE_SLOTS 0
+  #undef CYTHON_USE_TYPE_SPECS
+  #define CYTHON_USE_TYPE_SPECS 0
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #if PY_VERSION_HEX < 0x03050000
+    #undef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 0
+  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_INTERNALS
+  #define CYTHON_USE_UNICODE_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #undef CYTHON_AVOID_BORROWED_REFS
+  #define CYTHON_AVOID_BORROWED_REFS 1
+  #undef CYTHON_ASSUME_SAFE_MACROS
+  #define CYTHON_ASSUME_SAFE_MACROS 0
+  #undef CYTHON_UNPACK_METHODS
+  #define CYTHON_UNPACK_METHODS 0
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_GIL
+  #define CYTHON_FAST_GIL 0
+  #undef CYTHON_METH_FASTCALL
+  #define CYTHON_METH_FASTCALL 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #ifndef CYTHON_PEP487_INIT_SUBCLASS
+    #define CYTHON_PEP487_INIT_SUBCLASS (PY_MAJOR_VERSION >= 3)
+  #endif
+  #undef CYTHON_PEP489_MULTI_PHASE_INIT
+  #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #undef CYTHON_USE_MODULE_STATE
+  #define CYTHON_USE_MODULE_STATE 0
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE 0
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+  #undef CYTHON_USE_FREELISTS
+  #define CYTHON_USE_FREELISTS 0
+#elif defined(PYPY_VERSION)
+  #define CYTHON_COMPILING_IN_PYPY 1
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_LIMITED_API 0
+  #define CYTHON_COMPILING_IN_GRAAL 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #undef CYTHON_USE_TYPE_SLOTS
+  #define CYTHON_USE_TYPE_SLOTS 0
+  #ifndef CYTHON_USE_TYPE_SPECS
+    #define CYTHON_USE_TYPE_SPECS 0
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #if PY_VERSION_HEX < 0x03050000
+    #undef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 0
+  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_INTERNALS
+  #define CYTHON_USE_UNICODE_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #undef CYTHON_AVOID_BORROWED_REFS
+  #define CYTHON_AVOID_BORROWED_REFS 1
+  #undef CYTHON_ASSUME_SAFE_MACROS
+  #define CYTHON_ASSUME_SAFE_MACROS 0
+  #undef CYTHON_UNPACK_METHODS
+  #define CYTHON_UNPACK_METHODS 0
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_GIL
+  #define CYTHON_FAST_GIL 0
+  #undef CYTHON_METH_FASTCALL
+  #define CYTHON_METH_FASTCALL 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #ifndef CYTHON_PEP487_INIT_SUBCLASS
+    #define CYTHON_PEP487_INIT_SUBCLASS (PY_MAJOR_VERSION >= 3)
+  #endif
+  #if PY_VERSION_HEX < 0x03090000
+    #undef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #elif !defined(CYTHON_PEP489_MULTI_PHASE_INIT)
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #undef CYTHON_USE_MODULE_STATE
+  #define CYTHON_USE_MODULE_STATE 0
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1 && PYPY_VERSION_NUM >= 0x07030C00)
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+  #undef CYTHON_USE_FREELISTS
+  #define CYTHON_USE_FREELISTS 0
+#elif defined(CYTHON_LIMITED_API)
+  #ifdef Py_LIMITED_API
+    #undef __PYX_LIMITED_VERSION_HEX
+    #define __PYX_LIMITED_VERSION_HEX Py_LIMITED_API
+  #endif
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_LIMITED_API 1
+  #define CYTHON_COMPILING_IN_GRAAL 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #undef CYTHON_CLINE_IN_TRACEBACK
+  #define CYTHON_CLINE_IN_TRACEBACK 0
+  #undef CYTHON_USE_TYPE_SLOTS
+  #define CYTHON_USE_TYPE_SLOTS 0
+  #undef CYTHON_USE_TYPE_SPECS
+  #define CYTHON_USE_TYPE_SPECS 1
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #undef CYTHON_USE_ASYNC_SLOTS
+  #define CYTHON_USE_ASYNC_SLOTS 0
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_INTERNALS
+  #define CYTHON_USE_UNICODE_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_WRITER
+    #define CYTHON_USE_UNICODE_WRITER 0
+  #endif
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #undef CYTHON_ASSUME_SAFE_MACROS
+  #define CYTHON_ASSUME_SAFE_MACROS 0
+  #undef CYTHON_UNPACK_METHODS
+  #define CYTHON_UNPACK_METHODS 0
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_GIL
+  #define CYTHON_FAST_GIL 0
+  #undef CYTHON_METH_FASTCALL
+  #define CYTHON_METH_FASTCALL 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #ifndef CYTHON_PEP487_INIT_SUBCLASS
+    #define CYTHON_PEP487_INIT_SUBCLASS 1
+  #endif
+  #undef CYTHON_PEP489_MULTI_PHASE_INIT
+  #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #undef CYTHON_USE_MODULE_STATE
+  #define CYTHON_USE_MODULE_STATE 1
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE 0
+  #endif
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+  #undef CYTHON_USE_FREELISTS
+  #define CYTHON_USE_FREELISTS 0
+#elif defined(Py_GIL_DISABLED) || defined(Py_NOGIL)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_LIMITED_API 0
+  #define CYTHON_COMPILING_IN_GRAAL 0
+  #define CYTHON_COMPILING_IN_NOGIL 1
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #ifndef CYTHON_USE_TYPE_SPECS
+    #define CYTHON_USE_TYPE_SPECS 0
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #ifndef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #ifndef CYTHON_USE_PYLONG_INTERNALS
+    #define CYTHON_USE_PYLONG_INTERNALS 0
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_GIL
+  #define CYTHON_FAST_GIL 0
+  #ifndef CYTHON_METH_FASTCALL
+    #define CYTHON_METH_FASTCALL 1
+  #endif
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #ifndef CYTHON_PEP487_INIT_SUBCLASS
+    #define CYTHON_PEP487_INIT_SUBCLASS 1
+  #endif
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #ifndef CYTHON_USE_MODULE_STATE
+    #define CYTHON_USE_MODULE_STATE 0
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE 1
+  #endif
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 1
+  #endif
+  #ifndef CYTHON_USE_FREELISTS
+    #define CYTHON_USE_FREELISTS 0
+  #endif
+#else
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_CPYTHON 1
+  #define CYTHON_COMPILING_IN_LIMITED_API 0
+  #define CYTHON_COMPILING_IN_GRAAL 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #ifndef CYTHON_USE_TYPE_SPECS
+    #define CYTHON_USE_TYPE_SPECS 0
+  #endif
+  #ifndef CYTHON_USE_PYTYPE_LOOKUP
+    #define CYTHON_USE_PYTYPE_LOOKUP 1
+  #endif
+  #if PY_MAJOR_VERSION < 3
+    #undef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 0
+  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #ifndef CYTHON_USE_PYLONG_INTERNALS
+    #define CYTHON_USE_PYLONG_INTERNALS 1
+  #endif
+  #ifndef CYTHON_USE_PYLIST_INTERNALS
+    #define CYTHON_USE_PYLIST_INTERNALS 1
+  #endif
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #if PY_VERSION_HEX < 0x030300F0 || PY_VERSION_HEX >= 0x030B00A2
+    #undef CYTHON_USE_UNICODE_WRITER
+    #define CYTHON_USE_UNICODE_WRITER 0
+  #elif !defined(CYTHON_USE_UNICODE_WRITER)
+    #define CYTHON_USE_UNICODE_WRITER 1
+  #endif
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #ifndef CYTHON_FAST_THREAD_STATE
+    #define CYTHON_FAST_THREAD_STATE 1
+  #endif
+  #ifndef CYTHON_FAST_GIL
+    #define CYTHON_FAST_GIL (PY_MAJOR_VERSION < 3 || PY_VERSION_HEX >= 0x03060000 && PY_VERSION_HEX < 0x030C00A6)
+  #endif
+  #ifndef CYTHON_METH_FASTCALL
+    #define CYTHON_METH_FASTCALL (PY_VERSION_HEX >= 0x030700A1)
+  #endif
+  #ifndef CYTHON_FAST_PYCALL
+    #define CYTHON_FAST_PYCALL 1
+  #endif
+  #ifndef CYTHON_PEP487_INIT_SUBCLASS
+    #define CYTHON_PEP487_INIT_SUBCLASS 1
+  #endif
+  #if PY_VERSION_HEX < 0x03050000
+    #undef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #elif !defined(CYTHON_PEP489_MULTI_PHASE_INIT)
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #ifndef CYTHON_USE_MODULE_STATE
+    #define CYTHON_USE_MODULE_STATE 0
+  #endif
+  #if PY_VERSION_HEX < 0x030400a1
+    #undef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE 0
+  #elif !defined(CYTHON_USE_TP_FINALIZE)
+    #define CYTHON_USE_TP_FINALIZE 1
+  #endif
+  #if PY_VERSION_HEX < 0x030600B1
+    #undef CYTHON_USE_DICT_VERSIONS
+    #define CYTHON_USE_DICT_VERSIONS 0
+  #elif !defined(CYTHON_USE_DICT_VERSIONS)
+    #define CYTHON_USE_DICT_VERSIONS  (PY_VERSION_HEX < 0x030C00A5)
+  #endif
+  #if PY_VERSION_HEX < 0x030700A3
+    #undef CYTHON_USE_EXC_INFO_STACK
+    #define CYTHON_USE_EXC_INFO_STACK 0
+  #elif !defined(CYTHON_USE_EXC_INFO_STACK)
+    #define CYTHON_USE_EXC_INFO_STACK 1
+  #endif
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 1
+  #endif
+  #ifndef CYTHON_USE_FREELISTS
+    #define CYTHON_USE_FREELISTS 1
+  #endif
+#endif
+#if !defined(CYTHON_FAST_PYCCALL)
+#define CYTHON_FAST_PYCCALL  (CYTHON_FAST_PYCALL && PY_VERSION_HEX >= 0x030600B1)
+#endif
+#if !defined(CYTHON_VECTORCALL)
+#define CYTHON_VECTORCALL  (CYTHON_FAST_PYCCALL && PY_VERSION_HEX >= 0x030800B1)
+#endif
+#define CYTHON_BACKPORT_VECTORCALL (CYTHON_METH_FASTCALL && PY_VERSION_HEX < 0x030800B1)
+#if CYTHON_USE_PYLONG_INTERNALS
+  #if PY_MAJOR_VERSION < 3
+    #include "longintrepr.h"
+  #endif
+  #undef SHIFT
+  #undef BASE
+  #undef MASK
+  #ifdef SIZEOF_VOID_P
+    enum { __pyx_check_sizeof_voidp = 1 / (int)(SIZEOF_VOID_P == sizeof(void*)) };
+  #endif
+#endif
+#ifndef __has_attribute
+  #define __has_attribute(x) 0
+#endif
+#ifndef __has_cpp_attribute
+  #define __has_cpp_attribute(x) 0
+#endif
+#ifndef CYTHON_RESTRICT
+  #if defined(__GNUC__)
+    #define CYTHON_RESTRICT __restrict__
+  #elif defined(_MSC_VER) && _MSC_VER >= 1400
+    #define CYTHON_RESTRICT __restrict
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_RESTRICT restrict
+  #else
+    #define CYTHON_RESTRICT
+  #endif
+#endif
+#ifndef CYTHON_UNUSED
+  #if defined(__cplusplus)
+    /* for clang __has_cpp_attribute(maybe_unused) is true even before C++17
+     * but leads to warnings with -pedantic, since it is a C++17 feature */
+    #if ((defined(_MSVC_LANG) && _MSVC_LANG >= 201703L) || __cplusplus >= 201703L)
+      #if __has_cpp_attribute(maybe_unused)
+        #define CYTHON_UNUSED [[maybe_unused]]
+      #endif
+    #endif
+  #endif
+#endif
+#ifndef CYTHON_UNUSED
+# if defined(__GNUC__)
+#   if !(defined(__cplusplus)) || (__GNUC__ > 3 || (__GNUC__ == 3 && __GNUC_MINOR__ >= 4))
+#     define CYTHON_UNUSED __attribute__ ((__unused__))
+#   else
+#     define CYTHON_UNUSED
+#   endif
+# elif defined(__ICC) || (defined(__INTEL_COMPILER) && !defined(_MSC_VER))
+#   define CYTHON_UNUSED __attribute__ ((__unused__))
+# else
+#   define CYTHON_UNUSED
+# endif
+#endif
+#ifndef CYTHON_UNUSED_VAR
+#  if defined(__cplusplus)
+     template<class T> void CYTHON_UNUSED_VAR( const T& ) { }
+#  else
+#    define CYTHON_UNUSED_VAR(x) (void)(x)
+#  endif
+#endif
+#ifndef CYTHON_MAYBE_UNUSED_VAR
+  #define CYTHON_MAYBE_UNUSED_VAR(x) CYTHON_UNUSED_VAR(x)
+#endif
+#ifndef CYTHON_NCP_UNUSED
+# if CYTHON_COMPILING_IN_CPYTHON
+#  define CYTHON_NCP_UNUSED
+# else
+#  define CYTHON_NCP_UNUSED CYTHON_UNUSED
+# endif
+#endif
+#ifndef CYTHON_USE_CPP_STD_MOVE
+  #if defined(__cplusplus) && (\
+    __cplusplus >= 201103L || (defined(_MSC_VER) && _MSC_VER >= 1600))
+    #define CYTHON_USE_CPP_STD_MOVE 1
+  #else
+    #define CYTHON_USE_CPP_STD_MOVE 0
+  #endif
+#endif
+#define __Pyx_void_to_None(void_result) ((void)(void_result), Py_INCREF(Py_None), Py_None)
+#ifdef _MSC_VER
+    #ifndef _MSC_STDINT_H_
+        #if _MSC_VER < 1300
+            typedef unsigned char     uint8_t;
+            typedef unsigned short    uint16_t;
+            typedef unsigned int      uint32_t;
+        #else
+            typedef unsigned __int8   uint8_t;
+            typedef unsigned __int16  uint16_t;
+            typedef unsigned __int32  uint32_t;
+        #endif
+    #endif
+    #if _MSC_VER < 1300
+        #ifdef _WIN64
+            typedef unsigned long long  __pyx_uintptr_t;
+        #else
+            typedef unsigned int        __pyx_uintptr_t;
+        #endif
+    #else
+        #ifdef _WIN64
+            typedef unsigned __int64    __pyx_uintptr_t;
+        #else
+            typedef unsigned __int32    __pyx_uintptr_t;
+        #endif
+    #endif
+#else
+    #include <stdint.h>
+    typedef uintptr_t  __pyx_uintptr_t;
+#endif
+#ifndef CYTHON_FALLTHROUGH
+  #if defined(__cplusplus)
+    /* for clang __has_cpp_attribute(fallthrough) is true even before C++17
+     * but leads to warnings with -pedantic, since it is a C++17 feature */
+    #if ((defined(_MSVC_LANG) && _MSVC_LANG >= 201703L) || __cplusplus >= 201703L)
+      #if __has_cpp_attribute(fallthrough)
+        #define CYTHON_FALLTHROUGH [[fallthrough]]
+      #endif
+    #endif
+    #ifndef CYTHON_FALLTHROUGH
+      #if __has_cpp_attribute(clang::fallthrough)
+        #define CYTHON_FALLTHROUGH [[clang::fallthrough]]
+      #elif __has_cpp_attribute(gnu::fallthrough)
+        #define CYTHON_FALLTHROUGH [[gnu::fallthrough]]
+      #endif
+    #endif
+  #endif
+  #ifndef CYTHON_FALLTHROUGH
+    #if __has_attribute(fallthrough)
+      #define CYTHON_FALLTHROUGH __attribute__((fallthrough))
+    #else
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+  #if defined(__clang__) && defined(__apple_build_version__)
+    #if __apple_build_version__ < 7000000
+      #undef  CYTHON_FALLTHROUGH
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+#endif
+#ifdef __cplusplus
+  template <typename T>
+  struct __PYX_IS_UNSIGNED_IMPL {static const bool value = T(0) < T(-1);};
+  #define __PYX_IS_UNSIGNED(type) (__PYX_IS_UNSIGNED_IMPL<type>::value)
+#else
+  #define __PYX_IS_UNSIGNED(type) (((type)-1) > 0)
+#endif
+#if CYTHON_COMPILING_IN_PYPY == 1
+  #define __PYX_NEED_TP_PRINT_SLOT  (PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x030A0000)
+#else
+  #define __PYX_NEED_TP_PRINT_SLOT  (PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000)
+#endif
+#define __PYX_REINTERPRET_FUNCION(func_pointer, other_pointer) ((func_pointer)(void(*)(void))(other_pointer))
+
+#ifndef CYTHON_INLINE
+  #if defined(__clang__)
+    #define CYTHON_INLINE __inline__ __attribute__ ((__unused__))
+  #elif defined(__GNUC__)
+    #define CYTHON_INLINE __inline__
+  #elif defined(_MSC_VER)
+    #define CYTHON_INLINE __inline
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_INLINE inline
+  #else
+    #define CYTHON_INLINE
+  #endif
+#endif
+
+#define __PYX_BUILD_PY_SSIZE_T "n"
+#define CYTHON_FORMAT_SSIZE_T "z"
+#if PY_MAJOR_VERSION < 3
+  #define __Pyx_BUILTIN_MODULE_NAME "__builtin__"
+  #define __Pyx_DefaultClassType PyClass_Type
+  #define __Pyx_PyCode_New(a, p, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_New(a+k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+#else
+  #define __Pyx_BUILTIN_MODULE_NAME "builtins"
+  #define __Pyx_DefaultClassType PyType_Type
+#if CYTHON_COMPILING_IN_LIMITED_API
+    static CYTHON_INLINE PyObject* __Pyx_PyCode_New(int a, int p, int k, int l, int s, int f,
+                                                    PyObject *code, PyObject *c, PyObject* n, PyObject *v,
+                                                    PyObject *fv, PyObject *cell, PyObject* fn,
+                                                    PyObject *name, int fline, PyObject *lnos) {
+        PyObject *exception_table = NULL;
+        PyObject *types_module=NULL, *code_type=NULL, *result=NULL;
+        #if __PYX_LIMITED_VERSION_HEX < 0x030B0000
+        PyObject *version_info;
+        PyObject *py_minor_version = NULL;
+        #endif
+        long minor_version = 0;
+        PyObject *type, *value, *traceback;
+        PyErr_Fetch(&type, &value, &traceback);
+        #if __PYX_LIMITED_VERSION_HEX >= 0x030B0000
+        minor_version = 11;
+        #else
+        if (!(version_info = PySys_GetObject("version_info"))) goto end;
+        if (!(py_minor_version = PySequence_GetItem(version_info, 1))) goto end;
+        minor_version = PyLong_AsLong(py_minor_version);
+        Py_DECREF(py_minor_version);
+        if (minor_version == -1 && PyErr_Occurred()) goto end;
+        #endif
+        if (!(types_module = PyImport_ImportModule("types"))) goto end;
+        if (!(code_type = PyObject_GetAttrString(types_module, "CodeType"))) goto end;
+        if (minor_version <= 7) {
+            (void)p;
+            result = PyObject_CallFunction(code_type, "iiiiiOOOOOOiOO", a, k, l, s, f, code,
+                          c, n, v, fn, name, fline, lnos, fv, cell);
+        } else if (minor_version <= 10) {
+            result = PyObject_CallFunction(code_type, "iiiiiiOOOOOOiOO", a,p, k, l, s, f, code,
+                          c, n, v, fn, name, fline, lnos, fv, cell);
+        } else {
+            if (!(exception_table = PyBytes_FromStringAndSize(NULL, 0))) goto end;
+            result = PyObject_CallFunction(code_type, "iiiiiiOOOOOOOiOO", a,p, k, l, s, f, code,
+                          c, n, v, fn, name, name, fline, lnos, exception_table, fv, cell);
+        }
+    end:
+        Py_XDECREF(code_type);
+        Py_XDECREF(exception_table);
+        Py_XDECREF(types_module);
+        if (type) {
+            PyErr_Restore(type, value, traceback);
+        }
+        return result;
+    }
+    #ifndef CO_OPTIMIZED
+    #define CO_OPTIMIZED 0x0001
+    #endif
+    #ifndef CO_NEWLOCALS
+    #define CO_NEWLOCALS 0x0002
+    #endif
+    #ifndef CO_VARARGS
+    #define CO_VARARGS 0x0004
+    #endif
+    #ifndef CO_VARKEYWORDS
+    #define CO_VARKEYWORDS 0x0008
+    #endif
+    #ifndef CO_ASYNC_GENERATOR
+    #define CO_ASYNC_GENERATOR 0x0200
+    #endif
+    #ifndef CO_GENERATOR
+    #define CO_GENERATOR 0x0020
+    #endif
+    #ifndef CO_COROUTINE
+    #define CO_COROUTINE 0x0080
+    #endif
+#elif PY_VERSION_HEX >= 0x030B0000
+  static CYTHON_INLINE PyCodeObject* __Pyx_PyCode_New(int a, int p, int k, int l, int s, int f,
+                                                    PyObject *code, PyObject *c, PyObject* n, PyObject *v,
+                                                    PyObject *fv, PyObject *cell, PyObject* fn,
+                                                    PyObject *name, int fline, PyObject *lnos) {
+    PyCodeObject *result;
+    PyObject *empty_bytes = PyBytes_FromStringAndSize("", 0);
+    if (!empty_bytes) return NULL;
+    result =
+      #if PY_VERSION_HEX >= 0x030C0000
+        PyUnstable_Code_NewWithPosOnlyArgs
+      #else
+        PyCode_NewWithPosOnlyArgs
+      #endif
+        (a, p, k, l, s, f, code, c, n, v, fv, cell, fn, name, name, fline, lnos, empty_bytes);
+    Py_DECREF(empty_bytes);
+    return result;
+  }
+#elif PY_VERSION_HEX >= 0x030800B2 && !CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyCode_New(a, p, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_NewWithPosOnlyArgs(a, p, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+#else
+  #define __Pyx_PyCode_New(a, p, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+#endif
+#endif
+#if PY_VERSION_HEX >= 0x030900A4 || defined(Py_IS_TYPE)
+  #define __Pyx_IS_TYPE(ob, type) Py_IS_TYPE(ob, type)
+#else
+  #define __Pyx_IS_TYPE(ob, type) (((const PyObject*)ob)->ob_type == (type))
+#endif
+#if PY_VERSION_HEX >= 0x030A00B1 || defined(Py_Is)
+  #define __Pyx_Py_Is(x, y)  Py_Is(x, y)
+#else
+  #define __Pyx_Py_Is(x, y) ((x) == (y))
+#endif
+#if PY_VERSION_HEX >= 0x030A00B1 || defined(Py_IsNone)
+  #define __Pyx_Py_IsNone(ob) Py_IsNone(ob)
+#else
+  #define __Pyx_Py_IsNone(ob) __Pyx_Py_Is((ob), Py_None)
+#endif
+#if PY_VERSION_HEX >= 0x030A00B1 || defined(Py_IsTrue)
+  #define __Pyx_Py_IsTrue(ob) Py_IsTrue(ob)
+#else
+  #define __Pyx_Py_IsTrue(ob) __Pyx_Py_Is((ob), Py_True)
+#endif
+#if PY_VERSION_HEX >= 0x030A00B1 || defined(Py_IsFalse)
+  #define __Pyx_Py_IsFalse(ob) Py_IsFalse(ob)
+#else
+  #define __Pyx_Py_IsFalse(ob) __Pyx_Py_Is((ob), Py_False)
+#endif
+#define __Pyx_NoneAsNull(obj)  (__Pyx_Py_IsNone(obj) ? NULL : (obj))
+#if PY_VERSION_HEX >= 0x030900F0 && !CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyObject_GC_IsFinalized(o) PyObject_GC_IsFinalized(o)
+#else
+  #define __Pyx_PyObject_GC_IsFinalized(o) _PyGC_FINALIZED(o)
+#endif
+#ifndef CO_COROUTINE
+  #define CO_COROUTINE 0x80
+#endif
+#ifndef CO_ASYNC_GENERATOR
+  #define CO_ASYNC_GENERATOR 0x200
+#endif
+#ifndef Py_TPFLAGS_CHECKTYPES
+  #define Py_TPFLAGS_CHECKTYPES 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_INDEX
+  #define Py_TPFLAGS_HAVE_INDEX 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_NEWBUFFER
+  #define Py_TPFLAGS_HAVE_NEWBUFFER 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_FINALIZE
+  #define Py_TPFLAGS_HAVE_FINALIZE 0
+#endif
+#ifndef Py_TPFLAGS_SEQUENCE
+  #define Py_TPFLAGS_SEQUENCE 0
+#endif
+#ifndef Py_TPFLAGS_MAPPING
+  #define Py_TPFLAGS_MAPPING 0
+#endif
+#ifndef METH_STACKLESS
+  #define METH_STACKLESS 0
+#endif
+#if PY_VERSION_HEX <= 0x030700A3 || !defined(METH_FASTCALL)
+  #ifndef METH_FASTCALL
+     #define METH_FASTCALL 0x80
+  #endif
+  typedef PyObject *(*__Pyx_PyCFunctionFast) (PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+  typedef PyObject *(*__Pyx_PyCFunctionFastWithKeywords) (PyObject *self, PyObject *const *args,
+                                                          Py_ssize_t nargs, PyObject *kwnames);
+#else
+  #if PY_VERSION_HEX >= 0x030d00A4
+  #  define __Pyx_PyCFunctionFast PyCFunctionFast
+  #  define __Pyx_PyCFunctionFastWithKeywords PyCFunctionFastWithKeywords
+  #else
+  #  define __Pyx_PyCFunctionFast _PyCFunctionFast
+  #  define __Pyx_PyCFunctionFastWithKeywords _PyCFunctionFastWithKeywords
+  #endif
+#endif
+#if CYTHON_METH_FASTCALL
+  #define __Pyx_METH_FASTCALL METH_FASTCALL
+  #define __Pyx_PyCFunction_FastCall __Pyx_PyCFunctionFast
+  #define __Pyx_PyCFunction_FastCallWithKeywords __Pyx_PyCFunctionFastWithKeywords
+#else
+  #define __Pyx_METH_FASTCALL METH_VARARGS
+  #define __Pyx_PyCFunction_FastCall PyCFunction
+  #define __Pyx_PyCFunction_FastCallWithKeywords PyCFunctionWithKeywords
+#endif
+#if CYTHON_VECTORCALL
+  #define __pyx_vectorcallfunc vectorcallfunc
+  #define __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET  PY_VECTORCALL_ARGUMENTS_OFFSET
+  #define __Pyx_PyVectorcall_NARGS(n)  PyVectorcall_NARGS((size_t)(n))
+#elif CYTHON_BACKPORT_VECTORCALL
+  typedef PyObject *(*__pyx_vectorcallfunc)(PyObject *callable, PyObject *const *args,
+                                            size_t nargsf, PyObject *kwnames);
+  #define __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET  ((size_t)1 << (8 * sizeof(size_t) - 1))
+  #define __Pyx_PyVectorcall_NARGS(n)  ((Py_ssize_t)(((size_t)(n)) & ~__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET))
+#else
+  #define __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET  0
+  #define __Pyx_PyVectorcall_NARGS(n)  ((Py_ssize_t)(n))
+#endif
+#if PY_MAJOR_VERSION >= 0x030900B1
+#define __Pyx_PyCFunction_CheckExact(func)  PyCFunction_CheckExact(func)
+#else
+#define __Pyx_PyCFunction_CheckExact(func)  PyCFunction_Check(func)
+#endif
+#define __Pyx_CyOrPyCFunction_Check(func)  PyCFunction_Check(func)
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_CyOrPyCFunction_GET_FUNCTION(func)  (((PyCFunctionObject*)(func))->m_ml->ml_meth)
+#elif !CYTHON_COMPILING_IN_LIMITED_API
+#define __Pyx_CyOrPyCFunction_GET_FUNCTION(func)  PyCFunction_GET_FUNCTION(func)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_CyOrPyCFunction_GET_FLAGS(func)  (((PyCFunctionObject*)(func))->m_ml->ml_flags)
+static CYTHON_INLINE PyObject* __Pyx_CyOrPyCFunction_GET_SELF(PyObject *func) {
+    return (__Pyx_CyOrPyCFunction_GET_FLAGS(func) & METH_STATIC) ? NULL : ((PyCFunctionObject*)func)->m_self;
+}
+#endif
+static CYTHON_INLINE int __Pyx__IsSameCFunction(PyObject *func, void *cfunc) {
+#if CYTHON_COMPILING_IN_LIMITED_API
+    return PyCFunction_Check(func) && PyCFunction_GetFunction(func) == (PyCFunction) cfunc;
+#else
+    return PyCFunction_Check(func) && PyCFunction_GET_FUNCTION(func) == (PyCFunction) cfunc;
+#endif
+}
+#define __Pyx_IsSameCFunction(func, cfunc)   __Pyx__IsSameCFunction(func, cfunc)
+#if __PYX_LIMITED_VERSION_HEX < 0x030900B1
+  #define __Pyx_PyType_FromModuleAndSpec(m, s, b)  ((void)m, PyType_FromSpecWithBases(s, b))
+  typedef PyObject *(*__Pyx_PyCMethod)(PyObject *, PyTypeObject *, PyObject *const *, size_t, PyObject *);
+#else
+  #define __Pyx_PyType_FromModuleAndSpec(m, s, b)  PyType_FromModuleAndSpec(m, s, b)
+  #define __Pyx_PyCMethod  PyCMethod
+#endif
+#ifndef METH_METHOD
+  #define METH_METHOD 0x200
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Malloc)
+  #define PyObject_Malloc(s)   PyMem_Malloc(s)
+  #define PyObject_Free(p)     PyMem_Free(p)
+  #define PyObject_Realloc(p)  PyMem_Realloc(p)
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API
+  #define __Pyx_PyCode_HasFreeVars(co)  (PyCode_GetNumFree(co) > 0)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno)
+#else
+  #define __Pyx_PyCode_HasFreeVars(co)  (PyCode_GetNumFree(co) > 0)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno)  (frame)->f_lineno = (lineno)
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API
+  #define __Pyx_PyThreadState_Current PyThreadState_Get()
+#elif !CYTHON_FAST_THREAD_STATE
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#elif PY_VERSION_HEX >= 0x030d00A1
+  #define __Pyx_PyThreadState_Current PyThreadState_GetUnchecked()
+#elif PY_VERSION_HEX >= 0x03060000
+  #define __Pyx_PyThreadState_Current _PyThreadState_UncheckedGet()
+#elif PY_VERSION_HEX >= 0x03000000
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#else
+  #define __Pyx_PyThreadState_Current _PyThreadState_Current
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API
+static CYTHON_INLINE void *__Pyx_PyModule_GetState(PyObject *op)
+{
+    void *result;
+    result = PyModule_GetState(op);
+    if (!result)
+        Py_FatalError("Couldn't find the module state");
+    return result;
+}
+#endif
+#define __Pyx_PyObject_GetSlot(obj, name, func_ctype)  __Pyx_PyType_GetSlot(Py_TYPE(obj), name, func_ctype)
+#if CYTHON_COMPILING_IN_LIMITED_API
+  #define __Pyx_PyType_GetSlot(type, name, func_ctype)  ((func_ctype) PyType_GetSlot((type), Py_##name))
+#else
+  #define __Pyx_PyType_GetSlot(type, name, func_ctype)  ((type)->name)
+#endif
+#if PY_VERSION_HEX < 0x030700A2 && !defined(PyThread_tss_create) && !defined(Py_tss_NEEDS_INIT)
+#include "pythread.h"
+#define Py_tss_NEEDS_INIT 0
+typedef int Py_tss_t;
+static CYTHON_INLINE int PyThread_tss_create(Py_tss_t *key) {
+  *key = PyThread_create_key();
+  return 0;
+}
+static CYTHON_INLINE Py_tss_t * PyThread_tss_alloc(void) {
+  Py_tss_t *key = (Py_tss_t *)PyObject_Malloc(sizeof(Py_tss_t));
+  *key = Py_tss_NEEDS_INIT;
+  return key;
+}
+static CYTHON_INLINE void PyThread_tss_free(Py_tss_t *key) {
+  PyObject_Free(key);
+}
+static CYTHON_INLINE int PyThread_tss_is_created(Py_tss_t *key) {
+  return *key != Py_tss_NEEDS_INIT;
+}
+static CYTHON_INLINE void PyThread_tss_delete(Py_tss_t *key) {
+  PyThread_delete_key(*key);
+  *key = Py_tss_NEEDS_INIT;
+}
+static CYTHON_INLINE int PyThread_tss_set(Py_tss_t *key, void *value) {
+  return PyThread_set_key_value(*key, value);
+}
+static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
+  return PyThread_get_key_value(*key);
+}
+#endif
+#if PY_MAJOR_VERSION < 3
+    #if CYTHON_COMPILING_IN_PYPY
+        #if PYPY_VERSION_NUM < 0x07030600
+            #if defined(__cplusplus) && __cplusplus >= 201402L
+                [[deprecated("`with nogil:` inside a nogil function will not release the GIL in PyPy2 < 7.3.6")]]
+            #elif defined(__GNUC__) || defined(__clang__)
+                __attribute__ ((__deprecated__("`with nogil:` inside a nogil function will not release the GIL in PyPy2 < 7.3.6")))
+            #elif defined(_MSC_VER)
+                __declspec(deprecated("`with nogil:` inside a nogil function will not release the GIL in PyPy2 < 7.3.6"))
+            #endif
+            static CYTHON_INLINE int PyGILState_Check(void) {
+                return 0;
+            }
+        #else  // PYPY_VERSION_NUM < 0x07030600
+        #endif  // PYPY_VERSION_NUM < 0x07030600
+    #else
+        static CYTHON_INLINE int PyGILState_Check(void) {
+            PyThreadState * tstate = _PyThreadState_Current;
+            return tstate && (tstate == PyGILState_GetThisThreadState());
+        }
+    #endif
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030d0000 || defined(_PyDict_NewPresized)
+#define __Pyx_PyDict_NewPresized(n)  ((n <= 8) ? PyDict_New() : _PyDict_NewPresized(n))
+#else
+#define __Pyx_PyDict_NewPresized(n)  PyDict_New()
+#endif
+#if PY_MAJOR_VERSION >= 3 || CYTHON_FUTURE_DIVISION
+  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_TrueDivide(x,y)
+  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceTrueDivide(x,y)
+#else
+  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_Divide(x,y)
+  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceDivide(x,y)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX > 0x030600B4 && PY_VERSION_HEX < 0x030d0000 && CYTHON_USE_UNICODE_INTERNALS
+#define __Pyx_PyDict_GetItemStrWithError(dict, name)  _PyDict_GetItem_KnownHash(dict, name, ((PyASCIIObject *) name)->hash)
+static CYTHON_INLINE PyObject * __Pyx_PyDict_GetItemStr(PyObject *dict, PyObject *name) {
+    PyObject *res = __Pyx_PyDict_GetItemStrWithError(dict, name);
+    if (res == NULL) PyErr_Clear();
+    return res;
+}
+#elif PY_MAJOR_VERSION >= 3 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07020000)
+#define __Pyx_PyDict_GetItemStrWithError  PyDict_GetItemWithError
+#define __Pyx_PyDict_GetItemStr           PyDict_GetItem
+#else
+static CYTHON_INLINE PyObject * __Pyx_PyDict_GetItemStrWithError(PyObject *dict, PyObject *name) {
+#if CYTHON_COMPILING_IN_PYPY
+    return PyDict_GetItem(dict, name);
+#else
+    PyDictEntry *ep;
+    PyDictObject *mp = (PyDictObject*) dict;
+    long hash = ((PyStringObject *) name)->ob_shash;
+    assert(hash != -1);
+    ep = (mp->ma_lookup)(mp, name, hash);
+    if (ep == NULL) {
+        return NULL;
+    }
+    return ep->me_value;
+#endif
+}
+#define __Pyx_PyDict_GetItemStr           PyDict_GetItem
+#endif
+#if CYTHON_USE_TYPE_SLOTS
+  #define __Pyx_PyType_GetFlags(tp)   (((PyTypeObject *)tp)->tp_flags)
+  #define __Pyx_PyType_HasFeature(type, feature)  ((__Pyx_PyType_GetFlags(type) & (feature)) != 0)
+  #define __Pyx_PyObject_GetIterNextFunc(obj)  (Py_TYPE(obj)->tp_iternext)
+#else
+  #define __Pyx_PyType_GetFlags(tp)   (PyType_GetFlags((PyTypeObject *)tp))
+  #define __Pyx_PyType_HasFeature(type, feature)  PyType_HasFeature(type, feature)
+  #define __Pyx_PyObject_GetIterNextFunc(obj)  PyIter_Next
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API
+  #define __Pyx_SetItemOnTypeDict(tp, k, v) PyObject_GenericSetAttr((PyObject*)tp, k, v)
+#else
+  #define __Pyx_SetItemOnTypeDict(tp, k, v) PyDict_SetItem(tp->tp_dict, k, v)
+#endif
+#if CYTHON_USE_TYPE_SPECS && PY_VERSION_HEX >= 0x03080000
+#define __Pyx_PyHeapTypeObject_GC_Del(obj)  {\
+    PyTypeObject *type = Py_TYPE((PyObject*)obj);\
+    assert(__Pyx_PyType_HasFeature(type, Py_TPFLAGS_HEAPTYPE));\
+    PyObject_GC_Del(obj);\
+    Py_DECREF(type);\
+}
+#else
+#define __Pyx_PyHeapTypeObject_GC_Del(obj)  PyObject_GC_Del(obj)
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API
+  #define CYTHON_PEP393_ENABLED 1
+  #define __Pyx_PyUnicode_READY(op)       (0)
+  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GetLength(u)
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) PyUnicode_ReadChar(u, i)
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   ((void)u, 1114111U)
+  #define __Pyx_PyUnicode_KIND(u)         ((void)u, (0))
+  #define __Pyx_PyUnicode_DATA(u)         ((void*)u)
+  #define __Pyx_PyUnicode_READ(k, d, i)   ((void)k, PyUnicode_ReadChar((PyObject*)(d), i))
+  #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GetLength(u))
+#elif PY_VERSION_HEX > 0x03030000 && defined(PyUnicode_KIND)
+  #define CYTHON_PEP393_ENABLED 1
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_READY(op)       (0)
+  #else
+    #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ?\
+                                                0 : _PyUnicode_Ready((PyObject *)(op)))
+  #endif
+  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_LENGTH(u)
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) PyUnicode_READ_CHAR(u, i)
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   PyUnicode_MAX_CHAR_VALUE(u)
+  #define __Pyx_PyUnicode_KIND(u)         ((int)PyUnicode_KIND(u))
+  #define __Pyx_PyUnicode_DATA(u)         PyUnicode_DATA(u)
+  #define __Pyx_PyUnicode_READ(k, d, i)   PyUnicode_READ(k, d, i)
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  PyUnicode_WRITE(k, d, i, (Py_UCS4) ch)
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_LENGTH(u))
+  #else
+    #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x03090000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : ((PyCompactUnicodeObject *)(u))->wstr_length))
+    #else
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : PyUnicode_GET_SIZE(u)))
+    #endif
+  #endif
+#else
+  #define CYTHON_PEP393_ENABLED 0
+  #define PyUnicode_1BYTE_KIND  1
+  #define PyUnicode_2BYTE_KIND  2
+  #define PyUnicode_4BYTE_KIND  4
+  #define __Pyx_PyUnicode_READY(op)       (0)
+  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_SIZE(u)
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) ((Py_UCS4)(PyUnicode_AS_UNICODE(u)[i]))
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   ((sizeof(Py_UNICODE) == 2) ? 65535U : 1114111U)
+  #define __Pyx_PyUnicode_KIND(u)         ((int)sizeof(Py_UNICODE))
+  #define __Pyx_PyUnicode_DATA(u)         ((void*)PyUnicode_AS_UNICODE(u))
+  #define __Pyx_PyUnicode_READ(k, d, i)   ((void)(k), (Py_UCS4)(((Py_UNICODE*)d)[i]))
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  (((void)(k)), ((Py_UNICODE*)d)[i] = (Py_UNICODE) ch)
+  #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_SIZE(u))
+#endif
+#if CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyUnicode_Concat(a, b)      PyNumber_Add(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  PyNumber_Add(a, b)
+#else
+  #define __Pyx_PyUnicode_Concat(a, b)      PyUnicode_Concat(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  ((unlikely((a) == Py_None) || unlikely((b) == Py_None)) ?\
+      PyNumber_Add(a, b) : __Pyx_PyUnicode_Concat(a, b))
+#endif
+#if CYTHON_COMPILING_IN_PYPY
+  #if !defined(PyUnicode_DecodeUnicodeEscape)
+    #define PyUnicode_DecodeUnicodeEscape(s, size, errors)  PyUnicode_Decode(s, size, "unicode_escape", errors)
+  #endif
+  #if !defined(PyUnicode_Contains) || (PY_MAJOR_VERSION == 2 && PYPY_VERSION_NUM < 0x07030500)
+    #undef PyUnicode_Contains
+    #define PyUnicode_Contains(u, s)  PySequence_Contains(u, s)
+  #endif
+  #if !defined(PyByteArray_Check)
+    #define PyByteArray_Check(obj)  PyObject_TypeCheck(obj, &PyByteArray_Type)
+  #endif
+  #if !defined(PyObject_Format)
+    #define PyObject_Format(obj, fmt)  PyObject_CallMethod(obj, "__format__", "O", fmt)
+  #endif
+#endif
+#define __Pyx_PyString_FormatSafe(a, b)   ((unlikely((a) == Py_None || (PyString_Check(b) && !PyString_CheckExact(b)))) ? PyNumber_Remainder(a, b) : __Pyx_PyString_Format(a, b))
+#define __Pyx_PyUnicode_FormatSafe(a, b)  ((unlikely((a) == Py_None || (PyUnicode_Check(b) && !PyUnicode_CheckExact(b)))) ? PyNumber_Remainder(a, b) : PyUnicode_Format(a, b))
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyString_Format(a, b)  PyUnicode_Format(a, b)
+#else
+  #define __Pyx_PyString_Format(a, b)  PyString_Format(a, b)
+#endif
+#if PY_MAJOR_VERSION < 3 && !defined(PyObject_ASCII)
+  #define PyObject_ASCII(o)            PyObject_Repr(o)
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyBaseString_Type            PyUnicode_Type
+  #define PyStringObject               PyUnicodeObject
+  #define PyString_Type                PyUnicode_Type
+  #define PyString_Check               PyUnicode_Check
+  #define PyString_CheckExact          PyUnicode_CheckExact
+#ifndef PyObject_Unicode
+  #define PyObject_Unicode             PyObject_Str
+#endif
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyBaseString_Check(obj) PyUnicode_Check(obj)
+  #define __Pyx_PyBaseString_CheckExact(obj) PyUnicode_CheckExact(obj)
+#else
+  #define __Pyx_PyBaseString_Check(obj) (PyString_Check(obj) || PyUnicode_Check(obj))
+  #define __Pyx_PyBaseString_CheckExact(obj) (PyString_CheckExact(obj) || PyUnicode_CheckExact(obj))
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON
+  #define __Pyx_PySequence_ListKeepNew(obj)\
+    (likely(PyList_CheckExact(obj) && Py_REFCNT(obj) == 1) ? __Pyx_NewRef(obj) : PySequence_List(obj))
+#else
+  #define __Pyx_PySequence_ListKeepNew(obj)  PySequence_List(obj)
+#endif
+#ifndef PySet_CheckExact
+  #define PySet_CheckExact(obj)        __Pyx_IS_TYPE(obj, &PySet_Type)
+#endif
+#if PY_VERSION_HEX >= 0x030900A4
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_SET_REFCNT(obj, refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SET_SIZE(obj, size)
+#else
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_REFCNT(obj) = (refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SIZE(obj) = (size)
+#endif
+#if CYTHON_ASSUME_SAFE_MACROS
+  #define __Pyx_PySequence_ITEM(o, i) PySequence_ITEM(o, i)
+  #define __Pyx_PySequence_SIZE(seq)  Py_SIZE(seq)
+  #define __Pyx_PyTuple_SET_ITEM(o, i, v) (PyTuple_SET_ITEM(o, i, v), (0))
+  #define __Pyx_PyList_SET_ITEM(o, i, v) (PyList_SET_ITEM(o, i, v), (0))
+  #define __Pyx_PyTuple_GET_SIZE(o) PyTuple_GET_SIZE(o)
+  #define __Pyx_PyList_GET_SIZE(o) PyList_GET_SIZE(o)
+  #define __Pyx_PySet_GET_SIZE(o) PySet_GET_SIZE(o)
+  #define __Pyx_PyBytes_GET_SIZE(o) PyBytes_GET_SIZE(o)
+  #define __Pyx_PyByteArray_GET_SIZE(o) PyByteArray_GET_SIZE(o)
+#else
+  #define __Pyx_PySequence_ITEM(o, i) PySequence_GetItem(o, i)
+  #define __Pyx_PySequence_SIZE(seq)  PySequence_Size(seq)
+  #define __Pyx_PyTuple_SET_ITEM(o, i, v) PyTuple_SetItem(o, i, v)
+  #define __Pyx_PyList_SET_ITEM(o, i, v) PyList_SetItem(o, i, v)
+  #define __Pyx_PyTuple_GET_SIZE(o) PyTuple_Size(o)
+  #define __Pyx_PyList_GET_SIZE(o) PyList_Size(o)
+  #define __Pyx_PySet_GET_SIZE(o) PySet_Size(o)
+  #define __Pyx_PyBytes_GET_SIZE(o) PyBytes_Size(o)
+  #define __Pyx_PyByteArray_GET_SIZE(o) PyByteArray_Size(o)
+#endif
+#if __PYX_LIMITED_VERSION_HEX >= 0x030d00A1
+  #define __Pyx_PyImport_AddModuleRef(name) PyImport_AddModuleRef(name)
+#else
+  static CYTHON_INLINE PyObject *__Pyx_PyImport_AddModuleRef(const char *name) {
+      PyObject *module = PyImport_AddModule(name);
+      Py_XINCREF(module);
+      return module;
+  }
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyIntObject                  PyLongObject
+  #define PyInt_Type                   PyLong_Type
+  #define PyInt_Check(op)              PyLong_Check(op)
+  #define PyInt_CheckExact(op)         PyLong_CheckExact(op)
+  #define __Pyx_Py3Int_Check(op)       PyLong_Check(op)
+  #define __Pyx_Py3Int_CheckExact(op)  PyLong_CheckExact(op)
+  #define PyInt_FromString             PyLong_FromString
+  #define PyInt_FromUnicode            PyLong_FromUnicode
+  #define PyInt_FromLong               PyLong_FromLong
+  #define PyInt_FromSize_t             PyLong_FromSize_t
+  #define PyInt_FromSsize_t            PyLong_FromSsize_t
+  #define PyInt_AsLong                 PyLong_AsLong
+  #define PyInt_AS_LONG                PyLong_AS_LONG
+  #define PyInt_AsSsize_t              PyLong_AsSsize_t
+  #define PyInt_AsUnsignedLongMask     PyLong_AsUnsignedLongMask
+  #define PyInt_AsUnsignedLongLongMask PyLong_AsUnsignedLongLongMask
+  #define PyNumber_Int                 PyNumber_Long
+#else
+  #define __Pyx_Py3Int_Check(op)       (PyLong_Check(op) || PyInt_Check(op))
+  #define __Pyx_Py3Int_CheckExact(op)  (PyLong_CheckExact(op) || PyInt_CheckExact(op))
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyBoolObject                 PyLongObject
+#endif
+#if PY_MAJOR_VERSION >= 3 && CYTHON_COMPILING_IN_PYPY
+  #ifndef PyUnicode_InternFromString
+    #define PyUnicode_InternFromString(s) PyUnicode_FromString(s)
+  #endif
+#endif
+#if PY_VERSION_HEX < 0x030200A4
+  typedef long Py_hash_t;
+  #define __Pyx_PyInt_FromHash_t PyInt_FromLong
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsHash_t
+#else
+  #define __Pyx_PyInt_FromHash_t PyInt_FromSsize_t
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsSsize_t
+#endif
+#if CYTHON_USE_ASYNC_SLOTS
+  #if PY_VERSION_HEX >= 0x030500B1
+    #define __Pyx_PyAsyncMethodsStruct PyAsyncMethods
+    #define __Pyx_PyType_AsAsync(obj) (Py_TYPE(obj)->tp_as_async)
+  #else
+    #define __Pyx_PyType_AsAsync(obj) ((__Pyx_PyAsyncMethodsStruct*) (Py_TYPE(obj)->tp_reserved))
+  #endif
+#else
+  #define __Pyx_PyType_AsAsync(obj) NULL
+#endif
+#ifndef __Pyx_PyAsyncMethodsStruct
+    typedef struct {
+        unaryfunc am_await;
+        unaryfunc am_aiter;
+        unaryfunc am_anext;
+    } __Pyx_PyAsyncMethodsStruct;
+#endif
+
+#if defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)
+  #if !defined(_USE_MATH_DEFINES)
+    #define _USE_MATH_DEFINES
+  #endif
+#endif
+#include <math.h>
+#ifdef NAN
+#define __PYX_NAN() ((float) NAN)
+#else
+static CYTHON_INLINE float __PYX_NAN() {
+  float value;
+  memset(&value, 0xFF, sizeof(value));
+  return value;
+}
+#endif
+#if defined(__CYGWIN__) && defined(_LDBL_EQ_DBL)
+#define __Pyx_truncl trunc
+#else
+#define __Pyx_truncl truncl
+#endif
+
+#define __PYX_MARK_ERR_POS(f_index, lineno) \
+    { __pyx_filename = __pyx_f[f_index]; (void)__pyx_filename; __pyx_lineno = lineno; (void)__pyx_lineno; __pyx_clineno = __LINE__;  (void)__pyx_clineno; }
+#define __PYX_ERR(f_index, lineno, Ln_error) \
+    { __PYX_MARK_ERR_POS(f_index, lineno) goto Ln_error; }
+
+#ifdef CYTHON_EXTERN_C
+    #undef __PYX_EXTERN_C
+    #define __PYX_EXTERN_C CYTHON_EXTERN_C
+#elif defined(__PYX_EXTERN_C)
+    #ifdef _MSC_VER
+    #pragma message ("Please do not define the '__PYX_EXTERN_C' macro externally. Use 'CYTHON_EXTERN_C' instead.")
+    #else
+    #warning Please do not define the '__PYX_EXTERN_C' macro externally. Use 'CYTHON_EXTERN_C' instead.
+    #endif
+#else
+  #ifdef __cplusplus
+    #define __PYX_EXTERN_C extern "C"
+  #else
+    #define __PYX_EXTERN_C extern
+  #endif
+#endif
+
+#define __PYX_HAVE__nalpy__math___c_extensions__deterministic
+#define __PYX_HAVE_API__nalpy__math___c_extensions__deterministic
+/* Early includes */
+#include <math.h>
+#include <stdint.h>
+#include <string.h>
+
+    static const double nalpy_det_pi = 3.14159265358979311600e+00;
+    static const double nalpy_det_pio2_hi = 1.57079632679489655800e+00;
+    static const double nalpy_det_pio2_lo = 6.12323399573676603587e-17;
+    static const double nalpy_det_pio4 = 7.85398163397448278999e-01;
+    static const double nalpy_det_pi_lo = 1.22464679914735317720e-16;
+    static const double nalpy_det_atan_hi[4] = {4.63647609000806093515e-01, 7.85398163397448278999e-01, 9.82793723247329054082e-01, 1.57079632679489655800e+00};
+    static const double nalpy_det_atan_lo[4] = {2.26987774529616870924e-17, 3.06161699786838301793e-17, 1.39033110312309984516e-17, 6.12323399573676603587e-17};
+    
+#ifdef _OPENMP
+#include <omp.h>
+#endif /* _OPENMP */
+
+#if defined(PYREX_WITHOUT_ASSERTIONS) && !defined(CYTHON_WITHOUT_ASSERTIONS)
+#define CYTHON_WITHOUT_ASSERTIONS
+#endif
+
+typedef struct {PyObject **p; const char *s; const Py_ssize_t n; const char* encoding;
+                const char is_unicode; const char is_str; const char intern; } __Pyx_StringTabEntry;
+
+#define __PYX_DEFAULT_STRING_ENCODING_IS_ASCII 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_UTF8 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT (PY_MAJOR_VERSION >= 3 && __PYX_DEFAULT_STRING_ENCODING_IS_UTF8)
+#define __PYX_DEFAULT_STRING_ENCODING ""
+#define __Pyx_PyObject_FromString __Pyx_PyBytes_FromString
+#define __Pyx_PyObject_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
+#define __Pyx_uchar_cast(c) ((unsigned char)c)
+#define __Pyx_long_cast(x) ((long)x)
+#define __Pyx_fits_Py_ssize_t(v, type, is_signed)  (\
+    (sizeof(type) < sizeof(Py_ssize_t))  ||\
+    (sizeof(type) > sizeof(Py_ssize_t) &&\
+          likely(v < (type)PY_SSIZE_T_MAX ||\
+                 v == (type)PY_SSIZE_T_MAX)  &&\
+          (!is_signed || likely(v > (type)PY_SSIZE_T_MIN ||\
+                                v == (type)PY_SSIZE_T_MIN)))  ||\
+    (sizeof(type) == sizeof(Py_ssize_t) &&\
+          (is_signed || likely(v < (type)PY_SSIZE_T_MAX ||\
+                               v == (type)PY_SSIZE_T_MAX)))  )
+static CYTHON_INLINE int __Pyx_is_valid_index(Py_ssize_t i, Py_ssize_t limit) {
+    return (size_t) i < (size_t) limit;
+}
+#if defined (__cplusplus) && __cplusplus >= 201103L
+    #include <cstdlib>
+    #define __Pyx_sst_abs(value) std::abs(value)
+#elif SIZEOF_INT >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) abs(value)
+#elif SIZEOF_LONG >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) labs(value)
+#elif defined (_MSC_VER)
+    #define __Pyx_sst_abs(value) ((Py_ssize_t)_abs64(value))
+#elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define __Pyx_sst_abs(value) llabs(value)
+#elif defined (__GNUC__)
+    #define __Pyx_sst_abs(value) __builtin_llabs(value)
+#else
+    #define __Pyx_sst_abs(value) ((value<0) ? -value : value)
+#endif
+static CYTHON_INLINE Py_ssize_t __Pyx_ssize_strlen(const char *s);
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject*);
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject*, Py_ssize_t* length);
+static CYTHON_INLINE PyObject* __Pyx_PyByteArray_FromString(const char*);
+#define __Pyx_PyByteArray_FromStringAndSize(s, l) PyByteArray_FromStringAndSize((const char*)s, l)
+#define __Pyx_PyBytes_FromString        PyBytes_FromString
+#define __Pyx_PyBytes_FromStringAndSize PyBytes_FromStringAndSize
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char*);
+#if PY_MAJOR_VERSION < 3
+    #define __Pyx_PyStr_FromString        __Pyx_PyBytes_FromString
+    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
+#else
+    #define __Pyx_PyStr_FromString        __Pyx_PyUnicode_FromString
+    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyUnicode_FromStringAndSize
+#endif
+#define __Pyx_PyBytes_AsWritableString(s)     ((char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsWritableSString(s)    ((signed char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsWritableUString(s)    ((unsigned char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsString(s)     ((const char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsSString(s)    ((const signed char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsUString(s)    ((const unsigned char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyObject_AsWritableString(s)    ((char*)(__pyx_uintptr_t) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableSString(s)    ((signed char*)(__pyx_uintptr_t) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableUString(s)    ((unsigned char*)(__pyx_uintptr_t) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsSString(s)    ((const signed char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsUString(s)    ((const unsigned char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_FromCString(s)  __Pyx_PyObject_FromString((const char*)s)
+#define __Pyx_PyBytes_FromCString(s)   __Pyx_PyBytes_FromString((const char*)s)
+#define __Pyx_PyByteArray_FromCString(s)   __Pyx_PyByteArray_FromString((const char*)s)
+#define __Pyx_PyStr_FromCString(s)     __Pyx_PyStr_FromString((const char*)s)
+#define __Pyx_PyUnicode_FromCString(s) __Pyx_PyUnicode_FromString((const char*)s)
+#define __Pyx_PyUnicode_FromOrdinal(o)       PyUnicode_FromOrdinal((int)o)
+#define __Pyx_PyUnicode_AsUnicode            PyUnicode_AsUnicode
+#define __Pyx_NewRef(obj) (Py_INCREF(obj), obj)
+#define __Pyx_Owned_Py_None(b) __Pyx_NewRef(Py_None)
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject*);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject*);
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x);
+#define __Pyx_PySequence_Tuple(obj)\
+    (likely(PyTuple_CheckExact(obj)) ? __Pyx_NewRef(obj) : PySequence_Tuple(obj))
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t);
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject*);
+#if CYTHON_ASSUME_SAFE_MACROS
+#define __pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
+#else
+#define __pyx_PyFloat_AsDouble(x) PyFloat_AsDouble(x)
+#endif
+#define __pyx_PyFloat_AsFloat(x) ((float) __pyx_PyFloat_AsDouble(x))
+#if PY_MAJOR_VERSION >= 3
+#define __Pyx_PyNumber_Int(x) (PyLong_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Long(x))
+#else
+#define __Pyx_PyNumber_Int(x) (PyInt_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Int(x))
+#endif
+#if CYTHON_USE_PYLONG_INTERNALS
+  #if PY_VERSION_HEX >= 0x030C00A7
+  #ifndef _PyLong_SIGN_MASK
+    #define _PyLong_SIGN_MASK 3
+  #endif
+  #ifndef _PyLong_NON_SIZE_BITS
+    #define _PyLong_NON_SIZE_BITS 3
+  #endif
+  #define __Pyx_PyLong_Sign(x)  (((PyLongObject*)x)->long_value.lv_tag & _PyLong_SIGN_MASK)
+  #define __Pyx_PyLong_IsNeg(x)  ((__Pyx_PyLong_Sign(x) & 2) != 0)
+  #define __Pyx_PyLong_IsNonNeg(x)  (!__Pyx_PyLong_IsNeg(x))
+  #define __Pyx_PyLong_IsZero(x)  (__Pyx_PyLong_Sign(x) & 1)
+  #define __Pyx_PyLong_IsPos(x)  (__Pyx_PyLong_Sign(x) == 0)
+  #define __Pyx_PyLong_CompactValueUnsigned(x)  (__Pyx_PyLong_Digits(x)[0])
+  #define __Pyx_PyLong_DigitCount(x)  ((Py_ssize_t) (((PyLongObject*)x)->long_value.lv_tag >> _PyLong_NON_SIZE_BITS))
+  #define __Pyx_PyLong_SignedDigitCount(x)\
+        ((1 - (Py_ssize_t) __Pyx_PyLong_Sign(x)) * __Pyx_PyLong_DigitCount(x))
+  #if defined(PyUnstable_Long_IsCompact) && defined(PyUnstable_Long_CompactValue)
+    #define __Pyx_PyLong_IsCompact(x)     PyUnstable_Long_IsCompact((PyLongObject*) x)
+    #define __Pyx_PyLong_CompactValue(x)  PyUnstable_Long_CompactValue((PyLongObject*) x)
+  #else
+    #define __Pyx_PyLong_IsCompact(x)     (((PyLongObject*)x)->long_value.lv_tag < (2 << _PyLong_NON_SIZE_BITS))
+    #define __Pyx_PyLong_CompactValue(x)  ((1 - (Py_ssize_t) __Pyx_PyLong_Sign(x)) * (Py_ssize_t) __Pyx_PyLong_Digits(x)[0])
+  #endif
+  typedef Py_ssize_t  __Pyx_compact_pylong;
+  typedef size_t  __Pyx_compact_upylong;
+  #else
+  #define __Pyx_PyLong_IsNeg(x)  (Py_SIZE(x) < 0)
+  #define __Pyx_PyLong_IsNonNeg(x)  (Py_SIZE(x) >= 0)
+  #define __Pyx_PyLong_IsZero(x)  (Py_SIZE(x) == 0)
+  #define __Pyx_PyLong_IsPos(x)  (Py_SIZE(x) > 0)
+  #define __Pyx_PyLong_CompactValueUnsigned(x)  ((Py_SIZE(x) == 0) ? 0 : __Pyx_PyLong_Digits(x)[0])
+  #define __Pyx_PyLong_DigitCount(x)  __Pyx_sst_abs(Py_SIZE(x))
+  #define __Pyx_PyLong_SignedDigitCount(x)  Py_SIZE(x)
+  #define __Pyx_PyLong_IsCompact(x)  (Py_SIZE(x) == 0 || Py_SIZE(x) == 1 || Py_SIZE(x) == -1)
+  #define __Pyx_PyLong_CompactValue(x)\
+        ((Py_SIZE(x) == 0) ? (sdigit) 0 : ((Py_SIZE(x) < 0) ? -(sdigit)__Pyx_PyLong_Digits(x)[0] : (sdigit)__Pyx_PyLong_Digits(x)[0]))
+  typedef sdigit  __Pyx_compact_pylong;
+  typedef digit  __Pyx_compact_upylong;
+  #endif
+  #if PY_VERSION_HEX >= 0x030C00A5
+  #define __Pyx_PyLong_Digits(x)  (((PyLongObject*)x)->long_value.ob_digit)
+  #else
+  #define __Pyx_PyLong_Digits(x)  (((PyLongObject*)x)->ob_digit)
+  #endif
+#endif
+#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+#include <string.h>
+static int __Pyx_sys_getdefaultencoding_not_ascii;
+static int __Pyx_init_sys_getdefaultencoding_params(void) {
+    PyObject* sys;
+    PyObject* default_encoding = NULL;
+    PyObject* ascii_chars_u = NULL;
+    PyObject* ascii_chars_b = NULL;
+    const char* default_encoding_c;
+    sys = PyImport_ImportModule("sys");
+    if (!sys) goto bad;
+    default_encoding = PyObject_CallMethod(sys, (char*) "getdefaultencoding", NULL);
+    Py_DECREF(sys);
+    if (!default_encoding) goto bad;
+    default_encoding_c = PyBytes_AsString(default_encoding);
+    if (!default_encoding_c) goto bad;
+    if (strcmp(default_encoding_c, "ascii") == 0) {
+        __Pyx_sys_getdefaultencoding_not_ascii = 0;
+    } else {
+        char ascii_chars[128];
+        int c;
+        for (c = 0; c < 128; c++) {
+            ascii_chars[c] = (char) c;
+        }
+        __Pyx_sys_getdefaultencoding_not_ascii = 1;
+        ascii_chars_u = PyUnicode_DecodeASCII(ascii_chars, 128, NULL);
+        if (!ascii_chars_u) goto bad;
+        ascii_chars_b = PyUnicode_AsEncodedString(ascii_chars_u, default_encoding_c, NULL);
+        if (!ascii_chars_b || !PyBytes_Check(ascii_chars_b) || memcmp(ascii_chars, PyBytes_AS_STRING(ascii_chars_b), 128) != 0) {
+            PyErr_Format(
+                PyExc_ValueError,
+                "This module compiled with c_string_encoding=ascii, but default encoding '%.200s' is not a superset of ascii.",
+                default_encoding_c);
+            goto bad;
+        }
+        Py_DECREF(ascii_chars_u);
+        Py_DECREF(ascii_chars_b);
+    }
+    Py_DECREF(default_encoding);
+    return 0;
+bad:
+    Py_XDECREF(default_encoding);
+    Py_XDECREF(ascii_chars_u);
+    Py_XDECREF(ascii_chars_b);
+    return -1;
+}
+#endif
+#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT && PY_MAJOR_VERSION >= 3
+#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_DecodeUTF8(c_str, size, NULL)
+#else
+#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_Decode(c_str, size, __PYX_DEFAULT_STRING_ENCODING, NULL)
+#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+#include <string.h>
+static char* __PYX_DEFAULT_STRING_ENCODING;
+static int __Pyx_init_sys_getdefaultencoding_params(void) {
+    PyObject* sys;
+    PyObject* default_encoding = NULL;
+    char* default_encoding_c;
+    sys = PyImport_ImportModule("sys");
+    if (!sys) goto bad;
+    default_encoding = PyObject_CallMethod(sys, (char*) (const char*) "getdefaultencoding", NULL);
+    Py_DECREF(sys);
+    if (!default_encoding) goto bad;
+    default_encoding_c = PyBytes_AsString(default_encoding);
+    if (!default_encoding_c) goto bad;
+    __PYX_DEFAULT_STRING_ENCODING = (char*) malloc(strlen(default_encoding_c) + 1);
+    if (!__PYX_DEFAULT_STRING_ENCODING) goto bad;
+    strcpy(__PYX_DEFAULT_STRING_ENCODING, default_encoding_c);
+    Py_DECREF(default_encoding);
+    return 0;
+bad:
+    Py_XDECREF(default_encoding);
+    return -1;
+}
+#endif
+#endif
+
+
+/* Test for GCC > 2.95 */
+#if defined(__GNUC__)     && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))
+  #define likely(x)   __builtin_expect(!!(x), 1)
+  #define unlikely(x) __builtin_expect(!!(x), 0)
+#else /* !__GNUC__ or GCC < 2.95 */
+  #define likely(x)   (x)
+  #define unlikely(x) (x)
+#endif /* __GNUC__ */
+static CYTHON_INLINE void __Pyx_pretend_to_initialize(void* ptr) { (void)ptr; }
+
+#if !CYTHON_USE_MODULE_STATE
+static PyObject *__pyx_m = NULL;
+#endif
+static int __pyx_lineno;
+static int __pyx_clineno = 0;
+static const char * __pyx_cfilenm = __FILE__;
+static const char *__pyx_filename;
+
+/* #### Code section: filename_table ### */
+
+static const char *__pyx_f[] = {
+  "nalpy/math/_c_extensions/deterministic.pyx",
+  "nalpy/math/_c_extensions/mvector2.pxd",
+  "nalpy/math/_c_extensions/vector2.pxd",
+  "nalpy/math/_c_extensions/vector2_int.pxd",
+};
+/* #### Code section: utility_code_proto_before_types ### */
+/* ForceInitThreads.proto */
+#ifndef __PYX_FORCE_INIT_THREADS
+  #define __PYX_FORCE_INIT_THREADS 0
+#endif
+
+/* #### Code section: numeric_typedefs ### */
+
+/* "vector2_int.pxd":5
+ * from libc.math cimport hypot, ceil, floor, llround
+ * 
+ * ctypedef long long int _V2I_int_t             # <<<<<<<<<<<<<<
+ * 
+ * cdef class Vector2Int:
+ */
+typedef PY_LONG_LONG __pyx_t_5nalpy_4math_13_c_extensions_11vector2_int__V2I_int_t;
+/* #### Code section: complex_type_declarations ### */
+/* #### Code section: type_declarations ### */
+
+/*--- Type declarations ---*/
+struct __pyx_obj_5nalpy_4math_13_c_extensions_8mvector2_MVector2;
+struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2;
+struct __pyx_obj_5nalpy_4math_13_c_extensions_11vector2_int_Vector2Int;
+struct __pyx_defaults;
+typedef struct __pyx_defaults __pyx_defaults;
+struct __pyx_defaults {
+  double __pyx_arg_max_speed;
+};
+
+/* "mvector2.pxd":3
+ * #cython: language_level=3
+ * 
+ * cdef class MVector2:             # <<<<<<<<<<<<<<
+ *     cdef public double x
+ *     cdef public double y
+ */
+struct __pyx_obj_5nalpy_4math_13_c_extensions_8mvector2_MVector2 {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_5nalpy_4math_13_c_extensions_8mvector2_MVector2 *__pyx_vtab;
+  double x;
+  double y;
+};
+
+
+/* "vector2.pxd":6
+ * from libc.math cimport hypot, acos
+ * 
+ * cdef class Vector2:             # <<<<<<<<<<<<<<
+ *     cdef readonly double x
+ *     cdef readonly double y
+ */
+struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 {
+  PyObject_HEAD
+  double x;
+  double y;
+};
+
+
+/* "vector2_int.pxd":7
+ * ctypedef long long int _V2I_int_t
+ * 
+ * cdef class Vector2Int:             # <<<<<<<<<<<<<<
+ *     cdef readonly _V2I_int_t x
+ *     cdef readonly _V2I_int_t y
+ */
+struct __pyx_obj_5nalpy_4math_13_c_extensions_11vector2_int_Vector2Int {
+  PyObject_HEAD
+  __pyx_t_5nalpy_4math_13_c_extensions_11vector2_int__V2I_int_t x;
+  __pyx_t_5nalpy_4math_13_c_extensions_11vector2_int__V2I_int_t y;
+};
+
+
+
+/* "mvector2.pxd":3
+ * #cython: language_level=3
+ * 
+ * cdef class MVector2:             # <<<<<<<<<<<<<<
+ *     cdef public double x
+ *     cdef public double y
+ */
+
+struct __pyx_vtabstruct_5nalpy_4math_13_c_extensions_8mvector2_MVector2 {
+  struct __pyx_obj_5nalpy_4math_13_c_extensions_8mvector2_MVector2 *(*copy)(struct __pyx_obj_5nalpy_4math_13_c_extensions_8mvector2_MVector2 *, int __pyx_skip_dispatch);
+  PyObject *(*normalize)(struct __pyx_obj_5nalpy_4math_13_c_extensions_8mvector2_MVector2 *, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_5nalpy_4math_13_c_extensions_8mvector2_MVector2 *__pyx_vtabptr_5nalpy_4math_13_c_extensions_8mvector2_MVector2;
+/* #### Code section: utility_code_proto ### */
+
+/* --- Runtime support code (head) --- */
+/* Refnanny.proto */
+#ifndef CYTHON_REFNANNY
+  #define CYTHON_REFNANNY 0
+#endif
+#if CYTHON_REFNANNY
+  typedef struct {
+    void (*INCREF)(void*, PyObject*, Py_ssize_t);
+    void (*DECREF)(void*, PyObject*, Py_ssize_t);
+    void (*GOTREF)(void*, PyObject*, Py_ssize_t);
+    void (*GIVEREF)(void*, PyObject*, Py_ssize_t);
+    void* (*SetupContext)(const char*, Py_ssize_t, const char*);
+    void (*FinishContext)(void**);
+  } __Pyx_RefNannyAPIStruct;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNanny = NULL;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname);
+  #define __Pyx_RefNannyDeclarations void *__pyx_refnanny = NULL;
+#ifdef WITH_THREAD
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
+          if (acquire_gil) {\
+              PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), (__LINE__), (__FILE__));\
+              PyGILState_Release(__pyx_gilstate_save);\
+          } else {\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), (__LINE__), (__FILE__));\
+          }
+  #define __Pyx_RefNannyFinishContextNogil() {\
+              PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();\
+              __Pyx_RefNannyFinishContext();\
+              PyGILState_Release(__pyx_gilstate_save);\
+          }
+#else
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
+          __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), (__LINE__), (__FILE__))
+  #define __Pyx_RefNannyFinishContextNogil() __Pyx_RefNannyFinishContext()
+#endif
+  #define __Pyx_RefNannyFinishContextNogil() {\
+              PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();\
+              __Pyx_RefNannyFinishContext();\
+              PyGILState_Release(__pyx_gilstate_save);\
+          }
+  #define __Pyx_RefNannyFinishContext()\
+          __Pyx_RefNanny->FinishContext(&__pyx_refnanny)
+  #define __Pyx_INCREF(r)  __Pyx_RefNanny->INCREF(__pyx_refnanny, (PyObject *)(r), (__LINE__))
+  #define __Pyx_DECREF(r)  __Pyx_RefNanny->DECREF(__pyx_refnanny, (PyObject *)(r), (__LINE__))
+  #define __Pyx_GOTREF(r)  __Pyx_RefNanny->GOTREF(__pyx_refnanny, (PyObject *)(r), (__LINE__))
+  #define __Pyx_GIVEREF(r) __Pyx_RefNanny->GIVEREF(__pyx_refnanny, (PyObject *)(r), (__LINE__))
+  #define __Pyx_XINCREF(r)  do { if((r) == NULL); else {__Pyx_INCREF(r); }} while(0)
+  #define __Pyx_XDECREF(r)  do { if((r) == NULL); else {__Pyx_DECREF(r); }} while(0)
+  #define __Pyx_XGOTREF(r)  do { if((r) == NULL); else {__Pyx_GOTREF(r); }} while(0)
+  #define __Pyx_XGIVEREF(r) do { if((r) == NULL); else {__Pyx_GIVEREF(r);}} while(0)
+#else
+  #define __Pyx_RefNannyDeclarations
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)
+  #define __Pyx_RefNannyFinishContextNogil()
+  #define __Pyx_RefNannyFinishContext()
+  #define __Pyx_INCREF(r) Py_INCREF(r)
+  #define __Pyx_DECREF(r) Py_DECREF(r)
+  #define __Pyx_GOTREF(r)
+  #define __Pyx_GIVEREF(r)
+  #define __Pyx_XINCREF(r) Py_XINCREF(r)
+  #define __Pyx_XDECREF(r) Py_XDECREF(r)
+  #define __Pyx_XGOTREF(r)
+  #define __Pyx_XGIVEREF(r)
+#endif
+#define __Pyx_Py_XDECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; Py_XDECREF(tmp);\
+    } while (0)
+#define __Pyx_XDECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_XDECREF(tmp);\
+    } while (0)
+#define __Pyx_DECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_DECREF(tmp);\
+    } while (0)
+#define __Pyx_CLEAR(r)    do { PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);} while(0)
+#define __Pyx_XCLEAR(r)   do { if((r) != NULL) {PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);}} while(0)
+
+/* PyErrExceptionMatches.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_ExceptionMatches(err) __Pyx_PyErr_ExceptionMatchesInState(__pyx_tstate, err)
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err);
+#else
+#define __Pyx_PyErr_ExceptionMatches(err)  PyErr_ExceptionMatches(err)
+#endif
+
+/* PyThreadStateGet.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyThreadState_declare  PyThreadState *__pyx_tstate;
+#define __Pyx_PyThreadState_assign  __pyx_tstate = __Pyx_PyThreadState_Current;
+#if PY_VERSION_HEX >= 0x030C00A6
+#define __Pyx_PyErr_Occurred()  (__pyx_tstate->current_exception != NULL)
+#define __Pyx_PyErr_CurrentExceptionType()  (__pyx_tstate->current_exception ? (PyObject*) Py_TYPE(__pyx_tstate->current_exception) : (PyObject*) NULL)
+#else
+#define __Pyx_PyErr_Occurred()  (__pyx_tstate->curexc_type != NULL)
+#define __Pyx_PyErr_CurrentExceptionType()  (__pyx_tstate->curexc_type)
+#endif
+#else
+#define __Pyx_PyThreadState_declare
+#define __Pyx_PyThreadState_assign
+#define __Pyx_PyErr_Occurred()  (PyErr_Occurred() != NULL)
+#define __Pyx_PyErr_CurrentExceptionType()  PyErr_Occurred()
+#endif
+
+/* PyErrFetchRestore.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_Clear() __Pyx_ErrRestore(NULL, NULL, NULL)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  __Pyx_ErrRestoreInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)    __Pyx_ErrFetchInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  __Pyx_ErrRestoreInState(__pyx_tstate, type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)    __Pyx_ErrFetchInState(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A6
+#define __Pyx_PyErr_SetNone(exc) (Py_INCREF(exc), __Pyx_ErrRestore((exc), NULL, NULL))
+#else
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#endif
+#else
+#define __Pyx_PyErr_Clear() PyErr_Clear()
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestoreInState(tstate, type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchInState(tstate, type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)  PyErr_Fetch(type, value, tb)
+#endif
+
+/* PyObjectGetAttrStr.proto */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GetAttrStr(o,n) PyObject_GetAttr(o,n)
+#endif
+
+/* PyObjectGetAttrStrNoError.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name);
+
+/* GetBuiltinName.proto */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name);
+
+/* tp_new.proto */
+#define __Pyx_tp_new(type_obj, args) __Pyx_tp_new_kwargs(type_obj, args, NULL)
+static CYTHON_INLINE PyObject* __Pyx_tp_new_kwargs(PyObject* type_obj, PyObject* args, PyObject* kwargs) {
+    return (PyObject*) (((PyTypeObject*)type_obj)->tp_new((PyTypeObject*)type_obj, args, kwargs));
+}
+
+/* ExtTypeTest.proto */
+static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type);
+
+/* PyObjectCall.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw);
+#else
+#define __Pyx_PyObject_Call(func, arg, kw) PyObject_Call(func, arg, kw)
+#endif
+
+/* RaiseException.proto */
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
+
+/* TupleAndListFromArray.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyList_FromArray(PyObject *const *src, Py_ssize_t n);
+static CYTHON_INLINE PyObject* __Pyx_PyTuple_FromArray(PyObject *const *src, Py_ssize_t n);
+#endif
+
+/* IncludeStringH.proto */
+#include <string.h>
+
+/* BytesEquals.proto */
+static CYTHON_INLINE int __Pyx_PyBytes_Equals(PyObject* s1, PyObject* s2, int equals);
+
+/* UnicodeEquals.proto */
+static CYTHON_INLINE int __Pyx_PyUnicode_Equals(PyObject* s1, PyObject* s2, int equals);
+
+/* fastcall.proto */
+#if CYTHON_AVOID_BORROWED_REFS
+    #define __Pyx_Arg_VARARGS(args, i) PySequence_GetItem(args, i)
+#elif CYTHON_ASSUME_SAFE_MACROS
+    #define __Pyx_Arg_VARARGS(args, i) PyTuple_GET_ITEM(args, i)
+#else
+    #define __Pyx_Arg_VARARGS(args, i) PyTuple_GetItem(args, i)
+#endif
+#if CYTHON_AVOID_BORROWED_REFS
+    #define __Pyx_Arg_NewRef_VARARGS(arg) __Pyx_NewRef(arg)
+    #define __Pyx_Arg_XDECREF_VARARGS(arg) Py_XDECREF(arg)
+#else
+    #define __Pyx_Arg_NewRef_VARARGS(arg) arg
+    #define __Pyx_Arg_XDECREF_VARARGS(arg)
+#endif
+#define __Pyx_NumKwargs_VARARGS(kwds) PyDict_Size(kwds)
+#define __Pyx_KwValues_VARARGS(args, nargs) NULL
+#define __Pyx_GetKwValue_VARARGS(kw, kwvalues, s) __Pyx_PyDict_GetItemStrWithError(kw, s)
+#define __Pyx_KwargsAsDict_VARARGS(kw, kwvalues) PyDict_Copy(kw)
+#if CYTHON_METH_FASTCALL
+    #define __Pyx_Arg_FASTCALL(args, i) args[i]
+    #define __Pyx_NumKwargs_FASTCALL(kwds) PyTuple_GET_SIZE(kwds)
+    #define __Pyx_KwValues_FASTCALL(args, nargs) ((args) + (nargs))
+    static CYTHON_INLINE PyObject * __Pyx_GetKwValue_FASTCALL(PyObject *kwnames, PyObject *const *kwvalues, PyObject *s);
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030d0000
+    CYTHON_UNUSED static PyObject *__Pyx_KwargsAsDict_FASTCALL(PyObject *kwnames, PyObject *const *kwvalues);
+  #else
+    #define __Pyx_KwargsAsDict_FASTCALL(kw, kwvalues) _PyStack_AsDict(kwvalues, kw)
+  #endif
+    #define __Pyx_Arg_NewRef_FASTCALL(arg) arg  /* no-op, __Pyx_Arg_FASTCALL is direct and this needs
+                                                   to have the same reference counting */
+    #define __Pyx_Arg_XDECREF_FASTCALL(arg)
+#else
+    #define __Pyx_Arg_FASTCALL __Pyx_Arg_VARARGS
+    #define __Pyx_NumKwargs_FASTCALL __Pyx_NumKwargs_VARARGS
+    #define __Pyx_KwValues_FASTCALL __Pyx_KwValues_VARARGS
+    #define __Pyx_GetKwValue_FASTCALL __Pyx_GetKwValue_VARARGS
+    #define __Pyx_KwargsAsDict_FASTCALL __Pyx_KwargsAsDict_VARARGS
+    #define __Pyx_Arg_NewRef_FASTCALL(arg) __Pyx_Arg_NewRef_VARARGS(arg)
+    #define __Pyx_Arg_XDECREF_FASTCALL(arg) __Pyx_Arg_XDECREF_VARARGS(arg)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+#define __Pyx_ArgsSlice_VARARGS(args, start, stop) __Pyx_PyTuple_FromArray(&__Pyx_Arg_VARARGS(args, start), stop - start)
+#define __Pyx_ArgsSlice_FASTCALL(args, start, stop) __Pyx_PyTuple_FromArray(&__Pyx_Arg_FASTCALL(args, start), stop - start)
+#else
+#define __Pyx_ArgsSlice_VARARGS(args, start, stop) PyTuple_GetSlice(args, start, stop)
+#define __Pyx_ArgsSlice_FASTCALL(args, start, stop) PyTuple_GetSlice(args, start, stop)
+#endif
+
+/* RaiseDoubleKeywords.proto */
+static void __Pyx_RaiseDoubleKeywordsError(const char* func_name, PyObject* kw_name);
+
+/* ParseKeywords.proto */
+static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject *const *kwvalues,
+    PyObject **argnames[],
+    PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args,
+    const char* function_name);
+
+/* RaiseArgTupleInvalid.proto */
+static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
+    Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found);
+
+/* ArgTypeTest.proto */
+#define __Pyx_ArgTypeTest(obj, type, none_allowed, name, exact)\
+    ((likely(__Pyx_IS_TYPE(obj, type) | (none_allowed && (obj == Py_None)))) ? 1 :\
+        __Pyx__ArgTypeTest(obj, type, name, exact))
+static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact);
+
+/* TypeImport.proto */
+#ifndef __PYX_HAVE_RT_ImportType_proto_3_0_11
+#define __PYX_HAVE_RT_ImportType_proto_3_0_11
+#if defined (__STDC_VERSION__) && __STDC_VERSION__ >= 201112L
+#include <stdalign.h>
+#endif
+#if (defined (__STDC_VERSION__) && __STDC_VERSION__ >= 201112L) || __cplusplus >= 201103L
+#define __PYX_GET_STRUCT_ALIGNMENT_3_0_11(s) alignof(s)
+#else
+#define __PYX_GET_STRUCT_ALIGNMENT_3_0_11(s) sizeof(void*)
+#endif
+enum __Pyx_ImportType_CheckSize_3_0_11 {
+   __Pyx_ImportType_CheckSize_Error_3_0_11 = 0,
+   __Pyx_ImportType_CheckSize_Warn_3_0_11 = 1,
+   __Pyx_ImportType_CheckSize_Ignore_3_0_11 = 2
+};
+static PyTypeObject *__Pyx_ImportType_3_0_11(PyObject* module, const char *module_name, const char *class_name, size_t size, size_t alignment, enum __Pyx_ImportType_CheckSize_3_0_11 check_size);
+#endif
+
+/* GetVTable.proto */
+static void* __Pyx_GetVtable(PyTypeObject *type);
+
+/* IncludeStructmemberH.proto */
+#include <structmember.h>
+
+/* FixUpExtensionType.proto */
+#if CYTHON_USE_TYPE_SPECS
+static int __Pyx_fix_up_extension_type_from_spec(PyType_Spec *spec, PyTypeObject *type);
+#endif
+
+/* FetchSharedCythonModule.proto */
+static PyObject *__Pyx_FetchSharedCythonABIModule(void);
+
+/* FetchCommonType.proto */
+#if !CYTHON_USE_TYPE_SPECS
+static PyTypeObject* __Pyx_FetchCommonType(PyTypeObject* type);
+#else
+static PyTypeObject* __Pyx_FetchCommonTypeFromSpec(PyObject *module, PyType_Spec *spec, PyObject *bases);
+#endif
+
+/* PyMethodNew.proto */
+#if CYTHON_COMPILING_IN_LIMITED_API
+static PyObject *__Pyx_PyMethod_New(PyObject *func, PyObject *self, PyObject *typ) {
+    PyObject *typesModule=NULL, *methodType=NULL, *result=NULL;
+    CYTHON_UNUSED_VAR(typ);
+    if (!self)
+        return __Pyx_NewRef(func);
+    typesModule = PyImport_ImportModule("types");
+    if (!typesModule) return NULL;
+    methodType = PyObject_GetAttrString(typesModule, "MethodType");
+    Py_DECREF(typesModule);
+    if (!methodType) return NULL;
+    result = PyObject_CallFunctionObjArgs(methodType, func, self, NULL);
+    Py_DECREF(methodType);
+    return result;
+}
+#elif PY_MAJOR_VERSION >= 3
+static PyObject *__Pyx_PyMethod_New(PyObject *func, PyObject *self, PyObject *typ) {
+    CYTHON_UNUSED_VAR(typ);
+    if (!self)
+        return __Pyx_NewRef(func);
+    return PyMethod_New(func, self);
+}
+#else
+    #define __Pyx_PyMethod_New PyMethod_New
+#endif
+
+/* PyVectorcallFastCallDict.proto */
+#if CYTHON_METH_FASTCALL
+static CYTHON_INLINE PyObject *__Pyx_PyVectorcall_FastCallDict(PyObject *func, __pyx_vectorcallfunc vc, PyObject *const *args, size_t nargs, PyObject *kw);
+#endif
+
+/* CythonFunctionShared.proto */
+#define __Pyx_CyFunction_USED
+#define __Pyx_CYFUNCTION_STATICMETHOD  0x01
+#define __Pyx_CYFUNCTION_CLASSMETHOD   0x02
+#define __Pyx_CYFUNCTION_CCLASS        0x04
+#define __Pyx_CYFUNCTION_COROUTINE     0x08
+#define __Pyx_CyFunction_GetClosure(f)\
+    (((__pyx_CyFunctionObject *) (f))->func_closure)
+#if PY_VERSION_HEX < 0x030900B1 || CYTHON_COMPILING_IN_LIMITED_API
+  #define __Pyx_CyFunction_GetClassObj(f)\
+      (((__pyx_CyFunctionObject *) (f))->func_classobj)
+#else
+  #define __Pyx_CyFunction_GetClassObj(f)\
+      ((PyObject*) ((PyCMethodObject *) (f))->mm_class)
+#endif
+#define __Pyx_CyFunction_SetClassObj(f, classobj)\
+    __Pyx__CyFunction_SetClassObj((__pyx_CyFunctionObject *) (f), (classobj))
+#define __Pyx_CyFunction_Defaults(type, f)\
+    ((type *)(((__pyx_CyFunctionObject *) (f))->defaults))
+#define __Pyx_CyFunction_SetDefaultsGetter(f, g)\
+    ((__pyx_CyFunctionObject *) (f))->defaults_getter = (g)
+typedef struct {
+#if CYTHON_COMPILING_IN_LIMITED_API
+    PyObject_HEAD
+    PyObject *func;
+#elif PY_VERSION_HEX < 0x030900B1
+    PyCFunctionObject func;
+#else
+    PyCMethodObject func;
+#endif
+#if CYTHON_BACKPORT_VECTORCALL
+    __pyx_vectorcallfunc func_vectorcall;
+#endif
+#if PY_VERSION_HEX < 0x030500A0 || CYTHON_COMPILING_IN_LIMITED_API
+    PyObject *func_weakreflist;
+#endif
+    PyObject *func_dict;
+    PyObject *func_name;
+    PyObject *func_qualname;
+    PyObject *func_doc;
+    PyObject *func_globals;
+    PyObject *func_code;
+    PyObject *func_closure;
+#if PY_VERSION_HEX < 0x030900B1 || CYTHON_COMPILING_IN_LIMITED_API
+    PyObject *func_classobj;
+#endif
+    void *defaults;
+    int defaults_pyobjects;
+    size_t defaults_size;
+    int flags;
+    PyObject *defaults_tuple;
+    PyObject *defaults_kwdict;
+    PyObject *(*defaults_getter)(PyObject *);
+    PyObject *func_annotations;
+    PyObject *func_is_coroutine;
+} __pyx_CyFunctionObject;
+#undef __Pyx_CyOrPyCFunction_Check
+#define __Pyx_CyFunction_Check(obj)  __Pyx_TypeCheck(obj, __pyx_CyFunctionType)
+#define __Pyx_CyOrPyCFunction_Check(obj)  __Pyx_TypeCheck2(obj, __pyx_CyFunctionType, &PyCFunction_Type)
+#define __Pyx_CyFunction_CheckExact(obj)  __Pyx_IS_TYPE(obj, __pyx_CyFunctionType)
+static CYTHON_INLINE int __Pyx__IsSameCyOrCFunction(PyObject *func, void *cfunc);
+#undef __Pyx_IsSameCFunction
+#define __Pyx_IsSameCFunction(func, cfunc)   __Pyx__IsSameCyOrCFunction(func, cfunc)
+static PyObject *__Pyx_CyFunction_Init(__pyx_CyFunctionObject* op, PyMethodDef *ml,
+                                      int flags, PyObject* qualname,
+                                      PyObject *closure,
+                                      PyObject *module, PyObject *globals,
+                                      PyObject* code);
+static CYTHON_INLINE void __Pyx__CyFunction_SetClassObj(__pyx_CyFunctionObject* f, PyObject* classobj);
+static CYTHON_INLINE void *__Pyx_CyFunction_InitDefaults(PyObject *m,
+                                                         size_t size,
+                                                         int pyobjects);
+static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsTuple(PyObject *m,
+                                                            PyObject *tuple);
+static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsKwDict(PyObject *m,
+                                                             PyObject *dict);
+static CYTHON_INLINE void __Pyx_CyFunction_SetAnnotationsDict(PyObject *m,
+                                                              PyObject *dict);
+static int __pyx_CyFunction_init(PyObject *module);
+#if CYTHON_METH_FASTCALL
+static PyObject * __Pyx_CyFunction_Vectorcall_NOARGS(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames);
+static PyObject * __Pyx_CyFunction_Vectorcall_O(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames);
+static PyObject * __Pyx_CyFunction_Vectorcall_FASTCALL_KEYWORDS(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames);
+static PyObject * __Pyx_CyFunction_Vectorcall_FASTCALL_KEYWORDS_METHOD(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames);
+#if CYTHON_BACKPORT_VECTORCALL
+#define __Pyx_CyFunction_func_vectorcall(f) (((__pyx_CyFunctionObject*)f)->func_vectorcall)
+#else
+#define __Pyx_CyFunction_func_vectorcall(f) (((PyCFunctionObject*)f)->vectorcall)
+#endif
+#endif
+
+/* CythonFunction.proto */
+static PyObject *__Pyx_CyFunction_New(PyMethodDef *ml,
+                                      int flags, PyObject* qualname,
+                                      PyObject *closure,
+                                      PyObject *module, PyObject *globals,
+                                      PyObject* code);
+
+/* PyDictVersioning.proto */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+#define __PYX_DICT_VERSION_INIT  ((PY_UINT64_T) -1)
+#define __PYX_GET_DICT_VERSION(dict)  (((PyDictObject*)(dict))->ma_version_tag)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)\
+    (version_var) = __PYX_GET_DICT_VERSION(dict);\
+    (cache_var) = (value);
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP) {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    if (likely(__PYX_GET_DICT_VERSION(DICT) == __pyx_dict_version)) {\
+        (VAR) = __pyx_dict_cached_value;\
+    } else {\
+        (VAR) = __pyx_dict_cached_value = (LOOKUP);\
+        __pyx_dict_version = __PYX_GET_DICT_VERSION(DICT);\
+    }\
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj);
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj);
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version);
+#else
+#define __PYX_GET_DICT_VERSION(dict)  (0)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP)  (VAR) = (LOOKUP);
+#endif
+
+/* CLineInTraceback.proto */
+#ifdef CYTHON_CLINE_IN_TRACEBACK
+#define __Pyx_CLineForTraceback(tstate, c_line)  (((CYTHON_CLINE_IN_TRACEBACK)) ? c_line : 0)
+#else
+static int __Pyx_CLineForTraceback(PyThreadState *tstate, int c_line);
+#endif
+
+/* CodeObjectCache.proto */
+#if !CYTHON_COMPILING_IN_LIMITED_API
+typedef struct {
+    PyCodeObject* code_object;
+    int code_line;
+} __Pyx_CodeObjectCacheEntry;
+struct __Pyx_CodeObjectCache {
+    int count;
+    int max_count;
+    __Pyx_CodeObjectCacheEntry* entries;
+};
+static struct __Pyx_CodeObjectCache __pyx_code_cache = {0,0,NULL};
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line);
+static PyCodeObject *__pyx_find_code_object(int code_line);
+static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object);
+#endif
+
+/* AddTraceback.proto */
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename);
+
+/* FormatTypeName.proto */
+#if CYTHON_COMPILING_IN_LIMITED_API
+typedef PyObject *__Pyx_TypeName;
+#define __Pyx_FMT_TYPENAME "%U"
+static __Pyx_TypeName __Pyx_PyType_GetName(PyTypeObject* tp);
+#define __Pyx_DECREF_TypeName(obj) Py_XDECREF(obj)
+#else
+typedef const char *__Pyx_TypeName;
+#define __Pyx_FMT_TYPENAME "%.200s"
+#define __Pyx_PyType_GetName(tp) ((tp)->tp_name)
+#define __Pyx_DECREF_TypeName(obj)
+#endif
+
+/* GCCDiagnostics.proto */
+#if !defined(__INTEL_COMPILER) && defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 6))
+#define __Pyx_HAS_GCC_DIAGNOSTIC
+#endif
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
+
+/* FastTypeChecks.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_TypeCheck(obj, type) __Pyx_IsSubtype(Py_TYPE(obj), (PyTypeObject *)type)
+#define __Pyx_TypeCheck2(obj, type1, type2) __Pyx_IsAnySubtype2(Py_TYPE(obj), (PyTypeObject *)type1, (PyTypeObject *)type2)
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b);
+static CYTHON_INLINE int __Pyx_IsAnySubtype2(PyTypeObject *cls, PyTypeObject *a, PyTypeObject *b);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject *type);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *type1, PyObject *type2);
+#else
+#define __Pyx_TypeCheck(obj, type) PyObject_TypeCheck(obj, (PyTypeObject *)type)
+#define __Pyx_TypeCheck2(obj, type1, type2) (PyObject_TypeCheck(obj, (PyTypeObject *)type1) || PyObject_TypeCheck(obj, (PyTypeObject *)type2))
+#define __Pyx_PyErr_GivenExceptionMatches(err, type) PyErr_GivenExceptionMatches(err, type)
+#define __Pyx_PyErr_GivenExceptionMatches2(err, type1, type2) (PyErr_GivenExceptionMatches(err, type1) || PyErr_GivenExceptionMatches(err, type2))
+#endif
+#define __Pyx_PyErr_ExceptionMatches2(err1, err2)  __Pyx_PyErr_GivenExceptionMatches2(__Pyx_PyErr_CurrentExceptionType(), err1, err2)
+#define __Pyx_PyException_Check(obj) __Pyx_TypeCheck(obj, PyExc_Exception)
+
+/* CheckBinaryVersion.proto */
+static unsigned long __Pyx_get_runtime_version(void);
+static int __Pyx_check_binary_version(unsigned long ct_version, unsigned long rt_version, int allow_newer);
+
+/* InitStrings.proto */
+static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
+
+/* #### Code section: module_declarations ### */
+
+/* Module declarations from "cython" */
+
+/* Module declarations from "cpython.long" */
+
+/* Module declarations from "libc.math" */
+
+/* Module declarations from "libc.stdint" */
+
+/* Module declarations from "libc.string" */
+
+/* Module declarations from "nalpy.math._c_extensions._deterministic" */
+static CYTHON_INLINE int32_t __pyx_f_5nalpy_4math_13_c_extensions_14_deterministic__high_word(double); /*proto*/
+static CYTHON_INLINE uint32_t __pyx_f_5nalpy_4math_13_c_extensions_14_deterministic__low_word(double); /*proto*/
+static CYTHON_INLINE double __pyx_f_5nalpy_4math_13_c_extensions_14_deterministic__clear_low_word(double); /*proto*/
+static CYTHON_INLINE double __pyx_f_5nalpy_4math_13_c_extensions_14_deterministic_det_hypot(double, double); /*proto*/
+static CYTHON_INLINE double __pyx_f_5nalpy_4math_13_c_extensions_14_deterministic__acos_rational(double); /*proto*/
+static CYTHON_INLINE double __pyx_f_5nalpy_4math_13_c_extensions_14_deterministic_det_acos(double); /*proto*/
+static CYTHON_INLINE double __pyx_f_5nalpy_4math_13_c_extensions_14_deterministic__atan(double); /*proto*/
+static CYTHON_INLINE double __pyx_f_5nalpy_4math_13_c_extensions_14_deterministic_det_atan2(double, double); /*proto*/
+static CYTHON_INLINE double __pyx_f_5nalpy_4math_13_c_extensions_14_deterministic_det_round(double); /*proto*/
+
+/* Module declarations from "nalpy.math._c_extensions.mvector2" */
+
+/* Module declarations from "nalpy.math._c_extensions.vector2" */
+static CYTHON_INLINE struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *__pyx_f_5nalpy_4math_13_c_extensions_7vector2_new_vector2(double, double); /*proto*/
+static CYTHON_INLINE double __pyx_f_5nalpy_4math_13_c_extensions_7vector2_angle2(double, double, double, double); /*proto*/
+static CYTHON_INLINE void __pyx_f_5nalpy_4math_13_c_extensions_7vector2_lerp_unclamped2(double, double, double, double, double, double *); /*proto*/
+static CYTHON_INLINE int __pyx_f_5nalpy_4math_13_c_extensions_7vector2_move_towards2_dist(double, double, double, double, double, double, double *); /*proto*/
+static CYTHON_INLINE void __pyx_f_5nalpy_4math_13_c_extensions_7vector2_smooth_damp2_dist(double, double, double, double, double, double *, double, double, double, double *); /*proto*/
+
+/* Module declarations from "nalpy.math._c_extensions.vector2_int" */
+static CYTHON_INLINE struct __pyx_obj_5nalpy_4math_13_c_extensions_11vector2_int_Vector2Int *__pyx_f_5nalpy_4math_13_c_extensions_11vector2_int_new_vector2_int(__pyx_t_5nalpy_4math_13_c_extensions_11vector2_int__V2I_int_t, __pyx_t_5nalpy_4math_13_c_extensions_11vector2_int__V2I_int_t); /*proto*/
+
+/* Module declarations from "nalpy.math._c_extensions.deterministic" */
+static struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *__pyx_v_5nalpy_4math_13_c_extensions_13deterministic__zero = 0;
+static double __pyx_v_5nalpy_4math_13_c_extensions_13deterministic__LIMIT;
+static PY_LONG_LONG __pyx_f_5nalpy_4math_13_c_extensions_13deterministic__to_int(double); /*proto*/
+static CYTHON_INLINE double __pyx_f_5nalpy_4math_13_c_extensions_13deterministic__angle2(double, double, double, double); /*proto*/
+/* #### Code section: typeinfo ### */
+/* #### Code section: before_global_var ### */
+#define __Pyx_MODULE_NAME "nalpy.math._c_extensions.deterministic"
+extern int __pyx_module_is_main_nalpy__math___c_extensions__deterministic;
+int __pyx_module_is_main_nalpy__math___c_extensions__deterministic = 0;
+
+/* Implementation of "nalpy.math._c_extensions.deterministic" */
+/* #### Code section: global_var ### */
+static PyObject *__pyx_builtin_ValueError;
+static PyObject *__pyx_builtin_OverflowError;
+/* #### Code section: string_decls ### */
+static const char __pyx_k_a[] = "a";
+static const char __pyx_k_b[] = "b";
+static const char __pyx_k_v[] = "v";
+static const char __pyx_k_x[] = "x";
+static const char __pyx_k_y[] = "y";
+static const char __pyx_k_to[] = "_to";
+static const char __pyx_k__26[] = "?";
+static const char __pyx_k_out[] = "out";
+static const char __pyx_k_acos[] = "acos";
+static const char __pyx_k_dist[] = "dist";
+static const char __pyx_k_from[] = "_from";
+static const char __pyx_k_main[] = "__main__";
+static const char __pyx_k_name[] = "__name__";
+static const char __pyx_k_test[] = "__test__";
+static const char __pyx_k_angle[] = "angle";
+static const char __pyx_k_atan2[] = "atan2";
+static const char __pyx_k_hypot[] = "hypot";
+static const char __pyx_k_round[] = "round";
+static const char __pyx_k_output[] = "output";
+static const char __pyx_k_target[] = "target";
+static const char __pyx_k_current[] = "current";
+static const char __pyx_k_distance[] = "distance";
+static const char __pyx_k_velocity[] = "velocity";
+static const char __pyx_k_magnitude[] = "magnitude";
+static const char __pyx_k_max_speed[] = "max_speed";
+static const char __pyx_k_ValueError[] = "ValueError";
+static const char __pyx_k_delta_time[] = "delta_time";
+static const char __pyx_k_normalized[] = "normalized";
+static const char __pyx_k_pyx_vtable[] = "__pyx_vtable__";
+static const char __pyx_k_smooth_damp[] = "smooth_damp";
+static const char __pyx_k_smooth_time[] = "smooth_time";
+static const char __pyx_k_is_coroutine[] = "_is_coroutine";
+static const char __pyx_k_move_towards[] = "move_towards";
+static const char __pyx_k_round_vector[] = "round_vector";
+static const char __pyx_k_signed_angle[] = "signed_angle";
+static const char __pyx_k_OverflowError[] = "OverflowError";
+static const char __pyx_k_unsigned_angle[] = "unsigned_angle";
+static const char __pyx_k_current_velocity[] = "current_velocity";
+static const char __pyx_k_math_domain_error[] = "math domain error";
+static const char __pyx_k_asyncio_coroutines[] = "asyncio.coroutines";
+static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
+static const char __pyx_k_max_distance_delta[] = "max_distance_delta";
+static const char __pyx_k_Cannot_convert_float_NaN_to_inte[] = "Cannot convert float NaN to integer.";
+static const char __pyx_k_Result_does_not_fit_into_a_64_bi[] = "Result does not fit into a 64-bit integer.";
+static const char __pyx_k_nalpy_math__c_extensions_determi[] = "nalpy/math/_c_extensions/deterministic.pyx";
+static const char __pyx_k_nalpy_math__c_extensions_determi_2[] = "nalpy.math._c_extensions.deterministic";
+/* #### Code section: decls ### */
+static PyObject *__pyx_pf_5nalpy_4math_13_c_extensions_13deterministic_hypot(CYTHON_UNUSED PyObject *__pyx_self, double __pyx_v_x, double __pyx_v_y); /* proto */
+static PyObject *__pyx_pf_5nalpy_4math_13_c_extensions_13deterministic_2acos(CYTHON_UNUSED PyObject *__pyx_self, double __pyx_v_x); /* proto */
+static PyObject *__pyx_pf_5nalpy_4math_13_c_extensions_13deterministic_4atan2(CYTHON_UNUSED PyObject *__pyx_self, double __pyx_v_y, double __pyx_v_x); /* proto */
+static PyObject *__pyx_pf_5nalpy_4math_13_c_extensions_13deterministic_6round(CYTHON_UNUSED PyObject *__pyx_self, double __pyx_v_x); /* proto */
+static PyObject *__pyx_pf_5nalpy_4math_13_c_extensions_13deterministic_8magnitude(CYTHON_UNUSED PyObject *__pyx_self, struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *__pyx_v_v); /* proto */
+static PyObject *__pyx_pf_5nalpy_4math_13_c_extensions_13deterministic_10normalized(CYTHON_UNUSED PyObject *__pyx_self, struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *__pyx_v_v); /* proto */
+static PyObject *__pyx_pf_5nalpy_4math_13_c_extensions_13deterministic_12distance(CYTHON_UNUSED PyObject *__pyx_self, struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *__pyx_v_a, struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *__pyx_v_b); /* proto */
+static PyObject *__pyx_pf_5nalpy_4math_13_c_extensions_13deterministic_14angle(CYTHON_UNUSED PyObject *__pyx_self, struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *__pyx_v__from, struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *__pyx_v__to); /* proto */
+static PyObject *__pyx_pf_5nalpy_4math_13_c_extensions_13deterministic_16signed_angle(CYTHON_UNUSED PyObject *__pyx_self, struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *__pyx_v__from, struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *__pyx_v__to); /* proto */
+static PyObject *__pyx_pf_5nalpy_4math_13_c_extensions_13deterministic_18move_towards(CYTHON_UNUSED PyObject *__pyx_self, struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *__pyx_v_current, struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *__pyx_v_target, double __pyx_v_max_distance_delta); /* proto */
+static PyObject *__pyx_pf_5nalpy_4math_13_c_extensions_13deterministic_24__defaults__(CYTHON_UNUSED PyObject *__pyx_self); /* proto */
+static PyObject *__pyx_pf_5nalpy_4math_13_c_extensions_13deterministic_20smooth_damp(CYTHON_UNUSED PyObject *__pyx_self, struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *__pyx_v_current, struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *__pyx_v_target, struct __pyx_obj_5nalpy_4math_13_c_extensions_8mvector2_MVector2 *__pyx_v_current_velocity, double __pyx_v_smooth_time, double __pyx_v_delta_time, double __pyx_v_max_speed); /* proto */
+static PyObject *__pyx_pf_5nalpy_4math_13_c_extensions_13deterministic_22round_vector(CYTHON_UNUSED PyObject *__pyx_self, struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *__pyx_v_v); /* proto */
+/* #### Code section: late_includes ### */
+/* #### Code section: module_state ### */
+typedef struct {
+  PyObject *__pyx_d;
+  PyObject *__pyx_b;
+  PyObject *__pyx_cython_runtime;
+  PyObject *__pyx_empty_tuple;
+  PyObject *__pyx_empty_bytes;
+  PyObject *__pyx_empty_unicode;
+  #ifdef __Pyx_CyFunction_USED
+  PyTypeObject *__pyx_CyFunctionType;
+  #endif
+  #ifdef __Pyx_FusedFunction_USED
+  PyTypeObject *__pyx_FusedFunctionType;
+  #endif
+  #ifdef __Pyx_Generator_USED
+  PyTypeObject *__pyx_GeneratorType;
+  #endif
+  #ifdef __Pyx_IterableCoroutine_USED
+  PyTypeObject *__pyx_IterableCoroutineType;
+  #endif
+  #ifdef __Pyx_Coroutine_USED
+  PyTypeObject *__pyx_CoroutineAwaitType;
+  #endif
+  #ifdef __Pyx_Coroutine_USED
+  PyTypeObject *__pyx_CoroutineType;
+  #endif
+  #if CYTHON_USE_MODULE_STATE
+  #endif
+  #if CYTHON_USE_MODULE_STATE
+  #endif
+  #if CYTHON_USE_MODULE_STATE
+  #endif
+  #if CYTHON_USE_MODULE_STATE
+  #endif
+  #if CYTHON_USE_MODULE_STATE
+  #endif
+  #if CYTHON_USE_MODULE_STATE
+  #endif
+  #if CYTHON_USE_MODULE_STATE
+  #endif
+  PyTypeObject *__pyx_ptype_5nalpy_4math_13_c_extensions_8mvector2_MVector2;
+  #if CYTHON_USE_MODULE_STATE
+  #endif
+  PyTypeObject *__pyx_ptype_5nalpy_4math_13_c_extensions_7vector2_Vector2;
+  #if CYTHON_USE_MODULE_STATE
+  #endif
+  PyTypeObject *__pyx_ptype_5nalpy_4math_13_c_extensions_11vector2_int_Vector2Int;
+  #if CYTHON_USE_MODULE_STATE
+  #endif
+  PyObject *__pyx_kp_u_Cannot_convert_float_NaN_to_inte;
+  PyObject *__pyx_n_s_OverflowError;
+  PyObject *__pyx_kp_u_Result_does_not_fit_into_a_64_bi;
+  PyObject *__pyx_n_s_ValueError;
+  PyObject *__pyx_n_s__26;
+  PyObject *__pyx_n_s_a;
+  PyObject *__pyx_n_s_acos;
+  PyObject *__pyx_n_s_angle;
+  PyObject *__pyx_n_s_asyncio_coroutines;
+  PyObject *__pyx_n_s_atan2;
+  PyObject *__pyx_n_s_b;
+  PyObject *__pyx_n_s_cline_in_traceback;
+  PyObject *__pyx_n_s_current;
+  PyObject *__pyx_n_s_current_velocity;
+  PyObject *__pyx_n_s_delta_time;
+  PyObject *__pyx_n_s_dist;
+  PyObject *__pyx_n_s_distance;
+  PyObject *__pyx_n_s_from;
+  PyObject *__pyx_n_s_hypot;
+  PyObject *__pyx_n_s_is_coroutine;
+  PyObject *__pyx_n_s_magnitude;
+  PyObject *__pyx_n_s_main;
+  PyObject *__pyx_kp_u_math_domain_error;
+  PyObject *__pyx_n_s_max_distance_delta;
+  PyObject *__pyx_n_s_max_speed;
+  PyObject *__pyx_n_s_move_towards;
+  PyObject *__pyx_kp_s_nalpy_math__c_extensions_determi;
+  PyObject *__pyx_n_s_nalpy_math__c_extensions_determi_2;
+  PyObject *__pyx_n_s_name;
+  PyObject *__pyx_n_s_normalized;
+  PyObject *__pyx_n_s_out;
+  PyObject *__pyx_n_s_output;
+  PyObject *__pyx_n_s_pyx_vtable;
+  PyObject *__pyx_n_s_round;
+  PyObject *__pyx_n_s_round_vector;
+  PyObject *__pyx_n_s_signed_angle;
+  PyObject *__pyx_n_s_smooth_damp;
+  PyObject *__pyx_n_s_smooth_time;
+  PyObject *__pyx_n_s_target;
+  PyObject *__pyx_n_s_test;
+  PyObject *__pyx_n_s_to;
+  PyObject *__pyx_n_s_unsigned_angle;
+  PyObject *__pyx_n_s_v;
+  PyObject *__pyx_n_s_velocity;
+  PyObject *__pyx_n_s_x;
+  PyObject *__pyx_n_s_y;
+  PyObject *__pyx_tuple_;
+  PyObject *__pyx_tuple__2;
+  PyObject *__pyx_tuple__3;
+  PyObject *__pyx_tuple__4;
+  PyObject *__pyx_tuple__6;
+  PyObject *__pyx_tuple__8;
+  PyObject *__pyx_tuple__11;
+  PyObject *__pyx_tuple__13;
+  PyObject *__pyx_tuple__15;
+  PyObject *__pyx_tuple__17;
+  PyObject *__pyx_tuple__19;
+  PyObject *__pyx_tuple__21;
+  PyObject *__pyx_tuple__23;
+  PyObject *__pyx_codeobj__5;
+  PyObject *__pyx_codeobj__7;
+  PyObject *__pyx_codeobj__9;
+  PyObject *__pyx_codeobj__10;
+  PyObject *__pyx_codeobj__12;
+  PyObject *__pyx_codeobj__14;
+  PyObject *__pyx_codeobj__16;
+  PyObject *__pyx_codeobj__18;
+  PyObject *__pyx_codeobj__20;
+  PyObject *__pyx_codeobj__22;
+  PyObject *__pyx_codeobj__24;
+  PyObject *__pyx_codeobj__25;
+} __pyx_mstate;
+
+#if CYTHON_USE_MODULE_STATE
+#ifdef __cplusplus
+namespace {
+  extern struct PyModuleDef __pyx_moduledef;
+} /* anonymous namespace */
+#else
+static struct PyModuleDef __pyx_moduledef;
+#endif
+
+#define __pyx_mstate(o) ((__pyx_mstate *)__Pyx_PyModule_GetState(o))
+
+#define __pyx_mstate_global (__pyx_mstate(PyState_FindModule(&__pyx_moduledef)))
+
+#define __pyx_m (PyState_FindModule(&__pyx_moduledef))
+#else
+static __pyx_mstate __pyx_mstate_global_static =
+#ifdef __cplusplus
+    {};
+#else
+    {0};
+#endif
+static __pyx_mstate *__pyx_mstate_global = &__pyx_mstate_global_static;
+#endif
+/* #### Code section: module_state_clear ### */
+#if CYTHON_USE_MODULE_STATE
+static int __pyx_m_clear(PyObject *m) {
+  __pyx_mstate *clear_module_state = __pyx_mstate(m);
+  if (!clear_module_state) return 0;
+  Py_CLEAR(clear_module_state->__pyx_d);
+  Py_CLEAR(clear_module_state->__pyx_b);
+  Py_CLEAR(clear_module_state->__pyx_cython_runtime);
+  Py_CLEAR(clear_module_state->__pyx_empty_tuple);
+  Py_CLEAR(clear_module_state->__pyx_empty_bytes);
+  Py_CLEAR(clear_module_state->__pyx_empty_unicode);
+  #ifdef __Pyx_CyFunction_USED
+  Py_CLEAR(clear_module_state->__pyx_CyFunctionType);
+  #endif
+  #ifdef __Pyx_FusedFunction_USED
+  Py_CLEAR(clear_module_state->__pyx_FusedFunctionType);
+  #endif
+  Py_CLEAR(clear_module_state->__pyx_ptype_5nalpy_4math_13_c_extensions_8mvector2_MVector2);
+  Py_CLEAR(clear_module_state->__pyx_ptype_5nalpy_4math_13_c_extensions_7vector2_Vector2);
+  Py_CLEAR(clear_module_state->__pyx_ptype_5nalpy_4math_13_c_extensions_11vector2_int_Vector2Int);
+  Py_CLEAR(clear_module_state->__pyx_kp_u_Cannot_convert_float_NaN_to_inte);
+  Py_CLEAR(clear_module_state->__pyx_n_s_OverflowError);
+  Py_CLEAR(clear_module_state->__pyx_kp_u_Result_does_not_fit_into_a_64_bi);
+  Py_CLEAR(clear_module_state->__pyx_n_s_ValueError);
+  Py_CLEAR(clear_module_state->__pyx_n_s__26);
+  Py_CLEAR(clear_module_state->__pyx_n_s_a);
+  Py_CLEAR(clear_module_state->__pyx_n_s_acos);
+  Py_CLEAR(clear_module_state->__pyx_n_s_angle);
+  Py_CLEAR(clear_module_state->__pyx_n_s_asyncio_coroutines);
+  Py_CLEAR(clear_module_state->__pyx_n_s_atan2);
+  Py_CLEAR(clear_module_state->__pyx_n_s_b);
+  Py_CLEAR(clear_module_state->__pyx_n_s_cline_in_traceback);
+  Py_CLEAR(clear_module_state->__pyx_n_s_current);
+  Py_CLEAR(clear_module_state->__pyx_n_s_current_velocity);
+  Py_CLEAR(clear_module_state->__pyx_n_s_delta_time);
+  Py_CLEAR(clear_module_state->__pyx_n_s_dist);
+  Py_CLEAR(clear_module_state->__pyx_n_s_distance);
+  Py_CLEAR(clear_module_state->__pyx_n_s_from);
+  Py_CLEAR(clear_module_state->__pyx_n_s_hypot);
+  Py_CLEAR(clear_module_state->__pyx_n_s_is_coroutine);
+  Py_CLEAR(clear_module_state->__pyx_n_s_magnitude);
+  Py_CLEAR(clear_module_state->__pyx_n_s_main);
+  Py_CLEAR(clear_module_state->__pyx_kp_u_math_domain_error);
+  Py_CLEAR(clear_module_state->__pyx_n_s_max_distance_delta);
+  Py_CLEAR(clear_module_state->__pyx_n_s_max_speed);
+  Py_CLEAR(clear_module_state->__pyx_n_s_move_towards);
+  Py_CLEAR(clear_module_state->__pyx_kp_s_nalpy_math__c_extensions_determi);
+  Py_CLEAR(clear_module_state->__pyx_n_s_nalpy_math__c_extensions_determi_2);
+  Py_CLEAR(clear_module_state->__pyx_n_s_name);
+  Py_CLEAR(clear_module_state->__pyx_n_s_normalized);
+  Py_CLEAR(clear_module_state->__pyx_n_s_out);
+  Py_CLEAR(clear_module_state->__pyx_n_s_output);
+  Py_CLEAR(clear_module_state->__pyx_n_s_pyx_vtable);
+  Py_CLEAR(clear_module_state->__pyx_n_s_round);
+  Py_CLEAR(clear_module_state->__pyx_n_s_round_vector);
+  Py_CLEAR(clear_module_state->__pyx_n_s_signed_angle);
+  Py_CLEAR(clear_module_state->__pyx_n_s_smooth_damp);
+  Py_CLEAR(clear_module_state->__pyx_n_s_smooth_time);
+  Py_CLEAR(clear_module_state->__pyx_n_s_target);
+  Py_CLEAR(clear_module_state->__pyx_n_s_test);
+  Py_CLEAR(clear_module_state->__pyx_n_s_to);
+  Py_CLEAR(clear_module_state->__pyx_n_s_unsigned_angle);
+  Py_CLEAR(clear_module_state->__pyx_n_s_v);
+  Py_CLEAR(clear_module_state->__pyx_n_s_velocity);
+  Py_CLEAR(clear_module_state->__pyx_n_s_x);
+  Py_CLEAR(clear_module_state->__pyx_n_s_y);
+  Py_CLEAR(clear_module_state->__pyx_tuple_);
+  Py_CLEAR(clear_module_state->__pyx_tuple__2);
+  Py_CLEAR(clear_module_state->__pyx_tuple__3);
+  Py_CLEAR(clear_module_state->__pyx_tuple__4);
+  Py_CLEAR(clear_module_state->__pyx_tuple__6);
+  Py_CLEAR(clear_module_state->__pyx_tuple__8);
+  Py_CLEAR(clear_module_state->__pyx_tuple__11);
+  Py_CLEAR(clear_module_state->__pyx_tuple__13);
+  Py_CLEAR(clear_module_state->__pyx_tuple__15);
+  Py_CLEAR(clear_module_state->__pyx_tuple__17);
+  Py_CLEAR(clear_module_state->__pyx_tuple__19);
+  Py_CLEAR(clear_module_state->__pyx_tuple__21);
+  Py_CLEAR(clear_module_state->__pyx_tuple__23);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__5);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__7);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__9);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__10);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__12);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__14);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__16);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__18);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__20);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__22);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__24);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__25);
+  return 0;
+}
+#endif
+/* #### Code section: module_state_traverse ### */
+#if CYTHON_USE_MODULE_STATE
+static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
+  __pyx_mstate *traverse_module_state = __pyx_mstate(m);
+  if (!traverse_module_state) return 0;
+  Py_VISIT(traverse_module_state->__pyx_d);
+  Py_VISIT(traverse_module_state->__pyx_b);
+  Py_VISIT(traverse_module_state->__pyx_cython_runtime);
+  Py_VISIT(traverse_module_state->__pyx_empty_tuple);
+  Py_VISIT(traverse_module_state->__pyx_empty_bytes);
+  Py_VISIT(traverse_module_state->__pyx_empty_unicode);
+  #ifdef __Pyx_CyFunction_USED
+  Py_VISIT(traverse_module_state->__pyx_CyFunctionType);
+  #endif
+  #ifdef __Pyx_FusedFunction_USED
+  Py_VISIT(traverse_module_state->__pyx_FusedFunctionType);
+  #endif
+  Py_VISIT(traverse_module_state->__pyx_ptype_5nalpy_4math_13_c_extensions_8mvector2_MVector2);
+  Py_VISIT(traverse_module_state->__pyx_ptype_5nalpy_4math_13_c_extensions_7vector2_Vector2);
+  Py_VISIT(traverse_module_state->__pyx_ptype_5nalpy_4math_13_c_extensions_11vector2_int_Vector2Int);
+  Py_VISIT(traverse_module_state->__pyx_kp_u_Cannot_convert_float_NaN_to_inte);
+  Py_VISIT(traverse_module_state->__pyx_n_s_OverflowError);
+  Py_VISIT(traverse_module_state->__pyx_kp_u_Result_does_not_fit_into_a_64_bi);
+  Py_VISIT(traverse_module_state->__pyx_n_s_ValueError);
+  Py_VISIT(traverse_module_state->__pyx_n_s__26);
+  Py_VISIT(traverse_module_state->__pyx_n_s_a);
+  Py_VISIT(traverse_module_state->__pyx_n_s_acos);
+  Py_VISIT(traverse_module_state->__pyx_n_s_angle);
+  Py_VISIT(traverse_module_state->__pyx_n_s_asyncio_coroutines);
+  Py_VISIT(traverse_module_state->__pyx_n_s_atan2);
+  Py_VISIT(traverse_module_state->__pyx_n_s_b);
+  Py_VISIT(traverse_module_state->__pyx_n_s_cline_in_traceback);
+  Py_VISIT(traverse_module_state->__pyx_n_s_current);
+  Py_VISIT(traverse_module_state->__pyx_n_s_current_velocity);
+  Py_VISIT(traverse_module_state->__pyx_n_s_delta_time);
+  Py_VISIT(traverse_module_state->__pyx_n_s_dist);
+  Py_VISIT(traverse_module_state->__pyx_n_s_distance);
+  Py_VISIT(traverse_module_state->__pyx_n_s_from);
+  Py_VISIT(traverse_module_state->__pyx_n_s_hypot);
+  Py_VISIT(traverse_module_state->__pyx_n_s_is_coroutine);
+  Py_VISIT(traverse_module_state->__pyx_n_s_magnitude);
+  Py_VISIT(traverse_module_state->__pyx_n_s_main);
+  Py_VISIT(traverse_module_state->__pyx_kp_u_math_domain_error);
+  Py_VISIT(traverse_module_state->__pyx_n_s_max_distance_delta);
+  Py_VISIT(traverse_module_state->__pyx_n_s_max_speed);
+  Py_VISIT(traverse_module_state->__pyx_n_s_move_towards);
+  Py_VISIT(traverse_module_state->__pyx_kp_s_nalpy_math__c_extensions_determi);
+  Py_VISIT(traverse_module_state->__pyx_n_s_nalpy_math__c_extensions_determi_2);
+  Py_VISIT(traverse_module_state->__pyx_n_s_name);
+  Py_VISIT(traverse_module_state->__pyx_n_s_normalized);
+  Py_VISIT(traverse_module_state->__pyx_n_s_out);
+  Py_VISIT(traverse_module_state->__pyx_n_s_output);
+  Py_VISIT(traverse_module_state->__pyx_n_s_pyx_vtable);
+  Py_VISIT(traverse_module_state->__pyx_n_s_round);
+  Py_VISIT(traverse_module_state->__pyx_n_s_round_vector);
+  Py_VISIT(traverse_module_state->__pyx_n_s_signed_angle);
+  Py_VISIT(traverse_module_state->__pyx_n_s_smooth_damp);
+  Py_VISIT(traverse_module_state->__pyx_n_s_smooth_time);
+  Py_VISIT(traverse_module_state->__pyx_n_s_target);
+  Py_VISIT(traverse_module_state->__pyx_n_s_test);
+  Py_VISIT(traverse_module_state->__pyx_n_s_to);
+  Py_VISIT(traverse_module_state->__pyx_n_s_unsigned_angle);
+  Py_VISIT(traverse_module_state->__pyx_n_s_v);
+  Py_VISIT(traverse_module_state->__pyx_n_s_velocity);
+  Py_VISIT(traverse_module_state->__pyx_n_s_x);
+  Py_VISIT(traverse_module_state->__pyx_n_s_y);
+  Py_VISIT(traverse_module_state->__pyx_tuple_);
+  Py_VISIT(traverse_module_state->__pyx_tuple__2);
+  Py_VISIT(traverse_module_state->__pyx_tuple__3);
+  Py_VISIT(traverse_module_state->__pyx_tuple__4);
+  Py_VISIT(traverse_module_state->__pyx_tuple__6);
+  Py_VISIT(traverse_module_state->__pyx_tuple__8);
+  Py_VISIT(traverse_module_state->__pyx_tuple__11);
+  Py_VISIT(traverse_module_state->__pyx_tuple__13);
+  Py_VISIT(traverse_module_state->__pyx_tuple__15);
+  Py_VISIT(traverse_module_state->__pyx_tuple__17);
+  Py_VISIT(traverse_module_state->__pyx_tuple__19);
+  Py_VISIT(traverse_module_state->__pyx_tuple__21);
+  Py_VISIT(traverse_module_state->__pyx_tuple__23);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__5);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__7);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__9);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__10);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__12);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__14);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__16);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__18);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__20);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__22);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__24);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__25);
+  return 0;
+}
+#endif
+/* #### Code section: module_state_defines ### */
+#define __pyx_d __pyx_mstate_global->__pyx_d
+#define __pyx_b __pyx_mstate_global->__pyx_b
+#define __pyx_cython_runtime __pyx_mstate_global->__pyx_cython_runtime
+#define __pyx_empty_tuple __pyx_mstate_global->__pyx_empty_tuple
+#define __pyx_empty_bytes __pyx_mstate_global->__pyx_empty_bytes
+#define __pyx_empty_unicode __pyx_mstate_global->__pyx_empty_unicode
+#ifdef __Pyx_CyFunction_USED
+#define __pyx_CyFunctionType __pyx_mstate_global->__pyx_CyFunctionType
+#endif
+#ifdef __Pyx_FusedFunction_USED
+#define __pyx_FusedFunctionType __pyx_mstate_global->__pyx_FusedFunctionType
+#endif
+#ifdef __Pyx_Generator_USED
+#define __pyx_GeneratorType __pyx_mstate_global->__pyx_GeneratorType
+#endif
+#ifdef __Pyx_IterableCoroutine_USED
+#define __pyx_IterableCoroutineType __pyx_mstate_global->__pyx_IterableCoroutineType
+#endif
+#ifdef __Pyx_Coroutine_USED
+#define __pyx_CoroutineAwaitType __pyx_mstate_global->__pyx_CoroutineAwaitType
+#endif
+#ifdef __Pyx_Coroutine_USED
+#define __pyx_CoroutineType __pyx_mstate_global->__pyx_CoroutineType
+#endif
+#if CYTHON_USE_MODULE_STATE
+#endif
+#if CYTHON_USE_MODULE_STATE
+#endif
+#if CYTHON_USE_MODULE_STATE
+#endif
+#if CYTHON_USE_MODULE_STATE
+#endif
+#if CYTHON_USE_MODULE_STATE
+#endif
+#if CYTHON_USE_MODULE_STATE
+#endif
+#if CYTHON_USE_MODULE_STATE
+#endif
+#define __pyx_ptype_5nalpy_4math_13_c_extensions_8mvector2_MVector2 __pyx_mstate_global->__pyx_ptype_5nalpy_4math_13_c_extensions_8mvector2_MVector2
+#if CYTHON_USE_MODULE_STATE
+#endif
+#define __pyx_ptype_5nalpy_4math_13_c_extensions_7vector2_Vector2 __pyx_mstate_global->__pyx_ptype_5nalpy_4math_13_c_extensions_7vector2_Vector2
+#if CYTHON_USE_MODULE_STATE
+#endif
+#define __pyx_ptype_5nalpy_4math_13_c_extensions_11vector2_int_Vector2Int __pyx_mstate_global->__pyx_ptype_5nalpy_4math_13_c_extensions_11vector2_int_Vector2Int
+#if CYTHON_USE_MODULE_STATE
+#endif
+#define __pyx_kp_u_Cannot_convert_float_NaN_to_inte __pyx_mstate_global->__pyx_kp_u_Cannot_convert_float_NaN_to_inte
+#define __pyx_n_s_OverflowError __pyx_mstate_global->__pyx_n_s_OverflowError
+#define __pyx_kp_u_Result_does_not_fit_into_a_64_bi __pyx_mstate_global->__pyx_kp_u_Result_does_not_fit_into_a_64_bi
+#define __pyx_n_s_ValueError __pyx_mstate_global->__pyx_n_s_ValueError
+#define __pyx_n_s__26 __pyx_mstate_global->__pyx_n_s__26
+#define __pyx_n_s_a __pyx_mstate_global->__pyx_n_s_a
+#define __pyx_n_s_acos __pyx_mstate_global->__pyx_n_s_acos
+#define __pyx_n_s_angle __pyx_mstate_global->__pyx_n_s_angle
+#define __pyx_n_s_asyncio_coroutines __pyx_mstate_global->__pyx_n_s_asyncio_coroutines
+#define __pyx_n_s_atan2 __pyx_mstate_global->__pyx_n_s_atan2
+#define __pyx_n_s_b __pyx_mstate_global->__pyx_n_s_b
+#define __pyx_n_s_cline_in_traceback __pyx_mstate_global->__pyx_n_s_cline_in_traceback
+#define __pyx_n_s_current __pyx_mstate_global->__pyx_n_s_current
+#define __pyx_n_s_current_velocity __pyx_mstate_global->__pyx_n_s_current_velocity
+#define __pyx_n_s_delta_time __pyx_mstate_global->__pyx_n_s_delta_time
+#define __pyx_n_s_dist __pyx_mstate_global->__pyx_n_s_dist
+#define __pyx_n_s_distance __pyx_mstate_global->__pyx_n_s_distance
+#define __pyx_n_s_from __pyx_mstate_global->__pyx_n_s_from
+#define __pyx_n_s_hypot __pyx_mstate_global->__pyx_n_s_hypot
+#define __pyx_n_s_is_coroutine __pyx_mstate_global->__pyx_n_s_is_coroutine
+#define __pyx_n_s_magnitude __pyx_mstate_global->__pyx_n_s_magnitude
+#define __pyx_n_s_main __pyx_mstate_global->__pyx_n_s_main
+#define __pyx_kp_u_math_domain_error __pyx_mstate_global->__pyx_kp_u_math_domain_error
+#define __pyx_n_s_max_distance_delta __pyx_mstate_global->__pyx_n_s_max_distance_delta
+#define __pyx_n_s_max_speed __pyx_mstate_global->__pyx_n_s_max_speed
+#define __pyx_n_s_move_towards __pyx_mstate_global->__pyx_n_s_move_towards
+#define __pyx_kp_s_nalpy_math__c_extensions_determi __pyx_mstate_global->__pyx_kp_s_nalpy_math__c_extensions_determi
+#define __pyx_n_s_nalpy_math__c_extensions_determi_2 __pyx_mstate_global->__pyx_n_s_nalpy_math__c_extensions_determi_2
+#define __pyx_n_s_name __pyx_mstate_global->__pyx_n_s_name
+#define __pyx_n_s_normalized __pyx_mstate_global->__pyx_n_s_normalized
+#define __pyx_n_s_out __pyx_mstate_global->__pyx_n_s_out
+#define __pyx_n_s_output __pyx_mstate_global->__pyx_n_s_output
+#define __pyx_n_s_pyx_vtable __pyx_mstate_global->__pyx_n_s_pyx_vtable
+#define __pyx_n_s_round __pyx_mstate_global->__pyx_n_s_round
+#define __pyx_n_s_round_vector __pyx_mstate_global->__pyx_n_s_round_vector
+#define __pyx_n_s_signed_angle __pyx_mstate_global->__pyx_n_s_signed_angle
+#define __pyx_n_s_smooth_damp __pyx_mstate_global->__pyx_n_s_smooth_damp
+#define __pyx_n_s_smooth_time __pyx_mstate_global->__pyx_n_s_smooth_time
+#define __pyx_n_s_target __pyx_mstate_global->__pyx_n_s_target
+#define __pyx_n_s_test __pyx_mstate_global->__pyx_n_s_test
+#define __pyx_n_s_to __pyx_mstate_global->__pyx_n_s_to
+#define __pyx_n_s_unsigned_angle __pyx_mstate_global->__pyx_n_s_unsigned_angle
+#define __pyx_n_s_v __pyx_mstate_global->__pyx_n_s_v
+#define __pyx_n_s_velocity __pyx_mstate_global->__pyx_n_s_velocity
+#define __pyx_n_s_x __pyx_mstate_global->__pyx_n_s_x
+#define __pyx_n_s_y __pyx_mstate_global->__pyx_n_s_y
+#define __pyx_tuple_ __pyx_mstate_global->__pyx_tuple_
+#define __pyx_tuple__2 __pyx_mstate_global->__pyx_tuple__2
+#define __pyx_tuple__3 __pyx_mstate_global->__pyx_tuple__3
+#define __pyx_tuple__4 __pyx_mstate_global->__pyx_tuple__4
+#define __pyx_tuple__6 __pyx_mstate_global->__pyx_tuple__6
+#define __pyx_tuple__8 __pyx_mstate_global->__pyx_tuple__8
+#define __pyx_tuple__11 __pyx_mstate_global->__pyx_tuple__11
+#define __pyx_tuple__13 __pyx_mstate_global->__pyx_tuple__13
+#define __pyx_tuple__15 __pyx_mstate_global->__pyx_tuple__15
+#define __pyx_tuple__17 __pyx_mstate_global->__pyx_tuple__17
+#define __pyx_tuple__19 __pyx_mstate_global->__pyx_tuple__19
+#define __pyx_tuple__21 __pyx_mstate_global->__pyx_tuple__21
+#define __pyx_tuple__23 __pyx_mstate_global->__pyx_tuple__23
+#define __pyx_codeobj__5 __pyx_mstate_global->__pyx_codeobj__5
+#define __pyx_codeobj__7 __pyx_mstate_global->__pyx_codeobj__7
+#define __pyx_codeobj__9 __pyx_mstate_global->__pyx_codeobj__9
+#define __pyx_codeobj__10 __pyx_mstate_global->__pyx_codeobj__10
+#define __pyx_codeobj__12 __pyx_mstate_global->__pyx_codeobj__12
+#define __pyx_codeobj__14 __pyx_mstate_global->__pyx_codeobj__14
+#define __pyx_codeobj__16 __pyx_mstate_global->__pyx_codeobj__16
+#define __pyx_codeobj__18 __pyx_mstate_global->__pyx_codeobj__18
+#define __pyx_codeobj__20 __pyx_mstate_global->__pyx_codeobj__20
+#define __pyx_codeobj__22 __pyx_mstate_global->__pyx_codeobj__22
+#define __pyx_codeobj__24 __pyx_mstate_global->__pyx_codeobj__24
+#define __pyx_codeobj__25 __pyx_mstate_global->__pyx_codeobj__25
+/* #### Code section: module_code ### */
+
+/* "_deterministic.pxd":13
+ * from libc.string cimport memcpy
+ * 
+ * cdef inline int32_t _high_word(double x) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef uint64_t bits
+ *     memcpy(&bits, &x, sizeof(double))
+ */
+
+static CYTHON_INLINE int32_t __pyx_f_5nalpy_4math_13_c_extensions_14_deterministic__high_word(double __pyx_v_x) {
+  uint64_t __pyx_v_bits;
+  int32_t __pyx_r;
+
+  /* "_deterministic.pxd":15
+ * cdef inline int32_t _high_word(double x) noexcept nogil:
+ *     cdef uint64_t bits
+ *     memcpy(&bits, &x, sizeof(double))             # <<<<<<<<<<<<<<
+ *     return <int32_t>(<uint32_t>(bits >> 32))
+ * 
+ */
+  (void)(memcpy((&__pyx_v_bits), (&__pyx_v_x), (sizeof(double))));
+
+  /* "_deterministic.pxd":16
+ *     cdef uint64_t bits
+ *     memcpy(&bits, &x, sizeof(double))
+ *     return <int32_t>(<uint32_t>(bits >> 32))             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline uint32_t _low_word(double x) noexcept nogil:
+ */
+  __pyx_r = ((int32_t)((uint32_t)(__pyx_v_bits >> 32)));
+  goto __pyx_L0;
+
+  /* "_deterministic.pxd":13
+ * from libc.string cimport memcpy
+ * 
+ * cdef inline int32_t _high_word(double x) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef uint64_t bits
+ *     memcpy(&bits, &x, sizeof(double))
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "_deterministic.pxd":18
+ *     return <int32_t>(<uint32_t>(bits >> 32))
+ * 
+ * cdef inline uint32_t _low_word(double x) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef uint64_t bits
+ *     memcpy(&bits, &x, sizeof(double))
+ */
+
+static CYTHON_INLINE uint32_t __pyx_f_5nalpy_4math_13_c_extensions_14_deterministic__low_word(double __pyx_v_x) {
+  uint64_t __pyx_v_bits;
+  uint32_t __pyx_r;
+
+  /* "_deterministic.pxd":20
+ * cdef inline uint32_t _low_word(double x) noexcept nogil:
+ *     cdef uint64_t bits
+ *     memcpy(&bits, &x, sizeof(double))             # <<<<<<<<<<<<<<
+ *     return <uint32_t>bits
+ * 
+ */
+  (void)(memcpy((&__pyx_v_bits), (&__pyx_v_x), (sizeof(double))));
+
+  /* "_deterministic.pxd":21
+ *     cdef uint64_t bits
+ *     memcpy(&bits, &x, sizeof(double))
+ *     return <uint32_t>bits             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline double _clear_low_word(double x) noexcept nogil:
+ */
+  __pyx_r = ((uint32_t)__pyx_v_bits);
+  goto __pyx_L0;
+
+  /* "_deterministic.pxd":18
+ *     return <int32_t>(<uint32_t>(bits >> 32))
+ * 
+ * cdef inline uint32_t _low_word(double x) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef uint64_t bits
+ *     memcpy(&bits, &x, sizeof(double))
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "_deterministic.pxd":23
+ *     return <uint32_t>bits
+ * 
+ * cdef inline double _clear_low_word(double x) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef uint64_t bits
+ *     memcpy(&bits, &x, sizeof(double))
+ */
+
+static CYTHON_INLINE double __pyx_f_5nalpy_4math_13_c_extensions_14_deterministic__clear_low_word(double __pyx_v_x) {
+  uint64_t __pyx_v_bits;
+  double __pyx_r;
+
+  /* "_deterministic.pxd":25
+ * cdef inline double _clear_low_word(double x) noexcept nogil:
+ *     cdef uint64_t bits
+ *     memcpy(&bits, &x, sizeof(double))             # <<<<<<<<<<<<<<
+ *     bits &= 0xFFFFFFFF00000000ULL
+ *     memcpy(&x, &bits, sizeof(double))
+ */
+  (void)(memcpy((&__pyx_v_bits), (&__pyx_v_x), (sizeof(double))));
+
+  /* "_deterministic.pxd":26
+ *     cdef uint64_t bits
+ *     memcpy(&bits, &x, sizeof(double))
+ *     bits &= 0xFFFFFFFF00000000ULL             # <<<<<<<<<<<<<<
+ *     memcpy(&x, &bits, sizeof(double))
+ *     return x
+ */
+  __pyx_v_bits = (__pyx_v_bits & 0xFFFFFFFF00000000ULL);
+
+  /* "_deterministic.pxd":27
+ *     memcpy(&bits, &x, sizeof(double))
+ *     bits &= 0xFFFFFFFF00000000ULL
+ *     memcpy(&x, &bits, sizeof(double))             # <<<<<<<<<<<<<<
+ *     return x
+ * 
+ */
+  (void)(memcpy((&__pyx_v_x), (&__pyx_v_bits), (sizeof(double))));
+
+  /* "_deterministic.pxd":28
+ *     bits &= 0xFFFFFFFF00000000ULL
+ *     memcpy(&x, &bits, sizeof(double))
+ *     return x             # <<<<<<<<<<<<<<
+ * 
+ * @cython.cdivision(True)
+ */
+  __pyx_r = __pyx_v_x;
+  goto __pyx_L0;
+
+  /* "_deterministic.pxd":23
+ *     return <uint32_t>bits
+ * 
+ * cdef inline double _clear_low_word(double x) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef uint64_t bits
+ *     memcpy(&bits, &x, sizeof(double))
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "_deterministic.pxd":31
+ * 
+ * @cython.cdivision(True)
+ * cdef inline double det_hypot(double x, double y) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     x = fabs(x)
+ *     y = fabs(y)
+ */
+
+static CYTHON_INLINE double __pyx_f_5nalpy_4math_13_c_extensions_14_deterministic_det_hypot(double __pyx_v_x, double __pyx_v_y) {
+  int __pyx_v_exponent;
+  double __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  double __pyx_t_3;
+  double __pyx_t_4;
+
+  /* "_deterministic.pxd":32
+ * @cython.cdivision(True)
+ * cdef inline double det_hypot(double x, double y) noexcept nogil:
+ *     x = fabs(x)             # <<<<<<<<<<<<<<
+ *     y = fabs(y)
+ *     if isinf(x) or isinf(y): # hypot(inf, nan) is inf
+ */
+  __pyx_v_x = fabs(__pyx_v_x);
+
+  /* "_deterministic.pxd":33
+ * cdef inline double det_hypot(double x, double y) noexcept nogil:
+ *     x = fabs(x)
+ *     y = fabs(y)             # <<<<<<<<<<<<<<
+ *     if isinf(x) or isinf(y): # hypot(inf, nan) is inf
+ *         return INFINITY
+ */
+  __pyx_v_y = fabs(__pyx_v_y);
+
+  /* "_deterministic.pxd":34
+ *     x = fabs(x)
+ *     y = fabs(y)
+ *     if isinf(x) or isinf(y): # hypot(inf, nan) is inf             # <<<<<<<<<<<<<<
+ *         return INFINITY
+ *     if isnan(x) or isnan(y):
+ */
+  __pyx_t_2 = (isinf(__pyx_v_x) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = (isinf(__pyx_v_y) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "_deterministic.pxd":35
+ *     y = fabs(y)
+ *     if isinf(x) or isinf(y): # hypot(inf, nan) is inf
+ *         return INFINITY             # <<<<<<<<<<<<<<
+ *     if isnan(x) or isnan(y):
+ *         return x + y
+ */
+    __pyx_r = INFINITY;
+    goto __pyx_L0;
+
+    /* "_deterministic.pxd":34
+ *     x = fabs(x)
+ *     y = fabs(y)
+ *     if isinf(x) or isinf(y): # hypot(inf, nan) is inf             # <<<<<<<<<<<<<<
+ *         return INFINITY
+ *     if isnan(x) or isnan(y):
+ */
+  }
+
+  /* "_deterministic.pxd":36
+ *     if isinf(x) or isinf(y): # hypot(inf, nan) is inf
+ *         return INFINITY
+ *     if isnan(x) or isnan(y):             # <<<<<<<<<<<<<<
+ *         return x + y
+ *     if x < y:
+ */
+  __pyx_t_2 = isnan(__pyx_v_x);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L7_bool_binop_done;
+  }
+  __pyx_t_2 = isnan(__pyx_v_y);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L7_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "_deterministic.pxd":37
+ *         return INFINITY
+ *     if isnan(x) or isnan(y):
+ *         return x + y             # <<<<<<<<<<<<<<
+ *     if x < y:
+ *         x, y = y, x
+ */
+    __pyx_r = (__pyx_v_x + __pyx_v_y);
+    goto __pyx_L0;
+
+    /* "_deterministic.pxd":36
+ *     if isinf(x) or isinf(y): # hypot(inf, nan) is inf
+ *         return INFINITY
+ *     if isnan(x) or isnan(y):             # <<<<<<<<<<<<<<
+ *         return x + y
+ *     if x < y:
+ */
+  }
+
+  /* "_deterministic.pxd":38
+ *     if isnan(x) or isnan(y):
+ *         return x + y
+ *     if x < y:             # <<<<<<<<<<<<<<
+ *         x, y = y, x
+ *     if y == 0.0:
+ */
+  __pyx_t_1 = (__pyx_v_x < __pyx_v_y);
+  if (__pyx_t_1) {
+
+    /* "_deterministic.pxd":39
+ *         return x + y
+ *     if x < y:
+ *         x, y = y, x             # <<<<<<<<<<<<<<
+ *     if y == 0.0:
+ *         return x
+ */
+    __pyx_t_3 = __pyx_v_y;
+    __pyx_t_4 = __pyx_v_x;
+    __pyx_v_x = __pyx_t_3;
+    __pyx_v_y = __pyx_t_4;
+
+    /* "_deterministic.pxd":38
+ *     if isnan(x) or isnan(y):
+ *         return x + y
+ *     if x < y:             # <<<<<<<<<<<<<<
+ *         x, y = y, x
+ *     if y == 0.0:
+ */
+  }
+
+  /* "_deterministic.pxd":40
+ *     if x < y:
+ *         x, y = y, x
+ *     if y == 0.0:             # <<<<<<<<<<<<<<
+ *         return x
+ * 
+ */
+  __pyx_t_1 = (__pyx_v_y == 0.0);
+  if (__pyx_t_1) {
+
+    /* "_deterministic.pxd":41
+ *         x, y = y, x
+ *     if y == 0.0:
+ *         return x             # <<<<<<<<<<<<<<
+ * 
+ *     # Scale by a power of two so that squaring can't overflow or underflow. Scaling is exact.
+ */
+    __pyx_r = __pyx_v_x;
+    goto __pyx_L0;
+
+    /* "_deterministic.pxd":40
+ *     if x < y:
+ *         x, y = y, x
+ *     if y == 0.0:             # <<<<<<<<<<<<<<
+ *         return x
+ * 
+ */
+  }
+
+  /* "_deterministic.pxd":45
+ *     # Scale by a power of two so that squaring can't overflow or underflow. Scaling is exact.
+ *     cdef int exponent
+ *     frexp(x, &exponent)             # <<<<<<<<<<<<<<
+ *     x = ldexp(x, -exponent)
+ *     y = ldexp(y, -exponent)
+ */
+  (void)(frexp(__pyx_v_x, (&__pyx_v_exponent)));
+
+  /* "_deterministic.pxd":46
+ *     cdef int exponent
+ *     frexp(x, &exponent)
+ *     x = ldexp(x, -exponent)             # <<<<<<<<<<<<<<
+ *     y = ldexp(y, -exponent)
+ *     return ldexp(sqrt(x * x + y * y), exponent)
+ */
+  __pyx_v_x = ldexp(__pyx_v_x, (-__pyx_v_exponent));
+
+  /* "_deterministic.pxd":47
+ *     frexp(x, &exponent)
+ *     x = ldexp(x, -exponent)
+ *     y = ldexp(y, -exponent)             # <<<<<<<<<<<<<<
+ *     return ldexp(sqrt(x * x + y * y), exponent)
+ * 
+ */
+  __pyx_v_y = ldexp(__pyx_v_y, (-__pyx_v_exponent));
+
+  /* "_deterministic.pxd":48
+ *     x = ldexp(x, -exponent)
+ *     y = ldexp(y, -exponent)
+ *     return ldexp(sqrt(x * x + y * y), exponent)             # <<<<<<<<<<<<<<
+ * 
+ * cdef extern from *:
+ */
+  __pyx_r = ldexp(sqrt(((__pyx_v_x * __pyx_v_x) + (__pyx_v_y * __pyx_v_y))), __pyx_v_exponent);
+  goto __pyx_L0;
+
+  /* "_deterministic.pxd":31
+ * 
+ * @cython.cdivision(True)
+ * cdef inline double det_hypot(double x, double y) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     x = fabs(x)
+ *     y = fabs(y)
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "_deterministic.pxd":69
+ * 
+ * @cython.cdivision(True)
+ * cdef inline double _acos_rational(double z) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef double p = z * (1.66666666666666657415e-01 + z * (-3.25565818622400915405e-01 + z * (2.01212532134862925881e-01 + z * (-4.00555345006794114027e-02 + z * (7.91534994289814532176e-04 + z * 3.47933107596021167570e-05)))))
+ *     cdef double q = 1.0 + z * (-2.40339491173441421878e+00 + z * (2.02094576023350569471e+00 + z * (-6.88283971605453293030e-01 + z * 7.70381505559019352791e-02)))
+ */
+
+static CYTHON_INLINE double __pyx_f_5nalpy_4math_13_c_extensions_14_deterministic__acos_rational(double __pyx_v_z) {
+  double __pyx_v_p;
+  double __pyx_v_q;
+  double __pyx_r;
+
+  /* "_deterministic.pxd":70
+ * @cython.cdivision(True)
+ * cdef inline double _acos_rational(double z) noexcept nogil:
+ *     cdef double p = z * (1.66666666666666657415e-01 + z * (-3.25565818622400915405e-01 + z * (2.01212532134862925881e-01 + z * (-4.00555345006794114027e-02 + z * (7.91534994289814532176e-04 + z * 3.47933107596021167570e-05)))))             # <<<<<<<<<<<<<<
+ *     cdef double q = 1.0 + z * (-2.40339491173441421878e+00 + z * (2.02094576023350569471e+00 + z * (-6.88283971605453293030e-01 + z * 7.70381505559019352791e-02)))
+ *     return p / q
+ */
+  __pyx_v_p = (__pyx_v_z * (1.66666666666666657415e-01 + (__pyx_v_z * (-3.25565818622400915405e-01 + (__pyx_v_z * (2.01212532134862925881e-01 + (__pyx_v_z * (-4.00555345006794114027e-02 + (__pyx_v_z * (7.91534994289814532176e-04 + (__pyx_v_z * 3.47933107596021167570e-05)))))))))));
+
+  /* "_deterministic.pxd":71
+ * cdef inline double _acos_rational(double z) noexcept nogil:
+ *     cdef double p = z * (1.66666666666666657415e-01 + z * (-3.25565818622400915405e-01 + z * (2.01212532134862925881e-01 + z * (-4.00555345006794114027e-02 + z * (7.91534994289814532176e-04 + z * 3.47933107596021167570e-05)))))
+ *     cdef double q = 1.0 + z * (-2.40339491173441421878e+00 + z * (2.02094576023350569471e+00 + z * (-6.88283971605453293030e-01 + z * 7.70381505559019352791e-02)))             # <<<<<<<<<<<<<<
+ *     return p / q
+ * 
+ */
+  __pyx_v_q = (1.0 + (__pyx_v_z * (-2.40339491173441421878e+00 + (__pyx_v_z * (2.02094576023350569471e+00 + (__pyx_v_z * (-6.88283971605453293030e-01 + (__pyx_v_z * 7.70381505559019352791e-02))))))));
+
+  /* "_deterministic.pxd":72
+ *     cdef double p = z * (1.66666666666666657415e-01 + z * (-3.25565818622400915405e-01 + z * (2.01212532134862925881e-01 + z * (-4.00555345006794114027e-02 + z * (7.91534994289814532176e-04 + z * 3.47933107596021167570e-05)))))
+ *     cdef double q = 1.0 + z * (-2.40339491173441421878e+00 + z * (2.02094576023350569471e+00 + z * (-6.88283971605453293030e-01 + z * 7.70381505559019352791e-02)))
+ *     return p / q             # <<<<<<<<<<<<<<
+ * 
+ * @cython.cdivision(True)
+ */
+  __pyx_r = (__pyx_v_p / __pyx_v_q);
+  goto __pyx_L0;
+
+  /* "_deterministic.pxd":69
+ * 
+ * @cython.cdivision(True)
+ * cdef inline double _acos_rational(double z) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef double p = z * (1.66666666666666657415e-01 + z * (-3.25565818622400915405e-01 + z * (2.01212532134862925881e-01 + z * (-4.00555345006794114027e-02 + z * (7.91534994289814532176e-04 + z * 3.47933107596021167570e-05)))))
+ *     cdef double q = 1.0 + z * (-2.40339491173441421878e+00 + z * (2.02094576023350569471e+00 + z * (-6.88283971605453293030e-01 + z * 7.70381505559019352791e-02)))
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "_deterministic.pxd":75
+ * 
+ * @cython.cdivision(True)
+ * cdef inline double det_acos(double x) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef int32_t hx = _high_word(x)
+ *     cdef int32_t ix = hx & 0x7fffffff
+ */
+
+static CYTHON_INLINE double __pyx_f_5nalpy_4math_13_c_extensions_14_deterministic_det_acos(double __pyx_v_x) {
+  int32_t __pyx_v_hx;
+  int32_t __pyx_v_ix;
+  double __pyx_v_z;
+  double __pyx_v_s;
+  double __pyx_v_r;
+  double __pyx_v_w;
+  double __pyx_v_df;
+  double __pyx_v_c;
+  double __pyx_r;
+  int __pyx_t_1;
+
+  /* "_deterministic.pxd":76
+ * @cython.cdivision(True)
+ * cdef inline double det_acos(double x) noexcept nogil:
+ *     cdef int32_t hx = _high_word(x)             # <<<<<<<<<<<<<<
+ *     cdef int32_t ix = hx & 0x7fffffff
+ *     cdef double z, s, r, w, df, c
+ */
+  __pyx_v_hx = __pyx_f_5nalpy_4math_13_c_extensions_14_deterministic__high_word(__pyx_v_x);
+
+  /* "_deterministic.pxd":77
+ * cdef inline double det_acos(double x) noexcept nogil:
+ *     cdef int32_t hx = _high_word(x)
+ *     cdef int32_t ix = hx & 0x7fffffff             # <<<<<<<<<<<<<<
+ *     cdef double z, s, r, w, df, c
+ * 
+ */
+  __pyx_v_ix = (__pyx_v_hx & 0x7fffffff);
+
+  /* "_deterministic.pxd":80
+ *     cdef double z, s, r, w, df, c
+ * 
+ *     if ix >= 0x3ff00000: # |x| >= 1             # <<<<<<<<<<<<<<
+ *         if ((ix - 0x3ff00000) | <int32_t>_low_word(x)) == 0: # |x| == 1
+ *             if hx > 0:
+ */
+  __pyx_t_1 = (__pyx_v_ix >= 0x3ff00000);
+  if (__pyx_t_1) {
+
+    /* "_deterministic.pxd":81
+ * 
+ *     if ix >= 0x3ff00000: # |x| >= 1
+ *         if ((ix - 0x3ff00000) | <int32_t>_low_word(x)) == 0: # |x| == 1             # <<<<<<<<<<<<<<
+ *             if hx > 0:
+ *                 return 0.0
+ */
+    __pyx_t_1 = (((__pyx_v_ix - 0x3ff00000) | ((int32_t)__pyx_f_5nalpy_4math_13_c_extensions_14_deterministic__low_word(__pyx_v_x))) == 0);
+    if (__pyx_t_1) {
+
+      /* "_deterministic.pxd":82
+ *     if ix >= 0x3ff00000: # |x| >= 1
+ *         if ((ix - 0x3ff00000) | <int32_t>_low_word(x)) == 0: # |x| == 1
+ *             if hx > 0:             # <<<<<<<<<<<<<<
+ *                 return 0.0
+ *             return _PI + 2.0 * _PIO2_LO
+ */
+      __pyx_t_1 = (__pyx_v_hx > 0);
+      if (__pyx_t_1) {
+
+        /* "_deterministic.pxd":83
+ *         if ((ix - 0x3ff00000) | <int32_t>_low_word(x)) == 0: # |x| == 1
+ *             if hx > 0:
+ *                 return 0.0             # <<<<<<<<<<<<<<
+ *             return _PI + 2.0 * _PIO2_LO
+ *         return (x - x) / (x - x) # nan
+ */
+        __pyx_r = 0.0;
+        goto __pyx_L0;
+
+        /* "_deterministic.pxd":82
+ *     if ix >= 0x3ff00000: # |x| >= 1
+ *         if ((ix - 0x3ff00000) | <int32_t>_low_word(x)) == 0: # |x| == 1
+ *             if hx > 0:             # <<<<<<<<<<<<<<
+ *                 return 0.0
+ *             return _PI + 2.0 * _PIO2_LO
+ */
+      }
+
+      /* "_deterministic.pxd":84
+ *             if hx > 0:
+ *                 return 0.0
+ *             return _PI + 2.0 * _PIO2_LO             # <<<<<<<<<<<<<<
+ *         return (x - x) / (x - x) # nan
+ * 
+ */
+      __pyx_r = (nalpy_det_pi + (2.0 * nalpy_det_pio2_lo));
+      goto __pyx_L0;
+
+      /* "_deterministic.pxd":81
+ * 
+ *     if ix >= 0x3ff00000: # |x| >= 1
+ *         if ((ix - 0x3ff00000) | <int32_t>_low_word(x)) == 0: # |x| == 1             # <<<<<<<<<<<<<<
+ *             if hx > 0:
+ *                 return 0.0
+ */
+    }
+
+    /* "_deterministic.pxd":85
+ *                 return 0.0
+ *             return _PI + 2.0 * _PIO2_LO
+ *         return (x - x) / (x - x) # nan             # <<<<<<<<<<<<<<
+ * 
+ *     if ix < 0x3fe00000: # |x| < 0.5
+ */
+    __pyx_r = ((__pyx_v_x - __pyx_v_x) / (__pyx_v_x - __pyx_v_x));
+    goto __pyx_L0;
+
+    /* "_deterministic.pxd":80
+ *     cdef double z, s, r, w, df, c
+ * 
+ *     if ix >= 0x3ff00000: # |x| >= 1             # <<<<<<<<<<<<<<
+ *         if ((ix - 0x3ff00000) | <int32_t>_low_word(x)) == 0: # |x| == 1
+ *             if hx > 0:
+ */
+  }
+
+  /* "_deterministic.pxd":87
+ *         return (x - x) / (x - x) # nan
+ * 
+ *     if ix < 0x3fe00000: # |x| < 0.5             # <<<<<<<<<<<<<<
+ *         if ix <= 0x3c600000: # |x| < 2 ** -57
+ *             return _PIO2_HI + _PIO2_LO
+ */
+  __pyx_t_1 = (__pyx_v_ix < 0x3fe00000);
+  if (__pyx_t_1) {
+
+    /* "_deterministic.pxd":88
+ * 
+ *     if ix < 0x3fe00000: # |x| < 0.5
+ *         if ix <= 0x3c600000: # |x| < 2 ** -57             # <<<<<<<<<<<<<<
+ *             return _PIO2_HI + _PIO2_LO
+ *         r = _acos_rational(x * x)
+ */
+    __pyx_t_1 = (__pyx_v_ix <= 0x3c600000);
+    if (__pyx_t_1) {
+
+      /* "_deterministic.pxd":89
+ *     if ix < 0x3fe00000: # |x| < 0.5
+ *         if ix <= 0x3c600000: # |x| < 2 ** -57
+ *             return _PIO2_HI + _PIO2_LO             # <<<<<<<<<<<<<<
+ *         r = _acos_rational(x * x)
+ *         return _PIO2_HI - (x - (_PIO2_LO - x * r))
+ */
+      __pyx_r = (nalpy_det_pio2_hi + nalpy_det_pio2_lo);
+      goto __pyx_L0;
+
+      /* "_deterministic.pxd":88
+ * 
+ *     if ix < 0x3fe00000: # |x| < 0.5
+ *         if ix <= 0x3c600000: # |x| < 2 ** -57             # <<<<<<<<<<<<<<
+ *             return _PIO2_HI + _PIO2_LO
+ *         r = _acos_rational(x * x)
+ */
+    }
+
+    /* "_deterministic.pxd":90
+ *         if ix <= 0x3c600000: # |x| < 2 ** -57
+ *             return _PIO2_HI + _PIO2_LO
+ *         r = _acos_rational(x * x)             # <<<<<<<<<<<<<<
+ *         return _PIO2_HI - (x - (_PIO2_LO - x * r))
+ * 
+ */
+    __pyx_v_r = __pyx_f_5nalpy_4math_13_c_extensions_14_deterministic__acos_rational((__pyx_v_x * __pyx_v_x));
+
+    /* "_deterministic.pxd":91
+ *             return _PIO2_HI + _PIO2_LO
+ *         r = _acos_rational(x * x)
+ *         return _PIO2_HI - (x - (_PIO2_LO - x * r))             # <<<<<<<<<<<<<<
+ * 
+ *     if hx < 0: # x < -0.5
+ */
+    __pyx_r = (nalpy_det_pio2_hi - (__pyx_v_x - (nalpy_det_pio2_lo - (__pyx_v_x * __pyx_v_r))));
+    goto __pyx_L0;
+
+    /* "_deterministic.pxd":87
+ *         return (x - x) / (x - x) # nan
+ * 
+ *     if ix < 0x3fe00000: # |x| < 0.5             # <<<<<<<<<<<<<<
+ *         if ix <= 0x3c600000: # |x| < 2 ** -57
+ *             return _PIO2_HI + _PIO2_LO
+ */
+  }
+
+  /* "_deterministic.pxd":93
+ *         return _PIO2_HI - (x - (_PIO2_LO - x * r))
+ * 
+ *     if hx < 0: # x < -0.5             # <<<<<<<<<<<<<<
+ *         z = (1.0 + x) * 0.5
+ *         s = sqrt(z)
+ */
+  __pyx_t_1 = (__pyx_v_hx < 0);
+  if (__pyx_t_1) {
+
+    /* "_deterministic.pxd":94
+ * 
+ *     if hx < 0: # x < -0.5
+ *         z = (1.0 + x) * 0.5             # <<<<<<<<<<<<<<
+ *         s = sqrt(z)
+ *         w = _acos_rational(z) * s - _PIO2_LO
+ */
+    __pyx_v_z = ((1.0 + __pyx_v_x) * 0.5);
+
+    /* "_deterministic.pxd":95
+ *     if hx < 0: # x < -0.5
+ *         z = (1.0 + x) * 0.5
+ *         s = sqrt(z)             # <<<<<<<<<<<<<<
+ *         w = _acos_rational(z) * s - _PIO2_LO
+ *         return _PI - 2.0 * (s + w)
+ */
+    __pyx_v_s = sqrt(__pyx_v_z);
+
+    /* "_deterministic.pxd":96
+ *         z = (1.0 + x) * 0.5
+ *         s = sqrt(z)
+ *         w = _acos_rational(z) * s - _PIO2_LO             # <<<<<<<<<<<<<<
+ *         return _PI - 2.0 * (s + w)
+ * 
+ */
+    __pyx_v_w = ((__pyx_f_5nalpy_4math_13_c_extensions_14_deterministic__acos_rational(__pyx_v_z) * __pyx_v_s) - nalpy_det_pio2_lo);
+
+    /* "_deterministic.pxd":97
+ *         s = sqrt(z)
+ *         w = _acos_rational(z) * s - _PIO2_LO
+ *         return _PI - 2.0 * (s + w)             # <<<<<<<<<<<<<<
+ * 
+ *     # x > 0.5
+ */
+    __pyx_r = (nalpy_det_pi - (2.0 * (__pyx_v_s + __pyx_v_w)));
+    goto __pyx_L0;
+
+    /* "_deterministic.pxd":93
+ *         return _PIO2_HI - (x - (_PIO2_LO - x * r))
+ * 
+ *     if hx < 0: # x < -0.5             # <<<<<<<<<<<<<<
+ *         z = (1.0 + x) * 0.5
+ *         s = sqrt(z)
+ */
+  }
+
+  /* "_deterministic.pxd":100
+ * 
+ *     # x > 0.5
+ *     z = (1.0 - x) * 0.5             # <<<<<<<<<<<<<<
+ *     s = sqrt(z)
+ *     df = _clear_low_word(s)
+ */
+  __pyx_v_z = ((1.0 - __pyx_v_x) * 0.5);
+
+  /* "_deterministic.pxd":101
+ *     # x > 0.5
+ *     z = (1.0 - x) * 0.5
+ *     s = sqrt(z)             # <<<<<<<<<<<<<<
+ *     df = _clear_low_word(s)
+ *     c = (z - df * df) / (s + df)
+ */
+  __pyx_v_s = sqrt(__pyx_v_z);
+
+  /* "_deterministic.pxd":102
+ *     z = (1.0 - x) * 0.5
+ *     s = sqrt(z)
+ *     df = _clear_low_word(s)             # <<<<<<<<<<<<<<
+ *     c = (z - df * df) / (s + df)
+ *     w = _acos_rational(z) * s + c
+ */
+  __pyx_v_df = __pyx_f_5nalpy_4math_13_c_extensions_14_deterministic__clear_low_word(__pyx_v_s);
+
+  /* "_deterministic.pxd":103
+ *     s = sqrt(z)
+ *     df = _clear_low_word(s)
+ *     c = (z - df * df) / (s + df)             # <<<<<<<<<<<<<<
+ *     w = _acos_rational(z) * s + c
+ *     return 2.0 * (df + w)
+ */
+  __pyx_v_c = ((__pyx_v_z - (__pyx_v_df * __pyx_v_df)) / (__pyx_v_s + __pyx_v_df));
+
+  /* "_deterministic.pxd":104
+ *     df = _clear_low_word(s)
+ *     c = (z - df * df) / (s + df)
+ *     w = _acos_rational(z) * s + c             # <<<<<<<<<<<<<<
+ *     return 2.0 * (df + w)
+ * 
+ */
+  __pyx_v_w = ((__pyx_f_5nalpy_4math_13_c_extensions_14_deterministic__acos_rational(__pyx_v_z) * __pyx_v_s) + __pyx_v_c);
+
+  /* "_deterministic.pxd":105
+ *     c = (z - df * df) / (s + df)
+ *     w = _acos_rational(z) * s + c
+ *     return 2.0 * (df + w)             # <<<<<<<<<<<<<<
+ * 
+ * @cython.cdivision(True)
+ */
+  __pyx_r = (2.0 * (__pyx_v_df + __pyx_v_w));
+  goto __pyx_L0;
+
+  /* "_deterministic.pxd":75
+ * 
+ * @cython.cdivision(True)
+ * cdef inline double det_acos(double x) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef int32_t hx = _high_word(x)
+ *     cdef int32_t ix = hx & 0x7fffffff
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "_deterministic.pxd":108
+ * 
+ * @cython.cdivision(True)
+ * cdef inline double _atan(double x) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef int32_t hx = _high_word(x)
+ *     cdef int32_t ix = hx & 0x7fffffff
+ */
+
+static CYTHON_INLINE double __pyx_f_5nalpy_4math_13_c_extensions_14_deterministic__atan(double __pyx_v_x) {
+  int32_t __pyx_v_hx;
+  int32_t __pyx_v_ix;
+  int __pyx_v_index;
+  double __pyx_v_z;
+  double __pyx_v_w;
+  double __pyx_v_s1;
+  double __pyx_v_s2;
+  double __pyx_r;
+  int __pyx_t_1;
+  double __pyx_t_2;
+
+  /* "_deterministic.pxd":109
+ * @cython.cdivision(True)
+ * cdef inline double _atan(double x) noexcept nogil:
+ *     cdef int32_t hx = _high_word(x)             # <<<<<<<<<<<<<<
+ *     cdef int32_t ix = hx & 0x7fffffff
+ *     cdef int index
+ */
+  __pyx_v_hx = __pyx_f_5nalpy_4math_13_c_extensions_14_deterministic__high_word(__pyx_v_x);
+
+  /* "_deterministic.pxd":110
+ * cdef inline double _atan(double x) noexcept nogil:
+ *     cdef int32_t hx = _high_word(x)
+ *     cdef int32_t ix = hx & 0x7fffffff             # <<<<<<<<<<<<<<
+ *     cdef int index
+ *     cdef double z, w, s1, s2
+ */
+  __pyx_v_ix = (__pyx_v_hx & 0x7fffffff);
+
+  /* "_deterministic.pxd":114
+ *     cdef double z, w, s1, s2
+ * 
+ *     if ix >= 0x44100000: # |x| >= 2 ** 66             # <<<<<<<<<<<<<<
+ *         if isnan(x):
+ *             return x + x
+ */
+  __pyx_t_1 = (__pyx_v_ix >= 0x44100000);
+  if (__pyx_t_1) {
+
+    /* "_deterministic.pxd":115
+ * 
+ *     if ix >= 0x44100000: # |x| >= 2 ** 66
+ *         if isnan(x):             # <<<<<<<<<<<<<<
+ *             return x + x
+ *         return _ATAN_HI[3] + _ATAN_LO[3] if hx > 0 else -_ATAN_HI[3] - _ATAN_LO[3]
+ */
+    __pyx_t_1 = isnan(__pyx_v_x);
+    if (__pyx_t_1) {
+
+      /* "_deterministic.pxd":116
+ *     if ix >= 0x44100000: # |x| >= 2 ** 66
+ *         if isnan(x):
+ *             return x + x             # <<<<<<<<<<<<<<
+ *         return _ATAN_HI[3] + _ATAN_LO[3] if hx > 0 else -_ATAN_HI[3] - _ATAN_LO[3]
+ * 
+ */
+      __pyx_r = (__pyx_v_x + __pyx_v_x);
+      goto __pyx_L0;
+
+      /* "_deterministic.pxd":115
+ * 
+ *     if ix >= 0x44100000: # |x| >= 2 ** 66
+ *         if isnan(x):             # <<<<<<<<<<<<<<
+ *             return x + x
+ *         return _ATAN_HI[3] + _ATAN_LO[3] if hx > 0 else -_ATAN_HI[3] - _ATAN_LO[3]
+ */
+    }
+
+    /* "_deterministic.pxd":117
+ *         if isnan(x):
+ *             return x + x
+ *         return _ATAN_HI[3] + _ATAN_LO[3] if hx > 0 else -_ATAN_HI[3] - _ATAN_LO[3]             # <<<<<<<<<<<<<<
+ * 
+ *     if ix < 0x3fdc0000: # |x| < 0.4375
+ */
+    __pyx_t_1 = (__pyx_v_hx > 0);
+    if (__pyx_t_1) {
+      __pyx_t_2 = ((nalpy_det_atan_hi[3]) + (nalpy_det_atan_lo[3]));
+    } else {
+      __pyx_t_2 = ((-(nalpy_det_atan_hi[3])) - (nalpy_det_atan_lo[3]));
+    }
+    __pyx_r = __pyx_t_2;
+    goto __pyx_L0;
+
+    /* "_deterministic.pxd":114
+ *     cdef double z, w, s1, s2
+ * 
+ *     if ix >= 0x44100000: # |x| >= 2 ** 66             # <<<<<<<<<<<<<<
+ *         if isnan(x):
+ *             return x + x
+ */
+  }
+
+  /* "_deterministic.pxd":119
+ *         return _ATAN_HI[3] + _ATAN_LO[3] if hx > 0 else -_ATAN_HI[3] - _ATAN_LO[3]
+ * 
+ *     if ix < 0x3fdc0000: # |x| < 0.4375             # <<<<<<<<<<<<<<
+ *         if ix < 0x3e400000: # |x| < 2 ** -27
+ *             return x
+ */
+  __pyx_t_1 = (__pyx_v_ix < 0x3fdc0000);
+  if (__pyx_t_1) {
+
+    /* "_deterministic.pxd":120
+ * 
+ *     if ix < 0x3fdc0000: # |x| < 0.4375
+ *         if ix < 0x3e400000: # |x| < 2 ** -27             # <<<<<<<<<<<<<<
+ *             return x
+ *         index = -1
+ */
+    __pyx_t_1 = (__pyx_v_ix < 0x3e400000);
+    if (__pyx_t_1) {
+
+      /* "_deterministic.pxd":121
+ *     if ix < 0x3fdc0000: # |x| < 0.4375
+ *         if ix < 0x3e400000: # |x| < 2 ** -27
+ *             return x             # <<<<<<<<<<<<<<
+ *         index = -1
+ *     else:
+ */
+      __pyx_r = __pyx_v_x;
+      goto __pyx_L0;
+
+      /* "_deterministic.pxd":120
+ * 
+ *     if ix < 0x3fdc0000: # |x| < 0.4375
+ *         if ix < 0x3e400000: # |x| < 2 ** -27             # <<<<<<<<<<<<<<
+ *             return x
+ *         index = -1
+ */
+    }
+
+    /* "_deterministic.pxd":122
+ *         if ix < 0x3e400000: # |x| < 2 ** -27
+ *             return x
+ *         index = -1             # <<<<<<<<<<<<<<
+ *     else:
+ *         x = fabs(x)
+ */
+    __pyx_v_index = -1;
+
+    /* "_deterministic.pxd":119
+ *         return _ATAN_HI[3] + _ATAN_LO[3] if hx > 0 else -_ATAN_HI[3] - _ATAN_LO[3]
+ * 
+ *     if ix < 0x3fdc0000: # |x| < 0.4375             # <<<<<<<<<<<<<<
+ *         if ix < 0x3e400000: # |x| < 2 ** -27
+ *             return x
+ */
+    goto __pyx_L5;
+  }
+
+  /* "_deterministic.pxd":124
+ *         index = -1
+ *     else:
+ *         x = fabs(x)             # <<<<<<<<<<<<<<
+ *         if ix < 0x3ff30000: # |x| < 1.1875
+ *             if ix < 0x3fe60000: # 7/16 <= |x| < 11/16
+ */
+  /*else*/ {
+    __pyx_v_x = fabs(__pyx_v_x);
+
+    /* "_deterministic.pxd":125
+ *     else:
+ *         x = fabs(x)
+ *         if ix < 0x3ff30000: # |x| < 1.1875             # <<<<<<<<<<<<<<
+ *             if ix < 0x3fe60000: # 7/16 <= |x| < 11/16
+ *                 index = 0
+ */
+    __pyx_t_1 = (__pyx_v_ix < 0x3ff30000);
+    if (__pyx_t_1) {
+
+      /* "_deterministic.pxd":126
+ *         x = fabs(x)
+ *         if ix < 0x3ff30000: # |x| < 1.1875
+ *             if ix < 0x3fe60000: # 7/16 <= |x| < 11/16             # <<<<<<<<<<<<<<
+ *                 index = 0
+ *                 x = (2.0 * x - 1.0) / (2.0 + x)
+ */
+      __pyx_t_1 = (__pyx_v_ix < 0x3fe60000);
+      if (__pyx_t_1) {
+
+        /* "_deterministic.pxd":127
+ *         if ix < 0x3ff30000: # |x| < 1.1875
+ *             if ix < 0x3fe60000: # 7/16 <= |x| < 11/16
+ *                 index = 0             # <<<<<<<<<<<<<<
+ *                 x = (2.0 * x - 1.0) / (2.0 + x)
+ *             else: # 11/16 <= |x| < 19/16
+ */
+        __pyx_v_index = 0;
+
+        /* "_deterministic.pxd":128
+ *             if ix < 0x3fe60000: # 7/16 <= |x| < 11/16
+ *                 index = 0
+ *                 x = (2.0 * x - 1.0) / (2.0 + x)             # <<<<<<<<<<<<<<
+ *             else: # 11/16 <= |x| < 19/16
+ *                 index = 1
+ */
+        __pyx_v_x = (((2.0 * __pyx_v_x) - 1.0) / (2.0 + __pyx_v_x));
+
+        /* "_deterministic.pxd":126
+ *         x = fabs(x)
+ *         if ix < 0x3ff30000: # |x| < 1.1875
+ *             if ix < 0x3fe60000: # 7/16 <= |x| < 11/16             # <<<<<<<<<<<<<<
+ *                 index = 0
+ *                 x = (2.0 * x - 1.0) / (2.0 + x)
+ */
+        goto __pyx_L8;
+      }
+
+      /* "_deterministic.pxd":130
+ *                 x = (2.0 * x - 1.0) / (2.0 + x)
+ *             else: # 11/16 <= |x| < 19/16
+ *                 index = 1             # <<<<<<<<<<<<<<
+ *                 x = (x - 1.0) / (x + 1.0)
+ *         elif ix < 0x40038000: # |x| < 2.4375
+ */
+      /*else*/ {
+        __pyx_v_index = 1;
+
+        /* "_deterministic.pxd":131
+ *             else: # 11/16 <= |x| < 19/16
+ *                 index = 1
+ *                 x = (x - 1.0) / (x + 1.0)             # <<<<<<<<<<<<<<
+ *         elif ix < 0x40038000: # |x| < 2.4375
+ *             index = 2
+ */
+        __pyx_v_x = ((__pyx_v_x - 1.0) / (__pyx_v_x + 1.0));
+      }
+      __pyx_L8:;
+
+      /* "_deterministic.pxd":125
+ *     else:
+ *         x = fabs(x)
+ *         if ix < 0x3ff30000: # |x| < 1.1875             # <<<<<<<<<<<<<<
+ *             if ix < 0x3fe60000: # 7/16 <= |x| < 11/16
+ *                 index = 0
+ */
+      goto __pyx_L7;
+    }
+
+    /* "_deterministic.pxd":132
+ *                 index = 1
+ *                 x = (x - 1.0) / (x + 1.0)
+ *         elif ix < 0x40038000: # |x| < 2.4375             # <<<<<<<<<<<<<<
+ *             index = 2
+ *             x = (x - 1.5) / (1.0 + 1.5 * x)
+ */
+    __pyx_t_1 = (__pyx_v_ix < 0x40038000);
+    if (__pyx_t_1) {
+
+      /* "_deterministic.pxd":133
+ *                 x = (x - 1.0) / (x + 1.0)
+ *         elif ix < 0x40038000: # |x| < 2.4375
+ *             index = 2             # <<<<<<<<<<<<<<
+ *             x = (x - 1.5) / (1.0 + 1.5 * x)
+ *         else: # 2.4375 <= |x| < 2 ** 66
+ */
+      __pyx_v_index = 2;
+
+      /* "_deterministic.pxd":134
+ *         elif ix < 0x40038000: # |x| < 2.4375
+ *             index = 2
+ *             x = (x - 1.5) / (1.0 + 1.5 * x)             # <<<<<<<<<<<<<<
+ *         else: # 2.4375 <= |x| < 2 ** 66
+ *             index = 3
+ */
+      __pyx_v_x = ((__pyx_v_x - 1.5) / (1.0 + (1.5 * __pyx_v_x)));
+
+      /* "_deterministic.pxd":132
+ *                 index = 1
+ *                 x = (x - 1.0) / (x + 1.0)
+ *         elif ix < 0x40038000: # |x| < 2.4375             # <<<<<<<<<<<<<<
+ *             index = 2
+ *             x = (x - 1.5) / (1.0 + 1.5 * x)
+ */
+      goto __pyx_L7;
+    }
+
+    /* "_deterministic.pxd":136
+ *             x = (x - 1.5) / (1.0 + 1.5 * x)
+ *         else: # 2.4375 <= |x| < 2 ** 66
+ *             index = 3             # <<<<<<<<<<<<<<
+ *             x = -1.0 / x
+ * 
+ */
+    /*else*/ {
+      __pyx_v_index = 3;
+
+      /* "_deterministic.pxd":137
+ *         else: # 2.4375 <= |x| < 2 ** 66
+ *             index = 3
+ *             x = -1.0 / x             # <<<<<<<<<<<<<<
+ * 
+ *     z = x * x
+ */
+      __pyx_v_x = (-1.0 / __pyx_v_x);
+    }
+    __pyx_L7:;
+  }
+  __pyx_L5:;
+
+  /* "_deterministic.pxd":139
+ *             x = -1.0 / x
+ * 
+ *     z = x * x             # <<<<<<<<<<<<<<
+ *     w = z * z
+ *     s1 = z * (3.33333333333329318027e-01 + w * (1.42857142725034663711e-01 + w * (9.09088713343650656196e-02 + w * (6.66107313738753120669e-02 + w * (4.97687799461593236017e-02 + w * 1.62858201153657823623e-02)))))
+ */
+  __pyx_v_z = (__pyx_v_x * __pyx_v_x);
+
+  /* "_deterministic.pxd":140
+ * 
+ *     z = x * x
+ *     w = z * z             # <<<<<<<<<<<<<<
+ *     s1 = z * (3.33333333333329318027e-01 + w * (1.42857142725034663711e-01 + w * (9.09088713343650656196e-02 + w * (6.66107313738753120669e-02 + w * (4.97687799461593236017e-02 + w * 1.62858201153657823623e-02)))))
+ *     s2 = w * (-1.99999999998764832476e-01 + w * (-1.11111104054623557880e-01 + w * (-7.69187620504482999495e-02 + w * (-5.83357013379057348645e-02 + w * -3.65315727442169155270e-02))))
+ */
+  __pyx_v_w = (__pyx_v_z * __pyx_v_z);
+
+  /* "_deterministic.pxd":141
+ *     z = x * x
+ *     w = z * z
+ *     s1 = z * (3.33333333333329318027e-01 + w * (1.42857142725034663711e-01 + w * (9.09088713343650656196e-02 + w * (6.66107313738753120669e-02 + w * (4.97687799461593236017e-02 + w * 1.62858201153657823623e-02)))))             # <<<<<<<<<<<<<<
+ *     s2 = w * (-1.99999999998764832476e-01 + w * (-1.11111104054623557880e-01 + w * (-7.69187620504482999495e-02 + w * (-5.83357013379057348645e-02 + w * -3.65315727442169155270e-02))))
+ *     if index < 0:
+ */
+  __pyx_v_s1 = (__pyx_v_z * (3.33333333333329318027e-01 + (__pyx_v_w * (1.42857142725034663711e-01 + (__pyx_v_w * (9.09088713343650656196e-02 + (__pyx_v_w * (6.66107313738753120669e-02 + (__pyx_v_w * (4.97687799461593236017e-02 + (__pyx_v_w * 1.62858201153657823623e-02)))))))))));
+
+  /* "_deterministic.pxd":142
+ *     w = z * z
+ *     s1 = z * (3.33333333333329318027e-01 + w * (1.42857142725034663711e-01 + w * (9.09088713343650656196e-02 + w * (6.66107313738753120669e-02 + w * (4.97687799461593236017e-02 + w * 1.62858201153657823623e-02)))))
+ *     s2 = w * (-1.99999999998764832476e-01 + w * (-1.11111104054623557880e-01 + w * (-7.69187620504482999495e-02 + w * (-5.83357013379057348645e-02 + w * -3.65315727442169155270e-02))))             # <<<<<<<<<<<<<<
+ *     if index < 0:
+ *         return x - x * (s1 + s2)
+ */
+  __pyx_v_s2 = (__pyx_v_w * (-1.99999999998764832476e-01 + (__pyx_v_w * (-1.11111104054623557880e-01 + (__pyx_v_w * (-7.69187620504482999495e-02 + (__pyx_v_w * (-5.83357013379057348645e-02 + (__pyx_v_w * -3.65315727442169155270e-02)))))))));
+
+  /* "_deterministic.pxd":143
+ *     s1 = z * (3.33333333333329318027e-01 + w * (1.42857142725034663711e-01 + w * (9.09088713343650656196e-02 + w * (6.66107313738753120669e-02 + w * (4.97687799461593236017e-02 + w * 1.62858201153657823623e-02)))))
+ *     s2 = w * (-1.99999999998764832476e-01 + w * (-1.11111104054623557880e-01 + w * (-7.69187620504482999495e-02 + w * (-5.83357013379057348645e-02 + w * -3.65315727442169155270e-02))))
+ *     if index < 0:             # <<<<<<<<<<<<<<
+ *         return x - x * (s1 + s2)
+ * 
+ */
+  __pyx_t_1 = (__pyx_v_index < 0);
+  if (__pyx_t_1) {
+
+    /* "_deterministic.pxd":144
+ *     s2 = w * (-1.99999999998764832476e-01 + w * (-1.11111104054623557880e-01 + w * (-7.69187620504482999495e-02 + w * (-5.83357013379057348645e-02 + w * -3.65315727442169155270e-02))))
+ *     if index < 0:
+ *         return x - x * (s1 + s2)             # <<<<<<<<<<<<<<
+ * 
+ *     z = _ATAN_HI[index] - ((x * (s1 + s2) - _ATAN_LO[index]) - x)
+ */
+    __pyx_r = (__pyx_v_x - (__pyx_v_x * (__pyx_v_s1 + __pyx_v_s2)));
+    goto __pyx_L0;
+
+    /* "_deterministic.pxd":143
+ *     s1 = z * (3.33333333333329318027e-01 + w * (1.42857142725034663711e-01 + w * (9.09088713343650656196e-02 + w * (6.66107313738753120669e-02 + w * (4.97687799461593236017e-02 + w * 1.62858201153657823623e-02)))))
+ *     s2 = w * (-1.99999999998764832476e-01 + w * (-1.11111104054623557880e-01 + w * (-7.69187620504482999495e-02 + w * (-5.83357013379057348645e-02 + w * -3.65315727442169155270e-02))))
+ *     if index < 0:             # <<<<<<<<<<<<<<
+ *         return x - x * (s1 + s2)
+ * 
+ */
+  }
+
+  /* "_deterministic.pxd":146
+ *         return x - x * (s1 + s2)
+ * 
+ *     z = _ATAN_HI[index] - ((x * (s1 + s2) - _ATAN_LO[index]) - x)             # <<<<<<<<<<<<<<
+ *     return -z if hx < 0 else z
+ * 
+ */
+  __pyx_v_z = ((nalpy_det_atan_hi[__pyx_v_index]) - (((__pyx_v_x * (__pyx_v_s1 + __pyx_v_s2)) - (nalpy_det_atan_lo[__pyx_v_index])) - __pyx_v_x));
+
+  /* "_deterministic.pxd":147
+ * 
+ *     z = _ATAN_HI[index] - ((x * (s1 + s2) - _ATAN_LO[index]) - x)
+ *     return -z if hx < 0 else z             # <<<<<<<<<<<<<<
+ * 
+ * @cython.cdivision(True)
+ */
+  __pyx_t_1 = (__pyx_v_hx < 0);
+  if (__pyx_t_1) {
+    __pyx_t_2 = (-__pyx_v_z);
+  } else {
+    __pyx_t_2 = __pyx_v_z;
+  }
+  __pyx_r = __pyx_t_2;
+  goto __pyx_L0;
+
+  /* "_deterministic.pxd":108
+ * 
+ * @cython.cdivision(True)
+ * cdef inline double _atan(double x) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef int32_t hx = _high_word(x)
+ *     cdef int32_t ix = hx & 0x7fffffff
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "_deterministic.pxd":150
+ * 
+ * @cython.cdivision(True)
+ * cdef inline double det_atan2(double y, double x) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     if isnan(x) or isnan(y):
+ *         return x + y
+ */
+
+static CYTHON_INLINE double __pyx_f_5nalpy_4math_13_c_extensions_14_deterministic_det_atan2(double __pyx_v_y, double __pyx_v_x) {
+  int32_t __pyx_v_hx;
+  int32_t __pyx_v_hy;
+  int32_t __pyx_v_ix;
+  int32_t __pyx_v_iy;
+  int __pyx_v_quadrant;
+  double __pyx_v_z;
+  int32_t __pyx_v_k;
+  double __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  long __pyx_t_3;
+  long __pyx_t_4;
+  double __pyx_t_5;
+
+  /* "_deterministic.pxd":151
+ * @cython.cdivision(True)
+ * cdef inline double det_atan2(double y, double x) noexcept nogil:
+ *     if isnan(x) or isnan(y):             # <<<<<<<<<<<<<<
+ *         return x + y
+ *     if x == 1.0:
+ */
+  __pyx_t_2 = isnan(__pyx_v_x);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = isnan(__pyx_v_y);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "_deterministic.pxd":152
+ * cdef inline double det_atan2(double y, double x) noexcept nogil:
+ *     if isnan(x) or isnan(y):
+ *         return x + y             # <<<<<<<<<<<<<<
+ *     if x == 1.0:
+ *         return _atan(y)
+ */
+    __pyx_r = (__pyx_v_x + __pyx_v_y);
+    goto __pyx_L0;
+
+    /* "_deterministic.pxd":151
+ * @cython.cdivision(True)
+ * cdef inline double det_atan2(double y, double x) noexcept nogil:
+ *     if isnan(x) or isnan(y):             # <<<<<<<<<<<<<<
+ *         return x + y
+ *     if x == 1.0:
+ */
+  }
+
+  /* "_deterministic.pxd":153
+ *     if isnan(x) or isnan(y):
+ *         return x + y
+ *     if x == 1.0:             # <<<<<<<<<<<<<<
+ *         return _atan(y)
+ * 
+ */
+  __pyx_t_1 = (__pyx_v_x == 1.0);
+  if (__pyx_t_1) {
+
+    /* "_deterministic.pxd":154
+ *         return x + y
+ *     if x == 1.0:
+ *         return _atan(y)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int32_t hx = _high_word(x)
+ */
+    __pyx_r = __pyx_f_5nalpy_4math_13_c_extensions_14_deterministic__atan(__pyx_v_y);
+    goto __pyx_L0;
+
+    /* "_deterministic.pxd":153
+ *     if isnan(x) or isnan(y):
+ *         return x + y
+ *     if x == 1.0:             # <<<<<<<<<<<<<<
+ *         return _atan(y)
+ * 
+ */
+  }
+
+  /* "_deterministic.pxd":156
+ *         return _atan(y)
+ * 
+ *     cdef int32_t hx = _high_word(x)             # <<<<<<<<<<<<<<
+ *     cdef int32_t hy = _high_word(y)
+ *     cdef int32_t ix = hx & 0x7fffffff
+ */
+  __pyx_v_hx = __pyx_f_5nalpy_4math_13_c_extensions_14_deterministic__high_word(__pyx_v_x);
+
+  /* "_deterministic.pxd":157
+ * 
+ *     cdef int32_t hx = _high_word(x)
+ *     cdef int32_t hy = _high_word(y)             # <<<<<<<<<<<<<<
+ *     cdef int32_t ix = hx & 0x7fffffff
+ *     cdef int32_t iy = hy & 0x7fffffff
+ */
+  __pyx_v_hy = __pyx_f_5nalpy_4math_13_c_extensions_14_deterministic__high_word(__pyx_v_y);
+
+  /* "_deterministic.pxd":158
+ *     cdef int32_t hx = _high_word(x)
+ *     cdef int32_t hy = _high_word(y)
+ *     cdef int32_t ix = hx & 0x7fffffff             # <<<<<<<<<<<<<<
+ *     cdef int32_t iy = hy & 0x7fffffff
+ *     cdef int quadrant = (1 if hy < 0 else 0) | (2 if hx < 0 else 0) # Sign of y | sign of x
+ */
+  __pyx_v_ix = (__pyx_v_hx & 0x7fffffff);
+
+  /* "_deterministic.pxd":159
+ *     cdef int32_t hy = _high_word(y)
+ *     cdef int32_t ix = hx & 0x7fffffff
+ *     cdef int32_t iy = hy & 0x7fffffff             # <<<<<<<<<<<<<<
+ *     cdef int quadrant = (1 if hy < 0 else 0) | (2 if hx < 0 else 0) # Sign of y | sign of x
+ * 
+ */
+  __pyx_v_iy = (__pyx_v_hy & 0x7fffffff);
+
+  /* "_deterministic.pxd":160
+ *     cdef int32_t ix = hx & 0x7fffffff
+ *     cdef int32_t iy = hy & 0x7fffffff
+ *     cdef int quadrant = (1 if hy < 0 else 0) | (2 if hx < 0 else 0) # Sign of y | sign of x             # <<<<<<<<<<<<<<
+ * 
+ *     if y == 0.0:
+ */
+  __pyx_t_1 = (__pyx_v_hy < 0);
+  if (__pyx_t_1) {
+    __pyx_t_3 = 1;
+  } else {
+    __pyx_t_3 = 0;
+  }
+  __pyx_t_1 = (__pyx_v_hx < 0);
+  if (__pyx_t_1) {
+    __pyx_t_4 = 2;
+  } else {
+    __pyx_t_4 = 0;
+  }
+  __pyx_v_quadrant = (__pyx_t_3 | __pyx_t_4);
+
+  /* "_deterministic.pxd":162
+ *     cdef int quadrant = (1 if hy < 0 else 0) | (2 if hx < 0 else 0) # Sign of y | sign of x
+ * 
+ *     if y == 0.0:             # <<<<<<<<<<<<<<
+ *         if quadrant < 2:
+ *             return y # atan2(+-0, +anything) = +-0
+ */
+  __pyx_t_1 = (__pyx_v_y == 0.0);
+  if (__pyx_t_1) {
+
+    /* "_deterministic.pxd":163
+ * 
+ *     if y == 0.0:
+ *         if quadrant < 2:             # <<<<<<<<<<<<<<
+ *             return y # atan2(+-0, +anything) = +-0
+ *         return _PI if quadrant == 2 else -_PI
+ */
+    __pyx_t_1 = (__pyx_v_quadrant < 2);
+    if (__pyx_t_1) {
+
+      /* "_deterministic.pxd":164
+ *     if y == 0.0:
+ *         if quadrant < 2:
+ *             return y # atan2(+-0, +anything) = +-0             # <<<<<<<<<<<<<<
+ *         return _PI if quadrant == 2 else -_PI
+ *     if x == 0.0:
+ */
+      __pyx_r = __pyx_v_y;
+      goto __pyx_L0;
+
+      /* "_deterministic.pxd":163
+ * 
+ *     if y == 0.0:
+ *         if quadrant < 2:             # <<<<<<<<<<<<<<
+ *             return y # atan2(+-0, +anything) = +-0
+ *         return _PI if quadrant == 2 else -_PI
+ */
+    }
+
+    /* "_deterministic.pxd":165
+ *         if quadrant < 2:
+ *             return y # atan2(+-0, +anything) = +-0
+ *         return _PI if quadrant == 2 else -_PI             # <<<<<<<<<<<<<<
+ *     if x == 0.0:
+ *         return -_PIO2_HI if hy < 0 else _PIO2_HI
+ */
+    __pyx_t_1 = (__pyx_v_quadrant == 2);
+    if (__pyx_t_1) {
+      __pyx_t_5 = nalpy_det_pi;
+    } else {
+      __pyx_t_5 = (-nalpy_det_pi);
+    }
+    __pyx_r = __pyx_t_5;
+    goto __pyx_L0;
+
+    /* "_deterministic.pxd":162
+ *     cdef int quadrant = (1 if hy < 0 else 0) | (2 if hx < 0 else 0) # Sign of y | sign of x
+ * 
+ *     if y == 0.0:             # <<<<<<<<<<<<<<
+ *         if quadrant < 2:
+ *             return y # atan2(+-0, +anything) = +-0
+ */
+  }
+
+  /* "_deterministic.pxd":166
+ *             return y # atan2(+-0, +anything) = +-0
+ *         return _PI if quadrant == 2 else -_PI
+ *     if x == 0.0:             # <<<<<<<<<<<<<<
+ *         return -_PIO2_HI if hy < 0 else _PIO2_HI
+ * 
+ */
+  __pyx_t_1 = (__pyx_v_x == 0.0);
+  if (__pyx_t_1) {
+
+    /* "_deterministic.pxd":167
+ *         return _PI if quadrant == 2 else -_PI
+ *     if x == 0.0:
+ *         return -_PIO2_HI if hy < 0 else _PIO2_HI             # <<<<<<<<<<<<<<
+ * 
+ *     if isinf(x):
+ */
+    __pyx_t_1 = (__pyx_v_hy < 0);
+    if (__pyx_t_1) {
+      __pyx_t_5 = (-nalpy_det_pio2_hi);
+    } else {
+      __pyx_t_5 = nalpy_det_pio2_hi;
+    }
+    __pyx_r = __pyx_t_5;
+    goto __pyx_L0;
+
+    /* "_deterministic.pxd":166
+ *             return y # atan2(+-0, +anything) = +-0
+ *         return _PI if quadrant == 2 else -_PI
+ *     if x == 0.0:             # <<<<<<<<<<<<<<
+ *         return -_PIO2_HI if hy < 0 else _PIO2_HI
+ * 
+ */
+  }
+
+  /* "_deterministic.pxd":169
+ *         return -_PIO2_HI if hy < 0 else _PIO2_HI
+ * 
+ *     if isinf(x):             # <<<<<<<<<<<<<<
+ *         if isinf(y):
+ *             if quadrant == 0:
+ */
+  __pyx_t_1 = (isinf(__pyx_v_x) != 0);
+  if (__pyx_t_1) {
+
+    /* "_deterministic.pxd":170
+ * 
+ *     if isinf(x):
+ *         if isinf(y):             # <<<<<<<<<<<<<<
+ *             if quadrant == 0:
+ *                 return _PIO4
+ */
+    __pyx_t_1 = (isinf(__pyx_v_y) != 0);
+    if (__pyx_t_1) {
+
+      /* "_deterministic.pxd":171
+ *     if isinf(x):
+ *         if isinf(y):
+ *             if quadrant == 0:             # <<<<<<<<<<<<<<
+ *                 return _PIO4
+ *             if quadrant == 1:
+ */
+      __pyx_t_1 = (__pyx_v_quadrant == 0);
+      if (__pyx_t_1) {
+
+        /* "_deterministic.pxd":172
+ *         if isinf(y):
+ *             if quadrant == 0:
+ *                 return _PIO4             # <<<<<<<<<<<<<<
+ *             if quadrant == 1:
+ *                 return -_PIO4
+ */
+        __pyx_r = nalpy_det_pio4;
+        goto __pyx_L0;
+
+        /* "_deterministic.pxd":171
+ *     if isinf(x):
+ *         if isinf(y):
+ *             if quadrant == 0:             # <<<<<<<<<<<<<<
+ *                 return _PIO4
+ *             if quadrant == 1:
+ */
+      }
+
+      /* "_deterministic.pxd":173
+ *             if quadrant == 0:
+ *                 return _PIO4
+ *             if quadrant == 1:             # <<<<<<<<<<<<<<
+ *                 return -_PIO4
+ *             if quadrant == 2:
+ */
+      __pyx_t_1 = (__pyx_v_quadrant == 1);
+      if (__pyx_t_1) {
+
+        /* "_deterministic.pxd":174
+ *                 return _PIO4
+ *             if quadrant == 1:
+ *                 return -_PIO4             # <<<<<<<<<<<<<<
+ *             if quadrant == 2:
+ *                 return 3.0 * _PIO4
+ */
+        __pyx_r = (-nalpy_det_pio4);
+        goto __pyx_L0;
+
+        /* "_deterministic.pxd":173
+ *             if quadrant == 0:
+ *                 return _PIO4
+ *             if quadrant == 1:             # <<<<<<<<<<<<<<
+ *                 return -_PIO4
+ *             if quadrant == 2:
+ */
+      }
+
+      /* "_deterministic.pxd":175
+ *             if quadrant == 1:
+ *                 return -_PIO4
+ *             if quadrant == 2:             # <<<<<<<<<<<<<<
+ *                 return 3.0 * _PIO4
+ *             return -3.0 * _PIO4
+ */
+      __pyx_t_1 = (__pyx_v_quadrant == 2);
+      if (__pyx_t_1) {
+
+        /* "_deterministic.pxd":176
+ *                 return -_PIO4
+ *             if quadrant == 2:
+ *                 return 3.0 * _PIO4             # <<<<<<<<<<<<<<
+ *             return -3.0 * _PIO4
+ *         if quadrant == 0:
+ */
+        __pyx_r = (3.0 * nalpy_det_pio4);
+        goto __pyx_L0;
+
+        /* "_deterministic.pxd":175
+ *             if quadrant == 1:
+ *                 return -_PIO4
+ *             if quadrant == 2:             # <<<<<<<<<<<<<<
+ *                 return 3.0 * _PIO4
+ *             return -3.0 * _PIO4
+ */
+      }
+
+      /* "_deterministic.pxd":177
+ *             if quadrant == 2:
+ *                 return 3.0 * _PIO4
+ *             return -3.0 * _PIO4             # <<<<<<<<<<<<<<
+ *         if quadrant == 0:
+ *             return 0.0
+ */
+      __pyx_r = (-3.0 * nalpy_det_pio4);
+      goto __pyx_L0;
+
+      /* "_deterministic.pxd":170
+ * 
+ *     if isinf(x):
+ *         if isinf(y):             # <<<<<<<<<<<<<<
+ *             if quadrant == 0:
+ *                 return _PIO4
+ */
+    }
+
+    /* "_deterministic.pxd":178
+ *                 return 3.0 * _PIO4
+ *             return -3.0 * _PIO4
+ *         if quadrant == 0:             # <<<<<<<<<<<<<<
+ *             return 0.0
+ *         if quadrant == 1:
+ */
+    __pyx_t_1 = (__pyx_v_quadrant == 0);
+    if (__pyx_t_1) {
+
+      /* "_deterministic.pxd":179
+ *             return -3.0 * _PIO4
+ *         if quadrant == 0:
+ *             return 0.0             # <<<<<<<<<<<<<<
+ *         if quadrant == 1:
+ *             return -0.0
+ */
+      __pyx_r = 0.0;
+      goto __pyx_L0;
+
+      /* "_deterministic.pxd":178
+ *                 return 3.0 * _PIO4
+ *             return -3.0 * _PIO4
+ *         if quadrant == 0:             # <<<<<<<<<<<<<<
+ *             return 0.0
+ *         if quadrant == 1:
+ */
+    }
+
+    /* "_deterministic.pxd":180
+ *         if quadrant == 0:
+ *             return 0.0
+ *         if quadrant == 1:             # <<<<<<<<<<<<<<
+ *             return -0.0
+ *         if quadrant == 2:
+ */
+    __pyx_t_1 = (__pyx_v_quadrant == 1);
+    if (__pyx_t_1) {
+
+      /* "_deterministic.pxd":181
+ *             return 0.0
+ *         if quadrant == 1:
+ *             return -0.0             # <<<<<<<<<<<<<<
+ *         if quadrant == 2:
+ *             return _PI
+ */
+      __pyx_r = -0.0;
+      goto __pyx_L0;
+
+      /* "_deterministic.pxd":180
+ *         if quadrant == 0:
+ *             return 0.0
+ *         if quadrant == 1:             # <<<<<<<<<<<<<<
+ *             return -0.0
+ *         if quadrant == 2:
+ */
+    }
+
+    /* "_deterministic.pxd":182
+ *         if quadrant == 1:
+ *             return -0.0
+ *         if quadrant == 2:             # <<<<<<<<<<<<<<
+ *             return _PI
+ *         return -_PI
+ */
+    __pyx_t_1 = (__pyx_v_quadrant == 2);
+    if (__pyx_t_1) {
+
+      /* "_deterministic.pxd":183
+ *             return -0.0
+ *         if quadrant == 2:
+ *             return _PI             # <<<<<<<<<<<<<<
+ *         return -_PI
+ *     if isinf(y):
+ */
+      __pyx_r = nalpy_det_pi;
+      goto __pyx_L0;
+
+      /* "_deterministic.pxd":182
+ *         if quadrant == 1:
+ *             return -0.0
+ *         if quadrant == 2:             # <<<<<<<<<<<<<<
+ *             return _PI
+ *         return -_PI
+ */
+    }
+
+    /* "_deterministic.pxd":184
+ *         if quadrant == 2:
+ *             return _PI
+ *         return -_PI             # <<<<<<<<<<<<<<
+ *     if isinf(y):
+ *         return -_PIO2_HI if hy < 0 else _PIO2_HI
+ */
+    __pyx_r = (-nalpy_det_pi);
+    goto __pyx_L0;
+
+    /* "_deterministic.pxd":169
+ *         return -_PIO2_HI if hy < 0 else _PIO2_HI
+ * 
+ *     if isinf(x):             # <<<<<<<<<<<<<<
+ *         if isinf(y):
+ *             if quadrant == 0:
+ */
+  }
+
+  /* "_deterministic.pxd":185
+ *             return _PI
+ *         return -_PI
+ *     if isinf(y):             # <<<<<<<<<<<<<<
+ *         return -_PIO2_HI if hy < 0 else _PIO2_HI
+ * 
+ */
+  __pyx_t_1 = (isinf(__pyx_v_y) != 0);
+  if (__pyx_t_1) {
+
+    /* "_deterministic.pxd":186
+ *         return -_PI
+ *     if isinf(y):
+ *         return -_PIO2_HI if hy < 0 else _PIO2_HI             # <<<<<<<<<<<<<<
+ * 
+ *     cdef double z
+ */
+    __pyx_t_1 = (__pyx_v_hy < 0);
+    if (__pyx_t_1) {
+      __pyx_t_5 = (-nalpy_det_pio2_hi);
+    } else {
+      __pyx_t_5 = nalpy_det_pio2_hi;
+    }
+    __pyx_r = __pyx_t_5;
+    goto __pyx_L0;
+
+    /* "_deterministic.pxd":185
+ *             return _PI
+ *         return -_PI
+ *     if isinf(y):             # <<<<<<<<<<<<<<
+ *         return -_PIO2_HI if hy < 0 else _PIO2_HI
+ * 
+ */
+  }
+
+  /* "_deterministic.pxd":189
+ * 
+ *     cdef double z
+ *     cdef int32_t k = (iy - ix) >> 20 # Difference of the exponents             # <<<<<<<<<<<<<<
+ *     if k > 60: # |y / x| > 2 ** 60
+ *         z = _PIO2_HI + 0.5 * _PI_LO
+ */
+  __pyx_v_k = ((__pyx_v_iy - __pyx_v_ix) >> 20);
+
+  /* "_deterministic.pxd":190
+ *     cdef double z
+ *     cdef int32_t k = (iy - ix) >> 20 # Difference of the exponents
+ *     if k > 60: # |y / x| > 2 ** 60             # <<<<<<<<<<<<<<
+ *         z = _PIO2_HI + 0.5 * _PI_LO
+ *         quadrant &= 1 # The sign of x doesn't matter, fix from FreeBSD msun
+ */
+  __pyx_t_1 = (__pyx_v_k > 60);
+  if (__pyx_t_1) {
+
+    /* "_deterministic.pxd":191
+ *     cdef int32_t k = (iy - ix) >> 20 # Difference of the exponents
+ *     if k > 60: # |y / x| > 2 ** 60
+ *         z = _PIO2_HI + 0.5 * _PI_LO             # <<<<<<<<<<<<<<
+ *         quadrant &= 1 # The sign of x doesn't matter, fix from FreeBSD msun
+ *     elif hx < 0 and k < -60: # |y| / x < -2 ** -60
+ */
+    __pyx_v_z = (nalpy_det_pio2_hi + (0.5 * nalpy_det_pi_lo));
+
+    /* "_deterministic.pxd":192
+ *     if k > 60: # |y / x| > 2 ** 60
+ *         z = _PIO2_HI + 0.5 * _PI_LO
+ *         quadrant &= 1 # The sign of x doesn't matter, fix from FreeBSD msun             # <<<<<<<<<<<<<<
+ *     elif hx < 0 and k < -60: # |y| / x < -2 ** -60
+ *         z = 0.0
+ */
+    __pyx_v_quadrant = (__pyx_v_quadrant & 1);
+
+    /* "_deterministic.pxd":190
+ *     cdef double z
+ *     cdef int32_t k = (iy - ix) >> 20 # Difference of the exponents
+ *     if k > 60: # |y / x| > 2 ** 60             # <<<<<<<<<<<<<<
+ *         z = _PIO2_HI + 0.5 * _PI_LO
+ *         quadrant &= 1 # The sign of x doesn't matter, fix from FreeBSD msun
+ */
+    goto __pyx_L19;
+  }
+
+  /* "_deterministic.pxd":193
+ *         z = _PIO2_HI + 0.5 * _PI_LO
+ *         quadrant &= 1 # The sign of x doesn't matter, fix from FreeBSD msun
+ *     elif hx < 0 and k < -60: # |y| / x < -2 ** -60             # <<<<<<<<<<<<<<
+ *         z = 0.0
+ *     else:
+ */
+  __pyx_t_2 = (__pyx_v_hx < 0);
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L20_bool_binop_done;
+  }
+  __pyx_t_2 = (__pyx_v_k < -60L);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L20_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "_deterministic.pxd":194
+ *         quadrant &= 1 # The sign of x doesn't matter, fix from FreeBSD msun
+ *     elif hx < 0 and k < -60: # |y| / x < -2 ** -60
+ *         z = 0.0             # <<<<<<<<<<<<<<
+ *     else:
+ *         z = _atan(fabs(y / x))
+ */
+    __pyx_v_z = 0.0;
+
+    /* "_deterministic.pxd":193
+ *         z = _PIO2_HI + 0.5 * _PI_LO
+ *         quadrant &= 1 # The sign of x doesn't matter, fix from FreeBSD msun
+ *     elif hx < 0 and k < -60: # |y| / x < -2 ** -60             # <<<<<<<<<<<<<<
+ *         z = 0.0
+ *     else:
+ */
+    goto __pyx_L19;
+  }
+
+  /* "_deterministic.pxd":196
+ *         z = 0.0
+ *     else:
+ *         z = _atan(fabs(y / x))             # <<<<<<<<<<<<<<
+ * 
+ *     if quadrant == 0:
+ */
+  /*else*/ {
+    __pyx_v_z = __pyx_f_5nalpy_4math_13_c_extensions_14_deterministic__atan(fabs((__pyx_v_y / __pyx_v_x)));
+  }
+  __pyx_L19:;
+
+  /* "_deterministic.pxd":198
+ *         z = _atan(fabs(y / x))
+ * 
+ *     if quadrant == 0:             # <<<<<<<<<<<<<<
+ *         return z
+ *     if quadrant == 1:
+ */
+  __pyx_t_1 = (__pyx_v_quadrant == 0);
+  if (__pyx_t_1) {
+
+    /* "_deterministic.pxd":199
+ * 
+ *     if quadrant == 0:
+ *         return z             # <<<<<<<<<<<<<<
+ *     if quadrant == 1:
+ *         return -z
+ */
+    __pyx_r = __pyx_v_z;
+    goto __pyx_L0;
+
+    /* "_deterministic.pxd":198
+ *         z = _atan(fabs(y / x))
+ * 
+ *     if quadrant == 0:             # <<<<<<<<<<<<<<
+ *         return z
+ *     if quadrant == 1:
+ */
+  }
+
+  /* "_deterministic.pxd":200
+ *     if quadrant == 0:
+ *         return z
+ *     if quadrant == 1:             # <<<<<<<<<<<<<<
+ *         return -z
+ *     if quadrant == 2:
+ */
+  __pyx_t_1 = (__pyx_v_quadrant == 1);
+  if (__pyx_t_1) {
+
+    /* "_deterministic.pxd":201
+ *         return z
+ *     if quadrant == 1:
+ *         return -z             # <<<<<<<<<<<<<<
+ *     if quadrant == 2:
+ *         return _PI - (z - _PI_LO)
+ */
+    __pyx_r = (-__pyx_v_z);
+    goto __pyx_L0;
+
+    /* "_deterministic.pxd":200
+ *     if quadrant == 0:
+ *         return z
+ *     if quadrant == 1:             # <<<<<<<<<<<<<<
+ *         return -z
+ *     if quadrant == 2:
+ */
+  }
+
+  /* "_deterministic.pxd":202
+ *     if quadrant == 1:
+ *         return -z
+ *     if quadrant == 2:             # <<<<<<<<<<<<<<
+ *         return _PI - (z - _PI_LO)
+ *     return (z - _PI_LO) - _PI
+ */
+  __pyx_t_1 = (__pyx_v_quadrant == 2);
+  if (__pyx_t_1) {
+
+    /* "_deterministic.pxd":203
+ *         return -z
+ *     if quadrant == 2:
+ *         return _PI - (z - _PI_LO)             # <<<<<<<<<<<<<<
+ *     return (z - _PI_LO) - _PI
+ * 
+ */
+    __pyx_r = (nalpy_det_pi - (__pyx_v_z - nalpy_det_pi_lo));
+    goto __pyx_L0;
+
+    /* "_deterministic.pxd":202
+ *     if quadrant == 1:
+ *         return -z
+ *     if quadrant == 2:             # <<<<<<<<<<<<<<
+ *         return _PI - (z - _PI_LO)
+ *     return (z - _PI_LO) - _PI
+ */
+  }
+
+  /* "_deterministic.pxd":204
+ *     if quadrant == 2:
+ *         return _PI - (z - _PI_LO)
+ *     return (z - _PI_LO) - _PI             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline double det_round(double x) noexcept nogil:
+ */
+  __pyx_r = ((__pyx_v_z - nalpy_det_pi_lo) - nalpy_det_pi);
+  goto __pyx_L0;
+
+  /* "_deterministic.pxd":150
+ * 
+ * @cython.cdivision(True)
+ * cdef inline double det_atan2(double y, double x) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     if isnan(x) or isnan(y):
+ *         return x + y
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "_deterministic.pxd":206
+ *     return (z - _PI_LO) - _PI
+ * 
+ * cdef inline double det_round(double x) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     # Half away from zero like llround, but keeps the result a double so that out of range values don't depend on the platform.
+ *     # x - trunc(x) is exact, unlike x + 0.5 which rounds 0.49999999999999994 up.
+ */
+
+static CYTHON_INLINE double __pyx_f_5nalpy_4math_13_c_extensions_14_deterministic_det_round(double __pyx_v_x) {
+  double __pyx_v_t;
+  double __pyx_r;
+  int __pyx_t_1;
+
+  /* "_deterministic.pxd":209
+ *     # Half away from zero like llround, but keeps the result a double so that out of range values don't depend on the platform.
+ *     # x - trunc(x) is exact, unlike x + 0.5 which rounds 0.49999999999999994 up.
+ *     cdef double t = trunc(x)             # <<<<<<<<<<<<<<
+ *     if fabs(x - t) >= 0.5:
+ *         t += copysign(1.0, x)
+ */
+  __pyx_v_t = trunc(__pyx_v_x);
+
+  /* "_deterministic.pxd":210
+ *     # x - trunc(x) is exact, unlike x + 0.5 which rounds 0.49999999999999994 up.
+ *     cdef double t = trunc(x)
+ *     if fabs(x - t) >= 0.5:             # <<<<<<<<<<<<<<
+ *         t += copysign(1.0, x)
+ *     return t
+ */
+  __pyx_t_1 = (fabs((__pyx_v_x - __pyx_v_t)) >= 0.5);
+  if (__pyx_t_1) {
+
+    /* "_deterministic.pxd":211
+ *     cdef double t = trunc(x)
+ *     if fabs(x - t) >= 0.5:
+ *         t += copysign(1.0, x)             # <<<<<<<<<<<<<<
+ *     return t
+ */
+    __pyx_v_t = (__pyx_v_t + copysign(1.0, __pyx_v_x));
+
+    /* "_deterministic.pxd":210
+ *     # x - trunc(x) is exact, unlike x + 0.5 which rounds 0.49999999999999994 up.
+ *     cdef double t = trunc(x)
+ *     if fabs(x - t) >= 0.5:             # <<<<<<<<<<<<<<
+ *         t += copysign(1.0, x)
+ *     return t
+ */
+  }
+
+  /* "_deterministic.pxd":212
+ *     if fabs(x - t) >= 0.5:
+ *         t += copysign(1.0, x)
+ *     return t             # <<<<<<<<<<<<<<
+ */
+  __pyx_r = __pyx_v_t;
+  goto __pyx_L0;
+
+  /* "_deterministic.pxd":206
+ *     return (z - _PI_LO) - _PI
+ * 
+ * cdef inline double det_round(double x) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     # Half away from zero like llround, but keeps the result a double so that out of range values don't depend on the platform.
+ *     # x - trunc(x) is exact, unlike x + 0.5 which rounds 0.49999999999999994 up.
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "mvector2.pxd":10
+ *     cpdef normalize(self)
+ * 
+ * cdef inline MVector2 new_mvector2(double x, double y):             # <<<<<<<<<<<<<<
+ *     # MVector2(x, y) without the overhead of calling __init__ through Python
+ *     cdef MVector2 v = MVector2.__new__(MVector2)
+ */
+
+static CYTHON_INLINE struct __pyx_obj_5nalpy_4math_13_c_extensions_8mvector2_MVector2 *__pyx_f_5nalpy_4math_13_c_extensions_8mvector2_new_mvector2(double __pyx_v_x, double __pyx_v_y) {
+  struct __pyx_obj_5nalpy_4math_13_c_extensions_8mvector2_MVector2 *__pyx_v_v = 0;
+  struct __pyx_obj_5nalpy_4math_13_c_extensions_8mvector2_MVector2 *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("new_mvector2", 1);
+
+  /* "mvector2.pxd":12
+ * cdef inline MVector2 new_mvector2(double x, double y):
+ *     # MVector2(x, y) without the overhead of calling __init__ through Python
+ *     cdef MVector2 v = MVector2.__new__(MVector2)             # <<<<<<<<<<<<<<
+ *     v.x = x
+ *     v.y = y
+ */
+  __pyx_t_1 = __Pyx_tp_new(((PyObject *)__pyx_ptype_5nalpy_4math_13_c_extensions_8mvector2_MVector2), __pyx_empty_tuple); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (!(likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5nalpy_4math_13_c_extensions_8mvector2_MVector2)))) __PYX_ERR(1, 12, __pyx_L1_error)
+  __pyx_v_v = ((struct __pyx_obj_5nalpy_4math_13_c_extensions_8mvector2_MVector2 *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "mvector2.pxd":13
+ *     # MVector2(x, y) without the overhead of calling __init__ through Python
+ *     cdef MVector2 v = MVector2.__new__(MVector2)
+ *     v.x = x             # <<<<<<<<<<<<<<
+ *     v.y = y
+ *     return v
+ */
+  __pyx_v_v->x = __pyx_v_x;
+
+  /* "mvector2.pxd":14
+ *     cdef MVector2 v = MVector2.__new__(MVector2)
+ *     v.x = x
+ *     v.y = y             # <<<<<<<<<<<<<<
+ *     return v
+ */
+  __pyx_v_v->y = __pyx_v_y;
+
+  /* "mvector2.pxd":15
+ *     v.x = x
+ *     v.y = y
+ *     return v             # <<<<<<<<<<<<<<
+ */
+  __Pyx_XDECREF((PyObject *)__pyx_r);
+  __Pyx_INCREF((PyObject *)__pyx_v_v);
+  __pyx_r = __pyx_v_v;
+  goto __pyx_L0;
+
+  /* "mvector2.pxd":10
+ *     cpdef normalize(self)
+ * 
+ * cdef inline MVector2 new_mvector2(double x, double y):             # <<<<<<<<<<<<<<
+ *     # MVector2(x, y) without the overhead of calling __init__ through Python
+ *     cdef MVector2 v = MVector2.__new__(MVector2)
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("nalpy.math._c_extensions.mvector2.new_mvector2", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_v);
+  __Pyx_XGIVEREF((PyObject *)__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "vector2.pxd":10
+ *     cdef readonly double y
+ * 
+ * cdef inline Vector2 new_vector2(double x, double y):             # <<<<<<<<<<<<<<
+ *     # Vector2(x, y) without the overhead of calling __init__ through Python
+ *     cdef Vector2 v = Vector2.__new__(Vector2)
+ */
+
+static CYTHON_INLINE struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *__pyx_f_5nalpy_4math_13_c_extensions_7vector2_new_vector2(double __pyx_v_x, double __pyx_v_y) {
+  struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *__pyx_v_v = 0;
+  struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("new_vector2", 1);
+
+  /* "vector2.pxd":12
+ * cdef inline Vector2 new_vector2(double x, double y):
+ *     # Vector2(x, y) without the overhead of calling __init__ through Python
+ *     cdef Vector2 v = Vector2.__new__(Vector2)             # <<<<<<<<<<<<<<
+ *     v.x = x
+ *     v.y = y
+ */
+  __pyx_t_1 = __Pyx_tp_new(((PyObject *)__pyx_ptype_5nalpy_4math_13_c_extensions_7vector2_Vector2), __pyx_empty_tuple); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (!(likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5nalpy_4math_13_c_extensions_7vector2_Vector2)))) __PYX_ERR(2, 12, __pyx_L1_error)
+  __pyx_v_v = ((struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "vector2.pxd":13
+ *     # Vector2(x, y) without the overhead of calling __init__ through Python
+ *     cdef Vector2 v = Vector2.__new__(Vector2)
+ *     v.x = x             # <<<<<<<<<<<<<<
+ *     v.y = y
+ *     return v
+ */
+  __pyx_v_v->x = __pyx_v_x;
+
+  /* "vector2.pxd":14
+ *     cdef Vector2 v = Vector2.__new__(Vector2)
+ *     v.x = x
+ *     v.y = y             # <<<<<<<<<<<<<<
+ *     return v
+ * 
+ */
+  __pyx_v_v->y = __pyx_v_y;
+
+  /* "vector2.pxd":15
+ *     v.x = x
+ *     v.y = y
+ *     return v             # <<<<<<<<<<<<<<
+ * 
+ * # Component-wise C versions of the Vector2 math for use from other extensions, callable without the GIL.
+ */
+  __Pyx_XDECREF((PyObject *)__pyx_r);
+  __Pyx_INCREF((PyObject *)__pyx_v_v);
+  __pyx_r = __pyx_v_v;
+  goto __pyx_L0;
+
+  /* "vector2.pxd":10
+ *     cdef readonly double y
+ * 
+ * cdef inline Vector2 new_vector2(double x, double y):             # <<<<<<<<<<<<<<
+ *     # Vector2(x, y) without the overhead of calling __init__ through Python
+ *     cdef Vector2 v = Vector2.__new__(Vector2)
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("nalpy.math._c_extensions.vector2.new_vector2", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_v);
+  __Pyx_XGIVEREF((PyObject *)__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "vector2.pxd":19
+ * # Component-wise C versions of the Vector2 math for use from other extensions, callable without the GIL.
+ * # Vector results are written into out which must have room for two doubles and may alias the inputs.
+ * cdef inline double magnitude2(double x, double y) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return hypot(x, y)
+ * 
+ */
+
+static CYTHON_INLINE double __pyx_f_5nalpy_4math_13_c_extensions_7vector2_magnitude2(double __pyx_v_x, double __pyx_v_y) {
+  double __pyx_r;
+
+  /* "vector2.pxd":20
+ * # Vector results are written into out which must have room for two doubles and may alias the inputs.
+ * cdef inline double magnitude2(double x, double y) noexcept nogil:
+ *     return hypot(x, y)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline double dot2(double ax, double ay, double bx, double by) noexcept nogil:
+ */
+  __pyx_r = hypot(__pyx_v_x, __pyx_v_y);
+  goto __pyx_L0;
+
+  /* "vector2.pxd":19
+ * # Component-wise C versions of the Vector2 math for use from other extensions, callable without the GIL.
+ * # Vector results are written into out which must have room for two doubles and may alias the inputs.
+ * cdef inline double magnitude2(double x, double y) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return hypot(x, y)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "vector2.pxd":22
+ *     return hypot(x, y)
+ * 
+ * cdef inline double dot2(double ax, double ay, double bx, double by) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return (ax * bx) + (ay * by)
+ * 
+ */
+
+static CYTHON_INLINE double __pyx_f_5nalpy_4math_13_c_extensions_7vector2_dot2(double __pyx_v_ax, double __pyx_v_ay, double __pyx_v_bx, double __pyx_v_by) {
+  double __pyx_r;
+
+  /* "vector2.pxd":23
+ * 
+ * cdef inline double dot2(double ax, double ay, double bx, double by) noexcept nogil:
+ *     return (ax * bx) + (ay * by)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline double distance2(double ax, double ay, double bx, double by) noexcept nogil:
+ */
+  __pyx_r = ((__pyx_v_ax * __pyx_v_bx) + (__pyx_v_ay * __pyx_v_by));
+  goto __pyx_L0;
+
+  /* "vector2.pxd":22
+ *     return hypot(x, y)
+ * 
+ * cdef inline double dot2(double ax, double ay, double bx, double by) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return (ax * bx) + (ay * by)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "vector2.pxd":25
+ *     return (ax * bx) + (ay * by)
+ * 
+ * cdef inline double distance2(double ax, double ay, double bx, double by) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return hypot(ax - bx, ay - by)
+ * 
+ */
+
+static CYTHON_INLINE double __pyx_f_5nalpy_4math_13_c_extensions_7vector2_distance2(double __pyx_v_ax, double __pyx_v_ay, double __pyx_v_bx, double __pyx_v_by) {
+  double __pyx_r;
+
+  /* "vector2.pxd":26
+ * 
+ * cdef inline double distance2(double ax, double ay, double bx, double by) noexcept nogil:
+ *     return hypot(ax - bx, ay - by)             # <<<<<<<<<<<<<<
+ * 
+ * @cython.cdivision(True)
+ */
+  __pyx_r = hypot((__pyx_v_ax - __pyx_v_bx), (__pyx_v_ay - __pyx_v_by));
+  goto __pyx_L0;
+
+  /* "vector2.pxd":25
+ *     return (ax * bx) + (ay * by)
+ * 
+ * cdef inline double distance2(double ax, double ay, double bx, double by) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return hypot(ax - bx, ay - by)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "vector2.pxd":29
+ * 
+ * @cython.cdivision(True)
+ * cdef inline double angle2(double from_x, double from_y, double to_x, double to_y) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef double denom = hypot(from_x, from_y) * hypot(to_x, to_y) # Multiply magnitudes
+ *     if denom == 0.0:
+ */
+
+static CYTHON_INLINE double __pyx_f_5nalpy_4math_13_c_extensions_7vector2_angle2(double __pyx_v_from_x, double __pyx_v_from_y, double __pyx_v_to_x, double __pyx_v_to_y) {
+  double __pyx_v_denom;
+  double __pyx_v_cos_val;
+  double __pyx_r;
+  int __pyx_t_1;
+
+  /* "vector2.pxd":30
+ * @cython.cdivision(True)
+ * cdef inline double angle2(double from_x, double from_y, double to_x, double to_y) noexcept nogil:
+ *     cdef double denom = hypot(from_x, from_y) * hypot(to_x, to_y) # Multiply magnitudes             # <<<<<<<<<<<<<<
+ *     if denom == 0.0:
+ *         return 0.0
+ */
+  __pyx_v_denom = (hypot(__pyx_v_from_x, __pyx_v_from_y) * hypot(__pyx_v_to_x, __pyx_v_to_y));
+
+  /* "vector2.pxd":31
+ * cdef inline double angle2(double from_x, double from_y, double to_x, double to_y) noexcept nogil:
+ *     cdef double denom = hypot(from_x, from_y) * hypot(to_x, to_y) # Multiply magnitudes
+ *     if denom == 0.0:             # <<<<<<<<<<<<<<
+ *         return 0.0
+ * 
+ */
+  __pyx_t_1 = (__pyx_v_denom == 0.0);
+  if (__pyx_t_1) {
+
+    /* "vector2.pxd":32
+ *     cdef double denom = hypot(from_x, from_y) * hypot(to_x, to_y) # Multiply magnitudes
+ *     if denom == 0.0:
+ *         return 0.0             # <<<<<<<<<<<<<<
+ * 
+ *     cdef double cos_val = ((from_x * to_x) + (from_y * to_y)) / denom
+ */
+    __pyx_r = 0.0;
+    goto __pyx_L0;
+
+    /* "vector2.pxd":31
+ * cdef inline double angle2(double from_x, double from_y, double to_x, double to_y) noexcept nogil:
+ *     cdef double denom = hypot(from_x, from_y) * hypot(to_x, to_y) # Multiply magnitudes
+ *     if denom == 0.0:             # <<<<<<<<<<<<<<
+ *         return 0.0
+ * 
+ */
+  }
+
+  /* "vector2.pxd":34
+ *         return 0.0
+ * 
+ *     cdef double cos_val = ((from_x * to_x) + (from_y * to_y)) / denom             # <<<<<<<<<<<<<<
+ *     if cos_val < -1.0: # Clamp to range [-1, 1]
+ *         cos_val = -1.0
+ */
+  __pyx_v_cos_val = (((__pyx_v_from_x * __pyx_v_to_x) + (__pyx_v_from_y * __pyx_v_to_y)) / __pyx_v_denom);
+
+  /* "vector2.pxd":35
+ * 
+ *     cdef double cos_val = ((from_x * to_x) + (from_y * to_y)) / denom
+ *     if cos_val < -1.0: # Clamp to range [-1, 1]             # <<<<<<<<<<<<<<
+ *         cos_val = -1.0
+ *     elif cos_val > 1.0:
+ */
+  __pyx_t_1 = (__pyx_v_cos_val < -1.0);
+  if (__pyx_t_1) {
+
+    /* "vector2.pxd":36
+ *     cdef double cos_val = ((from_x * to_x) + (from_y * to_y)) / denom
+ *     if cos_val < -1.0: # Clamp to range [-1, 1]
+ *         cos_val = -1.0             # <<<<<<<<<<<<<<
+ *     elif cos_val > 1.0:
+ *         cos_val = 1.0
+ */
+    __pyx_v_cos_val = -1.0;
+
+    /* "vector2.pxd":35
+ * 
+ *     cdef double cos_val = ((from_x * to_x) + (from_y * to_y)) / denom
+ *     if cos_val < -1.0: # Clamp to range [-1, 1]             # <<<<<<<<<<<<<<
+ *         cos_val = -1.0
+ *     elif cos_val > 1.0:
+ */
+    goto __pyx_L4;
+  }
+
+  /* "vector2.pxd":37
+ *     if cos_val < -1.0: # Clamp to range [-1, 1]
+ *         cos_val = -1.0
+ *     elif cos_val > 1.0:             # <<<<<<<<<<<<<<
+ *         cos_val = 1.0
+ * 
+ */
+  __pyx_t_1 = (__pyx_v_cos_val > 1.0);
+  if (__pyx_t_1) {
+
+    /* "vector2.pxd":38
+ *         cos_val = -1.0
+ *     elif cos_val > 1.0:
+ *         cos_val = 1.0             # <<<<<<<<<<<<<<
+ * 
+ *     return acos(cos_val) * (180.0 / 3.14159265358979323846)
+ */
+    __pyx_v_cos_val = 1.0;
+
+    /* "vector2.pxd":37
+ *     if cos_val < -1.0: # Clamp to range [-1, 1]
+ *         cos_val = -1.0
+ *     elif cos_val > 1.0:             # <<<<<<<<<<<<<<
+ *         cos_val = 1.0
+ * 
+ */
+  }
+  __pyx_L4:;
+
+  /* "vector2.pxd":40
+ *         cos_val = 1.0
+ * 
+ *     return acos(cos_val) * (180.0 / 3.14159265358979323846)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline double signed_angle2(double from_x, double from_y, double to_x, double to_y) noexcept nogil:
+ */
+  __pyx_r = (acos(__pyx_v_cos_val) * (180.0 / 3.14159265358979323846));
+  goto __pyx_L0;
+
+  /* "vector2.pxd":29
+ * 
+ * @cython.cdivision(True)
+ * cdef inline double angle2(double from_x, double from_y, double to_x, double to_y) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef double denom = hypot(from_x, from_y) * hypot(to_x, to_y) # Multiply magnitudes
+ *     if denom == 0.0:
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "vector2.pxd":42
+ *     return acos(cos_val) * (180.0 / 3.14159265358979323846)
+ * 
+ * cdef inline double signed_angle2(double from_x, double from_y, double to_x, double to_y) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef double unsigned_angle = angle2(from_x, from_y, to_x, to_y)
+ *     if ((from_x * to_y) - (from_y * to_x)) < 0.0:
+ */
+
+static CYTHON_INLINE double __pyx_f_5nalpy_4math_13_c_extensions_7vector2_signed_angle2(double __pyx_v_from_x, double __pyx_v_from_y, double __pyx_v_to_x, double __pyx_v_to_y) {
+  double __pyx_v_unsigned_angle;
+  double __pyx_r;
+  int __pyx_t_1;
+
+  /* "vector2.pxd":43
+ * 
+ * cdef inline double signed_angle2(double from_x, double from_y, double to_x, double to_y) noexcept nogil:
+ *     cdef double unsigned_angle = angle2(from_x, from_y, to_x, to_y)             # <<<<<<<<<<<<<<
+ *     if ((from_x * to_y) - (from_y * to_x)) < 0.0:
+ *         return -unsigned_angle
+ */
+  __pyx_v_unsigned_angle = __pyx_f_5nalpy_4math_13_c_extensions_7vector2_angle2(__pyx_v_from_x, __pyx_v_from_y, __pyx_v_to_x, __pyx_v_to_y);
+
+  /* "vector2.pxd":44
+ * cdef inline double signed_angle2(double from_x, double from_y, double to_x, double to_y) noexcept nogil:
+ *     cdef double unsigned_angle = angle2(from_x, from_y, to_x, to_y)
+ *     if ((from_x * to_y) - (from_y * to_x)) < 0.0:             # <<<<<<<<<<<<<<
+ *         return -unsigned_angle
+ *     return unsigned_angle
+ */
+  __pyx_t_1 = (((__pyx_v_from_x * __pyx_v_to_y) - (__pyx_v_from_y * __pyx_v_to_x)) < 0.0);
+  if (__pyx_t_1) {
+
+    /* "vector2.pxd":45
+ *     cdef double unsigned_angle = angle2(from_x, from_y, to_x, to_y)
+ *     if ((from_x * to_y) - (from_y * to_x)) < 0.0:
+ *         return -unsigned_angle             # <<<<<<<<<<<<<<
+ *     return unsigned_angle
+ * 
+ */
+    __pyx_r = (-__pyx_v_unsigned_angle);
+    goto __pyx_L0;
+
+    /* "vector2.pxd":44
+ * cdef inline double signed_angle2(double from_x, double from_y, double to_x, double to_y) noexcept nogil:
+ *     cdef double unsigned_angle = angle2(from_x, from_y, to_x, to_y)
+ *     if ((from_x * to_y) - (from_y * to_x)) < 0.0:             # <<<<<<<<<<<<<<
+ *         return -unsigned_angle
+ *     return unsigned_angle
+ */
+  }
+
+  /* "vector2.pxd":46
+ *     if ((from_x * to_y) - (from_y * to_x)) < 0.0:
+ *         return -unsigned_angle
+ *     return unsigned_angle             # <<<<<<<<<<<<<<
+ * 
+ * @cython.cdivision(True)
+ */
+  __pyx_r = __pyx_v_unsigned_angle;
+  goto __pyx_L0;
+
+  /* "vector2.pxd":42
+ *     return acos(cos_val) * (180.0 / 3.14159265358979323846)
+ * 
+ * cdef inline double signed_angle2(double from_x, double from_y, double to_x, double to_y) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef double unsigned_angle = angle2(from_x, from_y, to_x, to_y)
+ *     if ((from_x * to_y) - (from_y * to_x)) < 0.0:
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "vector2.pxd":49
+ * 
+ * @cython.cdivision(True)
+ * cdef inline void normalize2(double x, double y, double* out) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef double magnitude = hypot(x, y)
+ *     if magnitude == 0.0:
+ */
+
+static CYTHON_INLINE void __pyx_f_5nalpy_4math_13_c_extensions_7vector2_normalize2(double __pyx_v_x, double __pyx_v_y, double *__pyx_v_out) {
+  double __pyx_v_magnitude;
+  int __pyx_t_1;
+
+  /* "vector2.pxd":50
+ * @cython.cdivision(True)
+ * cdef inline void normalize2(double x, double y, double* out) noexcept nogil:
+ *     cdef double magnitude = hypot(x, y)             # <<<<<<<<<<<<<<
+ *     if magnitude == 0.0:
+ *         out[0] = 0.0
+ */
+  __pyx_v_magnitude = hypot(__pyx_v_x, __pyx_v_y);
+
+  /* "vector2.pxd":51
+ * cdef inline void normalize2(double x, double y, double* out) noexcept nogil:
+ *     cdef double magnitude = hypot(x, y)
+ *     if magnitude == 0.0:             # <<<<<<<<<<<<<<
+ *         out[0] = 0.0
+ *         out[1] = 0.0
+ */
+  __pyx_t_1 = (__pyx_v_magnitude == 0.0);
+  if (__pyx_t_1) {
+
+    /* "vector2.pxd":52
+ *     cdef double magnitude = hypot(x, y)
+ *     if magnitude == 0.0:
+ *         out[0] = 0.0             # <<<<<<<<<<<<<<
+ *         out[1] = 0.0
+ *     else:
+ */
+    (__pyx_v_out[0]) = 0.0;
+
+    /* "vector2.pxd":53
+ *     if magnitude == 0.0:
+ *         out[0] = 0.0
+ *         out[1] = 0.0             # <<<<<<<<<<<<<<
+ *     else:
+ *         out[0] = x / magnitude
+ */
+    (__pyx_v_out[1]) = 0.0;
+
+    /* "vector2.pxd":51
+ * cdef inline void normalize2(double x, double y, double* out) noexcept nogil:
+ *     cdef double magnitude = hypot(x, y)
+ *     if magnitude == 0.0:             # <<<<<<<<<<<<<<
+ *         out[0] = 0.0
+ *         out[1] = 0.0
+ */
+    goto __pyx_L3;
+  }
+
+  /* "vector2.pxd":55
+ *         out[1] = 0.0
+ *     else:
+ *         out[0] = x / magnitude             # <<<<<<<<<<<<<<
+ *         out[1] = y / magnitude
+ * 
+ */
+  /*else*/ {
+    (__pyx_v_out[0]) = (__pyx_v_x / __pyx_v_magnitude);
+
+    /* "vector2.pxd":56
+ *     else:
+ *         out[0] = x / magnitude
+ *         out[1] = y / magnitude             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void lerp_unclamped2(double ax, double ay, double bx, double by, double t, double* out) noexcept nogil:
+ */
+    (__pyx_v_out[1]) = (__pyx_v_y / __pyx_v_magnitude);
+  }
+  __pyx_L3:;
+
+  /* "vector2.pxd":49
+ * 
+ * @cython.cdivision(True)
+ * cdef inline void normalize2(double x, double y, double* out) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef double magnitude = hypot(x, y)
+ *     if magnitude == 0.0:
+ */
+
+  /* function exit code */
+}
+
+/* "vector2.pxd":58
+ *         out[1] = y / magnitude
+ * 
+ * cdef inline void lerp_unclamped2(double ax, double ay, double bx, double by, double t, double* out) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     out[0] = ax + ((bx - ax) * t)
+ *     out[1] = ay + ((by - ay) * t)
+ */
+
+static CYTHON_INLINE void __pyx_f_5nalpy_4math_13_c_extensions_7vector2_lerp_unclamped2(double __pyx_v_ax, double __pyx_v_ay, double __pyx_v_bx, double __pyx_v_by, double __pyx_v_t, double *__pyx_v_out) {
+
+  /* "vector2.pxd":59
+ * 
+ * cdef inline void lerp_unclamped2(double ax, double ay, double bx, double by, double t, double* out) noexcept nogil:
+ *     out[0] = ax + ((bx - ax) * t)             # <<<<<<<<<<<<<<
+ *     out[1] = ay + ((by - ay) * t)
+ * 
+ */
+  (__pyx_v_out[0]) = (__pyx_v_ax + ((__pyx_v_bx - __pyx_v_ax) * __pyx_v_t));
+
+  /* "vector2.pxd":60
+ * cdef inline void lerp_unclamped2(double ax, double ay, double bx, double by, double t, double* out) noexcept nogil:
+ *     out[0] = ax + ((bx - ax) * t)
+ *     out[1] = ay + ((by - ay) * t)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void lerp2(double ax, double ay, double bx, double by, double t, double* out) noexcept nogil:
+ */
+  (__pyx_v_out[1]) = (__pyx_v_ay + ((__pyx_v_by - __pyx_v_ay) * __pyx_v_t));
+
+  /* "vector2.pxd":58
+ *         out[1] = y / magnitude
+ * 
+ * cdef inline void lerp_unclamped2(double ax, double ay, double bx, double by, double t, double* out) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     out[0] = ax + ((bx - ax) * t)
+ *     out[1] = ay + ((by - ay) * t)
+ */
+
+  /* function exit code */
+}
+
+/* "vector2.pxd":62
+ *     out[1] = ay + ((by - ay) * t)
+ * 
+ * cdef inline void lerp2(double ax, double ay, double bx, double by, double t, double* out) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     if t < 0.0: # clamp01 substitute
+ *         t = 0.0
+ */
+
+static CYTHON_INLINE void __pyx_f_5nalpy_4math_13_c_extensions_7vector2_lerp2(double __pyx_v_ax, double __pyx_v_ay, double __pyx_v_bx, double __pyx_v_by, double __pyx_v_t, double *__pyx_v_out) {
+  int __pyx_t_1;
+
+  /* "vector2.pxd":63
+ * 
+ * cdef inline void lerp2(double ax, double ay, double bx, double by, double t, double* out) noexcept nogil:
+ *     if t < 0.0: # clamp01 substitute             # <<<<<<<<<<<<<<
+ *         t = 0.0
+ *     elif t > 1.0:
+ */
+  __pyx_t_1 = (__pyx_v_t < 0.0);
+  if (__pyx_t_1) {
+
+    /* "vector2.pxd":64
+ * cdef inline void lerp2(double ax, double ay, double bx, double by, double t, double* out) noexcept nogil:
+ *     if t < 0.0: # clamp01 substitute
+ *         t = 0.0             # <<<<<<<<<<<<<<
+ *     elif t > 1.0:
+ *         t = 1.0
+ */
+    __pyx_v_t = 0.0;
+
+    /* "vector2.pxd":63
+ * 
+ * cdef inline void lerp2(double ax, double ay, double bx, double by, double t, double* out) noexcept nogil:
+ *     if t < 0.0: # clamp01 substitute             # <<<<<<<<<<<<<<
+ *         t = 0.0
+ *     elif t > 1.0:
+ */
+    goto __pyx_L3;
+  }
+
+  /* "vector2.pxd":65
+ *     if t < 0.0: # clamp01 substitute
+ *         t = 0.0
+ *     elif t > 1.0:             # <<<<<<<<<<<<<<
+ *         t = 1.0
+ *     lerp_unclamped2(ax, ay, bx, by, t, out)
+ */
+  __pyx_t_1 = (__pyx_v_t > 1.0);
+  if (__pyx_t_1) {
+
+    /* "vector2.pxd":66
+ *         t = 0.0
+ *     elif t > 1.0:
+ *         t = 1.0             # <<<<<<<<<<<<<<
+ *     lerp_unclamped2(ax, ay, bx, by, t, out)
+ * 
+ */
+    __pyx_v_t = 1.0;
+
+    /* "vector2.pxd":65
+ *     if t < 0.0: # clamp01 substitute
+ *         t = 0.0
+ *     elif t > 1.0:             # <<<<<<<<<<<<<<
+ *         t = 1.0
+ *     lerp_unclamped2(ax, ay, bx, by, t, out)
+ */
+  }
+  __pyx_L3:;
+
+  /* "vector2.pxd":67
+ *     elif t > 1.0:
+ *         t = 1.0
+ *     lerp_unclamped2(ax, ay, bx, by, t, out)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline bint move_towards2(double current_x, double current_y, double target_x, double target_y, double max_distance_delta, double* out) noexcept nogil:
+ */
+  __pyx_f_5nalpy_4math_13_c_extensions_7vector2_lerp_unclamped2(__pyx_v_ax, __pyx_v_ay, __pyx_v_bx, __pyx_v_by, __pyx_v_t, __pyx_v_out);
+
+  /* "vector2.pxd":62
+ *     out[1] = ay + ((by - ay) * t)
+ * 
+ * cdef inline void lerp2(double ax, double ay, double bx, double by, double t, double* out) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     if t < 0.0: # clamp01 substitute
+ *         t = 0.0
+ */
+
+  /* function exit code */
+}
+
+/* "vector2.pxd":69
+ *     lerp_unclamped2(ax, ay, bx, by, t, out)
+ * 
+ * cdef inline bint move_towards2(double current_x, double current_y, double target_x, double target_y, double max_distance_delta, double* out) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     # Returns True if the target was reached, out holds the target in that case.
+ *     return move_towards2_dist(current_x, current_y, target_x, target_y, hypot(target_x - current_x, target_y - current_y), max_distance_delta, out)
+ */
+
+static CYTHON_INLINE int __pyx_f_5nalpy_4math_13_c_extensions_7vector2_move_towards2(double __pyx_v_current_x, double __pyx_v_current_y, double __pyx_v_target_x, double __pyx_v_target_y, double __pyx_v_max_distance_delta, double *__pyx_v_out) {
+  int __pyx_r;
+
+  /* "vector2.pxd":71
+ * cdef inline bint move_towards2(double current_x, double current_y, double target_x, double target_y, double max_distance_delta, double* out) noexcept nogil:
+ *     # Returns True if the target was reached, out holds the target in that case.
+ *     return move_towards2_dist(current_x, current_y, target_x, target_y, hypot(target_x - current_x, target_y - current_y), max_distance_delta, out)             # <<<<<<<<<<<<<<
+ * 
+ * @cython.cdivision(True)
+ */
+  __pyx_r = __pyx_f_5nalpy_4math_13_c_extensions_7vector2_move_towards2_dist(__pyx_v_current_x, __pyx_v_current_y, __pyx_v_target_x, __pyx_v_target_y, hypot((__pyx_v_target_x - __pyx_v_current_x), (__pyx_v_target_y - __pyx_v_current_y)), __pyx_v_max_distance_delta, __pyx_v_out);
+  goto __pyx_L0;
+
+  /* "vector2.pxd":69
+ *     lerp_unclamped2(ax, ay, bx, by, t, out)
+ * 
+ * cdef inline bint move_towards2(double current_x, double current_y, double target_x, double target_y, double max_distance_delta, double* out) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     # Returns True if the target was reached, out holds the target in that case.
+ *     return move_towards2_dist(current_x, current_y, target_x, target_y, hypot(target_x - current_x, target_y - current_y), max_distance_delta, out)
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "vector2.pxd":74
+ * 
+ * @cython.cdivision(True)
+ * cdef inline bint move_towards2_dist(double current_x, double current_y, double target_x, double target_y, double dist, double max_distance_delta, double* out) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     # move_towards2 with the distance between current and target computed by the caller, shared with the deterministic version.
+ *     cdef double to_vector_x = target_x - current_x
+ */
+
+static CYTHON_INLINE int __pyx_f_5nalpy_4math_13_c_extensions_7vector2_move_towards2_dist(double __pyx_v_current_x, double __pyx_v_current_y, double __pyx_v_target_x, double __pyx_v_target_y, double __pyx_v_dist, double __pyx_v_max_distance_delta, double *__pyx_v_out) {
+  double __pyx_v_to_vector_x;
+  double __pyx_v_to_vector_y;
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+
+  /* "vector2.pxd":76
+ * cdef inline bint move_towards2_dist(double current_x, double current_y, double target_x, double target_y, double dist, double max_distance_delta, double* out) noexcept nogil:
+ *     # move_towards2 with the distance between current and target computed by the caller, shared with the deterministic version.
+ *     cdef double to_vector_x = target_x - current_x             # <<<<<<<<<<<<<<
+ *     cdef double to_vector_y = target_y - current_y
+ * 
+ */
+  __pyx_v_to_vector_x = (__pyx_v_target_x - __pyx_v_current_x);
+
+  /* "vector2.pxd":77
+ *     # move_towards2 with the distance between current and target computed by the caller, shared with the deterministic version.
+ *     cdef double to_vector_x = target_x - current_x
+ *     cdef double to_vector_y = target_y - current_y             # <<<<<<<<<<<<<<
+ * 
+ *     if dist == 0 or (max_distance_delta >= 0 and dist <= max_distance_delta):
+ */
+  __pyx_v_to_vector_y = (__pyx_v_target_y - __pyx_v_current_y);
+
+  /* "vector2.pxd":79
+ *     cdef double to_vector_y = target_y - current_y
+ * 
+ *     if dist == 0 or (max_distance_delta >= 0 and dist <= max_distance_delta):             # <<<<<<<<<<<<<<
+ *         out[0] = target_x
+ *         out[1] = target_y
+ */
+  __pyx_t_2 = (__pyx_v_dist == 0.0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = (__pyx_v_max_distance_delta >= 0.0);
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = (__pyx_v_dist <= __pyx_v_max_distance_delta);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "vector2.pxd":80
+ * 
+ *     if dist == 0 or (max_distance_delta >= 0 and dist <= max_distance_delta):
+ *         out[0] = target_x             # <<<<<<<<<<<<<<
+ *         out[1] = target_y
+ *         return True
+ */
+    (__pyx_v_out[0]) = __pyx_v_target_x;
+
+    /* "vector2.pxd":81
+ *     if dist == 0 or (max_distance_delta >= 0 and dist <= max_distance_delta):
+ *         out[0] = target_x
+ *         out[1] = target_y             # <<<<<<<<<<<<<<
+ *         return True
+ * 
+ */
+    (__pyx_v_out[1]) = __pyx_v_target_y;
+
+    /* "vector2.pxd":82
+ *         out[0] = target_x
+ *         out[1] = target_y
+ *         return True             # <<<<<<<<<<<<<<
+ * 
+ *     out[0] = current_x + to_vector_x / dist * max_distance_delta
+ */
+    __pyx_r = 1;
+    goto __pyx_L0;
+
+    /* "vector2.pxd":79
+ *     cdef double to_vector_y = target_y - current_y
+ * 
+ *     if dist == 0 or (max_distance_delta >= 0 and dist <= max_distance_delta):             # <<<<<<<<<<<<<<
+ *         out[0] = target_x
+ *         out[1] = target_y
+ */
+  }
+
+  /* "vector2.pxd":84
+ *         return True
+ * 
+ *     out[0] = current_x + to_vector_x / dist * max_distance_delta             # <<<<<<<<<<<<<<
+ *     out[1] = current_y + to_vector_y / dist * max_distance_delta
+ *     return False
+ */
+  (__pyx_v_out[0]) = (__pyx_v_current_x + ((__pyx_v_to_vector_x / __pyx_v_dist) * __pyx_v_max_distance_delta));
+
+  /* "vector2.pxd":85
+ * 
+ *     out[0] = current_x + to_vector_x / dist * max_distance_delta
+ *     out[1] = current_y + to_vector_y / dist * max_distance_delta             # <<<<<<<<<<<<<<
+ *     return False
+ * 
+ */
+  (__pyx_v_out[1]) = (__pyx_v_current_y + ((__pyx_v_to_vector_y / __pyx_v_dist) * __pyx_v_max_distance_delta));
+
+  /* "vector2.pxd":86
+ *     out[0] = current_x + to_vector_x / dist * max_distance_delta
+ *     out[1] = current_y + to_vector_y / dist * max_distance_delta
+ *     return False             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void perpendicular2(double x, double y, double* out) noexcept nogil:
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "vector2.pxd":74
+ * 
+ * @cython.cdivision(True)
+ * cdef inline bint move_towards2_dist(double current_x, double current_y, double target_x, double target_y, double dist, double max_distance_delta, double* out) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     # move_towards2 with the distance between current and target computed by the caller, shared with the deterministic version.
+ *     cdef double to_vector_x = target_x - current_x
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "vector2.pxd":88
+ *     return False
+ * 
+ * cdef inline void perpendicular2(double x, double y, double* out) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     out[0] = -y
+ *     out[1] = x
+ */
+
+static CYTHON_INLINE void __pyx_f_5nalpy_4math_13_c_extensions_7vector2_perpendicular2(double __pyx_v_x, double __pyx_v_y, double *__pyx_v_out) {
+
+  /* "vector2.pxd":89
+ * 
+ * cdef inline void perpendicular2(double x, double y, double* out) noexcept nogil:
+ *     out[0] = -y             # <<<<<<<<<<<<<<
+ *     out[1] = x
+ * 
+ */
+  (__pyx_v_out[0]) = (-__pyx_v_y);
+
+  /* "vector2.pxd":90
+ * cdef inline void perpendicular2(double x, double y, double* out) noexcept nogil:
+ *     out[0] = -y
+ *     out[1] = x             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void reflect2(double x, double y, double normal_x, double normal_y, double* out) noexcept nogil:
+ */
+  (__pyx_v_out[1]) = __pyx_v_x;
+
+  /* "vector2.pxd":88
+ *     return False
+ * 
+ * cdef inline void perpendicular2(double x, double y, double* out) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     out[0] = -y
+ *     out[1] = x
+ */
+
+  /* function exit code */
+}
+
+/* "vector2.pxd":92
+ *     out[1] = x
+ * 
+ * cdef inline void reflect2(double x, double y, double normal_x, double normal_y, double* out) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef double factor = -2.0 * ((normal_x * x) + (normal_y * y))
+ *     out[0] = factor * normal_x + x
+ */
+
+static CYTHON_INLINE void __pyx_f_5nalpy_4math_13_c_extensions_7vector2_reflect2(double __pyx_v_x, double __pyx_v_y, double __pyx_v_normal_x, double __pyx_v_normal_y, double *__pyx_v_out) {
+  double __pyx_v_factor;
+
+  /* "vector2.pxd":93
+ * 
+ * cdef inline void reflect2(double x, double y, double normal_x, double normal_y, double* out) noexcept nogil:
+ *     cdef double factor = -2.0 * ((normal_x * x) + (normal_y * y))             # <<<<<<<<<<<<<<
+ *     out[0] = factor * normal_x + x
+ *     out[1] = factor * normal_y + y
+ */
+  __pyx_v_factor = (-2.0 * ((__pyx_v_normal_x * __pyx_v_x) + (__pyx_v_normal_y * __pyx_v_y)));
+
+  /* "vector2.pxd":94
+ * cdef inline void reflect2(double x, double y, double normal_x, double normal_y, double* out) noexcept nogil:
+ *     cdef double factor = -2.0 * ((normal_x * x) + (normal_y * y))
+ *     out[0] = factor * normal_x + x             # <<<<<<<<<<<<<<
+ *     out[1] = factor * normal_y + y
+ * 
+ */
+  (__pyx_v_out[0]) = ((__pyx_v_factor * __pyx_v_normal_x) + __pyx_v_x);
+
+  /* "vector2.pxd":95
+ *     cdef double factor = -2.0 * ((normal_x * x) + (normal_y * y))
+ *     out[0] = factor * normal_x + x
+ *     out[1] = factor * normal_y + y             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void min2(double ax, double ay, double bx, double by, double* out) noexcept nogil:
+ */
+  (__pyx_v_out[1]) = ((__pyx_v_factor * __pyx_v_normal_y) + __pyx_v_y);
+
+  /* "vector2.pxd":92
+ *     out[1] = x
+ * 
+ * cdef inline void reflect2(double x, double y, double normal_x, double normal_y, double* out) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef double factor = -2.0 * ((normal_x * x) + (normal_y * y))
+ *     out[0] = factor * normal_x + x
+ */
+
+  /* function exit code */
+}
+
+/* "vector2.pxd":97
+ *     out[1] = factor * normal_y + y
+ * 
+ * cdef inline void min2(double ax, double ay, double bx, double by, double* out) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     out[0] = min(ax, bx)
+ *     out[1] = min(ay, by)
+ */
+
+static CYTHON_INLINE void __pyx_f_5nalpy_4math_13_c_extensions_7vector2_min2(double __pyx_v_ax, double __pyx_v_ay, double __pyx_v_bx, double __pyx_v_by, double *__pyx_v_out) {
+  double __pyx_t_1;
+  double __pyx_t_2;
+  double __pyx_t_3;
+  int __pyx_t_4;
+
+  /* "vector2.pxd":98
+ * 
+ * cdef inline void min2(double ax, double ay, double bx, double by, double* out) noexcept nogil:
+ *     out[0] = min(ax, bx)             # <<<<<<<<<<<<<<
+ *     out[1] = min(ay, by)
+ * 
+ */
+  __pyx_t_1 = __pyx_v_bx;
+  __pyx_t_2 = __pyx_v_ax;
+  __pyx_t_4 = (__pyx_t_1 < __pyx_t_2);
+  if (__pyx_t_4) {
+    __pyx_t_3 = __pyx_t_1;
+  } else {
+    __pyx_t_3 = __pyx_t_2;
+  }
+  (__pyx_v_out[0]) = __pyx_t_3;
+
+  /* "vector2.pxd":99
+ * cdef inline void min2(double ax, double ay, double bx, double by, double* out) noexcept nogil:
+ *     out[0] = min(ax, bx)
+ *     out[1] = min(ay, by)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void max2(double ax, double ay, double bx, double by, double* out) noexcept nogil:
+ */
+  __pyx_t_3 = __pyx_v_by;
+  __pyx_t_1 = __pyx_v_ay;
+  __pyx_t_4 = (__pyx_t_3 < __pyx_t_1);
+  if (__pyx_t_4) {
+    __pyx_t_2 = __pyx_t_3;
+  } else {
+    __pyx_t_2 = __pyx_t_1;
+  }
+  (__pyx_v_out[1]) = __pyx_t_2;
+
+  /* "vector2.pxd":97
+ *     out[1] = factor * normal_y + y
+ * 
+ * cdef inline void min2(double ax, double ay, double bx, double by, double* out) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     out[0] = min(ax, bx)
+ *     out[1] = min(ay, by)
+ */
+
+  /* function exit code */
+}
+
+/* "vector2.pxd":101
+ *     out[1] = min(ay, by)
+ * 
+ * cdef inline void max2(double ax, double ay, double bx, double by, double* out) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     out[0] = max(ax, bx)
+ *     out[1] = max(ay, by)
+ */
+
+static CYTHON_INLINE void __pyx_f_5nalpy_4math_13_c_extensions_7vector2_max2(double __pyx_v_ax, double __pyx_v_ay, double __pyx_v_bx, double __pyx_v_by, double *__pyx_v_out) {
+  double __pyx_t_1;
+  double __pyx_t_2;
+  double __pyx_t_3;
+  int __pyx_t_4;
+
+  /* "vector2.pxd":102
+ * 
+ * cdef inline void max2(double ax, double ay, double bx, double by, double* out) noexcept nogil:
+ *     out[0] = max(ax, bx)             # <<<<<<<<<<<<<<
+ *     out[1] = max(ay, by)
+ * 
+ */
+  __pyx_t_1 = __pyx_v_bx;
+  __pyx_t_2 = __pyx_v_ax;
+  __pyx_t_4 = (__pyx_t_1 > __pyx_t_2);
+  if (__pyx_t_4) {
+    __pyx_t_3 = __pyx_t_1;
+  } else {
+    __pyx_t_3 = __pyx_t_2;
+  }
+  (__pyx_v_out[0]) = __pyx_t_3;
+
+  /* "vector2.pxd":103
+ * cdef inline void max2(double ax, double ay, double bx, double by, double* out) noexcept nogil:
+ *     out[0] = max(ax, bx)
+ *     out[1] = max(ay, by)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void smooth_damp2(double current_x, double current_y, double target_x, double target_y, double* velocity, double smooth_time, double delta_time, double max_speed, double* out) noexcept nogil:
+ */
+  __pyx_t_3 = __pyx_v_by;
+  __pyx_t_1 = __pyx_v_ay;
+  __pyx_t_4 = (__pyx_t_3 > __pyx_t_1);
+  if (__pyx_t_4) {
+    __pyx_t_2 = __pyx_t_3;
+  } else {
+    __pyx_t_2 = __pyx_t_1;
+  }
+  (__pyx_v_out[1]) = __pyx_t_2;
+
+  /* "vector2.pxd":101
+ *     out[1] = min(ay, by)
+ * 
+ * cdef inline void max2(double ax, double ay, double bx, double by, double* out) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     out[0] = max(ax, bx)
+ *     out[1] = max(ay, by)
+ */
+
+  /* function exit code */
+}
+
+/* "vector2.pxd":105
+ *     out[1] = max(ay, by)
+ * 
+ * cdef inline void smooth_damp2(double current_x, double current_y, double target_x, double target_y, double* velocity, double smooth_time, double delta_time, double max_speed, double* out) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     # Shared by Vector2.smooth_damp and Vector2Array.smooth_damp_many so that both produce the exact same results.
+ *     # Writes the new position into out and the new velocity into velocity.
+ */
+
+static CYTHON_INLINE void __pyx_f_5nalpy_4math_13_c_extensions_7vector2_smooth_damp2(double __pyx_v_current_x, double __pyx_v_current_y, double __pyx_v_target_x, double __pyx_v_target_y, double *__pyx_v_velocity, double __pyx_v_smooth_time, double __pyx_v_delta_time, double __pyx_v_max_speed, double *__pyx_v_out) {
+
+  /* "vector2.pxd":108
+ *     # Shared by Vector2.smooth_damp and Vector2Array.smooth_damp_many so that both produce the exact same results.
+ *     # Writes the new position into out and the new velocity into velocity.
+ *     smooth_damp2_dist(current_x, current_y, target_x, target_y, hypot(current_x - target_x, current_y - target_y), velocity, smooth_time, delta_time, max_speed, out)             # <<<<<<<<<<<<<<
+ * 
+ * @cython.cdivision(True)
+ */
+  __pyx_f_5nalpy_4math_13_c_extensions_7vector2_smooth_damp2_dist(__pyx_v_current_x, __pyx_v_current_y, __pyx_v_target_x, __pyx_v_target_y, hypot((__pyx_v_current_x - __pyx_v_target_x), (__pyx_v_current_y - __pyx_v_target_y)), __pyx_v_velocity, __pyx_v_smooth_time, __pyx_v_delta_time, __pyx_v_max_speed, __pyx_v_out);
+
+  /* "vector2.pxd":105
+ *     out[1] = max(ay, by)
+ * 
+ * cdef inline void smooth_damp2(double current_x, double current_y, double target_x, double target_y, double* velocity, double smooth_time, double delta_time, double max_speed, double* out) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     # Shared by Vector2.smooth_damp and Vector2Array.smooth_damp_many so that both produce the exact same results.
+ *     # Writes the new position into out and the new velocity into velocity.
+ */
+
+  /* function exit code */
+}
+
+/* "vector2.pxd":111
+ * 
+ * @cython.cdivision(True)
+ * cdef inline void smooth_damp2_dist(double current_x, double current_y, double target_x, double target_y, double dist, double* velocity, double smooth_time, double delta_time, double max_speed, double* out) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     # smooth_damp2 with the distance between current and target computed by the caller, shared with the deterministic version.
+ *     # Heavy inspiration from https://github.com/Unity-Technologies/UnityCsReference/blob/2023.2/Runtime/Export/Math/Vector2.cs#L289
+ */
+
+static CYTHON_INLINE void __pyx_f_5nalpy_4math_13_c_extensions_7vector2_smooth_damp2_dist(double __pyx_v_current_x, double __pyx_v_current_y, double __pyx_v_target_x, double __pyx_v_target_y, double __pyx_v_dist, double *__pyx_v_velocity, double __pyx_v_smooth_time, double __pyx_v_delta_time, double __pyx_v_max_speed, double *__pyx_v_out) {
+  double __pyx_v_omega;
+  double __pyx_v_x;
+  double __pyx_v_exp;
+  double __pyx_v_change_x;
+  double __pyx_v_change_y;
+  double __pyx_v_original_to_x;
+  double __pyx_v_original_to_y;
+  double __pyx_v_max_change;
+  double __pyx_v_temp_x;
+  double __pyx_v_temp_y;
+  double __pyx_v_velocity_x;
+  double __pyx_v_velocity_y;
+  double __pyx_v_output_x;
+  double __pyx_v_output_y;
+  double __pyx_v_orig_minus_current_x;
+  double __pyx_v_orig_minus_current_y;
+  double __pyx_v_out_minus_orig_x;
+  double __pyx_v_out_minus_orig_y;
+  double __pyx_t_1;
+  double __pyx_t_2;
+  double __pyx_t_3;
+  int __pyx_t_4;
+
+  /* "vector2.pxd":115
+ *     # Heavy inspiration from https://github.com/Unity-Technologies/UnityCsReference/blob/2023.2/Runtime/Export/Math/Vector2.cs#L289
+ * 
+ *     smooth_time = max(0.0001, smooth_time)             # <<<<<<<<<<<<<<
+ *     cdef double omega = 2.0 / smooth_time
+ * 
+ */
+  __pyx_t_1 = __pyx_v_smooth_time;
+  __pyx_t_2 = 0.0001;
+  __pyx_t_4 = (__pyx_t_1 > __pyx_t_2);
+  if (__pyx_t_4) {
+    __pyx_t_3 = __pyx_t_1;
+  } else {
+    __pyx_t_3 = __pyx_t_2;
+  }
+  __pyx_v_smooth_time = __pyx_t_3;
+
+  /* "vector2.pxd":116
+ * 
+ *     smooth_time = max(0.0001, smooth_time)
+ *     cdef double omega = 2.0 / smooth_time             # <<<<<<<<<<<<<<
+ * 
+ *     cdef double x = omega * delta_time
+ */
+  __pyx_v_omega = (2.0 / __pyx_v_smooth_time);
+
+  /* "vector2.pxd":118
+ *     cdef double omega = 2.0 / smooth_time
+ * 
+ *     cdef double x = omega * delta_time             # <<<<<<<<<<<<<<
+ *     cdef double exp = 1.0 / (1.0 + x + 0.48 * x * x + 0.235 * x * x * x)
+ * 
+ */
+  __pyx_v_x = (__pyx_v_omega * __pyx_v_delta_time);
+
+  /* "vector2.pxd":119
+ * 
+ *     cdef double x = omega * delta_time
+ *     cdef double exp = 1.0 / (1.0 + x + 0.48 * x * x + 0.235 * x * x * x)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef double change_x = current_x - target_x
+ */
+  __pyx_v_exp = (1.0 / (((1.0 + __pyx_v_x) + ((0.48 * __pyx_v_x) * __pyx_v_x)) + (((0.235 * __pyx_v_x) * __pyx_v_x) * __pyx_v_x)));
+
+  /* "vector2.pxd":121
+ *     cdef double exp = 1.0 / (1.0 + x + 0.48 * x * x + 0.235 * x * x * x)
+ * 
+ *     cdef double change_x = current_x - target_x             # <<<<<<<<<<<<<<
+ *     cdef double change_y = current_y - target_y
+ *     cdef double original_to_x = target_x
+ */
+  __pyx_v_change_x = (__pyx_v_current_x - __pyx_v_target_x);
+
+  /* "vector2.pxd":122
+ * 
+ *     cdef double change_x = current_x - target_x
+ *     cdef double change_y = current_y - target_y             # <<<<<<<<<<<<<<
+ *     cdef double original_to_x = target_x
+ *     cdef double original_to_y = target_y
+ */
+  __pyx_v_change_y = (__pyx_v_current_y - __pyx_v_target_y);
+
+  /* "vector2.pxd":123
+ *     cdef double change_x = current_x - target_x
+ *     cdef double change_y = current_y - target_y
+ *     cdef double original_to_x = target_x             # <<<<<<<<<<<<<<
+ *     cdef double original_to_y = target_y
+ * 
+ */
+  __pyx_v_original_to_x = __pyx_v_target_x;
+
+  /* "vector2.pxd":124
+ *     cdef double change_y = current_y - target_y
+ *     cdef double original_to_x = target_x
+ *     cdef double original_to_y = target_y             # <<<<<<<<<<<<<<
+ * 
+ *     cdef double max_change = max_speed * smooth_time
+ */
+  __pyx_v_original_to_y = __pyx_v_target_y;
+
+  /* "vector2.pxd":126
+ *     cdef double original_to_y = target_y
+ * 
+ *     cdef double max_change = max_speed * smooth_time             # <<<<<<<<<<<<<<
+ *     if dist > max_change:
+ *         change_x = change_x / dist * max_change
+ */
+  __pyx_v_max_change = (__pyx_v_max_speed * __pyx_v_smooth_time);
+
+  /* "vector2.pxd":127
+ * 
+ *     cdef double max_change = max_speed * smooth_time
+ *     if dist > max_change:             # <<<<<<<<<<<<<<
+ *         change_x = change_x / dist * max_change
+ *         change_y = change_y / dist * max_change
+ */
+  __pyx_t_4 = (__pyx_v_dist > __pyx_v_max_change);
+  if (__pyx_t_4) {
+
+    /* "vector2.pxd":128
+ *     cdef double max_change = max_speed * smooth_time
+ *     if dist > max_change:
+ *         change_x = change_x / dist * max_change             # <<<<<<<<<<<<<<
+ *         change_y = change_y / dist * max_change
+ * 
+ */
+    __pyx_v_change_x = ((__pyx_v_change_x / __pyx_v_dist) * __pyx_v_max_change);
+
+    /* "vector2.pxd":129
+ *     if dist > max_change:
+ *         change_x = change_x / dist * max_change
+ *         change_y = change_y / dist * max_change             # <<<<<<<<<<<<<<
+ * 
+ *     target_x = current_x - change_x
+ */
+    __pyx_v_change_y = ((__pyx_v_change_y / __pyx_v_dist) * __pyx_v_max_change);
+
+    /* "vector2.pxd":127
+ * 
+ *     cdef double max_change = max_speed * smooth_time
+ *     if dist > max_change:             # <<<<<<<<<<<<<<
+ *         change_x = change_x / dist * max_change
+ *         change_y = change_y / dist * max_change
+ */
+  }
+
+  /* "vector2.pxd":131
+ *         change_y = change_y / dist * max_change
+ * 
+ *     target_x = current_x - change_x             # <<<<<<<<<<<<<<
+ *     target_y = current_y - change_y
+ * 
+ */
+  __pyx_v_target_x = (__pyx_v_current_x - __pyx_v_change_x);
+
+  /* "vector2.pxd":132
+ * 
+ *     target_x = current_x - change_x
+ *     target_y = current_y - change_y             # <<<<<<<<<<<<<<
+ * 
+ *     cdef double temp_x = (velocity[0] + omega * change_x) * delta_time
+ */
+  __pyx_v_target_y = (__pyx_v_current_y - __pyx_v_change_y);
+
+  /* "vector2.pxd":134
+ *     target_y = current_y - change_y
+ * 
+ *     cdef double temp_x = (velocity[0] + omega * change_x) * delta_time             # <<<<<<<<<<<<<<
+ *     cdef double temp_y = (velocity[1] + omega * change_y) * delta_time
+ * 
+ */
+  __pyx_v_temp_x = (((__pyx_v_velocity[0]) + (__pyx_v_omega * __pyx_v_change_x)) * __pyx_v_delta_time);
+
+  /* "vector2.pxd":135
+ * 
+ *     cdef double temp_x = (velocity[0] + omega * change_x) * delta_time
+ *     cdef double temp_y = (velocity[1] + omega * change_y) * delta_time             # <<<<<<<<<<<<<<
+ * 
+ *     cdef double velocity_x = (velocity[0] - omega * temp_x) * exp
+ */
+  __pyx_v_temp_y = (((__pyx_v_velocity[1]) + (__pyx_v_omega * __pyx_v_change_y)) * __pyx_v_delta_time);
+
+  /* "vector2.pxd":137
+ *     cdef double temp_y = (velocity[1] + omega * change_y) * delta_time
+ * 
+ *     cdef double velocity_x = (velocity[0] - omega * temp_x) * exp             # <<<<<<<<<<<<<<
+ *     cdef double velocity_y = (velocity[1] - omega * temp_y) * exp
+ * 
+ */
+  __pyx_v_velocity_x = (((__pyx_v_velocity[0]) - (__pyx_v_omega * __pyx_v_temp_x)) * __pyx_v_exp);
+
+  /* "vector2.pxd":138
+ * 
+ *     cdef double velocity_x = (velocity[0] - omega * temp_x) * exp
+ *     cdef double velocity_y = (velocity[1] - omega * temp_y) * exp             # <<<<<<<<<<<<<<
+ * 
+ *     cdef double output_x = target_x + (change_x + temp_x) * exp
+ */
+  __pyx_v_velocity_y = (((__pyx_v_velocity[1]) - (__pyx_v_omega * __pyx_v_temp_y)) * __pyx_v_exp);
+
+  /* "vector2.pxd":140
+ *     cdef double velocity_y = (velocity[1] - omega * temp_y) * exp
+ * 
+ *     cdef double output_x = target_x + (change_x + temp_x) * exp             # <<<<<<<<<<<<<<
+ *     cdef double output_y = target_y + (change_y + temp_y) * exp
+ * 
+ */
+  __pyx_v_output_x = (__pyx_v_target_x + ((__pyx_v_change_x + __pyx_v_temp_x) * __pyx_v_exp));
+
+  /* "vector2.pxd":141
+ * 
+ *     cdef double output_x = target_x + (change_x + temp_x) * exp
+ *     cdef double output_y = target_y + (change_y + temp_y) * exp             # <<<<<<<<<<<<<<
+ * 
+ *     cdef double orig_minus_current_x = original_to_x - current_x
+ */
+  __pyx_v_output_y = (__pyx_v_target_y + ((__pyx_v_change_y + __pyx_v_temp_y) * __pyx_v_exp));
+
+  /* "vector2.pxd":143
+ *     cdef double output_y = target_y + (change_y + temp_y) * exp
+ * 
+ *     cdef double orig_minus_current_x = original_to_x - current_x             # <<<<<<<<<<<<<<
+ *     cdef double orig_minus_current_y = original_to_y - current_y
+ *     cdef double out_minus_orig_x = output_x - original_to_x
+ */
+  __pyx_v_orig_minus_current_x = (__pyx_v_original_to_x - __pyx_v_current_x);
+
+  /* "vector2.pxd":144
+ * 
+ *     cdef double orig_minus_current_x = original_to_x - current_x
+ *     cdef double orig_minus_current_y = original_to_y - current_y             # <<<<<<<<<<<<<<
+ *     cdef double out_minus_orig_x = output_x - original_to_x
+ *     cdef double out_minus_orig_y = output_y - original_to_y
+ */
+  __pyx_v_orig_minus_current_y = (__pyx_v_original_to_y - __pyx_v_current_y);
+
+  /* "vector2.pxd":145
+ *     cdef double orig_minus_current_x = original_to_x - current_x
+ *     cdef double orig_minus_current_y = original_to_y - current_y
+ *     cdef double out_minus_orig_x = output_x - original_to_x             # <<<<<<<<<<<<<<
+ *     cdef double out_minus_orig_y = output_y - original_to_y
+ * 
+ */
+  __pyx_v_out_minus_orig_x = (__pyx_v_output_x - __pyx_v_original_to_x);
+
+  /* "vector2.pxd":146
+ *     cdef double orig_minus_current_y = original_to_y - current_y
+ *     cdef double out_minus_orig_x = output_x - original_to_x
+ *     cdef double out_minus_orig_y = output_y - original_to_y             # <<<<<<<<<<<<<<
+ * 
+ *     if (orig_minus_current_x * out_minus_orig_x + orig_minus_current_y * out_minus_orig_y) > 0: # Prevent overshooting
+ */
+  __pyx_v_out_minus_orig_y = (__pyx_v_output_y - __pyx_v_original_to_y);
+
+  /* "vector2.pxd":148
+ *     cdef double out_minus_orig_y = output_y - original_to_y
+ * 
+ *     if (orig_minus_current_x * out_minus_orig_x + orig_minus_current_y * out_minus_orig_y) > 0: # Prevent overshooting             # <<<<<<<<<<<<<<
+ *         output_x = original_to_x
+ *         output_y = original_to_y
+ */
+  __pyx_t_4 = (((__pyx_v_orig_minus_current_x * __pyx_v_out_minus_orig_x) + (__pyx_v_orig_minus_current_y * __pyx_v_out_minus_orig_y)) > 0.0);
+  if (__pyx_t_4) {
+
+    /* "vector2.pxd":149
+ * 
+ *     if (orig_minus_current_x * out_minus_orig_x + orig_minus_current_y * out_minus_orig_y) > 0: # Prevent overshooting
+ *         output_x = original_to_x             # <<<<<<<<<<<<<<
+ *         output_y = original_to_y
+ * 
+ */
+    __pyx_v_output_x = __pyx_v_original_to_x;
+
+    /* "vector2.pxd":150
+ *     if (orig_minus_current_x * out_minus_orig_x + orig_minus_current_y * out_minus_orig_y) > 0: # Prevent overshooting
+ *         output_x = original_to_x
+ *         output_y = original_to_y             # <<<<<<<<<<<<<<
+ * 
+ *         velocity_x = 0.0 # (output - original_to) / delta_time is always zero
+ */
+    __pyx_v_output_y = __pyx_v_original_to_y;
+
+    /* "vector2.pxd":152
+ *         output_y = original_to_y
+ * 
+ *         velocity_x = 0.0 # (output - original_to) / delta_time is always zero             # <<<<<<<<<<<<<<
+ *         velocity_y = 0.0
+ * 
+ */
+    __pyx_v_velocity_x = 0.0;
+
+    /* "vector2.pxd":153
+ * 
+ *         velocity_x = 0.0 # (output - original_to) / delta_time is always zero
+ *         velocity_y = 0.0             # <<<<<<<<<<<<<<
+ * 
+ *     velocity[0] = velocity_x
+ */
+    __pyx_v_velocity_y = 0.0;
+
+    /* "vector2.pxd":148
+ *     cdef double out_minus_orig_y = output_y - original_to_y
+ * 
+ *     if (orig_minus_current_x * out_minus_orig_x + orig_minus_current_y * out_minus_orig_y) > 0: # Prevent overshooting             # <<<<<<<<<<<<<<
+ *         output_x = original_to_x
+ *         output_y = original_to_y
+ */
+  }
+
+  /* "vector2.pxd":155
+ *         velocity_y = 0.0
+ * 
+ *     velocity[0] = velocity_x             # <<<<<<<<<<<<<<
+ *     velocity[1] = velocity_y
+ *     out[0] = output_x
+ */
+  (__pyx_v_velocity[0]) = __pyx_v_velocity_x;
+
+  /* "vector2.pxd":156
+ * 
+ *     velocity[0] = velocity_x
+ *     velocity[1] = velocity_y             # <<<<<<<<<<<<<<
+ *     out[0] = output_x
+ *     out[1] = output_y
+ */
+  (__pyx_v_velocity[1]) = __pyx_v_velocity_y;
+
+  /* "vector2.pxd":157
+ *     velocity[0] = velocity_x
+ *     velocity[1] = velocity_y
+ *     out[0] = output_x             # <<<<<<<<<<<<<<
+ *     out[1] = output_y
+ */
+  (__pyx_v_out[0]) = __pyx_v_output_x;
+
+  /* "vector2.pxd":158
+ *     velocity[1] = velocity_y
+ *     out[0] = output_x
+ *     out[1] = output_y             # <<<<<<<<<<<<<<
+ */
+  (__pyx_v_out[1]) = __pyx_v_output_y;
+
+  /* "vector2.pxd":111
+ * 
+ * @cython.cdivision(True)
+ * cdef inline void smooth_damp2_dist(double current_x, double current_y, double target_x, double target_y, double dist, double* velocity, double smooth_time, double delta_time, double max_speed, double* out) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     # smooth_damp2 with the distance between current and target computed by the caller, shared with the deterministic version.
+ *     # Heavy inspiration from https://github.com/Unity-Technologies/UnityCsReference/blob/2023.2/Runtime/Export/Math/Vector2.cs#L289
+ */
+
+  /* function exit code */
+}
+
+/* "vector2_int.pxd":11
+ *     cdef readonly _V2I_int_t y
+ * 
+ * cdef inline Vector2Int new_vector2_int(_V2I_int_t x, _V2I_int_t y):             # <<<<<<<<<<<<<<
+ *     # Vector2Int(x, y) without the overhead of calling __init__ through Python
+ *     cdef Vector2Int v = Vector2Int.__new__(Vector2Int)
+ */
+
+static CYTHON_INLINE struct __pyx_obj_5nalpy_4math_13_c_extensions_11vector2_int_Vector2Int *__pyx_f_5nalpy_4math_13_c_extensions_11vector2_int_new_vector2_int(__pyx_t_5nalpy_4math_13_c_extensions_11vector2_int__V2I_int_t __pyx_v_x, __pyx_t_5nalpy_4math_13_c_extensions_11vector2_int__V2I_int_t __pyx_v_y) {
+  struct __pyx_obj_5nalpy_4math_13_c_extensions_11vector2_int_Vector2Int *__pyx_v_v = 0;
+  struct __pyx_obj_5nalpy_4math_13_c_extensions_11vector2_int_Vector2Int *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("new_vector2_int", 1);
+
+  /* "vector2_int.pxd":13
+ * cdef inline Vector2Int new_vector2_int(_V2I_int_t x, _V2I_int_t y):
+ *     # Vector2Int(x, y) without the overhead of calling __init__ through Python
+ *     cdef Vector2Int v = Vector2Int.__new__(Vector2Int)             # <<<<<<<<<<<<<<
+ *     v.x = x
+ *     v.y = y
+ */
+  __pyx_t_1 = __Pyx_tp_new(((PyObject *)__pyx_ptype_5nalpy_4math_13_c_extensions_11vector2_int_Vector2Int), __pyx_empty_tuple); if (unlikely(!__pyx_t_1)) __PYX_ERR(3, 13, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (!(likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5nalpy_4math_13_c_extensions_11vector2_int_Vector2Int)))) __PYX_ERR(3, 13, __pyx_L1_error)
+  __pyx_v_v = ((struct __pyx_obj_5nalpy_4math_13_c_extensions_11vector2_int_Vector2Int *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "vector2_int.pxd":14
+ *     # Vector2Int(x, y) without the overhead of calling __init__ through Python
+ *     cdef Vector2Int v = Vector2Int.__new__(Vector2Int)
+ *     v.x = x             # <<<<<<<<<<<<<<
+ *     v.y = y
+ *     return v
+ */
+  __pyx_v_v->x = __pyx_v_x;
+
+  /* "vector2_int.pxd":15
+ *     cdef Vector2Int v = Vector2Int.__new__(Vector2Int)
+ *     v.x = x
+ *     v.y = y             # <<<<<<<<<<<<<<
+ *     return v
+ * 
+ */
+  __pyx_v_v->y = __pyx_v_y;
+
+  /* "vector2_int.pxd":16
+ *     v.x = x
+ *     v.y = y
+ *     return v             # <<<<<<<<<<<<<<
+ * 
+ * # Component-wise C versions of the Vector2Int math for use from other extensions, callable without the GIL.
+ */
+  __Pyx_XDECREF((PyObject *)__pyx_r);
+  __Pyx_INCREF((PyObject *)__pyx_v_v);
+  __pyx_r = __pyx_v_v;
+  goto __pyx_L0;
+
+  /* "vector2_int.pxd":11
+ *     cdef readonly _V2I_int_t y
+ * 
+ * cdef inline Vector2Int new_vector2_int(_V2I_int_t x, _V2I_int_t y):             # <<<<<<<<<<<<<<
+ *     # Vector2Int(x, y) without the overhead of calling __init__ through Python
+ *     cdef Vector2Int v = Vector2Int.__new__(Vector2Int)
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("nalpy.math._c_extensions.vector2_int.new_vector2_int", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_v);
+  __Pyx_XGIVEREF((PyObject *)__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "vector2_int.pxd":20
+ * # Component-wise C versions of the Vector2Int math for use from other extensions, callable without the GIL.
+ * # Vector results are written into out which must have room for two integers and may alias the inputs.
+ * cdef inline double magnitude2i(_V2I_int_t x, _V2I_int_t y) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return hypot(<double>x, <double>y)
+ * 
+ */
+
+static CYTHON_INLINE double __pyx_f_5nalpy_4math_13_c_extensions_11vector2_int_magnitude2i(__pyx_t_5nalpy_4math_13_c_extensions_11vector2_int__V2I_int_t __pyx_v_x, __pyx_t_5nalpy_4math_13_c_extensions_11vector2_int__V2I_int_t __pyx_v_y) {
+  double __pyx_r;
+
+  /* "vector2_int.pxd":21
+ * # Vector results are written into out which must have room for two integers and may alias the inputs.
+ * cdef inline double magnitude2i(_V2I_int_t x, _V2I_int_t y) noexcept nogil:
+ *     return hypot(<double>x, <double>y)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline double distance2i(_V2I_int_t ax, _V2I_int_t ay, _V2I_int_t bx, _V2I_int_t by) noexcept nogil:
+ */
+  __pyx_r = hypot(((double)__pyx_v_x), ((double)__pyx_v_y));
+  goto __pyx_L0;
+
+  /* "vector2_int.pxd":20
+ * # Component-wise C versions of the Vector2Int math for use from other extensions, callable without the GIL.
+ * # Vector results are written into out which must have room for two integers and may alias the inputs.
+ * cdef inline double magnitude2i(_V2I_int_t x, _V2I_int_t y) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return hypot(<double>x, <double>y)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "vector2_int.pxd":23
+ *     return hypot(<double>x, <double>y)
+ * 
+ * cdef inline double distance2i(_V2I_int_t ax, _V2I_int_t ay, _V2I_int_t bx, _V2I_int_t by) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef _V2I_int_t diff_x = ax - bx
+ *     cdef _V2I_int_t diff_y = ay - by
+ */
+
+static CYTHON_INLINE double __pyx_f_5nalpy_4math_13_c_extensions_11vector2_int_distance2i(__pyx_t_5nalpy_4math_13_c_extensions_11vector2_int__V2I_int_t __pyx_v_ax, __pyx_t_5nalpy_4math_13_c_extensions_11vector2_int__V2I_int_t __pyx_v_ay, __pyx_t_5nalpy_4math_13_c_extensions_11vector2_int__V2I_int_t __pyx_v_bx, __pyx_t_5nalpy_4math_13_c_extensions_11vector2_int__V2I_int_t __pyx_v_by) {
+  __pyx_t_5nalpy_4math_13_c_extensions_11vector2_int__V2I_int_t __pyx_v_diff_x;
+  __pyx_t_5nalpy_4math_13_c_extensions_11vector2_int__V2I_int_t __pyx_v_diff_y;
+  double __pyx_r;
+
+  /* "vector2_int.pxd":24
+ * 
+ * cdef inline double distance2i(_V2I_int_t ax, _V2I_int_t ay, _V2I_int_t bx, _V2I_int_t by) noexcept nogil:
+ *     cdef _V2I_int_t diff_x = ax - bx             # <<<<<<<<<<<<<<
+ *     cdef _V2I_int_t diff_y = ay - by
+ *     return hypot(<double>diff_x, <double>diff_y)
+ */
+  __pyx_v_diff_x = (__pyx_v_ax - __pyx_v_bx);
+
+  /* "vector2_int.pxd":25
+ * cdef inline double distance2i(_V2I_int_t ax, _V2I_int_t ay, _V2I_int_t bx, _V2I_int_t by) noexcept nogil:
+ *     cdef _V2I_int_t diff_x = ax - bx
+ *     cdef _V2I_int_t diff_y = ay - by             # <<<<<<<<<<<<<<
+ *     return hypot(<double>diff_x, <double>diff_y)
+ * 
+ */
+  __pyx_v_diff_y = (__pyx_v_ay - __pyx_v_by);
+
+  /* "vector2_int.pxd":26
+ *     cdef _V2I_int_t diff_x = ax - bx
+ *     cdef _V2I_int_t diff_y = ay - by
+ *     return hypot(<double>diff_x, <double>diff_y)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void min2i(_V2I_int_t ax, _V2I_int_t ay, _V2I_int_t bx, _V2I_int_t by, _V2I_int_t* out) noexcept nogil:
+ */
+  __pyx_r = hypot(((double)__pyx_v_diff_x), ((double)__pyx_v_diff_y));
+  goto __pyx_L0;
+
+  /* "vector2_int.pxd":23
+ *     return hypot(<double>x, <double>y)
+ * 
+ * cdef inline double distance2i(_V2I_int_t ax, _V2I_int_t ay, _V2I_int_t bx, _V2I_int_t by) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef _V2I_int_t diff_x = ax - bx
+ *     cdef _V2I_int_t diff_y = ay - by
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "vector2_int.pxd":28
+ *     return hypot(<double>diff_x, <double>diff_y)
+ * 
+ * cdef inline void min2i(_V2I_int_t ax, _V2I_int_t ay, _V2I_int_t bx, _V2I_int_t by, _V2I_int_t* out) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     out[0] = min(ax, bx)
+ *     out[1] = min(ay, by)
+ */
+
+static CYTHON_INLINE void __pyx_f_5nalpy_4math_13_c_extensions_11vector2_int_min2i(__pyx_t_5nalpy_4math_13_c_extensions_11vector2_int__V2I_int_t __pyx_v_ax, __pyx_t_5nalpy_4math_13_c_extensions_11vector2_int__V2I_int_t __pyx_v_ay, __pyx_t_5nalpy_4math_13_c_extensions_11vector2_int__V2I_int_t __pyx_v_bx, __pyx_t_5nalpy_4math_13_c_extensions_11vector2_int__V2I_int_t __pyx_v_by, __pyx_t_5nalpy_4math_13_c_extensions_11vector2_int__V2I_int_t *__pyx_v_out) {
+  __pyx_t_5nalpy_4math_13_c_extensions_11vector2_int__V2I_int_t __pyx_t_1;
+  __pyx_t_5nalpy_4math_13_c_extensions_11vector2_int__V2I_int_t __pyx_t_2;
+  __pyx_t_5nalpy_4math_13_c_extensions_11vector2_int__V2I_int_t __pyx_t_3;
+  int __pyx_t_4;
+
+  /* "vector2_int.pxd":29
+ * 
+ * cdef inline void min2i(_V2I_int_t ax, _V2I_int_t ay, _V2I_int_t bx, _V2I_int_t by, _V2I_int_t* out) noexcept nogil:
+ *     out[0] = min(ax, bx)             # <<<<<<<<<<<<<<
+ *     out[1] = min(ay, by)
+ * 
+ */
+  __pyx_t_1 = __pyx_v_bx;
+  __pyx_t_2 = __pyx_v_ax;
+  __pyx_t_4 = (__pyx_t_1 < __pyx_t_2);
+  if (__pyx_t_4) {
+    __pyx_t_3 = __pyx_t_1;
+  } else {
+    __pyx_t_3 = __pyx_t_2;
+  }
+  (__pyx_v_out[0]) = __pyx_t_3;
+
+  /* "vector2_int.pxd":30
+ * cdef inline void min2i(_V2I_int_t ax, _V2I_int_t ay, _V2I_int_t bx, _V2I_int_t by, _V2I_int_t* out) noexcept nogil:
+ *     out[0] = min(ax, bx)
+ *     out[1] = min(ay, by)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void max2i(_V2I_int_t ax, _V2I_int_t ay, _V2I_int_t bx, _V2I_int_t by, _V2I_int_t* out) noexcept nogil:
+ */
+  __pyx_t_3 = __pyx_v_by;
+  __pyx_t_1 = __pyx_v_ay;
+  __pyx_t_4 = (__pyx_t_3 < __pyx_t_1);
+  if (__pyx_t_4) {
+    __pyx_t_2 = __pyx_t_3;
+  } else {
+    __pyx_t_2 = __pyx_t_1;
+  }
+  (__pyx_v_out[1]) = __pyx_t_2;
+
+  /* "vector2_int.pxd":28
+ *     return hypot(<double>diff_x, <double>diff_y)
+ * 
+ * cdef inline void min2i(_V2I_int_t ax, _V2I_int_t ay, _V2I_int_t bx, _V2I_int_t by, _V2I_int_t* out) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     out[0] = min(ax, bx)
+ *     out[1] = min(ay, by)
+ */
+
+  /* function exit code */
+}
+
+/* "vector2_int.pxd":32
+ *     out[1] = min(ay, by)
+ * 
+ * cdef inline void max2i(_V2I_int_t ax, _V2I_int_t ay, _V2I_int_t bx, _V2I_int_t by, _V2I_int_t* out) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     out[0] = max(ax, bx)
+ *     out[1] = max(ay, by)
+ */
+
+static CYTHON_INLINE void __pyx_f_5nalpy_4math_13_c_extensions_11vector2_int_max2i(__pyx_t_5nalpy_4math_13_c_extensions_11vector2_int__V2I_int_t __pyx_v_ax, __pyx_t_5nalpy_4math_13_c_extensions_11vector2_int__V2I_int_t __pyx_v_ay, __pyx_t_5nalpy_4math_13_c_extensions_11vector2_int__V2I_int_t __pyx_v_bx, __pyx_t_5nalpy_4math_13_c_extensions_11vector2_int__V2I_int_t __pyx_v_by, __pyx_t_5nalpy_4math_13_c_extensions_11vector2_int__V2I_int_t *__pyx_v_out) {
+  __pyx_t_5nalpy_4math_13_c_extensions_11vector2_int__V2I_int_t __pyx_t_1;
+  __pyx_t_5nalpy_4math_13_c_extensions_11vector2_int__V2I_int_t __pyx_t_2;
+  __pyx_t_5nalpy_4math_13_c_extensions_11vector2_int__V2I_int_t __pyx_t_3;
+  int __pyx_t_4;
+
+  /* "vector2_int.pxd":33
+ * 
+ * cdef inline void max2i(_V2I_int_t ax, _V2I_int_t ay, _V2I_int_t bx, _V2I_int_t by, _V2I_int_t* out) noexcept nogil:
+ *     out[0] = max(ax, bx)             # <<<<<<<<<<<<<<
+ *     out[1] = max(ay, by)
+ * 
+ */
+  __pyx_t_1 = __pyx_v_bx;
+  __pyx_t_2 = __pyx_v_ax;
+  __pyx_t_4 = (__pyx_t_1 > __pyx_t_2);
+  if (__pyx_t_4) {
+    __pyx_t_3 = __pyx_t_1;
+  } else {
+    __pyx_t_3 = __pyx_t_2;
+  }
+  (__pyx_v_out[0]) = __pyx_t_3;
+
+  /* "vector2_int.pxd":34
+ * cdef inline void max2i(_V2I_int_t ax, _V2I_int_t ay, _V2I_int_t bx, _V2I_int_t by, _V2I_int_t* out) noexcept nogil:
+ *     out[0] = max(ax, bx)
+ *     out[1] = max(ay, by)             # <<<<<<<<<<<<<<
+ * 
+ * # Conversions from floating point components. Out of range and NaN components are undefined like in C.
+ */
+  __pyx_t_3 = __pyx_v_by;
+  __pyx_t_1 = __pyx_v_ay;
+  __pyx_t_4 = (__pyx_t_3 > __pyx_t_1);
+  if (__pyx_t_4) {
+    __pyx_t_2 = __pyx_t_3;
+  } else {
+    __pyx_t_2 = __pyx_t_1;
+  }
+  (__pyx_v_out[1]) = __pyx_t_2;
+
+  /* "vector2_int.pxd":32
+ *     out[1] = min(ay, by)
+ * 
+ * cdef inline void max2i(_V2I_int_t ax, _V2I_int_t ay, _V2I_int_t bx, _V2I_int_t by, _V2I_int_t* out) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     out[0] = max(ax, bx)
+ *     out[1] = max(ay, by)
+ */
+
+  /* function exit code */
+}
+
+/* "vector2_int.pxd":37
+ * 
+ * # Conversions from floating point components. Out of range and NaN components are undefined like in C.
+ * cdef inline void ceil2i(double x, double y, _V2I_int_t* out) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     out[0] = <_V2I_int_t>ceil(x)
+ *     out[1] = <_V2I_int_t>ceil(y)
+ */
+
+static CYTHON_INLINE void __pyx_f_5nalpy_4math_13_c_extensions_11vector2_int_ceil2i(double __pyx_v_x, double __pyx_v_y, __pyx_t_5nalpy_4math_13_c_extensions_11vector2_int__V2I_int_t *__pyx_v_out) {
+
+  /* "vector2_int.pxd":38
+ * # Conversions from floating point components. Out of range and NaN components are undefined like in C.
+ * cdef inline void ceil2i(double x, double y, _V2I_int_t* out) noexcept nogil:
+ *     out[0] = <_V2I_int_t>ceil(x)             # <<<<<<<<<<<<<<
+ *     out[1] = <_V2I_int_t>ceil(y)
+ * 
+ */
+  (__pyx_v_out[0]) = ((__pyx_t_5nalpy_4math_13_c_extensions_11vector2_int__V2I_int_t)ceil(__pyx_v_x));
+
+  /* "vector2_int.pxd":39
+ * cdef inline void ceil2i(double x, double y, _V2I_int_t* out) noexcept nogil:
+ *     out[0] = <_V2I_int_t>ceil(x)
+ *     out[1] = <_V2I_int_t>ceil(y)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void floor2i(double x, double y, _V2I_int_t* out) noexcept nogil:
+ */
+  (__pyx_v_out[1]) = ((__pyx_t_5nalpy_4math_13_c_extensions_11vector2_int__V2I_int_t)ceil(__pyx_v_y));
+
+  /* "vector2_int.pxd":37
+ * 
+ * # Conversions from floating point components. Out of range and NaN components are undefined like in C.
+ * cdef inline void ceil2i(double x, double y, _V2I_int_t* out) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     out[0] = <_V2I_int_t>ceil(x)
+ *     out[1] = <_V2I_int_t>ceil(y)
+ */
+
+  /* function exit code */
+}
+
+/* "vector2_int.pxd":41
+ *     out[1] = <_V2I_int_t>ceil(y)
+ * 
+ * cdef inline void floor2i(double x, double y, _V2I_int_t* out) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     out[0] = <_V2I_int_t>floor(x)
+ *     out[1] = <_V2I_int_t>floor(y)
+ */
+
+static CYTHON_INLINE void __pyx_f_5nalpy_4math_13_c_extensions_11vector2_int_floor2i(double __pyx_v_x, double __pyx_v_y, __pyx_t_5nalpy_4math_13_c_extensions_11vector2_int__V2I_int_t *__pyx_v_out) {
+
+  /* "vector2_int.pxd":42
+ * 
+ * cdef inline void floor2i(double x, double y, _V2I_int_t* out) noexcept nogil:
+ *     out[0] = <_V2I_int_t>floor(x)             # <<<<<<<<<<<<<<
+ *     out[1] = <_V2I_int_t>floor(y)
+ * 
+ */
+  (__pyx_v_out[0]) = ((__pyx_t_5nalpy_4math_13_c_extensions_11vector2_int__V2I_int_t)floor(__pyx_v_x));
+
+  /* "vector2_int.pxd":43
+ * cdef inline void floor2i(double x, double y, _V2I_int_t* out) noexcept nogil:
+ *     out[0] = <_V2I_int_t>floor(x)
+ *     out[1] = <_V2I_int_t>floor(y)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void round2i(double x, double y, _V2I_int_t* out) noexcept nogil:
+ */
+  (__pyx_v_out[1]) = ((__pyx_t_5nalpy_4math_13_c_extensions_11vector2_int__V2I_int_t)floor(__pyx_v_y));
+
+  /* "vector2_int.pxd":41
+ *     out[1] = <_V2I_int_t>ceil(y)
+ * 
+ * cdef inline void floor2i(double x, double y, _V2I_int_t* out) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     out[0] = <_V2I_int_t>floor(x)
+ *     out[1] = <_V2I_int_t>floor(y)
+ */
+
+  /* function exit code */
+}
+
+/* "vector2_int.pxd":45
+ *     out[1] = <_V2I_int_t>floor(y)
+ * 
+ * cdef inline void round2i(double x, double y, _V2I_int_t* out) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     # Rounds halfway cases away from zero
+ *     out[0] = <_V2I_int_t>llround(x)
+ */
+
+static CYTHON_INLINE void __pyx_f_5nalpy_4math_13_c_extensions_11vector2_int_round2i(double __pyx_v_x, double __pyx_v_y, __pyx_t_5nalpy_4math_13_c_extensions_11vector2_int__V2I_int_t *__pyx_v_out) {
+
+  /* "vector2_int.pxd":47
+ * cdef inline void round2i(double x, double y, _V2I_int_t* out) noexcept nogil:
+ *     # Rounds halfway cases away from zero
+ *     out[0] = <_V2I_int_t>llround(x)             # <<<<<<<<<<<<<<
+ *     out[1] = <_V2I_int_t>llround(y)
+ * 
+ */
+  (__pyx_v_out[0]) = ((__pyx_t_5nalpy_4math_13_c_extensions_11vector2_int__V2I_int_t)llround(__pyx_v_x));
+
+  /* "vector2_int.pxd":48
+ *     # Rounds halfway cases away from zero
+ *     out[0] = <_V2I_int_t>llround(x)
+ *     out[1] = <_V2I_int_t>llround(y)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void trunc2i(double x, double y, _V2I_int_t* out) noexcept nogil:
+ */
+  (__pyx_v_out[1]) = ((__pyx_t_5nalpy_4math_13_c_extensions_11vector2_int__V2I_int_t)llround(__pyx_v_y));
+
+  /* "vector2_int.pxd":45
+ *     out[1] = <_V2I_int_t>floor(y)
+ * 
+ * cdef inline void round2i(double x, double y, _V2I_int_t* out) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     # Rounds halfway cases away from zero
+ *     out[0] = <_V2I_int_t>llround(x)
+ */
+
+  /* function exit code */
+}
+
+/* "vector2_int.pxd":50
+ *     out[1] = <_V2I_int_t>llround(y)
+ * 
+ * cdef inline void trunc2i(double x, double y, _V2I_int_t* out) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     out[0] = <_V2I_int_t>x # Casting floating point to integer truncates
+ *     out[1] = <_V2I_int_t>y
+ */
+
+static CYTHON_INLINE void __pyx_f_5nalpy_4math_13_c_extensions_11vector2_int_trunc2i(double __pyx_v_x, double __pyx_v_y, __pyx_t_5nalpy_4math_13_c_extensions_11vector2_int__V2I_int_t *__pyx_v_out) {
+
+  /* "vector2_int.pxd":51
+ * 
+ * cdef inline void trunc2i(double x, double y, _V2I_int_t* out) noexcept nogil:
+ *     out[0] = <_V2I_int_t>x # Casting floating point to integer truncates             # <<<<<<<<<<<<<<
+ *     out[1] = <_V2I_int_t>y
+ */
+  (__pyx_v_out[0]) = ((__pyx_t_5nalpy_4math_13_c_extensions_11vector2_int__V2I_int_t)__pyx_v_x);
+
+  /* "vector2_int.pxd":52
+ * cdef inline void trunc2i(double x, double y, _V2I_int_t* out) noexcept nogil:
+ *     out[0] = <_V2I_int_t>x # Casting floating point to integer truncates
+ *     out[1] = <_V2I_int_t>y             # <<<<<<<<<<<<<<
+ */
+  (__pyx_v_out[1]) = ((__pyx_t_5nalpy_4math_13_c_extensions_11vector2_int__V2I_int_t)__pyx_v_y);
+
+  /* "vector2_int.pxd":50
+ *     out[1] = <_V2I_int_t>llround(y)
+ * 
+ * cdef inline void trunc2i(double x, double y, _V2I_int_t* out) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     out[0] = <_V2I_int_t>x # Casting floating point to integer truncates
+ *     out[1] = <_V2I_int_t>y
+ */
+
+  /* function exit code */
+}
+
+/* "nalpy/math/_c_extensions/deterministic.pyx":21
+ * cdef double _LIMIT = 9223372036854775808.0
+ * 
+ * cdef long long _to_int(double value) except? -1:             # <<<<<<<<<<<<<<
+ *     if isnan(value):
+ *         raise ValueError("Cannot convert float NaN to integer.")
+ */
+
+static PY_LONG_LONG __pyx_f_5nalpy_4math_13_c_extensions_13deterministic__to_int(double __pyx_v_value) {
+  PY_LONG_LONG __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_to_int", 1);
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":22
+ * 
+ * cdef long long _to_int(double value) except? -1:
+ *     if isnan(value):             # <<<<<<<<<<<<<<
+ *         raise ValueError("Cannot convert float NaN to integer.")
+ *     if not (value >= -_LIMIT and value < _LIMIT):
+ */
+  __pyx_t_1 = isnan(__pyx_v_value);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "nalpy/math/_c_extensions/deterministic.pyx":23
+ * cdef long long _to_int(double value) except? -1:
+ *     if isnan(value):
+ *         raise ValueError("Cannot convert float NaN to integer.")             # <<<<<<<<<<<<<<
+ *     if not (value >= -_LIMIT and value < _LIMIT):
+ *         raise OverflowError("Result does not fit into a 64-bit integer.")
+ */
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 23, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 23, __pyx_L1_error)
+
+    /* "nalpy/math/_c_extensions/deterministic.pyx":22
+ * 
+ * cdef long long _to_int(double value) except? -1:
+ *     if isnan(value):             # <<<<<<<<<<<<<<
+ *         raise ValueError("Cannot convert float NaN to integer.")
+ *     if not (value >= -_LIMIT and value < _LIMIT):
+ */
+  }
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":24
+ *     if isnan(value):
+ *         raise ValueError("Cannot convert float NaN to integer.")
+ *     if not (value >= -_LIMIT and value < _LIMIT):             # <<<<<<<<<<<<<<
+ *         raise OverflowError("Result does not fit into a 64-bit integer.")
+ *     return <long long>value
+ */
+  __pyx_t_3 = (__pyx_v_value >= (-__pyx_v_5nalpy_4math_13_c_extensions_13deterministic__LIMIT));
+  if (__pyx_t_3) {
+  } else {
+    __pyx_t_1 = __pyx_t_3;
+    goto __pyx_L5_bool_binop_done;
+  }
+  __pyx_t_3 = (__pyx_v_value < __pyx_v_5nalpy_4math_13_c_extensions_13deterministic__LIMIT);
+  __pyx_t_1 = __pyx_t_3;
+  __pyx_L5_bool_binop_done:;
+  __pyx_t_3 = (!__pyx_t_1);
+  if (unlikely(__pyx_t_3)) {
+
+    /* "nalpy/math/_c_extensions/deterministic.pyx":25
+ *         raise ValueError("Cannot convert float NaN to integer.")
+ *     if not (value >= -_LIMIT and value < _LIMIT):
+ *         raise OverflowError("Result does not fit into a 64-bit integer.")             # <<<<<<<<<<<<<<
+ *     return <long long>value
+ * 
+ */
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_OverflowError, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 25, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 25, __pyx_L1_error)
+
+    /* "nalpy/math/_c_extensions/deterministic.pyx":24
+ *     if isnan(value):
+ *         raise ValueError("Cannot convert float NaN to integer.")
+ *     if not (value >= -_LIMIT and value < _LIMIT):             # <<<<<<<<<<<<<<
+ *         raise OverflowError("Result does not fit into a 64-bit integer.")
+ *     return <long long>value
+ */
+  }
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":26
+ *     if not (value >= -_LIMIT and value < _LIMIT):
+ *         raise OverflowError("Result does not fit into a 64-bit integer.")
+ *     return <long long>value             # <<<<<<<<<<<<<<
+ * 
+ * @cython.cdivision(True)
+ */
+  __pyx_r = ((PY_LONG_LONG)__pyx_v_value);
+  goto __pyx_L0;
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":21
+ * cdef double _LIMIT = 9223372036854775808.0
+ * 
+ * cdef long long _to_int(double value) except? -1:             # <<<<<<<<<<<<<<
+ *     if isnan(value):
+ *         raise ValueError("Cannot convert float NaN to integer.")
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("nalpy.math._c_extensions.deterministic._to_int", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1LL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "nalpy/math/_c_extensions/deterministic.pyx":29
+ * 
+ * @cython.cdivision(True)
+ * cdef inline double _angle2(double from_x, double from_y, double to_x, double to_y) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     # angle2 from vector2.pxd with the portable hypot and acos
+ *     cdef double denom = det_hypot(from_x, from_y) * det_hypot(to_x, to_y)
+ */
+
+static CYTHON_INLINE double __pyx_f_5nalpy_4math_13_c_extensions_13deterministic__angle2(double __pyx_v_from_x, double __pyx_v_from_y, double __pyx_v_to_x, double __pyx_v_to_y) {
+  double __pyx_v_denom;
+  double __pyx_v_cos_val;
+  double __pyx_r;
+  int __pyx_t_1;
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":31
+ * cdef inline double _angle2(double from_x, double from_y, double to_x, double to_y) noexcept nogil:
+ *     # angle2 from vector2.pxd with the portable hypot and acos
+ *     cdef double denom = det_hypot(from_x, from_y) * det_hypot(to_x, to_y)             # <<<<<<<<<<<<<<
+ *     if denom == 0.0:
+ *         return 0.0
+ */
+  __pyx_v_denom = (__pyx_f_5nalpy_4math_13_c_extensions_14_deterministic_det_hypot(__pyx_v_from_x, __pyx_v_from_y) * __pyx_f_5nalpy_4math_13_c_extensions_14_deterministic_det_hypot(__pyx_v_to_x, __pyx_v_to_y));
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":32
+ *     # angle2 from vector2.pxd with the portable hypot and acos
+ *     cdef double denom = det_hypot(from_x, from_y) * det_hypot(to_x, to_y)
+ *     if denom == 0.0:             # <<<<<<<<<<<<<<
+ *         return 0.0
+ * 
+ */
+  __pyx_t_1 = (__pyx_v_denom == 0.0);
+  if (__pyx_t_1) {
+
+    /* "nalpy/math/_c_extensions/deterministic.pyx":33
+ *     cdef double denom = det_hypot(from_x, from_y) * det_hypot(to_x, to_y)
+ *     if denom == 0.0:
+ *         return 0.0             # <<<<<<<<<<<<<<
+ * 
+ *     cdef double cos_val = ((from_x * to_x) + (from_y * to_y)) / denom
+ */
+    __pyx_r = 0.0;
+    goto __pyx_L0;
+
+    /* "nalpy/math/_c_extensions/deterministic.pyx":32
+ *     # angle2 from vector2.pxd with the portable hypot and acos
+ *     cdef double denom = det_hypot(from_x, from_y) * det_hypot(to_x, to_y)
+ *     if denom == 0.0:             # <<<<<<<<<<<<<<
+ *         return 0.0
+ * 
+ */
+  }
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":35
+ *         return 0.0
+ * 
+ *     cdef double cos_val = ((from_x * to_x) + (from_y * to_y)) / denom             # <<<<<<<<<<<<<<
+ *     if cos_val < -1.0:
+ *         cos_val = -1.0
+ */
+  __pyx_v_cos_val = (((__pyx_v_from_x * __pyx_v_to_x) + (__pyx_v_from_y * __pyx_v_to_y)) / __pyx_v_denom);
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":36
+ * 
+ *     cdef double cos_val = ((from_x * to_x) + (from_y * to_y)) / denom
+ *     if cos_val < -1.0:             # <<<<<<<<<<<<<<
+ *         cos_val = -1.0
+ *     elif cos_val > 1.0:
+ */
+  __pyx_t_1 = (__pyx_v_cos_val < -1.0);
+  if (__pyx_t_1) {
+
+    /* "nalpy/math/_c_extensions/deterministic.pyx":37
+ *     cdef double cos_val = ((from_x * to_x) + (from_y * to_y)) / denom
+ *     if cos_val < -1.0:
+ *         cos_val = -1.0             # <<<<<<<<<<<<<<
+ *     elif cos_val > 1.0:
+ *         cos_val = 1.0
+ */
+    __pyx_v_cos_val = -1.0;
+
+    /* "nalpy/math/_c_extensions/deterministic.pyx":36
+ * 
+ *     cdef double cos_val = ((from_x * to_x) + (from_y * to_y)) / denom
+ *     if cos_val < -1.0:             # <<<<<<<<<<<<<<
+ *         cos_val = -1.0
+ *     elif cos_val > 1.0:
+ */
+    goto __pyx_L4;
+  }
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":38
+ *     if cos_val < -1.0:
+ *         cos_val = -1.0
+ *     elif cos_val > 1.0:             # <<<<<<<<<<<<<<
+ *         cos_val = 1.0
+ * 
+ */
+  __pyx_t_1 = (__pyx_v_cos_val > 1.0);
+  if (__pyx_t_1) {
+
+    /* "nalpy/math/_c_extensions/deterministic.pyx":39
+ *         cos_val = -1.0
+ *     elif cos_val > 1.0:
+ *         cos_val = 1.0             # <<<<<<<<<<<<<<
+ * 
+ *     return det_acos(cos_val) * (180.0 / 3.14159265358979323846)
+ */
+    __pyx_v_cos_val = 1.0;
+
+    /* "nalpy/math/_c_extensions/deterministic.pyx":38
+ *     if cos_val < -1.0:
+ *         cos_val = -1.0
+ *     elif cos_val > 1.0:             # <<<<<<<<<<<<<<
+ *         cos_val = 1.0
+ * 
+ */
+  }
+  __pyx_L4:;
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":41
+ *         cos_val = 1.0
+ * 
+ *     return det_acos(cos_val) * (180.0 / 3.14159265358979323846)             # <<<<<<<<<<<<<<
+ * 
+ * def hypot(double x, double y, /):
+ */
+  __pyx_r = (__pyx_f_5nalpy_4math_13_c_extensions_14_deterministic_det_acos(__pyx_v_cos_val) * (180.0 / 3.14159265358979323846));
+  goto __pyx_L0;
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":29
+ * 
+ * @cython.cdivision(True)
+ * cdef inline double _angle2(double from_x, double from_y, double to_x, double to_y) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     # angle2 from vector2.pxd with the portable hypot and acos
+ *     cdef double denom = det_hypot(from_x, from_y) * det_hypot(to_x, to_y)
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "nalpy/math/_c_extensions/deterministic.pyx":43
+ *     return det_acos(cos_val) * (180.0 / 3.14159265358979323846)
+ * 
+ * def hypot(double x, double y, /):             # <<<<<<<<<<<<<<
+ *     return det_hypot(x, y)
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5nalpy_4math_13_c_extensions_13deterministic_1hypot(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyMethodDef __pyx_mdef_5nalpy_4math_13_c_extensions_13deterministic_1hypot = {"hypot", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_5nalpy_4math_13_c_extensions_13deterministic_1hypot, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_5nalpy_4math_13_c_extensions_13deterministic_1hypot(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  double __pyx_v_x;
+  double __pyx_v_y;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[2] = {0,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("hypot (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject **__pyx_pyargnames[] = {0};
+    if (__pyx_kwds && __Pyx_NumKwargs_FASTCALL(__pyx_kwds) > 0) {
+      if (likely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, 0, "hypot") < 0)) __PYX_ERR(0, 43, __pyx_L3_error)
+    } else if (unlikely(__pyx_nargs != 2)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+      values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+    }
+    __pyx_v_x = __pyx_PyFloat_AsDouble(values[0]); if (unlikely((__pyx_v_x == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 43, __pyx_L3_error)
+    __pyx_v_y = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_y == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 43, __pyx_L3_error)
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("hypot", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 43, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_AddTraceback("nalpy.math._c_extensions.deterministic.hypot", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5nalpy_4math_13_c_extensions_13deterministic_hypot(__pyx_self, __pyx_v_x, __pyx_v_y);
+
+  /* function exit code */
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5nalpy_4math_13_c_extensions_13deterministic_hypot(CYTHON_UNUSED PyObject *__pyx_self, double __pyx_v_x, double __pyx_v_y) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("hypot", 1);
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":44
+ * 
+ * def hypot(double x, double y, /):
+ *     return det_hypot(x, y)             # <<<<<<<<<<<<<<
+ * 
+ * def acos(double x, /):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_f_5nalpy_4math_13_c_extensions_14_deterministic_det_hypot(__pyx_v_x, __pyx_v_y)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 44, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":43
+ *     return det_acos(cos_val) * (180.0 / 3.14159265358979323846)
+ * 
+ * def hypot(double x, double y, /):             # <<<<<<<<<<<<<<
+ *     return det_hypot(x, y)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("nalpy.math._c_extensions.deterministic.hypot", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "nalpy/math/_c_extensions/deterministic.pyx":46
+ *     return det_hypot(x, y)
+ * 
+ * def acos(double x, /):             # <<<<<<<<<<<<<<
+ *     if fabs(x) > 1.0: # Same error as math.acos, nan is passed through
+ *         raise ValueError("math domain error")
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5nalpy_4math_13_c_extensions_13deterministic_3acos(PyObject *__pyx_self, PyObject *__pyx_arg_x); /*proto*/
+static PyMethodDef __pyx_mdef_5nalpy_4math_13_c_extensions_13deterministic_3acos = {"acos", (PyCFunction)__pyx_pw_5nalpy_4math_13_c_extensions_13deterministic_3acos, METH_O, 0};
+static PyObject *__pyx_pw_5nalpy_4math_13_c_extensions_13deterministic_3acos(PyObject *__pyx_self, PyObject *__pyx_arg_x) {
+  double __pyx_v_x;
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("acos (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  assert(__pyx_arg_x); {
+    __pyx_v_x = __pyx_PyFloat_AsDouble(__pyx_arg_x); if (unlikely((__pyx_v_x == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 46, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("nalpy.math._c_extensions.deterministic.acos", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5nalpy_4math_13_c_extensions_13deterministic_2acos(__pyx_self, ((double)__pyx_v_x));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5nalpy_4math_13_c_extensions_13deterministic_2acos(CYTHON_UNUSED PyObject *__pyx_self, double __pyx_v_x) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("acos", 1);
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":47
+ * 
+ * def acos(double x, /):
+ *     if fabs(x) > 1.0: # Same error as math.acos, nan is passed through             # <<<<<<<<<<<<<<
+ *         raise ValueError("math domain error")
+ *     return det_acos(x)
+ */
+  __pyx_t_1 = (fabs(__pyx_v_x) > 1.0);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "nalpy/math/_c_extensions/deterministic.pyx":48
+ * def acos(double x, /):
+ *     if fabs(x) > 1.0: # Same error as math.acos, nan is passed through
+ *         raise ValueError("math domain error")             # <<<<<<<<<<<<<<
+ *     return det_acos(x)
+ * 
+ */
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__3, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 48, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 48, __pyx_L1_error)
+
+    /* "nalpy/math/_c_extensions/deterministic.pyx":47
+ * 
+ * def acos(double x, /):
+ *     if fabs(x) > 1.0: # Same error as math.acos, nan is passed through             # <<<<<<<<<<<<<<
+ *         raise ValueError("math domain error")
+ *     return det_acos(x)
+ */
+  }
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":49
+ *     if fabs(x) > 1.0: # Same error as math.acos, nan is passed through
+ *         raise ValueError("math domain error")
+ *     return det_acos(x)             # <<<<<<<<<<<<<<
+ * 
+ * def atan2(double y, double x, /):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = PyFloat_FromDouble(__pyx_f_5nalpy_4math_13_c_extensions_14_deterministic_det_acos(__pyx_v_x)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 49, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":46
+ *     return det_hypot(x, y)
+ * 
+ * def acos(double x, /):             # <<<<<<<<<<<<<<
+ *     if fabs(x) > 1.0: # Same error as math.acos, nan is passed through
+ *         raise ValueError("math domain error")
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("nalpy.math._c_extensions.deterministic.acos", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "nalpy/math/_c_extensions/deterministic.pyx":51
+ *     return det_acos(x)
+ * 
+ * def atan2(double y, double x, /):             # <<<<<<<<<<<<<<
+ *     return det_atan2(y, x)
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5nalpy_4math_13_c_extensions_13deterministic_5atan2(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyMethodDef __pyx_mdef_5nalpy_4math_13_c_extensions_13deterministic_5atan2 = {"atan2", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_5nalpy_4math_13_c_extensions_13deterministic_5atan2, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_5nalpy_4math_13_c_extensions_13deterministic_5atan2(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  double __pyx_v_y;
+  double __pyx_v_x;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[2] = {0,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("atan2 (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject **__pyx_pyargnames[] = {0};
+    if (__pyx_kwds && __Pyx_NumKwargs_FASTCALL(__pyx_kwds) > 0) {
+      if (likely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, 0, "atan2") < 0)) __PYX_ERR(0, 51, __pyx_L3_error)
+    } else if (unlikely(__pyx_nargs != 2)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+      values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+    }
+    __pyx_v_y = __pyx_PyFloat_AsDouble(values[0]); if (unlikely((__pyx_v_y == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 51, __pyx_L3_error)
+    __pyx_v_x = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_x == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 51, __pyx_L3_error)
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("atan2", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 51, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_AddTraceback("nalpy.math._c_extensions.deterministic.atan2", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5nalpy_4math_13_c_extensions_13deterministic_4atan2(__pyx_self, __pyx_v_y, __pyx_v_x);
+
+  /* function exit code */
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5nalpy_4math_13_c_extensions_13deterministic_4atan2(CYTHON_UNUSED PyObject *__pyx_self, double __pyx_v_y, double __pyx_v_x) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("atan2", 1);
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":52
+ * 
+ * def atan2(double y, double x, /):
+ *     return det_atan2(y, x)             # <<<<<<<<<<<<<<
+ * 
+ * def round(double x, /):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_f_5nalpy_4math_13_c_extensions_14_deterministic_det_atan2(__pyx_v_y, __pyx_v_x)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 52, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":51
+ *     return det_acos(x)
+ * 
+ * def atan2(double y, double x, /):             # <<<<<<<<<<<<<<
+ *     return det_atan2(y, x)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("nalpy.math._c_extensions.deterministic.atan2", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "nalpy/math/_c_extensions/deterministic.pyx":54
+ *     return det_atan2(y, x)
+ * 
+ * def round(double x, /):             # <<<<<<<<<<<<<<
+ *     return PyLong_FromDouble(det_round(x)) # Raises for nan and inf like the built-in round
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5nalpy_4math_13_c_extensions_13deterministic_7round(PyObject *__pyx_self, PyObject *__pyx_arg_x); /*proto*/
+static PyMethodDef __pyx_mdef_5nalpy_4math_13_c_extensions_13deterministic_7round = {"round", (PyCFunction)__pyx_pw_5nalpy_4math_13_c_extensions_13deterministic_7round, METH_O, 0};
+static PyObject *__pyx_pw_5nalpy_4math_13_c_extensions_13deterministic_7round(PyObject *__pyx_self, PyObject *__pyx_arg_x) {
+  double __pyx_v_x;
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("round (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  assert(__pyx_arg_x); {
+    __pyx_v_x = __pyx_PyFloat_AsDouble(__pyx_arg_x); if (unlikely((__pyx_v_x == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 54, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("nalpy.math._c_extensions.deterministic.round", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5nalpy_4math_13_c_extensions_13deterministic_6round(__pyx_self, ((double)__pyx_v_x));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5nalpy_4math_13_c_extensions_13deterministic_6round(CYTHON_UNUSED PyObject *__pyx_self, double __pyx_v_x) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("round", 1);
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":55
+ * 
+ * def round(double x, /):
+ *     return PyLong_FromDouble(det_round(x)) # Raises for nan and inf like the built-in round             # <<<<<<<<<<<<<<
+ * 
+ * def magnitude(Vector2 v):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyLong_FromDouble(__pyx_f_5nalpy_4math_13_c_extensions_14_deterministic_det_round(__pyx_v_x)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 55, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":54
+ *     return det_atan2(y, x)
+ * 
+ * def round(double x, /):             # <<<<<<<<<<<<<<
+ *     return PyLong_FromDouble(det_round(x)) # Raises for nan and inf like the built-in round
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("nalpy.math._c_extensions.deterministic.round", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "nalpy/math/_c_extensions/deterministic.pyx":57
+ *     return PyLong_FromDouble(det_round(x)) # Raises for nan and inf like the built-in round
+ * 
+ * def magnitude(Vector2 v):             # <<<<<<<<<<<<<<
+ *     return det_hypot(v.x, v.y)
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5nalpy_4math_13_c_extensions_13deterministic_9magnitude(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyMethodDef __pyx_mdef_5nalpy_4math_13_c_extensions_13deterministic_9magnitude = {"magnitude", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_5nalpy_4math_13_c_extensions_13deterministic_9magnitude, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_5nalpy_4math_13_c_extensions_13deterministic_9magnitude(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *__pyx_v_v = 0;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[1] = {0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("magnitude (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_v,0};
+    if (__pyx_kwds) {
+      Py_ssize_t kw_args;
+      switch (__pyx_nargs) {
+        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
+      switch (__pyx_nargs) {
+        case  0:
+        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_v)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 57, __pyx_L3_error)
+        else goto __pyx_L5_argtuple_error;
+      }
+      if (unlikely(kw_args > 0)) {
+        const Py_ssize_t kwd_pos_args = __pyx_nargs;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "magnitude") < 0)) __PYX_ERR(0, 57, __pyx_L3_error)
+      }
+    } else if (unlikely(__pyx_nargs != 1)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+    }
+    __pyx_v_v = ((struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *)values[0]);
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("magnitude", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 57, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_AddTraceback("nalpy.math._c_extensions.deterministic.magnitude", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_v), __pyx_ptype_5nalpy_4math_13_c_extensions_7vector2_Vector2, 1, "v", 0))) __PYX_ERR(0, 57, __pyx_L1_error)
+  __pyx_r = __pyx_pf_5nalpy_4math_13_c_extensions_13deterministic_8magnitude(__pyx_self, __pyx_v_v);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5nalpy_4math_13_c_extensions_13deterministic_8magnitude(CYTHON_UNUSED PyObject *__pyx_self, struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *__pyx_v_v) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("magnitude", 1);
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":58
+ * 
+ * def magnitude(Vector2 v):
+ *     return det_hypot(v.x, v.y)             # <<<<<<<<<<<<<<
+ * 
+ * @cython.cdivision(True)
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_f_5nalpy_4math_13_c_extensions_14_deterministic_det_hypot(__pyx_v_v->x, __pyx_v_v->y)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 58, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":57
+ *     return PyLong_FromDouble(det_round(x)) # Raises for nan and inf like the built-in round
+ * 
+ * def magnitude(Vector2 v):             # <<<<<<<<<<<<<<
+ *     return det_hypot(v.x, v.y)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("nalpy.math._c_extensions.deterministic.magnitude", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "nalpy/math/_c_extensions/deterministic.pyx":60
+ *     return det_hypot(v.x, v.y)
+ * 
+ * @cython.cdivision(True)             # <<<<<<<<<<<<<<
+ * def normalized(Vector2 v):
+ *     cdef double magnitude = det_hypot(v.x, v.y)
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5nalpy_4math_13_c_extensions_13deterministic_11normalized(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyMethodDef __pyx_mdef_5nalpy_4math_13_c_extensions_13deterministic_11normalized = {"normalized", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_5nalpy_4math_13_c_extensions_13deterministic_11normalized, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_5nalpy_4math_13_c_extensions_13deterministic_11normalized(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *__pyx_v_v = 0;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[1] = {0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("normalized (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_v,0};
+    if (__pyx_kwds) {
+      Py_ssize_t kw_args;
+      switch (__pyx_nargs) {
+        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
+      switch (__pyx_nargs) {
+        case  0:
+        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_v)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 60, __pyx_L3_error)
+        else goto __pyx_L5_argtuple_error;
+      }
+      if (unlikely(kw_args > 0)) {
+        const Py_ssize_t kwd_pos_args = __pyx_nargs;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "normalized") < 0)) __PYX_ERR(0, 60, __pyx_L3_error)
+      }
+    } else if (unlikely(__pyx_nargs != 1)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+    }
+    __pyx_v_v = ((struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *)values[0]);
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("normalized", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 60, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_AddTraceback("nalpy.math._c_extensions.deterministic.normalized", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_v), __pyx_ptype_5nalpy_4math_13_c_extensions_7vector2_Vector2, 1, "v", 0))) __PYX_ERR(0, 61, __pyx_L1_error)
+  __pyx_r = __pyx_pf_5nalpy_4math_13_c_extensions_13deterministic_10normalized(__pyx_self, __pyx_v_v);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5nalpy_4math_13_c_extensions_13deterministic_10normalized(CYTHON_UNUSED PyObject *__pyx_self, struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *__pyx_v_v) {
+  double __pyx_v_magnitude;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("normalized", 1);
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":62
+ * @cython.cdivision(True)
+ * def normalized(Vector2 v):
+ *     cdef double magnitude = det_hypot(v.x, v.y)             # <<<<<<<<<<<<<<
+ *     if magnitude == 0.0:
+ *         return _zero
+ */
+  __pyx_v_magnitude = __pyx_f_5nalpy_4math_13_c_extensions_14_deterministic_det_hypot(__pyx_v_v->x, __pyx_v_v->y);
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":63
+ * def normalized(Vector2 v):
+ *     cdef double magnitude = det_hypot(v.x, v.y)
+ *     if magnitude == 0.0:             # <<<<<<<<<<<<<<
+ *         return _zero
+ *     return new_vector2(v.x / magnitude, v.y / magnitude)
+ */
+  __pyx_t_1 = (__pyx_v_magnitude == 0.0);
+  if (__pyx_t_1) {
+
+    /* "nalpy/math/_c_extensions/deterministic.pyx":64
+ *     cdef double magnitude = det_hypot(v.x, v.y)
+ *     if magnitude == 0.0:
+ *         return _zero             # <<<<<<<<<<<<<<
+ *     return new_vector2(v.x / magnitude, v.y / magnitude)
+ * 
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF((PyObject *)__pyx_v_5nalpy_4math_13_c_extensions_13deterministic__zero);
+    __pyx_r = ((PyObject *)__pyx_v_5nalpy_4math_13_c_extensions_13deterministic__zero);
+    goto __pyx_L0;
+
+    /* "nalpy/math/_c_extensions/deterministic.pyx":63
+ * def normalized(Vector2 v):
+ *     cdef double magnitude = det_hypot(v.x, v.y)
+ *     if magnitude == 0.0:             # <<<<<<<<<<<<<<
+ *         return _zero
+ *     return new_vector2(v.x / magnitude, v.y / magnitude)
+ */
+  }
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":65
+ *     if magnitude == 0.0:
+ *         return _zero
+ *     return new_vector2(v.x / magnitude, v.y / magnitude)             # <<<<<<<<<<<<<<
+ * 
+ * def distance(Vector2 a, Vector2 b):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = ((PyObject *)__pyx_f_5nalpy_4math_13_c_extensions_7vector2_new_vector2((__pyx_v_v->x / __pyx_v_magnitude), (__pyx_v_v->y / __pyx_v_magnitude))); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 65, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":60
+ *     return det_hypot(v.x, v.y)
+ * 
+ * @cython.cdivision(True)             # <<<<<<<<<<<<<<
+ * def normalized(Vector2 v):
+ *     cdef double magnitude = det_hypot(v.x, v.y)
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("nalpy.math._c_extensions.deterministic.normalized", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "nalpy/math/_c_extensions/deterministic.pyx":67
+ *     return new_vector2(v.x / magnitude, v.y / magnitude)
+ * 
+ * def distance(Vector2 a, Vector2 b):             # <<<<<<<<<<<<<<
+ *     return det_hypot(a.x - b.x, a.y - b.y)
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5nalpy_4math_13_c_extensions_13deterministic_13distance(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyMethodDef __pyx_mdef_5nalpy_4math_13_c_extensions_13deterministic_13distance = {"distance", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_5nalpy_4math_13_c_extensions_13deterministic_13distance, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_5nalpy_4math_13_c_extensions_13deterministic_13distance(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *__pyx_v_a = 0;
+  struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *__pyx_v_b = 0;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[2] = {0,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("distance (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_a,&__pyx_n_s_b,0};
+    if (__pyx_kwds) {
+      Py_ssize_t kw_args;
+      switch (__pyx_nargs) {
+        case  2: values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
+      switch (__pyx_nargs) {
+        case  0:
+        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_a)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 67, __pyx_L3_error)
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_b)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[1]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 67, __pyx_L3_error)
+        else {
+          __Pyx_RaiseArgtupleInvalid("distance", 1, 2, 2, 1); __PYX_ERR(0, 67, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        const Py_ssize_t kwd_pos_args = __pyx_nargs;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "distance") < 0)) __PYX_ERR(0, 67, __pyx_L3_error)
+      }
+    } else if (unlikely(__pyx_nargs != 2)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+      values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+    }
+    __pyx_v_a = ((struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *)values[0]);
+    __pyx_v_b = ((struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *)values[1]);
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("distance", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 67, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_AddTraceback("nalpy.math._c_extensions.deterministic.distance", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_a), __pyx_ptype_5nalpy_4math_13_c_extensions_7vector2_Vector2, 1, "a", 0))) __PYX_ERR(0, 67, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_b), __pyx_ptype_5nalpy_4math_13_c_extensions_7vector2_Vector2, 1, "b", 0))) __PYX_ERR(0, 67, __pyx_L1_error)
+  __pyx_r = __pyx_pf_5nalpy_4math_13_c_extensions_13deterministic_12distance(__pyx_self, __pyx_v_a, __pyx_v_b);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5nalpy_4math_13_c_extensions_13deterministic_12distance(CYTHON_UNUSED PyObject *__pyx_self, struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *__pyx_v_a, struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *__pyx_v_b) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("distance", 1);
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":68
+ * 
+ * def distance(Vector2 a, Vector2 b):
+ *     return det_hypot(a.x - b.x, a.y - b.y)             # <<<<<<<<<<<<<<
+ * 
+ * def angle(Vector2 _from, Vector2 _to):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_f_5nalpy_4math_13_c_extensions_14_deterministic_det_hypot((__pyx_v_a->x - __pyx_v_b->x), (__pyx_v_a->y - __pyx_v_b->y))); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 68, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":67
+ *     return new_vector2(v.x / magnitude, v.y / magnitude)
+ * 
+ * def distance(Vector2 a, Vector2 b):             # <<<<<<<<<<<<<<
+ *     return det_hypot(a.x - b.x, a.y - b.y)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("nalpy.math._c_extensions.deterministic.distance", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "nalpy/math/_c_extensions/deterministic.pyx":70
+ *     return det_hypot(a.x - b.x, a.y - b.y)
+ * 
+ * def angle(Vector2 _from, Vector2 _to):             # <<<<<<<<<<<<<<
+ *     return _angle2(_from.x, _from.y, _to.x, _to.y)
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5nalpy_4math_13_c_extensions_13deterministic_15angle(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyMethodDef __pyx_mdef_5nalpy_4math_13_c_extensions_13deterministic_15angle = {"angle", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_5nalpy_4math_13_c_extensions_13deterministic_15angle, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_5nalpy_4math_13_c_extensions_13deterministic_15angle(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *__pyx_v__from = 0;
+  struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *__pyx_v__to = 0;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[2] = {0,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("angle (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_from,&__pyx_n_s_to,0};
+    if (__pyx_kwds) {
+      Py_ssize_t kw_args;
+      switch (__pyx_nargs) {
+        case  2: values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
+      switch (__pyx_nargs) {
+        case  0:
+        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_from)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 70, __pyx_L3_error)
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_to)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[1]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 70, __pyx_L3_error)
+        else {
+          __Pyx_RaiseArgtupleInvalid("angle", 1, 2, 2, 1); __PYX_ERR(0, 70, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        const Py_ssize_t kwd_pos_args = __pyx_nargs;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "angle") < 0)) __PYX_ERR(0, 70, __pyx_L3_error)
+      }
+    } else if (unlikely(__pyx_nargs != 2)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+      values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+    }
+    __pyx_v__from = ((struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *)values[0]);
+    __pyx_v__to = ((struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *)values[1]);
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("angle", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 70, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_AddTraceback("nalpy.math._c_extensions.deterministic.angle", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v__from), __pyx_ptype_5nalpy_4math_13_c_extensions_7vector2_Vector2, 1, "_from", 0))) __PYX_ERR(0, 70, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v__to), __pyx_ptype_5nalpy_4math_13_c_extensions_7vector2_Vector2, 1, "_to", 0))) __PYX_ERR(0, 70, __pyx_L1_error)
+  __pyx_r = __pyx_pf_5nalpy_4math_13_c_extensions_13deterministic_14angle(__pyx_self, __pyx_v__from, __pyx_v__to);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5nalpy_4math_13_c_extensions_13deterministic_14angle(CYTHON_UNUSED PyObject *__pyx_self, struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *__pyx_v__from, struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *__pyx_v__to) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("angle", 1);
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":71
+ * 
+ * def angle(Vector2 _from, Vector2 _to):
+ *     return _angle2(_from.x, _from.y, _to.x, _to.y)             # <<<<<<<<<<<<<<
+ * 
+ * def signed_angle(Vector2 _from, Vector2 _to):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_f_5nalpy_4math_13_c_extensions_13deterministic__angle2(__pyx_v__from->x, __pyx_v__from->y, __pyx_v__to->x, __pyx_v__to->y)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 71, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":70
+ *     return det_hypot(a.x - b.x, a.y - b.y)
+ * 
+ * def angle(Vector2 _from, Vector2 _to):             # <<<<<<<<<<<<<<
+ *     return _angle2(_from.x, _from.y, _to.x, _to.y)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("nalpy.math._c_extensions.deterministic.angle", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "nalpy/math/_c_extensions/deterministic.pyx":73
+ *     return _angle2(_from.x, _from.y, _to.x, _to.y)
+ * 
+ * def signed_angle(Vector2 _from, Vector2 _to):             # <<<<<<<<<<<<<<
+ *     cdef double unsigned_angle = _angle2(_from.x, _from.y, _to.x, _to.y)
+ *     if ((_from.x * _to.y) - (_from.y * _to.x)) < 0.0:
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5nalpy_4math_13_c_extensions_13deterministic_17signed_angle(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyMethodDef __pyx_mdef_5nalpy_4math_13_c_extensions_13deterministic_17signed_angle = {"signed_angle", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_5nalpy_4math_13_c_extensions_13deterministic_17signed_angle, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_5nalpy_4math_13_c_extensions_13deterministic_17signed_angle(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *__pyx_v__from = 0;
+  struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *__pyx_v__to = 0;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[2] = {0,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("signed_angle (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_from,&__pyx_n_s_to,0};
+    if (__pyx_kwds) {
+      Py_ssize_t kw_args;
+      switch (__pyx_nargs) {
+        case  2: values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
+      switch (__pyx_nargs) {
+        case  0:
+        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_from)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 73, __pyx_L3_error)
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_to)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[1]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 73, __pyx_L3_error)
+        else {
+          __Pyx_RaiseArgtupleInvalid("signed_angle", 1, 2, 2, 1); __PYX_ERR(0, 73, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        const Py_ssize_t kwd_pos_args = __pyx_nargs;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "signed_angle") < 0)) __PYX_ERR(0, 73, __pyx_L3_error)
+      }
+    } else if (unlikely(__pyx_nargs != 2)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+      values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+    }
+    __pyx_v__from = ((struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *)values[0]);
+    __pyx_v__to = ((struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *)values[1]);
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("signed_angle", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 73, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_AddTraceback("nalpy.math._c_extensions.deterministic.signed_angle", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v__from), __pyx_ptype_5nalpy_4math_13_c_extensions_7vector2_Vector2, 1, "_from", 0))) __PYX_ERR(0, 73, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v__to), __pyx_ptype_5nalpy_4math_13_c_extensions_7vector2_Vector2, 1, "_to", 0))) __PYX_ERR(0, 73, __pyx_L1_error)
+  __pyx_r = __pyx_pf_5nalpy_4math_13_c_extensions_13deterministic_16signed_angle(__pyx_self, __pyx_v__from, __pyx_v__to);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5nalpy_4math_13_c_extensions_13deterministic_16signed_angle(CYTHON_UNUSED PyObject *__pyx_self, struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *__pyx_v__from, struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *__pyx_v__to) {
+  double __pyx_v_unsigned_angle;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("signed_angle", 1);
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":74
+ * 
+ * def signed_angle(Vector2 _from, Vector2 _to):
+ *     cdef double unsigned_angle = _angle2(_from.x, _from.y, _to.x, _to.y)             # <<<<<<<<<<<<<<
+ *     if ((_from.x * _to.y) - (_from.y * _to.x)) < 0.0:
+ *         return -unsigned_angle
+ */
+  __pyx_v_unsigned_angle = __pyx_f_5nalpy_4math_13_c_extensions_13deterministic__angle2(__pyx_v__from->x, __pyx_v__from->y, __pyx_v__to->x, __pyx_v__to->y);
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":75
+ * def signed_angle(Vector2 _from, Vector2 _to):
+ *     cdef double unsigned_angle = _angle2(_from.x, _from.y, _to.x, _to.y)
+ *     if ((_from.x * _to.y) - (_from.y * _to.x)) < 0.0:             # <<<<<<<<<<<<<<
+ *         return -unsigned_angle
+ *     return unsigned_angle
+ */
+  __pyx_t_1 = (((__pyx_v__from->x * __pyx_v__to->y) - (__pyx_v__from->y * __pyx_v__to->x)) < 0.0);
+  if (__pyx_t_1) {
+
+    /* "nalpy/math/_c_extensions/deterministic.pyx":76
+ *     cdef double unsigned_angle = _angle2(_from.x, _from.y, _to.x, _to.y)
+ *     if ((_from.x * _to.y) - (_from.y * _to.x)) < 0.0:
+ *         return -unsigned_angle             # <<<<<<<<<<<<<<
+ *     return unsigned_angle
+ * 
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_2 = PyFloat_FromDouble((-__pyx_v_unsigned_angle)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 76, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+
+    /* "nalpy/math/_c_extensions/deterministic.pyx":75
+ * def signed_angle(Vector2 _from, Vector2 _to):
+ *     cdef double unsigned_angle = _angle2(_from.x, _from.y, _to.x, _to.y)
+ *     if ((_from.x * _to.y) - (_from.y * _to.x)) < 0.0:             # <<<<<<<<<<<<<<
+ *         return -unsigned_angle
+ *     return unsigned_angle
+ */
+  }
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":77
+ *     if ((_from.x * _to.y) - (_from.y * _to.x)) < 0.0:
+ *         return -unsigned_angle
+ *     return unsigned_angle             # <<<<<<<<<<<<<<
+ * 
+ * def move_towards(Vector2 current, Vector2 target, double max_distance_delta):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = PyFloat_FromDouble(__pyx_v_unsigned_angle); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 77, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":73
+ *     return _angle2(_from.x, _from.y, _to.x, _to.y)
+ * 
+ * def signed_angle(Vector2 _from, Vector2 _to):             # <<<<<<<<<<<<<<
+ *     cdef double unsigned_angle = _angle2(_from.x, _from.y, _to.x, _to.y)
+ *     if ((_from.x * _to.y) - (_from.y * _to.x)) < 0.0:
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("nalpy.math._c_extensions.deterministic.signed_angle", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "nalpy/math/_c_extensions/deterministic.pyx":79
+ *     return unsigned_angle
+ * 
+ * def move_towards(Vector2 current, Vector2 target, double max_distance_delta):             # <<<<<<<<<<<<<<
+ *     cdef double[2] out
+ *     cdef double dist = det_hypot(target.x - current.x, target.y - current.y)
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5nalpy_4math_13_c_extensions_13deterministic_19move_towards(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyMethodDef __pyx_mdef_5nalpy_4math_13_c_extensions_13deterministic_19move_towards = {"move_towards", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_5nalpy_4math_13_c_extensions_13deterministic_19move_towards, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_5nalpy_4math_13_c_extensions_13deterministic_19move_towards(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *__pyx_v_current = 0;
+  struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *__pyx_v_target = 0;
+  double __pyx_v_max_distance_delta;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[3] = {0,0,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("move_towards (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_current,&__pyx_n_s_target,&__pyx_n_s_max_distance_delta,0};
+    if (__pyx_kwds) {
+      Py_ssize_t kw_args;
+      switch (__pyx_nargs) {
+        case  3: values[2] = __Pyx_Arg_FASTCALL(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
+      switch (__pyx_nargs) {
+        case  0:
+        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_current)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 79, __pyx_L3_error)
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_target)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[1]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 79, __pyx_L3_error)
+        else {
+          __Pyx_RaiseArgtupleInvalid("move_towards", 1, 3, 3, 1); __PYX_ERR(0, 79, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_max_distance_delta)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[2]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 79, __pyx_L3_error)
+        else {
+          __Pyx_RaiseArgtupleInvalid("move_towards", 1, 3, 3, 2); __PYX_ERR(0, 79, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        const Py_ssize_t kwd_pos_args = __pyx_nargs;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "move_towards") < 0)) __PYX_ERR(0, 79, __pyx_L3_error)
+      }
+    } else if (unlikely(__pyx_nargs != 3)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+      values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+      values[2] = __Pyx_Arg_FASTCALL(__pyx_args, 2);
+    }
+    __pyx_v_current = ((struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *)values[0]);
+    __pyx_v_target = ((struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *)values[1]);
+    __pyx_v_max_distance_delta = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_max_distance_delta == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 79, __pyx_L3_error)
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("move_towards", 1, 3, 3, __pyx_nargs); __PYX_ERR(0, 79, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_AddTraceback("nalpy.math._c_extensions.deterministic.move_towards", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_current), __pyx_ptype_5nalpy_4math_13_c_extensions_7vector2_Vector2, 1, "current", 0))) __PYX_ERR(0, 79, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_target), __pyx_ptype_5nalpy_4math_13_c_extensions_7vector2_Vector2, 1, "target", 0))) __PYX_ERR(0, 79, __pyx_L1_error)
+  __pyx_r = __pyx_pf_5nalpy_4math_13_c_extensions_13deterministic_18move_towards(__pyx_self, __pyx_v_current, __pyx_v_target, __pyx_v_max_distance_delta);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5nalpy_4math_13_c_extensions_13deterministic_18move_towards(CYTHON_UNUSED PyObject *__pyx_self, struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *__pyx_v_current, struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *__pyx_v_target, double __pyx_v_max_distance_delta) {
+  double __pyx_v_out[2];
+  double __pyx_v_dist;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("move_towards", 1);
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":81
+ * def move_towards(Vector2 current, Vector2 target, double max_distance_delta):
+ *     cdef double[2] out
+ *     cdef double dist = det_hypot(target.x - current.x, target.y - current.y)             # <<<<<<<<<<<<<<
+ *     if move_towards2_dist(current.x, current.y, target.x, target.y, dist, max_distance_delta, out):
+ *         return target
+ */
+  __pyx_v_dist = __pyx_f_5nalpy_4math_13_c_extensions_14_deterministic_det_hypot((__pyx_v_target->x - __pyx_v_current->x), (__pyx_v_target->y - __pyx_v_current->y));
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":82
+ *     cdef double[2] out
+ *     cdef double dist = det_hypot(target.x - current.x, target.y - current.y)
+ *     if move_towards2_dist(current.x, current.y, target.x, target.y, dist, max_distance_delta, out):             # <<<<<<<<<<<<<<
+ *         return target
+ *     return new_vector2(out[0], out[1])
+ */
+  __pyx_t_1 = __pyx_f_5nalpy_4math_13_c_extensions_7vector2_move_towards2_dist(__pyx_v_current->x, __pyx_v_current->y, __pyx_v_target->x, __pyx_v_target->y, __pyx_v_dist, __pyx_v_max_distance_delta, __pyx_v_out);
+  if (__pyx_t_1) {
+
+    /* "nalpy/math/_c_extensions/deterministic.pyx":83
+ *     cdef double dist = det_hypot(target.x - current.x, target.y - current.y)
+ *     if move_towards2_dist(current.x, current.y, target.x, target.y, dist, max_distance_delta, out):
+ *         return target             # <<<<<<<<<<<<<<
+ *     return new_vector2(out[0], out[1])
+ * 
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF((PyObject *)__pyx_v_target);
+    __pyx_r = ((PyObject *)__pyx_v_target);
+    goto __pyx_L0;
+
+    /* "nalpy/math/_c_extensions/deterministic.pyx":82
+ *     cdef double[2] out
+ *     cdef double dist = det_hypot(target.x - current.x, target.y - current.y)
+ *     if move_towards2_dist(current.x, current.y, target.x, target.y, dist, max_distance_delta, out):             # <<<<<<<<<<<<<<
+ *         return target
+ *     return new_vector2(out[0], out[1])
+ */
+  }
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":84
+ *     if move_towards2_dist(current.x, current.y, target.x, target.y, dist, max_distance_delta, out):
+ *         return target
+ *     return new_vector2(out[0], out[1])             # <<<<<<<<<<<<<<
+ * 
+ * def smooth_damp(Vector2 current, Vector2 target, MVector2 current_velocity, double smooth_time, double delta_time, double max_speed = <double>INFINITY):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = ((PyObject *)__pyx_f_5nalpy_4math_13_c_extensions_7vector2_new_vector2((__pyx_v_out[0]), (__pyx_v_out[1]))); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 84, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":79
+ *     return unsigned_angle
+ * 
+ * def move_towards(Vector2 current, Vector2 target, double max_distance_delta):             # <<<<<<<<<<<<<<
+ *     cdef double[2] out
+ *     cdef double dist = det_hypot(target.x - current.x, target.y - current.y)
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("nalpy.math._c_extensions.deterministic.move_towards", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "nalpy/math/_c_extensions/deterministic.pyx":86
+ *     return new_vector2(out[0], out[1])
+ * 
+ * def smooth_damp(Vector2 current, Vector2 target, MVector2 current_velocity, double smooth_time, double delta_time, double max_speed = <double>INFINITY):             # <<<<<<<<<<<<<<
+ *     cdef double[2] velocity = [current_velocity.x, current_velocity.y]
+ *     cdef double[2] output
+ */
+
+static PyObject *__pyx_pf_5nalpy_4math_13_c_extensions_13deterministic_24__defaults__(CYTHON_UNUSED PyObject *__pyx_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__defaults__", 1);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyFloat_FromDouble(__Pyx_CyFunction_Defaults(__pyx_defaults, __pyx_self)->__pyx_arg_max_speed); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 86, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 86, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_1);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_1)) __PYX_ERR(0, 86, __pyx_L1_error);
+  __pyx_t_1 = 0;
+  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 86, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_2);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_2)) __PYX_ERR(0, 86, __pyx_L1_error);
+  __Pyx_INCREF(Py_None);
+  __Pyx_GIVEREF(Py_None);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 1, Py_None)) __PYX_ERR(0, 86, __pyx_L1_error);
+  __pyx_t_2 = 0;
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("nalpy.math._c_extensions.deterministic.__defaults__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5nalpy_4math_13_c_extensions_13deterministic_21smooth_damp(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyMethodDef __pyx_mdef_5nalpy_4math_13_c_extensions_13deterministic_21smooth_damp = {"smooth_damp", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_5nalpy_4math_13_c_extensions_13deterministic_21smooth_damp, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_5nalpy_4math_13_c_extensions_13deterministic_21smooth_damp(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *__pyx_v_current = 0;
+  struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *__pyx_v_target = 0;
+  struct __pyx_obj_5nalpy_4math_13_c_extensions_8mvector2_MVector2 *__pyx_v_current_velocity = 0;
+  double __pyx_v_smooth_time;
+  double __pyx_v_delta_time;
+  double __pyx_v_max_speed;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[6] = {0,0,0,0,0,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("smooth_damp (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_current,&__pyx_n_s_target,&__pyx_n_s_current_velocity,&__pyx_n_s_smooth_time,&__pyx_n_s_delta_time,&__pyx_n_s_max_speed,0};
+    __pyx_defaults *__pyx_dynamic_args = __Pyx_CyFunction_Defaults(__pyx_defaults, __pyx_self);
+    if (__pyx_kwds) {
+      Py_ssize_t kw_args;
+      switch (__pyx_nargs) {
+        case  6: values[5] = __Pyx_Arg_FASTCALL(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = __Pyx_Arg_FASTCALL(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = __Pyx_Arg_FASTCALL(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = __Pyx_Arg_FASTCALL(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
+      switch (__pyx_nargs) {
+        case  0:
+        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_current)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 86, __pyx_L3_error)
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_target)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[1]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 86, __pyx_L3_error)
+        else {
+          __Pyx_RaiseArgtupleInvalid("smooth_damp", 0, 5, 6, 1); __PYX_ERR(0, 86, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_current_velocity)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[2]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 86, __pyx_L3_error)
+        else {
+          __Pyx_RaiseArgtupleInvalid("smooth_damp", 0, 5, 6, 2); __PYX_ERR(0, 86, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (likely((values[3] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_smooth_time)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[3]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 86, __pyx_L3_error)
+        else {
+          __Pyx_RaiseArgtupleInvalid("smooth_damp", 0, 5, 6, 3); __PYX_ERR(0, 86, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  4:
+        if (likely((values[4] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_delta_time)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[4]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 86, __pyx_L3_error)
+        else {
+          __Pyx_RaiseArgtupleInvalid("smooth_damp", 0, 5, 6, 4); __PYX_ERR(0, 86, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  5:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_max_speed);
+          if (value) { values[5] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 86, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        const Py_ssize_t kwd_pos_args = __pyx_nargs;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "smooth_damp") < 0)) __PYX_ERR(0, 86, __pyx_L3_error)
+      }
+    } else {
+      switch (__pyx_nargs) {
+        case  6: values[5] = __Pyx_Arg_FASTCALL(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = __Pyx_Arg_FASTCALL(__pyx_args, 4);
+        values[3] = __Pyx_Arg_FASTCALL(__pyx_args, 3);
+        values[2] = __Pyx_Arg_FASTCALL(__pyx_args, 2);
+        values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+        values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_current = ((struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *)values[0]);
+    __pyx_v_target = ((struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *)values[1]);
+    __pyx_v_current_velocity = ((struct __pyx_obj_5nalpy_4math_13_c_extensions_8mvector2_MVector2 *)values[2]);
+    __pyx_v_smooth_time = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_smooth_time == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 86, __pyx_L3_error)
+    __pyx_v_delta_time = __pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_delta_time == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 86, __pyx_L3_error)
+    if (values[5]) {
+      __pyx_v_max_speed = __pyx_PyFloat_AsDouble(values[5]); if (unlikely((__pyx_v_max_speed == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 86, __pyx_L3_error)
+    } else {
+      __pyx_v_max_speed = __pyx_dynamic_args->__pyx_arg_max_speed;
+    }
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("smooth_damp", 0, 5, 6, __pyx_nargs); __PYX_ERR(0, 86, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_AddTraceback("nalpy.math._c_extensions.deterministic.smooth_damp", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_current), __pyx_ptype_5nalpy_4math_13_c_extensions_7vector2_Vector2, 1, "current", 0))) __PYX_ERR(0, 86, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_target), __pyx_ptype_5nalpy_4math_13_c_extensions_7vector2_Vector2, 1, "target", 0))) __PYX_ERR(0, 86, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_current_velocity), __pyx_ptype_5nalpy_4math_13_c_extensions_8mvector2_MVector2, 1, "current_velocity", 0))) __PYX_ERR(0, 86, __pyx_L1_error)
+  __pyx_r = __pyx_pf_5nalpy_4math_13_c_extensions_13deterministic_20smooth_damp(__pyx_self, __pyx_v_current, __pyx_v_target, __pyx_v_current_velocity, __pyx_v_smooth_time, __pyx_v_delta_time, __pyx_v_max_speed);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5nalpy_4math_13_c_extensions_13deterministic_20smooth_damp(CYTHON_UNUSED PyObject *__pyx_self, struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *__pyx_v_current, struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *__pyx_v_target, struct __pyx_obj_5nalpy_4math_13_c_extensions_8mvector2_MVector2 *__pyx_v_current_velocity, double __pyx_v_smooth_time, double __pyx_v_delta_time, double __pyx_v_max_speed) {
+  double __pyx_v_velocity[2];
+  double __pyx_v_output[2];
+  double __pyx_v_dist;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  double __pyx_t_1[2];
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("smooth_damp", 1);
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":87
+ * 
+ * def smooth_damp(Vector2 current, Vector2 target, MVector2 current_velocity, double smooth_time, double delta_time, double max_speed = <double>INFINITY):
+ *     cdef double[2] velocity = [current_velocity.x, current_velocity.y]             # <<<<<<<<<<<<<<
+ *     cdef double[2] output
+ *     cdef double dist = det_hypot(current.x - target.x, current.y - target.y)
+ */
+  __pyx_t_1[0] = __pyx_v_current_velocity->x;
+  __pyx_t_1[1] = __pyx_v_current_velocity->y;
+  memcpy(&(__pyx_v_velocity[0]), __pyx_t_1, sizeof(__pyx_v_velocity[0]) * (2));
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":89
+ *     cdef double[2] velocity = [current_velocity.x, current_velocity.y]
+ *     cdef double[2] output
+ *     cdef double dist = det_hypot(current.x - target.x, current.y - target.y)             # <<<<<<<<<<<<<<
+ *     smooth_damp2_dist(current.x, current.y, target.x, target.y, dist, velocity, smooth_time, delta_time, max_speed, output)
+ * 
+ */
+  __pyx_v_dist = __pyx_f_5nalpy_4math_13_c_extensions_14_deterministic_det_hypot((__pyx_v_current->x - __pyx_v_target->x), (__pyx_v_current->y - __pyx_v_target->y));
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":90
+ *     cdef double[2] output
+ *     cdef double dist = det_hypot(current.x - target.x, current.y - target.y)
+ *     smooth_damp2_dist(current.x, current.y, target.x, target.y, dist, velocity, smooth_time, delta_time, max_speed, output)             # <<<<<<<<<<<<<<
+ * 
+ *     current_velocity.x = velocity[0]
+ */
+  __pyx_f_5nalpy_4math_13_c_extensions_7vector2_smooth_damp2_dist(__pyx_v_current->x, __pyx_v_current->y, __pyx_v_target->x, __pyx_v_target->y, __pyx_v_dist, __pyx_v_velocity, __pyx_v_smooth_time, __pyx_v_delta_time, __pyx_v_max_speed, __pyx_v_output);
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":92
+ *     smooth_damp2_dist(current.x, current.y, target.x, target.y, dist, velocity, smooth_time, delta_time, max_speed, output)
+ * 
+ *     current_velocity.x = velocity[0]             # <<<<<<<<<<<<<<
+ *     current_velocity.y = velocity[1]
+ *     return new_vector2(output[0], output[1])
+ */
+  __pyx_v_current_velocity->x = (__pyx_v_velocity[0]);
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":93
+ * 
+ *     current_velocity.x = velocity[0]
+ *     current_velocity.y = velocity[1]             # <<<<<<<<<<<<<<
+ *     return new_vector2(output[0], output[1])
+ * 
+ */
+  __pyx_v_current_velocity->y = (__pyx_v_velocity[1]);
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":94
+ *     current_velocity.x = velocity[0]
+ *     current_velocity.y = velocity[1]
+ *     return new_vector2(output[0], output[1])             # <<<<<<<<<<<<<<
+ * 
+ * def round_vector(Vector2 v):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = ((PyObject *)__pyx_f_5nalpy_4math_13_c_extensions_7vector2_new_vector2((__pyx_v_output[0]), (__pyx_v_output[1]))); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 94, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":86
+ *     return new_vector2(out[0], out[1])
+ * 
+ * def smooth_damp(Vector2 current, Vector2 target, MVector2 current_velocity, double smooth_time, double delta_time, double max_speed = <double>INFINITY):             # <<<<<<<<<<<<<<
+ *     cdef double[2] velocity = [current_velocity.x, current_velocity.y]
+ *     cdef double[2] output
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("nalpy.math._c_extensions.deterministic.smooth_damp", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "nalpy/math/_c_extensions/deterministic.pyx":96
+ *     return new_vector2(output[0], output[1])
+ * 
+ * def round_vector(Vector2 v):             # <<<<<<<<<<<<<<
+ *     return new_vector2_int(_to_int(det_round(v.x)), _to_int(det_round(v.y)))
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5nalpy_4math_13_c_extensions_13deterministic_23round_vector(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyMethodDef __pyx_mdef_5nalpy_4math_13_c_extensions_13deterministic_23round_vector = {"round_vector", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_5nalpy_4math_13_c_extensions_13deterministic_23round_vector, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_5nalpy_4math_13_c_extensions_13deterministic_23round_vector(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *__pyx_v_v = 0;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[1] = {0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("round_vector (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_v,0};
+    if (__pyx_kwds) {
+      Py_ssize_t kw_args;
+      switch (__pyx_nargs) {
+        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
+      switch (__pyx_nargs) {
+        case  0:
+        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_v)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 96, __pyx_L3_error)
+        else goto __pyx_L5_argtuple_error;
+      }
+      if (unlikely(kw_args > 0)) {
+        const Py_ssize_t kwd_pos_args = __pyx_nargs;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "round_vector") < 0)) __PYX_ERR(0, 96, __pyx_L3_error)
+      }
+    } else if (unlikely(__pyx_nargs != 1)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+    }
+    __pyx_v_v = ((struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *)values[0]);
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("round_vector", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 96, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_AddTraceback("nalpy.math._c_extensions.deterministic.round_vector", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_v), __pyx_ptype_5nalpy_4math_13_c_extensions_7vector2_Vector2, 1, "v", 0))) __PYX_ERR(0, 96, __pyx_L1_error)
+  __pyx_r = __pyx_pf_5nalpy_4math_13_c_extensions_13deterministic_22round_vector(__pyx_self, __pyx_v_v);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5nalpy_4math_13_c_extensions_13deterministic_22round_vector(CYTHON_UNUSED PyObject *__pyx_self, struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *__pyx_v_v) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PY_LONG_LONG __pyx_t_1;
+  PY_LONG_LONG __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("round_vector", 1);
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":97
+ * 
+ * def round_vector(Vector2 v):
+ *     return new_vector2_int(_to_int(det_round(v.x)), _to_int(det_round(v.y)))             # <<<<<<<<<<<<<<
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_f_5nalpy_4math_13_c_extensions_13deterministic__to_int(__pyx_f_5nalpy_4math_13_c_extensions_14_deterministic_det_round(__pyx_v_v->x)); if (unlikely(__pyx_t_1 == ((PY_LONG_LONG)-1LL) && PyErr_Occurred())) __PYX_ERR(0, 97, __pyx_L1_error)
+  __pyx_t_2 = __pyx_f_5nalpy_4math_13_c_extensions_13deterministic__to_int(__pyx_f_5nalpy_4math_13_c_extensions_14_deterministic_det_round(__pyx_v_v->y)); if (unlikely(__pyx_t_2 == ((PY_LONG_LONG)-1LL) && PyErr_Occurred())) __PYX_ERR(0, 97, __pyx_L1_error)
+  __pyx_t_3 = ((PyObject *)__pyx_f_5nalpy_4math_13_c_extensions_11vector2_int_new_vector2_int(__pyx_t_1, __pyx_t_2)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 97, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_r = __pyx_t_3;
+  __pyx_t_3 = 0;
+  goto __pyx_L0;
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":96
+ *     return new_vector2(output[0], output[1])
+ * 
+ * def round_vector(Vector2 v):             # <<<<<<<<<<<<<<
+ *     return new_vector2_int(_to_int(det_round(v.x)), _to_int(det_round(v.y)))
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("nalpy.math._c_extensions.deterministic.round_vector", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyMethodDef __pyx_methods[] = {
+  {0, 0, 0, 0}
+};
+#ifndef CYTHON_SMALL_CODE
+#if defined(__clang__)
+    #define CYTHON_SMALL_CODE
+#elif defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 3))
+    #define CYTHON_SMALL_CODE __attribute__((cold))
+#else
+    #define CYTHON_SMALL_CODE
+#endif
+#endif
+/* #### Code section: pystring_table ### */
+
+static int __Pyx_CreateStringTabAndInitStrings(void) {
+  __Pyx_StringTabEntry __pyx_string_tab[] = {
+    {&__pyx_kp_u_Cannot_convert_float_NaN_to_inte, __pyx_k_Cannot_convert_float_NaN_to_inte, sizeof(__pyx_k_Cannot_convert_float_NaN_to_inte), 0, 1, 0, 0},
+    {&__pyx_n_s_OverflowError, __pyx_k_OverflowError, sizeof(__pyx_k_OverflowError), 0, 0, 1, 1},
+    {&__pyx_kp_u_Result_does_not_fit_into_a_64_bi, __pyx_k_Result_does_not_fit_into_a_64_bi, sizeof(__pyx_k_Result_does_not_fit_into_a_64_bi), 0, 1, 0, 0},
+    {&__pyx_n_s_ValueError, __pyx_k_ValueError, sizeof(__pyx_k_ValueError), 0, 0, 1, 1},
+    {&__pyx_n_s__26, __pyx_k__26, sizeof(__pyx_k__26), 0, 0, 1, 1},
+    {&__pyx_n_s_a, __pyx_k_a, sizeof(__pyx_k_a), 0, 0, 1, 1},
+    {&__pyx_n_s_acos, __pyx_k_acos, sizeof(__pyx_k_acos), 0, 0, 1, 1},
+    {&__pyx_n_s_angle, __pyx_k_angle, sizeof(__pyx_k_angle), 0, 0, 1, 1},
+    {&__pyx_n_s_asyncio_coroutines, __pyx_k_asyncio_coroutines, sizeof(__pyx_k_asyncio_coroutines), 0, 0, 1, 1},
+    {&__pyx_n_s_atan2, __pyx_k_atan2, sizeof(__pyx_k_atan2), 0, 0, 1, 1},
+    {&__pyx_n_s_b, __pyx_k_b, sizeof(__pyx_k_b), 0, 0, 1, 1},
+    {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
+    {&__pyx_n_s_current, __pyx_k_current, sizeof(__pyx_k_current), 0, 0, 1, 1},
+    {&__pyx_n_s_current_velocity, __pyx_k_current_velocity, sizeof(__pyx_k_current_velocity), 0, 0, 1, 1},
+    {&__pyx_n_s_delta_time, __pyx_k_delta_time, sizeof(__pyx_k_delta_time), 0, 0, 1, 1},
+    {&__pyx_n_s_dist, __pyx_k_dist, sizeof(__pyx_k_dist), 0, 0, 1, 1},
+    {&__pyx_n_s_distance, __pyx_k_distance, sizeof(__pyx_k_distance), 0, 0, 1, 1},
+    {&__pyx_n_s_from, __pyx_k_from, sizeof(__pyx_k_from), 0, 0, 1, 1},
+    {&__pyx_n_s_hypot, __pyx_k_hypot, sizeof(__pyx_k_hypot), 0, 0, 1, 1},
+    {&__pyx_n_s_is_coroutine, __pyx_k_is_coroutine, sizeof(__pyx_k_is_coroutine), 0, 0, 1, 1},
+    {&__pyx_n_s_magnitude, __pyx_k_magnitude, sizeof(__pyx_k_magnitude), 0, 0, 1, 1},
+    {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
+    {&__pyx_kp_u_math_domain_error, __pyx_k_math_domain_error, sizeof(__pyx_k_math_domain_error), 0, 1, 0, 0},
+    {&__pyx_n_s_max_distance_delta, __pyx_k_max_distance_delta, sizeof(__pyx_k_max_distance_delta), 0, 0, 1, 1},
+    {&__pyx_n_s_max_speed, __pyx_k_max_speed, sizeof(__pyx_k_max_speed), 0, 0, 1, 1},
+    {&__pyx_n_s_move_towards, __pyx_k_move_towards, sizeof(__pyx_k_move_towards), 0, 0, 1, 1},
+    {&__pyx_kp_s_nalpy_math__c_extensions_determi, __pyx_k_nalpy_math__c_extensions_determi, sizeof(__pyx_k_nalpy_math__c_extensions_determi), 0, 0, 1, 0},
+    {&__pyx_n_s_nalpy_math__c_extensions_determi_2, __pyx_k_nalpy_math__c_extensions_determi_2, sizeof(__pyx_k_nalpy_math__c_extensions_determi_2), 0, 0, 1, 1},
+    {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
+    {&__pyx_n_s_normalized, __pyx_k_normalized, sizeof(__pyx_k_normalized), 0, 0, 1, 1},
+    {&__pyx_n_s_out, __pyx_k_out, sizeof(__pyx_k_out), 0, 0, 1, 1},
+    {&__pyx_n_s_output, __pyx_k_output, sizeof(__pyx_k_output), 0, 0, 1, 1},
+    {&__pyx_n_s_pyx_vtable, __pyx_k_pyx_vtable, sizeof(__pyx_k_pyx_vtable), 0, 0, 1, 1},
+    {&__pyx_n_s_round, __pyx_k_round, sizeof(__pyx_k_round), 0, 0, 1, 1},
+    {&__pyx_n_s_round_vector, __pyx_k_round_vector, sizeof(__pyx_k_round_vector), 0, 0, 1, 1},
+    {&__pyx_n_s_signed_angle, __pyx_k_signed_angle, sizeof(__pyx_k_signed_angle), 0, 0, 1, 1},
+    {&__pyx_n_s_smooth_damp, __pyx_k_smooth_damp, sizeof(__pyx_k_smooth_damp), 0, 0, 1, 1},
+    {&__pyx_n_s_smooth_time, __pyx_k_smooth_time, sizeof(__pyx_k_smooth_time), 0, 0, 1, 1},
+    {&__pyx_n_s_target, __pyx_k_target, sizeof(__pyx_k_target), 0, 0, 1, 1},
+    {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
+    {&__pyx_n_s_to, __pyx_k_to, sizeof(__pyx_k_to), 0, 0, 1, 1},
+    {&__pyx_n_s_unsigned_angle, __pyx_k_unsigned_angle, sizeof(__pyx_k_unsigned_angle), 0, 0, 1, 1},
+    {&__pyx_n_s_v, __pyx_k_v, sizeof(__pyx_k_v), 0, 0, 1, 1},
+    {&__pyx_n_s_velocity, __pyx_k_velocity, sizeof(__pyx_k_velocity), 0, 0, 1, 1},
+    {&__pyx_n_s_x, __pyx_k_x, sizeof(__pyx_k_x), 0, 0, 1, 1},
+    {&__pyx_n_s_y, __pyx_k_y, sizeof(__pyx_k_y), 0, 0, 1, 1},
+    {0, 0, 0, 0, 0, 0, 0}
+  };
+  return __Pyx_InitStrings(__pyx_string_tab);
+}
+/* #### Code section: cached_builtins ### */
+static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
+  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(0, 23, __pyx_L1_error)
+  __pyx_builtin_OverflowError = __Pyx_GetBuiltinName(__pyx_n_s_OverflowError); if (!__pyx_builtin_OverflowError) __PYX_ERR(0, 25, __pyx_L1_error)
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+/* #### Code section: cached_constants ### */
+
+static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":23
+ * cdef long long _to_int(double value) except? -1:
+ *     if isnan(value):
+ *         raise ValueError("Cannot convert float NaN to integer.")             # <<<<<<<<<<<<<<
+ *     if not (value >= -_LIMIT and value < _LIMIT):
+ *         raise OverflowError("Result does not fit into a 64-bit integer.")
+ */
+  __pyx_tuple_ = PyTuple_Pack(1, __pyx_kp_u_Cannot_convert_float_NaN_to_inte); if (unlikely(!__pyx_tuple_)) __PYX_ERR(0, 23, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple_);
+  __Pyx_GIVEREF(__pyx_tuple_);
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":25
+ *         raise ValueError("Cannot convert float NaN to integer.")
+ *     if not (value >= -_LIMIT and value < _LIMIT):
+ *         raise OverflowError("Result does not fit into a 64-bit integer.")             # <<<<<<<<<<<<<<
+ *     return <long long>value
+ * 
+ */
+  __pyx_tuple__2 = PyTuple_Pack(1, __pyx_kp_u_Result_does_not_fit_into_a_64_bi); if (unlikely(!__pyx_tuple__2)) __PYX_ERR(0, 25, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__2);
+  __Pyx_GIVEREF(__pyx_tuple__2);
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":48
+ * def acos(double x, /):
+ *     if fabs(x) > 1.0: # Same error as math.acos, nan is passed through
+ *         raise ValueError("math domain error")             # <<<<<<<<<<<<<<
+ *     return det_acos(x)
+ * 
+ */
+  __pyx_tuple__3 = PyTuple_Pack(1, __pyx_kp_u_math_domain_error); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(0, 48, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__3);
+  __Pyx_GIVEREF(__pyx_tuple__3);
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":43
+ *     return det_acos(cos_val) * (180.0 / 3.14159265358979323846)
+ * 
+ * def hypot(double x, double y, /):             # <<<<<<<<<<<<<<
+ *     return det_hypot(x, y)
+ * 
+ */
+  __pyx_tuple__4 = PyTuple_Pack(2, __pyx_n_s_x, __pyx_n_s_y); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(0, 43, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__4);
+  __Pyx_GIVEREF(__pyx_tuple__4);
+  __pyx_codeobj__5 = (PyObject*)__Pyx_PyCode_New(2, 2, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__4, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_nalpy_math__c_extensions_determi, __pyx_n_s_hypot, 43, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__5)) __PYX_ERR(0, 43, __pyx_L1_error)
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":46
+ *     return det_hypot(x, y)
+ * 
+ * def acos(double x, /):             # <<<<<<<<<<<<<<
+ *     if fabs(x) > 1.0: # Same error as math.acos, nan is passed through
+ *         raise ValueError("math domain error")
+ */
+  __pyx_tuple__6 = PyTuple_Pack(2, __pyx_n_s_x, __pyx_n_s_x); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(0, 46, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__6);
+  __Pyx_GIVEREF(__pyx_tuple__6);
+  __pyx_codeobj__7 = (PyObject*)__Pyx_PyCode_New(1, 1, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__6, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_nalpy_math__c_extensions_determi, __pyx_n_s_acos, 46, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__7)) __PYX_ERR(0, 46, __pyx_L1_error)
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":51
+ *     return det_acos(x)
+ * 
+ * def atan2(double y, double x, /):             # <<<<<<<<<<<<<<
+ *     return det_atan2(y, x)
+ * 
+ */
+  __pyx_tuple__8 = PyTuple_Pack(2, __pyx_n_s_y, __pyx_n_s_x); if (unlikely(!__pyx_tuple__8)) __PYX_ERR(0, 51, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__8);
+  __Pyx_GIVEREF(__pyx_tuple__8);
+  __pyx_codeobj__9 = (PyObject*)__Pyx_PyCode_New(2, 2, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__8, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_nalpy_math__c_extensions_determi, __pyx_n_s_atan2, 51, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__9)) __PYX_ERR(0, 51, __pyx_L1_error)
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":54
+ *     return det_atan2(y, x)
+ * 
+ * def round(double x, /):             # <<<<<<<<<<<<<<
+ *     return PyLong_FromDouble(det_round(x)) # Raises for nan and inf like the built-in round
+ * 
+ */
+  __pyx_codeobj__10 = (PyObject*)__Pyx_PyCode_New(1, 1, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__6, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_nalpy_math__c_extensions_determi, __pyx_n_s_round, 54, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__10)) __PYX_ERR(0, 54, __pyx_L1_error)
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":57
+ *     return PyLong_FromDouble(det_round(x)) # Raises for nan and inf like the built-in round
+ * 
+ * def magnitude(Vector2 v):             # <<<<<<<<<<<<<<
+ *     return det_hypot(v.x, v.y)
+ * 
+ */
+  __pyx_tuple__11 = PyTuple_Pack(1, __pyx_n_s_v); if (unlikely(!__pyx_tuple__11)) __PYX_ERR(0, 57, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__11);
+  __Pyx_GIVEREF(__pyx_tuple__11);
+  __pyx_codeobj__12 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__11, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_nalpy_math__c_extensions_determi, __pyx_n_s_magnitude, 57, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__12)) __PYX_ERR(0, 57, __pyx_L1_error)
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":60
+ *     return det_hypot(v.x, v.y)
+ * 
+ * @cython.cdivision(True)             # <<<<<<<<<<<<<<
+ * def normalized(Vector2 v):
+ *     cdef double magnitude = det_hypot(v.x, v.y)
+ */
+  __pyx_tuple__13 = PyTuple_Pack(2, __pyx_n_s_v, __pyx_n_s_magnitude); if (unlikely(!__pyx_tuple__13)) __PYX_ERR(0, 60, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__13);
+  __Pyx_GIVEREF(__pyx_tuple__13);
+  __pyx_codeobj__14 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__13, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_nalpy_math__c_extensions_determi, __pyx_n_s_normalized, 60, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__14)) __PYX_ERR(0, 60, __pyx_L1_error)
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":67
+ *     return new_vector2(v.x / magnitude, v.y / magnitude)
+ * 
+ * def distance(Vector2 a, Vector2 b):             # <<<<<<<<<<<<<<
+ *     return det_hypot(a.x - b.x, a.y - b.y)
+ * 
+ */
+  __pyx_tuple__15 = PyTuple_Pack(2, __pyx_n_s_a, __pyx_n_s_b); if (unlikely(!__pyx_tuple__15)) __PYX_ERR(0, 67, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__15);
+  __Pyx_GIVEREF(__pyx_tuple__15);
+  __pyx_codeobj__16 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__15, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_nalpy_math__c_extensions_determi, __pyx_n_s_distance, 67, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__16)) __PYX_ERR(0, 67, __pyx_L1_error)
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":70
+ *     return det_hypot(a.x - b.x, a.y - b.y)
+ * 
+ * def angle(Vector2 _from, Vector2 _to):             # <<<<<<<<<<<<<<
+ *     return _angle2(_from.x, _from.y, _to.x, _to.y)
+ * 
+ */
+  __pyx_tuple__17 = PyTuple_Pack(2, __pyx_n_s_from, __pyx_n_s_to); if (unlikely(!__pyx_tuple__17)) __PYX_ERR(0, 70, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__17);
+  __Pyx_GIVEREF(__pyx_tuple__17);
+  __pyx_codeobj__18 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__17, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_nalpy_math__c_extensions_determi, __pyx_n_s_angle, 70, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__18)) __PYX_ERR(0, 70, __pyx_L1_error)
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":73
+ *     return _angle2(_from.x, _from.y, _to.x, _to.y)
+ * 
+ * def signed_angle(Vector2 _from, Vector2 _to):             # <<<<<<<<<<<<<<
+ *     cdef double unsigned_angle = _angle2(_from.x, _from.y, _to.x, _to.y)
+ *     if ((_from.x * _to.y) - (_from.y * _to.x)) < 0.0:
+ */
+  __pyx_tuple__19 = PyTuple_Pack(3, __pyx_n_s_from, __pyx_n_s_to, __pyx_n_s_unsigned_angle); if (unlikely(!__pyx_tuple__19)) __PYX_ERR(0, 73, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__19);
+  __Pyx_GIVEREF(__pyx_tuple__19);
+  __pyx_codeobj__20 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__19, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_nalpy_math__c_extensions_determi, __pyx_n_s_signed_angle, 73, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__20)) __PYX_ERR(0, 73, __pyx_L1_error)
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":79
+ *     return unsigned_angle
+ * 
+ * def move_towards(Vector2 current, Vector2 target, double max_distance_delta):             # <<<<<<<<<<<<<<
+ *     cdef double[2] out
+ *     cdef double dist = det_hypot(target.x - current.x, target.y - current.y)
+ */
+  __pyx_tuple__21 = PyTuple_Pack(5, __pyx_n_s_current, __pyx_n_s_target, __pyx_n_s_max_distance_delta, __pyx_n_s_out, __pyx_n_s_dist); if (unlikely(!__pyx_tuple__21)) __PYX_ERR(0, 79, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__21);
+  __Pyx_GIVEREF(__pyx_tuple__21);
+  __pyx_codeobj__22 = (PyObject*)__Pyx_PyCode_New(3, 0, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__21, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_nalpy_math__c_extensions_determi, __pyx_n_s_move_towards, 79, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__22)) __PYX_ERR(0, 79, __pyx_L1_error)
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":86
+ *     return new_vector2(out[0], out[1])
+ * 
+ * def smooth_damp(Vector2 current, Vector2 target, MVector2 current_velocity, double smooth_time, double delta_time, double max_speed = <double>INFINITY):             # <<<<<<<<<<<<<<
+ *     cdef double[2] velocity = [current_velocity.x, current_velocity.y]
+ *     cdef double[2] output
+ */
+  __pyx_tuple__23 = PyTuple_Pack(9, __pyx_n_s_current, __pyx_n_s_target, __pyx_n_s_current_velocity, __pyx_n_s_smooth_time, __pyx_n_s_delta_time, __pyx_n_s_max_speed, __pyx_n_s_velocity, __pyx_n_s_output, __pyx_n_s_dist); if (unlikely(!__pyx_tuple__23)) __PYX_ERR(0, 86, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__23);
+  __Pyx_GIVEREF(__pyx_tuple__23);
+  __pyx_codeobj__24 = (PyObject*)__Pyx_PyCode_New(6, 0, 0, 9, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__23, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_nalpy_math__c_extensions_determi, __pyx_n_s_smooth_damp, 86, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__24)) __PYX_ERR(0, 86, __pyx_L1_error)
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":96
+ *     return new_vector2(output[0], output[1])
+ * 
+ * def round_vector(Vector2 v):             # <<<<<<<<<<<<<<
+ *     return new_vector2_int(_to_int(det_round(v.x)), _to_int(det_round(v.y)))
+ */
+  __pyx_codeobj__25 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__11, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_nalpy_math__c_extensions_determi, __pyx_n_s_round_vector, 96, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__25)) __PYX_ERR(0, 96, __pyx_L1_error)
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+/* #### Code section: init_constants ### */
+
+static CYTHON_SMALL_CODE int __Pyx_InitConstants(void) {
+  if (__Pyx_CreateStringTabAndInitStrings() < 0) __PYX_ERR(0, 1, __pyx_L1_error);
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+/* #### Code section: init_globals ### */
+
+static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void) {
+  return 0;
+}
+/* #### Code section: init_module ### */
+
+static CYTHON_SMALL_CODE int __Pyx_modinit_global_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_import_code(void); /*proto*/
+
+static int __Pyx_modinit_global_init_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_global_init_code", 0);
+  /*--- Global init code ---*/
+  __pyx_v_5nalpy_4math_13_c_extensions_13deterministic__zero = ((struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *)Py_None); Py_INCREF(Py_None);
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_variable_export_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_export_code", 0);
+  /*--- Variable export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_function_export_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_export_code", 0);
+  /*--- Function export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_type_init_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_init_code", 0);
+  /*--- Type init code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_type_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_import_code", 0);
+  /*--- Type import code ---*/
+  __pyx_t_1 = PyImport_ImportModule("nalpy.math._c_extensions.mvector2"); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 3, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_5nalpy_4math_13_c_extensions_8mvector2_MVector2 = __Pyx_ImportType_3_0_11(__pyx_t_1, "nalpy.math._c_extensions.mvector2", "MVector2", sizeof(struct __pyx_obj_5nalpy_4math_13_c_extensions_8mvector2_MVector2), __PYX_GET_STRUCT_ALIGNMENT_3_0_11(struct __pyx_obj_5nalpy_4math_13_c_extensions_8mvector2_MVector2),__Pyx_ImportType_CheckSize_Warn_3_0_11); if (!__pyx_ptype_5nalpy_4math_13_c_extensions_8mvector2_MVector2) __PYX_ERR(1, 3, __pyx_L1_error)
+  __pyx_vtabptr_5nalpy_4math_13_c_extensions_8mvector2_MVector2 = (struct __pyx_vtabstruct_5nalpy_4math_13_c_extensions_8mvector2_MVector2*)__Pyx_GetVtable(__pyx_ptype_5nalpy_4math_13_c_extensions_8mvector2_MVector2); if (unlikely(!__pyx_vtabptr_5nalpy_4math_13_c_extensions_8mvector2_MVector2)) __PYX_ERR(1, 3, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("nalpy.math._c_extensions.vector2"); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 6, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_5nalpy_4math_13_c_extensions_7vector2_Vector2 = __Pyx_ImportType_3_0_11(__pyx_t_1, "nalpy.math._c_extensions.vector2", "Vector2", sizeof(struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2), __PYX_GET_STRUCT_ALIGNMENT_3_0_11(struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2),__Pyx_ImportType_CheckSize_Warn_3_0_11); if (!__pyx_ptype_5nalpy_4math_13_c_extensions_7vector2_Vector2) __PYX_ERR(2, 6, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("nalpy.math._c_extensions.vector2_int"); if (unlikely(!__pyx_t_1)) __PYX_ERR(3, 7, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_5nalpy_4math_13_c_extensions_11vector2_int_Vector2Int = __Pyx_ImportType_3_0_11(__pyx_t_1, "nalpy.math._c_extensions.vector2_int", "Vector2Int", sizeof(struct __pyx_obj_5nalpy_4math_13_c_extensions_11vector2_int_Vector2Int), __PYX_GET_STRUCT_ALIGNMENT_3_0_11(struct __pyx_obj_5nalpy_4math_13_c_extensions_11vector2_int_Vector2Int),__Pyx_ImportType_CheckSize_Warn_3_0_11); if (!__pyx_ptype_5nalpy_4math_13_c_extensions_11vector2_int_Vector2Int) __PYX_ERR(3, 7, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_variable_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_import_code", 0);
+  /*--- Variable import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_function_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_import_code", 0);
+  /*--- Function import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+
+#if PY_MAJOR_VERSION >= 3
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+static PyObject* __pyx_pymod_create(PyObject *spec, PyModuleDef *def); /*proto*/
+static int __pyx_pymod_exec_deterministic(PyObject* module); /*proto*/
+static PyModuleDef_Slot __pyx_moduledef_slots[] = {
+  {Py_mod_create, (void*)__pyx_pymod_create},
+  {Py_mod_exec, (void*)__pyx_pymod_exec_deterministic},
+  {0, NULL}
+};
+#endif
+
+#ifdef __cplusplus
+namespace {
+  struct PyModuleDef __pyx_moduledef =
+  #else
+  static struct PyModuleDef __pyx_moduledef =
+  #endif
+  {
+      PyModuleDef_HEAD_INIT,
+      "deterministic",
+      0, /* m_doc */
+    #if CYTHON_PEP489_MULTI_PHASE_INIT
+      0, /* m_size */
+    #elif CYTHON_USE_MODULE_STATE
+      sizeof(__pyx_mstate), /* m_size */
+    #else
+      -1, /* m_size */
+    #endif
+      __pyx_methods /* m_methods */,
+    #if CYTHON_PEP489_MULTI_PHASE_INIT
+      __pyx_moduledef_slots, /* m_slots */
+    #else
+      NULL, /* m_reload */
+    #endif
+    #if CYTHON_USE_MODULE_STATE
+      __pyx_m_traverse, /* m_traverse */
+      __pyx_m_clear, /* m_clear */
+      NULL /* m_free */
+    #else
+      NULL, /* m_traverse */
+      NULL, /* m_clear */
+      NULL /* m_free */
+    #endif
+  };
+  #ifdef __cplusplus
+} /* anonymous namespace */
+#endif
+#endif
+
+#ifndef CYTHON_NO_PYINIT_EXPORT
+#define __Pyx_PyMODINIT_FUNC PyMODINIT_FUNC
+#elif PY_MAJOR_VERSION < 3
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" void
+#else
+#define __Pyx_PyMODINIT_FUNC void
+#endif
+#else
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" PyObject *
+#else
+#define __Pyx_PyMODINIT_FUNC PyObject *
+#endif
+#endif
+
+
+#if PY_MAJOR_VERSION < 3
+__Pyx_PyMODINIT_FUNC initdeterministic(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC initdeterministic(void)
+#else
+__Pyx_PyMODINIT_FUNC PyInit_deterministic(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC PyInit_deterministic(void)
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+{
+  return PyModuleDef_Init(&__pyx_moduledef);
+}
+static CYTHON_SMALL_CODE int __Pyx_check_single_interpreter(void) {
+    #if PY_VERSION_HEX >= 0x030700A1
+    static PY_INT64_T main_interpreter_id = -1;
+    PY_INT64_T current_id = PyInterpreterState_GetID(PyThreadState_Get()->interp);
+    if (main_interpreter_id == -1) {
+        main_interpreter_id = current_id;
+        return (unlikely(current_id == -1)) ? -1 : 0;
+    } else if (unlikely(main_interpreter_id != current_id))
+    #else
+    static PyInterpreterState *main_interpreter = NULL;
+    PyInterpreterState *current_interpreter = PyThreadState_Get()->interp;
+    if (!main_interpreter) {
+        main_interpreter = current_interpreter;
+    } else if (unlikely(main_interpreter != current_interpreter))
+    #endif
+    {
+        PyErr_SetString(
+            PyExc_ImportError,
+            "Interpreter change detected - this module can only be loaded into one interpreter per process.");
+        return -1;
+    }
+    return 0;
+}
+#if CYTHON_COMPILING_IN_LIMITED_API
+static CYTHON_SMALL_CODE int __Pyx_copy_spec_to_module(PyObject *spec, PyObject *module, const char* from_name, const char* to_name, int allow_none)
+#else
+static CYTHON_SMALL_CODE int __Pyx_copy_spec_to_module(PyObject *spec, PyObject *moddict, const char* from_name, const char* to_name, int allow_none)
+#endif
+{
+    PyObject *value = PyObject_GetAttrString(spec, from_name);
+    int result = 0;
+    if (likely(value)) {
+        if (allow_none || value != Py_None) {
+#if CYTHON_COMPILING_IN_LIMITED_API
+            result = PyModule_AddObject(module, to_name, value);
+#else
+            result = PyDict_SetItemString(moddict, to_name, value);
+#endif
+        }
+        Py_DECREF(value);
+    } else if (PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Clear();
+    } else {
+        result = -1;
+    }
+    return result;
+}
+static CYTHON_SMALL_CODE PyObject* __pyx_pymod_create(PyObject *spec, PyModuleDef *def) {
+    PyObject *module = NULL, *moddict, *modname;
+    CYTHON_UNUSED_VAR(def);
+    if (__Pyx_check_single_interpreter())
+        return NULL;
+    if (__pyx_m)
+        return __Pyx_NewRef(__pyx_m);
+    modname = PyObject_GetAttrString(spec, "name");
+    if (unlikely(!modname)) goto bad;
+    module = PyModule_NewObject(modname);
+    Py_DECREF(modname);
+    if (unlikely(!module)) goto bad;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    moddict = module;
+#else
+    moddict = PyModule_GetDict(module);
+    if (unlikely(!moddict)) goto bad;
+#endif
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "loader", "__loader__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "origin", "__file__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "parent", "__package__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "submodule_search_locations", "__path__", 0) < 0)) goto bad;
+    return module;
+bad:
+    Py_XDECREF(module);
+    return NULL;
+}
+
+
+static CYTHON_SMALL_CODE int __pyx_pymod_exec_deterministic(PyObject *__pyx_pyinit_module)
+#endif
+#endif
+{
+  int stringtab_initialized = 0;
+  #if CYTHON_USE_MODULE_STATE
+  int pystate_addmodule_run = 0;
+  #endif
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannyDeclarations
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  if (__pyx_m) {
+    if (__pyx_m == __pyx_pyinit_module) return 0;
+    PyErr_SetString(PyExc_RuntimeError, "Module 'deterministic' has already been imported. Re-initialisation is not supported.");
+    return -1;
+  }
+  #elif PY_MAJOR_VERSION >= 3
+  if (__pyx_m) return __Pyx_NewRef(__pyx_m);
+  #endif
+  /*--- Module creation code ---*/
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  __pyx_m = __pyx_pyinit_module;
+  Py_INCREF(__pyx_m);
+  #else
+  #if PY_MAJOR_VERSION < 3
+  __pyx_m = Py_InitModule4("deterministic", __pyx_methods, 0, 0, PYTHON_API_VERSION); Py_XINCREF(__pyx_m);
+  if (unlikely(!__pyx_m)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #elif CYTHON_USE_MODULE_STATE
+  __pyx_t_1 = PyModule_Create(&__pyx_moduledef); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1, __pyx_L1_error)
+  {
+    int add_module_result = PyState_AddModule(__pyx_t_1, &__pyx_moduledef);
+    __pyx_t_1 = 0; /* transfer ownership from __pyx_t_1 to "deterministic" pseudovariable */
+    if (unlikely((add_module_result < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
+    pystate_addmodule_run = 1;
+  }
+  #else
+  __pyx_m = PyModule_Create(&__pyx_moduledef);
+  if (unlikely(!__pyx_m)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #endif
+  CYTHON_UNUSED_VAR(__pyx_t_1);
+  __pyx_d = PyModule_GetDict(__pyx_m); if (unlikely(!__pyx_d)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_d);
+  __pyx_b = __Pyx_PyImport_AddModuleRef(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_b)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_cython_runtime = __Pyx_PyImport_AddModuleRef((const char *) "cython_runtime"); if (unlikely(!__pyx_cython_runtime)) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #if CYTHON_REFNANNY
+__Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
+if (!__Pyx_RefNanny) {
+  PyErr_Clear();
+  __Pyx_RefNanny = __Pyx_RefNannyImportAPI("Cython.Runtime.refnanny");
+  if (!__Pyx_RefNanny)
+      Py_FatalError("failed to import 'refnanny' module");
+}
+#endif
+  __Pyx_RefNannySetupContext("__Pyx_PyMODINIT_FUNC PyInit_deterministic(void)", 0);
+  if (__Pyx_check_binary_version(__PYX_LIMITED_VERSION_HEX, __Pyx_get_runtime_version(), CYTHON_COMPILING_IN_LIMITED_API) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #ifdef __Pxy_PyFrame_Initialize_Offsets
+  __Pxy_PyFrame_Initialize_Offsets();
+  #endif
+  __pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_empty_tuple)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_unicode = PyUnicode_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_unicode)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #ifdef __Pyx_CyFunction_USED
+  if (__pyx_CyFunction_init(__pyx_m) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_FusedFunction_USED
+  if (__pyx_FusedFunction_init(__pyx_m) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_Coroutine_USED
+  if (__pyx_Coroutine_init(__pyx_m) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_Generator_USED
+  if (__pyx_Generator_init(__pyx_m) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_AsyncGen_USED
+  if (__pyx_AsyncGen_init(__pyx_m) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_StopAsyncIteration_USED
+  if (__pyx_StopAsyncIteration_init(__pyx_m) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  /*--- Library function declarations ---*/
+  /*--- Threads initialization code ---*/
+  #if defined(WITH_THREAD) && PY_VERSION_HEX < 0x030700F0 && defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
+  PyEval_InitThreads();
+  #endif
+  /*--- Initialize various global constants etc. ---*/
+  if (__Pyx_InitConstants() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  stringtab_initialized = 1;
+  if (__Pyx_InitGlobals() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #if PY_MAJOR_VERSION < 3 && (__PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT)
+  if (__Pyx_init_sys_getdefaultencoding_params() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  if (__pyx_module_is_main_nalpy__math___c_extensions__deterministic) {
+    if (PyObject_SetAttr(__pyx_m, __pyx_n_s_name, __pyx_n_s_main) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  }
+  #if PY_MAJOR_VERSION >= 3
+  {
+    PyObject *modules = PyImport_GetModuleDict(); if (unlikely(!modules)) __PYX_ERR(0, 1, __pyx_L1_error)
+    if (!PyDict_GetItemString(modules, "nalpy.math._c_extensions.deterministic")) {
+      if (unlikely((PyDict_SetItemString(modules, "nalpy.math._c_extensions.deterministic", __pyx_m) < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
+    }
+  }
+  #endif
+  /*--- Builtin init code ---*/
+  if (__Pyx_InitCachedBuiltins() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Constants init code ---*/
+  if (__Pyx_InitCachedConstants() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Global type/function init code ---*/
+  (void)__Pyx_modinit_global_init_code();
+  (void)__Pyx_modinit_variable_export_code();
+  (void)__Pyx_modinit_function_export_code();
+  (void)__Pyx_modinit_type_init_code();
+  if (unlikely((__Pyx_modinit_type_import_code() < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
+  (void)__Pyx_modinit_variable_import_code();
+  (void)__Pyx_modinit_function_import_code();
+  /*--- Execution code ---*/
+  #if defined(__Pyx_Generator_USED) || defined(__Pyx_Coroutine_USED)
+  if (__Pyx_patch_abc() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":16
+ * # these replace the parts that call into libm with the portable versions from _deterministic.pxd.
+ * 
+ * cdef Vector2 _zero = new_vector2(0.0, 0.0)             # <<<<<<<<<<<<<<
+ * 
+ * # 2 ** 63, every double in [-2 ** 63, 2 ** 63) fits into a long long
+ */
+  __pyx_t_2 = ((PyObject *)__pyx_f_5nalpy_4math_13_c_extensions_7vector2_new_vector2(0.0, 0.0)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 16, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_XGOTREF((PyObject *)__pyx_v_5nalpy_4math_13_c_extensions_13deterministic__zero);
+  __Pyx_DECREF_SET(__pyx_v_5nalpy_4math_13_c_extensions_13deterministic__zero, ((struct __pyx_obj_5nalpy_4math_13_c_extensions_7vector2_Vector2 *)__pyx_t_2));
+  __Pyx_GIVEREF(__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":19
+ * 
+ * # 2 ** 63, every double in [-2 ** 63, 2 ** 63) fits into a long long
+ * cdef double _LIMIT = 9223372036854775808.0             # <<<<<<<<<<<<<<
+ * 
+ * cdef long long _to_int(double value) except? -1:
+ */
+  __pyx_v_5nalpy_4math_13_c_extensions_13deterministic__LIMIT = 9223372036854775808.0;
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":43
+ *     return det_acos(cos_val) * (180.0 / 3.14159265358979323846)
+ * 
+ * def hypot(double x, double y, /):             # <<<<<<<<<<<<<<
+ *     return det_hypot(x, y)
+ * 
+ */
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_5nalpy_4math_13_c_extensions_13deterministic_1hypot, 0, __pyx_n_s_hypot, NULL, __pyx_n_s_nalpy_math__c_extensions_determi_2, __pyx_d, ((PyObject *)__pyx_codeobj__5)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 43, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_hypot, __pyx_t_2) < 0) __PYX_ERR(0, 43, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":46
+ *     return det_hypot(x, y)
+ * 
+ * def acos(double x, /):             # <<<<<<<<<<<<<<
+ *     if fabs(x) > 1.0: # Same error as math.acos, nan is passed through
+ *         raise ValueError("math domain error")
+ */
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_5nalpy_4math_13_c_extensions_13deterministic_3acos, 0, __pyx_n_s_acos, NULL, __pyx_n_s_nalpy_math__c_extensions_determi_2, __pyx_d, ((PyObject *)__pyx_codeobj__7)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 46, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_acos, __pyx_t_2) < 0) __PYX_ERR(0, 46, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":51
+ *     return det_acos(x)
+ * 
+ * def atan2(double y, double x, /):             # <<<<<<<<<<<<<<
+ *     return det_atan2(y, x)
+ * 
+ */
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_5nalpy_4math_13_c_extensions_13deterministic_5atan2, 0, __pyx_n_s_atan2, NULL, __pyx_n_s_nalpy_math__c_extensions_determi_2, __pyx_d, ((PyObject *)__pyx_codeobj__9)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 51, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_atan2, __pyx_t_2) < 0) __PYX_ERR(0, 51, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":54
+ *     return det_atan2(y, x)
+ * 
+ * def round(double x, /):             # <<<<<<<<<<<<<<
+ *     return PyLong_FromDouble(det_round(x)) # Raises for nan and inf like the built-in round
+ * 
+ */
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_5nalpy_4math_13_c_extensions_13deterministic_7round, 0, __pyx_n_s_round, NULL, __pyx_n_s_nalpy_math__c_extensions_determi_2, __pyx_d, ((PyObject *)__pyx_codeobj__10)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 54, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_round, __pyx_t_2) < 0) __PYX_ERR(0, 54, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":57
+ *     return PyLong_FromDouble(det_round(x)) # Raises for nan and inf like the built-in round
+ * 
+ * def magnitude(Vector2 v):             # <<<<<<<<<<<<<<
+ *     return det_hypot(v.x, v.y)
+ * 
+ */
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_5nalpy_4math_13_c_extensions_13deterministic_9magnitude, 0, __pyx_n_s_magnitude, NULL, __pyx_n_s_nalpy_math__c_extensions_determi_2, __pyx_d, ((PyObject *)__pyx_codeobj__12)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 57, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_magnitude, __pyx_t_2) < 0) __PYX_ERR(0, 57, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":60
+ *     return det_hypot(v.x, v.y)
+ * 
+ * @cython.cdivision(True)             # <<<<<<<<<<<<<<
+ * def normalized(Vector2 v):
+ *     cdef double magnitude = det_hypot(v.x, v.y)
+ */
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_5nalpy_4math_13_c_extensions_13deterministic_11normalized, 0, __pyx_n_s_normalized, NULL, __pyx_n_s_nalpy_math__c_extensions_determi_2, __pyx_d, ((PyObject *)__pyx_codeobj__14)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 60, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_normalized, __pyx_t_2) < 0) __PYX_ERR(0, 60, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":67
+ *     return new_vector2(v.x / magnitude, v.y / magnitude)
+ * 
+ * def distance(Vector2 a, Vector2 b):             # <<<<<<<<<<<<<<
+ *     return det_hypot(a.x - b.x, a.y - b.y)
+ * 
+ */
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_5nalpy_4math_13_c_extensions_13deterministic_13distance, 0, __pyx_n_s_distance, NULL, __pyx_n_s_nalpy_math__c_extensions_determi_2, __pyx_d, ((PyObject *)__pyx_codeobj__16)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 67, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_distance, __pyx_t_2) < 0) __PYX_ERR(0, 67, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":70
+ *     return det_hypot(a.x - b.x, a.y - b.y)
+ * 
+ * def angle(Vector2 _from, Vector2 _to):             # <<<<<<<<<<<<<<
+ *     return _angle2(_from.x, _from.y, _to.x, _to.y)
+ * 
+ */
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_5nalpy_4math_13_c_extensions_13deterministic_15angle, 0, __pyx_n_s_angle, NULL, __pyx_n_s_nalpy_math__c_extensions_determi_2, __pyx_d, ((PyObject *)__pyx_codeobj__18)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 70, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_angle, __pyx_t_2) < 0) __PYX_ERR(0, 70, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":73
+ *     return _angle2(_from.x, _from.y, _to.x, _to.y)
+ * 
+ * def signed_angle(Vector2 _from, Vector2 _to):             # <<<<<<<<<<<<<<
+ *     cdef double unsigned_angle = _angle2(_from.x, _from.y, _to.x, _to.y)
+ *     if ((_from.x * _to.y) - (_from.y * _to.x)) < 0.0:
+ */
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_5nalpy_4math_13_c_extensions_13deterministic_17signed_angle, 0, __pyx_n_s_signed_angle, NULL, __pyx_n_s_nalpy_math__c_extensions_determi_2, __pyx_d, ((PyObject *)__pyx_codeobj__20)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 73, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_signed_angle, __pyx_t_2) < 0) __PYX_ERR(0, 73, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":79
+ *     return unsigned_angle
+ * 
+ * def move_towards(Vector2 current, Vector2 target, double max_distance_delta):             # <<<<<<<<<<<<<<
+ *     cdef double[2] out
+ *     cdef double dist = det_hypot(target.x - current.x, target.y - current.y)
+ */
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_5nalpy_4math_13_c_extensions_13deterministic_19move_towards, 0, __pyx_n_s_move_towards, NULL, __pyx_n_s_nalpy_math__c_extensions_determi_2, __pyx_d, ((PyObject *)__pyx_codeobj__22)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 79, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_move_towards, __pyx_t_2) < 0) __PYX_ERR(0, 79, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":86
+ *     return new_vector2(out[0], out[1])
+ * 
+ * def smooth_damp(Vector2 current, Vector2 target, MVector2 current_velocity, double smooth_time, double delta_time, double max_speed = <double>INFINITY):             # <<<<<<<<<<<<<<
+ *     cdef double[2] velocity = [current_velocity.x, current_velocity.y]
+ *     cdef double[2] output
+ */
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_5nalpy_4math_13_c_extensions_13deterministic_21smooth_damp, 0, __pyx_n_s_smooth_damp, NULL, __pyx_n_s_nalpy_math__c_extensions_determi_2, __pyx_d, ((PyObject *)__pyx_codeobj__24)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 86, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (!__Pyx_CyFunction_InitDefaults(__pyx_t_2, sizeof(__pyx_defaults), 0)) __PYX_ERR(0, 86, __pyx_L1_error)
+  __Pyx_CyFunction_Defaults(__pyx_defaults, __pyx_t_2)->__pyx_arg_max_speed = ((double)INFINITY);
+  __Pyx_CyFunction_SetDefaultsGetter(__pyx_t_2, __pyx_pf_5nalpy_4math_13_c_extensions_13deterministic_24__defaults__);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_smooth_damp, __pyx_t_2) < 0) __PYX_ERR(0, 86, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":96
+ *     return new_vector2(output[0], output[1])
+ * 
+ * def round_vector(Vector2 v):             # <<<<<<<<<<<<<<
+ *     return new_vector2_int(_to_int(det_round(v.x)), _to_int(det_round(v.y)))
+ */
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_5nalpy_4math_13_c_extensions_13deterministic_23round_vector, 0, __pyx_n_s_round_vector, NULL, __pyx_n_s_nalpy_math__c_extensions_determi_2, __pyx_d, ((PyObject *)__pyx_codeobj__25)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 96, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_round_vector, __pyx_t_2) < 0) __PYX_ERR(0, 96, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "nalpy/math/_c_extensions/deterministic.pyx":1
+ * #cython: language_level=3             # <<<<<<<<<<<<<<
+ * 
+ * cimport cython
+ */
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_2) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /*--- Wrapped vars code ---*/
+
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  if (__pyx_m) {
+    if (__pyx_d && stringtab_initialized) {
+      __Pyx_AddTraceback("init nalpy.math._c_extensions.deterministic", __pyx_clineno, __pyx_lineno, __pyx_filename);
+    }
+    #if !CYTHON_USE_MODULE_STATE
+    Py_CLEAR(__pyx_m);
+    #else
+    Py_DECREF(__pyx_m);
+    if (pystate_addmodule_run) {
+      PyObject *tp, *value, *tb;
+      PyErr_Fetch(&tp, &value, &tb);
+      PyState_RemoveModule(&__pyx_moduledef);
+      PyErr_Restore(tp, value, tb);
+    }
+    #endif
+  } else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_ImportError, "init nalpy.math._c_extensions.deterministic");
+  }
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  return (__pyx_m != NULL) ? 0 : -1;
+  #elif PY_MAJOR_VERSION >= 3
+  return __pyx_m;
+  #else
+  return;
+  #endif
+}
+/* #### Code section: cleanup_globals ### */
+/* #### Code section: cleanup_module ### */
+/* #### Code section: main_method ### */
+/* #### Code section: utility_code_pragmas ### */
+#ifdef _MSC_VER
+#pragma warning( push )
+/* Warning 4127: conditional expression is constant
+ * Cython uses constant conditional expressions to allow in inline functions to be optimized at
+ * compile-time, so this warning is not useful
+ */
+#pragma warning( disable : 4127 )
+#endif
+
+
+
+/* #### Code section: utility_code_def ### */
+
+/* --- Runtime support code --- */
+/* Refnanny */
+#if CYTHON_REFNANNY
+static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname) {
+    PyObject *m = NULL, *p = NULL;
+    void *r = NULL;
+    m = PyImport_ImportModule(modname);
+    if (!m) goto end;
+    p = PyObject_GetAttrString(m, "RefNannyAPI");
+    if (!p) goto end;
+    r = PyLong_AsVoidPtr(p);
+end:
+    Py_XDECREF(p);
+    Py_XDECREF(m);
+    return (__Pyx_RefNannyAPIStruct *)r;
+}
+#endif
+
+/* PyErrExceptionMatches */
+#if CYTHON_FAST_THREAD_STATE
+static int __Pyx_PyErr_ExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    n = PyTuple_GET_SIZE(tuple);
+#if PY_MAJOR_VERSION >= 3
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+#endif
+    for (i=0; i<n; i++) {
+        if (__Pyx_PyErr_GivenExceptionMatches(exc_type, PyTuple_GET_ITEM(tuple, i))) return 1;
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err) {
+    int result;
+    PyObject *exc_type;
+#if PY_VERSION_HEX >= 0x030C00A6
+    PyObject *current_exception = tstate->current_exception;
+    if (unlikely(!current_exception)) return 0;
+    exc_type = (PyObject*) Py_TYPE(current_exception);
+    if (exc_type == err) return 1;
+#else
+    exc_type = tstate->curexc_type;
+    if (exc_type == err) return 1;
+    if (unlikely(!exc_type)) return 0;
+#endif
+    #if CYTHON_AVOID_BORROWED_REFS
+    Py_INCREF(exc_type);
+    #endif
+    if (unlikely(PyTuple_Check(err))) {
+        result = __Pyx_PyErr_ExceptionMatchesTuple(exc_type, err);
+    } else {
+        result = __Pyx_PyErr_GivenExceptionMatches(exc_type, err);
+    }
+    #if CYTHON_AVOID_BORROWED_REFS
+    Py_DECREF(exc_type);
+    #endif
+    return result;
+}
+#endif
+
+/* PyErrFetchRestore */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+#if PY_VERSION_HEX >= 0x030C00A6
+    PyObject *tmp_value;
+    assert(type == NULL || (value != NULL && type == (PyObject*) Py_TYPE(value)));
+    if (value) {
+        #if CYTHON_COMPILING_IN_CPYTHON
+        if (unlikely(((PyBaseExceptionObject*) value)->traceback != tb))
+        #endif
+            PyException_SetTraceback(value, tb);
+    }
+    tmp_value = tstate->current_exception;
+    tstate->current_exception = value;
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(type);
+    Py_XDECREF(tb);
+#else
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    tmp_type = tstate->curexc_type;
+    tmp_value = tstate->curexc_value;
+    tmp_tb = tstate->curexc_traceback;
+    tstate->curexc_type = type;
+    tstate->curexc_value = value;
+    tstate->curexc_traceback = tb;
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+#endif
+}
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+#if PY_VERSION_HEX >= 0x030C00A6
+    PyObject* exc_value;
+    exc_value = tstate->current_exception;
+    tstate->current_exception = 0;
+    *value = exc_value;
+    *type = NULL;
+    *tb = NULL;
+    if (exc_value) {
+        *type = (PyObject*) Py_TYPE(exc_value);
+        Py_INCREF(*type);
+        #if CYTHON_COMPILING_IN_CPYTHON
+        *tb = ((PyBaseExceptionObject*) exc_value)->traceback;
+        Py_XINCREF(*tb);
+        #else
+        *tb = PyException_GetTraceback(exc_value);
+        #endif
+    }
+#else
+    *type = tstate->curexc_type;
+    *value = tstate->curexc_value;
+    *tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+#endif
+}
+#endif
+
+/* PyObjectGetAttrStr */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name) {
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro))
+        return tp->tp_getattro(obj, attr_name);
+#if PY_MAJOR_VERSION < 3
+    if (likely(tp->tp_getattr))
+        return tp->tp_getattr(obj, PyString_AS_STRING(attr_name));
+#endif
+    return PyObject_GetAttr(obj, attr_name);
+}
+#endif
+
+/* PyObjectGetAttrStrNoError */
+#if __PYX_LIMITED_VERSION_HEX < 0x030d00A1
+static void __Pyx_PyObject_GetAttrStr_ClearAttributeError(void) {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    if (likely(__Pyx_PyErr_ExceptionMatches(PyExc_AttributeError)))
+        __Pyx_PyErr_Clear();
+}
+#endif
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name) {
+    PyObject *result;
+#if __PYX_LIMITED_VERSION_HEX >= 0x030d00A1
+    (void) PyObject_GetOptionalAttr(obj, attr_name, &result);
+    return result;
+#else
+#if CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_TYPE_SLOTS && PY_VERSION_HEX >= 0x030700B1
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro == PyObject_GenericGetAttr)) {
+        return _PyObject_GenericGetAttrWithDict(obj, attr_name, NULL, 1);
+    }
+#endif
+    result = __Pyx_PyObject_GetAttrStr(obj, attr_name);
+    if (unlikely(!result)) {
+        __Pyx_PyObject_GetAttrStr_ClearAttributeError();
+    }
+    return result;
+#endif
+}
+
+/* GetBuiltinName */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
+    PyObject* result = __Pyx_PyObject_GetAttrStrNoError(__pyx_b, name);
+    if (unlikely(!result) && !PyErr_Occurred()) {
+        PyErr_Format(PyExc_NameError,
+#if PY_MAJOR_VERSION >= 3
+            "name '%U' is not defined", name);
+#else
+            "name '%.200s' is not defined", PyString_AS_STRING(name));
+#endif
+    }
+    return result;
+}
+
+/* ExtTypeTest */
+static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type) {
+    __Pyx_TypeName obj_type_name;
+    __Pyx_TypeName type_name;
+    if (unlikely(!type)) {
+        PyErr_SetString(PyExc_SystemError, "Missing type object");
+        return 0;
+    }
+    if (likely(__Pyx_TypeCheck(obj, type)))
+        return 1;
+    obj_type_name = __Pyx_PyType_GetName(Py_TYPE(obj));
+    type_name = __Pyx_PyType_GetName(type);
+    PyErr_Format(PyExc_TypeError,
+                 "Cannot convert " __Pyx_FMT_TYPENAME " to " __Pyx_FMT_TYPENAME,
+                 obj_type_name, type_name);
+    __Pyx_DECREF_TypeName(obj_type_name);
+    __Pyx_DECREF_TypeName(type_name);
+    return 0;
+}
+
+/* PyObjectCall */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
+    PyObject *result;
+    ternaryfunc call = Py_TYPE(func)->tp_call;
+    if (unlikely(!call))
+        return PyObject_Call(func, arg, kw);
+    #if PY_MAJOR_VERSION < 3
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    #else
+    if (unlikely(Py_EnterRecursiveCall(" while calling a Python object")))
+        return NULL;
+    #endif
+    result = (*call)(func, arg, kw);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* RaiseException */
+#if PY_MAJOR_VERSION < 3
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
+    __Pyx_PyThreadState_declare
+    CYTHON_UNUSED_VAR(cause);
+    Py_XINCREF(type);
+    if (!value || value == Py_None)
+        value = NULL;
+    else
+        Py_INCREF(value);
+    if (!tb || tb == Py_None)
+        tb = NULL;
+    else {
+        Py_INCREF(tb);
+        if (!PyTraceBack_Check(tb)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: arg 3 must be a traceback or None");
+            goto raise_error;
+        }
+    }
+    if (PyType_Check(type)) {
+#if CYTHON_COMPILING_IN_PYPY
+        if (!value) {
+            Py_INCREF(Py_None);
+            value = Py_None;
+        }
+#endif
+        PyErr_NormalizeException(&type, &value, &tb);
+    } else {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto raise_error;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(type);
+        Py_INCREF(type);
+        if (!PyType_IsSubtype((PyTypeObject *)type, (PyTypeObject *)PyExc_BaseException)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: exception class must be a subclass of BaseException");
+            goto raise_error;
+        }
+    }
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrRestore(type, value, tb);
+    return;
+raise_error:
+    Py_XDECREF(value);
+    Py_XDECREF(type);
+    Py_XDECREF(tb);
+    return;
+}
+#else
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
+    PyObject* owned_instance = NULL;
+    if (tb == Py_None) {
+        tb = 0;
+    } else if (tb && !PyTraceBack_Check(tb)) {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: arg 3 must be a traceback or None");
+        goto bad;
+    }
+    if (value == Py_None)
+        value = 0;
+    if (PyExceptionInstance_Check(type)) {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto bad;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(value);
+    } else if (PyExceptionClass_Check(type)) {
+        PyObject *instance_class = NULL;
+        if (value && PyExceptionInstance_Check(value)) {
+            instance_class = (PyObject*) Py_TYPE(value);
+            if (instance_class != type) {
+                int is_subclass = PyObject_IsSubclass(instance_class, type);
+                if (!is_subclass) {
+                    instance_class = NULL;
+                } else if (unlikely(is_subclass == -1)) {
+                    goto bad;
+                } else {
+                    type = instance_class;
+                }
+            }
+        }
+        if (!instance_class) {
+            PyObject *args;
+            if (!value)
+                args = PyTuple_New(0);
+            else if (PyTuple_Check(value)) {
+                Py_INCREF(value);
+                args = value;
+            } else
+                args = PyTuple_Pack(1, value);
+            if (!args)
+                goto bad;
+            owned_instance = PyObject_Call(type, args, NULL);
+            Py_DECREF(args);
+            if (!owned_instance)
+                goto bad;
+            value = owned_instance;
+            if (!PyExceptionInstance_Check(value)) {
+                PyErr_Format(PyExc_TypeError,
+                             "calling %R should have returned an instance of "
+                             "BaseException, not %R",
+                             type, Py_TYPE(value));
+                goto bad;
+            }
+        }
+    } else {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: exception class must be a subclass of BaseException");
+        goto bad;
+    }
+    if (cause) {
+        PyObject *fixed_cause;
+        if (cause == Py_None) {
+            fixed_cause = NULL;
+        } else if (PyExceptionClass_Check(cause)) {
+            fixed_cause = PyObject_CallObject(cause, NULL);
+            if (fixed_cause == NULL)
+                goto bad;
+        } else if (PyExceptionInstance_Check(cause)) {
+            fixed_cause = cause;
+            Py_INCREF(fixed_cause);
+        } else {
+            PyErr_SetString(PyExc_TypeError,
+                            "exception causes must derive from "
+                            "BaseException");
+            goto bad;
+        }
+        PyException_SetCause(value, fixed_cause);
+    }
+    PyErr_SetObject(type, value);
+    if (tb) {
+      #if PY_VERSION_HEX >= 0x030C00A6
+        PyException_SetTraceback(value, tb);
+      #elif CYTHON_FAST_THREAD_STATE
+        PyThreadState *tstate = __Pyx_PyThreadState_Current;
+        PyObject* tmp_tb = tstate->curexc_traceback;
+        if (tb != tmp_tb) {
+            Py_INCREF(tb);
+            tstate->curexc_traceback = tb;
+            Py_XDECREF(tmp_tb);
+        }
+#else
+        PyObject *tmp_type, *tmp_value, *tmp_tb;
+        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
+        Py_INCREF(tb);
+        PyErr_Restore(tmp_type, tmp_value, tb);
+        Py_XDECREF(tmp_tb);
+#endif
+    }
+bad:
+    Py_XDECREF(owned_instance);
+    return;
+}
+#endif
+
+/* TupleAndListFromArray */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE void __Pyx_copy_object_array(PyObject *const *CYTHON_RESTRICT src, PyObject** CYTHON_RESTRICT dest, Py_ssize_t length) {
+    PyObject *v;
+    Py_ssize_t i;
+    for (i = 0; i < length; i++) {
+        v = dest[i] = src[i];
+        Py_INCREF(v);
+    }
+}
+static CYTHON_INLINE PyObject *
+__Pyx_PyTuple_FromArray(PyObject *const *src, Py_ssize_t n)
+{
+    PyObject *res;
+    if (n <= 0) {
+        Py_INCREF(__pyx_empty_tuple);
+        return __pyx_empty_tuple;
+    }
+    res = PyTuple_New(n);
+    if (unlikely(res == NULL)) return NULL;
+    __Pyx_copy_object_array(src, ((PyTupleObject*)res)->ob_item, n);
+    return res;
+}
+static CYTHON_INLINE PyObject *
+__Pyx_PyList_FromArray(PyObject *const *src, Py_ssize_t n)
+{
+    PyObject *res;
+    if (n <= 0) {
+        return PyList_New(0);
+    }
+    res = PyList_New(n);
+    if (unlikely(res == NULL)) return NULL;
+    __Pyx_copy_object_array(src, ((PyListObject*)res)->ob_item, n);
+    return res;
+}
+#endif
+
+/* BytesEquals */
+static CYTHON_INLINE int __Pyx_PyBytes_Equals(PyObject* s1, PyObject* s2, int equals) {
+#if CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_LIMITED_API
+    return PyObject_RichCompareBool(s1, s2, equals);
+#else
+    if (s1 == s2) {
+        return (equals == Py_EQ);
+    } else if (PyBytes_CheckExact(s1) & PyBytes_CheckExact(s2)) {
+        const char *ps1, *ps2;
+        Py_ssize_t length = PyBytes_GET_SIZE(s1);
+        if (length != PyBytes_GET_SIZE(s2))
+            return (equals == Py_NE);
+        ps1 = PyBytes_AS_STRING(s1);
+        ps2 = PyBytes_AS_STRING(s2);
+        if (ps1[0] != ps2[0]) {
+            return (equals == Py_NE);
+        } else if (length == 1) {
+            return (equals == Py_EQ);
+        } else {
+            int result;
+#if CYTHON_USE_UNICODE_INTERNALS && (PY_VERSION_HEX < 0x030B0000)
+            Py_hash_t hash1, hash2;
+            hash1 = ((PyBytesObject*)s1)->ob_shash;
+            hash2 = ((PyBytesObject*)s2)->ob_shash;
+            if (hash1 != hash2 && hash1 != -1 && hash2 != -1) {
+                return (equals == Py_NE);
+            }
+#endif
+            result = memcmp(ps1, ps2, (size_t)length);
+            return (equals == Py_EQ) ? (result == 0) : (result != 0);
+        }
+    } else if ((s1 == Py_None) & PyBytes_CheckExact(s2)) {
+        return (equals == Py_NE);
+    } else if ((s2 == Py_None) & PyBytes_CheckExact(s1)) {
+        return (equals == Py_NE);
+    } else {
+        int result;
+        PyObject* py_result = PyObject_RichCompare(s1, s2, equals);
+        if (!py_result)
+            return -1;
+        result = __Pyx_PyObject_IsTrue(py_result);
+        Py_DECREF(py_result);
+        return result;
+    }
+#endif
+}
+
+/* UnicodeEquals */
+static CYTHON_INLINE int __Pyx_PyUnicode_Equals(PyObject* s1, PyObject* s2, int equals) {
+#if CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_LIMITED_API
+    return PyObject_RichCompareBool(s1, s2, equals);
+#else
+#if PY_MAJOR_VERSION < 3
+    PyObject* owned_ref = NULL;
+#endif
+    int s1_is_unicode, s2_is_unicode;
+    if (s1 == s2) {
+        goto return_eq;
+    }
+    s1_is_unicode = PyUnicode_CheckExact(s1);
+    s2_is_unicode = PyUnicode_CheckExact(s2);
+#if PY_MAJOR_VERSION < 3
+    if ((s1_is_unicode & (!s2_is_unicode)) && PyString_CheckExact(s2)) {
+        owned_ref = PyUnicode_FromObject(s2);
+        if (unlikely(!owned_ref))
+            return -1;
+        s2 = owned_ref;
+        s2_is_unicode = 1;
+    } else if ((s2_is_unicode & (!s1_is_unicode)) && PyString_CheckExact(s1)) {
+        owned_ref = PyUnicode_FromObject(s1);
+        if (unlikely(!owned_ref))
+            return -1;
+        s1 = owned_ref;
+        s1_is_unicode = 1;
+    } else if (((!s2_is_unicode) & (!s1_is_unicode))) {
+        return __Pyx_PyBytes_Equals(s1, s2, equals);
+    }
+#endif
+    if (s1_is_unicode & s2_is_unicode) {
+        Py_ssize_t length;
+        int kind;
+        void *data1, *data2;
+        if (unlikely(__Pyx_PyUnicode_READY(s1) < 0) || unlikely(__Pyx_PyUnicode_READY(s2) < 0))
+            return -1;
+        length = __Pyx_PyUnicode_GET_LENGTH(s1);
+        if (length != __Pyx_PyUnicode_GET_LENGTH(s2)) {
+            goto return_ne;
+        }
+#if CYTHON_USE_UNICODE_INTERNALS
+        {
+            Py_hash_t hash1, hash2;
+        #if CYTHON_PEP393_ENABLED
+            hash1 = ((PyASCIIObject*)s1)->hash;
+            hash2 = ((PyASCIIObject*)s2)->hash;
+        #else
+            hash1 = ((PyUnicodeObject*)s1)->hash;
+            hash2 = ((PyUnicodeObject*)s2)->hash;
+        #endif
+            if (hash1 != hash2 && hash1 != -1 && hash2 != -1) {
+                goto return_ne;
+            }
+        }
+#endif
+        kind = __Pyx_PyUnicode_KIND(s1);
+        if (kind != __Pyx_PyUnicode_KIND(s2)) {
+            goto return_ne;
+        }
+        data1 = __Pyx_PyUnicode_DATA(s1);
+        data2 = __Pyx_PyUnicode_DATA(s2);
+        if (__Pyx_PyUnicode_READ(kind, data1, 0) != __Pyx_PyUnicode_READ(kind, data2, 0)) {
+            goto return_ne;
+        } else if (length == 1) {
+            goto return_eq;
+        } else {
+            int result = memcmp(data1, data2, (size_t)(length * kind));
+            #if PY_MAJOR_VERSION < 3
+            Py_XDECREF(owned_ref);
+            #endif
+            return (equals == Py_EQ) ? (result == 0) : (result != 0);
+        }
+    } else if ((s1 == Py_None) & s2_is_unicode) {
+        goto return_ne;
+    } else if ((s2 == Py_None) & s1_is_unicode) {
+        goto return_ne;
+    } else {
+        int result;
+        PyObject* py_result = PyObject_RichCompare(s1, s2, equals);
+        #if PY_MAJOR_VERSION < 3
+        Py_XDECREF(owned_ref);
+        #endif
+        if (!py_result)
+            return -1;
+        result = __Pyx_PyObject_IsTrue(py_result);
+        Py_DECREF(py_result);
+        return result;
+    }
+return_eq:
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(owned_ref);
+    #endif
+    return (equals == Py_EQ);
+return_ne:
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(owned_ref);
+    #endif
+    return (equals == Py_NE);
+#endif
+}
+
+/* fastcall */
+#if CYTHON_METH_FASTCALL
+static CYTHON_INLINE PyObject * __Pyx_GetKwValue_FASTCALL(PyObject *kwnames, PyObject *const *kwvalues, PyObject *s)
+{
+    Py_ssize_t i, n = PyTuple_GET_SIZE(kwnames);
+    for (i = 0; i < n; i++)
+    {
+        if (s == PyTuple_GET_ITEM(kwnames, i)) return kwvalues[i];
+    }
+    for (i = 0; i < n; i++)
+    {
+        int eq = __Pyx_PyUnicode_Equals(s, PyTuple_GET_ITEM(kwnames, i), Py_EQ);
+        if (unlikely(eq != 0)) {
+            if (unlikely(eq < 0)) return NULL;
+            return kwvalues[i];
+        }
+    }
+    return NULL;
+}
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030d0000
+CYTHON_UNUSED static PyObject *__Pyx_KwargsAsDict_FASTCALL(PyObject *kwnames, PyObject *const *kwvalues) {
+    Py_ssize_t i, nkwargs = PyTuple_GET_SIZE(kwnames);
+    PyObject *dict;
+    dict = PyDict_New();
+    if (unlikely(!dict))
+        return NULL;
+    for (i=0; i<nkwargs; i++) {
+        PyObject *key = PyTuple_GET_ITEM(kwnames, i);
+        if (unlikely(PyDict_SetItem(dict, key, kwvalues[i]) < 0))
+            goto bad;
+    }
+    return dict;
+bad:
+    Py_DECREF(dict);
+    return NULL;
+}
+#endif
+#endif
+
+/* RaiseDoubleKeywords */
+static void __Pyx_RaiseDoubleKeywordsError(
+    const char* func_name,
+    PyObject* kw_name)
+{
+    PyErr_Format(PyExc_TypeError,
+        #if PY_MAJOR_VERSION >= 3
+        "%s() got multiple values for keyword argument '%U'", func_name, kw_name);
+        #else
+        "%s() got multiple values for keyword argument '%s'", func_name,
+        PyString_AsString(kw_name));
+        #endif
+}
+
+/* ParseKeywords */
+static int __Pyx_ParseOptionalKeywords(
+    PyObject *kwds,
+    PyObject *const *kwvalues,
+    PyObject **argnames[],
+    PyObject *kwds2,
+    PyObject *values[],
+    Py_ssize_t num_pos_args,
+    const char* function_name)
+{
+    PyObject *key = 0, *value = 0;
+    Py_ssize_t pos = 0;
+    PyObject*** name;
+    PyObject*** first_kw_arg = argnames + num_pos_args;
+    int kwds_is_tuple = CYTHON_METH_FASTCALL && likely(PyTuple_Check(kwds));
+    while (1) {
+        Py_XDECREF(key); key = NULL;
+        Py_XDECREF(value); value = NULL;
+        if (kwds_is_tuple) {
+            Py_ssize_t size;
+#if CYTHON_ASSUME_SAFE_MACROS
+            size = PyTuple_GET_SIZE(kwds);
+#else
+            size = PyTuple_Size(kwds);
+            if (size < 0) goto bad;
+#endif
+            if (pos >= size) break;
+#if CYTHON_AVOID_BORROWED_REFS
+            key = __Pyx_PySequence_ITEM(kwds, pos);
+            if (!key) goto bad;
+#elif CYTHON_ASSUME_SAFE_MACROS
+            key = PyTuple_GET_ITEM(kwds, pos);
+#else
+            key = PyTuple_GetItem(kwds, pos);
+            if (!key) goto bad;
+#endif
+            value = kwvalues[pos];
+            pos++;
+        }
+        else
+        {
+            if (!PyDict_Next(kwds, &pos, &key, &value)) break;
+#if CYTHON_AVOID_BORROWED_REFS
+            Py_INCREF(key);
+#endif
+        }
+        name = first_kw_arg;
+        while (*name && (**name != key)) name++;
+        if (*name) {
+            values[name-argnames] = value;
+#if CYTHON_AVOID_BORROWED_REFS
+            Py_INCREF(value);
+            Py_DECREF(key);
+#endif
+            key = NULL;
+            value = NULL;
+            continue;
+        }
+#if !CYTHON_AVOID_BORROWED_REFS
+        Py_INCREF(key);
+#endif
+        Py_INCREF(value);
+        name = first_kw_arg;
+        #if PY_MAJOR_VERSION < 3
+        if (likely(PyString_Check(key))) {
+            while (*name) {
+                if ((CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**name) == PyString_GET_SIZE(key))
+                        && _PyString_Eq(**name, key)) {
+                    values[name-argnames] = value;
+#if CYTHON_AVOID_BORROWED_REFS
+                    value = NULL;
+#endif
+                    break;
+                }
+                name++;
+            }
+            if (*name) continue;
+            else {
+                PyObject*** argname = argnames;
+                while (argname != first_kw_arg) {
+                    if ((**argname == key) || (
+                            (CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**argname) == PyString_GET_SIZE(key))
+                             && _PyString_Eq(**argname, key))) {
+                        goto arg_passed_twice;
+                    }
+                    argname++;
+                }
+            }
+        } else
+        #endif
+        if (likely(PyUnicode_Check(key))) {
+            while (*name) {
+                int cmp = (
+                #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
+                    (__Pyx_PyUnicode_GET_LENGTH(**name) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
+                #endif
+                    PyUnicode_Compare(**name, key)
+                );
+                if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+                if (cmp == 0) {
+                    values[name-argnames] = value;
+#if CYTHON_AVOID_BORROWED_REFS
+                    value = NULL;
+#endif
+                    break;
+                }
+                name++;
+            }
+            if (*name) continue;
+            else {
+                PyObject*** argname = argnames;
+                while (argname != first_kw_arg) {
+                    int cmp = (**argname == key) ? 0 :
+                    #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
+                        (__Pyx_PyUnicode_GET_LENGTH(**argname) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
+                    #endif
+                        PyUnicode_Compare(**argname, key);
+                    if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+                    if (cmp == 0) goto arg_passed_twice;
+                    argname++;
+                }
+            }
+        } else
+            goto invalid_keyword_type;
+        if (kwds2) {
+            if (unlikely(PyDict_SetItem(kwds2, key, value))) goto bad;
+        } else {
+            goto invalid_keyword;
+        }
+    }
+    Py_XDECREF(key);
+    Py_XDECREF(value);
+    return 0;
+arg_passed_twice:
+    __Pyx_RaiseDoubleKeywordsError(function_name, key);
+    goto bad;
+invalid_keyword_type:
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() keywords must be strings", function_name);
+    goto bad;
+invalid_keyword:
+    #if PY_MAJOR_VERSION < 3
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() got an unexpected keyword argument '%.200s'",
+        function_name, PyString_AsString(key));
+    #else
+    PyErr_Format(PyExc_TypeError,
+        "%s() got an unexpected keyword argument '%U'",
+        function_name, key);
+    #endif
+bad:
+    Py_XDECREF(key);
+    Py_XDECREF(value);
+    return -1;
+}
+
+/* RaiseArgTupleInvalid */
+static void __Pyx_RaiseArgtupleInvalid(
+    const char* func_name,
+    int exact,
+    Py_ssize_t num_min,
+    Py_ssize_t num_max,
+    Py_ssize_t num_found)
+{
+    Py_ssize_t num_expected;
+    const char *more_or_less;
+    if (num_found < num_min) {
+        num_expected = num_min;
+        more_or_less = "at least";
+    } else {
+        num_expected = num_max;
+        more_or_less = "at most";
+    }
+    if (exact) {
+        more_or_less = "exactly";
+    }
+    PyErr_Format(PyExc_TypeError,
+                 "%.200s() takes %.8s %" CYTHON_FORMAT_SSIZE_T "d positional argument%.1s (%" CYTHON_FORMAT_SSIZE_T "d given)",
+                 func_name, more_or_less, num_expected,
+                 (num_expected == 1) ? "" : "s", num_found);
+}
+
+/* ArgTypeTest */
+static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact)
+{
+    __Pyx_TypeName type_name;
+    __Pyx_TypeName obj_type_name;
+    if (unlikely(!type)) {
+        PyErr_SetString(PyExc_SystemError, "Missing type object");
+        return 0;
+    }
+    else if (exact) {
+        #if PY_MAJOR_VERSION == 2
+        if ((type == &PyBaseString_Type) && likely(__Pyx_PyBaseString_CheckExact(obj))) return 1;
+        #endif
+    }
+    else {
+        if (likely(__Pyx_TypeCheck(obj, type))) return 1;
+    }
+    type_name = __Pyx_PyType_GetName(type);
+    obj_type_name = __Pyx_PyType_GetName(Py_TYPE(obj));
+    PyErr_Format(PyExc_TypeError,
+        "Argument '%.200s' has incorrect type (expected " __Pyx_FMT_TYPENAME
+        ", got " __Pyx_FMT_TYPENAME ")", name, type_name, obj_type_name);
+    __Pyx_DECREF_TypeName(type_name);
+    __Pyx_DECREF_TypeName(obj_type_name);
+    return 0;
+}
+
+/* TypeImport */
+#ifndef __PYX_HAVE_RT_ImportType_3_0_11
+#define __PYX_HAVE_RT_ImportType_3_0_11
+static PyTypeObject *__Pyx_ImportType_3_0_11(PyObject *module, const char *module_name, const char *class_name,
+    size_t size, size_t alignment, enum __Pyx_ImportType_CheckSize_3_0_11 check_size)
+{
+    PyObject *result = 0;
+    char warning[200];
+    Py_ssize_t basicsize;
+    Py_ssize_t itemsize;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    PyObject *py_basicsize;
+    PyObject *py_itemsize;
+#endif
+    result = PyObject_GetAttrString(module, class_name);
+    if (!result)
+        goto bad;
+    if (!PyType_Check(result)) {
+        PyErr_Format(PyExc_TypeError,
+            "%.200s.%.200s is not a type object",
+            module_name, class_name);
+        goto bad;
+    }
+#if !CYTHON_COMPILING_IN_LIMITED_API
+    basicsize = ((PyTypeObject *)result)->tp_basicsize;
+    itemsize = ((PyTypeObject *)result)->tp_itemsize;
+#else
+    py_basicsize = PyObject_GetAttrString(result, "__basicsize__");
+    if (!py_basicsize)
+        goto bad;
+    basicsize = PyLong_AsSsize_t(py_basicsize);
+    Py_DECREF(py_basicsize);
+    py_basicsize = 0;
+    if (basicsize == (Py_ssize_t)-1 && PyErr_Occurred())
+        goto bad;
+    py_itemsize = PyObject_GetAttrString(result, "__itemsize__");
+    if (!py_itemsize)
+        goto bad;
+    itemsize = PyLong_AsSsize_t(py_itemsize);
+    Py_DECREF(py_itemsize);
+    py_itemsize = 0;
+    if (itemsize == (Py_ssize_t)-1 && PyErr_Occurred())
+        goto bad;
+#endif
+    if (itemsize) {
+        if (size % alignment) {
+            alignment = size % alignment;
+        }
+        if (itemsize < (Py_ssize_t)alignment)
+            itemsize = (Py_ssize_t)alignment;
+    }
+    if ((size_t)(basicsize + itemsize) < size) {
+        PyErr_Format(PyExc_ValueError,
+            "%.200s.%.200s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize+itemsize);
+        goto bad;
+    }
+    if (check_size == __Pyx_ImportType_CheckSize_Error_3_0_11 &&
+            ((size_t)basicsize > size || (size_t)(basicsize + itemsize) < size)) {
+        PyErr_Format(PyExc_ValueError,
+            "%.200s.%.200s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd-%zd from PyObject",
+            module_name, class_name, size, basicsize, basicsize+itemsize);
+        goto bad;
+    }
+    else if (check_size == __Pyx_ImportType_CheckSize_Warn_3_0_11 && (size_t)basicsize > size) {
+        PyOS_snprintf(warning, sizeof(warning),
+            "%s.%s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize);
+        if (PyErr_WarnEx(NULL, warning, 0) < 0) goto bad;
+    }
+    return (PyTypeObject *)result;
+bad:
+    Py_XDECREF(result);
+    return NULL;
+}
+#endif
+
+/* GetVTable */
+static void* __Pyx_GetVtable(PyTypeObject *type) {
+    void* ptr;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    PyObject *ob = PyObject_GetAttr((PyObject *)type, __pyx_n_s_pyx_vtable);
+#else
+    PyObject *ob = PyObject_GetItem(type->tp_dict, __pyx_n_s_pyx_vtable);
+#endif
+    if (!ob)
+        goto bad;
+    ptr = PyCapsule_GetPointer(ob, 0);
+    if (!ptr && !PyErr_Occurred())
+        PyErr_SetString(PyExc_RuntimeError, "invalid vtable found for imported type");
+    Py_DECREF(ob);
+    return ptr;
+bad:
+    Py_XDECREF(ob);
+    return NULL;
+}
+
+/* FixUpExtensionType */
+#if CYTHON_USE_TYPE_SPECS
+static int __Pyx_fix_up_extension_type_from_spec(PyType_Spec *spec, PyTypeObject *type) {
+#if PY_VERSION_HEX > 0x030900B1 || CYTHON_COMPILING_IN_LIMITED_API
+    CYTHON_UNUSED_VAR(spec);
+    CYTHON_UNUSED_VAR(type);
+#else
+    const PyType_Slot *slot = spec->slots;
+    while (slot && slot->slot && slot->slot != Py_tp_members)
+        slot++;
+    if (slot && slot->slot == Py_tp_members) {
+        int changed = 0;
+#if !(PY_VERSION_HEX <= 0x030900b1 && CYTHON_COMPILING_IN_CPYTHON)
+        const
+#endif
+            PyMemberDef *memb = (PyMemberDef*) slot->pfunc;
+        while (memb && memb->name) {
+            if (memb->name[0] == '_' && memb->name[1] == '_') {
+#if PY_VERSION_HEX < 0x030900b1
+                if (strcmp(memb->name, "__weaklistoffset__") == 0) {
+                    assert(memb->type == T_PYSSIZET);
+                    assert(memb->flags == READONLY);
+                    type->tp_weaklistoffset = memb->offset;
+                    changed = 1;
+                }
+                else if (strcmp(memb->name, "__dictoffset__") == 0) {
+                    assert(memb->type == T_PYSSIZET);
+                    assert(memb->flags == READONLY);
+                    type->tp_dictoffset = memb->offset;
+                    changed = 1;
+                }
+#if CYTHON_METH_FASTCALL
+                else if (strcmp(memb->name, "__vectorcalloffset__") == 0) {
+                    assert(memb->type == T_PYSSIZET);
+                    assert(memb->flags == READONLY);
+#if PY_VERSION_HEX >= 0x030800b4
+                    type->tp_vectorcall_offset = memb->offset;
+#else
+                    type->tp_print = (printfunc) memb->offset;
+#endif
+                    changed = 1;
+                }
+#endif
+#else
+                if ((0));
+#endif
+#if PY_VERSION_HEX <= 0x030900b1 && CYTHON_COMPILING_IN_CPYTHON
+                else if (strcmp(memb->name, "__module__") == 0) {
+                    PyObject *descr;
+                    assert(memb->type == T_OBJECT);
+                    assert(memb->flags == 0 || memb->flags == READONLY);
+                    descr = PyDescr_NewMember(type, memb);
+                    if (unlikely(!descr))
+                        return -1;
+                    if (unlikely(PyDict_SetItem(type->tp_dict, PyDescr_NAME(descr), descr) < 0)) {
+                        Py_DECREF(descr);
+                        return -1;
+                    }
+                    Py_DECREF(descr);
+                    changed = 1;
+                }
+#endif
+            }
+            memb++;
+        }
+        if (changed)
+            PyType_Modified(type);
+    }
+#endif
+    return 0;
+}
+#endif
+
+/* FetchSharedCythonModule */
+static PyObject *__Pyx_FetchSharedCythonABIModule(void) {
+    return __Pyx_PyImport_AddModuleRef((char*) __PYX_ABI_MODULE_NAME);
+}
+
+/* FetchCommonType */
+static int __Pyx_VerifyCachedType(PyObject *cached_type,
+                               const char *name,
+                               Py_ssize_t basicsize,
+                               Py_ssize_t expected_basicsize) {
+    if (!PyType_Check(cached_type)) {
+        PyErr_Format(PyExc_TypeError,
+            "Shared Cython type %.200s is not a type object", name);
+        return -1;
+    }
+    if (basicsize != expected_basicsize) {
+        PyErr_Format(PyExc_TypeError,
+            "Shared Cython type %.200s has the wrong size, try recompiling",
+            name);
+        return -1;
+    }
+    return 0;
+}
+#if !CYTHON_USE_TYPE_SPECS
+static PyTypeObject* __Pyx_FetchCommonType(PyTypeObject* type) {
+    PyObject* abi_module;
+    const char* object_name;
+    PyTypeObject *cached_type = NULL;
+    abi_module = __Pyx_FetchSharedCythonABIModule();
+    if (!abi_module) return NULL;
+    object_name = strrchr(type->tp_name, '.');
+    object_name = object_name ? object_name+1 : type->tp_name;
+    cached_type = (PyTypeObject*) PyObject_GetAttrString(abi_module, object_name);
+    if (cached_type) {
+        if (__Pyx_VerifyCachedType(
+              (PyObject *)cached_type,
+              object_name,
+              cached_type->tp_basicsize,
+              type->tp_basicsize) < 0) {
+            goto bad;
+        }
+        goto done;
+    }
+    if (!PyErr_ExceptionMatches(PyExc_AttributeError)) goto bad;
+    PyErr_Clear();
+    if (PyType_Ready(type) < 0) goto bad;
+    if (PyObject_SetAttrString(abi_module, object_name, (PyObject *)type) < 0)
+        goto bad;
+    Py_INCREF(type);
+    cached_type = type;
+done:
+    Py_DECREF(abi_module);
+    return cached_type;
+bad:
+    Py_XDECREF(cached_type);
+    cached_type = NULL;
+    goto done;
+}
+#else
+static PyTypeObject *__Pyx_FetchCommonTypeFromSpec(PyObject *module, PyType_Spec *spec, PyObject *bases) {
+    PyObject *abi_module, *cached_type = NULL;
+    const char* object_name = strrchr(spec->name, '.');
+    object_name = object_name ? object_name+1 : spec->name;
+    abi_module = __Pyx_FetchSharedCythonABIModule();
+    if (!abi_module) return NULL;
+    cached_type = PyObject_GetAttrString(abi_module, object_name);
+    if (cached_type) {
+        Py_ssize_t basicsize;
+#if CYTHON_COMPILING_IN_LIMITED_API
+        PyObject *py_basicsize;
+        py_basicsize = PyObject_GetAttrString(cached_type, "__basicsize__");
+        if (unlikely(!py_basicsize)) goto bad;
+        basicsize = PyLong_AsSsize_t(py_basicsize);
+        Py_DECREF(py_basicsize);
+        py_basicsize = 0;
+        if (unlikely(basicsize == (Py_ssize_t)-1) && PyErr_Occurred()) goto bad;
+#else
+        basicsize = likely(PyType_Check(cached_type)) ? ((PyTypeObject*) cached_type)->tp_basicsize : -1;
+#endif
+        if (__Pyx_VerifyCachedType(
+              cached_type,
+              object_name,
+              basicsize,
+              spec->basicsize) < 0) {
+            goto bad;
+        }
+        goto done;
+    }
+    if (!PyErr_ExceptionMatches(PyExc_AttributeError)) goto bad;
+    PyErr_Clear();
+    CYTHON_UNUSED_VAR(module);
+    cached_type = __Pyx_PyType_FromModuleAndSpec(abi_module, spec, bases);
+    if (unlikely(!cached_type)) goto bad;
+    if (unlikely(__Pyx_fix_up_extension_type_from_spec(spec, (PyTypeObject *) cached_type) < 0)) goto bad;
+    if (PyObject_SetAttrString(abi_module, object_name, cached_type) < 0) goto bad;
+done:
+    Py_DECREF(abi_module);
+    assert(cached_type == NULL || PyType_Check(cached_type));
+    return (PyTypeObject *) cached_type;
+bad:
+    Py_XDECREF(cached_type);
+    cached_type = NULL;
+    goto done;
+}
+#endif
+
+/* PyVectorcallFastCallDict */
+#if CYTHON_METH_FASTCALL
+static PyObject *__Pyx_PyVectorcall_FastCallDict_kw(PyObject *func, __pyx_vectorcallfunc vc, PyObject *const *args, size_t nargs, PyObject *kw)
+{
+    PyObject *res = NULL;
+    PyObject *kwnames;
+    PyObject **newargs;
+    PyObject **kwvalues;
+    Py_ssize_t i, pos;
+    size_t j;
+    PyObject *key, *value;
+    unsigned long keys_are_strings;
+    Py_ssize_t nkw = PyDict_GET_SIZE(kw);
+    newargs = (PyObject **)PyMem_Malloc((nargs + (size_t)nkw) * sizeof(args[0]));
+    if (unlikely(newargs == NULL)) {
+        PyErr_NoMemory();
+        return NULL;
+    }
+    for (j = 0; j < nargs; j++) newargs[j] = args[j];
+    kwnames = PyTuple_New(nkw);
+    if (unlikely(kwnames == NULL)) {
+        PyMem_Free(newargs);
+        return NULL;
+    }
+    kwvalues = newargs + nargs;
+    pos = i = 0;
+    keys_are_strings = Py_TPFLAGS_UNICODE_SUBCLASS;
+    while (PyDict_Next(kw, &pos, &key, &value)) {
+        keys_are_strings &= Py_TYPE(key)->tp_flags;
+        Py_INCREF(key);
+        Py_INCREF(value);
+        PyTuple_SET_ITEM(kwnames, i, key);
+        kwvalues[i] = value;
+        i++;
+    }
+    if (unlikely(!keys_are_strings)) {
+        PyErr_SetString(PyExc_TypeError, "keywords must be strings");
+        goto cleanup;
+    }
+    res = vc(func, newargs, nargs, kwnames);
+cleanup:
+    Py_DECREF(kwnames);
+    for (i = 0; i < nkw; i++)
+        Py_DECREF(kwvalues[i]);
+    PyMem_Free(newargs);
+    return res;
+}
+static CYTHON_INLINE PyObject *__Pyx_PyVectorcall_FastCallDict(PyObject *func, __pyx_vectorcallfunc vc, PyObject *const *args, size_t nargs, PyObject *kw)
+{
+    if (likely(kw == NULL) || PyDict_GET_SIZE(kw) == 0) {
+        return vc(func, args, nargs, NULL);
+    }
+    return __Pyx_PyVectorcall_FastCallDict_kw(func, vc, args, nargs, kw);
+}
+#endif
+
+/* CythonFunctionShared */
+#if CYTHON_COMPILING_IN_LIMITED_API
+static CYTHON_INLINE int __Pyx__IsSameCyOrCFunction(PyObject *func, void *cfunc) {
+    if (__Pyx_CyFunction_Check(func)) {
+        return PyCFunction_GetFunction(((__pyx_CyFunctionObject*)func)->func) == (PyCFunction) cfunc;
+    } else if (PyCFunction_Check(func)) {
+        return PyCFunction_GetFunction(func) == (PyCFunction) cfunc;
+    }
+    return 0;
+}
+#else
+static CYTHON_INLINE int __Pyx__IsSameCyOrCFunction(PyObject *func, void *cfunc) {
+    return __Pyx_CyOrPyCFunction_Check(func) && __Pyx_CyOrPyCFunction_GET_FUNCTION(func) == (PyCFunction) cfunc;
+}
+#endif
+static CYTHON_INLINE void __Pyx__CyFunction_SetClassObj(__pyx_CyFunctionObject* f, PyObject* classobj) {
+#if PY_VERSION_HEX < 0x030900B1 || CYTHON_COMPILING_IN_LIMITED_API
+    __Pyx_Py_XDECREF_SET(
+        __Pyx_CyFunction_GetClassObj(f),
+            ((classobj) ? __Pyx_NewRef(classobj) : NULL));
+#else
+    __Pyx_Py_XDECREF_SET(
+        ((PyCMethodObject *) (f))->mm_class,
+        (PyTypeObject*)((classobj) ? __Pyx_NewRef(classobj) : NULL));
+#endif
+}
+static PyObject *
+__Pyx_CyFunction_get_doc(__pyx_CyFunctionObject *op, void *closure)
+{
+    CYTHON_UNUSED_VAR(closure);
+    if (unlikely(op->func_doc == NULL)) {
+#if CYTHON_COMPILING_IN_LIMITED_API
+        op->func_doc = PyObject_GetAttrString(op->func, "__doc__");
+        if (unlikely(!op->func_doc)) return NULL;
+#else
+        if (((PyCFunctionObject*)op)->m_ml->ml_doc) {
+#if PY_MAJOR_VERSION >= 3
+            op->func_doc = PyUnicode_FromString(((PyCFunctionObject*)op)->m_ml->ml_doc);
+#else
+            op->func_doc = PyString_FromString(((PyCFunctionObject*)op)->m_ml->ml_doc);
+#endif
+            if (unlikely(op->func_doc == NULL))
+                return NULL;
+        } else {
+            Py_INCREF(Py_None);
+            return Py_None;
+        }
+#endif
+    }
+    Py_INCREF(op->func_doc);
+    return op->func_doc;
+}
+static int
+__Pyx_CyFunction_set_doc(__pyx_CyFunctionObject *op, PyObject *value, void *context)
+{
+    CYTHON_UNUSED_VAR(context);
+    if (value == NULL) {
+        value = Py_None;
+    }
+    Py_INCREF(value);
+    __Pyx_Py_XDECREF_SET(op->func_doc, value);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_name(__pyx_CyFunctionObject *op, void *context)
+{
+    CYTHON_UNUSED_VAR(context);
+    if (unlikely(op->func_name == NULL)) {
+#if CYTHON_COMPILING_IN_LIMITED_API
+        op->func_name = PyObject_GetAttrString(op->func, "__name__");
+#elif PY_MAJOR_VERSION >= 3
+        op->func_name = PyUnicode_InternFromString(((PyCFunctionObject*)op)->m_ml->ml_name);
+#else
+        op->func_name = PyString_InternFromString(((PyCFunctionObject*)op)->m_ml->ml_name);
+#endif
+        if (unlikely(op->func_name == NULL))
+            return NULL;
+    }
+    Py_INCREF(op->func_name);
+    return op->func_name;
+}
+static int
+__Pyx_CyFunction_set_name(__pyx_CyFunctionObject *op, PyObject *value, void *context)
+{
+    CYTHON_UNUSED_VAR(context);
+#if PY_MAJOR_VERSION >= 3
+    if (unlikely(value == NULL || !PyUnicode_Check(value)))
+#else
+    if (unlikely(value == NULL || !PyString_Check(value)))
+#endif
+    {
+        PyErr_SetString(PyExc_TypeError,
+                        "__name__ must be set to a string object");
+        return -1;
+    }
+    Py_INCREF(value);
+    __Pyx_Py_XDECREF_SET(op->func_name, value);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_qualname(__pyx_CyFunctionObject *op, void *context)
+{
+    CYTHON_UNUSED_VAR(context);
+    Py_INCREF(op->func_qualname);
+    return op->func_qualname;
+}
+static int
+__Pyx_CyFunction_set_qualname(__pyx_CyFunctionObject *op, PyObject *value, void *context)
+{
+    CYTHON_UNUSED_VAR(context);
+#if PY_MAJOR_VERSION >= 3
+    if (unlikely(value == NULL || !PyUnicode_Check(value)))
+#else
+    if (unlikely(value == NULL || !PyString_Check(value)))
+#endif
+    {
+        PyErr_SetString(PyExc_TypeError,
+                        "__qualname__ must be set to a string object");
+        return -1;
+    }
+    Py_INCREF(value);
+    __Pyx_Py_XDECREF_SET(op->func_qualname, value);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_dict(__pyx_CyFunctionObject *op, void *context)
+{
+    CYTHON_UNUSED_VAR(context);
+    if (unlikely(op->func_dict == NULL)) {
+        op->func_dict = PyDict_New();
+        if (unlikely(op->func_dict == NULL))
+            return NULL;
+    }
+    Py_INCREF(op->func_dict);
+    return op->func_dict;
+}
+static int
+__Pyx_CyFunction_set_dict(__pyx_CyFunctionObject *op, PyObject *value, void *context)
+{
+    CYTHON_UNUSED_VAR(context);
+    if (unlikely(value == NULL)) {
+        PyErr_SetString(PyExc_TypeError,
+               "function's dictionary may not be deleted");
+        return -1;
+    }
+    if (unlikely(!PyDict_Check(value))) {
+        PyErr_SetString(PyExc_TypeError,
+               "setting function's dictionary to a non-dict");
+        return -1;
+    }
+    Py_INCREF(value);
+    __Pyx_Py_XDECREF_SET(op->func_dict, value);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_globals(__pyx_CyFunctionObject *op, void *context)
+{
+    CYTHON_UNUSED_VAR(context);
+    Py_INCREF(op->func_globals);
+    return op->func_globals;
+}
+static PyObject *
+__Pyx_CyFunction_get_closure(__pyx_CyFunctionObject *op, void *context)
+{
+    CYTHON_UNUSED_VAR(op);
+    CYTHON_UNUSED_VAR(context);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+static PyObject *
+__Pyx_CyFunction_get_code(__pyx_CyFunctionObject *op, void *context)
+{
+    PyObject* result = (op->func_code) ? op->func_code : Py_None;
+    CYTHON_UNUSED_VAR(context);
+    Py_INCREF(result);
+    return result;
+}
+static int
+__Pyx_CyFunction_init_defaults(__pyx_CyFunctionObject *op) {
+    int result = 0;
+    PyObject *res = op->defaults_getter((PyObject *) op);
+    if (unlikely(!res))
+        return -1;
+    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    op->defaults_tuple = PyTuple_GET_ITEM(res, 0);
+    Py_INCREF(op->defaults_tuple);
+    op->defaults_kwdict = PyTuple_GET_ITEM(res, 1);
+    Py_INCREF(op->defaults_kwdict);
+    #else
+    op->defaults_tuple = __Pyx_PySequence_ITEM(res, 0);
+    if (unlikely(!op->defaults_tuple)) result = -1;
+    else {
+        op->defaults_kwdict = __Pyx_PySequence_ITEM(res, 1);
+        if (unlikely(!op->defaults_kwdict)) result = -1;
+    }
+    #endif
+    Py_DECREF(res);
+    return result;
+}
+static int
+__Pyx_CyFunction_set_defaults(__pyx_CyFunctionObject *op, PyObject* value, void *context) {
+    CYTHON_UNUSED_VAR(context);
+    if (!value) {
+        value = Py_None;
+    } else if (unlikely(value != Py_None && !PyTuple_Check(value))) {
+        PyErr_SetString(PyExc_TypeError,
+                        "__defaults__ must be set to a tuple object");
+        return -1;
+    }
+    PyErr_WarnEx(PyExc_RuntimeWarning, "changes to cyfunction.__defaults__ will not "
+                 "currently affect the values used in function calls", 1);
+    Py_INCREF(value);
+    __Pyx_Py_XDECREF_SET(op->defaults_tuple, value);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_defaults(__pyx_CyFunctionObject *op, void *context) {
+    PyObject* result = op->defaults_tuple;
+    CYTHON_UNUSED_VAR(context);
+    if (unlikely(!result)) {
+        if (op->defaults_getter) {
+            if (unlikely(__Pyx_CyFunction_init_defaults(op) < 0)) return NULL;
+            result = op->defaults_tuple;
+        } else {
+            result = Py_None;
+        }
+    }
+    Py_INCREF(result);
+    return result;
+}
+static int
+__Pyx_CyFunction_set_kwdefaults(__pyx_CyFunctionObject *op, PyObject* value, void *context) {
+    CYTHON_UNUSED_VAR(context);
+    if (!value) {
+        value = Py_None;
+    } else if (unlikely(value != Py_None && !PyDict_Check(value))) {
+        PyErr_SetString(PyExc_TypeError,
+                        "__kwdefaults__ must be set to a dict object");
+        return -1;
+    }
+    PyErr_WarnEx(PyExc_RuntimeWarning, "changes to cyfunction.__kwdefaults__ will not "
+                 "currently affect the values used in function calls", 1);
+    Py_INCREF(value);
+    __Pyx_Py_XDECREF_SET(op->defaults_kwdict, value);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_kwdefaults(__pyx_CyFunctionObject *op, void *context) {
+    PyObject* result = op->defaults_kwdict;
+    CYTHON_UNUSED_VAR(context);
+    if (unlikely(!result)) {
+        if (op->defaults_getter) {
+            if (unlikely(__Pyx_CyFunction_init_defaults(op) < 0)) return NULL;
+            result = op->defaults_kwdict;
+        } else {
+            result = Py_None;
+        }
+    }
+    Py_INCREF(result);
+    return result;
+}
+static int
+__Pyx_CyFunction_set_annotations(__pyx_CyFunctionObject *op, PyObject* value, void *context) {
+    CYTHON_UNUSED_VAR(context);
+    if (!value || value == Py_None) {
+        value = NULL;
+    } else if (unlikely(!PyDict_Check(value))) {
+        PyErr_SetString(PyExc_TypeError,
+                        "__annotations__ must be set to a dict object");
+        return -1;
+    }
+    Py_XINCREF(value);
+    __Pyx_Py_XDECREF_SET(op->func_annotations, value);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_annotations(__pyx_CyFunctionObject *op, void *context) {
+    PyObject* result = op->func_annotations;
+    CYTHON_UNUSED_VAR(context);
+    if (unlikely(!result)) {
+        result = PyDict_New();
+        if (unlikely(!result)) return NULL;
+        op->func_annotations = result;
+    }
+    Py_INCREF(result);
+    return result;
+}
+static PyObject *
+__Pyx_CyFunction_get_is_coroutine(__pyx_CyFunctionObject *op, void *context) {
+    int is_coroutine;
+    CYTHON_UNUSED_VAR(context);
+    if (op->func_is_coroutine) {
+        return __Pyx_NewRef(op->func_is_coroutine);
+    }
+    is_coroutine = op->flags & __Pyx_CYFUNCTION_COROUTINE;
+#if PY_VERSION_HEX >= 0x03050000
+    if (is_coroutine) {
+        PyObject *module, *fromlist, *marker = __pyx_n_s_is_coroutine;
+        fromlist = PyList_New(1);
+        if (unlikely(!fromlist)) return NULL;
+        Py_INCREF(marker);
+#if CYTHON_ASSUME_SAFE_MACROS
+        PyList_SET_ITEM(fromlist, 0, marker);
+#else
+        if (unlikely(PyList_SetItem(fromlist, 0, marker) < 0)) {
+            Py_DECREF(marker);
+            Py_DECREF(fromlist);
+            return NULL;
+        }
+#endif
+        module = PyImport_ImportModuleLevelObject(__pyx_n_s_asyncio_coroutines, NULL, NULL, fromlist, 0);
+        Py_DECREF(fromlist);
+        if (unlikely(!module)) goto ignore;
+        op->func_is_coroutine = __Pyx_PyObject_GetAttrStr(module, marker);
+        Py_DECREF(module);
+        if (likely(op->func_is_coroutine)) {
+            return __Pyx_NewRef(op->func_is_coroutine);
+        }
+ignore:
+        PyErr_Clear();
+    }
+#endif
+    op->func_is_coroutine = __Pyx_PyBool_FromLong(is_coroutine);
+    return __Pyx_NewRef(op->func_is_coroutine);
+}
+#if CYTHON_COMPILING_IN_LIMITED_API
+static PyObject *
+__Pyx_CyFunction_get_module(__pyx_CyFunctionObject *op, void *context) {
+    CYTHON_UNUSED_VAR(context);
+    return PyObject_GetAttrString(op->func, "__module__");
+}
+static int
+__Pyx_CyFunction_set_module(__pyx_CyFunctionObject *op, PyObject* value, void *context) {
+    CYTHON_UNUSED_VAR(context);
+    return PyObject_SetAttrString(op->func, "__module__", value);
+}
+#endif
+static PyGetSetDef __pyx_CyFunction_getsets[] = {
+    {(char *) "func_doc", (getter)__Pyx_CyFunction_get_doc, (setter)__Pyx_CyFunction_set_doc, 0, 0},
+    {(char *) "__doc__",  (getter)__Pyx_CyFunction_get_doc, (setter)__Pyx_CyFunction_set_doc, 0, 0},
+    {(char *) "func_name", (getter)__Pyx_CyFunction_get_name, (setter)__Pyx_CyFunction_set_name, 0, 0},
+    {(char *) "__name__", (getter)__Pyx_CyFunction_get_name, (setter)__Pyx_CyFunction_set_name, 0, 0},
+    {(char *) "__qualname__", (getter)__Pyx_CyFunction_get_qualname, (setter)__Pyx_CyFunction_set_qualname, 0, 0},
+    {(char *) "func_dict", (getter)__Pyx_CyFunction_get_dict, (setter)__Pyx_CyFunction_set_dict, 0, 0},
+    {(char *) "__dict__", (getter)__Pyx_CyFunction_get_dict, (setter)__Pyx_CyFunction_set_dict, 0, 0},
+    {(char *) "func_globals", (getter)__Pyx_CyFunction_get_globals, 0, 0, 0},
+    {(char *) "__globals__", (getter)__Pyx_CyFunction_get_globals, 0, 0, 0},
+    {(char *) "func_closure", (getter)__Pyx_CyFunction_get_closure, 0, 0, 0},
+    {(char *) "__closure__", (getter)__Pyx_CyFunction_get_closure, 0, 0, 0},
+    {(char *) "func_code", (getter)__Pyx_CyFunction_get_code, 0, 0, 0},
+    {(char *) "__code__", (getter)__Pyx_CyFunction_get_code, 0, 0, 0},
+    {(char *) "func_defaults", (getter)__Pyx_CyFunction_get_defaults, (setter)__Pyx_CyFunction_set_defaults, 0, 0},
+    {(char *) "__defaults__", (getter)__Pyx_CyFunction_get_defaults, (setter)__Pyx_CyFunction_set_defaults, 0, 0},
+    {(char *) "__kwdefaults__", (getter)__Pyx_CyFunction_get_kwdefaults, (setter)__Pyx_CyFunction_set_kwdefaults, 0, 0},
+    {(char *) "__annotations__", (getter)__Pyx_CyFunction_get_annotations, (setter)__Pyx_CyFunction_set_annotations, 0, 0},
+    {(char *) "_is_coroutine", (getter)__Pyx_CyFunction_get_is_coroutine, 0, 0, 0},
+#if CYTHON_COMPILING_IN_LIMITED_API
+    {"__module__", (getter)__Pyx_CyFunction_get_module, (setter)__Pyx_CyFunction_set_module, 0, 0},
+#endif
+    {0, 0, 0, 0, 0}
+};
+static PyMemberDef __pyx_CyFunction_members[] = {
+#if !CYTHON_COMPILING_IN_LIMITED_API
+    {(char *) "__module__", T_OBJECT, offsetof(PyCFunctionObject, m_module), 0, 0},
+#endif
+#if CYTHON_USE_TYPE_SPECS
+    {(char *) "__dictoffset__", T_PYSSIZET, offsetof(__pyx_CyFunctionObject, func_dict), READONLY, 0},
+#if CYTHON_METH_FASTCALL
+#if CYTHON_BACKPORT_VECTORCALL
+    {(char *) "__vectorcalloffset__", T_PYSSIZET, offsetof(__pyx_CyFunctionObject, func_vectorcall), READONLY, 0},
+#else
+#if !CYTHON_COMPILING_IN_LIMITED_API
+    {(char *) "__vectorcalloffset__", T_PYSSIZET, offsetof(PyCFunctionObject, vectorcall), READONLY, 0},
+#endif
+#endif
+#endif
+#if PY_VERSION_HEX < 0x030500A0 || CYTHON_COMPILING_IN_LIMITED_API
+    {(char *) "__weaklistoffset__", T_PYSSIZET, offsetof(__pyx_CyFunctionObject, func_weakreflist), READONLY, 0},
+#else
+    {(char *) "__weaklistoffset__", T_PYSSIZET, offsetof(PyCFunctionObject, m_weakreflist), READONLY, 0},
+#endif
+#endif
+    {0, 0, 0,  0, 0}
+};
+static PyObject *
+__Pyx_CyFunction_reduce(__pyx_CyFunctionObject *m, PyObject *args)
+{
+    CYTHON_UNUSED_VAR(args);
+#if PY_MAJOR_VERSION >= 3
+    Py_INCREF(m->func_qualname);
+    return m->func_qualname;
+#else
+    return PyString_FromString(((PyCFunctionObject*)m)->m_ml->ml_name);
+#endif
+}
+static PyMethodDef __pyx_CyFunction_methods[] = {
+    {"__reduce__", (PyCFunction)__Pyx_CyFunction_reduce, METH_VARARGS, 0},
+    {0, 0, 0, 0}
+};
+#if PY_VERSION_HEX < 0x030500A0 || CYTHON_COMPILING_IN_LIMITED_API
+#define __Pyx_CyFunction_weakreflist(cyfunc) ((cyfunc)->func_weakreflist)
+#else
+#define __Pyx_CyFunction_weakreflist(cyfunc) (((PyCFunctionObject*)cyfunc)->m_weakreflist)
+#endif
+static PyObject *__Pyx_CyFunction_Init(__pyx_CyFunctionObject *op, PyMethodDef *ml, int flags, PyObject* qualname,
+                                       PyObject *closure, PyObject *module, PyObject* globals, PyObject* code) {
+#if !CYTHON_COMPILING_IN_LIMITED_API
+    PyCFunctionObject *cf = (PyCFunctionObject*) op;
+#endif
+    if (unlikely(op == NULL))
+        return NULL;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    op->func = PyCFunction_NewEx(ml, (PyObject*)op, module);
+    if (unlikely(!op->func)) return NULL;
+#endif
+    op->flags = flags;
+    __Pyx_CyFunction_weakreflist(op) = NULL;
+#if !CYTHON_COMPILING_IN_LIMITED_API
+    cf->m_ml = ml;
+    cf->m_self = (PyObject *) op;
+#endif
+    Py_XINCREF(closure);
+    op->func_closure = closure;
+#if !CYTHON_COMPILING_IN_LIMITED_API
+    Py_XINCREF(module);
+    cf->m_module = module;
+#endif
+    op->func_dict = NULL;
+    op->func_name = NULL;
+    Py_INCREF(qualname);
+    op->func_qualname = qualname;
+    op->func_doc = NULL;
+#if PY_VERSION_HEX < 0x030900B1 || CYTHON_COMPILING_IN_LIMITED_API
+    op->func_classobj = NULL;
+#else
+    ((PyCMethodObject*)op)->mm_class = NULL;
+#endif
+    op->func_globals = globals;
+    Py_INCREF(op->func_globals);
+    Py_XINCREF(code);
+    op->func_code = code;
+    op->defaults_pyobjects = 0;
+    op->defaults_size = 0;
+    op->defaults = NULL;
+    op->defaults_tuple = NULL;
+    op->defaults_kwdict = NULL;
+    op->defaults_getter = NULL;
+    op->func_annotations = NULL;
+    op->func_is_coroutine = NULL;
+#if CYTHON_METH_FASTCALL
+    switch (ml->ml_flags & (METH_VARARGS | METH_FASTCALL | METH_NOARGS | METH_O | METH_KEYWORDS | METH_METHOD)) {
+    case METH_NOARGS:
+        __Pyx_CyFunction_func_vectorcall(op) = __Pyx_CyFunction_Vectorcall_NOARGS;
+        break;
+    case METH_O:
+        __Pyx_CyFunction_func_vectorcall(op) = __Pyx_CyFunction_Vectorcall_O;
+        break;
+    case METH_METHOD | METH_FASTCALL | METH_KEYWORDS:
+        __Pyx_CyFunction_func_vectorcall(op) = __Pyx_CyFunction_Vectorcall_FASTCALL_KEYWORDS_METHOD;
+        break;
+    case METH_FASTCALL | METH_KEYWORDS:
+        __Pyx_CyFunction_func_vectorcall(op) = __Pyx_CyFunction_Vectorcall_FASTCALL_KEYWORDS;
+        break;
+    case METH_VARARGS | METH_KEYWORDS:
+        __Pyx_CyFunction_func_vectorcall(op) = NULL;
+        break;
+    default:
+        PyErr_SetString(PyExc_SystemError, "Bad call flags for CyFunction");
+        Py_DECREF(op);
+        return NULL;
+    }
+#endif
+    return (PyObject *) op;
+}
+static int
+__Pyx_CyFunction_clear(__pyx_CyFunctionObject *m)
+{
+    Py_CLEAR(m->func_closure);
+#if CYTHON_COMPILING_IN_LIMITED_API
+    Py_CLEAR(m->func);
+#else
+    Py_CLEAR(((PyCFunctionObject*)m)->m_module);
+#endif
+    Py_CLEAR(m->func_dict);
+    Py_CLEAR(m->func_name);
+    Py_CLEAR(m->func_qualname);
+    Py_CLEAR(m->func_doc);
+    Py_CLEAR(m->func_globals);
+    Py_CLEAR(m->func_code);
+#if !CYTHON_COMPILING_IN_LIMITED_API
+#if PY_VERSION_HEX < 0x030900B1
+    Py_CLEAR(__Pyx_CyFunction_GetClassObj(m));
+#else
+    {
+        PyObject *cls = (PyObject*) ((PyCMethodObject *) (m))->mm_class;
+        ((PyCMethodObject *) (m))->mm_class = NULL;
+        Py_XDECREF(cls);
+    }
+#endif
+#endif
+    Py_CLEAR(m->defaults_tuple);
+    Py_CLEAR(m->defaults_kwdict);
+    Py_CLEAR(m->func_annotations);
+    Py_CLEAR(m->func_is_coroutine);
+    if (m->defaults) {
+        PyObject **pydefaults = __Pyx_CyFunction_Defaults(PyObject *, m);
+        int i;
+        for (i = 0; i < m->defaults_pyobjects; i++)
+            Py_XDECREF(pydefaults[i]);
+        PyObject_Free(m->defaults);
+        m->defaults = NULL;
+    }
+    return 0;
+}
+static void __Pyx__CyFunction_dealloc(__pyx_CyFunctionObject *m)
+{
+    if (__Pyx_CyFunction_weakreflist(m) != NULL)
+        PyObject_ClearWeakRefs((PyObject *) m);
+    __Pyx_CyFunction_clear(m);
+    __Pyx_PyHeapTypeObject_GC_Del(m);
+}
+static void __Pyx_CyFunction_dealloc(__pyx_CyFunctionObject *m)
+{
+    PyObject_GC_UnTrack(m);
+    __Pyx__CyFunction_dealloc(m);
+}
+static int __Pyx_CyFunction_traverse(__pyx_CyFunctionObject *m, visitproc visit, void *arg)
+{
+    Py_VISIT(m->func_closure);
+#if CYTHON_COMPILING_IN_LIMITED_API
+    Py_VISIT(m->func);
+#else
+    Py_VISIT(((PyCFunctionObject*)m)->m_module);
+#endif
+    Py_VISIT(m->func_dict);
+    Py_VISIT(m->func_name);
+    Py_VISIT(m->func_qualname);
+    Py_VISIT(m->func_doc);
+    Py_VISIT(m->func_globals);
+    Py_VISIT(m->func_code);
+#if !CYTHON_COMPILING_IN_LIMITED_API
+    Py_VISIT(__Pyx_CyFunction_GetClassObj(m));
+#endif
+    Py_VISIT(m->defaults_tuple);
+    Py_VISIT(m->defaults_kwdict);
+    Py_VISIT(m->func_is_coroutine);
+    if (m->defaults) {
+        PyObject **pydefaults = __Pyx_CyFunction_Defaults(PyObject *, m);
+        int i;
+        for (i = 0; i < m->defaults_pyobjects; i++)
+            Py_VISIT(pydefaults[i]);
+    }
+    return 0;
+}
+static PyObject*
+__Pyx_CyFunction_repr(__pyx_CyFunctionObject *op)
+{
+#if PY_MAJOR_VERSION >= 3
+    return PyUnicode_FromFormat("<cyfunction %U at %p>",
+                                op->func_qualname, (void *)op);
+#else
+    return PyString_FromFormat("<cyfunction %s at %p>",
+                               PyString_AsString(op->func_qualname), (void *)op);
+#endif
+}
+static PyObject * __Pyx_CyFunction_CallMethod(PyObject *func, PyObject *self, PyObject *arg, PyObject *kw) {
+#if CYTHON_COMPILING_IN_LIMITED_API
+    PyObject *f = ((__pyx_CyFunctionObject*)func)->func;
+    PyObject *py_name = NULL;
+    PyCFunction meth;
+    int flags;
+    meth = PyCFunction_GetFunction(f);
+    if (unlikely(!meth)) return NULL;
+    flags = PyCFunction_GetFlags(f);
+    if (unlikely(flags < 0)) return NULL;
+#else
+    PyCFunctionObject* f = (PyCFunctionObject*)func;
+    PyCFunction meth = f->m_ml->ml_meth;
+    int flags = f->m_ml->ml_flags;
+#endif
+    Py_ssize_t size;
+    switch (flags & (METH_VARARGS | METH_KEYWORDS | METH_NOARGS | METH_O)) {
+    case METH_VARARGS:
+        if (likely(kw == NULL || PyDict_Size(kw) == 0))
+            return (*meth)(self, arg);
+        break;
+    case METH_VARARGS | METH_KEYWORDS:
+        return (*(PyCFunctionWithKeywords)(void*)meth)(self, arg, kw);
+    case METH_NOARGS:
+        if (likely(kw == NULL || PyDict_Size(kw) == 0)) {
+#if CYTHON_ASSUME_SAFE_MACROS
+            size = PyTuple_GET_SIZE(arg);
+#else
+            size = PyTuple_Size(arg);
+            if (unlikely(size < 0)) return NULL;
+#endif
+            if (likely(size == 0))
+                return (*meth)(self, NULL);
+#if CYTHON_COMPILING_IN_LIMITED_API
+            py_name = __Pyx_CyFunction_get_name((__pyx_CyFunctionObject*)func, NULL);
+            if (!py_name) return NULL;
+            PyErr_Format(PyExc_TypeError,
+                "%.200S() takes no arguments (%" CYTHON_FORMAT_SSIZE_T "d given)",
+                py_name, size);
+            Py_DECREF(py_name);
+#else
+            PyErr_Format(PyExc_TypeError,
+                "%.200s() takes no arguments (%" CYTHON_FORMAT_SSIZE_T "d given)",
+                f->m_ml->ml_name, size);
+#endif
+            return NULL;
+        }
+        break;
+    case METH_O:
+        if (likely(kw == NULL || PyDict_Size(kw) == 0)) {
+#if CYTHON_ASSUME_SAFE_MACROS
+            size = PyTuple_GET_SIZE(arg);
+#else
+            size = PyTuple_Size(arg);
+            if (unlikely(size < 0)) return NULL;
+#endif
+            if (likely(size == 1)) {
+                PyObject *result, *arg0;
+                #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+                arg0 = PyTuple_GET_ITEM(arg, 0);
+                #else
+                arg0 = __Pyx_PySequence_ITEM(arg, 0); if (unlikely(!arg0)) return NULL;
+                #endif
+                result = (*meth)(self, arg0);
+                #if !(CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS)
+                Py_DECREF(arg0);
+                #endif
+                return result;
+            }
+#if CYTHON_COMPILING_IN_LIMITED_API
+            py_name = __Pyx_CyFunction_get_name((__pyx_CyFunctionObject*)func, NULL);
+            if (!py_name) return NULL;
+            PyErr_Format(PyExc_TypeError,
+                "%.200S() takes exactly one argument (%" CYTHON_FORMAT_SSIZE_T "d given)",
+                py_name, size);
+            Py_DECREF(py_name);
+#else
+            PyErr_Format(PyExc_TypeError,
+                "%.200s() takes exactly one argument (%" CYTHON_FORMAT_SSIZE_T "d given)",
+                f->m_ml->ml_name, size);
+#endif
+            return NULL;
+        }
+        break;
+    default:
+        PyErr_SetString(PyExc_SystemError, "Bad call flags for CyFunction");
+        return NULL;
+    }
+#if CYTHON_COMPILING_IN_LIMITED_API
+    py_name = __Pyx_CyFunction_get_name((__pyx_CyFunctionObject*)func, NULL);
+    if (!py_name) return NULL;
+    PyErr_Format(PyExc_TypeError, "%.200S() takes no keyword arguments",
+                 py_name);
+    Py_DECREF(py_name);
+#else
+    PyErr_Format(PyExc_TypeError, "%.200s() takes no keyword arguments",
+                 f->m_ml->ml_name);
+#endif
+    return NULL;
+}
+static CYTHON_INLINE PyObject *__Pyx_CyFunction_Call(PyObject *func, PyObject *arg, PyObject *kw) {
+    PyObject *self, *result;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    self = PyCFunction_GetSelf(((__pyx_CyFunctionObject*)func)->func);
+    if (unlikely(!self) && PyErr_Occurred()) return NULL;
+#else
+    self = ((PyCFunctionObject*)func)->m_self;
+#endif
+    result = __Pyx_CyFunction_CallMethod(func, self, arg, kw);
+    return result;
+}
+static PyObject *__Pyx_CyFunction_CallAsMethod(PyObject *func, PyObject *args, PyObject *kw) {
+    PyObject *result;
+    __pyx_CyFunctionObject *cyfunc = (__pyx_CyFunctionObject *) func;
+#if CYTHON_METH_FASTCALL
+     __pyx_vectorcallfunc vc = __Pyx_CyFunction_func_vectorcall(cyfunc);
+    if (vc) {
+#if CYTHON_ASSUME_SAFE_MACROS
+        return __Pyx_PyVectorcall_FastCallDict(func, vc, &PyTuple_GET_ITEM(args, 0), (size_t)PyTuple_GET_SIZE(args), kw);
+#else
+        (void) &__Pyx_PyVectorcall_FastCallDict;
+        return PyVectorcall_Call(func, args, kw);
+#endif
+    }
+#endif
+    if ((cyfunc->flags & __Pyx_CYFUNCTION_CCLASS) && !(cyfunc->flags & __Pyx_CYFUNCTION_STATICMETHOD)) {
+        Py_ssize_t argc;
+        PyObject *new_args;
+        PyObject *self;
+#if CYTHON_ASSUME_SAFE_MACROS
+        argc = PyTuple_GET_SIZE(args);
+#else
+        argc = PyTuple_Size(args);
+        if (unlikely(!argc) < 0) return NULL;
+#endif
+        new_args = PyTuple_GetSlice(args, 1, argc);
+        if (unlikely(!new_args))
+            return NULL;
+        self = PyTuple_GetItem(args, 0);
+        if (unlikely(!self)) {
+            Py_DECREF(new_args);
+#if PY_MAJOR_VERSION > 2
+            PyErr_Format(PyExc_TypeError,
+                         "unbound method %.200S() needs an argument",
+                         cyfunc->func_qualname);
+#else
+            PyErr_SetString(PyExc_TypeError,
+                            "unbound method needs an argument");
+#endif
+            return NULL;
+        }
+        result = __Pyx_CyFunction_CallMethod(func, self, new_args, kw);
+        Py_DECREF(new_args);
+    } else {
+        result = __Pyx_CyFunction_Call(func, args, kw);
+    }
+    return result;
+}
+#if CYTHON_METH_FASTCALL
+static CYTHON_INLINE int __Pyx_CyFunction_Vectorcall_CheckArgs(__pyx_CyFunctionObject *cyfunc, Py_ssize_t nargs, PyObject *kwnames)
+{
+    int ret = 0;
+    if ((cyfunc->flags & __Pyx_CYFUNCTION_CCLASS) && !(cyfunc->flags & __Pyx_CYFUNCTION_STATICMETHOD)) {
+        if (unlikely(nargs < 1)) {
+            PyErr_Format(PyExc_TypeError, "%.200s() needs an argument",
+                         ((PyCFunctionObject*)cyfunc)->m_ml->ml_name);
+            return -1;
+        }
+        ret = 1;
+    }
+    if (unlikely(kwnames) && unlikely(PyTuple_GET_SIZE(kwnames))) {
+        PyErr_Format(PyExc_TypeError,
+                     "%.200s() takes no keyword arguments", ((PyCFunctionObject*)cyfunc)->m_ml->ml_name);
+        return -1;
+    }
+    return ret;
+}
+static PyObject * __Pyx_CyFunction_Vectorcall_NOARGS(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames)
+{
+    __pyx_CyFunctionObject *cyfunc = (__pyx_CyFunctionObject *)func;
+    PyMethodDef* def = ((PyCFunctionObject*)cyfunc)->m_ml;
+#if CYTHON_BACKPORT_VECTORCALL
+    Py_ssize_t nargs = (Py_ssize_t)nargsf;
+#else
+    Py_ssize_t nargs = PyVectorcall_NARGS(nargsf);
+#endif
+    PyObject *self;
+    switch (__Pyx_CyFunction_Vectorcall_CheckArgs(cyfunc, nargs, kwnames)) {
+    case 1:
+        self = args[0];
+        args += 1;
+        nargs -= 1;
+        break;
+    case 0:
+        self = ((PyCFunctionObject*)cyfunc)->m_self;
+        break;
+    default:
+        return NULL;
+    }
+    if (unlikely(nargs != 0)) {
+        PyErr_Format(PyExc_TypeError,
+            "%.200s() takes no arguments (%" CYTHON_FORMAT_SSIZE_T "d given)",
+            def->ml_name, nargs);
+        return NULL;
+    }
+    return def->ml_meth(self, NULL);
+}
+static PyObject * __Pyx_CyFunction_Vectorcall_O(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames)
+{
+    __pyx_CyFunctionObject *cyfunc = (__pyx_CyFunctionObject *)func;
+    PyMethodDef* def = ((PyCFunctionObject*)cyfunc)->m_ml;
+#if CYTHON_BACKPORT_VECTORCALL
+    Py_ssize_t nargs = (Py_ssize_t)nargsf;
+#else
+    Py_ssize_t nargs = PyVectorcall_NARGS(nargsf);
+#endif
+    PyObject *self;
+    switch (__Pyx_CyFunction_Vectorcall_CheckArgs(cyfunc, nargs, kwnames)) {
+    case 1:
+        self = args[0];
+        args += 1;
+        nargs -= 1;
+        break;
+    case 0:
+        self = ((PyCFunctionObject*)cyfunc)->m_self;
+        break;
+    default:
+        return NULL;
+    }
+    if (unlikely(nargs != 1)) {
+        PyErr_Format(PyExc_TypeError,
+            "%.200s() takes exactly one argument (%" CYTHON_FORMAT_SSIZE_T "d given)",
+            def->ml_name, nargs);
+        return NULL;
+    }
+    return def->ml_meth(self, args[0]);
+}
+static PyObject * __Pyx_CyFunction_Vectorcall_FASTCALL_KEYWORDS(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames)
+{
+    __pyx_CyFunctionObject *cyfunc = (__pyx_CyFunctionObject *)func;
+    PyMethodDef* def = ((PyCFunctionObject*)cyfunc)->m_ml;
+#if CYTHON_BACKPORT_VECTORCALL
+    Py_ssize_t nargs = (Py_ssize_t)nargsf;
+#else
+    Py_ssize_t nargs = PyVectorcall_NARGS(nargsf);
+#endif
+    PyObject *self;
+    switch (__Pyx_CyFunction_Vectorcall_CheckArgs(cyfunc, nargs, NULL)) {
+    case 1:
+        self = args[0];
+        args += 1;
+        nargs -= 1;
+        break;
+    case 0:
+        self = ((PyCFunctionObject*)cyfunc)->m_self;
+        break;
+    default:
+        return NULL;
+    }
+    return ((__Pyx_PyCFunctionFastWithKeywords)(void(*)(void))def->ml_meth)(self, args, nargs, kwnames);
+}
+static PyObject * __Pyx_CyFunction_Vectorcall_FASTCALL_KEYWORDS_METHOD(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames)
+{
+    __pyx_CyFunctionObject *cyfunc = (__pyx_CyFunctionObject *)func;
+    PyMethodDef* def = ((PyCFunctionObject*)cyfunc)->m_ml;
+    PyTypeObject *cls = (PyTypeObject *) __Pyx_CyFunction_GetClassObj(cyfunc);
+#if CYTHON_BACKPORT_VECTORCALL
+    Py_ssize_t nargs = (Py_ssize_t)nargsf;
+#else
+    Py_ssize_t nargs = PyVectorcall_NARGS(nargsf);
+#endif
+    PyObject *self;
+    switch (__Pyx_CyFunction_Vectorcall_CheckArgs(cyfunc, nargs, NULL)) {
+    case 1:
+        self = args[0];
+        args += 1;
+        nargs -= 1;
+        break;
+    case 0:
+        self = ((PyCFunctionObject*)cyfunc)->m_self;
+        break;
+    default:
+        return NULL;
+    }
+    return ((__Pyx_PyCMethod)(void(*)(void))def->ml_meth)(self, cls, args, (size_t)nargs, kwnames);
+}
+#endif
+#if CYTHON_USE_TYPE_SPECS
+static PyType_Slot __pyx_CyFunctionType_slots[] = {
+    {Py_tp_dealloc, (void *)__Pyx_CyFunction_dealloc},
+    {Py_tp_repr, (void *)__Pyx_CyFunction_repr},
+    {Py_tp_call, (void *)__Pyx_CyFunction_CallAsMethod},
+    {Py_tp_traverse, (void *)__Pyx_CyFunction_traverse},
+    {Py_tp_clear, (void *)__Pyx_CyFunction_clear},
+    {Py_tp_methods, (void *)__pyx_CyFunction_methods},
+    {Py_tp_members, (void *)__pyx_CyFunction_members},
+    {Py_tp_getset, (void *)__pyx_CyFunction_getsets},
+    {Py_tp_descr_get, (void *)__Pyx_PyMethod_New},
+    {0, 0},
+};
+static PyType_Spec __pyx_CyFunctionType_spec = {
+    __PYX_TYPE_MODULE_PREFIX "cython_function_or_method",
+    sizeof(__pyx_CyFunctionObject),
+    0,
+#ifdef Py_TPFLAGS_METHOD_DESCRIPTOR
+    Py_TPFLAGS_METHOD_DESCRIPTOR |
+#endif
+#if (defined(_Py_TPFLAGS_HAVE_VECTORCALL) && CYTHON_METH_FASTCALL)
+    _Py_TPFLAGS_HAVE_VECTORCALL |
+#endif
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC | Py_TPFLAGS_BASETYPE,
+    __pyx_CyFunctionType_slots
+};
+#else
+static PyTypeObject __pyx_CyFunctionType_type = {
+    PyVarObject_HEAD_INIT(0, 0)
+    __PYX_TYPE_MODULE_PREFIX "cython_function_or_method",
+    sizeof(__pyx_CyFunctionObject),
+    0,
+    (destructor) __Pyx_CyFunction_dealloc,
+#if !CYTHON_METH_FASTCALL
+    0,
+#elif CYTHON_BACKPORT_VECTORCALL
+    (printfunc)offsetof(__pyx_CyFunctionObject, func_vectorcall),
+#else
+    offsetof(PyCFunctionObject, vectorcall),
+#endif
+    0,
+    0,
+#if PY_MAJOR_VERSION < 3
+    0,
+#else
+    0,
+#endif
+    (reprfunc) __Pyx_CyFunction_repr,
+    0,
+    0,
+    0,
+    0,
+    __Pyx_CyFunction_CallAsMethod,
+    0,
+    0,
+    0,
+    0,
+#ifdef Py_TPFLAGS_METHOD_DESCRIPTOR
+    Py_TPFLAGS_METHOD_DESCRIPTOR |
+#endif
+#if defined(_Py_TPFLAGS_HAVE_VECTORCALL) && CYTHON_METH_FASTCALL
+    _Py_TPFLAGS_HAVE_VECTORCALL |
+#endif
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC | Py_TPFLAGS_BASETYPE,
+    0,
+    (traverseproc) __Pyx_CyFunction_traverse,
+    (inquiry) __Pyx_CyFunction_clear,
+    0,
+#if PY_VERSION_HEX < 0x030500A0
+    offsetof(__pyx_CyFunctionObject, func_weakreflist),
+#else
+    offsetof(PyCFunctionObject, m_weakreflist),
+#endif
+    0,
+    0,
+    __pyx_CyFunction_methods,
+    __pyx_CyFunction_members,
+    __pyx_CyFunction_getsets,
+    0,
+    0,
+    __Pyx_PyMethod_New,
+    0,
+    offsetof(__pyx_CyFunctionObject, func_dict),
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+#if PY_VERSION_HEX >= 0x030400a1
+    0,
+#endif
+#if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+    0,
+#endif
+#if __PYX_NEED_TP_PRINT_SLOT
+    0,
+#endif
+#if PY_VERSION_HEX >= 0x030C0000
+    0,
+#endif
+#if PY_VERSION_HEX >= 0x030d00A4
+    0,
+#endif
+#if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+    0,
+#endif
+};
+#endif
+static int __pyx_CyFunction_init(PyObject *module) {
+#if CYTHON_USE_TYPE_SPECS
+    __pyx_CyFunctionType = __Pyx_FetchCommonTypeFromSpec(module, &__pyx_CyFunctionType_spec, NULL);
+#else
+    CYTHON_UNUSED_VAR(module);
+    __pyx_CyFunctionType = __Pyx_FetchCommonType(&__pyx_CyFunctionType_type);
+#endif
+    if (unlikely(__pyx_CyFunctionType == NULL)) {
+        return -1;
+    }
+    return 0;
+}
+static CYTHON_INLINE void *__Pyx_CyFunction_InitDefaults(PyObject *func, size_t size, int pyobjects) {
+    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
+    m->defaults = PyObject_Malloc(size);
+    if (unlikely(!m->defaults))
+        return PyErr_NoMemory();
+    memset(m->defaults, 0, size);
+    m->defaults_pyobjects = pyobjects;
+    m->defaults_size = size;
+    return m->defaults;
+}
+static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsTuple(PyObject *func, PyObject *tuple) {
+    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
+    m->defaults_tuple = tuple;
+    Py_INCREF(tuple);
+}
+static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsKwDict(PyObject *func, PyObject *dict) {
+    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
+    m->defaults_kwdict = dict;
+    Py_INCREF(dict);
+}
+static CYTHON_INLINE void __Pyx_CyFunction_SetAnnotationsDict(PyObject *func, PyObject *dict) {
+    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
+    m->func_annotations = dict;
+    Py_INCREF(dict);
+}
+
+/* CythonFunction */
+static PyObject *__Pyx_CyFunction_New(PyMethodDef *ml, int flags, PyObject* qualname,
+                                      PyObject *closure, PyObject *module, PyObject* globals, PyObject* code) {
+    PyObject *op = __Pyx_CyFunction_Init(
+        PyObject_GC_New(__pyx_CyFunctionObject, __pyx_CyFunctionType),
+        ml, flags, qualname, closure, module, globals, code
+    );
+    if (likely(op)) {
+        PyObject_GC_Track(op);
+    }
+    return op;
+}
+
+/* PyDictVersioning */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    return likely(dict) ? __PYX_GET_DICT_VERSION(dict) : 0;
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj) {
+    PyObject **dictptr = NULL;
+    Py_ssize_t offset = Py_TYPE(obj)->tp_dictoffset;
+    if (offset) {
+#if CYTHON_COMPILING_IN_CPYTHON
+        dictptr = (likely(offset > 0)) ? (PyObject **) ((char *)obj + offset) : _PyObject_GetDictPtr(obj);
+#else
+        dictptr = _PyObject_GetDictPtr(obj);
+#endif
+    }
+    return (dictptr && *dictptr) ? __PYX_GET_DICT_VERSION(*dictptr) : 0;
+}
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    if (unlikely(!dict) || unlikely(tp_dict_version != __PYX_GET_DICT_VERSION(dict)))
+        return 0;
+    return obj_dict_version == __Pyx_get_object_dict_version(obj);
+}
+#endif
+
+/* CLineInTraceback */
+#ifndef CYTHON_CLINE_IN_TRACEBACK
+static int __Pyx_CLineForTraceback(PyThreadState *tstate, int c_line) {
+    PyObject *use_cline;
+    PyObject *ptype, *pvalue, *ptraceback;
+#if CYTHON_COMPILING_IN_CPYTHON
+    PyObject **cython_runtime_dict;
+#endif
+    CYTHON_MAYBE_UNUSED_VAR(tstate);
+    if (unlikely(!__pyx_cython_runtime)) {
+        return c_line;
+    }
+    __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+#if CYTHON_COMPILING_IN_CPYTHON
+    cython_runtime_dict = _PyObject_GetDictPtr(__pyx_cython_runtime);
+    if (likely(cython_runtime_dict)) {
+        __PYX_PY_DICT_LOOKUP_IF_MODIFIED(
+            use_cline, *cython_runtime_dict,
+            __Pyx_PyDict_GetItemStr(*cython_runtime_dict, __pyx_n_s_cline_in_traceback))
+    } else
+#endif
+    {
+      PyObject *use_cline_obj = __Pyx_PyObject_GetAttrStrNoError(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback);
+      if (use_cline_obj) {
+        use_cline = PyObject_Not(use_cline_obj) ? Py_False : Py_True;
+        Py_DECREF(use_cline_obj);
+      } else {
+        PyErr_Clear();
+        use_cline = NULL;
+      }
+    }
+    if (!use_cline) {
+        c_line = 0;
+        (void) PyObject_SetAttr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback, Py_False);
+    }
+    else if (use_cline == Py_False || (use_cline != Py_True && PyObject_Not(use_cline) != 0)) {
+        c_line = 0;
+    }
+    __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+    return c_line;
+}
+#endif
+
+/* CodeObjectCache */
+#if !CYTHON_COMPILING_IN_LIMITED_API
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
+    int start = 0, mid = 0, end = count - 1;
+    if (end >= 0 && code_line > entries[end].code_line) {
+        return count;
+    }
+    while (start < end) {
+        mid = start + (end - start) / 2;
+        if (code_line < entries[mid].code_line) {
+            end = mid;
+        } else if (code_line > entries[mid].code_line) {
+             start = mid + 1;
+        } else {
+            return mid;
+        }
+    }
+    if (code_line <= entries[mid].code_line) {
+        return mid;
+    } else {
+        return mid + 1;
+    }
+}
+static PyCodeObject *__pyx_find_code_object(int code_line) {
+    PyCodeObject* code_object;
+    int pos;
+    if (unlikely(!code_line) || unlikely(!__pyx_code_cache.entries)) {
+        return NULL;
+    }
+    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
+    if (unlikely(pos >= __pyx_code_cache.count) || unlikely(__pyx_code_cache.entries[pos].code_line != code_line)) {
+        return NULL;
+    }
+    code_object = __pyx_code_cache.entries[pos].code_object;
+    Py_INCREF(code_object);
+    return code_object;
+}
+static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
+    int pos, i;
+    __Pyx_CodeObjectCacheEntry* entries = __pyx_code_cache.entries;
+    if (unlikely(!code_line)) {
+        return;
+    }
+    if (unlikely(!entries)) {
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Malloc(64*sizeof(__Pyx_CodeObjectCacheEntry));
+        if (likely(entries)) {
+            __pyx_code_cache.entries = entries;
+            __pyx_code_cache.max_count = 64;
+            __pyx_code_cache.count = 1;
+            entries[0].code_line = code_line;
+            entries[0].code_object = code_object;
+            Py_INCREF(code_object);
+        }
+        return;
+    }
+    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
+    if ((pos < __pyx_code_cache.count) && unlikely(__pyx_code_cache.entries[pos].code_line == code_line)) {
+        PyCodeObject* tmp = entries[pos].code_object;
+        entries[pos].code_object = code_object;
+        Py_DECREF(tmp);
+        return;
+    }
+    if (__pyx_code_cache.count == __pyx_code_cache.max_count) {
+        int new_max = __pyx_code_cache.max_count + 64;
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Realloc(
+            __pyx_code_cache.entries, ((size_t)new_max) * sizeof(__Pyx_CodeObjectCacheEntry));
+        if (unlikely(!entries)) {
+            return;
+        }
+        __pyx_code_cache.entries = entries;
+        __pyx_code_cache.max_count = new_max;
+    }
+    for (i=__pyx_code_cache.count; i>pos; i--) {
+        entries[i] = entries[i-1];
+    }
+    entries[pos].code_line = code_line;
+    entries[pos].code_object = code_object;
+    __pyx_code_cache.count++;
+    Py_INCREF(code_object);
+}
+#endif
+
+/* AddTraceback */
+#include "compile.h"
+#include "frameobject.h"
+#include "traceback.h"
+#if PY_VERSION_HEX >= 0x030b00a6 && !CYTHON_COMPILING_IN_LIMITED_API
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API
+static PyObject *__Pyx_PyCode_Replace_For_AddTraceback(PyObject *code, PyObject *scratch_dict,
+                                                       PyObject *firstlineno, PyObject *name) {
+    PyObject *replace = NULL;
+    if (unlikely(PyDict_SetItemString(scratch_dict, "co_firstlineno", firstlineno))) return NULL;
+    if (unlikely(PyDict_SetItemString(scratch_dict, "co_name", name))) return NULL;
+    replace = PyObject_GetAttrString(code, "replace");
+    if (likely(replace)) {
+        PyObject *result;
+        result = PyObject_Call(replace, __pyx_empty_tuple, scratch_dict);
+        Py_DECREF(replace);
+        return result;
+    }
+    PyErr_Clear();
+    #if __PYX_LIMITED_VERSION_HEX < 0x030780000
+    {
+        PyObject *compiled = NULL, *result = NULL;
+        if (unlikely(PyDict_SetItemString(scratch_dict, "code", code))) return NULL;
+        if (unlikely(PyDict_SetItemString(scratch_dict, "type", (PyObject*)(&PyType_Type)))) return NULL;
+        compiled = Py_CompileString(
+            "out = type(code)(\n"
+            "  code.co_argcount, code.co_kwonlyargcount, code.co_nlocals, code.co_stacksize,\n"
+            "  code.co_flags, code.co_code, code.co_consts, code.co_names,\n"
+            "  code.co_varnames, code.co_filename, co_name, co_firstlineno,\n"
+            "  code.co_lnotab)\n", "<dummy>", Py_file_input);
+        if (!compiled) return NULL;
+        result = PyEval_EvalCode(compiled, scratch_dict, scratch_dict);
+        Py_DECREF(compiled);
+        if (!result) PyErr_Print();
+        Py_DECREF(result);
+        result = PyDict_GetItemString(scratch_dict, "out");
+        if (result) Py_INCREF(result);
+        return result;
+    }
+    #else
+    return NULL;
+    #endif
+}
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename) {
+    PyObject *code_object = NULL, *py_py_line = NULL, *py_funcname = NULL, *dict = NULL;
+    PyObject *replace = NULL, *getframe = NULL, *frame = NULL;
+    PyObject *exc_type, *exc_value, *exc_traceback;
+    int success = 0;
+    if (c_line) {
+        (void) __pyx_cfilenm;
+        (void) __Pyx_CLineForTraceback(__Pyx_PyThreadState_Current, c_line);
+    }
+    PyErr_Fetch(&exc_type, &exc_value, &exc_traceback);
+    code_object = Py_CompileString("_getframe()", filename, Py_eval_input);
+    if (unlikely(!code_object)) goto bad;
+    py_py_line = PyLong_FromLong(py_line);
+    if (unlikely(!py_py_line)) goto bad;
+    py_funcname = PyUnicode_FromString(funcname);
+    if (unlikely(!py_funcname)) goto bad;
+    dict = PyDict_New();
+    if (unlikely(!dict)) goto bad;
+    {
+        PyObject *old_code_object = code_object;
+        code_object = __Pyx_PyCode_Replace_For_AddTraceback(code_object, dict, py_py_line, py_funcname);
+        Py_DECREF(old_code_object);
+    }
+    if (unlikely(!code_object)) goto bad;
+    getframe = PySys_GetObject("_getframe");
+    if (unlikely(!getframe)) goto bad;
+    if (unlikely(PyDict_SetItemString(dict, "_getframe", getframe))) goto bad;
+    frame = PyEval_EvalCode(code_object, dict, dict);
+    if (unlikely(!frame) || frame == Py_None) goto bad;
+    success = 1;
+  bad:
+    PyErr_Restore(exc_type, exc_value, exc_traceback);
+    Py_XDECREF(code_object);
+    Py_XDECREF(py_py_line);
+    Py_XDECREF(py_funcname);
+    Py_XDECREF(dict);
+    Py_XDECREF(replace);
+    if (success) {
+        PyTraceBack_Here(
+            (struct _frame*)frame);
+    }
+    Py_XDECREF(frame);
+}
+#else
+static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
+            const char *funcname, int c_line,
+            int py_line, const char *filename) {
+    PyCodeObject *py_code = NULL;
+    PyObject *py_funcname = NULL;
+    #if PY_MAJOR_VERSION < 3
+    PyObject *py_srcfile = NULL;
+    py_srcfile = PyString_FromString(filename);
+    if (!py_srcfile) goto bad;
+    #endif
+    if (c_line) {
+        #if PY_MAJOR_VERSION < 3
+        py_funcname = PyString_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        #else
+        py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        funcname = PyUnicode_AsUTF8(py_funcname);
+        if (!funcname) goto bad;
+        #endif
+    }
+    else {
+        #if PY_MAJOR_VERSION < 3
+        py_funcname = PyString_FromString(funcname);
+        if (!py_funcname) goto bad;
+        #endif
+    }
+    #if PY_MAJOR_VERSION < 3
+    py_code = __Pyx_PyCode_New(
+        0,
+        0,
+        0,
+        0,
+        0,
+        0,
+        __pyx_empty_bytes, /*PyObject *code,*/
+        __pyx_empty_tuple, /*PyObject *consts,*/
+        __pyx_empty_tuple, /*PyObject *names,*/
+        __pyx_empty_tuple, /*PyObject *varnames,*/
+        __pyx_empty_tuple, /*PyObject *freevars,*/
+        __pyx_empty_tuple, /*PyObject *cellvars,*/
+        py_srcfile,   /*PyObject *filename,*/
+        py_funcname,  /*PyObject *name,*/
+        py_line,
+        __pyx_empty_bytes  /*PyObject *lnotab*/
+    );
+    Py_DECREF(py_srcfile);
+    #else
+    py_code = PyCode_NewEmpty(filename, funcname, py_line);
+    #endif
+    Py_XDECREF(py_funcname);
+    return py_code;
+bad:
+    Py_XDECREF(py_funcname);
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(py_srcfile);
+    #endif
+    return NULL;
+}
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename) {
+    PyCodeObject *py_code = 0;
+    PyFrameObject *py_frame = 0;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject *ptype, *pvalue, *ptraceback;
+    if (c_line) {
+        c_line = __Pyx_CLineForTraceback(tstate, c_line);
+    }
+    py_code = __pyx_find_code_object(c_line ? -c_line : py_line);
+    if (!py_code) {
+        __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+        py_code = __Pyx_CreateCodeObjectForTraceback(
+            funcname, c_line, py_line, filename);
+        if (!py_code) {
+            /* If the code object creation fails, then we should clear the
+               fetched exception references and propagate the new exception */
+            Py_XDECREF(ptype);
+            Py_XDECREF(pvalue);
+            Py_XDECREF(ptraceback);
+            goto bad;
+        }
+        __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+        __pyx_insert_code_object(c_line ? -c_line : py_line, py_code);
+    }
+    py_frame = PyFrame_New(
+        tstate,            /*PyThreadState *tstate,*/
+        py_code,           /*PyCodeObject *code,*/
+        __pyx_d,    /*PyObject *globals,*/
+        0                  /*PyObject *locals*/
+    );
+    if (!py_frame) goto bad;
+    __Pyx_PyFrame_SetLineNumber(py_frame, py_line);
+    PyTraceBack_Here(py_frame);
+bad:
+    Py_XDECREF(py_code);
+    Py_XDECREF(py_frame);
+}
+#endif
+
+/* FormatTypeName */
+#if CYTHON_COMPILING_IN_LIMITED_API
+static __Pyx_TypeName
+__Pyx_PyType_GetName(PyTypeObject* tp)
+{
+    PyObject *name = __Pyx_PyObject_GetAttrStr((PyObject *)tp,
+                                               __pyx_n_s_name);
+    if (unlikely(name == NULL) || unlikely(!PyUnicode_Check(name))) {
+        PyErr_Clear();
+        Py_XDECREF(name);
+        name = __Pyx_NewRef(__pyx_n_s__26);
+    }
+    return name;
+}
+#endif
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(long) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(long) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(long) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        unsigned char *bytes = (unsigned char *)&value;
+#if !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d00A4
+        if (is_unsigned) {
+            return PyLong_FromUnsignedNativeBytes(bytes, sizeof(value), -1);
+        } else {
+            return PyLong_FromNativeBytes(bytes, sizeof(value), -1);
+        }
+#elif !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x030d0000
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        return _PyLong_FromByteArray(bytes, sizeof(long),
+                                     little, !is_unsigned);
+#else
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        PyObject *from_bytes, *result = NULL;
+        PyObject *py_bytes = NULL, *arg_tuple = NULL, *kwds = NULL, *order_str = NULL;
+        from_bytes = PyObject_GetAttrString((PyObject*)&PyLong_Type, "from_bytes");
+        if (!from_bytes) return NULL;
+        py_bytes = PyBytes_FromStringAndSize((char*)bytes, sizeof(long));
+        if (!py_bytes) goto limited_bad;
+        order_str = PyUnicode_FromString(little ? "little" : "big");
+        if (!order_str) goto limited_bad;
+        arg_tuple = PyTuple_Pack(2, py_bytes, order_str);
+        if (!arg_tuple) goto limited_bad;
+        if (!is_unsigned) {
+            kwds = PyDict_New();
+            if (!kwds) goto limited_bad;
+            if (PyDict_SetItemString(kwds, "signed", __Pyx_NewRef(Py_True))) goto limited_bad;
+        }
+        result = PyObject_Call(from_bytes, arg_tuple, kwds);
+        limited_bad:
+        Py_XDECREF(kwds);
+        Py_XDECREF(arg_tuple);
+        Py_XDECREF(order_str);
+        Py_XDECREF(py_bytes);
+        Py_XDECREF(from_bytes);
+        return result;
+#endif
+    }
+}
+
+/* CIntFromPyVerify */
+#define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
+#define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
+#define __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, exc)\
+    {\
+        func_type value = func_value;\
+        if (sizeof(target_type) < sizeof(func_type)) {\
+            if (unlikely(value != (func_type) (target_type) value)) {\
+                func_type zero = 0;\
+                if (exc && unlikely(value == (func_type)-1 && PyErr_Occurred()))\
+                    return (target_type) -1;\
+                if (is_unsigned && unlikely(value < zero))\
+                    goto raise_neg_overflow;\
+                else\
+                    goto raise_overflow;\
+            }\
+        }\
+        return (target_type) value;\
+    }
+
+/* CIntFromPy */
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if ((sizeof(long) < sizeof(long))) {
+            __PYX_VERIFY_RETURN_INT(long, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (long) val;
+        }
+    }
+#endif
+    if (unlikely(!PyLong_Check(x))) {
+        long val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (long) -1;
+        val = __Pyx_PyInt_As_long(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+    if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+        if (unlikely(__Pyx_PyLong_IsNeg(x))) {
+            goto raise_neg_overflow;
+        } else if (__Pyx_PyLong_IsCompact(x)) {
+            __PYX_VERIFY_RETURN_INT(long, __Pyx_compact_upylong, __Pyx_PyLong_CompactValueUnsigned(x))
+        } else {
+            const digit* digits = __Pyx_PyLong_Digits(x);
+            assert(__Pyx_PyLong_DigitCount(x) > 1);
+            switch (__Pyx_PyLong_DigitCount(x)) {
+                case 2:
+                    if ((8 * sizeof(long) > 1 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) >= 2 * PyLong_SHIFT)) {
+                            return (long) (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if ((8 * sizeof(long) > 2 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) >= 3 * PyLong_SHIFT)) {
+                            return (long) (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if ((8 * sizeof(long) > 3 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) >= 4 * PyLong_SHIFT)) {
+                            return (long) (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+            }
+        }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+        if (unlikely(Py_SIZE(x) < 0)) {
+            goto raise_neg_overflow;
+        }
+#else
+        {
+            int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+            if (unlikely(result < 0))
+                return (long) -1;
+            if (unlikely(result == 1))
+                goto raise_neg_overflow;
+        }
+#endif
+        if ((sizeof(long) <= sizeof(unsigned long))) {
+            __PYX_VERIFY_RETURN_INT_EXC(long, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+        } else if ((sizeof(long) <= sizeof(unsigned PY_LONG_LONG))) {
+            __PYX_VERIFY_RETURN_INT_EXC(long, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+        }
+    } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+        if (__Pyx_PyLong_IsCompact(x)) {
+            __PYX_VERIFY_RETURN_INT(long, __Pyx_compact_pylong, __Pyx_PyLong_CompactValue(x))
+        } else {
+            const digit* digits = __Pyx_PyLong_Digits(x);
+            assert(__Pyx_PyLong_DigitCount(x) > 1);
+            switch (__Pyx_PyLong_SignedDigitCount(x)) {
+                case -2:
+                    if ((8 * sizeof(long) - 1 > 1 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) - 1 > 2 * PyLong_SHIFT)) {
+                            return (long) (((long)-1)*(((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if ((8 * sizeof(long) > 1 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) - 1 > 2 * PyLong_SHIFT)) {
+                            return (long) ((((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if ((8 * sizeof(long) - 1 > 2 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) - 1 > 3 * PyLong_SHIFT)) {
+                            return (long) (((long)-1)*(((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if ((8 * sizeof(long) > 2 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) - 1 > 3 * PyLong_SHIFT)) {
+                            return (long) ((((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if ((8 * sizeof(long) - 1 > 3 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) - 1 > 4 * PyLong_SHIFT)) {
+                            return (long) (((long)-1)*(((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if ((8 * sizeof(long) > 3 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) - 1 > 4 * PyLong_SHIFT)) {
+                            return (long) ((((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+            }
+        }
+#endif
+        if ((sizeof(long) <= sizeof(long))) {
+            __PYX_VERIFY_RETURN_INT_EXC(long, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+        } else if ((sizeof(long) <= sizeof(PY_LONG_LONG))) {
+            __PYX_VERIFY_RETURN_INT_EXC(long, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+        }
+    }
+    {
+        long val;
+        int ret = -1;
+#if PY_VERSION_HEX >= 0x030d00A6 && !CYTHON_COMPILING_IN_LIMITED_API
+        Py_ssize_t bytes_copied = PyLong_AsNativeBytes(
+            x, &val, sizeof(val), Py_ASNATIVEBYTES_NATIVE_ENDIAN | (is_unsigned ? Py_ASNATIVEBYTES_UNSIGNED_BUFFER | Py_ASNATIVEBYTES_REJECT_NEGATIVE : 0));
+        if (unlikely(bytes_copied == -1)) {
+        } else if (unlikely(bytes_copied > (Py_ssize_t) sizeof(val))) {
+            goto raise_overflow;
+        } else {
+            ret = 0;
+        }
+#elif PY_VERSION_HEX < 0x030d0000 && !(CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_LIMITED_API) || defined(_PyLong_AsByteArray)
+        int one = 1; int is_little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&val;
+        ret = _PyLong_AsByteArray((PyLongObject *)x,
+                                    bytes, sizeof(val),
+                                    is_little, !is_unsigned);
+#else
+        PyObject *v;
+        PyObject *stepval = NULL, *mask = NULL, *shift = NULL;
+        int bits, remaining_bits, is_negative = 0;
+        int chunk_size = (sizeof(long) < 8) ? 30 : 62;
+        if (likely(PyLong_CheckExact(x))) {
+            v = __Pyx_NewRef(x);
+        } else {
+            v = PyNumber_Long(x);
+            if (unlikely(!v)) return (long) -1;
+            assert(PyLong_CheckExact(v));
+        }
+        {
+            int result = PyObject_RichCompareBool(v, Py_False, Py_LT);
+            if (unlikely(result < 0)) {
+                Py_DECREF(v);
+                return (long) -1;
+            }
+            is_negative = result == 1;
+        }
+        if (is_unsigned && unlikely(is_negative)) {
+            Py_DECREF(v);
+            goto raise_neg_overflow;
+        } else if (is_negative) {
+            stepval = PyNumber_Invert(v);
+            Py_DECREF(v);
+            if (unlikely(!stepval))
+                return (long) -1;
+        } else {
+            stepval = v;
+        }
+        v = NULL;
+        val = (long) 0;
+        mask = PyLong_FromLong((1L << chunk_size) - 1); if (unlikely(!mask)) goto done;
+        shift = PyLong_FromLong(chunk_size); if (unlikely(!shift)) goto done;
+        for (bits = 0; bits < (int) sizeof(long) * 8 - chunk_size; bits += chunk_size) {
+            PyObject *tmp, *digit;
+            long idigit;
+            digit = PyNumber_And(stepval, mask);
+            if (unlikely(!digit)) goto done;
+            idigit = PyLong_AsLong(digit);
+            Py_DECREF(digit);
+            if (unlikely(idigit < 0)) goto done;
+            val |= ((long) idigit) << bits;
+            tmp = PyNumber_Rshift(stepval, shift);
+            if (unlikely(!tmp)) goto done;
+            Py_DECREF(stepval); stepval = tmp;
+        }
+        Py_DECREF(shift); shift = NULL;
+        Py_DECREF(mask); mask = NULL;
+        {
+            long idigit = PyLong_AsLong(stepval);
+            if (unlikely(idigit < 0)) goto done;
+            remaining_bits = ((int) sizeof(long) * 8) - bits - (is_unsigned ? 0 : 1);
+            if (unlikely(idigit >= (1L << remaining_bits)))
+                goto raise_overflow;
+            val |= ((long) idigit) << bits;
+        }
+        if (!is_unsigned) {
+            if (unlikely(val & (((long) 1) << (sizeof(long) * 8 - 1))))
+                goto raise_overflow;
+            if (is_negative)
+                val = ~val;
+        }
+        ret = 0;
+    done:
+        Py_XDECREF(shift);
+        Py_XDECREF(mask);
+        Py_XDECREF(stepval);
+#endif
+        if (unlikely(ret))
+            return (long) -1;
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to long");
+    return (long) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to long");
+    return (long) -1;
+}
+
+/* CIntFromPy */
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if ((sizeof(int) < sizeof(long))) {
+            __PYX_VERIFY_RETURN_INT(int, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (int) val;
+        }
+    }
+#endif
+    if (unlikely(!PyLong_Check(x))) {
+        int val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (int) -1;
+        val = __Pyx_PyInt_As_int(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+    if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+        if (unlikely(__Pyx_PyLong_IsNeg(x))) {
+            goto raise_neg_overflow;
+        } else if (__Pyx_PyLong_IsCompact(x)) {
+            __PYX_VERIFY_RETURN_INT(int, __Pyx_compact_upylong, __Pyx_PyLong_CompactValueUnsigned(x))
+        } else {
+            const digit* digits = __Pyx_PyLong_Digits(x);
+            assert(__Pyx_PyLong_DigitCount(x) > 1);
+            switch (__Pyx_PyLong_DigitCount(x)) {
+                case 2:
+                    if ((8 * sizeof(int) > 1 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) >= 2 * PyLong_SHIFT)) {
+                            return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if ((8 * sizeof(int) > 2 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) >= 3 * PyLong_SHIFT)) {
+                            return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if ((8 * sizeof(int) > 3 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) >= 4 * PyLong_SHIFT)) {
+                            return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+            }
+        }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+        if (unlikely(Py_SIZE(x) < 0)) {
+            goto raise_neg_overflow;
+        }
+#else
+        {
+            int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+            if (unlikely(result < 0))
+                return (int) -1;
+            if (unlikely(result == 1))
+                goto raise_neg_overflow;
+        }
+#endif
+        if ((sizeof(int) <= sizeof(unsigned long))) {
+            __PYX_VERIFY_RETURN_INT_EXC(int, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+        } else if ((sizeof(int) <= sizeof(unsigned PY_LONG_LONG))) {
+            __PYX_VERIFY_RETURN_INT_EXC(int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+        }
+    } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+        if (__Pyx_PyLong_IsCompact(x)) {
+            __PYX_VERIFY_RETURN_INT(int, __Pyx_compact_pylong, __Pyx_PyLong_CompactValue(x))
+        } else {
+            const digit* digits = __Pyx_PyLong_Digits(x);
+            assert(__Pyx_PyLong_DigitCount(x) > 1);
+            switch (__Pyx_PyLong_SignedDigitCount(x)) {
+                case -2:
+                    if ((8 * sizeof(int) - 1 > 1 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) - 1 > 2 * PyLong_SHIFT)) {
+                            return (int) (((int)-1)*(((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if ((8 * sizeof(int) > 1 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) - 1 > 2 * PyLong_SHIFT)) {
+                            return (int) ((((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if ((8 * sizeof(int) - 1 > 2 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) - 1 > 3 * PyLong_SHIFT)) {
+                            return (int) (((int)-1)*(((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if ((8 * sizeof(int) > 2 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) - 1 > 3 * PyLong_SHIFT)) {
+                            return (int) ((((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if ((8 * sizeof(int) - 1 > 3 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) - 1 > 4 * PyLong_SHIFT)) {
+                            return (int) (((int)-1)*(((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if ((8 * sizeof(int) > 3 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) - 1 > 4 * PyLong_SHIFT)) {
+                            return (int) ((((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+            }
+        }
+#endif
+        if ((sizeof(int) <= sizeof(long))) {
+            __PYX_VERIFY_RETURN_INT_EXC(int, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+        } else if ((sizeof(int) <= sizeof(PY_LONG_LONG))) {
+            __PYX_VERIFY_RETURN_INT_EXC(int, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+        }
+    }
+    {
+        int val;
+        int ret = -1;
+#if PY_VERSION_HEX >= 0x030d00A6 && !CYTHON_COMPILING_IN_LIMITED_API
+        Py_ssize_t bytes_copied = PyLong_AsNativeBytes(
+            x, &val, sizeof(val), Py_ASNATIVEBYTES_NATIVE_ENDIAN | (is_unsigned ? Py_ASNATIVEBYTES_UNSIGNED_BUFFER | Py_ASNATIVEBYTES_REJECT_NEGATIVE : 0));
+        if (unlikely(bytes_copied == -1)) {
+        } else if (unlikely(bytes_copied > (Py_ssize_t) sizeof(val))) {
+            goto raise_overflow;
+        } else {
+            ret = 0;
+        }
+#elif PY_VERSION_HEX < 0x030d0000 && !(CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_LIMITED_API) || defined(_PyLong_AsByteArray)
+        int one = 1; int is_little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&val;
+        ret = _PyLong_AsByteArray((PyLongObject *)x,
+                                    bytes, sizeof(val),
+                                    is_little, !is_unsigned);
+#else
+        PyObject *v;
+        PyObject *stepval = NULL, *mask = NULL, *shift = NULL;
+        int bits, remaining_bits, is_negative = 0;
+        int chunk_size = (sizeof(long) < 8) ? 30 : 62;
+        if (likely(PyLong_CheckExact(x))) {
+            v = __Pyx_NewRef(x);
+        } else {
+            v = PyNumber_Long(x);
+            if (unlikely(!v)) return (int) -1;
+            assert(PyLong_CheckExact(v));
+        }
+        {
+            int result = PyObject_RichCompareBool(v, Py_False, Py_LT);
+            if (unlikely(result < 0)) {
+                Py_DECREF(v);
+                return (int) -1;
+            }
+            is_negative = result == 1;
+        }
+        if (is_unsigned && unlikely(is_negative)) {
+            Py_DECREF(v);
+            goto raise_neg_overflow;
+        } else if (is_negative) {
+            stepval = PyNumber_Invert(v);
+            Py_DECREF(v);
+            if (unlikely(!stepval))
+                return (int) -1;
+        } else {
+            stepval = v;
+        }
+        v = NULL;
+        val = (int) 0;
+        mask = PyLong_FromLong((1L << chunk_size) - 1); if (unlikely(!mask)) goto done;
+        shift = PyLong_FromLong(chunk_size); if (unlikely(!shift)) goto done;
+        for (bits = 0; bits < (int) sizeof(int) * 8 - chunk_size; bits += chunk_size) {
+            PyObject *tmp, *digit;
+            long idigit;
+            digit = PyNumber_And(stepval, mask);
+            if (unlikely(!digit)) goto done;
+            idigit = PyLong_AsLong(digit);
+            Py_DECREF(digit);
+            if (unlikely(idigit < 0)) goto done;
+            val |= ((int) idigit) << bits;
+            tmp = PyNumber_Rshift(stepval, shift);
+            if (unlikely(!tmp)) goto done;
+            Py_DECREF(stepval); stepval = tmp;
+        }
+        Py_DECREF(shift); shift = NULL;
+        Py_DECREF(mask); mask = NULL;
+        {
+            long idigit = PyLong_AsLong(stepval);
+            if (unlikely(idigit < 0)) goto done;
+            remaining_bits = ((int) sizeof(int) * 8) - bits - (is_unsigned ? 0 : 1);
+            if (unlikely(idigit >= (1L << remaining_bits)))
+                goto raise_overflow;
+            val |= ((int) idigit) << bits;
+        }
+        if (!is_unsigned) {
+            if (unlikely(val & (((int) 1) << (sizeof(int) * 8 - 1))))
+                goto raise_overflow;
+            if (is_negative)
+                val = ~val;
+        }
+        ret = 0;
+    done:
+        Py_XDECREF(shift);
+        Py_XDECREF(mask);
+        Py_XDECREF(stepval);
+#endif
+        if (unlikely(ret))
+            return (int) -1;
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to int");
+    return (int) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to int");
+    return (int) -1;
+}
+
+/* FastTypeChecks */
+#if CYTHON_COMPILING_IN_CPYTHON
+static int __Pyx_InBases(PyTypeObject *a, PyTypeObject *b) {
+    while (a) {
+        a = __Pyx_PyType_GetSlot(a, tp_base, PyTypeObject*);
+        if (a == b)
+            return 1;
+    }
+    return b == &PyBaseObject_Type;
+}
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b) {
+    PyObject *mro;
+    if (a == b) return 1;
+    mro = a->tp_mro;
+    if (likely(mro)) {
+        Py_ssize_t i, n;
+        n = PyTuple_GET_SIZE(mro);
+        for (i = 0; i < n; i++) {
+            if (PyTuple_GET_ITEM(mro, i) == (PyObject *)b)
+                return 1;
+        }
+        return 0;
+    }
+    return __Pyx_InBases(a, b);
+}
+static CYTHON_INLINE int __Pyx_IsAnySubtype2(PyTypeObject *cls, PyTypeObject *a, PyTypeObject *b) {
+    PyObject *mro;
+    if (cls == a || cls == b) return 1;
+    mro = cls->tp_mro;
+    if (likely(mro)) {
+        Py_ssize_t i, n;
+        n = PyTuple_GET_SIZE(mro);
+        for (i = 0; i < n; i++) {
+            PyObject *base = PyTuple_GET_ITEM(mro, i);
+            if (base == (PyObject *)a || base == (PyObject *)b)
+                return 1;
+        }
+        return 0;
+    }
+    return __Pyx_InBases(cls, a) || __Pyx_InBases(cls, b);
+}
+#if PY_MAJOR_VERSION == 2
+static int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject* exc_type2) {
+    PyObject *exception, *value, *tb;
+    int res;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&exception, &value, &tb);
+    res = exc_type1 ? PyObject_IsSubclass(err, exc_type1) : 0;
+    if (unlikely(res == -1)) {
+        PyErr_WriteUnraisable(err);
+        res = 0;
+    }
+    if (!res) {
+        res = PyObject_IsSubclass(err, exc_type2);
+        if (unlikely(res == -1)) {
+            PyErr_WriteUnraisable(err);
+            res = 0;
+        }
+    }
+    __Pyx_ErrRestore(exception, value, tb);
+    return res;
+}
+#else
+static CYTHON_INLINE int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject *exc_type2) {
+    if (exc_type1) {
+        return __Pyx_IsAnySubtype2((PyTypeObject*)err, (PyTypeObject*)exc_type1, (PyTypeObject*)exc_type2);
+    } else {
+        return __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type2);
+    }
+}
+#endif
+static int __Pyx_PyErr_GivenExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    assert(PyExceptionClass_Check(exc_type));
+    n = PyTuple_GET_SIZE(tuple);
+#if PY_MAJOR_VERSION >= 3
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+#endif
+    for (i=0; i<n; i++) {
+        PyObject *t = PyTuple_GET_ITEM(tuple, i);
+        #if PY_MAJOR_VERSION < 3
+        if (likely(exc_type == t)) return 1;
+        #endif
+        if (likely(PyExceptionClass_Check(t))) {
+            if (__Pyx_inner_PyErr_GivenExceptionMatches2(exc_type, NULL, t)) return 1;
+        } else {
+        }
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject* exc_type) {
+    if (likely(err == exc_type)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        if (likely(PyExceptionClass_Check(exc_type))) {
+            return __Pyx_inner_PyErr_GivenExceptionMatches2(err, NULL, exc_type);
+        } else if (likely(PyTuple_Check(exc_type))) {
+            return __Pyx_PyErr_GivenExceptionMatchesTuple(err, exc_type);
+        } else {
+        }
+    }
+    return PyErr_GivenExceptionMatches(err, exc_type);
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *exc_type1, PyObject *exc_type2) {
+    assert(PyExceptionClass_Check(exc_type1));
+    assert(PyExceptionClass_Check(exc_type2));
+    if (likely(err == exc_type1 || err == exc_type2)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        return __Pyx_inner_PyErr_GivenExceptionMatches2(err, exc_type1, exc_type2);
+    }
+    return (PyErr_GivenExceptionMatches(err, exc_type1) || PyErr_GivenExceptionMatches(err, exc_type2));
+}
+#endif
+
+/* CheckBinaryVersion */
+static unsigned long __Pyx_get_runtime_version(void) {
+#if __PYX_LIMITED_VERSION_HEX >= 0x030B00A4
+    return Py_Version & ~0xFFUL;
+#else
+    const char* rt_version = Py_GetVersion();
+    unsigned long version = 0;
+    unsigned long factor = 0x01000000UL;
+    unsigned int digit = 0;
+    int i = 0;
+    while (factor) {
+        while ('0' <= rt_version[i] && rt_version[i] <= '9') {
+            digit = digit * 10 + (unsigned int) (rt_version[i] - '0');
+            ++i;
+        }
+        version += factor * digit;
+        if (rt_version[i] != '.')
+            break;
+        digit = 0;
+        factor >>= 8;
+        ++i;
+    }
+    return version;
+#endif
+}
+static int __Pyx_check_binary_version(unsigned long ct_version, unsigned long rt_version, int allow_newer) {
+    const unsigned long MAJOR_MINOR = 0xFFFF0000UL;
+    if ((rt_version & MAJOR_MINOR) == (ct_version & MAJOR_MINOR))
+        return 0;
+    if (likely(allow_newer && (rt_version & MAJOR_MINOR) > (ct_version & MAJOR_MINOR)))
+        return 1;
+    {
+        char message[200];
+        PyOS_snprintf(message, sizeof(message),
+                      "compile time Python version %d.%d "
+                      "of module '%.100s' "
+                      "%s "
+                      "runtime version %d.%d",
+                       (int) (ct_version >> 24), (int) ((ct_version >> 16) & 0xFF),
+                       __Pyx_MODULE_NAME,
+                       (allow_newer) ? "was newer than" : "does not match",
+                       (int) (rt_version >> 24), (int) ((rt_version >> 16) & 0xFF)
+       );
+        return PyErr_WarnEx(NULL, message, 1);
+    }
+}
+
+/* InitStrings */
+#if PY_MAJOR_VERSION >= 3
+static int __Pyx_InitString(__Pyx_StringTabEntry t, PyObject **str) {
+    if (t.is_unicode | t.is_str) {
+        if (t.intern) {
+            *str = PyUnicode_InternFromString(t.s);
+        } else if (t.encoding) {
+            *str = PyUnicode_Decode(t.s, t.n - 1, t.encoding, NULL);
+        } else {
+            *str = PyUnicode_FromStringAndSize(t.s, t.n - 1);
+        }
+    } else {
+        *str = PyBytes_FromStringAndSize(t.s, t.n - 1);
+    }
+    if (!*str)
+        return -1;
+    if (PyObject_Hash(*str) == -1)
+        return -1;
+    return 0;
+}
+#endif
+static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
+    while (t->p) {
+        #if PY_MAJOR_VERSION >= 3
+        __Pyx_InitString(*t, t->p);
+        #else
+        if (t->is_unicode) {
+            *t->p = PyUnicode_DecodeUTF8(t->s, t->n - 1, NULL);
+        } else if (t->intern) {
+            *t->p = PyString_InternFromString(t->s);
+        } else {
+            *t->p = PyString_FromStringAndSize(t->s, t->n - 1);
+        }
+        if (!*t->p)
+            return -1;
+        if (PyObject_Hash(*t->p) == -1)
+            return -1;
+        #endif
+        ++t;
+    }
+    return 0;
+}
+
+#include <string.h>
+static CYTHON_INLINE Py_ssize_t __Pyx_ssize_strlen(const char *s) {
+    size_t len = strlen(s);
+    if (unlikely(len > (size_t) PY_SSIZE_T_MAX)) {
+        PyErr_SetString(PyExc_OverflowError, "byte string is too long");
+        return -1;
+    }
+    return (Py_ssize_t) len;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char* c_str) {
+    Py_ssize_t len = __Pyx_ssize_strlen(c_str);
+    if (unlikely(len < 0)) return NULL;
+    return __Pyx_PyUnicode_FromStringAndSize(c_str, len);
+}
+static CYTHON_INLINE PyObject* __Pyx_PyByteArray_FromString(const char* c_str) {
+    Py_ssize_t len = __Pyx_ssize_strlen(c_str);
+    if (unlikely(len < 0)) return NULL;
+    return PyByteArray_FromStringAndSize(c_str, len);
+}
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject* o) {
+    Py_ssize_t ignore;
+    return __Pyx_PyObject_AsStringAndSize(o, &ignore);
+}
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+#if !CYTHON_PEP393_ENABLED
+static const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    char* defenc_c;
+    PyObject* defenc = _PyUnicode_AsDefaultEncodedString(o, NULL);
+    if (!defenc) return NULL;
+    defenc_c = PyBytes_AS_STRING(defenc);
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+    {
+        char* end = defenc_c + PyBytes_GET_SIZE(defenc);
+        char* c;
+        for (c = defenc_c; c < end; c++) {
+            if ((unsigned char) (*c) >= 128) {
+                PyUnicode_AsASCIIString(o);
+                return NULL;
+            }
+        }
+    }
+#endif
+    *length = PyBytes_GET_SIZE(defenc);
+    return defenc_c;
+}
+#else
+static CYTHON_INLINE const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    if (unlikely(__Pyx_PyUnicode_READY(o) == -1)) return NULL;
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+    if (likely(PyUnicode_IS_ASCII(o))) {
+        *length = PyUnicode_GET_LENGTH(o);
+        return PyUnicode_AsUTF8(o);
+    } else {
+        PyUnicode_AsASCIIString(o);
+        return NULL;
+    }
+#else
+    return PyUnicode_AsUTF8AndSize(o, length);
+#endif
+}
+#endif
+#endif
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+    if (
+#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+            __Pyx_sys_getdefaultencoding_not_ascii &&
+#endif
+            PyUnicode_Check(o)) {
+        return __Pyx_PyUnicode_AsStringAndSize(o, length);
+    } else
+#endif
+#if (!CYTHON_COMPILING_IN_PYPY && !CYTHON_COMPILING_IN_LIMITED_API) || (defined(PyByteArray_AS_STRING) && defined(PyByteArray_GET_SIZE))
+    if (PyByteArray_Check(o)) {
+        *length = PyByteArray_GET_SIZE(o);
+        return PyByteArray_AS_STRING(o);
+    } else
+#endif
+    {
+        char* result;
+        int r = PyBytes_AsStringAndSize(o, &result, length);
+        if (unlikely(r < 0)) {
+            return NULL;
+        } else {
+            return result;
+        }
+    }
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject* x) {
+   int is_true = x == Py_True;
+   if (is_true | (x == Py_False) | (x == Py_None)) return is_true;
+   else return PyObject_IsTrue(x);
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject* x) {
+    int retval;
+    if (unlikely(!x)) return -1;
+    retval = __Pyx_PyObject_IsTrue(x);
+    Py_DECREF(x);
+    return retval;
+}
+static PyObject* __Pyx_PyNumber_IntOrLongWrongResultType(PyObject* result, const char* type_name) {
+    __Pyx_TypeName result_type_name = __Pyx_PyType_GetName(Py_TYPE(result));
+#if PY_MAJOR_VERSION >= 3
+    if (PyLong_Check(result)) {
+        if (PyErr_WarnFormat(PyExc_DeprecationWarning, 1,
+                "__int__ returned non-int (type " __Pyx_FMT_TYPENAME ").  "
+                "The ability to return an instance of a strict subclass of int is deprecated, "
+                "and may be removed in a future version of Python.",
+                result_type_name)) {
+            __Pyx_DECREF_TypeName(result_type_name);
+            Py_DECREF(result);
+            return NULL;
+        }
+        __Pyx_DECREF_TypeName(result_type_name);
+        return result;
+    }
+#endif
+    PyErr_Format(PyExc_TypeError,
+                 "__%.4s__ returned non-%.4s (type " __Pyx_FMT_TYPENAME ")",
+                 type_name, type_name, result_type_name);
+    __Pyx_DECREF_TypeName(result_type_name);
+    Py_DECREF(result);
+    return NULL;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x) {
+#if CYTHON_USE_TYPE_SLOTS
+  PyNumberMethods *m;
+#endif
+  const char *name = NULL;
+  PyObject *res = NULL;
+#if PY_MAJOR_VERSION < 3
+  if (likely(PyInt_Check(x) || PyLong_Check(x)))
+#else
+  if (likely(PyLong_Check(x)))
+#endif
+    return __Pyx_NewRef(x);
+#if CYTHON_USE_TYPE_SLOTS
+  m = Py_TYPE(x)->tp_as_number;
+  #if PY_MAJOR_VERSION < 3
+  if (m && m->nb_int) {
+    name = "int";
+    res = m->nb_int(x);
+  }
+  else if (m && m->nb_long) {
+    name = "long";
+    res = m->nb_long(x);
+  }
+  #else
+  if (likely(m && m->nb_int)) {
+    name = "int";
+    res = m->nb_int(x);
+  }
+  #endif
+#else
+  if (!PyBytes_CheckExact(x) && !PyUnicode_CheckExact(x)) {
+    res = PyNumber_Int(x);
+  }
+#endif
+  if (likely(res)) {
+#if PY_MAJOR_VERSION < 3
+    if (unlikely(!PyInt_Check(res) && !PyLong_Check(res))) {
+#else
+    if (unlikely(!PyLong_CheckExact(res))) {
+#endif
+        return __Pyx_PyNumber_IntOrLongWrongResultType(res, name);
+    }
+  }
+  else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_TypeError,
+                    "an integer is required");
+  }
+  return res;
+}
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
+  Py_ssize_t ival;
+  PyObject *x;
+#if PY_MAJOR_VERSION < 3
+  if (likely(PyInt_CheckExact(b))) {
+    if (sizeof(Py_ssize_t) >= sizeof(long))
+        return PyInt_AS_LONG(b);
+    else
+        return PyInt_AsSsize_t(b);
+  }
+#endif
+  if (likely(PyLong_CheckExact(b))) {
+    #if CYTHON_USE_PYLONG_INTERNALS
+    if (likely(__Pyx_PyLong_IsCompact(b))) {
+        return __Pyx_PyLong_CompactValue(b);
+    } else {
+      const digit* digits = __Pyx_PyLong_Digits(b);
+      const Py_ssize_t size = __Pyx_PyLong_SignedDigitCount(b);
+      switch (size) {
+         case 2:
+           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -2:
+           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case 3:
+           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -3:
+           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case 4:
+           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -4:
+           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+      }
+    }
+    #endif
+    return PyLong_AsSsize_t(b);
+  }
+  x = PyNumber_Index(b);
+  if (!x) return -1;
+  ival = PyInt_AsSsize_t(x);
+  Py_DECREF(x);
+  return ival;
+}
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject* o) {
+  if (sizeof(Py_hash_t) == sizeof(Py_ssize_t)) {
+    return (Py_hash_t) __Pyx_PyIndex_AsSsize_t(o);
+#if PY_MAJOR_VERSION < 3
+  } else if (likely(PyInt_CheckExact(o))) {
+    return PyInt_AS_LONG(o);
+#endif
+  } else {
+    Py_ssize_t ival;
+    PyObject *x;
+    x = PyNumber_Index(o);
+    if (!x) return -1;
+    ival = PyInt_AsLong(x);
+    Py_DECREF(x);
+    return ival;
+  }
+}
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b) {
+  return b ? __Pyx_NewRef(Py_True) : __Pyx_NewRef(Py_False);
+}
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t ival) {
+    return PyInt_FromSize_t(ival);
+}
+
+
+/* #### Code section: utility_code_pragmas_end ### */
+#ifdef _MSC_VER
+#pragma warning( pop )
+#endif
+
+
+
+/* #### Code section: end ### */
+#endif /* Py_PYTHON_H */
@@ -0,0 +1,69 @@
+from .mvector2 import MVector2
+from .vector2 import Vector2
+from .vector2_int import Vector2Int
+
+# Versions of the Vector2 math that give bit-identical results on every platform, for lockstep simulations and replays.
+# The results of hypot, acos and friends from the C standard library differ by an ulp or two between platforms,
+# these use portable implementations instead. Still compiled C, around as fast as the regular versions.
+#
+# Everything else in Vector2, Vector2Array and functions only uses +, -, *, / and comparisons,
+# which are deterministic because those extensions are compiled without floating point contraction (FMA).
+#
+# NOTE: Assumes IEEE 754 doubles with SSE2 or equivalent math, 32-bit x86 builds using the x87 FPU are not deterministic.
+
+def hypot(__x: float, __y: float) -> float:
+    """Portable `math.hypot` for two values. Within 1 ulp of the exact result."""
+    ...
+
+def acos(__x: float) -> float:
+    """Portable `math.acos`. Raises ``ValueError`` if x is outside of the range [-1, 1]."""
+    ...
+
+def atan2(__y: float, __x: float) -> float:
+    """Portable `math.atan2`."""
+    ...
+
+def round(__x: float) -> int:
+    """
+    Round a number to an integer.
+    When a number is halfway between two others, it's rounded toward the nearest number that's away from zero.
+
+    Unlike `nalpy.math.round`, raises ``ValueError`` for NaN and ``OverflowError`` for infinity instead of returning a platform dependent value.
+    """
+    ...
+
+def magnitude(v: Vector2) -> float:
+    """Deterministic `Vector2.magnitude`."""
+    ...
+
+def normalized(v: Vector2) -> Vector2:
+    """Deterministic `Vector2.normalized`."""
+    ...
+
+def distance(a: Vector2, b: Vector2) -> float:
+    """Deterministic `Vector2.distance`."""
+    ...
+
+def angle(_from: Vector2, _to: Vector2) -> float:
+    """Deterministic `Vector2.angle`."""
+    ...
+
+def signed_angle(_from: Vector2, _to: Vector2) -> float:
+    """Deterministic `Vector2.signed_angle`."""
+    ...
+
+def move_towards(current: Vector2, target: Vector2, max_distance_delta: float) -> Vector2:
+    """Deterministic `Vector2.move_towards`."""
+    ...
+
+def smooth_damp(current: Vector2, target: Vector2, current_velocity: MVector2, smooth_time: float, delta_time: float, max_speed: float = float("inf")) -> Vector2:
+    """Deterministic `Vector2.smooth_damp`."""
+    ...
+
+def round_vector(v: Vector2) -> Vector2Int:
+    """
+    Deterministic `Vector2Int.round`.
+
+    Raises ``ValueError`` for NaN components and ``OverflowError`` for components that don't fit into a 64-bit integer.
+    """
+    ...
@@ -0,0 +1,97 @@
+#cython: language_level=3
+
+cimport cython
+from cpython.long cimport PyLong_FromDouble
+from libc.math cimport fabs, isnan, INFINITY
+
+from ._deterministic cimport det_hypot, det_acos, det_atan2, det_round
+from .mvector2 cimport MVector2
+from .vector2 cimport Vector2, new_vector2, move_towards2_dist, smooth_damp2_dist
+from .vector2_int cimport Vector2Int, new_vector2_int
+
+# Vector2 math that gives bit-identical results on every platform.
+# Everything that only uses +, -, * and / is already deterministic when compiled without contraction,
+# these replace the parts that call into libm with the portable versions from _deterministic.pxd.
+
+cdef Vector2 _zero = new_vector2(0.0, 0.0)
+
+# 2 ** 63, every double in [-2 ** 63, 2 ** 63) fits into a long long
+cdef double _LIMIT = 9223372036854775808.0
+
+cdef long long _to_int(double value) except? -1:
+    if isnan(value):
+        raise ValueError("Cannot convert float NaN to integer.")
+    if not (value >= -_LIMIT and value < _LIMIT):
+        raise OverflowError("Result does not fit into a 64-bit integer.")
+    return <long long>value
+
+@cython.cdivision(True)
+cdef inline double _angle2(double from_x, double from_y, double to_x, double to_y) noexcept nogil:
+    # angle2 from vector2.pxd with the portable hypot and acos
+    cdef double denom = det_hypot(from_x, from_y) * det_hypot(to_x, to_y)
+    if denom == 0.0:
+        return 0.0
+
+    cdef double cos_val = ((from_x * to_x) + (from_y * to_y)) / denom
+    if cos_val < -1.0:
+        cos_val = -1.0
+    elif cos_val > 1.0:
+        cos_val = 1.0
+
+    return det_acos(cos_val) * (180.0 / 3.14159265358979323846)
+
+def hypot(double x, double y, /):
+    return det_hypot(x, y)
+
+def acos(double x, /):
+    if fabs(x) > 1.0: # Same error as math.acos, nan is passed through
+        raise ValueError("math domain error")
+    return det_acos(x)
+
+def atan2(double y, double x, /):
+    return det_atan2(y, x)
+
+def round(double x, /):
+    return PyLong_FromDouble(det_round(x)) # Raises for nan and inf like the built-in round
+
+def magnitude(Vector2 v):
+    return det_hypot(v.x, v.y)
+
+@cython.cdivision(True)
+def normalized(Vector2 v):
+    cdef double magnitude = det_hypot(v.x, v.y)
+    if magnitude == 0.0:
+        return _zero
+    return new_vector2(v.x / magnitude, v.y / magnitude)
+
+def distance(Vector2 a, Vector2 b):
+    return det_hypot(a.x - b.x, a.y - b.y)
+
+def angle(Vector2 _from, Vector2 _to):
+    return _angle2(_from.x, _from.y, _to.x, _to.y)
+
+def signed_angle(Vector2 _from, Vector2 _to):
+    cdef double unsigned_angle = _angle2(_from.x, _from.y, _to.x, _to.y)
+    if ((_from.x * _to.y) - (_from.y * _to.x)) < 0.0:
+        return -unsigned_angle
+    return unsigned_angle
+
+def move_towards(Vector2 current, Vector2 target, double max_distance_delta):
+    cdef double[2] out
+    cdef double dist = det_hypot(target.x - current.x, target.y - current.y)
+    if move_towards2_dist(current.x, current.y, target.x, target.y, dist, max_distance_delta, out):
+        return target
+    return new_vector2(out[0], out[1])
+
+def smooth_damp(Vector2 current, Vector2 target, MVector2 current_velocity, double smooth_time, double delta_time, double max_speed = <double>INFINITY):
+    cdef double[2] velocity = [current_velocity.x, current_velocity.y]
+    cdef double[2] output
+    cdef double dist = det_hypot(current.x - target.x, current.y - target.y)
+    smooth_damp2_dist(current.x, current.y, target.x, target.y, dist, velocity, smooth_time, delta_time, max_speed, output)
+
+    current_velocity.x = velocity[0]
+    current_velocity.y = velocity[1]
+    return new_vector2(output[0], output[1])
+
+def round_vector(Vector2 v):
+    return new_vector2_int(_to_int(det_round(v.x)), _to_int(det_round(v.y)))
@@ -1,4 +1,102 @@
 #cython: language_level=3
 
-cdef inline char doublesign(double x) noexcept: # Extracted into a separate function because cpdef doesn't support position only arguments.
+cimport cython
+from libc.math cimport fmod, floor, copysign, fabs
+
+cdef inline char doublesign(double x) noexcept nogil: # Extracted into a separate function because cpdef doesn't support position only arguments.
     return (<unsigned char>(x > 0.0)) - (<unsigned char>(x < 0.0))
+
+# Python float semantics for // and % without the ZeroDivisionError check so that they can be used in nogil loops.
+# Division by zero results in nan instead. Adapted from float_divmod https://github.com/python/cpython/blob/3.11/Objects/floatobject.c#L643
+@cython.cdivision(True)
+cdef inline double pymod(double a, double b) noexcept nogil:
+    cdef double mod = fmod(a, b)
+    if mod != 0.0:
+        if (b < 0.0) != (mod < 0.0):
+            mod += b
+    else:
+        mod = copysign(0.0, b)
+    return mod
+
+@cython.cdivision(True)
+cdef inline double pyfloordiv(double a, double b) noexcept nogil:
+    cdef double mod = fmod(a, b)
+    cdef double div = (a - mod) / b
+    if mod != 0.0 and ((b < 0.0) != (mod < 0.0)):
+        div -= 1.0
+
+    cdef double floordiv
+    if div != 0.0:
+        floordiv = floor(div)
+        if div - floordiv > 0.5:
+            floordiv += 1.0
+    else:
+        floordiv = copysign(0.0, a / b)
+    return floordiv
+
+# C versions of the functions in functions.pyx for use from other extensions, callable without the GIL.
+# Prefixed with c so that they don't clash with the Python functions of the same name.
+cdef inline double cclamp(double value, double _min, double _max) noexcept nogil:
+    if value < _min:
+        return _min
+    if value > _max:
+        return _max
+    return value
+
+cdef inline double cclamp01(double value) noexcept nogil:
+    if value < 0.0:
+        return 0.0
+    if value > 1.0:
+        return 1.0
+    return value
+
+# remap and remap01 divide by zero when from1 == to1, which results in inf or nan instead of a ZeroDivisionError.
+@cython.cdivision(True)
+cdef inline double cremap(double value, double from1, double to1, double from2, double to2) noexcept nogil:
+    return (value - from1) / (to1 - from1) * (to2 - from2) + from2
+
+@cython.cdivision(True)
+cdef inline double cremap01(double value, double from1, double to1) noexcept nogil:
+    return (value - from1) / (to1 - from1)
+
+cdef inline double cdelta_angle(double current, double target) noexcept nogil:
+    cdef double delta = pymod(target - current, 360.0)
+    if delta > 180.0:
+        delta -= 360.0
+    return delta
+
+cdef inline double clerp(double a, double b, double t) noexcept nogil:
+    return a + (b - a) * cclamp01(t)
+
+cdef inline double clerp_unclamped(double a, double b, double t) noexcept nogil:
+    return a + (b - a) * t
+
+cdef inline double clerp_angle(double a, double b, double t) noexcept nogil:
+    return a + cdelta_angle(a, b) * cclamp01(t)
+
+@cython.cdivision(True)
+cdef inline double cinverse_lerp(double a, double b, double value) noexcept nogil:
+    if a != b:
+        return cclamp01((value - a) / (b - a))
+    return 0.0
+
+cdef inline double csmooth_step(double a, double b, double t) noexcept nogil:
+    t = cclamp01(t)
+    t = -2.0 * t * t * t + 3.0 * t * t
+    return b * t + a * (1 - t)
+
+cdef inline double cmove_towards(double current, double target, double max_delta) noexcept nogil:
+    if fabs(target - current) <= max_delta:
+        return target
+    return current + doublesign(target - current) * max_delta
+
+cdef inline double cmove_towards_angle(double current, double target, double max_delta) noexcept nogil:
+    cdef double delta = cdelta_angle(current, target)
+    if -max_delta < delta and delta < max_delta:
+        return target
+    return cmove_towards(current, current + delta, max_delta)
+
+# Length of zero results in nan instead of a ZeroDivisionError.
+cdef inline double cping_pong(double t, double length) noexcept nogil:
+    t = pymod(t, length * 2.0)
+    return length - fabs(t - length)
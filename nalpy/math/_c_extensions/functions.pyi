@@ -1,4 +1,5 @@
-from typing import Iterable, overload
+from typing import Iterable, TypeAlias, TypeVar, overload
+from typing_extensions import Buffer
 
 
 def round(__x: float) -> int:
@@ -108,9 +109,249 @@ def ping_pong(t: float, length: float) -> float:
     """
     ...
 
+#region Rounding
+@overload
+def round_to_nearest_n(__x: float, n: int) -> int:
+    """
+    Round a number to the nearest multiple of ``n``.
+    When a number is halfway between two multiples of n, it's rounded toward the nearest number that's away from zero.
+    """
+    ...
+@overload
+def round_to_nearest_n(__x: float, n: float) -> float:
+    """
+    Round a number to the nearest multiple of ``n``.
+    When a number is halfway between two multiples of n, it's rounded toward the nearest number that's away from zero.
+    """
+    ...
+
+@overload
+def floor_to_nearest_n(__x: float, n: int) -> int:
+    """Floor a number to the nearest multiple of ``n``."""
+    ...
+@overload
+def floor_to_nearest_n(__x: float, n: float) -> float:
+    """Floor a number to the nearest multiple of ``n``."""
+    ...
+
+@overload
+def ceil_to_nearest_n(__x: float, n: int) -> int:
+    """Ceil a number to the nearest multiple of ``n``."""
+    ...
+@overload
+def ceil_to_nearest_n(__x: float, n: float) -> float:
+    """Ceil a number to the nearest multiple of ``n``."""
+    ...
+
+def round_to_digits(__x: float, digits: int = 0) -> float:
+    """
+    Round a number to a given precision in decimal digits.
+    When a number is halfway between two others, it's rounded toward the nearest number that's away from zero.
+
+    ``digits`` may be negative.
+    """
+    ...
+
+def floor_to_digits(__x: float, digits: int = 0) -> float:
+    """Return the floor of x as a float with specified decimal accuracy."""
+    ...
+
+def ceil_to_digits(__x: float, digits: int = 0) -> float:
+    """Return the ceiling of x as a float with specified decimal accuracy."""
+    ...
+
+def round_to_nearest_n_to_digits(__x: float, n: float, digits: int = 0) -> float:
+    """Round a number to the nearest multiple of ``n`` with specified decimal accuracy."""
+    ...
+
+def floor_to_nearest_n_to_digits(__x: float, n: float, digits: int = 0) -> float:
+    """Floor a number to the nearest multiple of ``n`` with specified decimal accuracy."""
+    ...
+
+def ceil_to_nearest_n_to_digits(__x: float, n: float, digits: int = 0) -> float:
+    """Ceil a number to the nearest multiple of ``n`` with specified decimal accuracy."""
+    ...
+#endregion
+
 def kahan_sum(float_values: Iterable[float]) -> float:
     """
     Implements the Kahan summation algorithm.
 
     This algorithm greatly reduces the numerical error of the returned floating point values compared to basic summation.
     """
+    ...
+
+
+#region Buffers
+_DoubleOperand: TypeAlias = float | Buffer
+"""A single float that is broadcast or a one-dimensional contiguous buffer of doubles (``array.array("d")``, ``memoryview``, NumPy array, ...)."""
+_OutT = TypeVar("_OutT", bound=Buffer)
+
+# The following functions are batched variants of the functions above.
+# They release the GIL and write their results into ``out`` if given (which can be one of the arguments to operate in place), otherwise a new ``array.array("d")`` is returned.
+# NOTE: Division by zero results in ``inf`` or ``nan`` instead of raising ``ZeroDivisionError``.
+
+@overload
+def remap_many(value: _DoubleOperand, from1: _DoubleOperand, to1: _DoubleOperand, from2: _DoubleOperand, to2: _DoubleOperand, out: None = None) -> Buffer: ...
+@overload
+def remap_many(value: _DoubleOperand, from1: _DoubleOperand, to1: _DoubleOperand, from2: _DoubleOperand, to2: _DoubleOperand, out: _OutT) -> _OutT:
+    """Batched ``remap``."""
+    ...
+
+@overload
+def remap01_many(value: _DoubleOperand, from1: _DoubleOperand, to1: _DoubleOperand, out: None = None) -> Buffer: ...
+@overload
+def remap01_many(value: _DoubleOperand, from1: _DoubleOperand, to1: _DoubleOperand, out: _OutT) -> _OutT:
+    """Batched ``remap01``."""
+    ...
+
+@overload
+def clamp_many(value: _DoubleOperand, _min: _DoubleOperand, _max: _DoubleOperand, out: None = None) -> Buffer: ...
+@overload
+def clamp_many(value: _DoubleOperand, _min: _DoubleOperand, _max: _DoubleOperand, out: _OutT) -> _OutT:
+    """Batched ``clamp``. Only supports floating point values."""
+    ...
+
+@overload
+def clamp01_many(value: _DoubleOperand, out: None = None) -> Buffer: ...
+@overload
+def clamp01_many(value: _DoubleOperand, out: _OutT) -> _OutT:
+    """Batched ``clamp01``."""
+    ...
+
+@overload
+def delta_angle_many(current: _DoubleOperand, target: _DoubleOperand, out: None = None) -> Buffer: ...
+@overload
+def delta_angle_many(current: _DoubleOperand, target: _DoubleOperand, out: _OutT) -> _OutT:
+    """Batched ``delta_angle``."""
+    ...
+
+@overload
+def sign_many(x: _DoubleOperand, out: None = None) -> Buffer: ...
+@overload
+def sign_many(x: _DoubleOperand, out: _OutT) -> _OutT:
+    """Batched ``sign``. The signs are stored as floats."""
+    ...
+
+@overload
+def lerp_many(a: _DoubleOperand, b: _DoubleOperand, t: _DoubleOperand, out: None = None) -> Buffer: ...
+@overload
+def lerp_many(a: _DoubleOperand, b: _DoubleOperand, t: _DoubleOperand, out: _OutT) -> _OutT:
+    """Batched ``lerp``."""
+    ...
+
+@overload
+def lerp_unclamped_many(a: _DoubleOperand, b: _DoubleOperand, t: _DoubleOperand, out: None = None) -> Buffer: ...
+@overload
+def lerp_unclamped_many(a: _DoubleOperand, b: _DoubleOperand, t: _DoubleOperand, out: _OutT) -> _OutT:
+    """Batched ``lerp_unclamped``."""
+    ...
+
+@overload
+def inverse_lerp_many(a: _DoubleOperand, b: _DoubleOperand, value: _DoubleOperand, out: None = None) -> Buffer: ...
+@overload
+def inverse_lerp_many(a: _DoubleOperand, b: _DoubleOperand, value: _DoubleOperand, out: _OutT) -> _OutT:
+    """Batched ``inverse_lerp``."""
+    ...
+
+@overload
+def smooth_step_many(a: _DoubleOperand, b: _DoubleOperand, t: _DoubleOperand, out: None = None) -> Buffer: ...
+@overload
+def smooth_step_many(a: _DoubleOperand, b: _DoubleOperand, t: _DoubleOperand, out: _OutT) -> _OutT:
+    """Batched ``smooth_step``."""
+    ...
+
+@overload
+def move_towards_many(current: _DoubleOperand, target: _DoubleOperand, max_delta: _DoubleOperand, out: None = None) -> Buffer: ...
+@overload
+def move_towards_many(current: _DoubleOperand, target: _DoubleOperand, max_delta: _DoubleOperand, out: _OutT) -> _OutT:
+    """Batched ``move_towards``."""
+    ...
+
+@overload
+def ping_pong_many(t: _DoubleOperand, length: _DoubleOperand, out: None = None) -> Buffer: ...
+@overload
+def ping_pong_many(t: _DoubleOperand, length: _DoubleOperand, out: _OutT) -> _OutT:
+    """Batched ``ping_pong``."""
+    ...
+
+# ``n`` and ``digits`` are single values so that the scale is computed only once.
+@overload
+def round_to_nearest_n_many(x: _DoubleOperand, n: float, out: None = None) -> Buffer: ...
+@overload
+def round_to_nearest_n_many(x: _DoubleOperand, n: float, *, out: _OutT) -> _OutT:
+    """Batched ``round_to_nearest_n``. The results are stored as floats."""
+    ...
+
+@overload
+def floor_to_nearest_n_many(x: _DoubleOperand, n: float, out: None = None) -> Buffer: ...
+@overload
+def floor_to_nearest_n_many(x: _DoubleOperand, n: float, *, out: _OutT) -> _OutT:
+    """Batched ``floor_to_nearest_n``. The results are stored as floats."""
+    ...
+
+@overload
+def ceil_to_nearest_n_many(x: _DoubleOperand, n: float, out: None = None) -> Buffer: ...
+@overload
+def ceil_to_nearest_n_many(x: _DoubleOperand, n: float, *, out: _OutT) -> _OutT:
+    """Batched ``ceil_to_nearest_n``. The results are stored as floats."""
+    ...
+
+@overload
+def round_to_digits_many(x: _DoubleOperand, digits: int = 0, out: None = None) -> Buffer: ...
+@overload
+def round_to_digits_many(x: _DoubleOperand, digits: int = 0, *, out: _OutT) -> _OutT:
+    """Batched ``round_to_digits``."""
+    ...
+
+@overload
+def floor_to_digits_many(x: _DoubleOperand, digits: int = 0, out: None = None) -> Buffer: ...
+@overload
+def floor_to_digits_many(x: _DoubleOperand, digits: int = 0, *, out: _OutT) -> _OutT:
+    """Batched ``floor_to_digits``."""
+    ...
+
+@overload
+def ceil_to_digits_many(x: _DoubleOperand, digits: int = 0, out: None = None) -> Buffer: ...
+@overload
+def ceil_to_digits_many(x: _DoubleOperand, digits: int = 0, *, out: _OutT) -> _OutT:
+    """Batched ``ceil_to_digits``."""
+    ...
+
+@overload
+def round_to_nearest_n_to_digits_many(x: _DoubleOperand, n: float, digits: int = 0, out: None = None) -> Buffer: ...
+@overload
+def round_to_nearest_n_to_digits_many(x: _DoubleOperand, n: float, digits: int = 0, *, out: _OutT) -> _OutT:
+    """Batched ``round_to_nearest_n_to_digits``."""
+    ...
+
+@overload
+def floor_to_nearest_n_to_digits_many(x: _DoubleOperand, n: float, digits: int = 0, out: None = None) -> Buffer: ...
+@overload
+def floor_to_nearest_n_to_digits_many(x: _DoubleOperand, n: float, digits: int = 0, *, out: _OutT) -> _OutT:
+    """Batched ``floor_to_nearest_n_to_digits``."""
+    ...
+
+@overload
+def ceil_to_nearest_n_to_digits_many(x: _DoubleOperand, n: float, digits: int = 0, out: None = None) -> Buffer: ...
+@overload
+def ceil_to_nearest_n_to_digits_many(x: _DoubleOperand, n: float, digits: int = 0, *, out: _OutT) -> _OutT:
+    """Batched ``ceil_to_nearest_n_to_digits``."""
+    ...
+
+# Candidates can be any one-dimensional contiguous buffer of doubles or an iterable of floats. Every value is compared against every candidate.
+# Build a ``SortedValues`` to answer queries against the same candidates in logarithmic time instead.
+@overload
+def closest_many(values: _DoubleOperand, candidates: Buffer | Iterable[float], out: None = None) -> Buffer: ...
+@overload
+def closest_many(values: _DoubleOperand, candidates: Buffer | Iterable[float], out: _OutT) -> _OutT:
+    """Batched ``closest``. Like ``closest``, the first of equally close candidates is chosen. Raises ``ValueError`` if ``candidates`` is empty."""
+    ...
+
+@overload
+def furthest_many(values: _DoubleOperand, candidates: Buffer | Iterable[float], out: None = None) -> Buffer: ...
+@overload
+def furthest_many(values: _DoubleOperand, candidates: Buffer | Iterable[float], out: _OutT) -> _OutT:
+    """Batched ``furthest``. Like ``furthest``, the first of equally far candidates is chosen. Raises ``ValueError`` if ``candidates`` is empty."""
+    ...
+#endregion
@@ -1,6 +1,10 @@
 #cython: language_level=3
 
-from libc.math cimport llround, fabs
+cimport cython
+from cpython.long cimport PyLong_FromDouble
+from libc.math cimport llround, fabs, round as cround, floor, ceil, pow
+
+from ._batch cimport DoubleOperand, double_operand, broadcast_length, resolve_length, check_length, new_double_array, as_doubles
 
 def round(double x, /):
     return llround(x)
@@ -19,58 +23,95 @@ def clamp(value, _min, _max): # types not verified due to performance reasons
     return value
 
 cpdef clamp01(double value):
-    if value < 0.0:
-        return 0.0
-    if value > 1.0:
-        return 1.0
-    return value
+    return cclamp01(value)
 
 cpdef delta_angle(double current, double target):
-    cdef double delta = (target - current) % 360.0
-    if delta > 180.0:
-        delta -= 360.0
-    return delta
+    return cdelta_angle(current, target)
 
 def sign(double x, /):
     return doublesign(x)
 
 
 def lerp(double a, double b, double t):
-    return a + (b - a) * clamp01(t)
+    return clerp(a, b, t)
 
 def lerp_unclamped(double a, double b, double t):
-    return a + (b - a) * t
+    return clerp_unclamped(a, b, t)
 
 def lerp_angle(double a, double b, double t):
-    return a + delta_angle(a, b) * clamp01(t)
+    return clerp_angle(a, b, t)
 
 def inverse_lerp(double a, double b, double value):
-    if a != b:
-        return clamp01((value - a) / (b - a))
-    else:
-        return 0.0
+    return cinverse_lerp(a, b, value)
 
 def smooth_step(double a, double b, double t):
-    t = clamp01(t)
-    t = -2.0 * t * t * t + 3.0 * t * t
-    return b * t + a * (1 - t)
+    return csmooth_step(a, b, t)
 
 cpdef move_towards(double current, double target, double max_delta):
-    if fabs(target - current) <= max_delta:
-        return target
-    return current + doublesign(target - current) * max_delta
+    return cmove_towards(current, target, max_delta)
 
 def move_towards_angle(double current, double target, double max_delta):
-    deltaAngle = delta_angle(current, target)
-    if -max_delta < deltaAngle and deltaAngle < max_delta:
-        return target
-    target = current + deltaAngle
-    return move_towards(current, target, max_delta)
+    return cmove_towards_angle(current, target, max_delta)
 
 def ping_pong(double t, double length):
-    t = t % (length * 2.0)
+    t = t % (length * 2.0) # Raises ZeroDivisionError unlike cping_pong
     return length - fabs(t - length)
 
+#region Rounding
+ctypedef enum _Rounding:
+    _ROUND # Half away from zero like round
+    _FLOOR
+    _CEIL
+
+cdef inline double _apply_rounding(_Rounding rounding, double x) noexcept nogil:
+    if rounding == _ROUND:
+        return cround(x)
+    if rounding == _FLOOR:
+        return floor(x)
+    return ceil(x)
+
+@cython.cdivision(True)
+cdef inline object _to_nearest_n(_Rounding rounding, double x, object n):
+    cdef double _n = n
+    if _n == 0.0: # Prevent division by zero. Any multiple of zero is always zero.
+        return 0
+    return PyLong_FromDouble(_apply_rounding(rounding, x / _n)) * n # Integer n keeps the result an integer
+
+@cython.cdivision(True)
+cdef inline double _to_nearest_n_to_digits(_Rounding rounding, double x, double n, double digits) noexcept nogil:
+    if n == 0.0:
+        return 0.0
+    cdef double pow10 = pow(10.0, digits)
+    return _apply_rounding(rounding, (x * pow10) / n) * n / pow10 + 0.0 # Turns -0.0 into 0.0 like the integer rounding of the Python versions did
+
+def round_to_nearest_n(double x, /, n):
+    return _to_nearest_n(_ROUND, x, n)
+
+def floor_to_nearest_n(double x, /, n):
+    return _to_nearest_n(_FLOOR, x, n)
+
+def ceil_to_nearest_n(double x, /, n):
+    return _to_nearest_n(_CEIL, x, n)
+
+def round_to_digits(double x, /, double digits = 0):
+    return _to_nearest_n_to_digits(_ROUND, x, 1.0, digits)
+
+def floor_to_digits(double x, /, double digits = 0):
+    return _to_nearest_n_to_digits(_FLOOR, x, 1.0, digits)
+
+def ceil_to_digits(double x, /, double digits = 0):
+    return _to_nearest_n_to_digits(_CEIL, x, 1.0, digits)
+
+def round_to_nearest_n_to_digits(double x, /, double n, double digits = 0):
+    return _to_nearest_n_to_digits(_ROUND, x, n, digits)
+
+def floor_to_nearest_n_to_digits(double x, /, double n, double digits = 0):
+    return _to_nearest_n_to_digits(_FLOOR, x, n, digits)
+
+def ceil_to_nearest_n_to_digits(double x, /, double n, double digits = 0):
+    return _to_nearest_n_to_digits(_CEIL, x, n, digits)
+#endregion
+
 def kahan_sum(float_values):
     cdef double acc = 0.0
     cdef double c = 0.0
@@ -86,3 +127,234 @@ def kahan_sum(float_values):
         acc = t
 
     return acc
+
+
+#region Buffers
+# Batched variants of the functions above. Every argument can be a single float or a one-dimensional contiguous buffer of doubles.
+# Results are written into out (which can be one of the arguments to operate in place) or a newly allocated array.array("d").
+
+ctypedef double (*_unary_fn)(double) noexcept nogil
+ctypedef double (*_binary_fn)(double, double) noexcept nogil
+ctypedef double (*_ternary_fn)(double, double, double) noexcept nogil
+
+# Function pointers need a matching signature, sign returns a char.
+cdef double _sign(double x) noexcept nogil:
+    return <double>doublesign(x)
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef object _map1(_unary_fn fn, object x, object out):
+    cdef DoubleOperand ox
+    keep_x = double_operand(x, &ox)
+    cdef Py_ssize_t n = resolve_length(ox.length)
+    if out is None:
+        out = new_double_array(n)
+    cdef double[::1] out_view = out
+    check_length(n, out_view.shape[0])
+
+    cdef Py_ssize_t i
+    with nogil:
+        for i in range(n):
+            out_view[i] = fn(ox.data[i * ox.step])
+    return out
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef object _map2(_binary_fn fn, object a, object b, object out):
+    cdef DoubleOperand oa, ob
+    keep_a = double_operand(a, &oa)
+    keep_b = double_operand(b, &ob)
+    cdef Py_ssize_t n = resolve_length(broadcast_length(oa.length, ob.length))
+    if out is None:
+        out = new_double_array(n)
+    cdef double[::1] out_view = out
+    check_length(n, out_view.shape[0])
+
+    cdef Py_ssize_t i
+    with nogil:
+        for i in range(n):
+            out_view[i] = fn(oa.data[i * oa.step], ob.data[i * ob.step])
+    return out
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef object _map3(_ternary_fn fn, object a, object b, object c, object out):
+    cdef DoubleOperand oa, ob, oc
+    keep_a = double_operand(a, &oa)
+    keep_b = double_operand(b, &ob)
+    keep_c = double_operand(c, &oc)
+    cdef Py_ssize_t n = resolve_length(broadcast_length(broadcast_length(oa.length, ob.length), oc.length))
+    if out is None:
+        out = new_double_array(n)
+    cdef double[::1] out_view = out
+    check_length(n, out_view.shape[0])
+
+    cdef Py_ssize_t i
+    with nogil:
+        for i in range(n):
+            out_view[i] = fn(oa.data[i * oa.step], ob.data[i * ob.step], oc.data[i * oc.step])
+    return out
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def remap_many(value, from1, to1, from2, to2, out = None):
+    cdef DoubleOperand ov, of1, ot1, of2, ot2
+    keep_v = double_operand(value, &ov)
+    keep_f1 = double_operand(from1, &of1)
+    keep_t1 = double_operand(to1, &ot1)
+    keep_f2 = double_operand(from2, &of2)
+    keep_t2 = double_operand(to2, &ot2)
+    cdef Py_ssize_t n = ov.length
+    n = broadcast_length(n, of1.length)
+    n = broadcast_length(n, ot1.length)
+    n = broadcast_length(n, of2.length)
+    n = resolve_length(broadcast_length(n, ot2.length))
+    if out is None:
+        out = new_double_array(n)
+    cdef double[::1] out_view = out
+    check_length(n, out_view.shape[0])
+
+    cdef Py_ssize_t i
+    cdef double f2
+    with nogil:
+        for i in range(n):
+            f2 = of2.data[i * of2.step]
+            out_view[i] = cremap01(ov.data[i * ov.step], of1.data[i * of1.step], ot1.data[i * ot1.step]) * (ot2.data[i * ot2.step] - f2) + f2
+    return out
+
+def remap01_many(value, from1, to1, out = None):
+    return _map3(cremap01, value, from1, to1, out)
+
+def clamp_many(value, _min, _max, out = None):
+    return _map3(cclamp, value, _min, _max, out)
+
+def clamp01_many(value, out = None):
+    return _map1(cclamp01, value, out)
+
+def delta_angle_many(current, target, out = None):
+    return _map2(cdelta_angle, current, target, out)
+
+def sign_many(x, out = None):
+    return _map1(_sign, x, out)
+
+def lerp_many(a, b, t, out = None):
+    return _map3(clerp, a, b, t, out)
+
+def lerp_unclamped_many(a, b, t, out = None):
+    return _map3(clerp_unclamped, a, b, t, out)
+
+def inverse_lerp_many(a, b, value, out = None):
+    return _map3(cinverse_lerp, a, b, value, out)
+
+def smooth_step_many(a, b, t, out = None):
+    return _map3(csmooth_step, a, b, t, out)
+
+def move_towards_many(current, target, max_delta, out = None):
+    return _map3(cmove_towards, current, target, max_delta, out)
+
+def ping_pong_many(t, length, out = None):
+    return _map2(cping_pong, t, length, out)
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef object _select_many(object values, object candidates, object out, bint furthest):
+    cdef DoubleOperand ov
+    keep_v = double_operand(values, &ov)
+    cdef Py_ssize_t n = resolve_length(ov.length)
+    cdef const double[::1] c = as_doubles(candidates)
+    cdef Py_ssize_t m = c.shape[0]
+    if m < 1:
+        raise ValueError("At least one candidate is required.")
+    if out is None:
+        out = new_double_array(n)
+    cdef double[::1] out_view = out
+    check_length(n, out_view.shape[0])
+
+    # Same as min / max with a key: the first candidate wins ties.
+    cdef Py_ssize_t i, j
+    cdef double value, best, best_distance, distance
+    with nogil:
+        for i in range(n):
+            value = ov.data[i * ov.step]
+            best = c[0]
+            best_distance = fabs(best - value)
+            if furthest:
+                for j in range(1, m):
+                    distance = fabs(c[j] - value)
+                    if distance > best_distance:
+                        best = c[j]
+                        best_distance = distance
+            else:
+                for j in range(1, m):
+                    distance = fabs(c[j] - value)
+                    if distance < best_distance:
+                        best = c[j]
+                        best_distance = distance
+            out_view[i] = best
+    return out
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+cdef object _rounding_many(_Rounding rounding, object x, double n, double digits, object out):
+    cdef DoubleOperand ox
+    keep_x = double_operand(x, &ox)
+    cdef Py_ssize_t length = resolve_length(ox.length)
+    if out is None:
+        out = new_double_array(length)
+    cdef double[::1] out_view = out
+    check_length(length, out_view.shape[0])
+
+    # Same arithmetic as _to_nearest_n_to_digits with the scale and the rounding mode hoisted out of the loop.
+    # Multiplying and dividing by 1.0 is exact, so the digits and nearest n variants give the same results as their scalar versions.
+    cdef double pow10 = pow(10.0, digits)
+    cdef Py_ssize_t i
+    with nogil:
+        if n == 0.0:
+            for i in range(length):
+                out_view[i] = 0.0
+        elif rounding == _ROUND:
+            for i in range(length):
+                out_view[i] = cround((ox.data[i * ox.step] * pow10) / n) * n / pow10 + 0.0
+        elif rounding == _FLOOR:
+            for i in range(length):
+                out_view[i] = floor((ox.data[i * ox.step] * pow10) / n) * n / pow10 + 0.0
+        else:
+            for i in range(length):
+                out_view[i] = ceil((ox.data[i * ox.step] * pow10) / n) * n / pow10 + 0.0
+    return out
+
+def round_to_nearest_n_many(x, double n, out = None):
+    return _rounding_many(_ROUND, x, n, 0.0, out)
+
+def floor_to_nearest_n_many(x, double n, out = None):
+    return _rounding_many(_FLOOR, x, n, 0.0, out)
+
+def ceil_to_nearest_n_many(x, double n, out = None):
+    return _rounding_many(_CEIL, x, n, 0.0, out)
+
+def round_to_digits_many(x, double digits = 0, out = None):
+    return _rounding_many(_ROUND, x, 1.0, digits, out)
+
+def floor_to_digits_many(x, double digits = 0, out = None):
+    return _rounding_many(_FLOOR, x, 1.0, digits, out)
+
+def ceil_to_digits_many(x, double digits = 0, out = None):
+    return _rounding_many(_CEIL, x, 1.0, digits, out)
+
+def round_to_nearest_n_to_digits_many(x, double n, double digits = 0, out = None):
+    return _rounding_many(_ROUND, x, n, digits, out)
+
+def floor_to_nearest_n_to_digits_many(x, double n, double digits = 0, out = None):
+    return _rounding_many(_FLOOR, x, n, digits, out)
+
+def ceil_to_nearest_n_to_digits_many(x, double n, double digits = 0, out = None):
+    return _rounding_many(_CEIL, x, n, digits, out)
+
+def closest_many(values, candidates, out = None):
+    return _select_many(values, candidates, out, False)
+
+def furthest_many(values, candidates, out = None):
+    return _select_many(values, candidates, out, True)
+#endregion
@@ -0,0 +1,21 @@
+#cython: language_level=3
+
+cdef class Matrix3x2:
+    # Row vector convention like System.Numerics: a point is transformed as [x, y, 1] * M.
+    cdef readonly double m11
+    cdef readonly double m12
+    cdef readonly double m21
+    cdef readonly double m22
+    cdef readonly double m31 # Translation x
+    cdef readonly double m32 # Translation y
+
+cdef inline Matrix3x2 new_matrix3x2(double m11, double m12, double m21, double m22, double m31, double m32):
+    # Matrix3x2(...) without the overhead of calling __init__ through Python
+    cdef Matrix3x2 m = Matrix3x2.__new__(Matrix3x2)
+    m.m11 = m11
+    m.m12 = m12
+    m.m21 = m21
+    m.m22 = m22
+    m.m31 = m31
+    m.m32 = m32
+    return m
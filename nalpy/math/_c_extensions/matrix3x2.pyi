@@ -0,0 +1,119 @@
+from typing import ClassVar, Iterable, TypeVar, final, overload
+from typing_extensions import Buffer
+from .rect import Rect
+from .vector2 import Vector2
+from .vector2_array import Vector2Array
+
+_OutT = TypeVar("_OutT", bound=Buffer)
+_Points = Vector2Array | Buffer | Iterable[Vector2 | tuple[float, float]]
+
+@final
+class Matrix3x2:
+    """
+    An immutable 2D affine transformation matrix.
+
+    Uses the row vector convention of ``System.Numerics.Matrix3x2``: a point ``(x, y)`` is transformed as ``[x, y, 1] * M``, so ``m31`` and ``m32`` hold the translation.
+    Composition with ``a * b`` results in a matrix that applies ``a`` first and then ``b``.
+
+    Angles are in degrees and positive angles rotate counterclockwise when the positive Y axis goes up.
+    """
+
+    identity: ClassVar[Matrix3x2]
+    """A matrix that doesn't transform anything."""
+
+    def __init__(self, m11: float, m12: float, m21: float, m22: float, m31: float, m32: float) -> None: ...
+
+    @property
+    def m11(self) -> float: ...
+    @property
+    def m12(self) -> float: ...
+    @property
+    def m21(self) -> float: ...
+    @property
+    def m22(self) -> float: ...
+    @property
+    def m31(self) -> float: ...
+    @property
+    def m32(self) -> float: ...
+
+    @staticmethod
+    def translate(translation: Vector2) -> Matrix3x2:
+        """A matrix that moves points by ``translation``."""
+        ...
+
+    @staticmethod
+    def rotate(angle: float) -> Matrix3x2:
+        """A matrix that rotates points around the origin by ``angle`` degrees."""
+        ...
+
+    @staticmethod
+    def scale(scale: Vector2 | float) -> Matrix3x2:
+        """A matrix that scales points from the origin, either uniformly or per axis."""
+        ...
+
+    @staticmethod
+    def trs(translation: Vector2, angle: float, scale: Vector2) -> Matrix3x2:
+        """
+        A matrix that scales, then rotates and then translates points.
+
+        Same as ``Matrix3x2.scale(scale) * Matrix3x2.rotate(angle) * Matrix3x2.translate(translation)``.
+        """
+        ...
+
+    def __repr__(self) -> str: ...
+
+    def __getitem__(self, index: tuple[int, int]) -> float:
+        """The value at ``[row, column]``."""
+        ...
+
+    def __mul__(self, other: Matrix3x2) -> Matrix3x2: ...
+
+    def __eq__(self, other: object) -> bool: ...
+
+    def __hash__(self) -> int: ...
+
+    @property
+    def translation(self) -> Vector2: ...
+
+    @property
+    def determinant(self) -> float: ...
+
+    @property
+    def is_identity(self) -> bool: ...
+
+    @property
+    def inverse(self) -> Matrix3x2:
+        """A matrix that undoes this transformation. Raises ``ValueError`` if the determinant is zero."""
+        ...
+
+    def transform_point(self, point: Vector2) -> Vector2: ...
+
+    def transform_vector(self, vector: Vector2) -> Vector2:
+        """Transform a direction. Ignores the translation of this matrix."""
+        ...
+
+    def transform_rect(self, rect: Rect) -> Rect:
+        """The smallest rect that contains the transformed corners of ``rect``."""
+        ...
+
+    @overload
+    def transform_points(self, points: _Points) -> Vector2Array:
+        """Transform every point of an ``(n, 2)`` buffer of doubles or an iterable of vectors in C."""
+        ...
+    @overload
+    def transform_points(self, points: _Points, out: _OutT) -> _OutT:
+        """Transform every point into ``out``, which must be a writable contiguous ``(n, 2)`` buffer of doubles. ``out`` may be ``points``."""
+        ...
+
+    @overload
+    def transform_vectors(self, vectors: _Points) -> Vector2Array:
+        """Batched ``transform_vector``."""
+        ...
+    @overload
+    def transform_vectors(self, vectors: _Points, out: _OutT) -> _OutT:
+        """Batched ``transform_vector`` into ``out``."""
+        ...
+
+    def to_tuple(self) -> tuple[float, float, float, float, float, float]:
+        """``(m11, m12, m21, m22, m31, m32)``"""
+        ...
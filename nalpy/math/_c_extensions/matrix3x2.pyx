@@ -0,0 +1,222 @@
+#cython: language_level=3
+
+cimport cython
+from cpython.buffer cimport PyObject_CheckBuffer
+from libc.math cimport sin, cos, fmin, fmax
+
+from ._batch cimport check_length, check_pairs
+from .rect cimport Rect, new_rect
+from .vector2 cimport Vector2, new_vector2
+from .vector2_array cimport Vector2Array
+
+cdef double _deg2rad = 3.14159265358979323846 / 180.0
+
+cdef const double[:, ::1] _points(object points):
+    # Accepts any (n, 2) contiguous buffer of doubles or an iterable of vectors.
+    if not PyObject_CheckBuffer(points):
+        points = Vector2Array(points)
+    cdef const double[:, ::1] view = points
+    check_pairs(view.shape[1])
+    return view
+
+cdef double[:, ::1] _output(object out, Py_ssize_t length):
+    cdef double[:, ::1] view = out
+    check_pairs(view.shape[1])
+    check_length(length, view.shape[0])
+    return view
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef object _transform_many(Matrix3x2 m, object points, object out, bint translate):
+    cdef const double[:, ::1] view = _points(points)
+    cdef Py_ssize_t n = view.shape[0]
+    if out is None:
+        out = Vector2Array.zeros(n)
+    cdef double[:, ::1] out_view = _output(out, n)
+
+    cdef double m11 = m.m11, m12 = m.m12, m21 = m.m21, m22 = m.m22
+    cdef double m31 = m.m31 if translate else 0.0
+    cdef double m32 = m.m32 if translate else 0.0
+    cdef Py_ssize_t i
+    cdef double x, y
+    with nogil:
+        for i in range(n):
+            x = view[i, 0] # Stored in case out aliases points
+            y = view[i, 1]
+            out_view[i, 0] = x * m11 + y * m21 + m31
+            out_view[i, 1] = x * m12 + y * m22 + m32
+    return out
+
+@cython.freelist(256)
+cdef class Matrix3x2:
+    identity = new_matrix3x2(1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+
+    def __init__(self, double m11, double m12, double m21, double m22, double m31, double m32):
+        # Matrix3x2(m11, m12, m21, m22, m31, m32)
+        self.m11 = m11
+        self.m12 = m12
+        self.m21 = m21
+        self.m22 = m22
+        self.m31 = m31
+        self.m32 = m32
+
+    #region Constructors
+    @staticmethod
+    def translate(Vector2 translation):
+        return new_matrix3x2(1.0, 0.0, 0.0, 1.0, translation.x, translation.y)
+
+    @staticmethod
+    def rotate(double angle):
+        # Counterclockwise in degrees
+        cdef double rad = angle * _deg2rad
+        cdef double c = cos(rad)
+        cdef double s = sin(rad)
+        return new_matrix3x2(c, s, -s, c, 0.0, 0.0)
+
+    @staticmethod
+    def scale(scale):
+        cdef double x
+        cdef double y
+        if isinstance(scale, Vector2):
+            x = (<Vector2>scale).x
+            y = (<Vector2>scale).y
+        else:
+            x = y = scale
+        return new_matrix3x2(x, 0.0, 0.0, y, 0.0, 0.0)
+
+    @staticmethod
+    def trs(Vector2 translation, double angle, Vector2 scale):
+        # Scale, then rotate, then translate
+        cdef double rad = angle * _deg2rad
+        cdef double c = cos(rad)
+        cdef double s = sin(rad)
+        return new_matrix3x2(scale.x * c, scale.x * s, -scale.y * s, scale.y * c, translation.x, translation.y)
+    #endregion
+
+    def __repr__(self):
+        # repr(self)
+        return f"Matrix3x2({self.m11}, {self.m12}, {self.m21}, {self.m22}, {self.m31}, {self.m32})"
+
+    def __getitem__(self, index):
+        # self[row, column]
+        cdef Py_ssize_t row, column
+        row, column = index
+        if row == 0:
+            if column == 0:
+                return self.m11
+            if column == 1:
+                return self.m12
+        elif row == 1:
+            if column == 0:
+                return self.m21
+            if column == 1:
+                return self.m22
+        elif row == 2:
+            if column == 0:
+                return self.m31
+            if column == 1:
+                return self.m32
+        raise IndexError(index)
+
+    def __mul__(self, other):
+        # self * other, applies self first and then other
+        if not isinstance(other, Matrix3x2):
+            return NotImplemented
+        cdef Matrix3x2 m = <Matrix3x2>other
+        return new_matrix3x2(
+            self.m11 * m.m11 + self.m12 * m.m21,
+            self.m11 * m.m12 + self.m12 * m.m22,
+            self.m21 * m.m11 + self.m22 * m.m21,
+            self.m21 * m.m12 + self.m22 * m.m22,
+            self.m31 * m.m11 + self.m32 * m.m21 + m.m31,
+            self.m31 * m.m12 + self.m32 * m.m22 + m.m32
+        )
+
+    def __eq__(self, other):
+        # self == other
+        if not isinstance(other, Matrix3x2):
+            return NotImplemented
+        cdef Matrix3x2 m = <Matrix3x2>other
+        return (
+            self.m11 == m.m11 and self.m12 == m.m12 and
+            self.m21 == m.m21 and self.m22 == m.m22 and
+            self.m31 == m.m31 and self.m32 == m.m32
+        )
+
+    def __hash__(self):
+        return hash(self.to_tuple())
+
+    def __reduce__(self):
+        return (Matrix3x2, self.to_tuple())
+
+    #region Properties
+    @property
+    def translation(self):
+        return new_vector2(self.m31, self.m32)
+
+    @property
+    def determinant(self):
+        return self.m11 * self.m22 - self.m12 * self.m21
+
+    @property
+    def is_identity(self):
+        return self.m11 == 1.0 and self.m12 == 0.0 and self.m21 == 0.0 and self.m22 == 1.0 and self.m31 == 0.0 and self.m32 == 0.0
+
+    @property
+    def inverse(self):
+        cdef double det = self.m11 * self.m22 - self.m12 * self.m21
+        if det == 0.0:
+            raise ValueError("Matrix is not invertible.")
+
+        cdef double inv_det = 1.0 / det
+        return new_matrix3x2(
+            self.m22 * inv_det,
+            -self.m12 * inv_det,
+            -self.m21 * inv_det,
+            self.m11 * inv_det,
+            (self.m21 * self.m32 - self.m31 * self.m22) * inv_det,
+            (self.m31 * self.m12 - self.m11 * self.m32) * inv_det
+        )
+    #endregion
+
+    #region Transformation
+    def transform_point(self, Vector2 point):
+        return new_vector2(
+            point.x * self.m11 + point.y * self.m21 + self.m31,
+            point.x * self.m12 + point.y * self.m22 + self.m32
+        )
+
+    def transform_vector(self, Vector2 vector):
+        # Ignores translation
+        return new_vector2(
+            vector.x * self.m11 + vector.y * self.m21,
+            vector.x * self.m12 + vector.y * self.m22
+        )
+
+    def transform_rect(self, Rect rect):
+        # Bounding box of the transformed corners
+        cdef double xs[4]
+        cdef double ys[4]
+        cdef double cx, cy
+        cdef int i
+        for i in range(4):
+            cx = rect.x + (rect.w if i & 1 else 0.0)
+            cy = rect.y + (rect.h if i & 2 else 0.0)
+            xs[i] = cx * self.m11 + cy * self.m21 + self.m31
+            ys[i] = cx * self.m12 + cy * self.m22 + self.m32
+
+        cdef double xmin = fmin(fmin(xs[0], xs[1]), fmin(xs[2], xs[3]))
+        cdef double ymin = fmin(fmin(ys[0], ys[1]), fmin(ys[2], ys[3]))
+        cdef double xmax = fmax(fmax(xs[0], xs[1]), fmax(xs[2], xs[3]))
+        cdef double ymax = fmax(fmax(ys[0], ys[1]), fmax(ys[2], ys[3]))
+        return new_rect(xmin, ymin, xmax - xmin, ymax - ymin)
+
+    def transform_points(self, points, out = None):
+        return _transform_many(self, points, out, True)
+
+    def transform_vectors(self, vectors, out = None):
+        return _transform_many(self, vectors, out, False)
+    #endregion
+
+    def to_tuple(self):
+        return (self.m11, self.m12, self.m21, self.m22, self.m31, self.m32)
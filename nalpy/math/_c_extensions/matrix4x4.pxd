@@ -0,0 +1,13 @@
+#cython: language_level=3
+
+from libc.string cimport memcpy
+
+cdef class Matrix4x4:
+    # Row vector convention like System.Numerics: a point is transformed as [x, y, z, 1] * M.
+    cdef double _m[16] # Row-major, translation in _m[12], _m[13] and _m[14]
+
+cdef inline Matrix4x4 new_matrix4x4(const double* values):
+    # Matrix4x4(...) from 16 row-major values without the overhead of calling __init__ through Python
+    cdef Matrix4x4 m = Matrix4x4.__new__(Matrix4x4)
+    memcpy(m._m, values, 16 * sizeof(double))
+    return m
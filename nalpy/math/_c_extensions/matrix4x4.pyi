@@ -0,0 +1,113 @@
+from typing import ClassVar, Iterable, TypeVar, final, overload
+from typing_extensions import Buffer
+from .vector3 import Vector3
+from .vector3_array import Vector3Array
+
+_OutT = TypeVar("_OutT", bound=Buffer)
+_Points = Vector3Array | Buffer | Iterable[Vector3 | tuple[float, float, float]]
+
+@final
+class Matrix4x4:
+    """
+    An immutable 3D transformation matrix.
+
+    Uses the row vector convention of ``System.Numerics.Matrix4x4``: a point ``(x, y, z)`` is transformed as ``[x, y, z, 1] * M``, so the fourth row holds the translation.
+    Composition with ``a * b`` results in a matrix that applies ``a`` first and then ``b``.
+
+    Angles are in degrees and positive angles rotate counterclockwise when looking from the positive end of the axis towards the origin.
+    """
+
+    identity: ClassVar[Matrix4x4]
+    """A matrix that doesn't transform anything."""
+
+    def __init__(
+        self,
+        m11: float, m12: float, m13: float, m14: float,
+        m21: float, m22: float, m23: float, m24: float,
+        m31: float, m32: float, m33: float, m34: float,
+        m41: float, m42: float, m43: float, m44: float
+    ) -> None: ...
+
+    @staticmethod
+    def translate(translation: Vector3) -> Matrix4x4:
+        """A matrix that moves points by ``translation``."""
+        ...
+
+    @staticmethod
+    def rotate_x(angle: float) -> Matrix4x4:
+        """A matrix that rotates points around the X axis by ``angle`` degrees."""
+        ...
+
+    @staticmethod
+    def rotate_y(angle: float) -> Matrix4x4:
+        """A matrix that rotates points around the Y axis by ``angle`` degrees."""
+        ...
+
+    @staticmethod
+    def rotate_z(angle: float) -> Matrix4x4:
+        """A matrix that rotates points around the Z axis by ``angle`` degrees."""
+        ...
+
+    @staticmethod
+    def scale(scale: Vector3 | float) -> Matrix4x4:
+        """A matrix that scales points from the origin, either uniformly or per axis."""
+        ...
+
+    def __repr__(self) -> str: ...
+
+    def __getitem__(self, index: tuple[int, int]) -> float:
+        """The value at ``[row, column]``."""
+        ...
+
+    def __mul__(self, other: Matrix4x4) -> Matrix4x4: ...
+
+    def __eq__(self, other: object) -> bool: ...
+
+    def __hash__(self) -> int: ...
+
+    @property
+    def translation(self) -> Vector3: ...
+
+    @property
+    def is_identity(self) -> bool: ...
+
+    @property
+    def transpose(self) -> Matrix4x4: ...
+
+    @property
+    def determinant(self) -> float: ...
+
+    @property
+    def inverse(self) -> Matrix4x4:
+        """A matrix that undoes this transformation. Raises ``ValueError`` if the determinant is zero."""
+        ...
+
+    def transform_point(self, point: Vector3) -> Vector3:
+        """Transform a position. The result is divided by ``w``, which is always 1 for affine matrices."""
+        ...
+
+    def transform_vector(self, vector: Vector3) -> Vector3:
+        """Transform a direction. Ignores the translation and the projection of this matrix."""
+        ...
+
+    @overload
+    def transform_points(self, points: _Points) -> Vector3Array:
+        """Transform every point of an ``(n, 3)`` buffer of doubles or an iterable of vectors in C."""
+        ...
+    @overload
+    def transform_points(self, points: _Points, out: _OutT) -> _OutT:
+        """Transform every point into ``out``, which must be a writable contiguous ``(n, 3)`` buffer of doubles. ``out`` may be ``points``."""
+        ...
+
+    @overload
+    def transform_vectors(self, vectors: _Points) -> Vector3Array:
+        """Batched ``transform_vector``."""
+        ...
+    @overload
+    def transform_vectors(self, vectors: _Points, out: _OutT) -> _OutT:
+        """Batched ``transform_vector`` into ``out``."""
+        ...
+
+    def to_tuple(self) -> tuple[float, ...]:
+        """The 16 values in row-major order."""
+        ...
@@ -0,0 +1,326 @@
+#cython: language_level=3
+
+cimport cython
+from cpython.buffer cimport PyObject_CheckBuffer
+from libc.math cimport sin, cos
+
+from ._batch cimport check_length, check_triples
+from .vector3 cimport Vector3, new_vector3
+from .vector3_array cimport Vector3Array
+
+cdef double _deg2rad = 3.14159265358979323846 / 180.0
+
+cdef double[16] _IDENTITY = [
+    1.0, 0.0, 0.0, 0.0,
+    0.0, 1.0, 0.0, 0.0,
+    0.0, 0.0, 1.0, 0.0,
+    0.0, 0.0, 0.0, 1.0
+]
+
+cdef inline Matrix4x4 _rotation(double angle, int axis):
+    # Counterclockwise in degrees around the x (0), y (1) or z (2) axis.
+    cdef double rad = angle * _deg2rad
+    cdef double c = cos(rad)
+    cdef double s = sin(rad)
+    cdef Matrix4x4 m = new_matrix4x4(_IDENTITY)
+    cdef int a = (axis + 1) % 3 # The two axes that rotate into each other
+    cdef int b = (axis + 2) % 3
+    m._m[4 * a + a] = c
+    m._m[4 * a + b] = s
+    m._m[4 * b + a] = -s
+    m._m[4 * b + b] = c
+    return m
+
+cdef void _multiply(double* out, const double* a, const double* b) noexcept nogil:
+    # out must not alias a or b
+    cdef int row, column, k
+    cdef double acc
+    for row in range(4):
+        for column in range(4):
+            acc = 0.0
+            for k in range(4):
+                acc = acc + a[4 * row + k] * b[4 * k + column]
+            out[4 * row + column] = acc
+
+cdef double _cofactor_determinant(const double* m, double* cofactors) noexcept:
+    # Returns the determinant and writes the cofactors of the first row (transposed into the first column of the inverse)
+    cdef double a = m[0], b = m[1], c = m[2], d = m[3]
+    cdef double e = m[4], f = m[5], g = m[6], h = m[7]
+    cdef double i = m[8], j = m[9], k = m[10], l = m[11]
+    cdef double p_ = m[12], q = m[13], r = m[14], s = m[15]
+
+    cdef double ks_lr = k * s - l * r
+    cdef double js_lq = j * s - l * q
+    cdef double jr_kq = j * r - k * q
+    cdef double is_lp = i * s - l * p_
+    cdef double ir_kp = i * r - k * p_
+    cdef double iq_jp = i * q - j * p_
+
+    cofactors[0] = f * ks_lr - g * js_lq + h * jr_kq
+    cofactors[1] = -(e * ks_lr - g * is_lp + h * ir_kp)
+    cofactors[2] = e * js_lq - f * is_lp + h * iq_jp
+    cofactors[3] = -(e * jr_kq - f * ir_kp + g * iq_jp)
+    return a * cofactors[0] + b * cofactors[1] + c * cofactors[2] + d * cofactors[3]
+
+cdef const double[:, ::1] _points(object points):
+    # Accepts any (n, 3) contiguous buffer of doubles or an iterable of vectors.
+    if not PyObject_CheckBuffer(points):
+        points = Vector3Array(points)
+    cdef const double[:, ::1] view = points
+    check_triples(view.shape[1])
+    return view
+
+cdef double[:, ::1] _output(object out, Py_ssize_t length):
+    cdef double[:, ::1] view = out
+    check_triples(view.shape[1])
+    check_length(length, view.shape[0])
+    return view
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+cdef object _transform_many(Matrix4x4 matrix, object points, object out, bint is_point):
+    cdef const double[:, ::1] view = _points(points)
+    cdef Py_ssize_t n = view.shape[0]
+    if out is None:
+        out = Vector3Array.zeros(n)
+    cdef double[:, ::1] out_view = _output(out, n)
+
+    cdef const double* m = matrix._m
+    cdef bint projective = is_point and not (m[3] == 0.0 and m[7] == 0.0 and m[11] == 0.0 and m[15] == 1.0)
+    cdef Py_ssize_t i
+    cdef double x, y, z, w
+    with nogil:
+        if not is_point:
+            for i in range(n):
+                x = view[i, 0] # Stored in case out aliases points
+                y = view[i, 1]
+                z = view[i, 2]
+                out_view[i, 0] = x * m[0] + y * m[4] + z * m[8]
+                out_view[i, 1] = x * m[1] + y * m[5] + z * m[9]
+                out_view[i, 2] = x * m[2] + y * m[6] + z * m[10]
+        elif not projective: # Affine matrices don't need the division
+            for i in range(n):
+                x = view[i, 0]
+                y = view[i, 1]
+                z = view[i, 2]
+                out_view[i, 0] = x * m[0] + y * m[4] + z * m[8] + m[12]
+                out_view[i, 1] = x * m[1] + y * m[5] + z * m[9] + m[13]
+                out_view[i, 2] = x * m[2] + y * m[6] + z * m[10] + m[14]
+        else:
+            for i in range(n):
+                x = view[i, 0]
+                y = view[i, 1]
+                z = view[i, 2]
+                w = x * m[3] + y * m[7] + z * m[11] + m[15]
+                out_view[i, 0] = (x * m[0] + y * m[4] + z * m[8] + m[12]) / w
+                out_view[i, 1] = (x * m[1] + y * m[5] + z * m[9] + m[13]) / w
+                out_view[i, 2] = (x * m[2] + y * m[6] + z * m[10] + m[14]) / w
+    return out
+
+@cython.freelist(256)
+cdef class Matrix4x4:
+    identity = new_matrix4x4(_IDENTITY)
+
+    def __init__(self, double m11, double m12, double m13, double m14,
+                       double m21, double m22, double m23, double m24,
+                       double m31, double m32, double m33, double m34,
+                       double m41, double m42, double m43, double m44):
+        # Matrix4x4(m11, m12, ..., m44)
+        self._m = [
+            m11, m12, m13, m14,
+            m21, m22, m23, m24,
+            m31, m32, m33, m34,
+            m41, m42, m43, m44
+        ]
+
+    #region Constructors
+    @staticmethod
+    def translate(Vector3 translation):
+        cdef Matrix4x4 m = new_matrix4x4(_IDENTITY)
+        m._m[12] = translation.x
+        m._m[13] = translation.y
+        m._m[14] = translation.z
+        return m
+
+    @staticmethod
+    def rotate_x(double angle):
+        return _rotation(angle, 0)
+
+    @staticmethod
+    def rotate_y(double angle):
+        return _rotation(angle, 1)
+
+    @staticmethod
+    def rotate_z(double angle):
+        return _rotation(angle, 2)
+
+    @staticmethod
+    def scale(scale):
+        cdef Matrix4x4 m = new_matrix4x4(_IDENTITY)
+        if isinstance(scale, Vector3):
+            m._m[0] = (<Vector3>scale).x
+            m._m[5] = (<Vector3>scale).y
+            m._m[10] = (<Vector3>scale).z
+        else:
+            m._m[0] = m._m[5] = m._m[10] = scale
+        return m
+    #endregion
+
+    def __repr__(self):
+        # repr(self)
+        return f"Matrix4x4({', '.join([repr(v) for v in self.to_tuple()])})"
+
+    def __getitem__(self, index):
+        # self[row, column]
+        cdef Py_ssize_t row, column
+        row, column = index
+        if row < 0 or row > 3 or column < 0 or column > 3:
+            raise IndexError(index)
+        return self._m[4 * row + column]
+
+    def __mul__(self, other):
+        # self * other, applies self first and then other
+        if not isinstance(other, Matrix4x4):
+            return NotImplemented
+        cdef Matrix4x4 out = Matrix4x4.__new__(Matrix4x4)
+        _multiply(out._m, self._m, (<Matrix4x4>other)._m)
+        return out
+
+    def __eq__(self, other):
+        # self == other
+        if not isinstance(other, Matrix4x4):
+            return NotImplemented
+        cdef Matrix4x4 m = <Matrix4x4>other
+        cdef int i
+        for i in range(16):
+            if self._m[i] != m._m[i]:
+                return False
+        return True
+
+    def __hash__(self):
+        return hash(self.to_tuple())
+
+    def __reduce__(self):
+        return (Matrix4x4, self.to_tuple())
+
+    #region Properties
+    @property
+    def translation(self):
+        return new_vector3(self._m[12], self._m[13], self._m[14])
+
+    @property
+    def is_identity(self):
+        cdef int i
+        for i in range(16):
+            if self._m[i] != _IDENTITY[i]:
+                return False
+        return True
+
+    @property
+    def transpose(self):
+        cdef Matrix4x4 out = Matrix4x4.__new__(Matrix4x4)
+        cdef int row, column
+        for row in range(4):
+            for column in range(4):
+                out._m[4 * column + row] = self._m[4 * row + column]
+        return out
+
+    @property
+    def determinant(self):
+        cdef double[4] cofactors
+        return _cofactor_determinant(self._m, cofactors)
+
+    @property
+    def inverse(self):
+        # Cofactor expansion, adapted from System.Numerics.Matrix4x4.Invert
+        cdef const double* m = self._m
+        cdef double a = m[0], b = m[1], c = m[2], d = m[3]
+        cdef double e = m[4], f = m[5], g = m[6], h = m[7]
+        cdef double i = m[8], j = m[9], k = m[10], l = m[11]
+        cdef double p_ = m[12], q = m[13], r = m[14], s = m[15]
+
+        cdef double[4] cofactors
+        cdef double det = _cofactor_determinant(m, cofactors)
+        if det == 0.0:
+            raise ValueError("Matrix is not invertible.")
+        cdef double inv_det = 1.0 / det
+
+        cdef double ks_lr = k * s - l * r
+        cdef double js_lq = j * s - l * q
+        cdef double jr_kq = j * r - k * q
+        cdef double is_lp = i * s - l * p_
+        cdef double ir_kp = i * r - k * p_
+        cdef double iq_jp = i * q - j * p_
+
+        cdef double gs_hr = g * s - h * r
+        cdef double fs_hq = f * s - h * q
+        cdef double fr_gq = f * r - g * q
+        cdef double es_hp = e * s - h * p_
+        cdef double er_gp = e * r - g * p_
+        cdef double eq_fp = e * q - f * p_
+
+        cdef double gl_hk = g * l - h * k
+        cdef double fl_hj = f * l - h * j
+        cdef double fk_gj = f * k - g * j
+        cdef double el_hi = e * l - h * i
+        cdef double ek_gi = e * k - g * i
+        cdef double ej_fi = e * j - f * i
+
+        cdef Matrix4x4 out = Matrix4x4.__new__(Matrix4x4)
+        out._m = [
+            cofactors[0] * inv_det,
+            -(b * ks_lr - c * js_lq + d * jr_kq) * inv_det,
+            (b * gs_hr - c * fs_hq + d * fr_gq) * inv_det,
+            -(b * gl_hk - c * fl_hj + d * fk_gj) * inv_det,
+
+            cofactors[1] * inv_det,
+            (a * ks_lr - c * is_lp + d * ir_kp) * inv_det,
+            -(a * gs_hr - c * es_hp + d * er_gp) * inv_det,
+            (a * gl_hk - c * el_hi + d * ek_gi) * inv_det,
+
+            cofactors[2] * inv_det,
+            -(a * js_lq - b * is_lp + d * iq_jp) * inv_det,
+            (a * fs_hq - b * es_hp + d * eq_fp) * inv_det,
+            -(a * fl_hj - b * el_hi + d * ej_fi) * inv_det,
+
+            cofactors[3] * inv_det,
+            (a * jr_kq - b * ir_kp + c * iq_jp) * inv_det,
+            -(a * fr_gq - b * er_gp + c * eq_fp) * inv_det,
+            (a * fk_gj - b * ek_gi + c * ej_fi) * inv_det
+        ]
+        return out
+    #endregion
+
+    #region Transformation
+    @cython.cdivision(True)
+    def transform_point(self, Vector3 point):
+        # Divides by w, which is 1 for affine matrices
+        cdef const double* m = self._m
+        cdef double x = point.x, y = point.y, z = point.z
+        cdef double w = x * m[3] + y * m[7] + z * m[11] + m[15]
+        return new_vector3(
+            (x * m[0] + y * m[4] + z * m[8] + m[12]) / w,
+            (x * m[1] + y * m[5] + z * m[9] + m[13]) / w,
+            (x * m[2] + y * m[6] + z * m[10] + m[14]) / w
+        )
+
+    def transform_vector(self, Vector3 vector):
+        # Ignores translation
+        cdef const double* m = self._m
+        cdef double x = vector.x, y = vector.y, z = vector.z
+        return new_vector3(
+            x * m[0] + y * m[4] + z * m[8],
+            x * m[1] + y * m[5] + z * m[9],
+            x * m[2] + y * m[6] + z * m[10]
+        )
+
+    def transform_points(self, points, out = None):
+        return _transform_many(self, points, out, True)
+
+    def transform_vectors(self, vectors, out = None):
+        return _transform_many(self, vectors, out, False)
+    #endregion
+
+    def to_tuple(self):
+        return tuple([self._m[i] for i in range(16)])
@@ -6,3 +6,10 @@ cdef class MVector2:
 
     cpdef MVector2 copy(self)
     cpdef normalize(self)
+
+cdef inline MVector2 new_mvector2(double x, double y):
+    # MVector2(x, y) without the overhead of calling __init__ through Python
+    cdef MVector2 v = MVector2.__new__(MVector2)
+    v.x = x
+    v.y = y
+    return v
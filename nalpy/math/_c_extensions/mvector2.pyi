@@ -1,5 +1,9 @@
-from typing import Self, SupportsIndex
+from typing import Iterable, Self, SupportsIndex, TypeVar, overload
+from typing_extensions import Buffer
 from .vector2 import Vector2
+from .vector2_array import Vector2Array
+
+_OutT = TypeVar("_OutT", bound=Buffer)
 
 class MVector2:
     @staticmethod
@@ -43,6 +47,10 @@ class MVector2:
 
     def __eq__(self, other: MVector2) -> bool: ...
 
+    def __copy__(self) -> MVector2: ...
+
+    def __deepcopy__(self, memo: dict[int, object], /) -> MVector2: ...
+
     @property
     def magnitude(self) -> float:
         """The length of this vector."""
@@ -71,6 +79,22 @@ class MVector2:
         """Create a new `MVector2` by selecting the largest components of the two given `MVector2` instances."""
         ...
 
+    @staticmethod
+    def from_buffer(buffer: Buffer) -> list[MVector2]:
+        """Unpack a contiguous ``(n, 2)`` buffer of doubles into a list of `MVector2` instances."""
+        ...
+
+    @overload
+    @staticmethod
+    def to_buffer(vectors: Iterable[MVector2]) -> Vector2Array:
+        """Pack `MVector2` instances into a new `Vector2Array`."""
+        ...
+    @overload
+    @staticmethod
+    def to_buffer(vectors: Iterable[MVector2], out: _OutT) -> _OutT:
+        """Pack `MVector2` instances into ``out``, which must be a writable contiguous ``(n, 2)`` buffer of doubles."""
+        ...
+
     def to_immutable(self) -> Vector2: ...
     def to_tuple(self) -> tuple[float, float]: ...
     def to_dict(self) -> dict[str, float]: ...
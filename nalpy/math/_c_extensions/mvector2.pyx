@@ -1,28 +1,30 @@
 #cython: language_level=3
 
-from libc.math cimport hypot
+cimport cython
 
-from .vector2 cimport Vector2
+from ._batch cimport check_length, check_pairs
+from .vector2 cimport Vector2, new_vector2, magnitude2, normalize2
 
+@cython.freelist(256)
 cdef class MVector2:
     @staticmethod
     def zero():
-        return MVector2(0.0, 0.0)
+        return new_mvector2(0.0, 0.0)
     @staticmethod
     def one():
-        return MVector2(1.0, 1.0)
+        return new_mvector2(1.0, 1.0)
     @staticmethod
     def up():
-        return MVector2(0.0, 1.0)
+        return new_mvector2(0.0, 1.0)
     @staticmethod
     def down():
-        return MVector2(0.0, -1.0)
+        return new_mvector2(0.0, -1.0)
     @staticmethod
     def left():
-        return MVector2(-1.0, 0.0)
+        return new_mvector2(-1.0, 0.0)
     @staticmethod
     def right():
-        return MVector2(1.0, 0.0)
+        return new_mvector2(1.0, 0.0)
 
     def __init__(self, double x, double y):
         self.x = x
@@ -30,7 +32,7 @@ cdef class MVector2:
 
     @staticmethod
     def from_immutable(Vector2 immutable):
-        return MVector2(immutable.x, immutable.y)
+        return new_mvector2(immutable.x, immutable.y)
 
     def __getitem__(self, Py_ssize_t i):
         if i == 0:
@@ -134,10 +136,19 @@ cdef class MVector2:
 
     # NOTE: Object is mutable, do not implement __hash__
 
+    def __reduce__(self):
+        return (MVector2, (self.x, self.y))
+
+    def __copy__(self):
+        return new_mvector2(self.x, self.y)
+
+    def __deepcopy__(self, memo):
+        return new_mvector2(self.x, self.y) # Components are numbers, a shallow copy is already deep
+
 
     @property
     def magnitude(self):
-        return hypot(self.x, self.y)
+        return magnitude2(self.x, self.y)
 
     @property
     def normalized(self):
@@ -147,28 +158,53 @@ cdef class MVector2:
 
 
     cpdef normalize(self):
-        cdef double magnitude = hypot(self.x, self.y)
-        if magnitude == 0.0:
-            self.x = self.y = 0.0
-        else:
-            self.x /= magnitude
-            self.y /= magnitude
+        cdef double[2] out
+        normalize2(self.x, self.y, out)
+        self.x = out[0]
+        self.y = out[1]
 
     cpdef MVector2 copy(self):
-        return MVector2(self.x, self.y)
+        return new_mvector2(self.x, self.y)
 
 
     @staticmethod
     def min(MVector2 a, MVector2 b):
-        return MVector2(min(a.x, b.x), min(a.y, b.y))
+        return new_mvector2(min(a.x, b.x), min(a.y, b.y))
 
     @staticmethod
     def max(MVector2 a, MVector2 b):
-        return MVector2(max(a.x, b.x), max(a.y, b.y))
+        return new_mvector2(max(a.x, b.x), max(a.y, b.y))
 
 
+    @staticmethod
+    def from_buffer(const double[:, ::1] buffer):
+        check_pairs(buffer.shape[1])
+        cdef Py_ssize_t i
+        return [new_mvector2(buffer[i, 0], buffer[i, 1]) for i in range(buffer.shape[0])]
+
+    @staticmethod
+    def to_buffer(vectors, out = None):
+        if not isinstance(vectors, (list, tuple)):
+            vectors = list(vectors)
+        cdef Py_ssize_t length = len(vectors)
+
+        if out is None:
+            from .vector2_array import Vector2Array # Imported lazily, vector2_array depends on this module.
+            out = Vector2Array.zeros(length)
+        cdef double[:, ::1] view = out
+        check_pairs(view.shape[1])
+        check_length(length, view.shape[0])
+
+        cdef Py_ssize_t i
+        cdef MVector2 vec
+        for i in range(length):
+            vec = <MVector2?>vectors[i]
+            view[i, 0] = vec.x
+            view[i, 1] = vec.y
+        return out
+
     def to_immutable(self):
-        return Vector2(self.x, self.y)
+        return new_vector2(self.x, self.y)
 
     def to_tuple(self):
         return (self.x, self.y)
@@ -0,0 +1,14 @@
+#cython: language_level=3
+
+ctypedef long long int int_t
+
+cdef class MVector2Int:
+    cdef public int_t x
+    cdef public int_t y
+
+cdef inline MVector2Int new_mvector2_int(int_t x, int_t y):
+    # MVector2Int(x, y) without the overhead of calling __init__ through Python
+    cdef MVector2Int v = MVector2Int.__new__(MVector2Int)
+    v.x = x
+    v.y = y
+    return v
@@ -1,5 +1,9 @@
-from typing import Self, SupportsIndex
+from typing import Iterable, Self, SupportsIndex, TypeVar, overload
+from typing_extensions import Buffer
 from .vector2_int import Vector2Int
+from .vector2_int_buffer import Vector2IntBuffer
+
+_OutT = TypeVar("_OutT", bound=Buffer)
 
 class MVector2Int:
     @staticmethod
@@ -41,6 +45,10 @@ class MVector2Int:
 
     def __eq__(self, other: MVector2Int) -> bool: ...
 
+    def __copy__(self) -> MVector2Int: ...
+
+    def __deepcopy__(self, memo: dict[int, object], /) -> MVector2Int: ...
+
     @property
     def magnitude(self) -> float:
         """The length of this vector."""
@@ -60,6 +68,22 @@ class MVector2Int:
         """Create a new `MVector2Int` by selecting the largest components of the two given `MVector2Int` instances."""
         ...
 
+    @staticmethod
+    def from_buffer(buffer: Buffer) -> list[MVector2Int]:
+        """Unpack a contiguous ``(n, 2)`` buffer of 64-bit integers into a list of `MVector2Int` instances."""
+        ...
+
+    @overload
+    @staticmethod
+    def to_buffer(vectors: Iterable[MVector2Int]) -> Vector2IntBuffer:
+        """Pack `MVector2Int` instances into a new `Vector2IntBuffer`."""
+        ...
+    @overload
+    @staticmethod
+    def to_buffer(vectors: Iterable[MVector2Int], out: _OutT) -> _OutT:
+        """Pack `MVector2Int` instances into ``out``, which must be a writable contiguous ``(n, 2)`` buffer of 64-bit integers."""
+        ...
+
     def to_immutable(self) -> Vector2Int: ...
     def to_tuple(self) -> tuple[int, int]: ...
     def to_dict(self) -> dict[str, int]: ...
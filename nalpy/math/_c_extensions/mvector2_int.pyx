@@ -1,34 +1,31 @@
 #cython: language_level=3
 
-from libc.math cimport hypot
+cimport cython
 
-from .vector2_int cimport Vector2Int
-
-ctypedef long long int int_t
+from ._batch cimport check_length, check_pairs
+from .vector2_int cimport Vector2Int, new_vector2_int, magnitude2i
 
 # Modified from MVector2
+@cython.freelist(256)
 cdef class MVector2Int:
     @staticmethod
     def zero():
-        return MVector2Int(0, 0)
+        return new_mvector2_int(0, 0)
     @staticmethod
     def one():
-        return MVector2Int(1, 1)
+        return new_mvector2_int(1, 1)
     @staticmethod
     def up():
-        return MVector2Int(0, 1)
+        return new_mvector2_int(0, 1)
     @staticmethod
     def down():
-        return MVector2Int(0, -1)
+        return new_mvector2_int(0, -1)
     @staticmethod
     def left():
-        return MVector2Int(-1, 0)
+        return new_mvector2_int(-1, 0)
     @staticmethod
     def right():
-        return MVector2Int(1, 0)
-
-    cdef public int_t x
-    cdef public int_t y
+        return new_mvector2_int(1, 0)
 
     def __init__(self, int_t x, int_t y):
         self.x = x
@@ -36,7 +33,7 @@ cdef class MVector2Int:
 
     @staticmethod
     def from_immutable(Vector2Int immutable):
-        return MVector2Int(immutable.x, immutable.y)
+        return new_mvector2_int(immutable.x, immutable.y)
 
     def __getitem__(self, Py_ssize_t i):
         if i == 0:
@@ -124,26 +121,62 @@ cdef class MVector2Int:
 
     # NOTE: Object is mutable, do not implement __hash__
 
+    def __reduce__(self):
+        return (MVector2Int, (self.x, self.y))
+
+    def __copy__(self):
+        return new_mvector2_int(self.x, self.y)
+
+    def __deepcopy__(self, memo):
+        return new_mvector2_int(self.x, self.y) # Components are numbers, a shallow copy is already deep
+
 
     @property
     def magnitude(self):
-        return hypot(<double>self.x, <double>self.y)
+        return magnitude2i(self.x, self.y)
 
     def copy(self):
-        return MVector2Int(self.x, self.y)
+        return new_mvector2_int(self.x, self.y)
 
 
     @staticmethod
     def min(MVector2Int a, MVector2Int b):
-        return MVector2Int(min(a.x, b.x), min(a.y, b.y))
+        return new_mvector2_int(min(a.x, b.x), min(a.y, b.y))
 
     @staticmethod
     def max(MVector2Int a, MVector2Int b):
-        return MVector2Int(max(a.x, b.x), max(a.y, b.y))
+        return new_mvector2_int(max(a.x, b.x), max(a.y, b.y))
 
 
+    @staticmethod
+    def from_buffer(const long long[:, ::1] buffer):
+        check_pairs(buffer.shape[1])
+        cdef Py_ssize_t i
+        return [new_mvector2_int(buffer[i, 0], buffer[i, 1]) for i in range(buffer.shape[0])]
+
+    @staticmethod
+    def to_buffer(vectors, out = None):
+        if not isinstance(vectors, (list, tuple)):
+            vectors = list(vectors)
+        cdef Py_ssize_t length = len(vectors)
+
+        if out is None:
+            from .vector2_int_buffer import Vector2IntBuffer # Imported lazily, vector2_int_buffer depends on this module.
+            out = Vector2IntBuffer.zeros(length)
+        cdef long long[:, ::1] view = out
+        check_pairs(view.shape[1])
+        check_length(length, view.shape[0])
+
+        cdef Py_ssize_t i
+        cdef MVector2Int vec
+        for i in range(length):
+            vec = <MVector2Int?>vectors[i]
+            view[i, 0] = vec.x
+            view[i, 1] = vec.y
+        return out
+
     def to_immutable(self):
-        return Vector2Int(self.x, self.y)
+        return new_vector2_int(self.x, self.y)
 
     def to_tuple(self):
         return (self.x, self.y)
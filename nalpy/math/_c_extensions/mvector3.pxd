@@ -0,0 +1,17 @@
+#cython: language_level=3
+
+cdef class MVector3:
+    cdef public double x
+    cdef public double y
+    cdef public double z
+
+    cpdef MVector3 copy(self)
+    cpdef normalize(self)
+
+cdef inline MVector3 new_mvector3(double x, double y, double z):
+    # MVector3(x, y, z) without the overhead of calling __init__ through Python
+    cdef MVector3 v = MVector3.__new__(MVector3)
+    v.x = x
+    v.y = y
+    v.z = z
+    return v
@@ -0,0 +1,101 @@
+from typing import Iterable, Self, SupportsIndex, TypeVar, overload
+from typing_extensions import Buffer
+from .vector3 import Vector3
+from .vector3_array import Vector3Array
+
+_OutT = TypeVar("_OutT", bound=Buffer)
+
+class MVector3:
+    @staticmethod
+    def zero() -> MVector3: ...
+    @staticmethod
+    def one() -> MVector3: ...
+    @staticmethod
+    def up() -> MVector3: ...
+    @staticmethod
+    def down() -> MVector3: ...
+    @staticmethod
+    def left() -> MVector3: ...
+    @staticmethod
+    def right() -> MVector3: ...
+    @staticmethod
+    def forward() -> MVector3: ...
+    @staticmethod
+    def back() -> MVector3: ...
+
+    x: float
+    y: float
+    z: float
+
+    def __init__(self, x: float, y: float, z: float) -> None: ...
+
+    @staticmethod
+    def from_immutable(immutable: Vector3) -> MVector3: ...
+
+    def __getitem__(self, i: SupportsIndex) -> float: ...
+
+    def __repr__(self) -> str: ...
+
+    def __len__(self) -> int: ...
+
+    def __iadd__(self, other: MVector3 | Vector3) -> Self: ...
+
+    def __isub__(self, other: MVector3 | Vector3) -> Self: ...
+
+    def __imul__(self, other: MVector3 | Vector3 | float | int) -> Self: ...
+
+    def __itruediv__(self, other: MVector3 | Vector3 | float | int) -> Self: ...
+
+    def __ifloordiv__(self, other: MVector3 | Vector3 | float | int) -> Self: ...
+
+    def __imod__(self, other: MVector3 | Vector3 | float | int) -> Self: ...
+
+    def __eq__(self, other: MVector3) -> bool: ...
+
+    @property
+    def magnitude(self) -> float:
+        """The length of this vector."""
+        ...
+
+    def copy(self) -> MVector3:
+        """Make a new vector where the components' values match this vectors values."""
+        ...
+
+    @property
+    def normalized(self) -> MVector3:
+        """A copy of this vector with a magnitude of 1"""
+        ...
+
+    def normalize(self) -> None:
+        """Make this vector keep its direction, but have a magnitude of 1. Operates in place."""
+        ...
+
+    @staticmethod
+    def min(a: MVector3, b: MVector3) -> MVector3:
+        """Create a new `MVector3` by selecting the smallest components of the two given `MVector3` instances."""
+        ...
+
+    @staticmethod
+    def max(a: MVector3, b: MVector3) -> MVector3:
+        """Create a new `MVector3` by selecting the largest components of the two given `MVector3` instances."""
+        ...
+
+    @staticmethod
+    def from_buffer(buffer: Buffer) -> list[MVector3]:
+        """Unpack a contiguous ``(n, 3)`` buffer of doubles into a list of `MVector3` instances."""
+        ...
+
+    @overload
+    @staticmethod
+    def to_buffer(vectors: Iterable[MVector3]) -> Vector3Array:
+        """Pack `MVector3` instances into a new `Vector3Array`."""
+        ...
+    @overload
+    @staticmethod
+    def to_buffer(vectors: Iterable[MVector3], out: _OutT) -> _OutT:
+        """Pack `MVector3` instances into ``out``, which must be a writable contiguous ``(n, 3)`` buffer of doubles."""
+        ...
+
+    def to_immutable(self) -> Vector3: ...
+    def to_tuple(self) -> tuple[float, float, float]: ...
+    def to_dict(self) -> dict[str, float]: ...
@@ -0,0 +1,231 @@
+#cython: language_level=3
+
+cimport cython
+
+from ._batch cimport check_length, check_triples
+from .vector3 cimport Vector3, new_vector3, magnitude3
+
+@cython.freelist(256)
+cdef class MVector3:
+    @staticmethod
+    def zero():
+        return new_mvector3(0.0, 0.0, 0.0)
+    @staticmethod
+    def one():
+        return new_mvector3(1.0, 1.0, 1.0)
+    @staticmethod
+    def up():
+        return new_mvector3(0.0, 1.0, 0.0)
+    @staticmethod
+    def down():
+        return new_mvector3(0.0, -1.0, 0.0)
+    @staticmethod
+    def left():
+        return new_mvector3(-1.0, 0.0, 0.0)
+    @staticmethod
+    def right():
+        return new_mvector3(1.0, 0.0, 0.0)
+    @staticmethod
+    def forward():
+        return new_mvector3(0.0, 0.0, 1.0)
+    @staticmethod
+    def back():
+        return new_mvector3(0.0, 0.0, -1.0)
+
+    def __init__(self, double x, double y, double z):
+        self.x = x
+        self.y = y
+        self.z = z
+
+    @staticmethod
+    def from_immutable(Vector3 immutable):
+        return new_mvector3(immutable.x, immutable.y, immutable.z)
+
+    def __getitem__(self, Py_ssize_t i):
+        if i == 0:
+            return self.x
+        if i == 1:
+            return self.y
+        if i == 2:
+            return self.z
+
+        raise IndexError(i)
+
+    def __repr__(self):
+        return f"MVector3({self.x}, {self.y}, {self.z})"
+
+    def __len__(self):
+        return 3
+
+    # Only in-place arithmetic supported. For other arithmetic operations, conversion to Vector3 is required.
+    def __iadd__(self, other):
+        if not isinstance(other, (MVector3, Vector3)):
+            return NotImplemented
+
+        self.x += <double>other.x # Casting to force C addition instead of Python addition
+        self.y += <double>other.y
+        self.z += <double>other.z
+
+        return self
+
+    def __isub__(self, other):
+        if not isinstance(other, (MVector3, Vector3)):
+            return NotImplemented
+
+        self.x -= <double>other.x
+        self.y -= <double>other.y
+        self.z -= <double>other.z
+
+        return self
+
+    def __imul__(self, other):
+        cdef double x
+        cdef double y
+        cdef double z
+        if isinstance(other, (MVector3, Vector3)):
+            x = other.x
+            y = other.y
+            z = other.z
+        elif isinstance(other, (float, int)):
+            x = y = z = other
+        else:
+            return NotImplemented
+
+        self.x *= x
+        self.y *= y
+        self.z *= z
+
+        return self
+
+    def __itruediv__(self, other):
+        cdef double x
+        cdef double y
+        cdef double z
+        if isinstance(other, (MVector3, Vector3)):
+            x = other.x
+            y = other.y
+            z = other.z
+        elif isinstance(other, (float, int)):
+            x = y = z = other
+        else:
+            return NotImplemented
+
+        self.x /= x
+        self.y /= y
+        self.z /= z
+
+        return self
+
+    def __ifloordiv__(self, other):
+        cdef double x
+        cdef double y
+        cdef double z
+        if isinstance(other, (MVector3, Vector3)):
+            x = other.x
+            y = other.y
+            z = other.z
+        elif isinstance(other, (float, int)):
+            x = y = z = other
+        else:
+            return NotImplemented
+
+        self.x //= x
+        self.y //= y
+        self.z //= z
+
+        return self
+
+    def __imod__(self, other):
+        cdef double x
+        cdef double y
+        cdef double z
+        if isinstance(other, (MVector3, Vector3)):
+            x = other.x
+            y = other.y
+            z = other.z
+        elif isinstance(other, (float, int)):
+            x = y = z = other
+        else:
+            return NotImplemented
+
+        self.x %= x
+        self.y %= y
+        self.z %= z
+
+        return self
+
+    def __eq__(self, MVector3 other):
+        return self.x == other.x and self.y == other.y and self.z == other.z
+
+    # NOTE: Object is mutable, do not implement __hash__
+
+
+    @property
+    def magnitude(self):
+        return magnitude3(self.x, self.y, self.z)
+
+    @property
+    def normalized(self):
+        cdef MVector3 v = self.copy()
+        v.normalize()
+        return v
+
+
+    cpdef normalize(self):
+        cdef double magnitude = magnitude3(self.x, self.y, self.z)
+        if magnitude == 0.0:
+            self.x = self.y = self.z = 0.0
+        else:
+            self.x /= magnitude
+            self.y /= magnitude
+            self.z /= magnitude
+
+    cpdef MVector3 copy(self):
+        return new_mvector3(self.x, self.y, self.z)
+
+
+    @staticmethod
+    def min(MVector3 a, MVector3 b):
+        return new_mvector3(min(a.x, b.x), min(a.y, b.y), min(a.z, b.z))
+
+    @staticmethod
+    def max(MVector3 a, MVector3 b):
+        return new_mvector3(max(a.x, b.x), max(a.y, b.y), max(a.z, b.z))
+
+
+    @staticmethod
+    def from_buffer(const double[:, ::1] buffer):
+        check_triples(buffer.shape[1])
+        cdef Py_ssize_t i
+        return [new_mvector3(buffer[i, 0], buffer[i, 1], buffer[i, 2]) for i in range(buffer.shape[0])]
+
+    @staticmethod
+    def to_buffer(vectors, out = None):
+        if not isinstance(vectors, (list, tuple)):
+            vectors = list(vectors)
+        cdef Py_ssize_t length = len(vectors)
+
+        if out is None:
+            from .vector3_array import Vector3Array # Imported lazily, vector3_array depends on this module.
+            out = Vector3Array.zeros(length)
+        cdef double[:, ::1] view = out
+        check_triples(view.shape[1])
+        check_length(length, view.shape[0])
+
+        cdef Py_ssize_t i
+        cdef MVector3 vec
+        for i in range(length):
+            vec = <MVector3?>vectors[i]
+            view[i, 0] = vec.x
+            view[i, 1] = vec.y
+            view[i, 2] = vec.z
+        return out
+
+    def to_immutable(self):
+        return new_vector3(self.x, self.y, self.z)
+
+    def to_tuple(self):
+        return (self.x, self.y, self.z)
+
+    def to_dict(self):
+        return {"x": self.x, "y": self.y, "z": self.z}
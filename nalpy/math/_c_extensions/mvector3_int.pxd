@@ -0,0 +1,16 @@
+#cython: language_level=3
+
+ctypedef long long int int_t
+
+cdef class MVector3Int:
+    cdef public int_t x
+    cdef public int_t y
+    cdef public int_t z
+
+cdef inline MVector3Int new_mvector3_int(int_t x, int_t y, int_t z):
+    # MVector3Int(x, y, z) without the overhead of calling __init__ through Python
+    cdef MVector3Int v = MVector3Int.__new__(MVector3Int)
+    v.x = x
+    v.y = y
+    v.z = z
+    return v
@@ -0,0 +1,90 @@
+from typing import Iterable, Self, SupportsIndex, TypeVar, overload
+from typing_extensions import Buffer
+from .vector3_int import Vector3Int
+from .vector3_int_buffer import Vector3IntBuffer
+
+_OutT = TypeVar("_OutT", bound=Buffer)
+
+class MVector3Int:
+    @staticmethod
+    def zero() -> MVector3Int: ...
+    @staticmethod
+    def one() -> MVector3Int: ...
+    @staticmethod
+    def up() -> MVector3Int: ...
+    @staticmethod
+    def down() -> MVector3Int: ...
+    @staticmethod
+    def left() -> MVector3Int: ...
+    @staticmethod
+    def right() -> MVector3Int: ...
+    @staticmethod
+    def forward() -> MVector3Int: ...
+    @staticmethod
+    def back() -> MVector3Int: ...
+
+    x: int
+    y: int
+    z: int
+
+    def __init__(self, x: int, y: int, z: int) -> None: ...
+
+    @staticmethod
+    def from_immutable(immutable: Vector3Int) -> MVector3Int: ...
+
+    def __getitem__(self, i: SupportsIndex) -> int: ...
+
+    def __repr__(self) -> str: ...
+
+    def __len__(self) -> int: ...
+
+    def __iadd__(self, other: MVector3Int | Vector3Int) -> Self: ...
+
+    def __isub__(self, other: MVector3Int | Vector3Int) -> Self: ...
+
+    def __imul__(self, other: MVector3Int | Vector3Int | int) -> Self: ...
+
+    def __ifloordiv__(self, other: MVector3Int | Vector3Int | int) -> Self: ...
+
+    def __imod__(self, other: MVector3Int | Vector3Int | int) -> Self: ...
+
+    def __eq__(self, other: MVector3Int) -> bool: ...
+
+    @property
+    def magnitude(self) -> float:
+        """The length of this vector."""
+        ...
+
+    def copy(self) -> MVector3Int:
+        """Make a new vector where the components' values match this vectors values."""
+        ...
+
+    @staticmethod
+    def min(a: MVector3Int, b: MVector3Int) -> MVector3Int:
+        """Create a new `MVector3Int` by selecting the smallest components of the two given `MVector3Int` instances."""
+        ...
+
+    @staticmethod
+    def max(a: MVector3Int, b: MVector3Int) -> MVector3Int:
+        """Create a new `MVector3Int` by selecting the largest components of the two given `MVector3Int` instances."""
+        ...
+
+    @staticmethod
+    def from_buffer(buffer: Buffer) -> list[MVector3Int]:
+        """Unpack a contiguous ``(n, 3)`` buffer of 64-bit integers into a list of `MVector3Int` instances."""
+        ...
+
+    @overload
+    @staticmethod
+    def to_buffer(vectors: Iterable[MVector3Int]) -> Vector3IntBuffer:
+        """Pack `MVector3Int` instances into a new `Vector3IntBuffer`."""
+        ...
+    @overload
+    @staticmethod
+    def to_buffer(vectors: Iterable[MVector3Int], out: _OutT) -> _OutT:
+        """Pack `MVector3Int` instances into ``out``, which must be a writable contiguous ``(n, 3)`` buffer of 64-bit integers."""
+        ...
+
+    def to_immutable(self) -> Vector3Int: ...
+    def to_tuple(self) -> tuple[int, int, int]: ...
+    def to_dict(self) -> dict[str, int]: ...
@@ -0,0 +1,198 @@
+#cython: language_level=3
+
+cimport cython
+
+from ._batch cimport check_length, check_triples
+from .vector3 cimport magnitude3
+from .vector3_int cimport Vector3Int, new_vector3_int
+
+# Modified from MVector3
+@cython.freelist(256)
+cdef class MVector3Int:
+    @staticmethod
+    def zero():
+        return new_mvector3_int(0, 0, 0)
+    @staticmethod
+    def one():
+        return new_mvector3_int(1, 1, 1)
+    @staticmethod
+    def up():
+        return new_mvector3_int(0, 1, 0)
+    @staticmethod
+    def down():
+        return new_mvector3_int(0, -1, 0)
+    @staticmethod
+    def left():
+        return new_mvector3_int(-1, 0, 0)
+    @staticmethod
+    def right():
+        return new_mvector3_int(1, 0, 0)
+    @staticmethod
+    def forward():
+        return new_mvector3_int(0, 0, 1)
+    @staticmethod
+    def back():
+        return new_mvector3_int(0, 0, -1)
+
+    def __init__(self, int_t x, int_t y, int_t z):
+        self.x = x
+        self.y = y
+        self.z = z
+
+    @staticmethod
+    def from_immutable(Vector3Int immutable):
+        return new_mvector3_int(immutable.x, immutable.y, immutable.z)
+
+    def __getitem__(self, Py_ssize_t i):
+        if i == 0:
+            return self.x
+        if i == 1:
+            return self.y
+        if i == 2:
+            return self.z
+
+        raise IndexError(i)
+
+    def __repr__(self):
+        return f"MVector3Int({self.x}, {self.y}, {self.z})"
+
+    def __len__(self):
+        return 3
+
+    # Only in-place arithmetic supported. For other arithmetic operations, conversion to Vector3Int is required.
+    def __iadd__(self, other):
+        if not isinstance(other, (MVector3Int, Vector3Int)):
+            return NotImplemented
+
+        self.x += <int_t>other.x # Casting to force C addition instead of Python addition
+        self.y += <int_t>other.y
+        self.z += <int_t>other.z
+
+        return self
+
+    def __isub__(self, other):
+        if not isinstance(other, (MVector3Int, Vector3Int)):
+            return NotImplemented
+
+        self.x -= <int_t>other.x
+        self.y -= <int_t>other.y
+        self.z -= <int_t>other.z
+
+        return self
+
+    def __imul__(self, other):
+        cdef int_t x
+        cdef int_t y
+        cdef int_t z
+        if isinstance(other, (MVector3Int, Vector3Int)):
+            x = other.x
+            y = other.y
+            z = other.z
+        elif isinstance(other, int):
+            x = y = z = other
+        else:
+            return NotImplemented
+
+        self.x *= x
+        self.y *= y
+        self.z *= z
+
+        return self
+
+    def __ifloordiv__(self, other):
+        cdef int_t x
+        cdef int_t y
+        cdef int_t z
+        if isinstance(other, (MVector3Int, Vector3Int)):
+            x = other.x
+            y = other.y
+            z = other.z
+        elif isinstance(other, int):
+            x = y = z = other
+        else:
+            return NotImplemented
+
+        self.x //= x
+        self.y //= y
+        self.z //= z
+
+        return self
+
+    def __imod__(self, other):
+        cdef int_t x
+        cdef int_t y
+        cdef int_t z
+        if isinstance(other, (MVector3Int, Vector3Int)):
+            x = other.x
+            y = other.y
+            z = other.z
+        elif isinstance(other, int):
+            x = y = z = other
+        else:
+            return NotImplemented
+
+        self.x %= x
+        self.y %= y
+        self.z %= z
+
+        return self
+
+    def __eq__(self, MVector3Int other):
+        return self.x == other.x and self.y == other.y and self.z == other.z
+
+    # NOTE: Object is mutable, do not implement __hash__
+
+
+    @property
+    def magnitude(self):
+        return magnitude3(<double>self.x, <double>self.y, <double>self.z)
+
+    def copy(self):
+        return new_mvector3_int(self.x, self.y, self.z)
+
+
+    @staticmethod
+    def min(MVector3Int a, MVector3Int b):
+        return new_mvector3_int(min(a.x, b.x), min(a.y, b.y), min(a.z, b.z))
+
+    @staticmethod
+    def max(MVector3Int a, MVector3Int b):
+        return new_mvector3_int(max(a.x, b.x), max(a.y, b.y), max(a.z, b.z))
+
+
+    @staticmethod
+    def from_buffer(const long long[:, ::1] buffer):
+        check_triples(buffer.shape[1])
+        cdef Py_ssize_t i
+        return [new_mvector3_int(buffer[i, 0], buffer[i, 1], buffer[i, 2]) for i in range(buffer.shape[0])]
+
+    @staticmethod
+    def to_buffer(vectors, out = None):
+        if not isinstance(vectors, (list, tuple)):
+            vectors = list(vectors)
+        cdef Py_ssize_t length = len(vectors)
+
+        if out is None:
+            from .vector3_int_buffer import Vector3IntBuffer # Imported lazily, vector3_int_buffer depends on this module.
+            out = Vector3IntBuffer.zeros(length)
+        cdef long long[:, ::1] view = out
+        check_triples(view.shape[1])
+        check_length(length, view.shape[0])
+
+        cdef Py_ssize_t i
+        cdef MVector3Int vec
+        for i in range(length):
+            vec = <MVector3Int?>vectors[i]
+            view[i, 0] = vec.x
+            view[i, 1] = vec.y
+            view[i, 2] = vec.z
+        return out
+
+    def to_immutable(self):
+        return new_vector3_int(self.x, self.y, self.z)
+
+    def to_tuple(self):
+        return (self.x, self.y, self.z)
+
+    def to_dict(self):
+        return {"x": self.x, "y": self.y, "z": self.z}
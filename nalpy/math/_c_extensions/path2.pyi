@@ -0,0 +1,86 @@
+from array import array
+from typing import Iterable, Iterator, TypeVar, final, overload
+from typing_extensions import Buffer
+from .vector2 import Vector2
+from .vector2_array import Vector2Array
+
+_OutT = TypeVar("_OutT", bound=Buffer)
+
+@final
+class Path2:
+    """
+    An immutable polyline of two-dimensional points with a precomputed cumulative length table.
+
+    ``points`` can be a ``Vector2Array``, any contiguous ``(n, 2)`` buffer of doubles or an iterable of vectors. At least one point is required. The points are copied.
+
+    Positions along the path are given as ``t`` in range [0, 1] where ``0`` is the first point and ``1`` is the last point.
+    ``t`` is proportional to the distance travelled along the path (arc length), not to the point index, so sampling with evenly spaced ``t`` moves at a constant speed.
+    """
+
+    def __init__(self, points: Vector2Array | Buffer | Iterable[Vector2 | tuple[float, float]]) -> None: ...
+
+    def __len__(self) -> int:
+        """The amount of points."""
+        ...
+
+    def __getitem__(self, index: int) -> Vector2: ...
+
+    def __iter__(self) -> Iterator[Vector2]: ...
+
+    def __repr__(self) -> str: ...
+
+    @property
+    def length(self) -> float:
+        """The total length of the path."""
+        ...
+
+    @property
+    def points(self) -> Vector2Array:
+        """A copy of the points of this path."""
+        ...
+
+    @property
+    def cumulative_lengths(self) -> array[float]:
+        """A copy of the cumulative length table. Item ``i`` is the length of the path from the first point to point ``i``."""
+        ...
+
+    def sample(self, t: float) -> Vector2:
+        """
+        The point at ``t`` along the path. Finds the segment using binary search over the cumulative length table.
+
+        The parameter ``t`` is clamped to the range [0, 1].
+        """
+        ...
+
+    @overload
+    def sample_many(self, t: Buffer) -> Vector2Array:
+        """Batched ``sample``. Releases the GIL."""
+        ...
+    @overload
+    def sample_many(self, t: Buffer, out: _OutT) -> _OutT:
+        """Batched ``sample`` into ``out``, which must be a writable contiguous ``(n, 2)`` buffer of doubles. Releases the GIL."""
+        ...
+
+    def closest_point(self, point: Vector2) -> Vector2:
+        """The point on the path that is closest to ``point``. Ties go to the point that comes first along the path."""
+        ...
+
+    def closest_t(self, point: Vector2) -> float:
+        """
+        The ``t`` of the point on the path that is closest to ``point``.
+
+        ``sample(closest_t(point))`` is the same as ``closest_point(point)`` apart from rounding errors.
+        """
+        ...
+
+    def resample(self, count: int) -> Path2:
+        """A new path of ``count`` points that are evenly spaced along this path. The first and the last point are kept as is. Raises ``ValueError`` if ``count`` is less than 2."""
+        ...
+
+    def simplify(self, tolerance: float) -> Path2:
+        """
+        A new path with the points removed that are at most ``tolerance`` away from the simplified path. Uses the Ramer–Douglas–Peucker algorithm.
+
+        The first and the last point are always kept. Raises ``ValueError`` if ``tolerance`` is negative.
+        """
+        ...
@@ -0,0 +1,300 @@
+#cython: language_level=3
+
+cimport cython
+from cpython.buffer cimport PyObject_CheckBuffer
+from cpython.mem cimport PyMem_Malloc, PyMem_Free
+from libc.math cimport hypot
+from libc.string cimport memcpy
+
+from ._batch cimport DoubleOperand, double_operand, resolve_length, check_length, check_pairs, new_double_array
+from .functions cimport cclamp01
+from .vector2 cimport Vector2, new_vector2
+from .vector2_array cimport Vector2Array
+
+cdef int _init_path(Path2 path, const double* points, Py_ssize_t count) except -1:
+    # Copies points and builds the cumulative length table
+    if count < 1:
+        raise ValueError("At least one point is required.")
+
+    cdef double* data = <double*>PyMem_Malloc(2 * count * sizeof(double))
+    cdef double* cumulative = <double*>PyMem_Malloc(count * sizeof(double))
+    if data == NULL or cumulative == NULL:
+        PyMem_Free(data)
+        PyMem_Free(cumulative)
+        raise MemoryError()
+    memcpy(data, points, 2 * count * sizeof(double))
+
+    cdef Py_ssize_t i
+    cumulative[0] = 0.0
+    for i in range(1, count):
+        cumulative[i] = cumulative[i - 1] + hypot(data[2 * i] - data[2 * i - 2], data[2 * i + 1] - data[2 * i - 1])
+
+    PyMem_Free(path._points)
+    PyMem_Free(path._cumulative)
+    path._points = data
+    path._cumulative = cumulative
+    path._count = count
+    return 0
+
+cdef Path2 _new_path(const double* points, Py_ssize_t count):
+    cdef Path2 path = Path2.__new__(Path2)
+    _init_path(path, points, count)
+    return path
+
+#region Kernels
+cdef Py_ssize_t _segment_at(const double* cumulative, Py_ssize_t count, double distance) noexcept nogil:
+    # Index of the first point of the segment that contains distance. Binary search, requires count >= 2.
+    cdef Py_ssize_t lo = 1
+    cdef Py_ssize_t hi = count - 1
+    cdef Py_ssize_t mid
+    while lo < hi: # First index in [1, count - 1] whose cumulative length is not less than distance
+        mid = (lo + hi) // 2
+        if cumulative[mid] < distance:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo - 1
+
+@cython.cdivision(True)
+cdef void _sample(const double* points, const double* cumulative, Py_ssize_t count, double t, double* out) noexcept nogil:
+    cdef double total = cumulative[count - 1]
+    if count == 1 or t <= 0.0 or total == 0.0:
+        out[0] = points[0]
+        out[1] = points[1]
+        return
+    if t >= 1.0: # Exactly the last point, interpolation could be off by rounding
+        out[0] = points[2 * count - 2]
+        out[1] = points[2 * count - 1]
+        return
+
+    cdef double distance = t * total
+    cdef Py_ssize_t i = _segment_at(cumulative, count, distance)
+    cdef double segment = cumulative[i + 1] - cumulative[i]
+    cdef double f = (distance - cumulative[i]) / segment if segment > 0.0 else 0.0
+    out[0] = points[2 * i] + (points[2 * i + 2] - points[2 * i]) * f
+    out[1] = points[2 * i + 1] + (points[2 * i + 3] - points[2 * i + 1]) * f
+
+@cython.cdivision(True)
+cdef inline double _project(const double* a, const double* b, double px, double py, double* qx, double* qy) noexcept nogil:
+    # Fraction along segment a -> b of the closest point to p. Writes the closest point into qx and qy.
+    cdef double abx = b[0] - a[0]
+    cdef double aby = b[1] - a[1]
+    cdef double sqr_length = abx * abx + aby * aby
+    cdef double u = 0.0
+    if sqr_length > 0.0:
+        u = cclamp01(((px - a[0]) * abx + (py - a[1]) * aby) / sqr_length)
+    qx[0] = a[0] + abx * u
+    qy[0] = a[1] + aby * u
+    return u
+
+cdef double _closest(const double* points, const double* cumulative, Py_ssize_t count, double px, double py, double* out) noexcept nogil:
+    # Writes the closest point on the path into out and returns its distance along the path.
+    # Ties go to the segment that comes first.
+    out[0] = points[0]
+    out[1] = points[1]
+    cdef double best_sqr = (px - out[0]) * (px - out[0]) + (py - out[1]) * (py - out[1])
+    cdef double best_distance = 0.0
+
+    cdef Py_ssize_t i
+    cdef double u, qx, qy, sqr
+    for i in range(count - 1):
+        u = _project(points + 2 * i, points + 2 * i + 2, px, py, &qx, &qy)
+        sqr = (px - qx) * (px - qx) + (py - qy) * (py - qy)
+        if sqr < best_sqr:
+            best_sqr = sqr
+            best_distance = cumulative[i] + (cumulative[i + 1] - cumulative[i]) * u
+            out[0] = qx
+            out[1] = qy
+    return best_distance
+
+cdef Py_ssize_t _douglas_peucker(const double* points, Py_ssize_t count, double tolerance, unsigned char* keep, Py_ssize_t* stack) noexcept nogil:
+    # Marks the points to keep and returns their amount. stack must have room for 2 * count indices.
+    cdef Py_ssize_t kept = 2
+    cdef Py_ssize_t top = 0
+    cdef Py_ssize_t start, end, i, farthest
+    cdef double sqr_tolerance = tolerance * tolerance
+    cdef double farthest_sqr, sqr, qx, qy
+
+    keep[0] = keep[count - 1] = 1
+    stack[0] = 0
+    stack[1] = count - 1
+    top = 2
+    while top > 0: # Iterative, recursion could overflow the C stack for long paths
+        top -= 2
+        start = stack[top]
+        end = stack[top + 1]
+
+        farthest = -1
+        farthest_sqr = sqr_tolerance
+        for i in range(start + 1, end):
+            _project(points + 2 * start, points + 2 * end, points[2 * i], points[2 * i + 1], &qx, &qy)
+            sqr = (points[2 * i] - qx) * (points[2 * i] - qx) + (points[2 * i + 1] - qy) * (points[2 * i + 1] - qy)
+            if sqr > farthest_sqr:
+                farthest_sqr = sqr
+                farthest = i
+
+        if farthest != -1:
+            keep[farthest] = 1
+            kept += 1
+            stack[top] = start
+            stack[top + 1] = farthest
+            stack[top + 2] = farthest
+            stack[top + 3] = end
+            top += 4
+    return kept
+#endregion
+
+cdef class Path2:
+    cdef double* _points # Interleaved x, y pairs
+    cdef double* _cumulative # Length of the path from the first point to each point
+    cdef Py_ssize_t _count
+
+    def __cinit__(self):
+        # The kernels require at least one point, behave like Path2([Vector2(0, 0)]) in case __init__ is never called.
+        cdef double origin[2]
+        origin[0] = 0.0
+        origin[1] = 0.0
+        _init_path(self, origin, 1)
+
+    def __init__(self, points):
+        # Path2(points)
+        if not PyObject_CheckBuffer(points):
+            points = Vector2Array(points)
+        cdef const double[:, ::1] view = points
+        check_pairs(view.shape[1])
+        _init_path(self, &view[0, 0] if view.shape[0] > 0 else NULL, view.shape[0])
+
+    def __dealloc__(self):
+        PyMem_Free(self._points)
+        PyMem_Free(self._cumulative)
+
+    def __len__(self):
+        # len(self)
+        return self._count
+
+    def __getitem__(self, Py_ssize_t index):
+        # self[index]
+        if index < 0:
+            index += self._count
+        if index < 0 or index >= self._count:
+            raise IndexError("Path2 index out of range")
+        return new_vector2(self._points[2 * index], self._points[2 * index + 1])
+
+    def __iter__(self):
+        # iter(self)
+        cdef Py_ssize_t i
+        for i in range(self._count):
+            yield new_vector2(self._points[2 * i], self._points[2 * i + 1])
+
+    def __repr__(self):
+        # repr(self)
+        return f"Path2([{', '.join([repr(v) for v in self])}])"
+
+    @property
+    def length(self):
+        return self._cumulative[self._count - 1]
+
+    @property
+    def points(self):
+        cdef Vector2Array out = Vector2Array.zeros(self._count)
+        memcpy(out._data, self._points, 2 * self._count * sizeof(double))
+        return out
+
+    @property
+    def cumulative_lengths(self):
+        out = new_double_array(self._count)
+        cdef double[::1] view = out
+        memcpy(&view[0], self._cumulative, self._count * sizeof(double))
+        return out
+
+    #region Queries
+    def sample(self, double t):
+        cdef double[2] out
+        _sample(self._points, self._cumulative, self._count, t, out)
+        return new_vector2(out[0], out[1])
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def sample_many(self, t, out = None):
+        cdef DoubleOperand ot
+        keep_t = double_operand(t, &ot)
+        cdef Py_ssize_t n = resolve_length(ot.length)
+        if out is None:
+            out = Vector2Array.zeros(n)
+        cdef double[:, ::1] out_view = out
+        check_pairs(out_view.shape[1])
+        check_length(n, out_view.shape[0])
+
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(n):
+                _sample(self._points, self._cumulative, self._count, ot.data[i * ot.step], &out_view[i, 0])
+        return out
+
+    def closest_point(self, Vector2 point):
+        cdef double[2] out
+        _closest(self._points, self._cumulative, self._count, point.x, point.y, out)
+        return new_vector2(out[0], out[1])
+
+    def closest_t(self, Vector2 point):
+        cdef double[2] out
+        cdef double distance = _closest(self._points, self._cumulative, self._count, point.x, point.y, out)
+        cdef double total = self._cumulative[self._count - 1]
+        if total == 0.0:
+            return 0.0
+        return cclamp01(distance / total)
+    #endregion
+
+    #region Construction of new paths
+    @cython.cdivision(True)
+    def resample(self, Py_ssize_t count):
+        if count < 2:
+            raise ValueError("At least two points are required.")
+
+        cdef double* data = <double*>PyMem_Malloc(2 * count * sizeof(double))
+        if data == NULL:
+            raise MemoryError()
+
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(count):
+                _sample(self._points, self._cumulative, self._count, <double>i / <double>(count - 1), data + 2 * i)
+        try:
+            return _new_path(data, count)
+        finally:
+            PyMem_Free(data)
+
+    def simplify(self, double tolerance):
+        if not tolerance >= 0.0:
+            raise ValueError("Tolerance must be non-negative.")
+        if self._count <= 2:
+            return _new_path(self._points, self._count)
+
+        cdef unsigned char* keep = <unsigned char*>PyMem_Malloc(self._count * sizeof(unsigned char))
+        cdef Py_ssize_t* stack = <Py_ssize_t*>PyMem_Malloc(2 * self._count * sizeof(Py_ssize_t))
+        cdef double* data = NULL
+        cdef Py_ssize_t i, j, kept
+        try:
+            if keep == NULL or stack == NULL:
+                raise MemoryError()
+            for i in range(self._count):
+                keep[i] = 0
+
+            with nogil:
+                kept = _douglas_peucker(self._points, self._count, tolerance, keep, stack)
+
+            data = <double*>PyMem_Malloc(2 * kept * sizeof(double))
+            if data == NULL:
+                raise MemoryError()
+            j = 0
+            for i in range(self._count):
+                if keep[i]:
+                    data[2 * j] = self._points[2 * i]
+                    data[2 * j + 1] = self._points[2 * i + 1]
+                    j += 1
+            return _new_path(data, kept)
+        finally:
+            PyMem_Free(keep)
+            PyMem_Free(stack)
+            PyMem_Free(data)
+    #endregion
@@ -0,0 +1,16 @@
+#cython: language_level=3
+
+cdef class Quaternion:
+    cdef readonly double x
+    cdef readonly double y
+    cdef readonly double z
+    cdef readonly double w
+
+cdef inline Quaternion new_quaternion(double x, double y, double z, double w):
+    # Quaternion(x, y, z, w) without the overhead of calling __init__ through Python
+    cdef Quaternion q = Quaternion.__new__(Quaternion)
+    q.x = x
+    q.y = y
+    q.z = z
+    q.w = w
+    return q
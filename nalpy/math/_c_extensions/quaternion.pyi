@@ -0,0 +1,173 @@
+from typing import ClassVar, Iterable, Iterator, SupportsIndex, TypeAlias, TypeVar, final, overload
+from typing_extensions import Buffer
+from .matrix4x4 import Matrix4x4
+from .quaternion_array import QuaternionArray
+from .vector3 import Vector3
+
+_OutT = TypeVar("_OutT", bound=Buffer)
+_QuaternionOperand: TypeAlias = Quaternion | QuaternionArray | Buffer | Iterable[Quaternion]
+"""A single ``Quaternion`` that is broadcast, an ``(n, 4)`` contiguous buffer of doubles or an iterable of quaternions."""
+_DoubleOperand: TypeAlias = float | Buffer
+"""A single float that is broadcast or a one-dimensional contiguous buffer of doubles."""
+
+@final
+class Quaternion:
+    """
+    An immutable quaternion ``(x, y, z, w)`` that represents a rotation in 3D space.
+
+    Angles are in degrees and positive angles rotate counterclockwise when looking against the rotation axis, same as ``Matrix4x4.rotate_x``, ``rotate_y`` and ``rotate_z``.
+    Composition with ``a * b`` results in a rotation that applies ``b`` first and then ``a``, and ``q * v`` rotates the vector ``v``.
+
+    NOTE: The rotation methods expect unit quaternions. Use ``normalized`` if the magnitude has drifted away from 1.
+    """
+
+    identity: ClassVar[Quaternion]
+    """A rotation that doesn't rotate anything. Shorthand for ``Quaternion(0.0, 0.0, 0.0, 1.0)``"""
+
+    def __init__(self, x: float, y: float, z: float, w: float) -> None: ...
+
+    @property
+    def x(self) -> float: ...
+    @property
+    def y(self) -> float: ...
+    @property
+    def z(self) -> float: ...
+    @property
+    def w(self) -> float: ...
+
+    @staticmethod
+    def from_axis_angle(axis: Vector3, angle: float) -> Quaternion:
+        """A rotation of ``angle`` degrees around ``axis``. Raises ``ValueError`` if ``axis`` is a zero vector."""
+        ...
+
+    @staticmethod
+    def from_euler(euler: Vector3) -> Quaternion:
+        """
+        A rotation of ``euler.z`` degrees around the z axis, then ``euler.x`` degrees around the x axis and then ``euler.y`` degrees around the y axis.
+
+        Same order as Unity's ``Quaternion.Euler`` and ``System.Numerics.Quaternion.CreateFromYawPitchRoll`` where yaw is ``y``, pitch is ``x`` and roll is ``z``.
+        """
+        ...
+
+    def __getitem__(self, i: SupportsIndex) -> float: ...
+
+    def __repr__(self) -> str: ...
+
+    def __len__(self) -> int: ...
+
+    @overload
+    def __mul__(self, other: Quaternion) -> Quaternion:
+        """The rotation that applies ``other`` first and then ``self`` (Hamilton product)."""
+        ...
+    @overload
+    def __mul__(self, other: Vector3) -> Vector3:
+        """Rotate ``other`` by this rotation."""
+        ...
+
+    def __neg__(self) -> Quaternion:
+        """Negates every component. The result represents the same rotation."""
+        ...
+
+    def __eq__(self, other: Quaternion) -> bool: ...
+
+    def __iter__(self) -> Iterator[float]: ...
+
+    def __hash__(self) -> int: ...
+
+    @property
+    def magnitude(self) -> float: ...
+
+    @property
+    def normalized(self) -> Quaternion:
+        """This quaternion with a magnitude of 1. A zero quaternion returns ``Quaternion.identity``."""
+        ...
+
+    @property
+    def inverse(self) -> Quaternion:
+        """The rotation that undoes this rotation. Raises ``ValueError`` if this is a zero quaternion."""
+        ...
+
+    @staticmethod
+    def dot(a: Quaternion, b: Quaternion) -> float: ...
+
+    @staticmethod
+    def angle(a: Quaternion, b: Quaternion) -> float:
+        """The angle in degrees needed to rotate from ``a`` to ``b``. Result is in range [0, 180]."""
+        ...
+
+    @staticmethod
+    def slerp(a: Quaternion, b: Quaternion, t: float) -> Quaternion:
+        """
+        Spherically interpolates between rotations ``a`` and ``b`` by ``t`` with a constant angular velocity through the shortest path.
+
+        The parameter ``t`` is clamped to the range [0, 1].
+        """
+        ...
+
+    @staticmethod
+    def slerp_unclamped(a: Quaternion, b: Quaternion, t: float) -> Quaternion:
+        """
+        Spherically interpolates between rotations ``a`` and ``b`` by ``t`` with a constant angular velocity through the shortest path.
+
+        The parameter ``t`` is not clamped.
+        """
+        ...
+
+    @staticmethod
+    def nlerp(a: Quaternion, b: Quaternion, t: float) -> Quaternion:
+        """
+        Linearly interpolates between rotations ``a`` and ``b`` by ``t`` through the shortest path and normalizes the result.
+
+        Faster than ``slerp``, but the angular velocity is not constant. The parameter ``t`` is clamped to the range [0, 1].
+        """
+        ...
+
+    # Batched variants of slerp and nlerp.
+    # Results are bit-for-bit identical to the single quaternion methods and are written into ``out`` if given (any writable contiguous ``(n, 4)`` buffer of doubles, may be one of the inputs), otherwise a new ``QuaternionArray`` is allocated.
+    @overload
+    @staticmethod
+    def slerp_many(a: _QuaternionOperand, b: _QuaternionOperand, t: _DoubleOperand) -> QuaternionArray:
+        """Batched ``Quaternion.slerp``. ``t`` can be a single value or one value per quaternion."""
+        ...
+    @overload
+    @staticmethod
+    def slerp_many(a: _QuaternionOperand, b: _QuaternionOperand, t: _DoubleOperand, out: _OutT) -> _OutT:
+        """Batched ``Quaternion.slerp`` into ``out``. ``t`` can be a single value or one value per quaternion."""
+        ...
+
+    @overload
+    @staticmethod
+    def nlerp_many(a: _QuaternionOperand, b: _QuaternionOperand, t: _DoubleOperand) -> QuaternionArray:
+        """Batched ``Quaternion.nlerp``. ``t`` can be a single value or one value per quaternion."""
+        ...
+    @overload
+    @staticmethod
+    def nlerp_many(a: _QuaternionOperand, b: _QuaternionOperand, t: _DoubleOperand, out: _OutT) -> _OutT:
+        """Batched ``Quaternion.nlerp`` into ``out``. ``t`` can be a single value or one value per quaternion."""
+        ...
+
+    def to_euler(self) -> Vector3:
+        """The euler angles of this rotation in the same order as ``from_euler``. The angles are in range [0, 360)."""
+        ...
+
+    def to_matrix(self) -> Matrix4x4:
+        """A ``Matrix4x4`` that applies the same rotation."""
+        ...
+
+    @staticmethod
+    def from_buffer(buffer: Buffer) -> list[Quaternion]:
+        """Unpack a contiguous ``(n, 4)`` buffer of doubles into a list of `Quaternion` instances."""
+        ...
+
+    @overload
+    @staticmethod
+    def to_buffer(quaternions: Iterable[Quaternion]) -> QuaternionArray:
+        """Pack `Quaternion` instances into a new `QuaternionArray`."""
+        ...
+    @overload
+    @staticmethod
+    def to_buffer(quaternions: Iterable[Quaternion], out: _OutT) -> _OutT:
+        """Pack `Quaternion` instances into ``out``, which must be a writable contiguous ``(n, 4)`` buffer of doubles."""
+        ...
+
+    def to_tuple(self) -> tuple[float, float, float, float]: ...
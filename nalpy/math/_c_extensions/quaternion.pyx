@@ -0,0 +1,368 @@
+#cython: language_level=3
+
+cimport cython
+from cpython.buffer cimport PyObject_CheckBuffer
+from libc.math cimport acos, atan2, cos, fabs, fmod, sin, sqrt
+
+from ._batch cimport DoubleOperand, double_operand, broadcast_length, resolve_length, check_length, check_quadruples
+from .functions cimport cclamp01
+from ._hash cimport hash4
+from .matrix4x4 cimport Matrix4x4, new_matrix4x4
+from .vector3 cimport Vector3, new_vector3, magnitude3
+
+cdef double _deg2rad = 3.14159265358979323846 / 180.0
+cdef double _rad2deg = 180.0 / 3.14159265358979323846
+
+cdef struct _QuaternionOperand:
+    const double* data
+    Py_ssize_t length # -1 when a single quaternion is broadcast
+    Py_ssize_t step # 0 when a single quaternion is broadcast
+    double scalar[4]
+
+#region Kernels
+# Quaternions are passed as pointers to x, y, z, w so that the scalar and the batched methods share the exact same math.
+# out may alias a or b.
+@cython.cdivision(True)
+cdef inline void _normalize(double* q) noexcept nogil:
+    cdef double magnitude = sqrt(q[0] * q[0] + q[1] * q[1] + q[2] * q[2] + q[3] * q[3])
+    if magnitude == 0.0: # Zero quaternion has no rotation, use identity instead
+        q[0] = q[1] = q[2] = 0.0
+        q[3] = 1.0
+    else:
+        q[0] /= magnitude
+        q[1] /= magnitude
+        q[2] /= magnitude
+        q[3] /= magnitude
+
+cdef inline void _nlerp(const double* a, const double* b, double t, double* out) noexcept nogil:
+    cdef double dot = a[0] * b[0] + a[1] * b[1] + a[2] * b[2] + a[3] * b[3]
+    cdef double wb = -t if dot < 0.0 else t # Negate b to interpolate through the shortest path
+    cdef double wa = 1.0 - t
+
+    cdef double x = wa * a[0] + wb * b[0]
+    cdef double y = wa * a[1] + wb * b[1]
+    cdef double z = wa * a[2] + wb * b[2]
+    cdef double w = wa * a[3] + wb * b[3]
+    out[0] = x
+    out[1] = y
+    out[2] = z
+    out[3] = w
+    _normalize(out)
+
+@cython.cdivision(True)
+cdef inline void _slerp(const double* a, const double* b, double t, double* out) noexcept nogil:
+    cdef double dot = a[0] * b[0] + a[1] * b[1] + a[2] * b[2] + a[3] * b[3]
+    cdef double sign = 1.0
+    if dot < 0.0: # Negate b to interpolate through the shortest path
+        dot = -dot
+        sign = -1.0
+
+    if dot > 0.9995: # sin(theta) is too close to zero, nlerp is indistinguishable at this range
+        _nlerp(a, b, t, out)
+        return
+
+    cdef double theta = acos(dot)
+    cdef double sin_theta = sqrt(1.0 - dot * dot) # Same as sin(theta), but cheaper
+    cdef double wa = sin((1.0 - t) * theta) / sin_theta
+    cdef double wb = sign * sin(t * theta) / sin_theta
+
+    cdef double x = wa * a[0] + wb * b[0]
+    cdef double y = wa * a[1] + wb * b[1]
+    cdef double z = wa * a[2] + wb * b[2]
+    cdef double w = wa * a[3] + wb * b[3]
+    out[0] = x
+    out[1] = y
+    out[2] = z
+    out[3] = w
+
+cdef inline double _wrap_degrees(double angle) noexcept nogil:
+    # Wraps into range [0, 360)
+    angle = fmod(angle, 360.0)
+    if angle < 0.0:
+        angle += 360.0
+    if angle >= 360.0: # Tiny negative angles round up to 360.0
+        angle = 0.0
+    return angle + 0.0 # Turns -0.0 into 0.0
+
+cdef object _quaternion_operand(object obj, _QuaternionOperand* op):
+    # Accepts a Quaternion, any (n, 4) contiguous buffer of doubles or an iterable of quaternions.
+    # Returns the object that owns op.data. It must be kept alive while op is in use.
+    cdef Quaternion q
+    cdef const double[:, ::1] view
+    if isinstance(obj, Quaternion):
+        q = <Quaternion>obj
+        op.scalar[0] = q.x
+        op.scalar[1] = q.y
+        op.scalar[2] = q.z
+        op.scalar[3] = q.w
+        op.data = op.scalar
+        op.length = -1
+        op.step = 0
+        return None
+
+    if not PyObject_CheckBuffer(obj):
+        obj = Quaternion.to_buffer(obj)
+
+    view = obj
+    check_quadruples(view.shape[1])
+    op.length = view.shape[0]
+    op.step = 4
+    op.data = &view[0, 0] if op.length > 0 else op.scalar
+    return view
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef object _interpolate_many(object a, object b, object t, object out, bint spherical):
+    cdef _QuaternionOperand oa, ob
+    cdef DoubleOperand ot
+    keep_a = _quaternion_operand(a, &oa)
+    keep_b = _quaternion_operand(b, &ob)
+    keep_t = double_operand(t, &ot)
+    cdef Py_ssize_t n = resolve_length(broadcast_length(broadcast_length(oa.length, ob.length), ot.length))
+
+    if out is None:
+        from .quaternion_array import QuaternionArray # Imported lazily, quaternion_array depends on this module.
+        out = QuaternionArray.zeros(n)
+    cdef double[:, ::1] out_view = out
+    check_quadruples(out_view.shape[1])
+    check_length(n, out_view.shape[0])
+
+    cdef Py_ssize_t i
+    with nogil:
+        if spherical:
+            for i in range(n):
+                _slerp(oa.data + i * oa.step, ob.data + i * ob.step, cclamp01(ot.data[i * ot.step]), &out_view[i, 0])
+        else:
+            for i in range(n):
+                _nlerp(oa.data + i * oa.step, ob.data + i * ob.step, cclamp01(ot.data[i * ot.step]), &out_view[i, 0])
+    return out
+#endregion
+
+@cython.freelist(256)
+cdef class Quaternion:
+    identity = new_quaternion(0.0, 0.0, 0.0, 1.0)
+
+    def __init__(self, double x, double y, double z, double w):
+        # Quaternion(x, y, z, w)
+        self.x = x
+        self.y = y
+        self.z = z
+        self.w = w
+
+    #region Constructors
+    @staticmethod
+    def from_axis_angle(Vector3 axis, double angle):
+        # Counterclockwise in degrees
+        cdef double magnitude = magnitude3(axis.x, axis.y, axis.z)
+        if magnitude == 0.0:
+            raise ValueError("Axis must not be a zero vector.")
+
+        cdef double half = 0.5 * angle * _deg2rad
+        cdef double s = sin(half) / magnitude
+        return new_quaternion(axis.x * s, axis.y * s, axis.z * s, cos(half))
+
+    @staticmethod
+    def from_euler(Vector3 euler):
+        # Rotates around z first, then x and then y. Same as Quaternion.from_axis_angle(Vector3.up, y) * Quaternion.from_axis_angle(Vector3.right, x) * Quaternion.from_axis_angle(Vector3.forward, z)
+        cdef double half_x = 0.5 * euler.x * _deg2rad
+        cdef double half_y = 0.5 * euler.y * _deg2rad
+        cdef double half_z = 0.5 * euler.z * _deg2rad
+        cdef double cx = cos(half_x), sx = sin(half_x)
+        cdef double cy = cos(half_y), sy = sin(half_y)
+        cdef double cz = cos(half_z), sz = sin(half_z)
+
+        return new_quaternion(
+            cy * sx * cz + sy * cx * sz,
+            sy * cx * cz - cy * sx * sz,
+            cy * cx * sz - sy * sx * cz,
+            cy * cx * cz + sy * sx * sz
+        )
+    #endregion
+
+    def __getitem__(self, Py_ssize_t i):
+        # self[i]
+        if i == 0:
+            return self.x
+        if i == 1:
+            return self.y
+        if i == 2:
+            return self.z
+        if i == 3:
+            return self.w
+
+        raise IndexError(i)
+
+    def __repr__(self):
+        # repr(self)
+        return f"Quaternion({self.x}, {self.y}, {self.z}, {self.w})"
+
+    def __len__(self):
+        # len(self)
+        return 4
+
+    def __mul__(self, other):
+        # self * other
+        cdef Quaternion q
+        cdef Vector3 v
+        cdef double tx, ty, tz
+        if isinstance(other, Quaternion): # Applies other first and then self
+            q = <Quaternion>other
+            return new_quaternion(
+                self.w * q.x + self.x * q.w + self.y * q.z - self.z * q.y,
+                self.w * q.y - self.x * q.z + self.y * q.w + self.z * q.x,
+                self.w * q.z + self.x * q.y - self.y * q.x + self.z * q.w,
+                self.w * q.w - self.x * q.x - self.y * q.y - self.z * q.z
+            )
+        if isinstance(other, Vector3):
+            v = <Vector3>other
+            tx = 2.0 * (self.y * v.z - self.z * v.y) # t = 2 * cross(q.xyz, v)
+            ty = 2.0 * (self.z * v.x - self.x * v.z)
+            tz = 2.0 * (self.x * v.y - self.y * v.x)
+            return new_vector3( # v + q.w * t + cross(q.xyz, t)
+                v.x + self.w * tx + (self.y * tz - self.z * ty),
+                v.y + self.w * ty + (self.z * tx - self.x * tz),
+                v.z + self.w * tz + (self.x * ty - self.y * tx)
+            )
+        return NotImplemented
+
+    def __neg__(self):
+        # -self
+        return new_quaternion(-self.x, -self.y, -self.z, -self.w)
+
+    def __eq__(self, Quaternion other):
+        # self == other
+        return self.x == other.x and self.y == other.y and self.z == other.z and self.w == other.w
+
+    def __iter__(self):
+        # iter(self)
+        return iter((self.x, self.y, self.z, self.w))
+
+    def __hash__(self):
+        # Same as hash((self.x, self.y, self.z, self.w))
+        return hash4(self.x, self.y, self.z, self.w)
+
+    def __reduce__(self):
+        return (Quaternion, (self.x, self.y, self.z, self.w))
+
+    @property
+    def magnitude(self):
+        return sqrt(self.x * self.x + self.y * self.y + self.z * self.z + self.w * self.w)
+
+    @property
+    def normalized(self):
+        cdef double[4] q = [self.x, self.y, self.z, self.w]
+        _normalize(q)
+        return new_quaternion(q[0], q[1], q[2], q[3])
+
+    @property
+    def inverse(self):
+        cdef double sqr_magnitude = self.x * self.x + self.y * self.y + self.z * self.z + self.w * self.w
+        if sqr_magnitude == 0.0:
+            raise ValueError("Quaternion is not invertible.")
+        return new_quaternion(-self.x / sqr_magnitude, -self.y / sqr_magnitude, -self.z / sqr_magnitude, self.w / sqr_magnitude)
+
+    @staticmethod
+    def dot(Quaternion a, Quaternion b):
+        return a.x * b.x + a.y * b.y + a.z * b.z + a.w * b.w
+
+    @staticmethod
+    def angle(Quaternion a, Quaternion b):
+        cdef double dot = fabs(a.x * b.x + a.y * b.y + a.z * b.z + a.w * b.w)
+        if dot > 1.0: # Clamp, rounding errors might push the dot product of unit quaternions slightly over 1
+            dot = 1.0
+        return 2.0 * acos(dot) * _rad2deg
+
+    #region Interpolation
+    @staticmethod
+    def slerp(Quaternion a, Quaternion b, double t):
+        cdef double[4] qa = [a.x, a.y, a.z, a.w]
+        cdef double[4] qb = [b.x, b.y, b.z, b.w]
+        cdef double[4] out
+        _slerp(qa, qb, cclamp01(t), out)
+        return new_quaternion(out[0], out[1], out[2], out[3])
+
+    @staticmethod
+    def slerp_unclamped(Quaternion a, Quaternion b, double t):
+        cdef double[4] qa = [a.x, a.y, a.z, a.w]
+        cdef double[4] qb = [b.x, b.y, b.z, b.w]
+        cdef double[4] out
+        _slerp(qa, qb, t, out)
+        return new_quaternion(out[0], out[1], out[2], out[3])
+
+    @staticmethod
+    def nlerp(Quaternion a, Quaternion b, double t):
+        cdef double[4] qa = [a.x, a.y, a.z, a.w]
+        cdef double[4] qb = [b.x, b.y, b.z, b.w]
+        cdef double[4] out
+        _nlerp(qa, qb, cclamp01(t), out)
+        return new_quaternion(out[0], out[1], out[2], out[3])
+
+    @staticmethod
+    def slerp_many(a, b, t, out = None):
+        return _interpolate_many(a, b, t, out, True)
+
+    @staticmethod
+    def nlerp_many(a, b, t, out = None):
+        return _interpolate_many(a, b, t, out, False)
+    #endregion
+
+    def to_euler(self):
+        # Inverse of from_euler, the angles are wrapped into range [0, 360)
+        cdef double x = self.x, y = self.y, z = self.z, w = self.w
+        cdef double sin_x = -2.0 * (y * z - x * w)
+        cdef double cos_z_cos_x = 1.0 - 2.0 * (x * x + z * z)
+        cdef double sin_z_cos_x = 2.0 * (x * y + z * w)
+        cdef double cos_x = sqrt(sin_z_cos_x * sin_z_cos_x + cos_z_cos_x * cos_z_cos_x)
+
+        cdef double euler_x = atan2(sin_x, cos_x) # asin(sin_x) loses precision near the poles
+        cdef double euler_y, euler_z
+        if cos_x > 1e-9:
+            euler_y = atan2(2.0 * (x * z + y * w), 1.0 - 2.0 * (x * x + y * y))
+            euler_z = atan2(sin_z_cos_x, cos_z_cos_x)
+        else: # Gimbal lock, y and z rotate around the same axis. Put the whole rotation into y.
+            euler_y = atan2(-2.0 * (x * z - y * w), 1.0 - 2.0 * (y * y + z * z))
+            euler_z = 0.0
+
+        return new_vector3(_wrap_degrees(euler_x * _rad2deg), _wrap_degrees(euler_y * _rad2deg), _wrap_degrees(euler_z * _rad2deg))
+
+    def to_matrix(self):
+        cdef double x = self.x, y = self.y, z = self.z, w = self.w
+        cdef double[16] m = [
+            1.0 - 2.0 * (y * y + z * z), 2.0 * (x * y + z * w), 2.0 * (x * z - y * w), 0.0,
+            2.0 * (x * y - z * w), 1.0 - 2.0 * (x * x + z * z), 2.0 * (y * z + x * w), 0.0,
+            2.0 * (x * z + y * w), 2.0 * (y * z - x * w), 1.0 - 2.0 * (x * x + y * y), 0.0,
+            0.0, 0.0, 0.0, 1.0
+        ]
+        return new_matrix4x4(m)
+
+    @staticmethod
+    def from_buffer(const double[:, ::1] buffer):
+        check_quadruples(buffer.shape[1])
+        cdef Py_ssize_t i
+        return [new_quaternion(buffer[i, 0], buffer[i, 1], buffer[i, 2], buffer[i, 3]) for i in range(buffer.shape[0])]
+
+    @staticmethod
+    def to_buffer(quaternions, out = None):
+        if not isinstance(quaternions, (list, tuple)):
+            quaternions = list(quaternions)
+        cdef Py_ssize_t length = len(quaternions)
+
+        if out is None:
+            from .quaternion_array import QuaternionArray # Imported lazily, quaternion_array depends on this module.
+            out = QuaternionArray.zeros(length)
+        cdef double[:, ::1] view = out
+        check_quadruples(view.shape[1])
+        check_length(length, view.shape[0])
+
+        cdef Py_ssize_t i
+        cdef Quaternion q
+        for i in range(length):
+            q = <Quaternion?>quaternions[i]
+            view[i, 0] = q.x
+            view[i, 1] = q.y
+            view[i, 2] = q.z
+            view[i, 3] = q.w
+        return out
+
+    def to_tuple(self):
+        return (self.x, self.y, self.z, self.w)
@@ -0,0 +1,9 @@
+#cython: language_level=3
+
+cdef class QuaternionArray:
+    cdef double* _data # Interleaved x, y, z, w quadruples
+    cdef Py_ssize_t _length
+    cdef object _base # Owner of _data if this array is a view, None if this array owns its memory.
+
+    cdef Py_ssize_t _shape[2]
+    cdef Py_ssize_t _strides[2]
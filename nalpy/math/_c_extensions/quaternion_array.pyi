@@ -0,0 +1,67 @@
+from typing import Any, Iterable, Iterator, SupportsIndex, overload
+from typing_extensions import Buffer
+from .quaternion import Quaternion
+
+class QuaternionArray:
+    """
+    A mutable, fixed-length array of quaternions stored as contiguous ``(x, y, z, w)`` double quadruples.
+
+    Used as the result of ``Quaternion.slerp_many`` and ``Quaternion.nlerp_many``.
+
+    Supports the buffer protocol with shape ``(len(self), 4)`` and format ``"d"`` so that for example NumPy can view the data without copying.
+    """
+
+    def __init__(self, quaternions: Iterable[Quaternion | tuple[float, float, float, float]] = ()) -> None: ...
+
+    @staticmethod
+    def zeros(length: int) -> QuaternionArray:
+        """Create a new array of ``length`` zero quaternions."""
+        ...
+
+    @staticmethod
+    def identity(length: int) -> QuaternionArray:
+        """Create a new array of ``length`` identity rotations."""
+        ...
+
+    @staticmethod
+    def from_buffer(buffer: Buffer) -> QuaternionArray:
+        """Create a new array by copying a contiguous ``(n, 4)`` buffer of doubles, for example a NumPy array of shape ``(n, 4)``."""
+        ...
+
+    def __len__(self) -> int: ...
+
+    @overload
+    def __getitem__(self, index: SupportsIndex) -> Quaternion: ...
+    @overload
+    def __getitem__(self, index: slice) -> QuaternionArray:
+        """Slices are views that share memory with the original array. Only contiguous slices (step 1) are supported."""
+        ...
+
+    def __setitem__(self, index: SupportsIndex, value: Quaternion | tuple[float, float, float, float]) -> None: ...
+
+    def __iter__(self) -> Iterator[Quaternion]: ...
+
+    def __repr__(self) -> str: ...
+
+    def __eq__(self, other: object) -> bool: ...
+
+    def __buffer__(self, flags: int, /) -> memoryview: ...
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> Any:
+        """NumPy array of shape ``(len(self), 4)`` that shares memory with this array unless a copy is requested or required by ``dtype``. Raises ``ValueError`` if ``copy`` is ``False`` and ``dtype`` requires a copy."""
+        ...
+
+    @property
+    def normalized(self) -> QuaternionArray:
+        """A copy of this array where every quaternion has a magnitude of 1. Zero quaternions become identity rotations."""
+        ...
+
+    def normalize(self) -> None:
+        """Make every quaternion in this array have a magnitude of 1. Operates in place."""
+        ...
+
+    def copy(self) -> QuaternionArray:
+        """Make a new array that doesn't share memory with this array."""
+        ...
+
+    def to_list(self) -> list[Quaternion]: ...
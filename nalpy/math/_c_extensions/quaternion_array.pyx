@@ -0,0 +1,209 @@
+#cython: language_level=3
+
+cimport cython
+from cpython.buffer cimport PyBUF_FORMAT, PyBUF_ND, PyBUF_STRIDES
+from cpython.mem cimport PyMem_Calloc, PyMem_Free
+from libc.math cimport sqrt
+from libc.string cimport memcpy
+
+from ._batch cimport check_quadruples, numpy_array
+from .quaternion cimport Quaternion, new_quaternion
+
+#region Construction
+cdef inline void _set_length(QuaternionArray arr, Py_ssize_t length) noexcept:
+    arr._length = length
+    arr._shape[0] = length
+    arr._shape[1] = 4
+    arr._strides[0] = 4 * sizeof(double)
+    arr._strides[1] = sizeof(double)
+
+cdef QuaternionArray _new_array(Py_ssize_t length):
+    # Zero-initialized. Always allocates at least one quadruple so that _data is never NULL.
+    if length < 0:
+        raise ValueError("Length must be non-negative.")
+
+    cdef QuaternionArray arr = QuaternionArray.__new__(QuaternionArray)
+    arr._data = <double*>PyMem_Calloc(4 * (length if length > 0 else 1), sizeof(double))
+    if arr._data == NULL:
+        raise MemoryError()
+    _set_length(arr, length)
+    return arr
+
+cdef QuaternionArray _new_view(double* data, Py_ssize_t length, object base):
+    cdef QuaternionArray arr = QuaternionArray.__new__(QuaternionArray)
+    arr._data = data
+    arr._base = base
+    _set_length(arr, length)
+    return arr
+
+cdef Py_ssize_t _wrap_index(Py_ssize_t i, Py_ssize_t length) except -1:
+    if i < 0:
+        i += length
+    if i < 0 or i >= length:
+        raise IndexError("QuaternionArray index out of range")
+    return i
+
+cdef inline void _store(double* data, object value) except *:
+    cdef Quaternion q
+    if isinstance(value, Quaternion):
+        q = <Quaternion>value
+        data[0] = q.x
+        data[1] = q.y
+        data[2] = q.z
+        data[3] = q.w
+    else:
+        data[0], data[1], data[2], data[3] = value
+#endregion
+
+@cython.cdivision(True)
+cdef void _normalize_kernel(double* out, const double* a, Py_ssize_t length) noexcept nogil:
+    cdef Py_ssize_t i
+    cdef double magnitude
+    for i in range(length):
+        magnitude = sqrt(a[4 * i] * a[4 * i] + a[4 * i + 1] * a[4 * i + 1] + a[4 * i + 2] * a[4 * i + 2] + a[4 * i + 3] * a[4 * i + 3])
+        if magnitude == 0.0: # Same as Quaternion.normalized
+            out[4 * i] = 0.0
+            out[4 * i + 1] = 0.0
+            out[4 * i + 2] = 0.0
+            out[4 * i + 3] = 1.0
+        else:
+            out[4 * i] = a[4 * i] / magnitude
+            out[4 * i + 1] = a[4 * i + 1] / magnitude
+            out[4 * i + 2] = a[4 * i + 2] / magnitude
+            out[4 * i + 3] = a[4 * i + 3] / magnitude
+
+cdef class QuaternionArray:
+    def __init__(self, quaternions = ()):
+        # QuaternionArray(quaternions)
+        cdef list items = list(quaternions)
+        cdef Py_ssize_t length = len(items)
+
+        if self._data != NULL: # Slices and exported buffers point into _data, it can't be replaced
+            raise RuntimeError("QuaternionArray is already initialized.")
+        self._data = <double*>PyMem_Calloc(4 * (length if length > 0 else 1), sizeof(double))
+        if self._data == NULL:
+            raise MemoryError()
+        _set_length(self, length)
+
+        cdef Py_ssize_t i
+        for i in range(length):
+            _store(self._data + 4 * i, items[i])
+
+    def __dealloc__(self):
+        if self._base is None:
+            PyMem_Free(self._data)
+
+    @staticmethod
+    def zeros(Py_ssize_t length):
+        return _new_array(length)
+
+    @staticmethod
+    def identity(Py_ssize_t length):
+        cdef QuaternionArray out = _new_array(length)
+        cdef Py_ssize_t i
+        for i in range(length):
+            out._data[4 * i + 3] = 1.0
+        return out
+
+    @staticmethod
+    def from_buffer(const double[:, ::1] buffer):
+        check_quadruples(buffer.shape[1])
+        cdef QuaternionArray out = _new_array(buffer.shape[0])
+        if out._length > 0:
+            memcpy(out._data, &buffer[0, 0], out._length * 4 * sizeof(double))
+        return out
+
+    def __getbuffer__(self, Py_buffer* buffer, int flags):
+        buffer.buf = <void*>self._data
+        buffer.obj = self
+        buffer.len = self._length * 4 * sizeof(double)
+        buffer.readonly = 0
+        buffer.itemsize = sizeof(double)
+        buffer.format = NULL
+        if (flags & PyBUF_FORMAT) == PyBUF_FORMAT:
+            buffer.format = "d"
+        buffer.ndim = 2
+        buffer.shape = NULL
+        if (flags & PyBUF_ND) == PyBUF_ND:
+            buffer.shape = self._shape
+        buffer.strides = NULL
+        if (flags & PyBUF_STRIDES) == PyBUF_STRIDES:
+            buffer.strides = self._strides
+        buffer.suboffsets = NULL
+        buffer.internal = NULL
+
+    def __releasebuffer__(self, Py_buffer* buffer):
+        pass
+
+    def __array__(self, dtype = None, copy = None):
+        return numpy_array(self, dtype, copy)
+
+    def __len__(self):
+        # len(self)
+        return self._length
+
+    def __getitem__(self, index):
+        # self[index]
+        cdef Py_ssize_t start, stop, step
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._length)
+            if step != 1:
+                raise ValueError("QuaternionArray slices must be contiguous.")
+            if stop < start:
+                stop = start
+            return _new_view(self._data + 4 * start, stop - start, self) # Slices share memory with self
+
+        cdef Py_ssize_t i = _wrap_index(index, self._length)
+        return new_quaternion(self._data[4 * i], self._data[4 * i + 1], self._data[4 * i + 2], self._data[4 * i + 3])
+
+    def __setitem__(self, index, value):
+        # self[index] = value
+        cdef Py_ssize_t i = _wrap_index(index, self._length)
+        _store(self._data + 4 * i, value)
+
+    def __iter__(self):
+        # iter(self)
+        cdef Py_ssize_t i
+        for i in range(self._length):
+            yield new_quaternion(self._data[4 * i], self._data[4 * i + 1], self._data[4 * i + 2], self._data[4 * i + 3])
+
+    def __repr__(self):
+        # repr(self)
+        return f"QuaternionArray([{', '.join([repr(q) for q in self])}])"
+
+    def __eq__(self, other):
+        # self == other
+        if not isinstance(other, QuaternionArray):
+            return NotImplemented
+
+        cdef QuaternionArray arr = <QuaternionArray>other
+        if arr._length != self._length:
+            return False
+
+        cdef Py_ssize_t i
+        for i in range(4 * self._length):
+            if self._data[i] != arr._data[i]:
+                return False
+        return True
+
+    # NOTE: Object is mutable, do not implement __hash__
+
+    @property
+    def normalized(self):
+        cdef QuaternionArray out = _new_array(self._length)
+        with nogil:
+            _normalize_kernel(out._data, self._data, self._length)
+        return out
+
+    def normalize(self):
+        with nogil:
+            _normalize_kernel(self._data, self._data, self._length)
+
+    def copy(self):
+        cdef QuaternionArray out = _new_array(self._length)
+        memcpy(out._data, self._data, self._length * 4 * sizeof(double))
+        return out
+
+    def to_list(self):
+        cdef Py_ssize_t i
+        return [new_quaternion(self._data[4 * i], self._data[4 * i + 1], self._data[4 * i + 2], self._data[4 * i + 3]) for i in range(self._length)]
@@ -0,0 +1,16 @@
+#cython: language_level=3
+
+cdef class Rect:
+    cdef readonly double x
+    cdef readonly double y
+    cdef readonly double w
+    cdef readonly double h
+
+cdef inline Rect new_rect(double x, double y, double w, double h):
+    # Rect(x, y, w, h) without the overhead of calling __init__ through Python
+    cdef Rect r = Rect.__new__(Rect)
+    r.x = x
+    r.y = y
+    r.w = w
+    r.h = h
+    return r
@@ -0,0 +1,110 @@
+from typing import Any, ClassVar, Iterator, SupportsIndex, final, overload
+from .mvector2 import MVector2
+from .vector2 import Vector2
+
+@final
+class Rect:
+    """
+    A 2D Rectangle defined by X and Y position, width and height.
+
+    The functionality of this rect depends on the coordinate space used.
+    When X increases to the right and Y increases upwards, position represents the bottom-left corner of the rectangle.
+    When X increases to the right and Y increases downwards, position represents the top-left corner of the rectange.
+
+    Behaves like a ``tuple[float, float, float, float]`` of ``(x, y, w, h)``: supports indexing, unpacking, ``len``, comparison with tuples and the ``NamedTuple`` helpers ``_fields``, ``_asdict`` and ``_replace``.
+    """
+
+    _fields: ClassVar[tuple[str, str, str, str]]
+
+    def __init__(self, x: float, y: float, w: float, h: float) -> None: ...
+
+    @property
+    def x(self) -> float: ...
+    @property
+    def y(self) -> float: ...
+    @property
+    def w(self) -> float: ...
+    @property
+    def h(self) -> float: ...
+
+    @staticmethod
+    def zero() -> Rect:
+        """Shorthand for ``math.Rect(0.0, 0.0, 0.0, 0.0)``"""
+        ...
+
+    @staticmethod
+    def from_pos(position: Vector2, size: Vector2) -> Rect: ...
+
+    @staticmethod
+    def from_center(center: Vector2, size: Vector2) -> Rect: ...
+
+    @staticmethod
+    def from_min_max(xmin: float, ymin: float, xmax: float, ymax: float) -> Rect: ...
+
+    @staticmethod
+    def from_min_max_vectors(min: Vector2, max: Vector2) -> Rect: ...
+
+    def __repr__(self) -> str: ...
+
+    def __len__(self) -> int: ...
+
+    @overload
+    def __getitem__(self, index: SupportsIndex) -> float: ...
+    @overload
+    def __getitem__(self, index: slice) -> tuple[float, ...]: ...
+
+    def __iter__(self) -> Iterator[float]: ...
+
+    def __eq__(self, other: object) -> bool: ...
+
+    def __hash__(self) -> int: ...
+
+    def _asdict(self) -> dict[str, float]: ...
+
+    def _replace(self, **changes: Any) -> Rect: ...
+
+    @property
+    def center(self) -> Vector2: ...
+    @property
+    def xcenter(self) -> float: ...
+    @property
+    def ycenter(self) -> float: ...
+
+    @property
+    def min(self) -> Vector2:
+        """Same as `Rect.position`"""
+        ...
+    @property
+    def xmin(self) -> float:
+        """Same as `Rect.x`"""
+        ...
+    @property
+    def ymin(self) -> float:
+        """Same as `Rect.y`"""
+        ...
+
+    @property
+    def max(self) -> Vector2: ...
+    @property
+    def xmax(self) -> float: ...
+    @property
+    def ymax(self) -> float: ...
+
+    @property
+    def position(self) -> Vector2: ...
+    @property
+    def size(self) -> Vector2: ...
+
+    def contains(self, point: Vector2 | MVector2) -> bool: ...
+
+    def overlaps(self, other: Rect) -> bool: ...
+
+    @staticmethod
+    def normalized_to_point(rect: Rect, normalized_rect_coordinates: Vector2) -> Vector2: ...
+
+    @staticmethod
+    def point_to_normalized(rect: Rect, point: Vector2) -> Vector2: ...
+
+    def to_tuple(self) -> tuple[float, float, float, float]: ...
+    def to_int_tuple(self) -> tuple[int, int, int, int]: ...
+    def to_float_dict(self) -> dict[str, float]: ...
@@ -0,0 +1,184 @@
+#cython: language_level=3
+
+cimport cython
+from libc.math cimport rint
+
+from ._hash cimport hash4
+from .functions cimport clerp, cinverse_lerp
+from .vector2 cimport Vector2, new_vector2
+
+cdef Rect _zero # Returned by Rect.zero(), assigned after the class has been created
+
+@cython.freelist(256)
+cdef class Rect:
+    _fields = ("x", "y", "w", "h") # NamedTuple compatibility
+
+    def __init__(self, double x, double y, double w, double h):
+        # Rect(x, y, w, h)
+        self.x = x
+        self.y = y
+        self.w = w
+        self.h = h
+
+    @staticmethod
+    def zero():
+        return _zero # Returning single instance, because Rect is immutable
+
+    #region Constructors
+    @staticmethod
+    def from_pos(Vector2 position, Vector2 size):
+        return new_rect(position.x, position.y, size.x, size.y)
+
+    @staticmethod
+    def from_center(Vector2 center, Vector2 size):
+        return new_rect(center.x - (size.x / 2.0), center.y - (size.y / 2.0), size.x, size.y)
+
+    @staticmethod
+    def from_min_max(double xmin, double ymin, double xmax, double ymax):
+        return new_rect(xmin, ymin, xmax - xmin, ymax - ymin)
+
+    @staticmethod
+    def from_min_max_vectors(Vector2 min, Vector2 max):
+        return new_rect(min.x, min.y, max.x - min.x, max.y - min.y)
+    #endregion
+
+    #region Tuple compatibility
+    def __repr__(self):
+        # repr(self)
+        return f"Rect({self.x}, {self.y}, {self.w}, {self.h})"
+
+    def __len__(self):
+        # len(self)
+        return 4
+
+    def __getitem__(self, index):
+        # self[index]
+        return (self.x, self.y, self.w, self.h)[index]
+
+    def __iter__(self):
+        # iter(self)
+        return iter((self.x, self.y, self.w, self.h))
+
+    def __eq__(self, other):
+        # self == other
+        cdef Rect r
+        if isinstance(other, Rect):
+            r = <Rect>other
+            return self.x == r.x and self.y == r.y and self.w == r.w and self.h == r.h
+        if isinstance(other, tuple):
+            return (self.x, self.y, self.w, self.h) == other
+        return NotImplemented
+
+    def __hash__(self):
+        # Equal to the hash of the corresponding tuple, because rects compare equal to tuples.
+        return hash4(self.x, self.y, self.w, self.h)
+
+    def __reduce__(self):
+        return (Rect, (self.x, self.y, self.w, self.h))
+
+    def _asdict(self):
+        return {"x": self.x, "y": self.y, "w": self.w, "h": self.h}
+
+    def _replace(self, **changes):
+        cdef Rect r = new_rect(changes.pop("x", self.x), changes.pop("y", self.y), changes.pop("w", self.w), changes.pop("h", self.h))
+        if changes:
+            raise ValueError(f"Got unexpected field names: {list(changes)!r}")
+        return r
+    #endregion
+
+    #region Properties
+    @property
+    def center(self):
+        return new_vector2(self.x + (self.w / 2.0), self.y + (self.h / 2.0))
+    @property
+    def xcenter(self):
+        return self.x + (self.w / 2.0)
+    @property
+    def ycenter(self):
+        return self.y + (self.h / 2.0)
+
+    @property
+    def min(self):
+        return new_vector2(self.x, self.y)
+    @property
+    def xmin(self):
+        return self.x
+    @property
+    def ymin(self):
+        return self.y
+
+    @property
+    def max(self):
+        return new_vector2(self.x + self.w, self.y + self.h)
+    @property
+    def xmax(self):
+        return self.x + self.w
+    @property
+    def ymax(self):
+        return self.y + self.h
+
+    @property
+    def position(self):
+        return new_vector2(self.x, self.y)
+    @property
+    def size(self):
+        return new_vector2(self.w, self.h)
+    #endregion
+
+    #region Collisions
+    def contains(self, point):
+        cdef Vector2 vec
+        if isinstance(point, Vector2):
+            vec = <Vector2>point
+            return (vec.x >= self.x) and (vec.x < self.x + self.w) and (vec.y >= self.y) and (vec.y < self.y + self.h)
+        # Duck-typed like the NamedTuple version, mutable vectors and anything else with x and y
+        return (point.x >= self.x) and (point.x < self.x + self.w) and (point.y >= self.y) and (point.y < self.y + self.h)
+
+    def overlaps(self, other):
+        cdef Rect rect
+        if isinstance(other, Rect):
+            rect = <Rect>other
+            return (
+                rect.x + rect.w > self.x and
+                rect.x          < self.x + self.w and
+                rect.y + rect.h > self.y and
+                rect.y          < self.y + self.h
+            )
+        # Duck-typed like the NamedTuple version, anything with x, y, xmax and ymax
+        return (
+            other.xmax > self.x and
+            other.x    < self.x + self.w and
+            other.ymax > self.y and
+            other.y    < self.y + self.h
+        )
+    #endregion
+
+    #region Normalization
+    @staticmethod
+    def normalized_to_point(Rect rect, Vector2 normalized_rect_coordinates):
+        return new_vector2(
+            clerp(rect.x, rect.x + rect.w, normalized_rect_coordinates.x),
+            clerp(rect.y, rect.y + rect.h, normalized_rect_coordinates.y)
+        )
+
+    @staticmethod
+    def point_to_normalized(Rect rect, Vector2 point):
+        return new_vector2(
+            cinverse_lerp(rect.x, rect.x + rect.w, point.x),
+            cinverse_lerp(rect.y, rect.y + rect.h, point.y)
+        )
+    #endregion
+
+    #region Conversions
+    def to_tuple(self):
+        return (self.x, self.y, self.w, self.h)
+
+    def to_int_tuple(self):
+        # rint rounds half to even like Python's round()
+        return (int(rint(self.x)), int(rint(self.y)), int(rint(self.w)), int(rint(self.h)))
+
+    def to_float_dict(self):
+        return {"x": self.x, "y": self.y, "w": self.w, "h": self.h}
+    #endregion
+
+_zero = new_rect(0.0, 0.0, 0.0, 0.0)
@@ -0,0 +1,110 @@
+from typing import Any, Iterable, Iterator, SupportsIndex, TypeAlias, overload
+from typing_extensions import Buffer
+from .rect import Rect
+from .vector2 import Vector2
+
+_RectOperand: TypeAlias = RectArray | Rect | Buffer | Iterable[Rect | tuple[float, float, float, float]]
+"""A single ``Rect`` that is broadcast, an ``(n, 4)`` contiguous buffer of doubles or an iterable of rects."""
+_PointOperand: TypeAlias = Vector2 | Buffer
+"""A single ``Vector2`` that is broadcast or an ``(n, 2)`` contiguous buffer of doubles, for example a ``Vector2Array``."""
+
+class RectArray:
+    """
+    A mutable, fixed-length array of rects stored as contiguous ``(x, y, w, h)`` double quadruples.
+
+    Supports the buffer protocol with shape ``(len(self), 4)`` and format ``"d"`` so that for example NumPy can view the data without copying.
+    """
+
+    def __init__(self, rects: Iterable[Rect | tuple[float, float, float, float]] = ()) -> None: ...
+
+    @staticmethod
+    def zeros(length: int) -> RectArray:
+        """Create a new array of ``length`` zero rects."""
+        ...
+
+    @staticmethod
+    def from_buffer(buffer: Buffer) -> RectArray:
+        """Create a new array by copying a contiguous ``(n, 4)`` buffer of doubles, for example a NumPy array of shape ``(n, 4)``."""
+        ...
+
+    def __len__(self) -> int: ...
+
+    @overload
+    def __getitem__(self, index: SupportsIndex) -> Rect: ...
+    @overload
+    def __getitem__(self, index: slice) -> RectArray:
+        """Slices are views that share memory with the original array. Only contiguous slices (step 1) are supported."""
+        ...
+
+    def __setitem__(self, index: SupportsIndex, value: Rect | tuple[float, float, float, float]) -> None: ...
+
+    def __iter__(self) -> Iterator[Rect]: ...
+
+    def __repr__(self) -> str: ...
+
+    def __eq__(self, other: object) -> bool: ...
+
+    def __buffer__(self, flags: int, /) -> memoryview: ...
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> Any:
+        """NumPy array of shape ``(len(self), 4)`` that shares memory with this array unless a copy is requested or required by ``dtype``. Raises ``ValueError`` if ``copy`` is ``False`` and ``dtype`` requires a copy."""
+        ...
+
+    def copy(self) -> RectArray:
+        """Make a new array that doesn't share memory with this array."""
+        ...
+
+    def to_list(self) -> list[Rect]: ...
+
+    # Batched rect operations.
+    # Results are written into ``out`` if given (any writable contiguous buffer of the right shape, may be one of the inputs), otherwise a new buffer is allocated.
+    # Rect results are returned as ``RectArray``, areas as ``array.array("d")`` and tests as ``bytearray`` of 0 and 1.
+    # Rects with a width or height that isn't positive are empty. They have no area and are ignored by ``union`` and ``merge_overlapping``.
+    @staticmethod
+    def intersect(a: _RectOperand, b: _RectOperand, out: Buffer | None = None) -> Buffer:
+        """The overlapping region of each pair of rects. Pairs that don't overlap result in a rect with zero width and height."""
+        ...
+
+    @staticmethod
+    def union(a: _RectOperand, b: _RectOperand, out: Buffer | None = None) -> Buffer:
+        """The smallest rect that contains both rects of each pair."""
+        ...
+
+    @staticmethod
+    def clip_to(rects: _RectOperand, bounds: _RectOperand) -> RectArray:
+        """
+        The part of each rect that is inside ``bounds``, usually a single viewport rect.
+
+        Unlike ``intersect``, rects that are completely outside of ``bounds`` are dropped so the result can be shorter than ``rects``.
+        """
+        ...
+
+    @staticmethod
+    def overlaps_any(rects: _RectOperand, others: _RectOperand, out: Buffer | None = None) -> Buffer:
+        """For each rect, whether it overlaps any of ``others`` as defined by ``Rect.overlaps``."""
+        ...
+
+    @staticmethod
+    def contains_points(rects: _RectOperand, points: _PointOperand, out: Buffer | None = None) -> Buffer:
+        """Batched ``Rect.contains``."""
+        ...
+
+    @staticmethod
+    def area(rects: _RectOperand, out: Buffer | None = None) -> Buffer:
+        """The area of each rect."""
+        ...
+
+    @staticmethod
+    def total_area(rects: _RectOperand) -> float:
+        """The sum of the areas of all rects. Regions covered by multiple rects are counted multiple times."""
+        ...
+
+    @staticmethod
+    def merge_overlapping(rects: _RectOperand) -> RectArray:
+        """
+        Replace overlapping rects with their union until no two rects overlap. Empty rects are dropped.
+
+        Used to coalesce dirty regions so that every pixel is redrawn at most once.
+        The result can cover some area that none of the original rects did, compare ``total_area`` of the input and the output to decide if merging is worth it.
+        """
+        ...
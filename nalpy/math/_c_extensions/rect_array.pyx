@@ -0,0 +1,407 @@
+#cython: language_level=3
+
+cimport cython
+from cpython.buffer cimport PyBUF_FORMAT, PyBUF_ND, PyBUF_STRIDES, PyObject_CheckBuffer
+from cpython.mem cimport PyMem_Calloc, PyMem_Malloc, PyMem_Free
+from libc.string cimport memcpy
+
+from ._batch cimport broadcast_length, resolve_length, check_length, check_pairs, check_quadruples, new_double_array, numpy_array
+from ._rect_kernels cimport rect_contains, rect_area, rect_intersect, rect_union, rect_empty, sort_by_x, overlaps_sorted, merge_overlapping
+from .rect cimport Rect, new_rect
+from .vector2 cimport Vector2
+
+cdef struct _RectOperand:
+    const double* data
+    Py_ssize_t length # -1 when a single rect is broadcast
+    Py_ssize_t step # 0 when a single rect is broadcast
+    double scalar[4]
+
+cdef struct _PointOperand:
+    const double* data
+    Py_ssize_t length # -1 when a single point is broadcast
+    Py_ssize_t step # 0 when a single point is broadcast
+    double scalar[2]
+
+#region Construction
+cdef inline void _set_length(RectArray arr, Py_ssize_t length) noexcept:
+    arr._length = length
+    arr._shape[0] = length
+    arr._shape[1] = 4
+    arr._strides[0] = 4 * sizeof(double)
+    arr._strides[1] = sizeof(double)
+
+cdef RectArray _new_array(Py_ssize_t length):
+    # Zero-initialized. Always allocates at least one quadruple so that _data is never NULL.
+    if length < 0:
+        raise ValueError("Length must be non-negative.")
+
+    cdef RectArray arr = RectArray.__new__(RectArray)
+    arr._data = <double*>PyMem_Calloc(4 * (length if length > 0 else 1), sizeof(double))
+    if arr._data == NULL:
+        raise MemoryError()
+    _set_length(arr, length)
+    return arr
+
+cdef RectArray _new_view(double* data, Py_ssize_t length, object base):
+    cdef RectArray arr = RectArray.__new__(RectArray)
+    arr._data = data
+    arr._base = base
+    _set_length(arr, length)
+    return arr
+
+cdef Py_ssize_t _wrap_index(Py_ssize_t i, Py_ssize_t length) except -1:
+    if i < 0:
+        i += length
+    if i < 0 or i >= length:
+        raise IndexError("RectArray index out of range")
+    return i
+
+cdef inline void _store(double* data, object value) except *:
+    cdef Rect r
+    if isinstance(value, Rect):
+        r = <Rect>value
+        data[0] = r.x
+        data[1] = r.y
+        data[2] = r.w
+        data[3] = r.h
+    else:
+        data[0], data[1], data[2], data[3] = value
+#endregion
+
+#region Operands
+cdef object _rect_operand(object obj, _RectOperand* op):
+    # Accepts a Rect, any (n, 4) contiguous buffer of doubles or an iterable of rects.
+    # Returns the object that owns op.data. It must be kept alive while op is in use.
+    cdef Rect r
+    cdef const double[:, ::1] view
+    if isinstance(obj, Rect):
+        r = <Rect>obj
+        op.scalar[0] = r.x
+        op.scalar[1] = r.y
+        op.scalar[2] = r.w
+        op.scalar[3] = r.h
+        op.data = op.scalar
+        op.length = -1
+        op.step = 0
+        return None
+
+    if not PyObject_CheckBuffer(obj):
+        obj = RectArray(obj)
+
+    view = obj
+    check_quadruples(view.shape[1])
+    op.length = view.shape[0]
+    op.step = 4
+    op.data = &view[0, 0] if op.length > 0 else op.scalar
+    return view
+
+cdef object _point_operand(object obj, _PointOperand* op):
+    # Accepts a Vector2 or any (n, 2) contiguous buffer of doubles, for example a Vector2Array.
+    cdef Vector2 vec
+    cdef const double[:, ::1] view
+    if isinstance(obj, Vector2):
+        vec = <Vector2>obj
+        op.scalar[0] = vec.x
+        op.scalar[1] = vec.y
+        op.data = op.scalar
+        op.length = -1
+        op.step = 0
+        return None
+
+    view = obj
+    check_pairs(view.shape[1])
+    op.length = view.shape[0]
+    op.step = 2
+    op.data = &view[0, 0] if op.length > 0 else op.scalar
+    return view
+
+cdef double[:, ::1] _rect_output(object out, Py_ssize_t length):
+    cdef double[:, ::1] view = out
+    if view.shape[1] != 4:
+        raise ValueError(f"Expected an output buffer of shape (n, 4), got (n, {view.shape[1]}).")
+    check_length(length, view.shape[0])
+    return view
+
+cdef unsigned char[::1] _bool_output(object out, Py_ssize_t length):
+    cdef unsigned char[::1] view = out
+    check_length(length, view.shape[0])
+    return view
+#endregion
+
+cdef class RectArray:
+    def __init__(self, rects = ()):
+        # RectArray(rects)
+        cdef list items = list(rects)
+        cdef Py_ssize_t length = len(items)
+
+        if self._data != NULL: # Slices and exported buffers point into _data, it can't be replaced
+            raise RuntimeError("RectArray is already initialized.")
+        self._data = <double*>PyMem_Calloc(4 * (length if length > 0 else 1), sizeof(double))
+        if self._data == NULL:
+            raise MemoryError()
+        _set_length(self, length)
+
+        cdef Py_ssize_t i
+        for i in range(length):
+            _store(self._data + 4 * i, items[i])
+
+    def __dealloc__(self):
+        if self._base is None:
+            PyMem_Free(self._data)
+
+    @staticmethod
+    def zeros(Py_ssize_t length):
+        return _new_array(length)
+
+    @staticmethod
+    def from_buffer(const double[:, ::1] buffer):
+        check_quadruples(buffer.shape[1])
+        cdef RectArray out = _new_array(buffer.shape[0])
+        if out._length > 0:
+            memcpy(out._data, &buffer[0, 0], out._length * 4 * sizeof(double))
+        return out
+
+    def __getbuffer__(self, Py_buffer* buffer, int flags):
+        buffer.buf = <void*>self._data
+        buffer.obj = self
+        buffer.len = self._length * 4 * sizeof(double)
+        buffer.readonly = 0
+        buffer.itemsize = sizeof(double)
+        buffer.format = NULL
+        if (flags & PyBUF_FORMAT) == PyBUF_FORMAT:
+            buffer.format = "d"
+        buffer.ndim = 2
+        buffer.shape = NULL
+        if (flags & PyBUF_ND) == PyBUF_ND:
+            buffer.shape = self._shape
+        buffer.strides = NULL
+        if (flags & PyBUF_STRIDES) == PyBUF_STRIDES:
+            buffer.strides = self._strides
+        buffer.suboffsets = NULL
+        buffer.internal = NULL
+
+    def __releasebuffer__(self, Py_buffer* buffer):
+        pass
+
+    def __array__(self, dtype = None, copy = None):
+        return numpy_array(self, dtype, copy)
+
+    def __len__(self):
+        # len(self)
+        return self._length
+
+    def __getitem__(self, index):
+        # self[index]
+        cdef Py_ssize_t start, stop, step
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._length)
+            if step != 1:
+                raise ValueError("RectArray slices must be contiguous.")
+            if stop < start:
+                stop = start
+            return _new_view(self._data + 4 * start, stop - start, self) # Slices share memory with self
+
+        cdef Py_ssize_t i = _wrap_index(index, self._length)
+        return new_rect(self._data[4 * i], self._data[4 * i + 1], self._data[4 * i + 2], self._data[4 * i + 3])
+
+    def __setitem__(self, index, value):
+        # self[index] = value
+        cdef Py_ssize_t i = _wrap_index(index, self._length)
+        _store(self._data + 4 * i, value)
+
+    def __iter__(self):
+        # iter(self)
+        cdef Py_ssize_t i
+        for i in range(self._length):
+            yield new_rect(self._data[4 * i], self._data[4 * i + 1], self._data[4 * i + 2], self._data[4 * i + 3])
+
+    def __repr__(self):
+        # repr(self)
+        return f"RectArray([{', '.join([repr(r) for r in self])}])"
+
+    def __eq__(self, other):
+        # self == other
+        if not isinstance(other, RectArray):
+            return NotImplemented
+
+        cdef RectArray arr = <RectArray>other
+        if arr._length != self._length:
+            return False
+
+        cdef Py_ssize_t i
+        for i in range(4 * self._length):
+            if self._data[i] != arr._data[i]:
+                return False
+        return True
+
+    # NOTE: Object is mutable, do not implement __hash__
+
+    def copy(self):
+        cdef RectArray out = _new_array(self._length)
+        memcpy(out._data, self._data, self._length * 4 * sizeof(double))
+        return out
+
+    def to_list(self):
+        cdef Py_ssize_t i
+        return [new_rect(self._data[4 * i], self._data[4 * i + 1], self._data[4 * i + 2], self._data[4 * i + 3]) for i in range(self._length)]
+
+    #region Batched math
+    # Each rect argument can be a RectArray, an (n, 4) buffer of doubles or a single Rect that is broadcast.
+    # Results are written into out, which is allocated if not given.
+    @staticmethod
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def intersect(a, b, out = None):
+        cdef _RectOperand ra, rb
+        keep_a = _rect_operand(a, &ra)
+        keep_b = _rect_operand(b, &rb)
+        cdef Py_ssize_t n = resolve_length(broadcast_length(ra.length, rb.length))
+        if out is None:
+            out = _new_array(n)
+        cdef double[:, ::1] out_view = _rect_output(out, n)
+
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(n):
+                rect_intersect(ra.data + i * ra.step, rb.data + i * rb.step, &out_view[i, 0])
+        return out
+
+    @staticmethod
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def union(a, b, out = None):
+        cdef _RectOperand ra, rb
+        keep_a = _rect_operand(a, &ra)
+        keep_b = _rect_operand(b, &rb)
+        cdef Py_ssize_t n = resolve_length(broadcast_length(ra.length, rb.length))
+        if out is None:
+            out = _new_array(n)
+        cdef double[:, ::1] out_view = _rect_output(out, n)
+
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(n):
+                rect_union(ra.data + i * ra.step, rb.data + i * rb.step, &out_view[i, 0])
+        return out
+
+    @staticmethod
+    def clip_to(rects, bounds):
+        cdef _RectOperand rr, rb
+        keep_rects = _rect_operand(rects, &rr)
+        keep_bounds = _rect_operand(bounds, &rb)
+        cdef Py_ssize_t n = resolve_length(broadcast_length(rr.length, rb.length))
+        cdef RectArray out = _new_array(n)
+
+        cdef Py_ssize_t i
+        cdef Py_ssize_t count = 0
+        with nogil:
+            for i in range(n):
+                rect_intersect(rr.data + i * rr.step, rb.data + i * rb.step, out._data + 4 * count)
+                if not rect_empty(out._data + 4 * count): # Rects outside of bounds are dropped
+                    count += 1
+        _set_length(out, count)
+        return out
+
+    @staticmethod
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def overlaps_any(rects, others, out = None):
+        cdef _RectOperand rr, ro
+        keep_rects = _rect_operand(rects, &rr)
+        keep_others = _rect_operand(others, &ro)
+        cdef Py_ssize_t n = resolve_length(rr.length)
+        cdef Py_ssize_t m = ro.length if ro.length != -1 else 1
+        if out is None:
+            out = bytearray(n)
+        cdef unsigned char[::1] out_view = _bool_output(out, n)
+
+        # Sorting the others by x lets every rect skip the ones that can't reach it
+        cdef double* sorted_others = <double*>PyMem_Malloc(4 * (m if m > 0 else 1) * sizeof(double))
+        if sorted_others == NULL:
+            raise MemoryError()
+        memcpy(sorted_others, ro.data, 4 * m * sizeof(double))
+
+        cdef Py_ssize_t i
+        cdef double max_w = 0.0
+        try:
+            with nogil:
+                sort_by_x(sorted_others, m)
+                for i in range(m):
+                    if i == 0 or sorted_others[4 * i + 2] > max_w:
+                        max_w = sorted_others[4 * i + 2]
+                for i in range(n):
+                    out_view[i] = overlaps_sorted(rr.data + 4 * i, sorted_others, m, max_w)
+        finally:
+            PyMem_Free(sorted_others)
+        return out
+
+    @staticmethod
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def contains_points(rects, points, out = None):
+        cdef _RectOperand rr
+        cdef _PointOperand pp
+        keep_rects = _rect_operand(rects, &rr)
+        keep_points = _point_operand(points, &pp)
+        cdef Py_ssize_t n = resolve_length(broadcast_length(rr.length, pp.length))
+        if out is None:
+            out = bytearray(n)
+        cdef unsigned char[::1] out_view = _bool_output(out, n)
+
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(n):
+                out_view[i] = rect_contains(rr.data + i * rr.step, pp.data[i * pp.step], pp.data[i * pp.step + 1])
+        return out
+
+    @staticmethod
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def area(rects, out = None):
+        cdef _RectOperand rr
+        keep_rects = _rect_operand(rects, &rr)
+        cdef Py_ssize_t n = resolve_length(rr.length)
+        if out is None:
+            out = new_double_array(n)
+        cdef double[::1] out_view = out
+        check_length(n, out_view.shape[0])
+
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(n):
+                out_view[i] = rect_area(rr.data + 4 * i)
+        return out
+
+    @staticmethod
+    def total_area(rects):
+        cdef _RectOperand rr
+        keep_rects = _rect_operand(rects, &rr)
+        cdef Py_ssize_t n = resolve_length(rr.length)
+
+        cdef Py_ssize_t i
+        cdef double total = 0.0
+        with nogil:
+            for i in range(n):
+                total += rect_area(rr.data + 4 * i)
+        return total
+
+    @staticmethod
+    def merge_overlapping(rects):
+        cdef _RectOperand rr
+        keep_rects = _rect_operand(rects, &rr)
+        cdef Py_ssize_t n = resolve_length(rr.length)
+        cdef RectArray out = _new_array(n)
+        memcpy(out._data, rr.data, 4 * n * sizeof(double))
+
+        cdef Py_ssize_t* active = <Py_ssize_t*>PyMem_Malloc((n if n > 0 else 1) * sizeof(Py_ssize_t))
+        if active == NULL:
+            raise MemoryError()
+        cdef Py_ssize_t count
+        try:
+            with nogil:
+                count = merge_overlapping(out._data, n, active)
+        finally:
+            PyMem_Free(active)
+        _set_length(out, count)
+        return out
+    #endregion
@@ -0,0 +1,29 @@
+#cython: language_level=3
+
+ctypedef long long int _RI_int_t
+
+cdef class RectInt:
+    cdef readonly _RI_int_t x
+    cdef readonly _RI_int_t y
+    cdef readonly _RI_int_t w
+    cdef readonly _RI_int_t h
+
+cdef inline RectInt new_rect_int(_RI_int_t x, _RI_int_t y, _RI_int_t w, _RI_int_t h):
+    # RectInt(x, y, w, h) without the overhead of calling __init__ through Python
+    cdef RectInt r = RectInt.__new__(RectInt)
+    r.x = x
+    r.y = y
+    r.w = w
+    r.h = h
+    return r
+
+# Called once per row of a rect with the half-open range [xmin, xmax) of that row.
+ctypedef void (*row_span_fn)(_RI_int_t y, _RI_int_t xmin, _RI_int_t xmax, void* context) noexcept nogil
+
+cdef inline void for_each_row_span(_RI_int_t x, _RI_int_t y, _RI_int_t w, _RI_int_t h, row_span_fn fn, void* context) noexcept nogil:
+    # Row spans of RectInt(x, y, w, h) from the first row to the last, for kernels that process whole rows at once (e.g. filling a region of a tile map).
+    if w <= 0:
+        return
+    cdef _RI_int_t row
+    for row in range(y, y + h):
+        fn(row, x, x + w, context)
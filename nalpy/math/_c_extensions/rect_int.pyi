@@ -0,0 +1,146 @@
+from enum import IntEnum
+from typing import Any, ClassVar, Iterable, Iterator, SupportsIndex, TypeVar, final, overload
+from typing_extensions import Buffer
+from .mvector2_int import MVector2Int
+from .rect import Rect
+from .vector2_int import Vector2Int
+from .vector2_int_buffer import Vector2IntBuffer
+
+_OutT = TypeVar("_OutT", bound=Buffer)
+
+class GridOrder(IntEnum):
+    """The order in which the cells of a `RectInt` are visited."""
+
+    ROW_MAJOR = 0
+    """Row by row, x increasing fastest."""
+    COLUMN_MAJOR = 1
+    """Column by column, y increasing fastest."""
+    MORTON = 2
+    """Z-order curve. Cells close to each other in the order are close to each other on the grid."""
+    HILBERT = 3
+    """Hilbert curve. Like ``MORTON``, but consecutive cells are always neighbours."""
+
+@final
+class GridIterator:
+    """Iterator over the cells of a `RectInt`. Returned by `RectInt.iter_positions`."""
+
+    def __iter__(self) -> GridIterator: ...
+    def __next__(self) -> Vector2Int: ...
+    def __length_hint__(self) -> int: ...
+
+@final
+class RectInt:
+    """
+    A 2D Rectangle defined by X and Y position, width and height with integer precision.
+
+    The functionality of this rect depends on the coordinate space used.
+    When X increases to the right and Y increases upwards, position represents the bottom-left corner of the rectangle.
+    When X increases to the right and Y increases downwards, position represents the top-left corner of the rectange.
+
+    Behaves like a ``tuple[int, int, int, int]`` of ``(x, y, w, h)``: supports indexing, unpacking, ``len``, comparison with tuples and the ``NamedTuple`` helpers ``_fields``, ``_asdict`` and ``_replace``.
+    """
+
+    _fields: ClassVar[tuple[str, str, str, str]]
+
+    def __init__(self, x: int, y: int, w: int, h: int) -> None: ...
+
+    @property
+    def x(self) -> int: ...
+    @property
+    def y(self) -> int: ...
+    @property
+    def w(self) -> int: ...
+    @property
+    def h(self) -> int: ...
+
+    @staticmethod
+    def zero() -> RectInt:
+        """Shorthand for ``math.RectInt(0, 0, 0, 0)``"""
+        ...
+
+    @staticmethod
+    def from_pos(position: Vector2Int, size: Vector2Int) -> RectInt: ...
+
+    @staticmethod
+    def from_min_max(xmin: int, ymin: int, xmax: int, ymax: int) -> RectInt: ...
+
+    @staticmethod
+    def from_min_max_vectors(min: Vector2Int, max: Vector2Int) -> RectInt: ...
+
+    def __repr__(self) -> str: ...
+
+    def __len__(self) -> int: ...
+
+    @overload
+    def __getitem__(self, index: SupportsIndex) -> int: ...
+    @overload
+    def __getitem__(self, index: slice) -> tuple[int, ...]: ...
+
+    def __iter__(self) -> Iterator[int]: ...
+
+    def __eq__(self, other: object) -> bool: ...
+
+    def __hash__(self) -> int: ...
+
+    def _asdict(self) -> dict[str, int]: ...
+
+    def _replace(self, **changes: Any) -> RectInt: ...
+
+    @property
+    def min(self) -> Vector2Int:
+        """Same as `Rect.position`"""
+        ...
+    @property
+    def xmin(self) -> int:
+        """Same as `Rect.x`"""
+        ...
+    @property
+    def ymin(self) -> int:
+        """Same as `Rect.y`"""
+        ...
+
+    @property
+    def max(self) -> Vector2Int: ...
+    @property
+    def xmax(self) -> int: ...
+    @property
+    def ymax(self) -> int: ...
+
+    @property
+    def position(self) -> Vector2Int: ...
+    @property
+    def size(self) -> Vector2Int: ...
+
+    @property
+    def all_positions_within(self) -> GridIterator:
+        """All integer positions inside this rect, row by row. Same as ``iter_positions(GridOrder.ROW_MAJOR)``."""
+        ...
+
+    def iter_positions(self, order: GridOrder = GridOrder.ROW_MAJOR) -> GridIterator:
+        """
+        Iterate over all integer positions inside this rect in the given order.
+
+        ``MORTON`` and ``HILBERT`` orders follow the curve over the smallest power of two square placed at the position of this rect, skipping the cells outside of the rect.
+
+        Raises ``OverflowError`` if the number of cells doesn't fit into a ``Py_ssize_t``.
+        """
+        ...
+
+    @overload
+    def positions_to_buffer(self, order: GridOrder = GridOrder.ROW_MAJOR) -> Vector2IntBuffer:
+        """Write all integer positions inside this rect into a new `Vector2IntBuffer` in the same order as `iter_positions`."""
+        ...
+    @overload
+    def positions_to_buffer(self, order: GridOrder, out: _OutT) -> _OutT:
+        """Write all integer positions inside this rect into ``out``, which must be a writable contiguous ``(w * h, 2)`` buffer of 64-bit integers."""
+        ...
+
+    def contains(self, point: Vector2Int | MVector2Int) -> bool: ...
+
+    def overlaps(self, other: RectInt) -> bool: ...
+
+    def clamped_to_bounds(self, bounds: RectInt) -> RectInt: ...
+
+    def to_rect(self) -> Rect: ...
+    def to_tuple(self) -> tuple[int, int, int, int]: ...
+    def to_int_dict(self) -> dict[str, int]: ...
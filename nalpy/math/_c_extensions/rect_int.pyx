@@ -0,0 +1,352 @@
+#cython: language_level=3
+
+cimport cython
+from cpython.pyport cimport PY_SSIZE_T_MAX
+from enum import IntEnum
+
+from ._batch cimport check_length, check_pairs
+from ._hash cimport hash4
+from ._overflow cimport checked_mul
+from .rect cimport new_rect
+from .vector2_int cimport Vector2Int, new_vector2_int
+from .vector2_int_buffer cimport new_vector2_int_buffer
+
+cdef RectInt _zero # Returned by RectInt.zero(), assigned after the class has been created
+
+#region Grid iteration
+class GridOrder(IntEnum):
+    ROW_MAJOR = 0
+    COLUMN_MAJOR = 1
+    MORTON = 2
+    HILBERT = 3
+
+ctypedef enum _Order:
+    _ROW_MAJOR
+    _COLUMN_MAJOR
+    _MORTON
+    _HILBERT
+
+# Morton and Hilbert orders walk a quadtree over the smallest power of two square that covers the rect, skipping the quadrants outside of it.
+# Each state lists the order of its quadrants and the state of each quadrant: (qx | qy << 1 | next_state << 2) per quadrant.
+# States 0 to 3 are the rotations and reflections of the Hilbert curve, state 4 is the Z-order curve.
+cdef int[20] _CURVE = [
+    0 | 0 << 1 | 1 << 2, 0 | 1 << 1 | 0 << 2, 1 | 1 << 1 | 0 << 2, 1 | 0 << 1 | 2 << 2, # Hilbert, starts at (0, 0) and ends at (1, 0)
+    0 | 0 << 1 | 0 << 2, 1 | 0 << 1 | 1 << 2, 1 | 1 << 1 | 1 << 2, 0 | 1 << 1 | 3 << 2,
+    1 | 1 << 1 | 3 << 2, 0 | 1 << 1 | 2 << 2, 0 | 0 << 1 | 2 << 2, 1 | 0 << 1 | 0 << 2,
+    1 | 1 << 1 | 2 << 2, 1 | 0 << 1 | 3 << 2, 0 | 0 << 1 | 3 << 2, 0 | 1 << 1 | 1 << 2,
+    0 | 0 << 1 | 4 << 2, 1 | 0 << 1 | 4 << 2, 0 | 1 << 1 | 4 << 2, 1 | 1 << 1 | 4 << 2  # Morton
+]
+cdef enum:
+    _MAX_STACK = 4 * 64 # Up to three pending siblings per level and 62 levels at most
+
+cdef struct _CurveNode:
+    _RI_int_t x # Relative to the position of the rect
+    _RI_int_t y
+    int level # Node covers 2 ** level cells in both directions
+    int state
+
+cdef struct _GridWalk:
+    _RI_int_t x0
+    _RI_int_t y0
+    _RI_int_t w
+    _RI_int_t h
+    _Order order
+    Py_ssize_t count # Number of cells
+    _RI_int_t x # Next cell in row and column order, relative to x0 and y0
+    _RI_int_t y
+    int top
+    _CurveNode stack[_MAX_STACK]
+
+cdef int _init_walk(_GridWalk* walk, RectInt rect, object order) except -1:
+    cdef int o = order
+    if o < _ROW_MAJOR or o > _HILBERT:
+        raise ValueError(f"Invalid grid order: {order!r}")
+
+    walk.x0 = rect.x
+    walk.y0 = rect.y
+    walk.w = rect.w if rect.w > 0 and rect.h > 0 else 0 # Empty rects are always empty in both dimensions
+    walk.h = rect.h if rect.w > 0 and rect.h > 0 else 0
+    walk.order = <_Order>o
+
+    cdef long long count
+    if checked_mul(walk.w, walk.h, &count) or count > PY_SSIZE_T_MAX:
+        raise OverflowError("Rect has too many cells.")
+    walk.count = <Py_ssize_t>count
+
+    walk.x = 0
+    walk.y = 0
+    walk.top = 0
+
+    cdef int level = 0
+    if walk.w > 0 and (walk.order == _MORTON or walk.order == _HILBERT):
+        while ((<_RI_int_t>1) << level) < walk.w or ((<_RI_int_t>1) << level) < walk.h:
+            level += 1
+            if level > 62:
+                raise ValueError("Rect is too large for curve orders.")
+        walk.stack[0].x = 0
+        walk.stack[0].y = 0
+        walk.stack[0].level = level
+        walk.stack[0].state = 4 if walk.order == _MORTON else 0
+        walk.top = 1
+    return 0
+
+cdef bint _walk_next(_GridWalk* walk, _RI_int_t* x, _RI_int_t* y) noexcept nogil:
+    # Writes the next cell into x and y. Returns False when every cell has been visited.
+    cdef _CurveNode node
+    cdef _RI_int_t half, cx, cy
+    cdef int i, step
+    if walk.order == _ROW_MAJOR or walk.order == _COLUMN_MAJOR:
+        if walk.w == 0 or walk.x >= walk.w or walk.y >= walk.h:
+            return False
+        x[0] = walk.x0 + walk.x
+        y[0] = walk.y0 + walk.y
+        if walk.order == _ROW_MAJOR:
+            walk.x += 1
+            if walk.x == walk.w:
+                walk.x = 0
+                walk.y += 1
+        else:
+            walk.y += 1
+            if walk.y == walk.h:
+                walk.y = 0
+                walk.x += 1
+        return True
+
+    while walk.top > 0:
+        walk.top -= 1
+        node = walk.stack[walk.top]
+        if node.level == 0:
+            x[0] = walk.x0 + node.x
+            y[0] = walk.y0 + node.y
+            return True
+
+        half = (<_RI_int_t>1) << (node.level - 1)
+        for i in range(3, -1, -1): # Pushed in reverse so that the first quadrant is visited first
+            step = _CURVE[4 * node.state + i]
+            cx = node.x + (step & 1) * half
+            cy = node.y + ((step >> 1) & 1) * half
+            if cx < walk.w and cy < walk.h:
+                walk.stack[walk.top].x = cx
+                walk.stack[walk.top].y = cy
+                walk.stack[walk.top].level = node.level - 1
+                walk.stack[walk.top].state = step >> 2
+                walk.top += 1
+    return False
+
+@cython.final
+cdef class GridIterator:
+    cdef _GridWalk _walk
+    cdef Py_ssize_t _remaining
+
+    def __iter__(self):
+        # iter(self)
+        return self
+
+    def __next__(self):
+        # next(self)
+        cdef _RI_int_t x, y
+        if not _walk_next(&self._walk, &x, &y):
+            raise StopIteration
+        self._remaining -= 1
+        return new_vector2_int(x, y)
+
+    def __length_hint__(self):
+        return self._remaining
+
+cdef GridIterator _new_grid_iterator(RectInt rect, object order):
+    cdef GridIterator it = GridIterator.__new__(GridIterator)
+    _init_walk(&it._walk, rect, order)
+    it._remaining = it._walk.count
+    return it
+#endregion
+
+@cython.freelist(256)
+cdef class RectInt:
+    _fields = ("x", "y", "w", "h") # NamedTuple compatibility
+
+    def __init__(self, _RI_int_t x, _RI_int_t y, _RI_int_t w, _RI_int_t h):
+        # RectInt(x, y, w, h)
+        self.x = x
+        self.y = y
+        self.w = w
+        self.h = h
+
+    @staticmethod
+    def zero():
+        return _zero # Returning single instance, because RectInt is immutable
+
+    #region Constructors
+    @staticmethod
+    def from_pos(Vector2Int position, Vector2Int size):
+        return new_rect_int(position.x, position.y, size.x, size.y)
+
+    @staticmethod
+    def from_min_max(_RI_int_t xmin, _RI_int_t ymin, _RI_int_t xmax, _RI_int_t ymax):
+        return new_rect_int(xmin, ymin, xmax - xmin, ymax - ymin)
+
+    @staticmethod
+    def from_min_max_vectors(Vector2Int min, Vector2Int max):
+        return new_rect_int(min.x, min.y, max.x - min.x, max.y - min.y)
+    #endregion
+
+    #region Tuple compatibility
+    def __repr__(self):
+        # repr(self)
+        return f"RectInt({self.x}, {self.y}, {self.w}, {self.h})"
+
+    def __len__(self):
+        # len(self)
+        return 4
+
+    def __getitem__(self, index):
+        # self[index]
+        return (self.x, self.y, self.w, self.h)[index]
+
+    def __iter__(self):
+        # iter(self)
+        return iter((self.x, self.y, self.w, self.h))
+
+    def __eq__(self, other):
+        # self == other
+        cdef RectInt r
+        if isinstance(other, RectInt):
+            r = <RectInt>other
+            return self.x == r.x and self.y == r.y and self.w == r.w and self.h == r.h
+        if isinstance(other, tuple):
+            return (self.x, self.y, self.w, self.h) == other
+        return NotImplemented
+
+    def __hash__(self):
+        # Equal to the hash of the corresponding tuple, because rects compare equal to tuples.
+        return hash4(self.x, self.y, self.w, self.h)
+
+    def __reduce__(self):
+        return (RectInt, (self.x, self.y, self.w, self.h))
+
+    def _asdict(self):
+        return {"x": self.x, "y": self.y, "w": self.w, "h": self.h}
+
+    def _replace(self, **changes):
+        cdef RectInt r = new_rect_int(changes.pop("x", self.x), changes.pop("y", self.y), changes.pop("w", self.w), changes.pop("h", self.h))
+        if changes:
+            raise ValueError(f"Got unexpected field names: {list(changes)!r}")
+        return r
+    #endregion
+
+    #region Properties
+    @property
+    def min(self):
+        return new_vector2_int(self.x, self.y)
+    @property
+    def xmin(self):
+        return self.x
+    @property
+    def ymin(self):
+        return self.y
+
+    @property
+    def max(self):
+        return new_vector2_int(self.x + self.w, self.y + self.h)
+    @property
+    def xmax(self):
+        return self.x + self.w
+    @property
+    def ymax(self):
+        return self.y + self.h
+
+    @property
+    def position(self):
+        return new_vector2_int(self.x, self.y)
+    @property
+    def size(self):
+        return new_vector2_int(self.w, self.h)
+
+    @property
+    def all_positions_within(self):
+        return _new_grid_iterator(self, _ROW_MAJOR)
+    #endregion
+
+    #region Grid iteration
+    def iter_positions(self, order = GridOrder.ROW_MAJOR):
+        return _new_grid_iterator(self, order)
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def positions_to_buffer(self, order = GridOrder.ROW_MAJOR, out = None):
+        cdef _GridWalk walk
+        _init_walk(&walk, self, order)
+        cdef Py_ssize_t n = walk.count
+        if out is None:
+            out = new_vector2_int_buffer(n)
+        cdef long long[:, ::1] view = out
+        check_pairs(view.shape[1])
+        check_length(n, view.shape[0])
+
+        cdef Py_ssize_t i = 0
+        cdef _RI_int_t x, y
+        with nogil:
+            if walk.order == _ROW_MAJOR: # Hot path for scans, written without the walk
+                for y in range(walk.y0, walk.y0 + walk.h):
+                    for x in range(walk.x0, walk.x0 + walk.w):
+                        view[i, 0] = x
+                        view[i, 1] = y
+                        i += 1
+            else:
+                while _walk_next(&walk, &x, &y):
+                    view[i, 0] = x
+                    view[i, 1] = y
+                    i += 1
+        return out
+    #endregion
+
+    #region Collisions
+    def contains(self, point):
+        cdef Vector2Int vec
+        if isinstance(point, Vector2Int):
+            vec = <Vector2Int>point
+            return (vec.x >= self.x) and (vec.x < self.x + self.w) and (vec.y >= self.y) and (vec.y < self.y + self.h)
+        # Duck-typed like the NamedTuple version, mutable vectors and anything else with x and y
+        return (point.x >= self.x) and (point.x < self.x + self.w) and (point.y >= self.y) and (point.y < self.y + self.h)
+
+    def overlaps(self, other):
+        cdef RectInt rect
+        if isinstance(other, RectInt):
+            rect = <RectInt>other
+            return (
+                rect.x + rect.w > self.x and
+                rect.x          < self.x + self.w and
+                rect.y + rect.h > self.y and
+                rect.y          < self.y + self.h
+            )
+        # Duck-typed like the NamedTuple version, anything with x, y, xmax and ymax
+        return (
+            other.xmax > self.x and
+            other.x    < self.x + self.w and
+            other.ymax > self.y and
+            other.y    < self.y + self.h
+        )
+    #endregion
+
+    #region Conversions
+    def clamped_to_bounds(self, RectInt bounds):
+        cdef _RI_int_t bounds_xmax = bounds.x + bounds.w
+        cdef _RI_int_t bounds_ymax = bounds.y + bounds.h
+
+        cdef _RI_int_t x = max(min(bounds_xmax, self.x), bounds.x)
+        cdef _RI_int_t y = max(min(bounds_ymax, self.y), bounds.y)
+        cdef _RI_int_t w = min(bounds_xmax - self.x, self.w)
+        cdef _RI_int_t h = min(bounds_ymax - self.y, self.h)
+
+        return new_rect_int(x, y, w, h)
+
+    def to_rect(self):
+        return new_rect(<double>self.x, <double>self.y, <double>self.w, <double>self.h)
+
+    def to_tuple(self):
+        return (self.x, self.y, self.w, self.h)
+
+    def to_int_dict(self):
+        return {"x": self.x, "y": self.y, "w": self.w, "h": self.h}
+    #endregion
+
+_zero = new_rect_int(0, 0, 0, 0)
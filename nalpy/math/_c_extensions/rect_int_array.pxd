@@ -0,0 +1,9 @@
+#cython: language_level=3
+
+cdef class RectIntArray:
+    cdef long long* _data # Interleaved x, y, w, h quadruples
+    cdef Py_ssize_t _length
+    cdef object _base # Owner of _data if this array is a view, None if this array owns its memory.
+
+    cdef Py_ssize_t _shape[2]
+    cdef Py_ssize_t _strides[2]
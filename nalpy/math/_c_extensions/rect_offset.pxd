@@ -0,0 +1,16 @@
+#cython: language_level=3
+
+cdef class RectOffset:
+    cdef readonly double left
+    cdef readonly double right
+    cdef readonly double top
+    cdef readonly double bottom
+
+cdef inline RectOffset new_rect_offset(double left, double right, double top, double bottom):
+    # RectOffset(left, right, top, bottom) without the overhead of calling __init__ through Python
+    cdef RectOffset o = RectOffset.__new__(RectOffset)
+    o.left = left
+    o.right = right
+    o.top = top
+    o.bottom = bottom
+    return o
@@ -0,0 +1,62 @@
+from typing import Any, ClassVar, Iterator, SupportsIndex, final, overload
+from .rect import Rect
+
+@final
+class RectOffset:
+    """
+    Offsets for rectangles, borders, etc.
+
+    Assumes that X increases to the right and Y increases downwards.
+
+    Behaves like a ``tuple[float, float, float, float]`` of ``(left, right, top, bottom)``.
+    """
+
+    _fields: ClassVar[tuple[str, str, str, str]]
+
+    def __init__(self, left: float, right: float, top: float, bottom: float) -> None: ...
+
+    @property
+    def left(self) -> float: ...
+    @property
+    def right(self) -> float: ...
+    @property
+    def top(self) -> float: ...
+    @property
+    def bottom(self) -> float: ...
+
+    def __repr__(self) -> str: ...
+
+    def __len__(self) -> int: ...
+
+    @overload
+    def __getitem__(self, index: SupportsIndex) -> float: ...
+    @overload
+    def __getitem__(self, index: slice) -> tuple[float, ...]: ...
+
+    def __iter__(self) -> Iterator[float]: ...
+
+    def __eq__(self, other: object) -> bool: ...
+
+    def __hash__(self) -> int: ...
+
+    def _asdict(self) -> dict[str, float]: ...
+
+    def _replace(self, **changes: Any) -> RectOffset: ...
+
+    @property
+    def horizontal(self) -> float: ...
+
+    @property
+    def vertical(self) -> float: ...
+
+    def add(self, rect: Rect) -> Rect:
+        """Add the border offsets to a rect."""
+        ...
+
+    def remove(self, rect: Rect) -> Rect:
+        """Remove the border offsets from a rect."""
+        ...
+
+    def to_tuple(self) -> tuple[float, float, float, float]: ...
+    def to_int_tuple(self) -> tuple[int, int, int, int]: ...
+    def to_float_dict(self) -> dict[str, float]: ...
@@ -0,0 +1,94 @@
+#cython: language_level=3
+
+from libc.math cimport rint
+
+from ._hash cimport hash4
+from .rect cimport Rect, new_rect
+
+cdef class RectOffset:
+    _fields = ("left", "right", "top", "bottom") # NamedTuple compatibility
+
+    def __init__(self, double left, double right, double top, double bottom):
+        # RectOffset(left, right, top, bottom)
+        self.left = left
+        self.right = right
+        self.top = top
+        self.bottom = bottom
+
+    #region Tuple compatibility
+    def __repr__(self):
+        # repr(self)
+        return f"RectOffset(left={self.left}, right={self.right}, top={self.top}, bottom={self.bottom})"
+
+    def __len__(self):
+        # len(self)
+        return 4
+
+    def __getitem__(self, index):
+        # self[index]
+        return (self.left, self.right, self.top, self.bottom)[index]
+
+    def __iter__(self):
+        # iter(self)
+        return iter((self.left, self.right, self.top, self.bottom))
+
+    def __eq__(self, other):
+        # self == other
+        cdef RectOffset o
+        if isinstance(other, RectOffset):
+            o = <RectOffset>other
+            return self.left == o.left and self.right == o.right and self.top == o.top and self.bottom == o.bottom
+        if isinstance(other, tuple):
+            return (self.left, self.right, self.top, self.bottom) == other
+        return NotImplemented
+
+    def __hash__(self):
+        # Equal to the hash of the corresponding tuple, because offsets compare equal to tuples.
+        return hash4(self.left, self.right, self.top, self.bottom)
+
+    def __reduce__(self):
+        return (RectOffset, (self.left, self.right, self.top, self.bottom))
+
+    def _asdict(self):
+        return {"left": self.left, "right": self.right, "top": self.top, "bottom": self.bottom}
+
+    def _replace(self, **changes):
+        cdef RectOffset o = new_rect_offset(changes.pop("left", self.left), changes.pop("right", self.right), changes.pop("top", self.top), changes.pop("bottom", self.bottom))
+        if changes:
+            raise ValueError(f"Got unexpected field names: {list(changes)!r}")
+        return o
+    #endregion
+
+    @property
+    def horizontal(self):
+        return self.left + self.right
+
+    @property
+    def vertical(self):
+        return self.top + self.bottom
+
+    def add(self, Rect rect):
+        # Rect.from_min_max(rect.xmin + left, rect.ymin + top, rect.xmax - right, rect.ymax - bottom)
+        cdef double xmin = rect.x + self.left
+        cdef double ymin = rect.y + self.top
+        cdef double xmax = (rect.x + rect.w) - self.right
+        cdef double ymax = (rect.y + rect.h) - self.bottom
+        return new_rect(xmin, ymin, xmax - xmin, ymax - ymin)
+
+    def remove(self, Rect rect):
+        # Rect.from_min_max(rect.xmin - left, rect.ymin - top, rect.xmax + right, rect.ymax + bottom)
+        cdef double xmin = rect.x - self.left
+        cdef double ymin = rect.y - self.top
+        cdef double xmax = (rect.x + rect.w) + self.right
+        cdef double ymax = (rect.y + rect.h) + self.bottom
+        return new_rect(xmin, ymin, xmax - xmin, ymax - ymin)
+
+    def to_tuple(self):
+        return (self.left, self.right, self.top, self.bottom)
+
+    def to_int_tuple(self):
+        # rint rounds half to even like Python's round()
+        return (int(rint(self.left)), int(rint(self.right)), int(rint(self.top)), int(rint(self.bottom)))
+
+    def to_float_dict(self):
+        return {"left": self.left, "right": self.right, "top": self.top, "bottom": self.bottom}
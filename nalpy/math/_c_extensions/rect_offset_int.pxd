@@ -0,0 +1,18 @@
+#cython: language_level=3
+
+ctypedef long long int _ROI_int_t
+
+cdef class RectOffsetInt:
+    cdef readonly _ROI_int_t left
+    cdef readonly _ROI_int_t right
+    cdef readonly _ROI_int_t top
+    cdef readonly _ROI_int_t bottom
+
+cdef inline RectOffsetInt new_rect_offset_int(_ROI_int_t left, _ROI_int_t right, _ROI_int_t top, _ROI_int_t bottom):
+    # RectOffsetInt(left, right, top, bottom) without the overhead of calling __init__ through Python
+    cdef RectOffsetInt o = RectOffsetInt.__new__(RectOffsetInt)
+    o.left = left
+    o.right = right
+    o.top = top
+    o.bottom = bottom
+    return o
@@ -0,0 +1,64 @@
+from typing import Any, ClassVar, Iterator, SupportsIndex, final, overload
+from .rect_int import RectInt
+from .rect_offset import RectOffset
+
+@final
+class RectOffsetInt:
+    """
+    Offsets for rectangles, borders, etc. with integer precision.
+
+    Assumes that X increases to the right and Y increases downwards.
+
+    Behaves like a ``tuple[int, int, int, int]`` of ``(left, right, top, bottom)``.
+    """
+
+    _fields: ClassVar[tuple[str, str, str, str]]
+
+    def __init__(self, left: int, right: int, top: int, bottom: int) -> None: ...
+
+    @property
+    def left(self) -> int: ...
+    @property
+    def right(self) -> int: ...
+    @property
+    def top(self) -> int: ...
+    @property
+    def bottom(self) -> int: ...
+
+    def __repr__(self) -> str: ...
+
+    def __len__(self) -> int: ...
+
+    @overload
+    def __getitem__(self, index: SupportsIndex) -> int: ...
+    @overload
+    def __getitem__(self, index: slice) -> tuple[int, ...]: ...
+
+    def __iter__(self) -> Iterator[int]: ...
+
+    def __eq__(self, other: object) -> bool: ...
+
+    def __hash__(self) -> int: ...
+
+    def _asdict(self) -> dict[str, int]: ...
+
+    def _replace(self, **changes: Any) -> RectOffsetInt: ...
+
+    @property
+    def horizontal(self) -> int: ...
+
+    @property
+    def vertical(self) -> int: ...
+
+    def add(self, rect: RectInt) -> RectInt:
+        """Add the border offsets to a rect."""
+        ...
+
+    def remove(self, rect: RectInt) -> RectInt:
+        """Remove the border offsets from a rect."""
+        ...
+
+    def to_rect_offset(self) -> RectOffset: ...
+    def to_tuple(self) -> tuple[int, int, int, int]: ...
+    def to_int_tuple(self) -> tuple[int, int, int, int]: ...
+    def to_int_dict(self) -> dict[str, int]: ...
@@ -0,0 +1,96 @@
+#cython: language_level=3
+
+from ._hash cimport hash4
+from .rect_int cimport RectInt, new_rect_int
+from .rect_offset cimport new_rect_offset
+
+# Modified from RectOffset
+cdef class RectOffsetInt:
+    _fields = ("left", "right", "top", "bottom") # NamedTuple compatibility
+
+    def __init__(self, _ROI_int_t left, _ROI_int_t right, _ROI_int_t top, _ROI_int_t bottom):
+        # RectOffsetInt(left, right, top, bottom)
+        self.left = left
+        self.right = right
+        self.top = top
+        self.bottom = bottom
+
+    #region Tuple compatibility
+    def __repr__(self):
+        # repr(self)
+        return f"RectOffsetInt(left={self.left}, right={self.right}, top={self.top}, bottom={self.bottom})"
+
+    def __len__(self):
+        # len(self)
+        return 4
+
+    def __getitem__(self, index):
+        # self[index]
+        return (self.left, self.right, self.top, self.bottom)[index]
+
+    def __iter__(self):
+        # iter(self)
+        return iter((self.left, self.right, self.top, self.bottom))
+
+    def __eq__(self, other):
+        # self == other
+        cdef RectOffsetInt o
+        if isinstance(other, RectOffsetInt):
+            o = <RectOffsetInt>other
+            return self.left == o.left and self.right == o.right and self.top == o.top and self.bottom == o.bottom
+        if isinstance(other, tuple):
+            return (self.left, self.right, self.top, self.bottom) == other
+        return NotImplemented
+
+    def __hash__(self):
+        # Equal to the hash of the corresponding tuple, because offsets compare equal to tuples.
+        return hash4(self.left, self.right, self.top, self.bottom)
+
+    def __reduce__(self):
+        return (RectOffsetInt, (self.left, self.right, self.top, self.bottom))
+
+    def _asdict(self):
+        return {"left": self.left, "right": self.right, "top": self.top, "bottom": self.bottom}
+
+    def _replace(self, **changes):
+        cdef RectOffsetInt o = new_rect_offset_int(changes.pop("left", self.left), changes.pop("right", self.right), changes.pop("top", self.top), changes.pop("bottom", self.bottom))
+        if changes:
+            raise ValueError(f"Got unexpected field names: {list(changes)!r}")
+        return o
+    #endregion
+
+    @property
+    def horizontal(self):
+        return self.left + self.right
+
+    @property
+    def vertical(self):
+        return self.top + self.bottom
+
+    def add(self, RectInt rect):
+        # RectInt.from_min_max(rect.xmin + left, rect.ymin + top, rect.xmax - right, rect.ymax - bottom)
+        cdef _ROI_int_t xmin = rect.x + self.left
+        cdef _ROI_int_t ymin = rect.y + self.top
+        cdef _ROI_int_t xmax = (rect.x + rect.w) - self.right
+        cdef _ROI_int_t ymax = (rect.y + rect.h) - self.bottom
+        return new_rect_int(xmin, ymin, xmax - xmin, ymax - ymin)
+
+    def remove(self, RectInt rect):
+        # RectInt.from_min_max(rect.xmin - left, rect.ymin - top, rect.xmax + right, rect.ymax + bottom)
+        cdef _ROI_int_t xmin = rect.x - self.left
+        cdef _ROI_int_t ymin = rect.y - self.top
+        cdef _ROI_int_t xmax = (rect.x + rect.w) + self.right
+        cdef _ROI_int_t ymax = (rect.y + rect.h) + self.bottom
+        return new_rect_int(xmin, ymin, xmax - xmin, ymax - ymin)
+
+    def to_rect_offset(self):
+        return new_rect_offset(<double>self.left, <double>self.right, <double>self.top, <double>self.bottom)
+
+    def to_tuple(self):
+        return (self.left, self.right, self.top, self.bottom)
+
+    def to_int_tuple(self):
+        return (self.left, self.right, self.top, self.bottom)
+
+    def to_int_dict(self):
+        return {"left": self.left, "right": self.right, "top": self.top, "bottom": self.bottom}
@@ -0,0 +1,83 @@
+from typing import Iterable
+from typing_extensions import Buffer
+
+# All reductions accept any one-dimensional contiguous buffer of doubles directly (array.array("d"), memoryview, NumPy array, ...).
+# Other iterables are collected into an array.array("d") first.
+# Large inputs are split into fixed-size blocks that are reduced in parallel using OpenMP (when available) and the block results are merged exactly,
+# so the result doesn't depend on the amount of threads used.
+
+def sum(values: Buffer | Iterable[float]) -> float:
+    """
+    Compensated (Neumaier) sum of ``values``.
+
+    The result is accurate to within a few units in the last place, unlike basic summation where the error grows with the amount of values.
+    """
+    ...
+
+def mean(values: Buffer | Iterable[float]) -> float:
+    """Arithmetic mean of ``values`` using compensated summation. Raises ``ValueError`` if ``values`` is empty."""
+    ...
+
+def variance(values: Buffer | Iterable[float], ddof: int = 0) -> float:
+    """
+    Variance of ``values`` using the corrected two-pass algorithm with compensated summation.
+
+    The sum of squared deviations is divided by ``len(values) - ddof``. The default ``ddof = 0`` gives the population variance and ``ddof = 1`` the sample variance.
+    """
+    ...
+
+def dot(a: Buffer | Iterable[float], b: Buffer | Iterable[float]) -> float:
+    """Compensated dot product of two equal-length sequences. The rounding error of each product is accounted for."""
+    ...
+
+def norm(values: Buffer | Iterable[float]) -> float:
+    """Euclidean norm of ``values``. Like ``math.hypot(*values)``, the values are scaled so that squaring them can't overflow or underflow."""
+    ...
+
+
+class CompensatedStats:
+    """
+    An accumulator for unbounded streams of values that keeps a compensated sum, the count, and Welford's mean and variance.
+
+    Batches added with ``extend`` are reduced at memory-bandwidth speed and merged in without re-summing history.
+    Accumulators of different shards can be combined with ``merge``. Supports pickling.
+    """
+
+    def __init__(self, values: Buffer | Iterable[float] = ()) -> None: ...
+
+    def add(self, x: float) -> None:
+        """Add a single value."""
+        ...
+
+    def extend(self, values: Buffer | Iterable[float]) -> None:
+        """Add a batch of values. Buffers of doubles are used directly, other iterables are collected into an array first."""
+        ...
+
+    def merge(self, other: CompensatedStats) -> None:
+        """Add all values accumulated by ``other`` to this accumulator. ``other`` is not modified."""
+        ...
+
+    def copy(self) -> CompensatedStats: ...
+
+    @property
+    def count(self) -> int:
+        """The amount of values added."""
+        ...
+
+    @property
+    def sum(self) -> float:
+        """The compensated sum of the values added."""
+        ...
+
+    @property
+    def mean(self) -> float:
+        """The arithmetic mean of the values added. Raises ``ValueError`` if no values have been added."""
+        ...
+
+    def variance(self, ddof: int = 0) -> float:
+        """
+        The variance of the values added.
+
+        The sum of squared deviations is divided by ``count - ddof``. The default ``ddof = 0`` gives the population variance and ``ddof = 1`` the sample variance.
+        """
+        ...
@@ -0,0 +1,337 @@
+#cython: language_level=3
+
+cimport cython
+from cython.parallel cimport prange
+from cpython.mem cimport PyMem_Malloc, PyMem_Free
+from libc.math cimport fabs, fma, sqrt, frexp, ldexp, isfinite, isnan, isinf, INFINITY, NAN
+
+from ._batch cimport as_doubles
+
+ctypedef enum _Reduction:
+    _SUM # sum(a)
+    _DOT # sum(a * b)
+    _DEVIATIONS # sum(a - shift) and sum((a - shift) ** 2)
+    _SCALED_SQUARES # sum((a * shift) ** 2)
+
+cdef enum:
+    # Work is split into fixed-size blocks instead of one block per thread,
+    # so that the result doesn't depend on the amount of threads used.
+    _BLOCK_SIZE = 16384
+
+    # Non-overlapping partials of a finite sum of doubles can't exceed (2098 / 53) + 1 values.
+    _MAX_PARTIALS = 64
+
+#region Compensated kernels
+cdef inline void _neumaier_add(double* s, double* c, double x) noexcept nogil:
+    cdef double t = s[0] + x
+    if fabs(s[0]) >= fabs(x):
+        c[0] += (s[0] - t) + x
+    else:
+        c[0] += (x - t) + s[0]
+    s[0] = t
+
+cdef inline void _neumaier_add_product(double* s, double* c, double a, double b) noexcept nogil:
+    # Dot2 by Ogita, Rump and Oishi. The rounding error of the product is recovered exactly using fma.
+    cdef double p = a * b
+    _neumaier_add(s, c, p)
+    c[0] += fma(a, b, -p)
+
+cdef void _reduce_block(_Reduction kind, const double* a, const double* b, Py_ssize_t n, double shift, double* partials) noexcept nogil:
+    # Writes the (sum, compensation) pairs of this block into partials[0:2] and partials[2:4]
+    cdef double s1 = 0.0
+    cdef double c1 = 0.0
+    cdef double s2 = 0.0
+    cdef double c2 = 0.0
+    cdef double d
+    cdef Py_ssize_t i
+
+    if kind == _SUM:
+        for i in range(n):
+            _neumaier_add(&s1, &c1, a[i])
+    elif kind == _DOT:
+        for i in range(n):
+            _neumaier_add_product(&s1, &c1, a[i], b[i])
+    elif kind == _DEVIATIONS:
+        for i in range(n):
+            d = a[i] - shift
+            _neumaier_add(&s1, &c1, d)
+            _neumaier_add_product(&s2, &c2, d, d)
+    elif kind == _SCALED_SQUARES:
+        for i in range(n):
+            d = a[i] * shift
+            _neumaier_add_product(&s1, &c1, d, d)
+
+    if not isfinite(s1): # Compensation of an infinite or nan sum is meaningless and would turn inf into nan.
+        c1 = 0.0
+    if not isfinite(s2):
+        c2 = 0.0
+
+    partials[0] = s1
+    partials[1] = c1
+    partials[2] = s2
+    partials[3] = c2
+
+cdef double _exact_sum(const double* values, Py_ssize_t n, Py_ssize_t step) noexcept nogil:
+    # Correctly rounded sum of values[0], values[step], ... values[(n - 1) * step] and values[1], values[1 + step], ...
+    # Adapted from math_fsum https://github.com/python/cpython/blob/3.11/Modules/mathmodule.c#L1326
+    cdef double p[_MAX_PARTIALS]
+    cdef Py_ssize_t count = 0
+    cdef Py_ssize_t i, j, k, m
+    cdef double x, y, t, hi, yr
+    cdef double lo = 0.0
+
+    cdef double naive = 0.0
+    for k in range(n):
+        naive += values[k * step] + values[k * step + 1]
+    if not isfinite(naive):
+        return naive # inf or nan, exactness doesn't matter anymore.
+
+    for k in range(n):
+        for j in range(2):
+            x = values[k * step + j]
+            i = 0
+            for m in range(count):
+                y = p[m]
+                if fabs(x) < fabs(y):
+                    t = x
+                    x = y
+                    y = t
+                hi = x + y
+                yr = hi - x
+                lo = y - yr
+                if lo != 0.0:
+                    p[i] = lo
+                    i += 1
+                x = hi
+            count = i
+            if x != 0.0:
+                if not isfinite(x):
+                    return naive # Intermediate overflow
+                p[count] = x
+                count += 1
+
+    hi = 0.0
+    if count > 0:
+        count -= 1
+        hi = p[count]
+        # Sum from the top, stop when the sum becomes inexact.
+        while count > 0:
+            x = hi
+            count -= 1
+            y = p[count]
+            hi = x + y
+            yr = hi - x
+            lo = y - yr
+            if lo != 0.0:
+                break
+        # Make half-even rounding work across multiple partials.
+        if count > 0 and ((lo < 0.0 and p[count - 1] < 0.0) or (lo > 0.0 and p[count - 1] > 0.0)):
+            y = lo * 2.0
+            x = hi + y
+            yr = x - hi
+            if y == yr:
+                hi = x
+    return hi
+#endregion
+
+#region Driver
+cdef int _reduce(_Reduction kind, const double* a, const double* b, Py_ssize_t n, double shift, double* first, double* second) except -1:
+    cdef Py_ssize_t block_count = (n + _BLOCK_SIZE - 1) // _BLOCK_SIZE
+    if block_count == 0:
+        first[0] = 0.0
+        second[0] = 0.0
+        return 0
+
+    cdef double* partials = <double*>PyMem_Malloc(4 * block_count * sizeof(double))
+    if partials == NULL:
+        raise MemoryError()
+
+    cdef Py_ssize_t block, start, length
+    with nogil:
+        if block_count == 1: # Not worth waking up the thread pool
+            _reduce_block(kind, a, b, n, shift, partials)
+        else:
+            for block in prange(block_count, schedule="static"):
+                start = block * _BLOCK_SIZE
+                length = min(_BLOCK_SIZE, n - start)
+                _reduce_block(kind, a + start, (b + start) if b != NULL else NULL, length, shift, partials + 4 * block)
+
+        # Block partials are merged exactly in a fixed order.
+        first[0] = _exact_sum(partials, block_count, 4)
+        second[0] = _exact_sum(partials + 2, block_count, 4)
+
+    PyMem_Free(partials)
+    return 0
+
+cdef inline const double* _pointer(const double[::1] view) noexcept:
+    if view.shape[0] == 0:
+        return NULL
+    return &view[0]
+#endregion
+
+def sum(values):
+    cdef const double[::1] view = as_doubles(values)
+    cdef double result, unused
+    _reduce(_SUM, _pointer(view), NULL, view.shape[0], 0.0, &result, &unused)
+    return result
+
+@cython.cdivision(True)
+def mean(values):
+    cdef const double[::1] view = as_doubles(values)
+    cdef Py_ssize_t n = view.shape[0]
+    if n < 1:
+        raise ValueError("mean requires at least one value.")
+
+    cdef double total, unused
+    _reduce(_SUM, _pointer(view), NULL, n, 0.0, &total, &unused)
+    return total / <double>n
+
+@cython.cdivision(True)
+def variance(values, Py_ssize_t ddof = 0):
+    cdef const double[::1] view = as_doubles(values)
+    cdef Py_ssize_t n = view.shape[0]
+    if n - ddof < 1:
+        raise ValueError(f"variance requires more than {ddof} values.")
+
+    cdef double total, unused
+    _reduce(_SUM, _pointer(view), NULL, n, 0.0, &total, &unused)
+    cdef double _mean = total / <double>n
+
+    # Corrected two-pass algorithm. The sum of deviations corrects for the rounding error in the mean.
+    cdef double deviations, squared_deviations
+    _reduce(_DEVIATIONS, _pointer(view), NULL, n, _mean, &deviations, &squared_deviations)
+    return (squared_deviations - (deviations * deviations) / <double>n) / <double>(n - ddof)
+
+def dot(a, b):
+    cdef const double[::1] view_a = as_doubles(a)
+    cdef const double[::1] view_b = as_doubles(b)
+    if view_a.shape[0] != view_b.shape[0]:
+        raise ValueError(f"Operands have different lengths ({view_a.shape[0]} and {view_b.shape[0]}).")
+
+    cdef double result, unused
+    _reduce(_DOT, _pointer(view_a), _pointer(view_b), view_a.shape[0], 0.0, &result, &unused)
+    return result
+
+cdef double _max_abs(const double* a, Py_ssize_t n) noexcept nogil:
+    # inf if any value is infinite, otherwise nan if any value is nan. Same precedence as math.hypot.
+    cdef double result = 0.0
+    cdef bint has_nan = False
+    cdef Py_ssize_t i
+    for i in range(n):
+        if isnan(a[i]):
+            has_nan = True
+        elif fabs(a[i]) > result:
+            result = fabs(a[i])
+    if has_nan and not isinf(result):
+        return NAN
+    return result
+
+def norm(values):
+    cdef const double[::1] view = as_doubles(values)
+    cdef Py_ssize_t n = view.shape[0]
+    cdef const double* data = _pointer(view)
+    cdef double largest
+    with nogil:
+        largest = _max_abs(data, n)
+    if largest == 0.0 or not isfinite(largest):
+        return largest
+
+    # Scale by a power of two so that the largest square is close to 1 and the sum can't overflow or underflow.
+    # Scaling by a power of two is exact, only values too small to affect the result lose precision.
+    cdef int exponent
+    frexp(largest, &exponent)
+    exponent = max(exponent, -1000) # 2 ** 1074 would overflow, subnormals are scaled up enough by 2 ** 1000
+    cdef double result, unused
+    _reduce(_SCALED_SQUARES, data, NULL, n, ldexp(1.0, -exponent), &result, &unused)
+    return ldexp(sqrt(result), exponent)
+
+
+cdef class CompensatedStats:
+    cdef long long _count
+    cdef double _sum
+    cdef double _compensation
+    cdef double _mean
+    cdef double _m2 # Sum of squared deviations from the mean
+
+    def __init__(self, values = ()):
+        self._count = 0
+        self._sum = 0.0
+        self._compensation = 0.0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self.extend(values)
+
+    cdef void _merge(self, long long count, double total, double compensation, double _mean, double m2) noexcept:
+        # Chan et al. parallel variance combination
+        if count == 0:
+            return
+
+        _neumaier_add(&self._sum, &self._compensation, total)
+        self._compensation += compensation
+
+        cdef long long combined = self._count + count
+        cdef double delta = _mean - self._mean
+        self._mean += delta * (<double>count / <double>combined)
+        self._m2 += m2 + delta * delta * ((<double>self._count * <double>count) / <double>combined)
+        self._count = combined
+
+    def add(self, double x):
+        _neumaier_add(&self._sum, &self._compensation, x)
+
+        # Welford's online algorithm
+        self._count += 1
+        cdef double delta = x - self._mean
+        self._mean += delta / <double>self._count
+        self._m2 += delta * (x - self._mean)
+
+    @cython.cdivision(True)
+    def extend(self, values):
+        cdef const double[::1] view = as_doubles(values)
+        cdef Py_ssize_t n = view.shape[0]
+        if n == 0:
+            return
+
+        # The batch is reduced at full speed and then merged as if it was another accumulator.
+        cdef double total, unused
+        _reduce(_SUM, _pointer(view), NULL, n, 0.0, &total, &unused)
+        cdef double batch_mean = total / <double>n
+
+        cdef double deviations, squared_deviations
+        _reduce(_DEVIATIONS, _pointer(view), NULL, n, batch_mean, &deviations, &squared_deviations)
+        self._merge(n, total, 0.0, batch_mean, squared_deviations - (deviations * deviations) / <double>n)
+
+    def merge(self, CompensatedStats other):
+        self._merge(other._count, other._sum, other._compensation, other._mean, other._m2)
+
+    def copy(self):
+        cdef CompensatedStats stats = CompensatedStats.__new__(CompensatedStats)
+        stats._merge(self._count, self._sum, self._compensation, self._mean, self._m2)
+        return stats
+
+    @property
+    def count(self):
+        return self._count
+
+    @property
+    def sum(self):
+        return self._sum + self._compensation
+
+    @property
+    def mean(self):
+        if self._count < 1:
+            raise ValueError("mean requires at least one value.")
+        return self._mean
+
+    def variance(self, long long ddof = 0):
+        if self._count - ddof < 1:
+            raise ValueError(f"variance requires more than {ddof} values.")
+        return self._m2 / <double>(self._count - ddof)
+
+    def __repr__(self):
+        return f"CompensatedStats(count={self._count}, sum={self.sum})"
+
+    def __reduce__(self):
+        return (CompensatedStats, (), (self._count, self._sum, self._compensation, self._mean, self._m2))
+
+    def __setstate__(self, state):
+        self._count, self._sum, self._compensation, self._mean, self._m2 = state
@@ -0,0 +1,48 @@
+from typing import Iterable, Iterator, TypeVar, final, overload
+from typing_extensions import Buffer
+
+_OutT = TypeVar("_OutT", bound=Buffer)
+
+@final
+class SortedValues:
+    """
+    An immutable sorted copy of candidate values for answering ``closest`` and ``furthest`` queries in logarithmic time using binary search.
+
+    ``values`` can be any one-dimensional contiguous buffer of doubles or an iterable of floats. It must not be empty or contain nan.
+    Results are always floats. Unlike ``closest`` and ``furthest``, ties go to the smaller candidate.
+    """
+
+    def __init__(self, values: Buffer | Iterable[float]) -> None: ...
+
+    def closest(self, value: float) -> float:
+        """Return the candidate that is closest to ``value``."""
+        ...
+
+    def furthest(self, value: float) -> float:
+        """Return the candidate that is furthest from ``value``."""
+        ...
+
+    # Batched variants. They release the GIL and write their results into ``out`` if given, otherwise a new ``array.array("d")`` is returned.
+    @overload
+    def closest_many(self, values: float | Buffer, out: None = None) -> Buffer: ...
+    @overload
+    def closest_many(self, values: float | Buffer, out: _OutT) -> _OutT:
+        """Batched ``closest``."""
+        ...
+
+    @overload
+    def furthest_many(self, values: float | Buffer, out: None = None) -> Buffer: ...
+    @overload
+    def furthest_many(self, values: float | Buffer, out: _OutT) -> _OutT:
+        """Batched ``furthest``."""
+        ...
+
+    def __len__(self) -> int: ...
+
+    def __getitem__(self, index: int) -> float:
+        """The candidate at ``index`` in ascending order."""
+        ...
+
+    def __iter__(self) -> Iterator[float]: ...
+
+    def __repr__(self) -> str: ...
@@ -0,0 +1,139 @@
+#cython: language_level=3
+
+cimport cython
+from cpython.mem cimport PyMem_Malloc, PyMem_Free
+from libc.math cimport isnan
+from libc.stdlib cimport qsort
+from libc.string cimport memcpy
+
+from ._batch cimport DoubleOperand, double_operand, resolve_length, check_length, new_double_array, as_doubles
+
+cdef int _compare(const void* a, const void* b) noexcept nogil:
+    cdef double x = (<const double*>a)[0]
+    cdef double y = (<const double*>b)[0]
+    return (x > y) - (x < y)
+
+cdef class SortedValues:
+    cdef double* _data
+    cdef Py_ssize_t _length
+
+    def __cinit__(self):
+        # The kernels require at least one value, behave like SortedValues([0.0]) in case __init__ is never called.
+        self._data = <double*>PyMem_Malloc(sizeof(double))
+        if self._data == NULL:
+            raise MemoryError()
+        self._data[0] = 0.0
+        self._length = 1
+
+    def __init__(self, values):
+        cdef const double[::1] view = as_doubles(values)
+        cdef Py_ssize_t n = view.shape[0]
+        if n < 1:
+            raise ValueError("At least one value is required.")
+
+        cdef double* data = <double*>PyMem_Malloc(n * sizeof(double))
+        if data == NULL:
+            raise MemoryError()
+        memcpy(data, &view[0], n * sizeof(double))
+
+        cdef Py_ssize_t i
+        for i in range(n):
+            if isnan(data[i]):
+                PyMem_Free(data)
+                raise ValueError("Values can't contain nan.")
+
+        with nogil:
+            qsort(data, n, sizeof(double), _compare)
+
+        PyMem_Free(self._data)
+        self._data = data
+        self._length = n
+
+    def __dealloc__(self):
+        PyMem_Free(self._data)
+
+    #region Kernels
+    cdef inline Py_ssize_t _lower_bound(self, double value) noexcept nogil:
+        # Index of the first value that is not less than value
+        cdef Py_ssize_t lo = 0
+        cdef Py_ssize_t hi = self._length
+        cdef Py_ssize_t mid
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._data[mid] < value:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    cdef inline double _closest(self, double value) noexcept nogil:
+        cdef Py_ssize_t i = self._lower_bound(value)
+        if i == 0:
+            return self._data[0]
+        if i == self._length:
+            return self._data[self._length - 1]
+
+        cdef double below = self._data[i - 1]
+        cdef double above = self._data[i]
+        if value - below <= above - value: # Ties go to the smaller value
+            return below
+        return above
+
+    cdef inline double _furthest(self, double value) noexcept nogil:
+        cdef double first = self._data[0]
+        cdef double last = self._data[self._length - 1]
+        if value - first >= last - value: # Ties go to the smaller value
+            return first
+        return last
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef object _select_many(self, object values, object out, bint furthest):
+        cdef DoubleOperand ov
+        keep_v = double_operand(values, &ov)
+        cdef Py_ssize_t n = resolve_length(ov.length)
+        if out is None:
+            out = new_double_array(n)
+        cdef double[::1] out_view = out
+        check_length(n, out_view.shape[0])
+
+        cdef Py_ssize_t i
+        with nogil:
+            if furthest:
+                for i in range(n):
+                    out_view[i] = self._furthest(ov.data[i * ov.step])
+            else:
+                for i in range(n):
+                    out_view[i] = self._closest(ov.data[i * ov.step])
+        return out
+    #endregion
+
+    def closest(self, double value):
+        return self._closest(value)
+
+    def furthest(self, double value):
+        return self._furthest(value)
+
+    def closest_many(self, values, out = None):
+        return self._select_many(values, out, False)
+
+    def furthest_many(self, values, out = None):
+        return self._select_many(values, out, True)
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, Py_ssize_t index):
+        if index < 0:
+            index += self._length
+        if index < 0 or index >= self._length:
+            raise IndexError("SortedValues index out of range")
+        return self._data[index]
+
+    def __iter__(self):
+        cdef Py_ssize_t i
+        for i in range(self._length):
+            yield self._data[i]
+
+    def __repr__(self):
+        return f"SortedValues([{', '.join(repr(x) for x in self)}])"
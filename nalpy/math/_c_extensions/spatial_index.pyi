@@ -0,0 +1,107 @@
+from typing import Hashable, Iterable, Iterator, TypeAlias, final
+from .rect import Rect
+from .rect_int import RectInt
+from .vector2 import Vector2
+from .vector2_int import Vector2Int
+
+_Shape: TypeAlias = Rect | RectInt | Vector2 | Vector2Int
+_Point: TypeAlias = Vector2 | Vector2Int
+
+class SpatialIndex:
+    """
+    Base class of the spatial indices. Maps hashable keys to shapes and answers geometric queries without checking every shape.
+
+    Rects are half-open like ``Rect.overlaps`` and ``Rect.contains``: ``[x, x + w)`` by ``[y, y + h)``. Points (and zero-sized rects) match queries like ``Rect.contains`` would match them.
+    Rects with a negative size are normalized. The results of queries are lists of keys in no particular order unless stated otherwise.
+
+    Can't be instantiated or subclassed directly, use (or subclass) ``QuadTree`` or ``SpatialHash`` instead.
+    """
+
+    def insert(self, key: Hashable, shape: _Shape) -> None:
+        """Add ``shape`` into the index under ``key``. If ``key`` is already in the index, its shape is replaced."""
+        ...
+
+    def insert_many(self, items: Iterable[tuple[Hashable, _Shape]]) -> None:
+        """Insert every ``(key, shape)`` pair, for example from ``dict.items()``."""
+        ...
+
+    def update(self, key: Hashable, shape: _Shape) -> None:
+        """Replace the shape of ``key``. Raises ``KeyError`` if ``key`` is not in the index."""
+        ...
+
+    def remove(self, key: Hashable) -> None:
+        """Remove ``key`` from the index. Raises ``KeyError`` if ``key`` is not in the index."""
+        ...
+
+    def clear(self) -> None:
+        """Remove every key from the index."""
+        ...
+
+    def query_rect(self, rect: Rect | RectInt) -> list[Hashable]:
+        """Keys of the shapes that overlap ``rect``."""
+        ...
+
+    def query_point(self, point: _Point) -> list[Hashable]:
+        """Keys of the shapes that contain ``point``."""
+        ...
+
+    def query_radius(self, center: _Point, radius: float) -> list[Hashable]:
+        """Keys of the shapes whose closest point is at most ``radius`` away from ``center``."""
+        ...
+
+    def nearest(self, point: _Point, k: int = 1) -> list[Hashable]:
+        """
+        Keys of the ``k`` shapes closest to ``point`` ordered from the closest to the furthest. Shapes that contain ``point`` have a distance of zero.
+
+        Fewer than ``k`` keys are returned if the index doesn't have enough shapes.
+        """
+        ...
+
+    def get(self, key: Hashable) -> _Shape:
+        """The shape of ``key`` as it was inserted. Raises ``KeyError`` if ``key`` is not in the index."""
+        ...
+
+    def __len__(self) -> int: ...
+
+    def __contains__(self, key: object) -> bool: ...
+
+    def __iter__(self) -> Iterator[Hashable]: ...
+
+@final
+class QuadTree(SpatialIndex):
+    """
+    A spatial index that recursively divides ``bounds`` into four quadrants whenever a quadrant has more than ``max_items`` shapes.
+
+    The quadrants are loose: a shape is stored in the quadrant that contains its center as long as the shape is at most as large as the quadrant.
+    Shapes that are too large or centered outside of ``bounds`` are stored in the root. Performs best when the shapes are small compared to ``bounds`` and unevenly distributed.
+
+    NOTE: Quadrants are not merged back when shapes are removed. Use ``clear()`` to free them.
+    """
+
+    def __init__(self, bounds: Rect | RectInt, max_items: int = 8, max_depth: int = 16) -> None: ...
+
+    @property
+    def node_count(self) -> int:
+        """The amount of quadrants in the tree, including the root."""
+        ...
+
+@final
+class SpatialHash(SpatialIndex):
+    """
+    A spatial index that divides the plane into an unbounded uniform grid of square cells. Each shape is stored in every cell that it touches.
+
+    Performs best when the shapes are roughly the size of ``cell_size`` or smaller and the queries are not much larger.
+    Shapes that would span a large amount of cells are checked by every query instead.
+
+    NOTE: Cells are not freed when they become empty. Use ``clear()`` to free them.
+    """
+
+    def __init__(self, cell_size: float) -> None: ...
+
+    @property
+    def cell_size(self) -> float: ...
+
+    @property
+    def cell_count(self) -> int:
+        """The amount of cells that have been allocated."""
+        ...
@@ -0,0 +1,996 @@
+#cython: language_level=3
+
+from cpython.mem cimport PyMem_Malloc, PyMem_Realloc, PyMem_Free
+from libc.math cimport floor, isfinite
+from libc.string cimport memset
+
+from .rect cimport Rect
+from .rect_int cimport RectInt
+from .vector2 cimport Vector2
+from .vector2_int cimport Vector2Int
+
+cdef enum:
+    # Items that would have to be inserted into more cells than this are kept in a separate list that every query checks.
+    _MAX_CELLS_PER_ITEM = 256
+
+#region Containers
+cdef struct _SlotList:
+    Py_ssize_t* data
+    Py_ssize_t count
+    Py_ssize_t capacity
+
+cdef int _push(_SlotList* l, Py_ssize_t value) except -1:
+    cdef Py_ssize_t capacity
+    cdef Py_ssize_t* data
+    if l.count == l.capacity:
+        capacity = 2 * l.capacity if l.capacity > 0 else 4
+        data = <Py_ssize_t*>PyMem_Realloc(l.data, capacity * sizeof(Py_ssize_t))
+        if data == NULL:
+            raise MemoryError()
+        l.data = data
+        l.capacity = capacity
+    l.data[l.count] = value
+    l.count += 1
+    return 0
+
+cdef void _discard(_SlotList* l, Py_ssize_t value) noexcept:
+    # Removes the first occurrence of value without preserving order.
+    cdef Py_ssize_t i
+    for i in range(l.count):
+        if l.data[i] == value:
+            l.count -= 1
+            l.data[i] = l.data[l.count]
+            return
+
+cdef void _release(_SlotList* l) noexcept:
+    PyMem_Free(l.data)
+    l.data = NULL
+    l.count = 0
+    l.capacity = 0
+
+cdef struct _HeapEntry:
+    double key
+    Py_ssize_t id
+    bint is_item
+
+cdef struct _Heap:
+    _HeapEntry* data
+    Py_ssize_t count
+    Py_ssize_t capacity
+
+cdef int _heap_push(_Heap* h, double key, Py_ssize_t id, bint is_item) except -1:
+    cdef Py_ssize_t capacity
+    cdef _HeapEntry* data
+    if h.count == h.capacity:
+        capacity = 2 * h.capacity if h.capacity > 0 else 16
+        data = <_HeapEntry*>PyMem_Realloc(h.data, capacity * sizeof(_HeapEntry))
+        if data == NULL:
+            raise MemoryError()
+        h.data = data
+        h.capacity = capacity
+
+    # Sift up
+    cdef Py_ssize_t i = h.count
+    cdef Py_ssize_t parent
+    h.count += 1
+    while i > 0:
+        parent = (i - 1) // 2
+        if h.data[parent].key <= key:
+            break
+        h.data[i] = h.data[parent]
+        i = parent
+    h.data[i].key = key
+    h.data[i].id = id
+    h.data[i].is_item = is_item
+    return 0
+
+cdef _HeapEntry _heap_pop(_Heap* h) noexcept:
+    # The heap must not be empty.
+    cdef _HeapEntry top = h.data[0]
+    h.count -= 1
+    cdef _HeapEntry last = h.data[h.count]
+
+    # Sift down
+    cdef Py_ssize_t i = 0
+    cdef Py_ssize_t child
+    while True:
+        child = 2 * i + 1
+        if child >= h.count:
+            break
+        if child + 1 < h.count and h.data[child + 1].key < h.data[child].key:
+            child += 1
+        if last.key <= h.data[child].key:
+            break
+        h.data[i] = h.data[child]
+        i = child
+    if h.count > 0:
+        h.data[i] = last
+    return top
+#endregion
+
+#region Geometry
+# Bounds are stored as (xmin, ymin, xmax, ymax) and are half-open like Rect: [xmin, xmax) x [ymin, ymax).
+# Along an axis where min == max (points), the item behaves like Rect.contains would for a point.
+cdef inline bint _axis_overlaps(double r0, double r1, double q0, double q1) noexcept nogil:
+    if r0 == r1:
+        return q0 <= r0 and r0 < q1
+    return r0 < q1 and r1 > q0
+
+cdef inline bint _axis_contains(double r0, double r1, double p) noexcept nogil:
+    if r0 == r1:
+        return p == r0
+    return r0 <= p and p < r1
+
+cdef inline double _distance2(const double* b, double px, double py) noexcept nogil:
+    # Squared distance from the point to the closest point of the bounds, zero if inside.
+    cdef double dx = 0.0
+    cdef double dy = 0.0
+    if px < b[0]:
+        dx = b[0] - px
+    elif px > b[2]:
+        dx = px - b[2]
+    if py < b[1]:
+        dy = b[1] - py
+    elif py > b[3]:
+        dy = py - b[3]
+    return dx * dx + dy * dy
+
+cdef int _shape_bounds(object shape, double* b) except -1:
+    cdef double x, y, w, h
+    if isinstance(shape, Rect):
+        x = (<Rect>shape).x
+        y = (<Rect>shape).y
+        w = (<Rect>shape).w
+        h = (<Rect>shape).h
+    elif isinstance(shape, RectInt):
+        x = <double>(<RectInt>shape).x
+        y = <double>(<RectInt>shape).y
+        w = <double>(<RectInt>shape).w
+        h = <double>(<RectInt>shape).h
+    elif isinstance(shape, Vector2):
+        x = (<Vector2>shape).x
+        y = (<Vector2>shape).y
+        w = h = 0.0
+    elif isinstance(shape, Vector2Int):
+        x = <double>(<Vector2Int>shape).x
+        y = <double>(<Vector2Int>shape).y
+        w = h = 0.0
+    else:
+        raise TypeError(f"Expected Rect, RectInt, Vector2 or Vector2Int, got {type(shape).__name__}.")
+
+    # Negative sizes are flipped so that min <= max
+    b[0] = min(x, x + w)
+    b[1] = min(y, y + h)
+    b[2] = max(x, x + w)
+    b[3] = max(y, y + h)
+    return 0
+
+cdef int _point(object point, double* px, double* py) except -1:
+    if isinstance(point, Vector2):
+        px[0] = (<Vector2>point).x
+        py[0] = (<Vector2>point).y
+    elif isinstance(point, Vector2Int):
+        px[0] = <double>(<Vector2Int>point).x
+        py[0] = <double>(<Vector2Int>point).y
+    else:
+        raise TypeError(f"Expected Vector2 or Vector2Int, got {type(point).__name__}.")
+    return 0
+#endregion
+
+
+cdef class SpatialIndex:
+    cdef list _keys # Key of each slot, None for free slots
+    cdef list _shapes # Shape of each slot as it was inserted
+    cdef dict _slots # Key to slot
+    cdef _SlotList _free
+
+    # Per slot data
+    cdef Py_ssize_t _capacity
+    cdef double* _bounds
+    cdef Py_ssize_t* _location # Implementation defined
+    cdef unsigned int* _stamp # Query stamp of the slot, used to deduplicate candidates
+
+    cdef unsigned int _query_stamp
+
+    def __cinit__(self):
+        # Checked here instead of __init__ so that __new__ can't create instances without an implementation either.
+        # Python subclasses would reach the abstract methods below, so only QuadTree and SpatialHash can be subclassed.
+        if not isinstance(self, (QuadTree, SpatialHash)):
+            raise TypeError("SpatialIndex can't be instantiated directly, use QuadTree or SpatialHash instead.")
+        self._keys = []
+        self._shapes = []
+        self._slots = {}
+
+    def __dealloc__(self):
+        _release(&self._free)
+        PyMem_Free(self._bounds)
+        PyMem_Free(self._location)
+        PyMem_Free(self._stamp)
+
+    #region Implementation
+    # Overridden by QuadTree and SpatialHash, __cinit__ makes sure that every instance is one of them.
+    cdef int _attach(self, Py_ssize_t slot) except -1:
+        raise NotImplementedError()
+
+    cdef int _detach(self, Py_ssize_t slot) except -1:
+        raise NotImplementedError()
+
+    cdef int _candidates(self, double x0, double y0, double x1, double y1, _SlotList* out) except -1:
+        # Appends every slot whose bounds might intersect the closed box [x0, x1] x [y0, y1]. Each slot at most once.
+        raise NotImplementedError()
+
+    cdef int _nearest(self, double px, double py, Py_ssize_t k, _SlotList* out) except -1:
+        # Appends the k slots closest to the point ordered by distance.
+        raise NotImplementedError()
+
+    cdef int _reset(self) except -1:
+        raise NotImplementedError()
+    #endregion
+
+    #region Slots
+    cdef int _grow(self) except -1:
+        cdef Py_ssize_t capacity = 2 * self._capacity if self._capacity > 0 else 64
+        cdef double* bounds = <double*>PyMem_Realloc(self._bounds, 4 * capacity * sizeof(double))
+        if bounds == NULL:
+            raise MemoryError()
+        self._bounds = bounds
+        cdef Py_ssize_t* location = <Py_ssize_t*>PyMem_Realloc(self._location, capacity * sizeof(Py_ssize_t))
+        if location == NULL:
+            raise MemoryError()
+        self._location = location
+        cdef unsigned int* stamp = <unsigned int*>PyMem_Realloc(self._stamp, capacity * sizeof(unsigned int))
+        if stamp == NULL:
+            raise MemoryError()
+        memset(stamp + self._capacity, 0, (capacity - self._capacity) * sizeof(unsigned int))
+        self._stamp = stamp
+        self._capacity = capacity
+        return 0
+
+    cdef Py_ssize_t _allocate(self, object key) except -1:
+        cdef Py_ssize_t slot
+        if self._free.count > 0:
+            self._free.count -= 1
+            slot = self._free.data[self._free.count]
+            self._keys[slot] = key
+            self._shapes[slot] = None
+        else:
+            slot = len(self._keys)
+            if slot == self._capacity:
+                self._grow()
+            self._keys.append(key)
+            self._shapes.append(None)
+        self._slots[key] = slot
+        return slot
+
+    cdef unsigned int _next_stamp(self) noexcept:
+        self._query_stamp += 1
+        if self._query_stamp == 0: # Wrapped around, old stamps could collide with new ones.
+            memset(self._stamp, 0, self._capacity * sizeof(unsigned int))
+            self._query_stamp = 1
+        return self._query_stamp
+
+    cdef int _insert(self, object key, object shape) except -1:
+        cdef double b[4]
+        _shape_bounds(shape, b)
+
+        cdef Py_ssize_t slot
+        existing = self._slots.get(key)
+        if existing is not None:
+            slot = existing
+            self._detach(slot)
+        else:
+            slot = self._allocate(key)
+
+        self._bounds[4 * slot] = b[0]
+        self._bounds[4 * slot + 1] = b[1]
+        self._bounds[4 * slot + 2] = b[2]
+        self._bounds[4 * slot + 3] = b[3]
+        self._shapes[slot] = shape
+        self._attach(slot)
+        return 0
+
+    cdef list _to_keys(self, _SlotList* slots):
+        cdef Py_ssize_t i
+        return [self._keys[slots.data[i]] for i in range(slots.count)]
+    #endregion
+
+    #region Modification
+    def insert(self, key, shape):
+        self._insert(key, shape)
+
+    def insert_many(self, items):
+        for key, shape in items:
+            self._insert(key, shape)
+
+    def update(self, key, shape):
+        if key not in self._slots:
+            raise KeyError(key)
+        self._insert(key, shape)
+
+    def remove(self, key):
+        cdef Py_ssize_t slot = self._slots.pop(key)
+        self._detach(slot)
+        self._keys[slot] = None
+        self._shapes[slot] = None
+        _push(&self._free, slot)
+
+    def clear(self):
+        self._keys = []
+        self._shapes = []
+        self._slots = {}
+        self._free.count = 0
+        self._reset()
+    #endregion
+
+    #region Queries
+    def query_rect(self, rect):
+        cdef double q[4]
+        if not isinstance(rect, (Rect, RectInt)):
+            raise TypeError(f"Expected Rect or RectInt, got {type(rect).__name__}.")
+        _shape_bounds(rect, q)
+
+        cdef _SlotList candidates
+        candidates.data = NULL
+        candidates.count = 0
+        candidates.capacity = 0
+
+        cdef Py_ssize_t i, slot
+        cdef Py_ssize_t count = 0
+        cdef const double* b
+        try:
+            self._candidates(q[0], q[1], q[2], q[3], &candidates)
+            for i in range(candidates.count):
+                slot = candidates.data[i]
+                b = self._bounds + 4 * slot
+                if _axis_overlaps(b[0], b[2], q[0], q[2]) and _axis_overlaps(b[1], b[3], q[1], q[3]):
+                    candidates.data[count] = slot
+                    count += 1
+            candidates.count = count
+            return self._to_keys(&candidates)
+        finally:
+            _release(&candidates)
+
+    def query_point(self, point):
+        cdef double px, py
+        _point(point, &px, &py)
+
+        cdef _SlotList candidates
+        candidates.data = NULL
+        candidates.count = 0
+        candidates.capacity = 0
+
+        cdef Py_ssize_t i, slot
+        cdef Py_ssize_t count = 0
+        cdef const double* b
+        try:
+            self._candidates(px, py, px, py, &candidates)
+            for i in range(candidates.count):
+                slot = candidates.data[i]
+                b = self._bounds + 4 * slot
+                if _axis_contains(b[0], b[2], px) and _axis_contains(b[1], b[3], py):
+                    candidates.data[count] = slot
+                    count += 1
+            candidates.count = count
+            return self._to_keys(&candidates)
+        finally:
+            _release(&candidates)
+
+    def query_radius(self, center, double radius):
+        cdef double px, py
+        _point(center, &px, &py)
+        if not radius >= 0.0:
+            raise ValueError("Radius must be non-negative.")
+
+        cdef _SlotList candidates
+        candidates.data = NULL
+        candidates.count = 0
+        candidates.capacity = 0
+
+        cdef double radius2 = radius * radius
+        cdef Py_ssize_t i, slot
+        cdef Py_ssize_t count = 0
+        try:
+            self._candidates(px - radius, py - radius, px + radius, py + radius, &candidates)
+            for i in range(candidates.count):
+                slot = candidates.data[i]
+                if _distance2(self._bounds + 4 * slot, px, py) <= radius2:
+                    candidates.data[count] = slot
+                    count += 1
+            candidates.count = count
+            return self._to_keys(&candidates)
+        finally:
+            _release(&candidates)
+
+    def nearest(self, point, Py_ssize_t k = 1):
+        cdef double px, py
+        _point(point, &px, &py)
+        if k < 0:
+            raise ValueError("k must be non-negative.")
+
+        cdef _SlotList result
+        result.data = NULL
+        result.count = 0
+        result.capacity = 0
+        try:
+            if k > 0 and len(self._slots) > 0:
+                self._nearest(px, py, k, &result)
+            return self._to_keys(&result)
+        finally:
+            _release(&result)
+    #endregion
+
+    def get(self, key):
+        return self._shapes[self._slots[key]]
+
+    def __len__(self):
+        return len(self._slots)
+
+    def __contains__(self, key):
+        return key in self._slots
+
+    def __iter__(self):
+        return iter(self._slots)
+
+
+#region Quadtree
+cdef struct _Node:
+    double x0
+    double y0
+    double x1
+    double y1
+    Py_ssize_t child # Index of the first of four children, -1 for leaves
+    int depth
+    _SlotList items
+
+cdef class QuadTree(SpatialIndex):
+    cdef _Node* _nodes
+    cdef Py_ssize_t _node_count
+    cdef Py_ssize_t _node_capacity
+
+    cdef double _root[4]
+    cdef Py_ssize_t _max_items
+    cdef int _max_depth
+
+    def __cinit__(self):
+        # Queries and inserts assume that the root exists, create an empty one in case __init__ is never called.
+        self._max_items = 8
+        self._max_depth = 16
+        self._reset()
+
+    def __init__(self, bounds, Py_ssize_t max_items = 8, int max_depth = 16):
+        if not isinstance(bounds, (Rect, RectInt)):
+            raise TypeError(f"Expected Rect or RectInt, got {type(bounds).__name__}.")
+        if max_items < 1:
+            raise ValueError("max_items must be at least 1.")
+        if max_depth < 0:
+            raise ValueError("max_depth must be non-negative.")
+
+        _shape_bounds(bounds, self._root)
+        self._max_items = max_items
+        self._max_depth = max_depth
+        self.clear()
+
+    def __dealloc__(self):
+        self._free_nodes()
+
+    cdef void _free_nodes(self) noexcept:
+        cdef Py_ssize_t i
+        for i in range(self._node_count):
+            _release(&self._nodes[i].items)
+        PyMem_Free(self._nodes)
+        self._nodes = NULL
+        self._node_count = 0
+        self._node_capacity = 0
+
+    cdef Py_ssize_t _new_node(self, double x0, double y0, double x1, double y1, int depth) except -1:
+        # NOTE: Invalidates pointers into _nodes
+        cdef Py_ssize_t capacity
+        cdef _Node* nodes
+        if self._node_count == self._node_capacity:
+            capacity = 2 * self._node_capacity if self._node_capacity > 0 else 16
+            nodes = <_Node*>PyMem_Realloc(self._nodes, capacity * sizeof(_Node))
+            if nodes == NULL:
+                raise MemoryError()
+            self._nodes = nodes
+            self._node_capacity = capacity
+
+        cdef Py_ssize_t index = self._node_count
+        cdef _Node* node = &self._nodes[index]
+        node.x0 = x0
+        node.y0 = y0
+        node.x1 = x1
+        node.y1 = y1
+        node.child = -1
+        node.depth = depth
+        node.items.data = NULL
+        node.items.count = 0
+        node.items.capacity = 0
+        self._node_count += 1
+        return index
+
+    cdef Py_ssize_t _child_for(self, Py_ssize_t index, const double* b) noexcept:
+        # Loose quadtree: the child is chosen by the center of the bounds and it can hold bounds up to its own size,
+        # so every item of a child is within the child's region expanded by half of its size on each side.
+        # Returns -1 if the bounds are too large for the children or their center is outside of the node (only possible at the root).
+        cdef _Node* node = &self._nodes[index]
+        cdef double mx = (node.x0 + node.x1) / 2.0
+        cdef double my = (node.y0 + node.y1) / 2.0
+        if not (b[2] - b[0] <= mx - node.x0 and b[3] - b[1] <= my - node.y0): # Also nan
+            return -1
+
+        cdef double cx = (b[0] + b[2]) / 2.0
+        cdef double cy = (b[1] + b[3]) / 2.0
+        if not (node.x0 <= cx and cx <= node.x1 and node.y0 <= cy and cy <= node.y1):
+            return -1
+
+        cdef int quadrant = 0
+        if cx >= mx:
+            quadrant += 1
+        if cy >= my:
+            quadrant += 2
+        return node.child + quadrant
+
+    cdef void _loose_bounds(self, Py_ssize_t index, double* out) noexcept:
+        cdef _Node* node = &self._nodes[index]
+        cdef double hw = (node.x1 - node.x0) / 2.0
+        cdef double hh = (node.y1 - node.y0) / 2.0
+        out[0] = node.x0 - hw
+        out[1] = node.y0 - hh
+        out[2] = node.x1 + hw
+        out[3] = node.y1 + hh
+
+    cdef int _split(self, Py_ssize_t index) except -1:
+        cdef _Node* node = &self._nodes[index]
+        cdef double x0 = node.x0
+        cdef double y0 = node.y0
+        cdef double x1 = node.x1
+        cdef double y1 = node.y1
+        cdef double mx = (x0 + x1) / 2.0
+        cdef double my = (y0 + y1) / 2.0
+        cdef int depth = node.depth + 1
+
+        cdef Py_ssize_t first = self._new_node(x0, y0, mx, my, depth)
+        self._new_node(mx, y0, x1, my, depth)
+        self._new_node(x0, my, mx, y1, depth)
+        self._new_node(mx, my, x1, y1, depth)
+        node = &self._nodes[index]
+        node.child = first
+
+        # Move the items that fit into a child
+        cdef Py_ssize_t i = 0
+        cdef Py_ssize_t slot, child
+        while i < node.items.count:
+            slot = node.items.data[i]
+            child = self._child_for(index, self._bounds + 4 * slot)
+            if child == -1:
+                i += 1
+                continue
+            node.items.count -= 1
+            node.items.data[i] = node.items.data[node.items.count]
+            _push(&self._nodes[child].items, slot)
+            self._location[slot] = child
+
+        for child in range(first, first + 4):
+            if self._nodes[child].items.count > self._max_items and depth < self._max_depth:
+                self._split(child)
+        return 0
+
+    cdef int _attach(self, Py_ssize_t slot) except -1:
+        cdef const double* b = self._bounds + 4 * slot
+        cdef Py_ssize_t index = 0
+        cdef Py_ssize_t child
+        while self._nodes[index].child != -1:
+            child = self._child_for(index, b)
+            if child == -1:
+                break
+            index = child
+
+        _push(&self._nodes[index].items, slot)
+        self._location[slot] = index
+        if self._nodes[index].child == -1 and self._nodes[index].items.count > self._max_items and self._nodes[index].depth < self._max_depth:
+            self._split(index)
+        return 0
+
+    cdef int _detach(self, Py_ssize_t slot) except -1:
+        # NOTE: Empty nodes are not merged back into their parents.
+        _discard(&self._nodes[self._location[slot]].items, slot)
+        return 0
+
+    cdef int _candidates(self, double x0, double y0, double x1, double y1, _SlotList* out) except -1:
+        if not (x0 <= x1 and y0 <= y1): # Also nan
+            return 0
+
+        cdef _SlotList stack
+        stack.data = NULL
+        stack.count = 0
+        stack.capacity = 0
+
+        cdef Py_ssize_t index, i, child
+        cdef _Node* node
+        cdef double region[4]
+        try:
+            _push(&stack, 0) # Items outside of the root bounds are stored in the root, so it is always visited.
+            while stack.count > 0:
+                stack.count -= 1
+                index = stack.data[stack.count]
+                node = &self._nodes[index]
+                for i in range(node.items.count):
+                    _push(out, node.items.data[i])
+
+                if node.child != -1:
+                    for child in range(node.child, node.child + 4):
+                        self._loose_bounds(child, region)
+                        if region[0] <= x1 and region[2] >= x0 and region[1] <= y1 and region[3] >= y0:
+                            _push(&stack, child)
+        finally:
+            _release(&stack)
+        return 0
+
+    cdef int _nearest(self, double px, double py, Py_ssize_t k, _SlotList* out) except -1:
+        # Best-first search, nodes are keyed by the distance to their loose bounds which is a lower bound for every item inside.
+        cdef _Heap heap
+        heap.data = NULL
+        heap.count = 0
+        heap.capacity = 0
+
+        cdef _HeapEntry entry
+        cdef _Node* node
+        cdef Py_ssize_t i, child
+        cdef double region[4]
+        try:
+            _heap_push(&heap, 0.0, 0, False) # Root might contain items outside of its bounds
+            while heap.count > 0:
+                entry = _heap_pop(&heap)
+                if entry.is_item:
+                    _push(out, entry.id)
+                    if out.count == k:
+                        break
+                    continue
+
+                node = &self._nodes[entry.id]
+                for i in range(node.items.count):
+                    _heap_push(&heap, _distance2(self._bounds + 4 * node.items.data[i], px, py), node.items.data[i], True)
+                if node.child != -1:
+                    for child in range(node.child, node.child + 4):
+                        self._loose_bounds(child, region)
+                        _heap_push(&heap, _distance2(region, px, py), child, False)
+        finally:
+            PyMem_Free(heap.data)
+        return 0
+
+    cdef int _reset(self) except -1:
+        self._free_nodes()
+        self._new_node(self._root[0], self._root[1], self._root[2], self._root[3], 0)
+        return 0
+
+    @property
+    def node_count(self):
+        return self._node_count
+#endregion
+
+
+#region Spatial hash
+cdef struct _Cell:
+    long long cx
+    long long cy
+    bint used
+    _SlotList items
+
+cdef inline size_t _cell_hash(long long cx, long long cy) noexcept nogil:
+    return <size_t>((<unsigned long long>cx * 0x9E3779B97F4A7C15ULL) ^ (<unsigned long long>cy * 0xC2B2AE3D27D4EB4FULL))
+
+cdef class SpatialHash(SpatialIndex):
+    cdef double _cell_size
+    cdef double _inverse_cell_size
+
+    # Open addressing hash table, capacity is a power of two. Empty cells are kept.
+    cdef _Cell* _cells
+    cdef Py_ssize_t _cell_count
+    cdef Py_ssize_t _cell_capacity
+
+    cdef _SlotList _oversized # Items that span too many cells or have non-finite bounds
+
+    # Bounding box of all cells ever used
+    cdef long long _min_cx
+    cdef long long _min_cy
+    cdef long long _max_cx
+    cdef long long _max_cy
+
+    def __init__(self, double cell_size):
+        if not (cell_size > 0.0 and isfinite(cell_size)):
+            raise ValueError("Cell size must be positive and finite.")
+        self._cell_size = cell_size
+        self._inverse_cell_size = 1.0 / cell_size
+        self.clear()
+
+    def __dealloc__(self):
+        self._free_cells()
+        _release(&self._oversized)
+
+    cdef void _free_cells(self) noexcept:
+        cdef Py_ssize_t i
+        for i in range(self._cell_capacity):
+            if self._cells[i].used:
+                _release(&self._cells[i].items)
+        PyMem_Free(self._cells)
+        self._cells = NULL
+        self._cell_count = 0
+        self._cell_capacity = 0
+
+    #region Cells
+    cdef _Cell* _find(self, long long cx, long long cy) noexcept:
+        if self._cell_capacity == 0:
+            return NULL
+        cdef size_t mask = <size_t>self._cell_capacity - 1
+        cdef size_t i = _cell_hash(cx, cy) & mask
+        cdef _Cell* cell
+        while True:
+            cell = &self._cells[i]
+            if not cell.used:
+                return NULL
+            if cell.cx == cx and cell.cy == cy:
+                return cell
+            i = (i + 1) & mask
+
+    cdef int _resize(self, Py_ssize_t capacity) except -1:
+        cdef _Cell* cells = <_Cell*>PyMem_Malloc(capacity * sizeof(_Cell))
+        if cells == NULL:
+            raise MemoryError()
+        memset(cells, 0, capacity * sizeof(_Cell))
+
+        cdef size_t mask = <size_t>capacity - 1
+        cdef size_t j
+        cdef Py_ssize_t i
+        for i in range(self._cell_capacity):
+            if self._cells[i].used:
+                j = _cell_hash(self._cells[i].cx, self._cells[i].cy) & mask
+                while cells[j].used:
+                    j = (j + 1) & mask
+                cells[j] = self._cells[i]
+
+        PyMem_Free(self._cells)
+        self._cells = cells
+        self._cell_capacity = capacity
+        return 0
+
+    cdef _Cell* _get_or_create(self, long long cx, long long cy) except NULL:
+        cdef _Cell* cell = self._find(cx, cy)
+        if cell != NULL:
+            return cell
+
+        if 2 * (self._cell_count + 1) > self._cell_capacity:
+            self._resize(2 * self._cell_capacity if self._cell_capacity > 0 else 64)
+
+        cdef size_t mask = <size_t>self._cell_capacity - 1
+        cdef size_t i = _cell_hash(cx, cy) & mask
+        while self._cells[i].used:
+            i = (i + 1) & mask
+        cell = &self._cells[i]
+        cell.cx = cx
+        cell.cy = cy
+        cell.used = True
+        cell.items.data = NULL
+        cell.items.count = 0
+        cell.items.capacity = 0
+
+        if self._cell_count == 0:
+            self._min_cx = self._max_cx = cx
+            self._min_cy = self._max_cy = cy
+        else:
+            self._min_cx = min(self._min_cx, cx)
+            self._min_cy = min(self._min_cy, cy)
+            self._max_cx = max(self._max_cx, cx)
+            self._max_cy = max(self._max_cy, cy)
+        self._cell_count += 1
+        return cell
+
+    cdef bint _cell_range(self, const double* b, long long* cx0, long long* cy0, long long* cx1, long long* cy1) noexcept:
+        # Cells covered by the bounds. False if the bounds should be stored in the oversized list instead.
+        if not (isfinite(b[0]) and isfinite(b[1]) and isfinite(b[2]) and isfinite(b[3])):
+            return False
+        cdef double fx0 = floor(b[0] * self._inverse_cell_size)
+        cdef double fy0 = floor(b[1] * self._inverse_cell_size)
+        cdef double fx1 = floor(b[2] * self._inverse_cell_size)
+        cdef double fy1 = floor(b[3] * self._inverse_cell_size)
+        if (fx1 - fx0 + 1.0) * (fy1 - fy0 + 1.0) > _MAX_CELLS_PER_ITEM:
+            return False
+        if not (-4.0e18 <= fx0 and fx1 <= 4.0e18 and -4.0e18 <= fy0 and fy1 <= 4.0e18): # Wouldn't fit into a long long
+            return False
+        cx0[0] = <long long>fx0
+        cy0[0] = <long long>fy0
+        cx1[0] = <long long>fx1
+        cy1[0] = <long long>fy1
+        return True
+    #endregion
+
+    cdef int _attach(self, Py_ssize_t slot) except -1:
+        cdef long long cx0, cy0, cx1, cy1, cx, cy
+        if not self._cell_range(self._bounds + 4 * slot, &cx0, &cy0, &cx1, &cy1):
+            _push(&self._oversized, slot)
+            return 0
+
+        for cy in range(cy0, cy1 + 1):
+            for cx in range(cx0, cx1 + 1):
+                _push(&self._get_or_create(cx, cy).items, slot)
+        return 0
+
+    cdef int _detach(self, Py_ssize_t slot) except -1:
+        cdef long long cx0, cy0, cx1, cy1, cx, cy
+        cdef _Cell* cell
+        if not self._cell_range(self._bounds + 4 * slot, &cx0, &cy0, &cx1, &cy1):
+            _discard(&self._oversized, slot)
+            return 0
+
+        for cy in range(cy0, cy1 + 1):
+            for cx in range(cx0, cx1 + 1):
+                cell = self._find(cx, cy)
+                if cell != NULL:
+                    _discard(&cell.items, slot)
+        return 0
+
+    cdef int _collect_cell(self, _Cell* cell, unsigned int stamp, _SlotList* out) except -1:
+        cdef Py_ssize_t i, slot
+        for i in range(cell.items.count):
+            slot = cell.items.data[i]
+            if self._stamp[slot] != stamp:
+                self._stamp[slot] = stamp
+                _push(out, slot)
+        return 0
+
+    cdef int _candidates(self, double x0, double y0, double x1, double y1, _SlotList* out) except -1:
+        cdef Py_ssize_t i
+        for i in range(self._oversized.count):
+            _push(out, self._oversized.data[i])
+
+        if not (x0 <= x1 and y0 <= y1) or self._cell_count == 0: # Also nan
+            return 0
+
+        # Clamp to the used cells in floating point so that huge and infinite queries don't overflow.
+        cdef double fx0 = max(floor(x0 * self._inverse_cell_size), <double>self._min_cx)
+        cdef double fy0 = max(floor(y0 * self._inverse_cell_size), <double>self._min_cy)
+        cdef double fx1 = min(floor(x1 * self._inverse_cell_size), <double>self._max_cx)
+        cdef double fy1 = min(floor(y1 * self._inverse_cell_size), <double>self._max_cy)
+        if fx0 > fx1 or fy0 > fy1:
+            return 0
+
+        cdef unsigned int stamp = self._next_stamp()
+        cdef long long cx0 = <long long>fx0
+        cdef long long cy0 = <long long>fy0
+        cdef long long cx1 = <long long>fx1
+        cdef long long cy1 = <long long>fy1
+        cdef long long cx, cy
+        cdef _Cell* cell
+        if (fx1 - fx0 + 1.0) * (fy1 - fy0 + 1.0) > <double>self._cell_count:
+            # Cheaper to scan the table than to look up every cell of the range
+            for i in range(self._cell_capacity):
+                cell = &self._cells[i]
+                if cell.used and cx0 <= cell.cx <= cx1 and cy0 <= cell.cy <= cy1:
+                    self._collect_cell(cell, stamp, out)
+        else:
+            for cy in range(cy0, cy1 + 1):
+                for cx in range(cx0, cx1 + 1):
+                    cell = self._find(cx, cy)
+                    if cell != NULL:
+                        self._collect_cell(cell, stamp, out)
+        return 0
+
+    cdef int _push_cell(self, _Cell* cell, unsigned int stamp, double px, double py, _Heap* heap) except -1:
+        cdef Py_ssize_t i, slot
+        for i in range(cell.items.count):
+            slot = cell.items.data[i]
+            if self._stamp[slot] != stamp:
+                self._stamp[slot] = stamp
+                _heap_push(heap, _distance2(self._bounds + 4 * slot, px, py), slot, True)
+        return 0
+
+    cdef Py_ssize_t _push_row(self, long long cy, long long cx0, long long cx1, unsigned int stamp, double px, double py, _Heap* heap) except -1:
+        # Pushes the cells (cx0, cy) ... (cx1, cy) clamped to the used cells and returns the amount of lookups.
+        if cy < self._min_cy or cy > self._max_cy:
+            return 0
+        cx0 = max(cx0, self._min_cx)
+        cx1 = min(cx1, self._max_cx)
+        cdef long long cx
+        cdef _Cell* cell
+        for cx in range(cx0, cx1 + 1):
+            cell = self._find(cx, cy)
+            if cell != NULL:
+                self._push_cell(cell, stamp, px, py, heap)
+        return <Py_ssize_t>max(0, cx1 - cx0 + 1)
+
+    cdef Py_ssize_t _push_column(self, long long cx, long long cy0, long long cy1, unsigned int stamp, double px, double py, _Heap* heap) except -1:
+        if cx < self._min_cx or cx > self._max_cx:
+            return 0
+        cy0 = max(cy0, self._min_cy)
+        cy1 = min(cy1, self._max_cy)
+        cdef long long cy
+        cdef _Cell* cell
+        for cy in range(cy0, cy1 + 1):
+            cell = self._find(cx, cy)
+            if cell != NULL:
+                self._push_cell(cell, stamp, px, py, heap)
+        return <Py_ssize_t>max(0, cy1 - cy0 + 1)
+
+    cdef int _nearest(self, double px, double py, Py_ssize_t k, _SlotList* out) except -1:
+        cdef _Heap heap
+        heap.data = NULL
+        heap.count = 0
+        heap.capacity = 0
+
+        cdef unsigned int stamp = self._next_stamp()
+        cdef Py_ssize_t i, slot
+        cdef long long pcx, pcy, r, r_min, r_max
+        cdef Py_ssize_t lookups = 0
+        cdef bint scan_all = False
+        cdef double bound
+        try:
+            for i in range(self._oversized.count):
+                slot = self._oversized.data[i]
+                _heap_push(&heap, _distance2(self._bounds + 4 * slot, px, py), slot, True)
+
+            if self._cell_count > 0:
+                pcx = self._clamped_cell(px)
+                pcy = self._clamped_cell(py)
+                # Rings outside of the used cells are skipped entirely
+                r_min = max(0, max(max(self._min_cx - pcx, pcx - self._max_cx), max(self._min_cy - pcy, pcy - self._max_cy)))
+                r_max = max(max(pcx - self._min_cx, self._max_cx - pcx), max(pcy - self._min_cy, self._max_cy - pcy))
+                if not (isfinite(px) and isfinite(py)):
+                    scan_all = True # Every distance is inf or nan
+                    r_max = -1
+
+                for r in range(r_min, r_max + 1):
+                    if lookups > 2 * self._cell_count + 64:
+                        scan_all = True # The rings are mostly empty, visiting every cell is cheaper.
+                        break
+
+                    # Square ring of cells r cells away from the point's cell
+                    if r == 0:
+                        lookups += self._push_row(pcy, pcx, pcx, stamp, px, py, &heap)
+                    else:
+                        lookups += self._push_row(pcy - r, pcx - r, pcx + r, stamp, px, py, &heap)
+                        lookups += self._push_row(pcy + r, pcx - r, pcx + r, stamp, px, py, &heap)
+                        lookups += self._push_column(pcx - r, pcy - r + 1, pcy + r - 1, stamp, px, py, &heap)
+                        lookups += self._push_column(pcx + r, pcy - r + 1, pcy + r - 1, stamp, px, py, &heap)
+
+                    # Items that haven't been pushed yet are at least as far away as the edge of the visited square.
+                    bound = min(
+                        min(px - <double>(pcx - r) * self._cell_size, <double>(pcx + r + 1) * self._cell_size - px),
+                        min(py - <double>(pcy - r) * self._cell_size, <double>(pcy + r + 1) * self._cell_size - py)
+                    )
+                    if bound > 0.0:
+                        while heap.count > 0 and heap.data[0].key <= bound * bound:
+                            _push(out, _heap_pop(&heap).id)
+                            if out.count == k:
+                                return 0
+
+                if scan_all:
+                    for i in range(self._cell_capacity):
+                        if self._cells[i].used:
+                            self._push_cell(&self._cells[i], stamp, px, py, &heap)
+
+            while heap.count > 0 and out.count < k:
+                _push(out, _heap_pop(&heap).id)
+        finally:
+            PyMem_Free(heap.data)
+        return 0
+
+    cdef long long _clamped_cell(self, double p) noexcept:
+        cdef double f = floor(p * self._inverse_cell_size)
+        if not (f >= -4.0e18): # Also nan
+            return -4000000000000000000LL
+        if f > 4.0e18:
+            return 4000000000000000000LL
+        return <long long>f
+
+    cdef int _reset(self) except -1:
+        self._free_cells()
+        self._oversized.count = 0
+        return 0
+
+    @property
+    def cell_size(self):
+        return self._cell_size
+
+    @property
+    def cell_count(self):
+        return self._cell_count
+#endregion
@@ -0,0 +1,69 @@
+from typing import Hashable, Iterable, Iterator, final
+from .rect import Rect
+from .rect_int import RectInt
+
+@final
+class SweepAndPrune:
+    """
+    A broad phase that keeps track of which rects overlap each other as they move.
+
+    Keeps the edges of the rects sorted along both axes. When the rects move only a little between frames,
+    the edges are re-sorted in close to linear time and only the rects whose edges pass each other are checked.
+    Unlike rebuilding a ``QuadTree`` or a ``SpatialHash`` every frame, the cost depends on how much the rects moved.
+
+    Rects are half-open like ``Rect.overlaps``: rects that only touch don't overlap. Rects with a negative size are not normalized, they overlap exactly when ``Rect.overlaps`` says so.
+
+    Changes are applied lazily when ``pairs()`` or ``pop_events()`` is called, so updating every rect once per frame and then calling ``pop_events()`` is the intended usage.
+    """
+
+    def __init__(self) -> None: ...
+
+    def insert(self, key: Hashable, rect: Rect | RectInt) -> None:
+        """Add ``rect`` under ``key``. If ``key`` is already added, its rect is replaced."""
+        ...
+
+    def insert_many(self, items: Iterable[tuple[Hashable, Rect | RectInt]]) -> None:
+        """Insert every ``(key, rect)`` pair. Inserting many rects at once sorts them from scratch, which is much faster than inserting them one by one."""
+        ...
+
+    def update(self, key: Hashable, rect: Rect | RectInt) -> None:
+        """Move ``key`` to ``rect``. Raises ``KeyError`` if ``key`` has not been added."""
+        ...
+
+    def update_many(self, items: Iterable[tuple[Hashable, Rect | RectInt]]) -> None:
+        """Update every ``(key, rect)`` pair. Raises ``KeyError`` if a key has not been added."""
+        ...
+
+    def remove(self, key: Hashable) -> None:
+        """
+        Remove ``key``. The overlaps that ``key`` had are ended. Raises ``KeyError`` if ``key`` has not been added.
+
+        Takes time proportional to the number of overlaps of ``key``, its edges are dropped by the next flush.
+        """
+        ...
+
+    def clear(self) -> None:
+        """Remove every key. No events are emitted and pending events are discarded."""
+        ...
+
+    def pairs(self) -> list[tuple[Hashable, Hashable]]:
+        """Every pair of keys whose rects overlap, in no particular order."""
+        ...
+
+    def pop_events(self) -> tuple[list[tuple[Hashable, Hashable]], list[tuple[Hashable, Hashable]]]:
+        """
+        The pairs of keys that started overlapping and the pairs that stopped overlapping since the last call, as ``(began, ended)``.
+
+        A pair that both began and ended since the last call is in both lists. Process ``ended`` first to apply the events in a consistent order.
+        """
+        ...
+
+    def get(self, key: Hashable) -> Rect | RectInt:
+        """The rect of ``key`` as it was inserted or last updated. Raises ``KeyError`` if ``key`` has not been added."""
+        ...
+
+    def __len__(self) -> int: ...
+
+    def __contains__(self, key: object) -> bool: ...
+
+    def __iter__(self) -> Iterator[Hashable]: ...
@@ -0,0 +1,400 @@
+#cython: language_level=3
+
+cimport cython
+from cpython.mem cimport PyMem_Malloc, PyMem_Realloc, PyMem_Free
+from cpython.set cimport PySet_Add, PySet_Contains, PySet_Discard
+from libc.math cimport isnan
+from libc.stdlib cimport qsort
+
+from .rect cimport Rect
+from .rect_int cimport RectInt
+
+cdef enum:
+    # Flushes that insert more rects than this sort from scratch instead of moving every new endpoint one step at a time.
+    _REBUILD_THRESHOLD = 64
+
+ctypedef enum _SlotState:
+    _FREE
+    _INSERTED # Inserted since the last flush, no endpoint values or pairs yet
+    _FLUSHED
+    _REMOVED # Endpoints are still in the arrays until the next flush, the slot can't be reused before that
+
+# Endpoints are sorted by value. At equal values max endpoints come before min endpoints, which makes touching rects not overlap like in Rect.overlaps.
+cdef struct _Endpoint:
+    double value
+    Py_ssize_t id # 2 * slot for the max endpoint, 2 * slot + 1 for the min endpoint
+
+cdef inline bint _before(const _Endpoint* a, const _Endpoint* b) noexcept nogil:
+    return a.value < b.value or (a.value == b.value and (a.id & 1) < (b.id & 1))
+
+cdef int _compare_endpoints(const void* a, const void* b) noexcept nogil:
+    if _before(<const _Endpoint*>a, <const _Endpoint*>b):
+        return -1
+    if _before(<const _Endpoint*>b, <const _Endpoint*>a):
+        return 1
+    return 0
+
+# Bounds are stored as (xmin, ymin, xmax, ymax)
+cdef inline bint _overlaps(const double* a, const double* b) noexcept nogil:
+    # Same as Rect.overlaps
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+cdef int _rect_bounds(object rect, double* b) except -1:
+    cdef double x, y, w, h
+    if isinstance(rect, Rect):
+        x = (<Rect>rect).x
+        y = (<Rect>rect).y
+        w = (<Rect>rect).w
+        h = (<Rect>rect).h
+    elif isinstance(rect, RectInt):
+        x = <double>(<RectInt>rect).x
+        y = <double>(<RectInt>rect).y
+        w = <double>(<RectInt>rect).w
+        h = <double>(<RectInt>rect).h
+    else:
+        raise TypeError(f"Expected Rect or RectInt, got {type(rect).__name__}.")
+    if isnan(x) or isnan(y) or isnan(w) or isnan(h):
+        raise ValueError("Rect must not contain NaN.")
+
+    # Negative sizes are kept as is, the max is then before the min and _overlaps matches Rect.overlaps for them as well
+    b[0] = x
+    b[1] = y
+    b[2] = x + w
+    b[3] = y + h
+    return 0
+
+cdef inline object _pair(Py_ssize_t a, Py_ssize_t b):
+    # Unordered pair of slots as a single integer
+    if a > b:
+        a, b = b, a
+    return (<unsigned long long>a << 32) | <unsigned long long>b
+
+@cython.final
+cdef class SweepAndPrune:
+    cdef list _keys # Key of each slot, None for free slots
+    cdef list _rects # Rect of each slot as it was inserted
+    cdef dict _slots # Key to slot
+    cdef list _free
+    cdef list _removed # Slots removed since the last flush, freed when their endpoints are dropped
+
+    cdef set _pairs # Pairs of slots that overlapped at the last flush
+    cdef list _partners # Set of the slots that each slot has a pair with, None for free slots
+    cdef list _began
+    cdef list _ended
+
+    # Per slot data
+    cdef Py_ssize_t _capacity
+    cdef double* _bounds # Bounds at the last flush, the endpoints and _pairs agree with these
+    cdef double* _next_bounds # Bounds that the next flush moves to
+    cdef unsigned char* _state # _SlotState
+
+    # Endpoints of both axes, 2 per slot that is in use
+    cdef _Endpoint* _x
+    cdef _Endpoint* _y
+    cdef Py_ssize_t _endpoint_count
+    cdef Py_ssize_t _inserted # Slots inserted since the last flush
+    cdef bint _dirty
+
+    def __cinit__(self):
+        self._keys = []
+        self._rects = []
+        self._slots = {}
+        self._free = []
+        self._removed = []
+        self._pairs = set()
+        self._partners = []
+        self._began = []
+        self._ended = []
+
+    def __dealloc__(self):
+        PyMem_Free(self._bounds)
+        PyMem_Free(self._next_bounds)
+        PyMem_Free(self._state)
+        PyMem_Free(self._x)
+        PyMem_Free(self._y)
+
+    #region Slots
+    cdef int _grow(self) except -1:
+        cdef Py_ssize_t capacity = 2 * self._capacity if self._capacity > 0 else 64
+        cdef double* bounds = <double*>PyMem_Realloc(self._bounds, 4 * capacity * sizeof(double))
+        if bounds == NULL:
+            raise MemoryError()
+        self._bounds = bounds
+        cdef double* next_bounds = <double*>PyMem_Realloc(self._next_bounds, 4 * capacity * sizeof(double))
+        if next_bounds == NULL:
+            raise MemoryError()
+        self._next_bounds = next_bounds
+        cdef unsigned char* state = <unsigned char*>PyMem_Realloc(self._state, capacity * sizeof(unsigned char))
+        if state == NULL:
+            raise MemoryError()
+        self._state = state
+        cdef _Endpoint* x = <_Endpoint*>PyMem_Realloc(self._x, 2 * capacity * sizeof(_Endpoint))
+        if x == NULL:
+            raise MemoryError()
+        self._x = x
+        cdef _Endpoint* y = <_Endpoint*>PyMem_Realloc(self._y, 2 * capacity * sizeof(_Endpoint))
+        if y == NULL:
+            raise MemoryError()
+        self._y = y
+        self._capacity = capacity
+        return 0
+
+    cdef int _insert(self, object key, object rect) except -1:
+        cdef double b[4]
+        _rect_bounds(rect, b)
+
+        cdef Py_ssize_t slot
+        existing = self._slots.get(key)
+        if existing is not None:
+            slot = existing
+            self._rects[slot] = rect
+        else:
+            if len(self._free) > 0:
+                slot = self._free.pop()
+                self._keys[slot] = key
+                self._rects[slot] = rect
+                self._partners[slot] = set()
+            else:
+                slot = len(self._keys)
+                if slot == self._capacity:
+                    self._grow()
+                self._keys.append(key)
+                self._rects.append(rect)
+                self._partners.append(set())
+            self._slots[key] = slot
+            self._state[slot] = _INSERTED
+            self._inserted += 1
+
+            # New endpoints start at the end as if the rect was infinitely far away. The min endpoints come first so that the new rects don't overlap each other there.
+            self._x[self._endpoint_count].id = 2 * slot + 1
+            self._x[self._endpoint_count + 1].id = 2 * slot
+            self._y[self._endpoint_count].id = 2 * slot + 1
+            self._y[self._endpoint_count + 1].id = 2 * slot
+            self._endpoint_count += 2
+
+        self._next_bounds[4 * slot] = b[0]
+        self._next_bounds[4 * slot + 1] = b[1]
+        self._next_bounds[4 * slot + 2] = b[2]
+        self._next_bounds[4 * slot + 3] = b[3]
+        self._dirty = True
+        return 0
+
+    cdef Py_ssize_t _drop_removed(self, _Endpoint* endpoints) noexcept:
+        # Drops the endpoints of removed slots and keeps the order of the others. Returns the new endpoint count.
+        cdef Py_ssize_t i
+        cdef Py_ssize_t count = 0
+        for i in range(self._endpoint_count):
+            if self._state[endpoints[i].id >> 1] != _REMOVED:
+                endpoints[count] = endpoints[i]
+                count += 1
+        return count
+    #endregion
+
+    #region Flushing
+    cdef int _begin(self, Py_ssize_t a, Py_ssize_t b) except -1:
+        if not _overlaps(self._next_bounds + 4 * a, self._next_bounds + 4 * b):
+            return 0
+        pair = _pair(a, b)
+        if not PySet_Contains(self._pairs, pair):
+            PySet_Add(self._pairs, pair)
+            PySet_Add(self._partners[a], b)
+            PySet_Add(self._partners[b], a)
+            self._began.append(self._key_pair(a, b))
+        return 0
+
+    cdef int _end(self, Py_ssize_t a, Py_ssize_t b) except -1:
+        if PySet_Discard(self._pairs, _pair(a, b)):
+            PySet_Discard(self._partners[a], b)
+            PySet_Discard(self._partners[b], a)
+            self._ended.append(self._key_pair(a, b))
+        return 0
+
+    cdef tuple _key_pair(self, Py_ssize_t a, Py_ssize_t b):
+        if a > b:
+            a, b = b, a
+        return (self._keys[a], self._keys[b])
+
+    cdef int _sort_axis(self, _Endpoint* endpoints) except -1:
+        # Insertion sort, nearly linear when the rects moved only a little since the last flush.
+        # Overlaps can only begin or end where a min endpoint passes a max endpoint of another rect.
+        cdef Py_ssize_t i, j
+        cdef _Endpoint e, f
+        for i in range(1, self._endpoint_count):
+            e = endpoints[i]
+            j = i
+            while j > 0 and _before(&e, &endpoints[j - 1]):
+                f = endpoints[j - 1]
+                if (e.id & 1) != (f.id & 1) and (e.id >> 1) != (f.id >> 1):
+                    if e.id & 1: # Min moved before a max, the rects might overlap now
+                        self._begin(e.id >> 1, f.id >> 1)
+                    else: # Max moved before a min, the rects are separated along this axis
+                        self._end(e.id >> 1, f.id >> 1)
+                endpoints[j] = f
+                j -= 1
+            endpoints[j] = e
+        return 0
+
+    cdef int _rebuild(self) except -1:
+        # Sorts from scratch and finds every overlapping pair with a single sweep along x
+        qsort(self._x, self._endpoint_count, sizeof(_Endpoint), _compare_endpoints)
+        qsort(self._y, self._endpoint_count, sizeof(_Endpoint), _compare_endpoints)
+
+        cdef Py_ssize_t slot_count = len(self._keys)
+        cdef Py_ssize_t* active = <Py_ssize_t*>PyMem_Malloc((slot_count if slot_count > 0 else 1) * sizeof(Py_ssize_t))
+        cdef Py_ssize_t* position = <Py_ssize_t*>PyMem_Malloc((slot_count if slot_count > 0 else 1) * sizeof(Py_ssize_t))
+        cdef set pairs = set()
+        cdef Py_ssize_t i, j, slot, last
+        cdef Py_ssize_t active_count = 0
+        cdef const double* b
+        try:
+            if active == NULL or position == NULL:
+                raise MemoryError()
+            for i in range(slot_count):
+                position[i] = -1
+
+            for i in range(self._endpoint_count):
+                slot = self._x[i].id >> 1
+                if self._x[i].id & 1:
+                    b = self._next_bounds + 4 * slot
+                    for j in range(active_count):
+                        if _overlaps(b, self._next_bounds + 4 * active[j]):
+                            PySet_Add(pairs, _pair(slot, active[j]))
+                    if b[2] > b[0]: # Zero-width rects have already passed their max endpoint
+                        position[slot] = active_count
+                        active[active_count] = slot
+                        active_count += 1
+                elif position[slot] != -1:
+                    active_count -= 1
+                    last = active[active_count]
+                    active[position[slot]] = last
+                    position[last] = position[slot]
+                    position[slot] = -1
+        finally:
+            PyMem_Free(active)
+            PyMem_Free(position)
+
+        cdef Py_ssize_t first, second
+        for pair in pairs - self._pairs:
+            first = pair >> 32
+            second = pair & 0xFFFFFFFF
+            PySet_Add(self._partners[first], second)
+            PySet_Add(self._partners[second], first)
+            self._began.append(self._key_pair(first, second))
+        for pair in self._pairs - pairs:
+            first = pair >> 32
+            second = pair & 0xFFFFFFFF
+            PySet_Discard(self._partners[first], second)
+            PySet_Discard(self._partners[second], first)
+            self._ended.append(self._key_pair(first, second))
+        self._pairs = pairs
+        return 0
+
+    cdef int _flush(self) except -1:
+        if not self._dirty:
+            return 0
+
+        cdef Py_ssize_t i, id
+        if len(self._removed) > 0:
+            self._drop_removed(self._x)
+            self._endpoint_count = self._drop_removed(self._y)
+            for i in self._removed:
+                self._state[i] = _FREE
+            self._free.extend(self._removed)
+            self._removed = []
+
+        for i in range(self._endpoint_count):
+            id = self._x[i].id
+            self._x[i].value = self._next_bounds[4 * (id >> 1) + (0 if id & 1 else 2)]
+            self._state[id >> 1] = _FLUSHED
+            id = self._y[i].id
+            self._y[i].value = self._next_bounds[4 * (id >> 1) + (1 if id & 1 else 3)]
+
+        if self._inserted > _REBUILD_THRESHOLD:
+            self._rebuild()
+        else:
+            self._sort_axis(self._x)
+            self._sort_axis(self._y)
+
+        cdef Py_ssize_t slot_count = len(self._keys)
+        for i in range(4 * slot_count):
+            self._bounds[i] = self._next_bounds[i]
+        self._inserted = 0
+        self._dirty = False
+        return 0
+    #endregion
+
+    #region Modification
+    def insert(self, key, rect):
+        self._insert(key, rect)
+
+    def insert_many(self, items):
+        for key, rect in items:
+            self._insert(key, rect)
+
+    def update(self, key, rect):
+        if key not in self._slots:
+            raise KeyError(key)
+        self._insert(key, rect)
+
+    def update_many(self, items):
+        for key, rect in items:
+            if key not in self._slots:
+                raise KeyError(key)
+            self._insert(key, rect)
+
+    def remove(self, key):
+        cdef Py_ssize_t slot = self._slots.pop(key)
+        if self._state[slot] == _FLUSHED: # End the overlaps as they were at the last flush
+            for other in list(self._partners[slot]):
+                self._end(slot, other)
+        else:
+            self._inserted -= 1
+
+        # The endpoints are dropped by the next flush, which walks over every endpoint anyway
+        self._state[slot] = _REMOVED
+        self._removed.append(slot)
+        self._keys[slot] = None
+        self._rects[slot] = None
+        self._partners[slot] = None
+        self._dirty = True
+
+    def clear(self):
+        self._keys = []
+        self._rects = []
+        self._slots = {}
+        self._free = []
+        self._removed = []
+        self._pairs = set()
+        self._partners = []
+        self._began = []
+        self._ended = []
+        self._endpoint_count = 0
+        self._inserted = 0
+        self._dirty = False
+    #endregion
+
+    #region Queries
+    def pairs(self):
+        self._flush()
+        return [self._key_pair(pair >> 32, pair & 0xFFFFFFFF) for pair in self._pairs]
+
+    def pop_events(self):
+        self._flush()
+        began = self._began
+        ended = self._ended
+        self._began = []
+        self._ended = []
+        return began, ended
+    #endregion
+
+    def get(self, key):
+        return self._rects[self._slots[key]]
+
+    def __len__(self):
+        return len(self._slots)
+
+    def __contains__(self, key):
+        return key in self._slots
+
+    def __iter__(self):
+        return iter(self._slots)
@@ -1,5 +1,158 @@
 #cython: language_level=3
 
+cimport cython
+from libc.math cimport hypot, acos
+
 cdef class Vector2:
     cdef readonly double x
     cdef readonly double y
+
+cdef inline Vector2 new_vector2(double x, double y):
+    # Vector2(x, y) without the overhead of calling __init__ through Python
+    cdef Vector2 v = Vector2.__new__(Vector2)
+    v.x = x
+    v.y = y
+    return v
+
+# Component-wise C versions of the Vector2 math for use from other extensions, callable without the GIL.
+# Vector results are written into out which must have room for two doubles and may alias the inputs.
+cdef inline double magnitude2(double x, double y) noexcept nogil:
+    return hypot(x, y)
+
+cdef inline double dot2(double ax, double ay, double bx, double by) noexcept nogil:
+    return (ax * bx) + (ay * by)
+
+cdef inline double distance2(double ax, double ay, double bx, double by) noexcept nogil:
+    return hypot(ax - bx, ay - by)
+
+@cython.cdivision(True)
+cdef inline double angle2(double from_x, double from_y, double to_x, double to_y) noexcept nogil:
+    cdef double denom = hypot(from_x, from_y) * hypot(to_x, to_y) # Multiply magnitudes
+    if denom == 0.0:
+        return 0.0
+
+    cdef double cos_val = ((from_x * to_x) + (from_y * to_y)) / denom
+    if cos_val < -1.0: # Clamp to range [-1, 1]
+        cos_val = -1.0
+    elif cos_val > 1.0:
+        cos_val = 1.0
+
+    return acos(cos_val) * (180.0 / 3.14159265358979323846)
+
+cdef inline double signed_angle2(double from_x, double from_y, double to_x, double to_y) noexcept nogil:
+    cdef double unsigned_angle = angle2(from_x, from_y, to_x, to_y)
+    if ((from_x * to_y) - (from_y * to_x)) < 0.0:
+        return -unsigned_angle
+    return unsigned_angle
+
+@cython.cdivision(True)
+cdef inline void normalize2(double x, double y, double* out) noexcept nogil:
+    cdef double magnitude = hypot(x, y)
+    if magnitude == 0.0:
+        out[0] = 0.0
+        out[1] = 0.0
+    else:
+        out[0] = x / magnitude
+        out[1] = y / magnitude
+
+cdef inline void lerp_unclamped2(double ax, double ay, double bx, double by, double t, double* out) noexcept nogil:
+    out[0] = ax + ((bx - ax) * t)
+    out[1] = ay + ((by - ay) * t)
+
+cdef inline void lerp2(double ax, double ay, double bx, double by, double t, double* out) noexcept nogil:
+    if t < 0.0: # clamp01 substitute
+        t = 0.0
+    elif t > 1.0:
+        t = 1.0
+    lerp_unclamped2(ax, ay, bx, by, t, out)
+
+cdef inline bint move_towards2(double current_x, double current_y, double target_x, double target_y, double max_distance_delta, double* out) noexcept nogil:
+    # Returns True if the target was reached, out holds the target in that case.
+    return move_towards2_dist(current_x, current_y, target_x, target_y, hypot(target_x - current_x, target_y - current_y), max_distance_delta, out)
+
+@cython.cdivision(True)
+cdef inline bint move_towards2_dist(double current_x, double current_y, double target_x, double target_y, double dist, double max_distance_delta, double* out) noexcept nogil:
+    # move_towards2 with the distance between current and target computed by the caller, shared with the deterministic version.
+    cdef double to_vector_x = target_x - current_x
+    cdef double to_vector_y = target_y - current_y
+
+    if dist == 0 or (max_distance_delta >= 0 and dist <= max_distance_delta):
+        out[0] = target_x
+        out[1] = target_y
+        return True
+
+    out[0] = current_x + to_vector_x / dist * max_distance_delta
+    out[1] = current_y + to_vector_y / dist * max_distance_delta
+    return False
+
+cdef inline void perpendicular2(double x, double y, double* out) noexcept nogil:
+    out[0] = -y
+    out[1] = x
+
+cdef inline void reflect2(double x, double y, double normal_x, double normal_y, double* out) noexcept nogil:
+    cdef double factor = -2.0 * ((normal_x * x) + (normal_y * y))
+    out[0] = factor * normal_x + x
+    out[1] = factor * normal_y + y
+
+cdef inline void min2(double ax, double ay, double bx, double by, double* out) noexcept nogil:
+    out[0] = min(ax, bx)
+    out[1] = min(ay, by)
+
+cdef inline void max2(double ax, double ay, double bx, double by, double* out) noexcept nogil:
+    out[0] = max(ax, bx)
+    out[1] = max(ay, by)
+
+cdef inline void smooth_damp2(double current_x, double current_y, double target_x, double target_y, double* velocity, double smooth_time, double delta_time, double max_speed, double* out) noexcept nogil:
+    # Shared by Vector2.smooth_damp and Vector2Array.smooth_damp_many so that both produce the exact same results.
+    # Writes the new position into out and the new velocity into velocity.
+    smooth_damp2_dist(current_x, current_y, target_x, target_y, hypot(current_x - target_x, current_y - target_y), velocity, smooth_time, delta_time, max_speed, out)
+
+@cython.cdivision(True)
+cdef inline void smooth_damp2_dist(double current_x, double current_y, double target_x, double target_y, double dist, double* velocity, double smooth_time, double delta_time, double max_speed, double* out) noexcept nogil:
+    # smooth_damp2 with the distance between current and target computed by the caller, shared with the deterministic version.
+    # Heavy inspiration from https://github.com/Unity-Technologies/UnityCsReference/blob/2023.2/Runtime/Export/Math/Vector2.cs#L289
+
+    smooth_time = max(0.0001, smooth_time)
+    cdef double omega = 2.0 / smooth_time
+
+    cdef double x = omega * delta_time
+    cdef double exp = 1.0 / (1.0 + x + 0.48 * x * x + 0.235 * x * x * x)
+
+    cdef double change_x = current_x - target_x
+    cdef double change_y = current_y - target_y
+    cdef double original_to_x = target_x
+    cdef double original_to_y = target_y
+
+    cdef double max_change = max_speed * smooth_time
+    if dist > max_change:
+        change_x = change_x / dist * max_change
+        change_y = change_y / dist * max_change
+
+    target_x = current_x - change_x
+    target_y = current_y - change_y
+
+    cdef double temp_x = (velocity[0] + omega * change_x) * delta_time
+    cdef double temp_y = (velocity[1] + omega * change_y) * delta_time
+
+    cdef double velocity_x = (velocity[0] - omega * temp_x) * exp
+    cdef double velocity_y = (velocity[1] - omega * temp_y) * exp
+
+    cdef double output_x = target_x + (change_x + temp_x) * exp
+    cdef double output_y = target_y + (change_y + temp_y) * exp
+
+    cdef double orig_minus_current_x = original_to_x - current_x
+    cdef double orig_minus_current_y = original_to_y - current_y
+    cdef double out_minus_orig_x = output_x - original_to_x
+    cdef double out_minus_orig_y = output_y - original_to_y
+
+    if (orig_minus_current_x * out_minus_orig_x + orig_minus_current_y * out_minus_orig_y) > 0: # Prevent overshooting
+        output_x = original_to_x
+        output_y = original_to_y
+
+        velocity_x = 0.0 # (output - original_to) / delta_time is always zero
+        velocity_y = 0.0
+
+    velocity[0] = velocity_x
+    velocity[1] = velocity_y
+    out[0] = output_x
+    out[1] = output_y
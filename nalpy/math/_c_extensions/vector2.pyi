@@ -1,5 +1,9 @@
-from typing import ClassVar, Iterator, SupportsIndex
+from typing import ClassVar, Iterable, Iterator, SupportsIndex, TypeVar, overload
+from typing_extensions import Buffer
 from .mvector2 import MVector2
+from .vector2_array import Vector2Array
+
+_OutT = TypeVar("_OutT", bound=Buffer)
 
 class Vector2:
     """An immutable two-dimensional vector"""
@@ -57,6 +61,10 @@ class Vector2:
 
     def __hash__(self) -> int: ...
 
+    def __copy__(self) -> Vector2: ...
+
+    def __deepcopy__(self, memo: dict[int, object], /) -> Vector2: ...
+
     @property
     def magnitude(self) -> float:
         """The length of this vector."""
@@ -146,5 +154,21 @@ class Vector2:
         """Create a new `Vector2` by selecting the largest components of the two given `Vector2` instances."""
         ...
 
+    @staticmethod
+    def from_buffer(buffer: Buffer) -> list[Vector2]:
+        """Unpack a contiguous ``(n, 2)`` buffer of doubles into a list of `Vector2` instances."""
+        ...
+
+    @overload
+    @staticmethod
+    def to_buffer(vectors: Iterable[Vector2]) -> Vector2Array:
+        """Pack `Vector2` instances into a new `Vector2Array`."""
+        ...
+    @overload
+    @staticmethod
+    def to_buffer(vectors: Iterable[Vector2], out: _OutT) -> _OutT:
+        """Pack `Vector2` instances into ``out``, which must be a writable contiguous ``(n, 2)`` buffer of doubles."""
+        ...
+
     def to_tuple(self) -> tuple[float, float]: ...
     def to_dict(self) -> dict[str, float]: ...
@@ -1,7 +1,9 @@
 #cython: language_level=3
 
-from libc.math cimport hypot, acos, fabs, INFINITY
+cimport cython
+from libc.math cimport fabs, INFINITY
 
+from ._batch cimport check_length, check_pairs
 from .mvector2 cimport MVector2
 
 cdef extern from "Python.h":
@@ -17,31 +19,17 @@ cdef inline _Vec_uhash_t _VecHASH_XXROTATE(_Vec_uhash_t x):
     return ((x << 31) | (x >> 33)) # Rotate left 31 bits
 # Hashing
 
-cdef double _rad2deg = 180.0 / 3.14159265358979323846
-
-cdef inline double _Vector2Angle(Vector2 _from, Vector2 _to):
-    cdef double denom = hypot(_from.x, _from.y) * hypot(_to.x, _to.y) # Multiply magnitudes
-    if denom == 0.0:
-        return 0.0
-
-    cdef double dot = (_from.x * _to.x) + (_from.y * _to.y)
-
-    cdef double cos_val = dot / denom
-    if cos_val < -1.0: # Clamp to range [-1, 1]
-        cos_val = -1.0
-    elif cos_val > 1.0:
-        cos_val = 1.0
-
-    return acos(cos_val) * _rad2deg
+cdef Vector2 _zero # Vector2.zero without the attribute lookup, assigned after the class has been created
 
+@cython.freelist(256) # Reuse memory of deallocated instances, allocation dominates the cost of most operations
 cdef class Vector2:
-    zero = Vector2(0.0, 0.0)
-    one = Vector2(1.0, 1.0)
+    zero = new_vector2(0.0, 0.0)
+    one = new_vector2(1.0, 1.0)
 
-    up = Vector2(0.0, 1.0)
-    down = Vector2(0.0, -1.0)
-    left = Vector2(-1.0, 0.0)
-    right = Vector2(1.0, 0.0)
+    up = new_vector2(0.0, 1.0)
+    down = new_vector2(0.0, -1.0)
+    left = new_vector2(-1.0, 0.0)
+    right = new_vector2(1.0, 0.0)
 
 
     def __init__(self, double x, double y):
@@ -66,13 +54,19 @@ cdef class Vector2:
         # len(self)
         return 2
 
-    def __add__(self, Vector2 other):
+    def __add__(self, other):
         # self + other
-        return Vector2(self.x + other.x, self.y + other.y)
+        if not isinstance(other, Vector2):
+            return NotImplemented # Lets Vector2Array handle Vector2 + Vector2Array
+        cdef Vector2 vec = <Vector2>other
+        return new_vector2(self.x + vec.x, self.y + vec.y)
 
-    def __sub__(self, Vector2 other):
+    def __sub__(self, other):
         # self - other
-        return Vector2(self.x - other.x, self.y - other.y)
+        if not isinstance(other, Vector2):
+            return NotImplemented # Lets Vector2Array handle Vector2 - Vector2Array
+        cdef Vector2 vec = <Vector2>other
+        return new_vector2(self.x - vec.x, self.y - vec.y)
 
     def __mul__(self, other):
         # self * other
@@ -86,7 +80,7 @@ cdef class Vector2:
         else:
             return NotImplemented
 
-        return Vector2(self.x * x, self.y * y)
+        return new_vector2(self.x * x, self.y * y)
 
     def __rmul__(self, other):
         # other * self
@@ -101,7 +95,7 @@ cdef class Vector2:
         else:
             return NotImplemented
 
-        return Vector2(self.x * x, self.y * y)
+        return new_vector2(self.x * x, self.y * y)
 
     def __truediv__(self, other):
         # self / other
@@ -115,7 +109,7 @@ cdef class Vector2:
         else:
             return NotImplemented
 
-        return Vector2(self.x / x, self.y / y)
+        return new_vector2(self.x / x, self.y / y)
 
     def __floordiv__(self, other):
         # self // other
@@ -129,7 +123,7 @@ cdef class Vector2:
         else:
             return NotImplemented
 
-        return Vector2(self.x // x, self.y // y) # Cython compiles floordiv into C
+        return new_vector2(self.x // x, self.y // y) # Cython compiles floordiv into C
 
     def __mod__(self, other):
         # self % other
@@ -143,7 +137,7 @@ cdef class Vector2:
         else:
             return NotImplemented
 
-        return Vector2(self.x % x, self.y % y) # Cython compiles modulo into C
+        return new_vector2(self.x % x, self.y % y) # Cython compiles modulo into C
 
     def __divmod__(self, other):
         # divmod(self, other)
@@ -162,15 +156,15 @@ cdef class Vector2:
         cdef double x_mod = self.x % x   # We calculate these separately to avoid using Python's divmod
         cdef double y_fdiv = self.y // y
         cdef double y_mod = self.y % y
-        return (Vector2(x_fdiv, y_fdiv), Vector2(x_mod, y_mod))
+        return (new_vector2(x_fdiv, y_fdiv), new_vector2(x_mod, y_mod))
 
     def __neg__(self):
         # -self
-        return Vector2(-self.x, -self.y)
+        return new_vector2(-self.x, -self.y)
 
     def __abs__(self):
         # abs(self)
-        return Vector2(fabs(self.x), fabs(self.y))
+        return new_vector2(fabs(self.x), fabs(self.y))
 
     def __eq__(self, Vector2 other):
         # self == other
@@ -214,141 +208,130 @@ cdef class Vector2:
 
         return acc
 
+    def __reduce__(self):
+        return (Vector2, (self.x, self.y))
+
+    def __copy__(self):
+        return self # Immutable, a copy would be indistinguishable
+
+    def __deepcopy__(self, memo):
+        return self
+
     @property
     def magnitude(self):
-        return hypot(self.x, self.y)
+        return magnitude2(self.x, self.y)
 
     @property
     def normalized(self):
-        cdef double magnitude = hypot(self.x, self.y)
-        if magnitude == 0.0:
-            return Vector2.zero
-        return Vector2(self.x / magnitude, self.y / magnitude)
+        cdef double[2] out
+        normalize2(self.x, self.y, out)
+        if out[0] == 0.0 and out[1] == 0.0:
+            return _zero
+        return new_vector2(out[0], out[1])
 
     @staticmethod
     def dot(Vector2 a, Vector2 b):
-        return (a.x * b.x) + (a.y * b.y)
+        return dot2(a.x, a.y, b.x, b.y)
 
     @staticmethod
     def lerp(Vector2 a, Vector2 b, double t):
-        if t < 0.0: # clamp01 substitute
-            t = 0.0
-        elif t > 1.0:
-            t = 1.0
-
-        lerp_x = a.x + ((b.x - a.x) * t)
-        lerp_y = a.y + ((b.y - a.y) * t)
-        return Vector2(lerp_x, lerp_y)
+        cdef double[2] out
+        lerp2(a.x, a.y, b.x, b.y, t, out)
+        return new_vector2(out[0], out[1])
 
     @staticmethod
     def lerp_unclamped(Vector2 a, Vector2 b, double t):
-        lerp_x = a.x + ((b.x - a.x) * t)
-        lerp_y = a.y + ((b.y - a.y) * t)
-        return Vector2(lerp_x, lerp_y)
+        cdef double[2] out
+        lerp_unclamped2(a.x, a.y, b.x, b.y, t, out)
+        return new_vector2(out[0], out[1])
 
     @staticmethod
     def move_towards(Vector2 current, Vector2 target, double max_distance_delta):
-        cdef double to_vector_x = target.x - current.x
-        cdef double to_vector_y = target.y - current.y
-
-        cdef double dist = hypot(to_vector_x, to_vector_y)
-
-        if dist == 0 or (max_distance_delta >= 0 and dist <= max_distance_delta):
+        cdef double[2] out
+        if move_towards2(current.x, current.y, target.x, target.y, max_distance_delta, out):
             return target
-
-        cdef double move_x = current.x + to_vector_x / dist * max_distance_delta
-        cdef double move_y = current.y + to_vector_y / dist * max_distance_delta
-        return Vector2(move_x, move_y)
+        return new_vector2(out[0], out[1])
 
     @staticmethod
     def smooth_damp(Vector2 current, Vector2 target, MVector2 current_velocity, double smooth_time, double delta_time, double max_speed = <double>INFINITY):
-        # Heavy inspiration from https://github.com/Unity-Technologies/UnityCsReference/blob/2023.2/Runtime/Export/Math/Vector2.cs#L289
-
-        smooth_time = max(0.0001, smooth_time)
-        cdef double omega = 2.0 / smooth_time
-
-        cdef float x = omega * delta_time
-        cdef double exp = 1.0 / (1.0 + x + 0.48 * x * x + 0.235 * x * x * x)
-
-        cdef double change_x = current.x - target.x
-        cdef double change_y = current.y - target.y
-        cdef Vector2 original_to = target
+        cdef double[2] velocity = [current_velocity.x, current_velocity.y]
+        cdef double[2] output
+        smooth_damp2(current.x, current.y, target.x, target.y, velocity, smooth_time, delta_time, max_speed, output)
 
-        cdef double max_change = max_speed * smooth_time
-        cdef double dist = hypot(change_x, change_y)
-        if dist > max_change:
-            change_x = change_x / dist * max_change
-            change_y = change_y / dist * max_change
-
-        target = Vector2(current.x - change_x, current.y - change_y)
-
-        cdef double temp_x = (current_velocity.x + omega * change_x) * delta_time
-        cdef double temp_y = (current_velocity.y + omega * change_y) * delta_time
-
-        current_velocity.x = (current_velocity.x - omega * temp_x) * exp
-        current_velocity.y = (current_velocity.y - omega * temp_y) * exp
-
-        cdef double output_x = target.x + (change_x + temp_x) * exp
-        cdef double output_y = target.y + (change_y + temp_y) * exp
-
-        cdef double orig_minus_current_x = original_to.x - current.x
-        cdef double orig_minus_current_y = original_to.y - current.y
-        cdef double out_minus_orig_x = output_x - original_to.x
-        cdef double out_minus_orig_y = output_y - original_to.y
-
-        if (orig_minus_current_x * out_minus_orig_x + orig_minus_current_y * out_minus_orig_y) > 0:
-            output_x = original_to.x
-            output_y = original_to.y
-
-            current_velocity.x = (output_x - original_to.x) / delta_time
-            current_velocity.y = (output_y - original_to.y) / delta_time
-
-        return Vector2(output_x, output_y)
+        current_velocity.x = velocity[0]
+        current_velocity.y = velocity[1]
+        return new_vector2(output[0], output[1])
 
 
     @staticmethod
     def perpendicular(Vector2 vector):
-        return Vector2(-vector.y, vector.x)
+        cdef double[2] out
+        perpendicular2(vector.x, vector.y, out)
+        return new_vector2(out[0], out[1])
 
     @staticmethod
     def reflect(Vector2 vector, Vector2 normal):
-        cdef double dot = (normal.x * vector.x) + (normal.y * vector.y)
-        cdef double factor = -2.0 * dot
-        return Vector2(factor * normal.x + vector.x, factor * normal.y + vector.y)
+        cdef double[2] out
+        reflect2(vector.x, vector.y, normal.x, normal.y, out)
+        return new_vector2(out[0], out[1])
 
     @staticmethod
     def angle(Vector2 _from, Vector2 _to):
-        return _Vector2Angle(_from, _to)
-        # Extracted into a separate inline method to increase signed_angle performance.
-        # From my testing this makes Vector2.angle slower by around 2 % which is basically randomness
-        # But on the other hand this change makes Vector2.signed_angle around 12 % faster.
+        return angle2(_from.x, _from.y, _to.x, _to.y)
 
     @staticmethod
     def signed_angle(Vector2 _from, Vector2 _to):
-        cdef double unsigned_angle = _Vector2Angle(_from, _to)
-        if ((_from.x * _to.y) - (_from.y * _to.x)) < 0.0:
-            return -unsigned_angle
-        else:
-            return unsigned_angle
+        return signed_angle2(_from.x, _from.y, _to.x, _to.y)
 
     @staticmethod
     def distance(Vector2 a, Vector2 b):
-        cdef double diff_x = a.x - b.x
-        cdef double diff_y = a.y - b.y
-        return hypot(diff_x, diff_y)
+        return distance2(a.x, a.y, b.x, b.y)
 
     @staticmethod
     def min(Vector2 a, Vector2 b):
         """Returns a vector that is made from the smallest components of two vectors."""
-        return Vector2(min(a.x, b.x), min(a.y, b.y))
+        cdef double[2] out
+        min2(a.x, a.y, b.x, b.y, out)
+        return new_vector2(out[0], out[1])
 
     @staticmethod
     def max(Vector2 a, Vector2 b):
         """Returns a vector that is made from the largest components of two vectors."""
-        return Vector2(max(a.x, b.x), max(a.y, b.y))
+        cdef double[2] out
+        max2(a.x, a.y, b.x, b.y, out)
+        return new_vector2(out[0], out[1])
+
+    @staticmethod
+    def from_buffer(const double[:, ::1] buffer):
+        check_pairs(buffer.shape[1])
+        cdef Py_ssize_t i
+        return [new_vector2(buffer[i, 0], buffer[i, 1]) for i in range(buffer.shape[0])]
+
+    @staticmethod
+    def to_buffer(vectors, out = None):
+        if not isinstance(vectors, (list, tuple)):
+            vectors = list(vectors)
+        cdef Py_ssize_t length = len(vectors)
+
+        if out is None:
+            from .vector2_array import Vector2Array # Imported lazily, vector2_array depends on this module.
+            out = Vector2Array.zeros(length)
+        cdef double[:, ::1] view = out
+        check_pairs(view.shape[1])
+        check_length(length, view.shape[0])
+
+        cdef Py_ssize_t i
+        cdef Vector2 vec
+        for i in range(length):
+            vec = <Vector2?>vectors[i]
+            view[i, 0] = vec.x
+            view[i, 1] = vec.y
+        return out
 
     def to_tuple(self):
         return (self.x, self.y)
 
     def to_dict(self):
         return {"x": self.x, "y": self.y}
+
+_zero = Vector2.zero
@@ -0,0 +1,170 @@
+from typing import Any, Iterable, Iterator, Self, SupportsIndex, TypeAlias, overload
+from typing_extensions import Buffer
+from .vector2 import Vector2
+
+_VectorOperand: TypeAlias = Vector2Array | Vector2 | Buffer | Iterable[Vector2 | tuple[float, float]]
+"""A single ``Vector2`` that is broadcast, an ``(n, 2)`` contiguous buffer of doubles or an iterable of vectors."""
+_DoubleOperand: TypeAlias = float | Buffer
+"""A single float that is broadcast or a one-dimensional contiguous buffer of doubles."""
+
+class Vector2Array:
+    """
+    A mutable, fixed-length array of two-dimensional vectors stored as contiguous ``(x, y)`` double pairs.
+
+    Arithmetic is done elementwise in C without creating any per-element Python objects.
+    The right-hand operand can be another ``Vector2Array`` of the same length or a single ``Vector2`` (or a scalar for ``*``, ``/``, ``//`` and ``%``) that is broadcast over the whole array.
+
+    Supports the buffer protocol with shape ``(len(self), 2)`` and format ``"d"`` so that for example NumPy can view the data without copying.
+
+    NOTE: Division by zero follows IEEE 754 and results in ``inf`` or ``nan`` instead of raising ``ZeroDivisionError``.
+    """
+
+    def __init__(self, vectors: Iterable[Vector2 | tuple[float, float]] = ()) -> None: ...
+
+    @staticmethod
+    def zeros(length: int) -> Vector2Array:
+        """Create a new array of ``length`` zero vectors."""
+        ...
+
+    @staticmethod
+    def from_buffer(buffer: Buffer) -> Vector2Array:
+        """Create a new array by copying a contiguous ``(n, 2)`` buffer of doubles, for example a NumPy array of shape ``(n, 2)``."""
+        ...
+
+    @staticmethod
+    def view(buffer: Buffer, length: int | None = None, offset: int = 0) -> Vector2Array:
+        """
+        Create an array that shares memory with a writable byte buffer, for example ``SharedMemory.buf`` or an ``mmap``.
+
+        Vectors are stored as native-endian double pairs, 16 bytes each, starting ``offset`` bytes into ``buffer``.
+        ``length`` defaults to as many vectors as fit. The start of the data must be aligned to 8 bytes.
+
+        Other processes can view the same shared memory and work on disjoint slices in place.
+        The buffer stays exported while the array or any of its slices are alive, so delete them before closing the ``SharedMemory`` or ``mmap``.
+        """
+        ...
+
+    def __len__(self) -> int: ...
+
+    @overload
+    def __getitem__(self, index: SupportsIndex) -> Vector2: ...
+    @overload
+    def __getitem__(self, index: slice) -> Vector2Array:
+        """Slices are views that share memory with the original array. Only contiguous slices (step 1) are supported."""
+        ...
+
+    def __setitem__(self, index: SupportsIndex, value: Vector2 | tuple[float, float]) -> None: ...
+
+    def __iter__(self) -> Iterator[Vector2]: ...
+
+    def __repr__(self) -> str: ...
+
+    def __eq__(self, other: object) -> bool: ...
+
+    def __add__(self, other: Vector2Array | Vector2) -> Vector2Array: ...
+    def __radd__(self, other: Vector2Array | Vector2) -> Vector2Array: ...
+    def __iadd__(self, other: Vector2Array | Vector2) -> Self: ...
+
+    def __sub__(self, other: Vector2Array | Vector2) -> Vector2Array: ...
+    def __rsub__(self, other: Vector2Array | Vector2) -> Vector2Array: ...
+    def __isub__(self, other: Vector2Array | Vector2) -> Self: ...
+
+    def __mul__(self, other: Vector2Array | Vector2 | float | int) -> Vector2Array: ...
+    def __rmul__(self, other: Vector2Array | Vector2 | float | int) -> Vector2Array: ...
+    def __imul__(self, other: Vector2Array | Vector2 | float | int) -> Self: ...
+
+    def __truediv__(self, other: Vector2Array | Vector2 | float | int) -> Vector2Array: ...
+    def __rtruediv__(self, other: Vector2Array | Vector2 | float | int) -> Vector2Array: ...
+    def __itruediv__(self, other: Vector2Array | Vector2 | float | int) -> Self: ...
+
+    def __floordiv__(self, other: Vector2Array | Vector2 | float | int) -> Vector2Array: ...
+    def __rfloordiv__(self, other: Vector2Array | Vector2 | float | int) -> Vector2Array: ...
+    def __ifloordiv__(self, other: Vector2Array | Vector2 | float | int) -> Self: ...
+
+    def __mod__(self, other: Vector2Array | Vector2 | float | int) -> Vector2Array: ...
+    def __rmod__(self, other: Vector2Array | Vector2 | float | int) -> Vector2Array: ...
+    def __imod__(self, other: Vector2Array | Vector2 | float | int) -> Self: ...
+
+    def __neg__(self) -> Vector2Array: ...
+
+    def __abs__(self) -> Vector2Array: ...
+
+    def __buffer__(self, flags: int, /) -> memoryview: ...
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> Any:
+        """NumPy array of shape ``(len(self), 2)`` that shares memory with this array unless a copy is requested or required by ``dtype``. Raises ``ValueError`` if ``copy`` is ``False`` and ``dtype`` requires a copy."""
+        ...
+
+    @property
+    def normalized(self) -> Vector2Array:
+        """A copy of this array where every vector has a magnitude of 1. Zero vectors stay zero."""
+        ...
+
+    def normalize(self) -> None:
+        """Make every vector in this array keep its direction, but have a magnitude of 1. Operates in place."""
+        ...
+
+    def copy(self) -> Vector2Array:
+        """Make a new array that doesn't share memory with this array."""
+        ...
+
+    def to_list(self) -> list[Vector2]: ...
+
+    # Batched variants of the Vector2 static methods.
+    # Results are written into ``out`` if given (any writable contiguous buffer of the right shape, may be one of the inputs), otherwise a new buffer is allocated.
+    # Scalar results are returned as ``array.array("d")`` and vector results as ``Vector2Array``.
+    @staticmethod
+    def dot(a: _VectorOperand, b: _VectorOperand, out: Buffer | None = None) -> Buffer:
+        """Batched ``Vector2.dot``."""
+        ...
+
+    @staticmethod
+    def distance(a: _VectorOperand, b: _VectorOperand, out: Buffer | None = None) -> Buffer:
+        """Batched ``Vector2.distance``."""
+        ...
+
+    @staticmethod
+    def angle(_from: _VectorOperand, _to: _VectorOperand, out: Buffer | None = None) -> Buffer:
+        """Batched ``Vector2.angle``."""
+        ...
+
+    @staticmethod
+    def signed_angle(_from: _VectorOperand, _to: _VectorOperand, out: Buffer | None = None) -> Buffer:
+        """Batched ``Vector2.signed_angle``."""
+        ...
+
+    @staticmethod
+    def lerp(a: _VectorOperand, b: _VectorOperand, t: _DoubleOperand, out: Buffer | None = None) -> Buffer:
+        """Batched ``Vector2.lerp``. ``t`` can be a single value or one value per vector."""
+        ...
+
+    @staticmethod
+    def lerp_unclamped(a: _VectorOperand, b: _VectorOperand, t: _DoubleOperand, out: Buffer | None = None) -> Buffer:
+        """Batched ``Vector2.lerp_unclamped``. ``t`` can be a single value or one value per vector."""
+        ...
+
+    @staticmethod
+    def move_towards(current: _VectorOperand, target: _VectorOperand, max_distance_delta: _DoubleOperand, out: Buffer | None = None) -> Buffer:
+        """Batched ``Vector2.move_towards``. ``max_distance_delta`` can be a single value or one value per vector."""
+        ...
+
+    @staticmethod
+    def perpendicular(vector: _VectorOperand, out: Buffer | None = None) -> Buffer:
+        """Batched ``Vector2.perpendicular``."""
+        ...
+
+    @staticmethod
+    def reflect(vector: _VectorOperand, normal: _VectorOperand, out: Buffer | None = None) -> Buffer:
+        """Batched ``Vector2.reflect``."""
+        ...
+
+    @staticmethod
+    def smooth_damp_many(current: Buffer, target: _VectorOperand, velocity: Buffer, smooth_time: _DoubleOperand, delta_time: _DoubleOperand, max_speed: _DoubleOperand = float("inf")) -> None:
+        """
+        Batched ``Vector2.smooth_damp`` that operates in place.
+
+        ``current`` and ``velocity`` must be writable contiguous ``(n, 2)`` buffers of doubles, for example ``Vector2Array``.
+        The new positions are written into ``current`` and the new velocities into ``velocity``. The results are bit-for-bit identical to ``Vector2.smooth_damp``.
+        ``smooth_time``, ``delta_time`` and ``max_speed`` can be single values or one value per vector.
+        """
+        ...
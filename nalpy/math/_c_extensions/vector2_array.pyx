@@ -0,0 +1,606 @@
+#cython: language_level=3
+
+cimport cython
+from cpython.buffer cimport PyBUF_FORMAT, PyBUF_ND, PyBUF_STRIDES, PyObject_CheckBuffer
+from cpython.mem cimport PyMem_Calloc, PyMem_Free
+from libc.math cimport fabs, INFINITY
+from libc.string cimport memcpy
+
+from ._batch cimport DoubleOperand, double_operand, broadcast_length, resolve_length, check_length, check_pairs, new_double_array, numpy_array
+from .functions cimport pyfloordiv, pymod
+from .vector2 cimport Vector2, new_vector2, dot2, distance2, angle2, signed_angle2, normalize2, lerp2, lerp_unclamped2, move_towards2, perpendicular2, reflect2, smooth_damp2
+
+ctypedef enum _BinaryOp:
+    _OP_ADD
+    _OP_SUB
+    _OP_MUL
+    _OP_TRUEDIV
+    _OP_FLOORDIV
+    _OP_MOD
+
+cdef struct _VectorOperand:
+    const double* data
+    Py_ssize_t length # -1 when a single vector is broadcast
+    Py_ssize_t step # 0 when a single vector is broadcast
+    double scalar[2]
+
+#region Construction
+cdef inline void _set_length(Vector2Array arr, Py_ssize_t length) noexcept:
+    arr._length = length
+    arr._shape[0] = length
+    arr._shape[1] = 2
+    arr._strides[0] = 2 * sizeof(double)
+    arr._strides[1] = sizeof(double)
+
+cdef Vector2Array _new_array(Py_ssize_t length):
+    # Zero-initialized. Always allocates at least one pair so that _data is never NULL.
+    if length < 0:
+        raise ValueError("Length must be non-negative.")
+
+    cdef Vector2Array arr = Vector2Array.__new__(Vector2Array)
+    arr._data = <double*>PyMem_Calloc(2 * (length if length > 0 else 1), sizeof(double))
+    if arr._data == NULL:
+        raise MemoryError()
+    _set_length(arr, length)
+    return arr
+
+cdef Vector2Array _new_view(double* data, Py_ssize_t length, object base):
+    cdef Vector2Array arr = Vector2Array.__new__(Vector2Array)
+    arr._data = data
+    arr._base = base
+    _set_length(arr, length)
+    return arr
+
+cdef Py_ssize_t _wrap_index(Py_ssize_t i, Py_ssize_t length) except -1:
+    if i < 0:
+        i += length
+    if i < 0 or i >= length:
+        raise IndexError("Vector2Array index out of range")
+    return i
+#endregion
+
+#region Kernels
+# out may alias a or b. A step of 0 broadcasts a single pair over the whole array.
+@cython.cdivision(True)
+cdef void _binary_kernel(_BinaryOp op, double* out, Py_ssize_t length, const double* a, Py_ssize_t a_step, const double* b, Py_ssize_t b_step) noexcept nogil:
+    cdef Py_ssize_t i
+    if op == _OP_ADD:
+        for i in range(length):
+            out[2 * i] = a[i * a_step] + b[i * b_step]
+            out[2 * i + 1] = a[i * a_step + 1] + b[i * b_step + 1]
+    elif op == _OP_SUB:
+        for i in range(length):
+            out[2 * i] = a[i * a_step] - b[i * b_step]
+            out[2 * i + 1] = a[i * a_step + 1] - b[i * b_step + 1]
+    elif op == _OP_MUL:
+        for i in range(length):
+            out[2 * i] = a[i * a_step] * b[i * b_step]
+            out[2 * i + 1] = a[i * a_step + 1] * b[i * b_step + 1]
+    elif op == _OP_TRUEDIV:
+        for i in range(length):
+            out[2 * i] = a[i * a_step] / b[i * b_step]
+            out[2 * i + 1] = a[i * a_step + 1] / b[i * b_step + 1]
+    elif op == _OP_FLOORDIV:
+        for i in range(length):
+            out[2 * i] = pyfloordiv(a[i * a_step], b[i * b_step])
+            out[2 * i + 1] = pyfloordiv(a[i * a_step + 1], b[i * b_step + 1])
+    elif op == _OP_MOD:
+        for i in range(length):
+            out[2 * i] = pymod(a[i * a_step], b[i * b_step])
+            out[2 * i + 1] = pymod(a[i * a_step + 1], b[i * b_step + 1])
+
+cdef void _normalize_kernel(double* out, const double* a, Py_ssize_t length) noexcept nogil:
+    cdef Py_ssize_t i
+    for i in range(length):
+        normalize2(a[2 * i], a[2 * i + 1], out + 2 * i)
+
+cdef int _operand(object other, Py_ssize_t length, bint allow_scalar, double* storage, const double** data, Py_ssize_t* step) except -1:
+    # Returns 0 if the operation isn't implemented for the type of other.
+    cdef Vector2Array arr
+    cdef Vector2 vec
+    if isinstance(other, Vector2Array):
+        arr = <Vector2Array>other
+        if arr._length != length:
+            raise ValueError(f"Operands could not be broadcast together with lengths {length} and {arr._length}.")
+        data[0] = arr._data
+        step[0] = 2
+    elif isinstance(other, Vector2):
+        vec = <Vector2>other
+        storage[0] = vec.x
+        storage[1] = vec.y
+        data[0] = storage
+        step[0] = 0
+    elif allow_scalar and isinstance(other, (float, int)):
+        storage[0] = storage[1] = other
+        data[0] = storage
+        step[0] = 0
+    else:
+        return 0
+    return 1
+
+cdef object _vector_operand(object obj, _VectorOperand* op):
+    # Accepts a Vector2, any (n, 2) contiguous buffer of doubles or an iterable of vectors.
+    # Returns the object that owns op.data. It must be kept alive while op is in use.
+    cdef Vector2 vec
+    cdef const double[:, ::1] view
+    if isinstance(obj, Vector2):
+        vec = <Vector2>obj
+        op.scalar[0] = vec.x
+        op.scalar[1] = vec.y
+        op.data = op.scalar
+        op.length = -1
+        op.step = 0
+        return None
+
+    if not PyObject_CheckBuffer(obj):
+        obj = Vector2Array(obj)
+
+    view = obj
+    check_pairs(view.shape[1])
+    op.length = view.shape[0]
+    op.step = 2
+    op.data = &view[0, 0] if op.length > 0 else op.scalar
+    return view
+
+cdef double[:, ::1] _vector_output(object out, Py_ssize_t length):
+    cdef double[:, ::1] view = out
+    if view.shape[1] != 2:
+        raise ValueError(f"Expected an output buffer of shape (n, 2), got (n, {view.shape[1]}).")
+    check_length(length, view.shape[0])
+    return view
+
+cdef object _binary(Vector2Array self, object other, _BinaryOp op, bint allow_scalar, bint reflected, bint inplace):
+    cdef double storage[2]
+    cdef const double* other_data
+    cdef Py_ssize_t other_step
+    if not _operand(other, self._length, allow_scalar, storage, &other_data, &other_step):
+        return NotImplemented
+
+    cdef Vector2Array out = self if inplace else _new_array(self._length)
+    with nogil:
+        if reflected:
+            _binary_kernel(op, out._data, self._length, other_data, other_step, self._data, 2)
+        else:
+            _binary_kernel(op, out._data, self._length, self._data, 2, other_data, other_step)
+    return out
+#endregion
+
+cdef class Vector2Array:
+    def __init__(self, vectors = ()):
+        # Vector2Array(vectors)
+        cdef list items = list(vectors)
+        cdef Py_ssize_t length = len(items)
+
+        if self._data != NULL: # Slices and exported buffers point into _data, it can't be replaced
+            raise RuntimeError("Vector2Array is already initialized.")
+        self._data = <double*>PyMem_Calloc(2 * (length if length > 0 else 1), sizeof(double))
+        if self._data == NULL:
+            raise MemoryError()
+        _set_length(self, length)
+
+        cdef Py_ssize_t i
+        cdef Vector2 vec
+        for i in range(length):
+            item = items[i]
+            if isinstance(item, Vector2):
+                vec = <Vector2>item
+                self._data[2 * i] = vec.x
+                self._data[2 * i + 1] = vec.y
+            else:
+                self._data[2 * i], self._data[2 * i + 1] = item
+
+    def __dealloc__(self):
+        if self._base is None:
+            PyMem_Free(self._data)
+
+    @staticmethod
+    def zeros(Py_ssize_t length):
+        return _new_array(length)
+
+    @staticmethod
+    def from_buffer(const double[:, ::1] buffer):
+        check_pairs(buffer.shape[1])
+        cdef Vector2Array out = _new_array(buffer.shape[0])
+        if out._length > 0:
+            memcpy(out._data, &buffer[0, 0], out._length * 2 * sizeof(double))
+        return out
+
+    @staticmethod
+    def view(buffer, length = None, Py_ssize_t offset = 0):
+        # Zero-copy, for example over SharedMemory.buf or an mmap
+        cdef unsigned char[::1] memory = buffer # Raises BufferError for read-only buffers
+        if offset < 0 or offset > memory.shape[0]:
+            raise ValueError(f"Offset {offset} is out of range for a buffer of {memory.shape[0]} bytes.")
+
+        cdef Py_ssize_t available = (memory.shape[0] - offset) // (2 * sizeof(double))
+        cdef Py_ssize_t n = available if length is None else length
+        if n < 0 or n > available:
+            raise ValueError(f"Buffer has room for {available} vectors after offset {offset}, {n} requested.")
+        if n == 0:
+            return _new_array(0) # &memory[offset] would be out of bounds
+
+        cdef double* data = <double*>&memory[offset]
+        if (<size_t>data) % sizeof(double) != 0:
+            raise ValueError(f"Buffer must be aligned to {sizeof(double)} bytes.")
+        return _new_view(data, n, memory) # The memoryview keeps the buffer exported, so it can't be closed or resized while in use
+
+    def __getbuffer__(self, Py_buffer* buffer, int flags):
+        buffer.buf = <void*>self._data
+        buffer.obj = self
+        buffer.len = self._length * 2 * sizeof(double)
+        buffer.readonly = 0
+        buffer.itemsize = sizeof(double)
+        buffer.format = NULL
+        if (flags & PyBUF_FORMAT) == PyBUF_FORMAT:
+            buffer.format = "d"
+        buffer.ndim = 2
+        buffer.shape = NULL
+        if (flags & PyBUF_ND) == PyBUF_ND:
+            buffer.shape = self._shape
+        buffer.strides = NULL
+        if (flags & PyBUF_STRIDES) == PyBUF_STRIDES:
+            buffer.strides = self._strides
+        buffer.suboffsets = NULL
+        buffer.internal = NULL
+
+    def __releasebuffer__(self, Py_buffer* buffer):
+        pass
+
+    def __array__(self, dtype = None, copy = None):
+        return numpy_array(self, dtype, copy)
+
+    def __len__(self):
+        # len(self)
+        return self._length
+
+    def __getitem__(self, index):
+        # self[index]
+        cdef Py_ssize_t start, stop, step
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._length)
+            if step != 1:
+                raise ValueError("Vector2Array slices must be contiguous.")
+            if stop < start:
+                stop = start
+            return _new_view(self._data + 2 * start, stop - start, self) # Slices share memory with self
+
+        cdef Py_ssize_t i = _wrap_index(index, self._length)
+        return new_vector2(self._data[2 * i], self._data[2 * i + 1])
+
+    def __setitem__(self, index, value):
+        # self[index] = value
+        cdef Py_ssize_t i = _wrap_index(index, self._length)
+        cdef Vector2 vec
+        if isinstance(value, Vector2):
+            vec = <Vector2>value
+            self._data[2 * i] = vec.x
+            self._data[2 * i + 1] = vec.y
+        else:
+            self._data[2 * i], self._data[2 * i + 1] = value
+
+    def __iter__(self):
+        # iter(self)
+        cdef Py_ssize_t i
+        for i in range(self._length):
+            yield new_vector2(self._data[2 * i], self._data[2 * i + 1])
+
+    def __repr__(self):
+        # repr(self)
+        return f"Vector2Array([{', '.join([repr(v) for v in self])}])"
+
+    def __eq__(self, other):
+        # self == other
+        if not isinstance(other, Vector2Array):
+            return NotImplemented
+
+        cdef Vector2Array arr = <Vector2Array>other
+        if arr._length != self._length:
+            return False
+
+        cdef Py_ssize_t i
+        for i in range(2 * self._length):
+            if self._data[i] != arr._data[i]:
+                return False
+        return True
+
+    # NOTE: Object is mutable, do not implement __hash__
+
+    #region Arithmetic
+    def __add__(self, other):
+        return _binary(self, other, _OP_ADD, False, False, False)
+
+    def __radd__(self, other):
+        return _binary(self, other, _OP_ADD, False, True, False)
+
+    def __iadd__(self, other):
+        return _binary(self, other, _OP_ADD, False, False, True)
+
+    def __sub__(self, other):
+        return _binary(self, other, _OP_SUB, False, False, False)
+
+    def __rsub__(self, other):
+        return _binary(self, other, _OP_SUB, False, True, False)
+
+    def __isub__(self, other):
+        return _binary(self, other, _OP_SUB, False, False, True)
+
+    def __mul__(self, other):
+        return _binary(self, other, _OP_MUL, True, False, False)
+
+    def __rmul__(self, other):
+        return _binary(self, other, _OP_MUL, True, True, False)
+
+    def __imul__(self, other):
+        return _binary(self, other, _OP_MUL, True, False, True)
+
+    def __truediv__(self, other):
+        return _binary(self, other, _OP_TRUEDIV, True, False, False)
+
+    def __rtruediv__(self, other):
+        return _binary(self, other, _OP_TRUEDIV, True, True, False)
+
+    def __itruediv__(self, other):
+        return _binary(self, other, _OP_TRUEDIV, True, False, True)
+
+    def __floordiv__(self, other):
+        return _binary(self, other, _OP_FLOORDIV, True, False, False)
+
+    def __rfloordiv__(self, other):
+        return _binary(self, other, _OP_FLOORDIV, True, True, False)
+
+    def __ifloordiv__(self, other):
+        return _binary(self, other, _OP_FLOORDIV, True, False, True)
+
+    def __mod__(self, other):
+        return _binary(self, other, _OP_MOD, True, False, False)
+
+    def __rmod__(self, other):
+        return _binary(self, other, _OP_MOD, True, True, False)
+
+    def __imod__(self, other):
+        return _binary(self, other, _OP_MOD, True, False, True)
+
+    def __neg__(self):
+        # -self
+        cdef Vector2Array out = _new_array(self._length)
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(2 * self._length):
+                out._data[i] = -self._data[i]
+        return out
+
+    def __abs__(self):
+        # abs(self)
+        cdef Vector2Array out = _new_array(self._length)
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(2 * self._length):
+                out._data[i] = fabs(self._data[i])
+        return out
+    #endregion
+
+    @property
+    def normalized(self):
+        cdef Vector2Array out = _new_array(self._length)
+        with nogil:
+            _normalize_kernel(out._data, self._data, self._length)
+        return out
+
+    def normalize(self):
+        with nogil:
+            _normalize_kernel(self._data, self._data, self._length)
+
+    def copy(self):
+        cdef Vector2Array out = _new_array(self._length)
+        memcpy(out._data, self._data, self._length * 2 * sizeof(double))
+        return out
+
+    def to_list(self):
+        cdef Py_ssize_t i
+        return [new_vector2(self._data[2 * i], self._data[2 * i + 1]) for i in range(self._length)]
+
+    #region Batched math
+    # The batched variants of the Vector2 static methods. Each vector argument can be a Vector2Array, an (n, 2) buffer of doubles or a single Vector2 that is broadcast.
+    # Results are written into out, which is allocated if not given.
+    @staticmethod
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def dot(a, b, out = None):
+        cdef _VectorOperand va, vb
+        keep_a = _vector_operand(a, &va)
+        keep_b = _vector_operand(b, &vb)
+        cdef Py_ssize_t n = resolve_length(broadcast_length(va.length, vb.length))
+        if out is None:
+            out = new_double_array(n)
+        cdef double[::1] out_view = out
+        check_length(n, out_view.shape[0])
+
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(n):
+                out_view[i] = dot2(va.data[i * va.step], va.data[i * va.step + 1], vb.data[i * vb.step], vb.data[i * vb.step + 1])
+        return out
+
+    @staticmethod
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def distance(a, b, out = None):
+        cdef _VectorOperand va, vb
+        keep_a = _vector_operand(a, &va)
+        keep_b = _vector_operand(b, &vb)
+        cdef Py_ssize_t n = resolve_length(broadcast_length(va.length, vb.length))
+        if out is None:
+            out = new_double_array(n)
+        cdef double[::1] out_view = out
+        check_length(n, out_view.shape[0])
+
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(n):
+                out_view[i] = distance2(va.data[i * va.step], va.data[i * va.step + 1], vb.data[i * vb.step], vb.data[i * vb.step + 1])
+        return out
+
+    @staticmethod
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def angle(_from, _to, out = None):
+        cdef _VectorOperand va, vb
+        keep_a = _vector_operand(_from, &va)
+        keep_b = _vector_operand(_to, &vb)
+        cdef Py_ssize_t n = resolve_length(broadcast_length(va.length, vb.length))
+        if out is None:
+            out = new_double_array(n)
+        cdef double[::1] out_view = out
+        check_length(n, out_view.shape[0])
+
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(n):
+                out_view[i] = angle2(va.data[i * va.step], va.data[i * va.step + 1], vb.data[i * vb.step], vb.data[i * vb.step + 1])
+        return out
+
+    @staticmethod
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def signed_angle(_from, _to, out = None):
+        cdef _VectorOperand va, vb
+        keep_a = _vector_operand(_from, &va)
+        keep_b = _vector_operand(_to, &vb)
+        cdef Py_ssize_t n = resolve_length(broadcast_length(va.length, vb.length))
+        if out is None:
+            out = new_double_array(n)
+        cdef double[::1] out_view = out
+        check_length(n, out_view.shape[0])
+
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(n):
+                out_view[i] = signed_angle2(va.data[i * va.step], va.data[i * va.step + 1], vb.data[i * vb.step], vb.data[i * vb.step + 1])
+        return out
+
+    @staticmethod
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def lerp(a, b, t, out = None):
+        cdef _VectorOperand va, vb
+        cdef DoubleOperand vt
+        keep_a = _vector_operand(a, &va)
+        keep_b = _vector_operand(b, &vb)
+        keep_t = double_operand(t, &vt)
+        cdef Py_ssize_t n = resolve_length(broadcast_length(broadcast_length(va.length, vb.length), vt.length))
+        if out is None:
+            out = _new_array(n)
+        cdef double[:, ::1] out_view = _vector_output(out, n)
+
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(n):
+                lerp2(va.data[i * va.step], va.data[i * va.step + 1], vb.data[i * vb.step], vb.data[i * vb.step + 1], vt.data[i * vt.step], &out_view[i, 0])
+        return out
+
+    @staticmethod
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def lerp_unclamped(a, b, t, out = None):
+        cdef _VectorOperand va, vb
+        cdef DoubleOperand vt
+        keep_a = _vector_operand(a, &va)
+        keep_b = _vector_operand(b, &vb)
+        keep_t = double_operand(t, &vt)
+        cdef Py_ssize_t n = resolve_length(broadcast_length(broadcast_length(va.length, vb.length), vt.length))
+        if out is None:
+            out = _new_array(n)
+        cdef double[:, ::1] out_view = _vector_output(out, n)
+
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(n):
+                lerp_unclamped2(va.data[i * va.step], va.data[i * va.step + 1], vb.data[i * vb.step], vb.data[i * vb.step + 1], vt.data[i * vt.step], &out_view[i, 0])
+        return out
+
+    @staticmethod
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def move_towards(current, target, max_distance_delta, out = None):
+        cdef _VectorOperand vc, vt
+        cdef DoubleOperand vd
+        keep_c = _vector_operand(current, &vc)
+        keep_t = _vector_operand(target, &vt)
+        keep_d = double_operand(max_distance_delta, &vd)
+        cdef Py_ssize_t n = resolve_length(broadcast_length(broadcast_length(vc.length, vt.length), vd.length))
+        if out is None:
+            out = _new_array(n)
+        cdef double[:, ::1] out_view = _vector_output(out, n)
+
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(n):
+                move_towards2(vc.data[i * vc.step], vc.data[i * vc.step + 1], vt.data[i * vt.step], vt.data[i * vt.step + 1], vd.data[i * vd.step], &out_view[i, 0])
+        return out
+
+    @staticmethod
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def perpendicular(vector, out = None):
+        cdef _VectorOperand vv
+        keep_v = _vector_operand(vector, &vv)
+        cdef Py_ssize_t n = resolve_length(vv.length)
+        if out is None:
+            out = _new_array(n)
+        cdef double[:, ::1] out_view = _vector_output(out, n)
+
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(n):
+                perpendicular2(vv.data[i * vv.step], vv.data[i * vv.step + 1], &out_view[i, 0])
+        return out
+
+    @staticmethod
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def reflect(vector, normal, out = None):
+        cdef _VectorOperand vv, vn
+        keep_v = _vector_operand(vector, &vv)
+        keep_n = _vector_operand(normal, &vn)
+        cdef Py_ssize_t n = resolve_length(broadcast_length(vv.length, vn.length))
+        if out is None:
+            out = _new_array(n)
+        cdef double[:, ::1] out_view = _vector_output(out, n)
+
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(n):
+                reflect2(vv.data[i * vv.step], vv.data[i * vv.step + 1], vn.data[i * vn.step], vn.data[i * vn.step + 1], &out_view[i, 0])
+        return out
+
+    @staticmethod
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def smooth_damp_many(current, target, velocity, smooth_time, delta_time, max_speed = INFINITY):
+        # Operates in place on current and velocity
+        cdef double[:, ::1] current_view = current
+        cdef double[:, ::1] velocity_view = velocity
+        check_pairs(current_view.shape[1])
+        check_pairs(velocity_view.shape[1])
+
+        cdef _VectorOperand vt
+        cdef DoubleOperand vs, vd, vm
+        keep_t = _vector_operand(target, &vt)
+        keep_s = double_operand(smooth_time, &vs)
+        keep_d = double_operand(delta_time, &vd)
+        keep_m = double_operand(max_speed, &vm)
+        cdef Py_ssize_t n = current_view.shape[0]
+        broadcast_length(n, velocity_view.shape[0])
+        broadcast_length(n, vt.length)
+        broadcast_length(n, vs.length)
+        broadcast_length(n, vd.length)
+        broadcast_length(n, vm.length)
+
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(n):
+                smooth_damp2(
+                    current_view[i, 0], current_view[i, 1], vt.data[i * vt.step], vt.data[i * vt.step + 1], &velocity_view[i, 0],
+                    vs.data[i * vs.step], vd.data[i * vd.step], vm.data[i * vm.step], &current_view[i, 0]
+                )
+    #endregion
@@ -1,7 +1,52 @@
 #cython: language_level=3
 
+from libc.math cimport hypot, ceil, floor, llround
+
 ctypedef long long int _V2I_int_t
 
 cdef class Vector2Int:
     cdef readonly _V2I_int_t x
     cdef readonly _V2I_int_t y
+
+cdef inline Vector2Int new_vector2_int(_V2I_int_t x, _V2I_int_t y):
+    # Vector2Int(x, y) without the overhead of calling __init__ through Python
+    cdef Vector2Int v = Vector2Int.__new__(Vector2Int)
+    v.x = x
+    v.y = y
+    return v
+
+# Component-wise C versions of the Vector2Int math for use from other extensions, callable without the GIL.
+# Vector results are written into out which must have room for two integers and may alias the inputs.
+cdef inline double magnitude2i(_V2I_int_t x, _V2I_int_t y) noexcept nogil:
+    return hypot(<double>x, <double>y)
+
+cdef inline double distance2i(_V2I_int_t ax, _V2I_int_t ay, _V2I_int_t bx, _V2I_int_t by) noexcept nogil:
+    cdef _V2I_int_t diff_x = ax - bx
+    cdef _V2I_int_t diff_y = ay - by
+    return hypot(<double>diff_x, <double>diff_y)
+
+cdef inline void min2i(_V2I_int_t ax, _V2I_int_t ay, _V2I_int_t bx, _V2I_int_t by, _V2I_int_t* out) noexcept nogil:
+    out[0] = min(ax, bx)
+    out[1] = min(ay, by)
+
+cdef inline void max2i(_V2I_int_t ax, _V2I_int_t ay, _V2I_int_t bx, _V2I_int_t by, _V2I_int_t* out) noexcept nogil:
+    out[0] = max(ax, bx)
+    out[1] = max(ay, by)
+
+# Conversions from floating point components. Out of range and NaN components are undefined like in C.
+cdef inline void ceil2i(double x, double y, _V2I_int_t* out) noexcept nogil:
+    out[0] = <_V2I_int_t>ceil(x)
+    out[1] = <_V2I_int_t>ceil(y)
+
+cdef inline void floor2i(double x, double y, _V2I_int_t* out) noexcept nogil:
+    out[0] = <_V2I_int_t>floor(x)
+    out[1] = <_V2I_int_t>floor(y)
+
+cdef inline void round2i(double x, double y, _V2I_int_t* out) noexcept nogil:
+    # Rounds halfway cases away from zero
+    out[0] = <_V2I_int_t>llround(x)
+    out[1] = <_V2I_int_t>llround(y)
+
+cdef inline void trunc2i(double x, double y, _V2I_int_t* out) noexcept nogil:
+    out[0] = <_V2I_int_t>x # Casting floating point to integer truncates
+    out[1] = <_V2I_int_t>y
@@ -1,5 +1,9 @@
-from typing import ClassVar, Iterator, SupportsIndex
+from typing import ClassVar, Iterable, Iterator, SupportsIndex, TypeVar, overload
+from typing_extensions import Buffer
 from .vector2 import Vector2
+from .vector2_int_buffer import Vector2IntBuffer
+
+_OutT = TypeVar("_OutT", bound=Buffer)
 
 class Vector2Int:
     """An immutable two-dimensional vector with integer precision."""
@@ -56,6 +60,10 @@ class Vector2Int:
 
     def __hash__(self) -> int: ...
 
+    def __copy__(self) -> Vector2Int: ...
+
+    def __deepcopy__(self, memo: dict[int, object], /) -> Vector2Int: ...
+
     @property
     def magnitude(self) -> float:
         """The length of this vector."""
@@ -96,6 +104,22 @@ class Vector2Int:
         """Create a new `Vector2Int` by selecting the largest components of the two given `Vector2Int` instances."""
         ...
 
+    @staticmethod
+    def from_buffer(buffer: Buffer) -> list[Vector2Int]:
+        """Unpack a contiguous ``(n, 2)`` buffer of 64-bit integers into a list of `Vector2Int` instances."""
+        ...
+
+    @overload
+    @staticmethod
+    def to_buffer(vectors: Iterable[Vector2Int]) -> Vector2IntBuffer:
+        """Pack `Vector2Int` instances into a new `Vector2IntBuffer`."""
+        ...
+    @overload
+    @staticmethod
+    def to_buffer(vectors: Iterable[Vector2Int], out: _OutT) -> _OutT:
+        """Pack `Vector2Int` instances into ``out``, which must be a writable contiguous ``(n, 2)`` buffer of 64-bit integers."""
+        ...
+
     def to_vector2(self) -> Vector2:
         """`Vector2Int` to `Vector2` conversion."""
         ...
@@ -1,9 +1,10 @@
 #cython: language_level=3
 
-from libc.math cimport hypot, ceil, floor, llround
+cimport cython
 from libc.stdlib cimport llabs
 
-from .vector2 cimport Vector2
+from ._batch cimport check_length, check_pairs
+from .vector2 cimport Vector2, new_vector2
 
 cdef extern from "Python.h":
     int SIZEOF_PY_HASH_T
@@ -18,14 +19,15 @@ cdef inline _Vec_uhash_t _VecHASH_XXROTATE(_Vec_uhash_t x):
     return ((x << 31) | (x >> 33)) # Rotate left 31 bits
 # Hashing
 
+@cython.freelist(256)
 cdef class Vector2Int:
-    zero = Vector2Int(0, 0)
-    one = Vector2Int(1, 1)
+    zero = new_vector2_int(0, 0)
+    one = new_vector2_int(1, 1)
 
-    up = Vector2Int(0, 1)
-    down = Vector2Int(0, -1)
-    left = Vector2Int(-1, 0)
-    right = Vector2Int(1, 0)
+    up = new_vector2_int(0, 1)
+    down = new_vector2_int(0, -1)
+    left = new_vector2_int(-1, 0)
+    right = new_vector2_int(1, 0)
 
 
     def __init__(self, _V2I_int_t x, _V2I_int_t y):
@@ -52,11 +54,11 @@ cdef class Vector2Int:
 
     def __add__(self, Vector2Int other):
         # self + other
-        return Vector2Int(self.x + other.x, self.y + other.y)
+        return new_vector2_int(self.x + other.x, self.y + other.y)
 
     def __sub__(self, Vector2Int other):
         # self - other
-        return Vector2Int(self.x - other.x, self.y - other.y)
+        return new_vector2_int(self.x - other.x, self.y - other.y)
 
     def __mul__(self, other):
         # self * other
@@ -70,7 +72,7 @@ cdef class Vector2Int:
         else:
             return NotImplemented
 
-        return Vector2Int(self.x * x, self.y * y)
+        return new_vector2_int(self.x * x, self.y * y)
 
     def __rmul__(self, other):
         # other * self
@@ -85,7 +87,7 @@ cdef class Vector2Int:
         else:
             return NotImplemented
 
-        return Vector2Int(self.x * x, self.y * y)
+        return new_vector2_int(self.x * x, self.y * y)
 
     def __truediv__(self, other):
         # self / other, NOTE: Returns Vector2
@@ -99,7 +101,7 @@ cdef class Vector2Int:
         else:
             return NotImplemented
 
-        return Vector2(self.x / x, self.y / y)
+        return new_vector2(self.x / x, self.y / y)
 
     def __floordiv__(self, other):
         # self // other
@@ -113,7 +115,7 @@ cdef class Vector2Int:
         else:
             return NotImplemented
 
-        return Vector2Int(self.x // x, self.y // y)
+        return new_vector2_int(self.x // x, self.y // y)
 
     def __mod__(self, other):
         # self % other
@@ -127,7 +129,7 @@ cdef class Vector2Int:
         else:
             return NotImplemented
 
-        return Vector2Int(self.x % x, self.y % y)
+        return new_vector2_int(self.x % x, self.y % y)
 
     def __divmod__(self, other):
         # divmod(self, other)
@@ -146,15 +148,15 @@ cdef class Vector2Int:
         cdef _V2I_int_t x_mod = self.x % x   # We calculate these separately to avoid using Python's divmod
         cdef _V2I_int_t y_fdiv = self.y // y
         cdef _V2I_int_t y_mod = self.y % y
-        return (Vector2Int(x_fdiv, y_fdiv), Vector2Int(x_mod, y_mod))
+        return (new_vector2_int(x_fdiv, y_fdiv), new_vector2_int(x_mod, y_mod))
 
     def __neg__(self):
         # -self
-        return Vector2Int(-self.x, -self.y)
+        return new_vector2_int(-self.x, -self.y)
 
     def __abs__(self):
         # abs(self)
-        return Vector2Int(llabs(self.x), llabs(self.y))
+        return new_vector2_int(llabs(self.x), llabs(self.y))
 
     def __eq__(self, Vector2Int other):
         # self == other
@@ -198,43 +200,88 @@ cdef class Vector2Int:
 
         return acc
 
+    def __reduce__(self):
+        return (Vector2Int, (self.x, self.y))
+
+    def __copy__(self):
+        return self # Immutable, a copy would be indistinguishable
+
+    def __deepcopy__(self, memo):
+        return self
+
     @property
     def magnitude(self):
-        return hypot(<double>self.x, <double>self.y)
+        return magnitude2i(self.x, self.y)
 
     @staticmethod
     def distance(Vector2Int a, Vector2Int b):
-        cdef _V2I_int_t diff_x = a.x - b.x
-        cdef _V2I_int_t diff_y = a.y - b.y
-        return hypot(<double>diff_x, <double>diff_y)
+        return distance2i(a.x, a.y, b.x, b.y)
 
     @staticmethod
     def ceil(v: Vector2) -> Vector2Int:
-       return Vector2Int(<_V2I_int_t>ceil(v.x), <_V2I_int_t>ceil(v.y))
+        cdef _V2I_int_t[2] out
+        ceil2i(v.x, v.y, out)
+        return new_vector2_int(out[0], out[1])
 
     @staticmethod
     def floor(v: Vector2) -> Vector2Int:
-        return Vector2Int(<_V2I_int_t>floor(v.x), <_V2I_int_t>floor(v.y))
+        cdef _V2I_int_t[2] out
+        floor2i(v.x, v.y, out)
+        return new_vector2_int(out[0], out[1])
 
     @staticmethod
     def round(v: Vector2) -> Vector2Int:
-        return Vector2Int(<_V2I_int_t>llround(v.x), <_V2I_int_t>llround(v.y))
-        # Casting in case we change the _V2I_int_t later. long long int can always hold a rounded double.
+        cdef _V2I_int_t[2] out
+        round2i(v.x, v.y, out)
+        return new_vector2_int(out[0], out[1])
 
     @staticmethod
     def trunc(v: Vector2) -> Vector2Int:
-        return Vector2Int(<_V2I_int_t>v.x, <_V2I_int_t>v.y) # Casting floating point to integer truncates
+        cdef _V2I_int_t[2] out
+        trunc2i(v.x, v.y, out)
+        return new_vector2_int(out[0], out[1])
 
     @staticmethod
     def min(Vector2Int a, Vector2Int b):
-        return Vector2Int(min(a.x, b.x), min(a.y, b.y))
+        cdef _V2I_int_t[2] out
+        min2i(a.x, a.y, b.x, b.y, out)
+        return new_vector2_int(out[0], out[1])
 
     @staticmethod
     def max(Vector2Int a, Vector2Int b):
-        return Vector2Int(max(a.x, b.x), max(a.y, b.y))
+        cdef _V2I_int_t[2] out
+        max2i(a.x, a.y, b.x, b.y, out)
+        return new_vector2_int(out[0], out[1])
+
+    @staticmethod
+    def from_buffer(const long long[:, ::1] buffer):
+        check_pairs(buffer.shape[1])
+        cdef Py_ssize_t i
+        return [new_vector2_int(buffer[i, 0], buffer[i, 1]) for i in range(buffer.shape[0])]
+
+    @staticmethod
+    def to_buffer(vectors, out = None):
+        if not isinstance(vectors, (list, tuple)):
+            vectors = list(vectors)
+        cdef Py_ssize_t length = len(vectors)
+
+        if out is None:
+            from .vector2_int_buffer import Vector2IntBuffer # Imported lazily, vector2_int_buffer depends on this module.
+            out = Vector2IntBuffer.zeros(length)
+        cdef long long[:, ::1] view = out
+        check_pairs(view.shape[1])
+        check_length(length, view.shape[0])
+
+        cdef Py_ssize_t i
+        cdef Vector2Int vec
+        for i in range(length):
+            vec = <Vector2Int?>vectors[i]
+            view[i, 0] = vec.x
+            view[i, 1] = vec.y
+        return out
 
     def to_vector2(self) -> Vector2:
-        return Vector2(<double>self.x, <double>self.y)
+        return new_vector2(<double>self.x, <double>self.y)
 
     def to_tuple(self):
         return (self.x, self.y)
@@ -0,0 +1,10 @@
+#cython: language_level=3
+
+cdef class Vector2IntBuffer:
+    cdef long long* _data # Interleaved x, y pairs
+    cdef Py_ssize_t _length
+
+    cdef Py_ssize_t _shape[2]
+    cdef Py_ssize_t _strides[2]
+
+cdef Vector2IntBuffer new_vector2_int_buffer(Py_ssize_t length)
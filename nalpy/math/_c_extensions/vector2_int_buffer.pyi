@@ -0,0 +1,47 @@
+from typing import Any, Iterable, Iterator, SupportsIndex
+from typing_extensions import Buffer
+from .vector2_int import Vector2Int
+
+class Vector2IntBuffer:
+    """
+    A mutable, fixed-length array of `Vector2Int` stored as contiguous ``(x, y)`` pairs of 64-bit integers.
+
+    Supports the buffer protocol with shape ``(len(self), 2)`` and format ``"q"`` so that for example NumPy can view the data without copying.
+    Unlike ``Vector2Array`` this type doesn't implement arithmetic, it is meant for moving vectors in and out of other libraries.
+    """
+
+    def __init__(self, vectors: Iterable[Vector2Int | tuple[int, int]] = ()) -> None: ...
+
+    @staticmethod
+    def zeros(length: int) -> Vector2IntBuffer:
+        """Create a new buffer of ``length`` zero vectors."""
+        ...
+
+    @staticmethod
+    def from_buffer(buffer: Buffer) -> Vector2IntBuffer:
+        """Create a new buffer by copying a contiguous ``(n, 2)`` buffer of 64-bit integers."""
+        ...
+
+    def __len__(self) -> int: ...
+
+    def __getitem__(self, index: SupportsIndex) -> Vector2Int: ...
+
+    def __setitem__(self, index: SupportsIndex, value: Vector2Int | tuple[int, int]) -> None: ...
+
+    def __iter__(self) -> Iterator[Vector2Int]: ...
+
+    def __repr__(self) -> str: ...
+
+    def __eq__(self, other: object) -> bool: ...
+
+    def __buffer__(self, flags: int, /) -> memoryview: ...
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> Any:
+        """NumPy array of shape ``(len(self), 2)`` that shares memory with this buffer unless a copy is requested or required by ``dtype``. Raises ``ValueError`` if ``copy`` is ``False`` and ``dtype`` requires a copy."""
+        ...
+
+    def copy(self) -> Vector2IntBuffer:
+        """Make a new buffer that doesn't share memory with this buffer."""
+        ...
+
+    def to_list(self) -> list[Vector2Int]: ...
@@ -0,0 +1,154 @@
+#cython: language_level=3
+
+from cpython.buffer cimport PyBUF_FORMAT, PyBUF_ND, PyBUF_STRIDES
+from cpython.mem cimport PyMem_Calloc, PyMem_Free
+from libc.string cimport memcpy
+
+from ._batch cimport check_pairs, numpy_array
+from .vector2_int cimport Vector2Int, new_vector2_int
+
+cdef inline void _set_length(Vector2IntBuffer buf, Py_ssize_t length) noexcept:
+    buf._length = length
+    buf._shape[0] = length
+    buf._shape[1] = 2
+    buf._strides[0] = 2 * sizeof(long long)
+    buf._strides[1] = sizeof(long long)
+
+cdef Vector2IntBuffer new_vector2_int_buffer(Py_ssize_t length):
+    # Zero-initialized. Always allocates at least one pair so that _data is never NULL.
+    if length < 0:
+        raise ValueError("Length must be non-negative.")
+
+    cdef Vector2IntBuffer buf = Vector2IntBuffer.__new__(Vector2IntBuffer)
+    buf._data = <long long*>PyMem_Calloc(2 * (length if length > 0 else 1), sizeof(long long))
+    if buf._data == NULL:
+        raise MemoryError()
+    _set_length(buf, length)
+    return buf
+
+cdef Py_ssize_t _wrap_index(Py_ssize_t i, Py_ssize_t length) except -1:
+    if i < 0:
+        i += length
+    if i < 0 or i >= length:
+        raise IndexError("Vector2IntBuffer index out of range")
+    return i
+
+cdef class Vector2IntBuffer:
+    def __init__(self, vectors = ()):
+        # Vector2IntBuffer(vectors)
+        cdef list items = list(vectors)
+        cdef Py_ssize_t length = len(items)
+
+        if self._data != NULL: # Exported buffers point into _data, it can't be replaced
+            raise RuntimeError("Vector2IntBuffer is already initialized.")
+        self._data = <long long*>PyMem_Calloc(2 * (length if length > 0 else 1), sizeof(long long))
+        if self._data == NULL:
+            raise MemoryError()
+        _set_length(self, length)
+
+        cdef Py_ssize_t i
+        cdef Vector2Int vec
+        for i in range(length):
+            item = items[i]
+            if isinstance(item, Vector2Int):
+                vec = <Vector2Int>item
+                self._data[2 * i] = vec.x
+                self._data[2 * i + 1] = vec.y
+            else:
+                self._data[2 * i], self._data[2 * i + 1] = item
+
+    def __dealloc__(self):
+        PyMem_Free(self._data)
+
+    @staticmethod
+    def zeros(Py_ssize_t length):
+        return new_vector2_int_buffer(length)
+
+    @staticmethod
+    def from_buffer(const long long[:, ::1] buffer):
+        check_pairs(buffer.shape[1])
+        cdef Vector2IntBuffer out = new_vector2_int_buffer(buffer.shape[0])
+        if out._length > 0:
+            memcpy(out._data, &buffer[0, 0], out._length * 2 * sizeof(long long))
+        return out
+
+    def __getbuffer__(self, Py_buffer* buffer, int flags):
+        buffer.buf = <void*>self._data
+        buffer.obj = self
+        buffer.len = self._length * 2 * sizeof(long long)
+        buffer.readonly = 0
+        buffer.itemsize = sizeof(long long)
+        buffer.format = NULL
+        if (flags & PyBUF_FORMAT) == PyBUF_FORMAT:
+            buffer.format = "q"
+        buffer.ndim = 2
+        buffer.shape = NULL
+        if (flags & PyBUF_ND) == PyBUF_ND:
+            buffer.shape = self._shape
+        buffer.strides = NULL
+        if (flags & PyBUF_STRIDES) == PyBUF_STRIDES:
+            buffer.strides = self._strides
+        buffer.suboffsets = NULL
+        buffer.internal = NULL
+
+    def __releasebuffer__(self, Py_buffer* buffer):
+        pass
+
+    def __array__(self, dtype = None, copy = None):
+        return numpy_array(self, dtype, copy)
+
+    def __len__(self):
+        # len(self)
+        return self._length
+
+    def __getitem__(self, Py_ssize_t index):
+        # self[index]
+        cdef Py_ssize_t i = _wrap_index(index, self._length)
+        return new_vector2_int(self._data[2 * i], self._data[2 * i + 1])
+
+    def __setitem__(self, Py_ssize_t index, value):
+        # self[index] = value
+        cdef Py_ssize_t i = _wrap_index(index, self._length)
+        cdef Vector2Int vec
+        if isinstance(value, Vector2Int):
+            vec = <Vector2Int>value
+            self._data[2 * i] = vec.x
+            self._data[2 * i + 1] = vec.y
+        else:
+            self._data[2 * i], self._data[2 * i + 1] = value
+
+    def __iter__(self):
+        # iter(self)
+        cdef Py_ssize_t i
+        for i in range(self._length):
+            yield new_vector2_int(self._data[2 * i], self._data[2 * i + 1])
+
+    def __repr__(self):
+        # repr(self)
+        return f"Vector2IntBuffer([{', '.join([repr(v) for v in self])}])"
+
+    def __eq__(self, other):
+        # self == other
+        if not isinstance(other, Vector2IntBuffer):
+            return NotImplemented
+
+        cdef Vector2IntBuffer buf = <Vector2IntBuffer>other
+        if buf._length != self._length:
+            return False
+
+        cdef Py_ssize_t i
+        for i in range(2 * self._length):
+            if self._data[i] != buf._data[i]:
+                return False
+        return True
+
+    # NOTE: Object is mutable, do not implement __hash__
+
+    def copy(self):
+        cdef Vector2IntBuffer out = new_vector2_int_buffer(self._length)
+        memcpy(out._data, self._data, self._length * 2 * sizeof(long long))
+        return out
+
+    def to_list(self):
+        cdef Py_ssize_t i
+        return [new_vector2_int(self._data[2 * i], self._data[2 * i + 1]) for i in range(self._length)]
@@ -0,0 +1,21 @@
+#cython: language_level=3
+
+from .vector2_int cimport Vector2Int
+
+cdef class CheckedVector2Int(Vector2Int):
+    pass
+
+cdef class SaturatingVector2Int(Vector2Int):
+    pass
+
+cdef inline CheckedVector2Int new_checked_vector2_int(long long x, long long y):
+    cdef CheckedVector2Int v = CheckedVector2Int.__new__(CheckedVector2Int)
+    v.x = x
+    v.y = y
+    return v
+
+cdef inline SaturatingVector2Int new_saturating_vector2_int(long long x, long long y):
+    cdef SaturatingVector2Int v = SaturatingVector2Int.__new__(SaturatingVector2Int)
+    v.x = x
+    v.y = y
+    return v
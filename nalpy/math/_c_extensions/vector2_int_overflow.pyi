@@ -0,0 +1,134 @@
+from typing import ClassVar
+from typing_extensions import Buffer
+from .vector2 import Vector2
+from .vector2_int import Vector2Int
+
+class CheckedVector2Int(Vector2Int):
+    """
+    A `Vector2Int` that raises ``OverflowError`` instead of silently wrapping around when a result doesn't fit into a 64-bit integer.
+
+    Arithmetic with a plain `Vector2Int` on either side results in a `CheckedVector2Int`.
+    Integer operands aren't limited to 64 bits, only the result has to fit.
+    Everything else is inherited from `Vector2Int`, including equality and hashing, so a `CheckedVector2Int` can be used wherever a `Vector2Int` is expected.
+    """
+    zero: ClassVar[CheckedVector2Int]
+    one: ClassVar[CheckedVector2Int]
+    up: ClassVar[CheckedVector2Int]
+    down: ClassVar[CheckedVector2Int]
+    left: ClassVar[CheckedVector2Int]
+    right: ClassVar[CheckedVector2Int]
+
+    def __add__(self, other: Vector2Int) -> CheckedVector2Int: ...
+    def __radd__(self, other: Vector2Int) -> CheckedVector2Int: ...
+
+    def __sub__(self, other: Vector2Int) -> CheckedVector2Int: ...
+    def __rsub__(self, other: Vector2Int) -> CheckedVector2Int: ...
+
+    def __mul__(self, other: Vector2Int | int) -> CheckedVector2Int: ...
+    def __rmul__(self, other: Vector2Int | int) -> CheckedVector2Int: ...
+
+    def __floordiv__(self, other: Vector2Int | int) -> CheckedVector2Int:
+        """Overflows only for ``-2 ** 63 // -1``."""
+        ...
+
+    def __mod__(self, other: Vector2Int | int) -> CheckedVector2Int: ...
+
+    def __divmod__(self, other: Vector2Int | int) -> tuple[CheckedVector2Int, CheckedVector2Int]: ...
+
+    def __neg__(self) -> CheckedVector2Int: ...
+
+    def __abs__(self) -> CheckedVector2Int: ...
+
+    @staticmethod
+    def ceil(v: Vector2) -> CheckedVector2Int:
+        """Raises ``OverflowError`` for components that don't fit into a 64-bit integer and ``ValueError`` for NaN."""
+        ...
+
+    @staticmethod
+    def floor(v: Vector2) -> CheckedVector2Int:
+        """Raises ``OverflowError`` for components that don't fit into a 64-bit integer and ``ValueError`` for NaN."""
+        ...
+
+    @staticmethod
+    def round(v: Vector2) -> CheckedVector2Int:
+        """Raises ``OverflowError`` for components that don't fit into a 64-bit integer and ``ValueError`` for NaN."""
+        ...
+
+    @staticmethod
+    def trunc(v: Vector2) -> CheckedVector2Int:
+        """Raises ``OverflowError`` for components that don't fit into a 64-bit integer and ``ValueError`` for NaN."""
+        ...
+
+    @staticmethod
+    def min(a: Vector2Int, b: Vector2Int) -> CheckedVector2Int: ...
+
+    @staticmethod
+    def max(a: Vector2Int, b: Vector2Int) -> CheckedVector2Int: ...
+
+    @staticmethod
+    def from_buffer(buffer: Buffer) -> list[CheckedVector2Int]: ...
+
+class SaturatingVector2Int(Vector2Int):
+    """
+    A `Vector2Int` that clamps results to the range of a 64-bit integer instead of wrapping around.
+
+    Arithmetic with a plain `Vector2Int` on either side results in a `SaturatingVector2Int`.
+    Integer operands aren't limited to 64 bits, the exact result is clamped.
+    Everything else is inherited from `Vector2Int`, including equality and hashing, so a `SaturatingVector2Int` can be used wherever a `Vector2Int` is expected.
+
+    NOTE: Division by zero still raises ``ZeroDivisionError``.
+    """
+    zero: ClassVar[SaturatingVector2Int]
+    one: ClassVar[SaturatingVector2Int]
+    up: ClassVar[SaturatingVector2Int]
+    down: ClassVar[SaturatingVector2Int]
+    left: ClassVar[SaturatingVector2Int]
+    right: ClassVar[SaturatingVector2Int]
+
+    def __add__(self, other: Vector2Int) -> SaturatingVector2Int: ...
+    def __radd__(self, other: Vector2Int) -> SaturatingVector2Int: ...
+
+    def __sub__(self, other: Vector2Int) -> SaturatingVector2Int: ...
+    def __rsub__(self, other: Vector2Int) -> SaturatingVector2Int: ...
+
+    def __mul__(self, other: Vector2Int | int) -> SaturatingVector2Int: ...
+    def __rmul__(self, other: Vector2Int | int) -> SaturatingVector2Int: ...
+
+    def __floordiv__(self, other: Vector2Int | int) -> SaturatingVector2Int: ...
+
+    def __mod__(self, other: Vector2Int | int) -> SaturatingVector2Int: ...
+
+    def __divmod__(self, other: Vector2Int | int) -> tuple[SaturatingVector2Int, SaturatingVector2Int]: ...
+
+    def __neg__(self) -> SaturatingVector2Int: ...
+
+    def __abs__(self) -> SaturatingVector2Int: ...
+
+    @staticmethod
+    def ceil(v: Vector2) -> SaturatingVector2Int:
+        """Components that don't fit into a 64-bit integer are clamped. Raises ``ValueError`` for NaN."""
+        ...
+
+    @staticmethod
+    def floor(v: Vector2) -> SaturatingVector2Int:
+        """Components that don't fit into a 64-bit integer are clamped. Raises ``ValueError`` for NaN."""
+        ...
+
+    @staticmethod
+    def round(v: Vector2) -> SaturatingVector2Int:
+        """Components that don't fit into a 64-bit integer are clamped. Raises ``ValueError`` for NaN."""
+        ...
+
+    @staticmethod
+    def trunc(v: Vector2) -> SaturatingVector2Int:
+        """Components that don't fit into a 64-bit integer are clamped. Raises ``ValueError`` for NaN."""
+        ...
+
+    @staticmethod
+    def min(a: Vector2Int, b: Vector2Int) -> SaturatingVector2Int: ...
+
+    @staticmethod
+    def max(a: Vector2Int, b: Vector2Int) -> SaturatingVector2Int: ...
+
+    @staticmethod
+    def from_buffer(buffer: Buffer) -> list[SaturatingVector2Int]: ...
@@ -0,0 +1,380 @@
+#cython: language_level=3
+
+cimport cython
+from libc.limits cimport LLONG_MIN, LLONG_MAX
+from libc.math cimport ceil, floor, isnan, round, trunc
+
+from ._batch cimport check_pairs
+from ._overflow cimport checked_add, checked_sub, checked_mul, checked_neg, checked_abs, checked_floordiv_mod, saturating_add, saturating_sub, saturating_mul, saturating_neg, saturating_abs
+from .vector2 cimport Vector2
+from .vector2_int cimport Vector2Int
+
+# Vector2Int wraps around on overflow like C integers. These subclasses replace the arithmetic with overflow aware versions.
+# Both operands are extracted into C integers first. If either operand has a policy, the result has it as well, the left operand wins ties.
+
+cdef enum:
+    _NOT_IMPLEMENTED = 0
+    _EXTRACTED = 1
+    _BIG_INT = 2 # Doesn't fit into a C integer, the exact result has to be computed with Python integers
+
+cdef int _operand(object other, bint allow_int, long long* x, long long* y) except -1:
+    if isinstance(other, Vector2Int):
+        x[0] = (<Vector2Int>other).x
+        y[0] = (<Vector2Int>other).y
+    elif allow_int and isinstance(other, int):
+        if not (LLONG_MIN <= other <= LLONG_MAX):
+            return _BIG_INT
+        x[0] = y[0] = other
+    else:
+        return _NOT_IMPLEMENTED
+    return _EXTRACTED
+
+cdef int _overflow() except -1:
+    raise OverflowError("Result does not fit into a 64-bit integer.")
+
+cdef int _check_divisor(long long x, long long y) except -1:
+    if x == 0 or y == 0:
+        raise ZeroDivisionError("integer division or modulo by zero")
+    return 0
+
+cdef int _check_finite(double value) except -1:
+    if isnan(value):
+        raise ValueError("Cannot convert float NaN to integer.")
+    return 0
+
+# 2 ** 63, every double in [-2 ** 63, 2 ** 63) fits into a long long after rounding towards zero
+cdef double _LIMIT = 9223372036854775808.0
+
+cdef long long _checked_int(double value) except? -1:
+    _check_finite(value)
+    if not (value >= -_LIMIT and value < _LIMIT):
+        _overflow()
+    return <long long>value
+
+cdef long long _checked_exact(object value) except? -1:
+    if not (LLONG_MIN <= value <= LLONG_MAX):
+        _overflow()
+    return value
+
+cdef long long _saturating_exact(object value) except? -1:
+    if value > LLONG_MAX:
+        return LLONG_MAX
+    if value < LLONG_MIN:
+        return LLONG_MIN
+    return value
+
+cdef long long _saturating_int(double value) except? -1:
+    _check_finite(value)
+    if value >= _LIMIT:
+        return LLONG_MAX
+    if value < -_LIMIT:
+        return LLONG_MIN
+    return <long long>value
+
+cdef class CheckedVector2Int(Vector2Int):
+    zero = new_checked_vector2_int(0, 0)
+    one = new_checked_vector2_int(1, 1)
+
+    up = new_checked_vector2_int(0, 1)
+    down = new_checked_vector2_int(0, -1)
+    left = new_checked_vector2_int(-1, 0)
+    right = new_checked_vector2_int(1, 0)
+
+    def __repr__(self):
+        # repr(self)
+        return f"CheckedVector2Int({self.x}, {self.y})"
+
+    def __add__(self, other):
+        # self + other
+        cdef long long x, y
+        if _operand(other, False, &x, &y) == _NOT_IMPLEMENTED:
+            return NotImplemented
+        if checked_add(self.x, x, &x) or checked_add(self.y, y, &y):
+            _overflow()
+        return new_checked_vector2_int(x, y)
+
+    def __radd__(self, other):
+        # other + self
+        cdef long long x, y
+        if _operand(other, False, &x, &y) == _NOT_IMPLEMENTED:
+            return NotImplemented
+        if checked_add(x, self.x, &x) or checked_add(y, self.y, &y):
+            _overflow()
+        return new_checked_vector2_int(x, y)
+
+    def __sub__(self, other):
+        # self - other
+        cdef long long x, y
+        if _operand(other, False, &x, &y) == _NOT_IMPLEMENTED:
+            return NotImplemented
+        if checked_sub(self.x, x, &x) or checked_sub(self.y, y, &y):
+            _overflow()
+        return new_checked_vector2_int(x, y)
+
+    def __rsub__(self, other):
+        # other - self
+        cdef long long x, y
+        if _operand(other, False, &x, &y) == _NOT_IMPLEMENTED:
+            return NotImplemented
+        if checked_sub(x, self.x, &x) or checked_sub(y, self.y, &y):
+            _overflow()
+        return new_checked_vector2_int(x, y)
+
+    def __mul__(self, other):
+        # self * other
+        cdef long long x, y
+        cdef int kind = _operand(other, True, &x, &y)
+        if kind == _NOT_IMPLEMENTED:
+            return NotImplemented
+        if kind == _BIG_INT:
+            return new_checked_vector2_int(_checked_exact(self.x * other), _checked_exact(self.y * other))
+        if checked_mul(self.x, x, &x) or checked_mul(self.y, y, &y):
+            _overflow()
+        return new_checked_vector2_int(x, y)
+
+    def __rmul__(self, other):
+        # other * self
+        cdef long long x, y
+        cdef int kind = _operand(other, True, &x, &y)
+        if kind == _NOT_IMPLEMENTED:
+            return NotImplemented
+        if kind == _BIG_INT:
+            return new_checked_vector2_int(_checked_exact(other * self.x), _checked_exact(other * self.y))
+        if checked_mul(x, self.x, &x) or checked_mul(y, self.y, &y):
+            _overflow()
+        return new_checked_vector2_int(x, y)
+
+    def __floordiv__(self, other):
+        # self // other
+        cdef long long x, y, x_mod, y_mod
+        cdef int kind = _operand(other, True, &x, &y)
+        if kind == _NOT_IMPLEMENTED:
+            return NotImplemented
+        if kind == _BIG_INT:
+            return new_checked_vector2_int(_checked_exact(self.x // other), _checked_exact(self.y // other))
+        _check_divisor(x, y)
+        if checked_floordiv_mod(self.x, x, &x, &x_mod) or checked_floordiv_mod(self.y, y, &y, &y_mod):
+            _overflow()
+        return new_checked_vector2_int(x, y)
+
+    def __mod__(self, other):
+        # self % other
+        cdef long long x, y, x_div, y_div
+        cdef int kind = _operand(other, True, &x, &y)
+        if kind == _NOT_IMPLEMENTED:
+            return NotImplemented
+        if kind == _BIG_INT:
+            return new_checked_vector2_int(_checked_exact(self.x % other), _checked_exact(self.y % other))
+        _check_divisor(x, y)
+        checked_floordiv_mod(self.x, x, &x_div, &x) # The remainder never overflows
+        checked_floordiv_mod(self.y, y, &y_div, &y)
+        return new_checked_vector2_int(x, y)
+
+    def __divmod__(self, other):
+        # divmod(self, other)
+        cdef long long x, y, x_div, y_div
+        cdef int kind = _operand(other, True, &x, &y)
+        if kind == _NOT_IMPLEMENTED:
+            return NotImplemented
+        if kind == _BIG_INT:
+            qx, rx = divmod(self.x, other)
+            qy, ry = divmod(self.y, other)
+            return (new_checked_vector2_int(_checked_exact(qx), _checked_exact(qy)), new_checked_vector2_int(_checked_exact(rx), _checked_exact(ry)))
+        _check_divisor(x, y)
+        if checked_floordiv_mod(self.x, x, &x_div, &x) or checked_floordiv_mod(self.y, y, &y_div, &y):
+            _overflow()
+        return (new_checked_vector2_int(x_div, y_div), new_checked_vector2_int(x, y))
+
+    def __neg__(self):
+        # -self
+        cdef long long x, y
+        if checked_neg(self.x, &x) or checked_neg(self.y, &y):
+            _overflow()
+        return new_checked_vector2_int(x, y)
+
+    def __abs__(self):
+        # abs(self)
+        cdef long long x, y
+        if checked_abs(self.x, &x) or checked_abs(self.y, &y):
+            _overflow()
+        return new_checked_vector2_int(x, y)
+
+    def __reduce__(self):
+        return (CheckedVector2Int, (self.x, self.y))
+
+    @staticmethod
+    def ceil(Vector2 v):
+        return new_checked_vector2_int(_checked_int(ceil(v.x)), _checked_int(ceil(v.y)))
+
+    @staticmethod
+    def floor(Vector2 v):
+        return new_checked_vector2_int(_checked_int(floor(v.x)), _checked_int(floor(v.y)))
+
+    @staticmethod
+    def round(Vector2 v):
+        return new_checked_vector2_int(_checked_int(round(v.x)), _checked_int(round(v.y))) # Rounds halfway cases away from zero like llround
+
+    @staticmethod
+    def trunc(Vector2 v):
+        return new_checked_vector2_int(_checked_int(trunc(v.x)), _checked_int(trunc(v.y)))
+
+    @staticmethod
+    def min(Vector2Int a, Vector2Int b):
+        return new_checked_vector2_int(min(a.x, b.x), min(a.y, b.y))
+
+    @staticmethod
+    def max(Vector2Int a, Vector2Int b):
+        return new_checked_vector2_int(max(a.x, b.x), max(a.y, b.y))
+
+    @staticmethod
+    def from_buffer(const long long[:, ::1] buffer):
+        check_pairs(buffer.shape[1])
+        cdef Py_ssize_t i
+        return [new_checked_vector2_int(buffer[i, 0], buffer[i, 1]) for i in range(buffer.shape[0])]
+
+cdef class SaturatingVector2Int(Vector2Int):
+    zero = new_saturating_vector2_int(0, 0)
+    one = new_saturating_vector2_int(1, 1)
+
+    up = new_saturating_vector2_int(0, 1)
+    down = new_saturating_vector2_int(0, -1)
+    left = new_saturating_vector2_int(-1, 0)
+    right = new_saturating_vector2_int(1, 0)
+
+    def __repr__(self):
+        # repr(self)
+        return f"SaturatingVector2Int({self.x}, {self.y})"
+
+    def __add__(self, other):
+        # self + other
+        cdef long long x, y
+        if _operand(other, False, &x, &y) == _NOT_IMPLEMENTED:
+            return NotImplemented
+        return new_saturating_vector2_int(saturating_add(self.x, x), saturating_add(self.y, y))
+
+    def __radd__(self, other):
+        # other + self
+        cdef long long x, y
+        if _operand(other, False, &x, &y) == _NOT_IMPLEMENTED:
+            return NotImplemented
+        return new_saturating_vector2_int(saturating_add(x, self.x), saturating_add(y, self.y))
+
+    def __sub__(self, other):
+        # self - other
+        cdef long long x, y
+        if _operand(other, False, &x, &y) == _NOT_IMPLEMENTED:
+            return NotImplemented
+        return new_saturating_vector2_int(saturating_sub(self.x, x), saturating_sub(self.y, y))
+
+    def __rsub__(self, other):
+        # other - self
+        cdef long long x, y
+        if _operand(other, False, &x, &y) == _NOT_IMPLEMENTED:
+            return NotImplemented
+        return new_saturating_vector2_int(saturating_sub(x, self.x), saturating_sub(y, self.y))
+
+    def __mul__(self, other):
+        # self * other
+        cdef long long x, y
+        cdef int kind = _operand(other, True, &x, &y)
+        if kind == _NOT_IMPLEMENTED:
+            return NotImplemented
+        if kind == _BIG_INT:
+            return new_saturating_vector2_int(_saturating_exact(self.x * other), _saturating_exact(self.y * other))
+        return new_saturating_vector2_int(saturating_mul(self.x, x), saturating_mul(self.y, y))
+
+    def __rmul__(self, other):
+        # other * self
+        cdef long long x, y
+        cdef int kind = _operand(other, True, &x, &y)
+        if kind == _NOT_IMPLEMENTED:
+            return NotImplemented
+        if kind == _BIG_INT:
+            return new_saturating_vector2_int(_saturating_exact(other * self.x), _saturating_exact(other * self.y))
+        return new_saturating_vector2_int(saturating_mul(x, self.x), saturating_mul(y, self.y))
+
+    def __floordiv__(self, other):
+        # self // other
+        cdef long long x, y, x_mod, y_mod
+        cdef int kind = _operand(other, True, &x, &y)
+        if kind == _NOT_IMPLEMENTED:
+            return NotImplemented
+        if kind == _BIG_INT:
+            return new_saturating_vector2_int(_saturating_exact(self.x // other), _saturating_exact(self.y // other))
+        _check_divisor(x, y)
+        if checked_floordiv_mod(self.x, x, &x, &x_mod): # Only LLONG_MIN // -1 overflows
+            x = LLONG_MAX
+        if checked_floordiv_mod(self.y, y, &y, &y_mod):
+            y = LLONG_MAX
+        return new_saturating_vector2_int(x, y)
+
+    def __mod__(self, other):
+        # self % other
+        cdef long long x, y, x_div, y_div
+        cdef int kind = _operand(other, True, &x, &y)
+        if kind == _NOT_IMPLEMENTED:
+            return NotImplemented
+        if kind == _BIG_INT:
+            return new_saturating_vector2_int(_saturating_exact(self.x % other), _saturating_exact(self.y % other))
+        _check_divisor(x, y)
+        checked_floordiv_mod(self.x, x, &x_div, &x) # The remainder never overflows
+        checked_floordiv_mod(self.y, y, &y_div, &y)
+        return new_saturating_vector2_int(x, y)
+
+    def __divmod__(self, other):
+        # divmod(self, other)
+        cdef long long x, y, x_div, y_div
+        cdef int kind = _operand(other, True, &x, &y)
+        if kind == _NOT_IMPLEMENTED:
+            return NotImplemented
+        if kind == _BIG_INT:
+            qx, rx = divmod(self.x, other)
+            qy, ry = divmod(self.y, other)
+            return (new_saturating_vector2_int(_saturating_exact(qx), _saturating_exact(qy)), new_saturating_vector2_int(_saturating_exact(rx), _saturating_exact(ry)))
+        _check_divisor(x, y)
+        if checked_floordiv_mod(self.x, x, &x_div, &x):
+            x_div = LLONG_MAX
+        if checked_floordiv_mod(self.y, y, &y_div, &y):
+            y_div = LLONG_MAX
+        return (new_saturating_vector2_int(x_div, y_div), new_saturating_vector2_int(x, y))
+
+    def __neg__(self):
+        # -self
+        return new_saturating_vector2_int(saturating_neg(self.x), saturating_neg(self.y))
+
+    def __abs__(self):
+        # abs(self)
+        return new_saturating_vector2_int(saturating_abs(self.x), saturating_abs(self.y))
+
+    def __reduce__(self):
+        return (SaturatingVector2Int, (self.x, self.y))
+
+    @staticmethod
+    def ceil(Vector2 v):
+        return new_saturating_vector2_int(_saturating_int(ceil(v.x)), _saturating_int(ceil(v.y)))
+
+    @staticmethod
+    def floor(Vector2 v):
+        return new_saturating_vector2_int(_saturating_int(floor(v.x)), _saturating_int(floor(v.y)))
+
+    @staticmethod
+    def round(Vector2 v):
+        return new_saturating_vector2_int(_saturating_int(round(v.x)), _saturating_int(round(v.y))) # Rounds halfway cases away from zero like llround
+
+    @staticmethod
+    def trunc(Vector2 v):
+        return new_saturating_vector2_int(_saturating_int(trunc(v.x)), _saturating_int(trunc(v.y)))
+
+    @staticmethod
+    def min(Vector2Int a, Vector2Int b):
+        return new_saturating_vector2_int(min(a.x, b.x), min(a.y, b.y))
+
+    @staticmethod
+    def max(Vector2Int a, Vector2Int b):
+        return new_saturating_vector2_int(max(a.x, b.x), max(a.y, b.y))
+
+    @staticmethod
+    def from_buffer(const long long[:, ::1] buffer):
+        check_pairs(buffer.shape[1])
+        cdef Py_ssize_t i
+        return [new_saturating_vector2_int(buffer[i, 0], buffer[i, 1]) for i in range(buffer.shape[0])]
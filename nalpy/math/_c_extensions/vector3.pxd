@@ -0,0 +1,22 @@
+#cython: language_level=3
+
+from libc.math cimport hypot, sqrt
+
+cdef class Vector3:
+    cdef readonly double x
+    cdef readonly double y
+    cdef readonly double z
+
+cdef inline Vector3 new_vector3(double x, double y, double z):
+    # Vector3(x, y, z) without the overhead of calling __init__ through Python
+    cdef Vector3 v = Vector3.__new__(Vector3)
+    v.x = x
+    v.y = y
+    v.z = z
+    return v
+
+cdef inline double magnitude3(double x, double y, double z) noexcept nogil:
+    cdef double squared = x * x + y * y + z * z
+    if 1e-290 < squared < 1e290: # No overflow or harmful underflow, also false for inf and nan
+        return sqrt(squared)
+    return hypot(hypot(x, y), z) # Slower, but scales the components like the 2D types do
@@ -0,0 +1,174 @@
+from typing import ClassVar, Iterable, Iterator, SupportsIndex, TypeVar, overload
+from typing_extensions import Buffer
+from .mvector3 import MVector3
+from .vector3_array import Vector3Array
+
+_OutT = TypeVar("_OutT", bound=Buffer)
+
+class Vector3:
+    """An immutable three-dimensional vector"""
+
+    zero: ClassVar[Vector3]
+    """Shorthand for ``Vector3(0.0, 0.0, 0.0)``"""
+    one: ClassVar[Vector3]
+    """Shorthand for ``Vector3(1.0, 1.0, 1.0)``"""
+    up: ClassVar[Vector3]
+    """A unit vector pointing up (vector j). Shorthand for ``Vector3(0.0, 1.0, 0.0)``"""
+    down: ClassVar[Vector3]
+    """A unit vector pointing down. Shorthand for ``Vector3(0.0, -1.0, 0.0)``"""
+    left: ClassVar[Vector3]
+    """A unit vector pointing left. Shorthand for ``Vector3(-1.0, 0.0, 0.0)``"""
+    right: ClassVar[Vector3]
+    """A unit vector pointing right (vector i). Shorthand for ``Vector3(1.0, 0.0, 0.0)``"""
+    forward: ClassVar[Vector3]
+    """A unit vector pointing forward (vector k). Shorthand for ``Vector3(0.0, 0.0, 1.0)``"""
+    back: ClassVar[Vector3]
+    """A unit vector pointing back. Shorthand for ``Vector3(0.0, 0.0, -1.0)``"""
+
+    def __init__(self, x: float, y: float, z: float) -> None: ...
+
+    def __getitem__(self, i: SupportsIndex) -> float: ...
+
+    @property
+    def x(self) -> float: ...
+
+    @property
+    def y(self) -> float: ...
+
+    @property
+    def z(self) -> float: ...
+
+    def __repr__(self) -> str: ...
+
+    def __len__(self) -> int: ...
+
+    def __add__(self, other: Vector3) -> Vector3: ...
+
+    def __sub__(self, other: Vector3) -> Vector3: ...
+
+    def __mul__(self, other: Vector3 | float | int) -> Vector3: ...
+
+    def __rmul__(self, other: Vector3 | float | int) -> Vector3: ...
+
+    def __truediv__(self, other: Vector3 | float | int) -> Vector3: ...
+
+    def __floordiv__(self, other: Vector3 | float | int) -> Vector3: ...
+
+    def __mod__(self, other: Vector3 | float | int) -> Vector3: ...
+
+    def __divmod__(self, other: Vector3 | float | int) -> tuple[Vector3, Vector3]: ...
+
+    def __neg__(self) -> Vector3: ...
+
+    def __abs__(self) -> Vector3: ...
+
+    def __eq__(self, other: Vector3) -> bool: ...
+
+    def __iter__(self) -> Iterator[float]: ...
+
+    def __hash__(self) -> int: ...
+
+    @property
+    def magnitude(self) -> float:
+        """The length of this vector."""
+        ...
+
+    @property
+    def normalized(self) -> Vector3:
+        """A copy of this vector with a magnitude of 1"""
+        ...
+
+    @staticmethod
+    def dot(a: Vector3, b: Vector3) -> float:
+        """Dot Product of two `Vector3` vectors."""
+        ...
+
+    @staticmethod
+    def cross(a: Vector3, b: Vector3) -> Vector3:
+        """Cross Product of two `Vector3` vectors. The result is perpendicular to both ``a`` and ``b``."""
+        ...
+
+    @staticmethod
+    def lerp(a: Vector3, b: Vector3, t: float) -> Vector3:
+        """
+        Linearly interpolates between vectors ``a`` and ``b`` by ``t``.
+
+        The parameter ``t`` is clamped to the range [0, 1].
+        """
+        ...
+
+    @staticmethod
+    def lerp_unclamped(a: Vector3, b: Vector3, t: float) -> Vector3:
+        """
+        Linearly interpolates between vectors ``a`` and ``b`` by ``t``.
+
+        The parameter ``t`` is not clamped.
+        """
+        ...
+
+    @staticmethod
+    def move_towards(current: Vector3, target: Vector3, max_distance_delta: float) -> Vector3:
+        """Moves a point current towards target."""
+        ...
+
+    @staticmethod
+    def smooth_damp(current: Vector3, target: Vector3, current_velocity: MVector3, smooth_time: float, delta_time: float, max_speed: float = float("inf")) -> Vector3:
+        """Gradually changes a vector towards a desired goal over time."""
+        ...
+
+    @staticmethod
+    def reflect(vector: Vector3, normal: Vector3) -> Vector3:
+        """Reflects a vector off the plane defined by a normal."""
+        ...
+
+    @staticmethod
+    def angle(_from: Vector3, _to: Vector3) -> float:
+        """
+        Gets the unsigned angle in degrees between from and to.
+
+        NOTE: The angle returned will always be between 0 and 180 degrees, because the method returns the smallest angle between the vectors.
+        """
+        ...
+
+    @staticmethod
+    def signed_angle(_from: Vector3, _to: Vector3, axis: Vector3) -> float:
+        """
+        Gets the signed angle in degrees between from and to. The angle is positive when the rotation from from to to is counterclockwise around ``axis``.
+
+        NOTE: The angle returned will always be between -180 and 180 degrees, because the method returns the smallest angle between the vectors.
+        """
+        ...
+
+    @staticmethod
+    def distance(a: Vector3, b: Vector3) -> float:
+        """Returns the distance between a and b."""
+        ...
+
+    @staticmethod
+    def min(a: Vector3, b: Vector3) -> Vector3:
+        """Create a new `Vector3` by selecting the smallest components of the two given `Vector3` instances."""
+        ...
+
+    @staticmethod
+    def max(a: Vector3, b: Vector3) -> Vector3:
+        """Create a new `Vector3` by selecting the largest components of the two given `Vector3` instances."""
+        ...
+
+    @staticmethod
+    def from_buffer(buffer: Buffer) -> list[Vector3]:
+        """Unpack a contiguous ``(n, 3)`` buffer of doubles into a list of `Vector3` instances."""
+        ...
+
+    @overload
+    @staticmethod
+    def to_buffer(vectors: Iterable[Vector3]) -> Vector3Array:
+        """Pack `Vector3` instances into a new `Vector3Array`."""
+        ...
+    @overload
+    @staticmethod
+    def to_buffer(vectors: Iterable[Vector3], out: _OutT) -> _OutT:
+        """Pack `Vector3` instances into ``out``, which must be a writable contiguous ``(n, 3)`` buffer of doubles."""
+        ...
+
+    def to_tuple(self) -> tuple[float, float, float]: ...
+    def to_dict(self) -> dict[str, float]: ...
@@ -0,0 +1,378 @@
+#cython: language_level=3
+
+cimport cython
+from libc.math cimport acos, fabs, INFINITY
+
+from ._batch cimport check_length, check_triples
+from ._hash cimport hash3
+from .mvector3 cimport MVector3
+
+cdef double _rad2deg = 180.0 / 3.14159265358979323846
+
+cdef inline double _Vector3Angle(Vector3 _from, Vector3 _to):
+    cdef double denom = magnitude3(_from.x, _from.y, _from.z) * magnitude3(_to.x, _to.y, _to.z) # Multiply magnitudes
+    if denom == 0.0:
+        return 0.0
+
+    cdef double dot = (_from.x * _to.x) + (_from.y * _to.y) + (_from.z * _to.z)
+
+    cdef double cos_val = dot / denom
+    if cos_val < -1.0: # Clamp to range [-1, 1]
+        cos_val = -1.0
+    elif cos_val > 1.0:
+        cos_val = 1.0
+
+    return acos(cos_val) * _rad2deg
+
+cdef Vector3 _zero # Vector3.zero without the attribute lookup, assigned after the class has been created
+
+@cython.freelist(256)
+cdef class Vector3:
+    zero = new_vector3(0.0, 0.0, 0.0)
+    one = new_vector3(1.0, 1.0, 1.0)
+
+    up = new_vector3(0.0, 1.0, 0.0)
+    down = new_vector3(0.0, -1.0, 0.0)
+    left = new_vector3(-1.0, 0.0, 0.0)
+    right = new_vector3(1.0, 0.0, 0.0)
+    forward = new_vector3(0.0, 0.0, 1.0)
+    back = new_vector3(0.0, 0.0, -1.0)
+
+
+    def __init__(self, double x, double y, double z):
+        # Vector3(x, y, z)
+        self.x = x
+        self.y = y
+        self.z = z
+
+    def __getitem__(self, Py_ssize_t i):
+        # self[i]
+        if i == 0:
+            return self.x
+        if i == 1:
+            return self.y
+        if i == 2:
+            return self.z
+
+        raise IndexError(i)
+
+    def __repr__(self):
+        # repr(self)
+        return f"Vector3({self.x}, {self.y}, {self.z})"
+
+    def __len__(self):
+        # len(self)
+        return 3
+
+    def __add__(self, other):
+        # self + other
+        if not isinstance(other, Vector3):
+            return NotImplemented # Lets Vector3Array handle Vector3 + Vector3Array
+        cdef Vector3 vec = <Vector3>other
+        return new_vector3(self.x + vec.x, self.y + vec.y, self.z + vec.z)
+
+    def __sub__(self, other):
+        # self - other
+        if not isinstance(other, Vector3):
+            return NotImplemented # Lets Vector3Array handle Vector3 - Vector3Array
+        cdef Vector3 vec = <Vector3>other
+        return new_vector3(self.x - vec.x, self.y - vec.y, self.z - vec.z)
+
+    def __mul__(self, other):
+        # self * other
+        cdef double x # Extracted into cdef so that Cython uses C math instead of Python math
+        cdef double y
+        cdef double z
+        if isinstance(other, Vector3):
+            x = other.x
+            y = other.y
+            z = other.z
+        elif isinstance(other, (float, int)):
+            x = y = z = other
+        else:
+            return NotImplemented
+
+        return new_vector3(self.x * x, self.y * y, self.z * z)
+
+    def __rmul__(self, other):
+        # other * self
+        cdef double x # Extracted into cdef so that Cython uses C math instead of Python math
+        cdef double y
+        cdef double z
+        if isinstance(other, Vector3):
+            x = other.x
+            y = other.y
+            z = other.z
+        elif isinstance(other, (float, int)):
+            x = y = z = other
+        else:
+            return NotImplemented
+
+        return new_vector3(self.x * x, self.y * y, self.z * z)
+
+    def __truediv__(self, other):
+        # self / other
+        cdef double x # Extracted into cdef so that Cython uses C math instead of Python math
+        cdef double y
+        cdef double z
+        if isinstance(other, Vector3):
+            x = other.x
+            y = other.y
+            z = other.z
+        elif isinstance(other, (float, int)):
+            x = y = z = other
+        else:
+            return NotImplemented
+
+        return new_vector3(self.x / x, self.y / y, self.z / z)
+
+    def __floordiv__(self, other):
+        # self // other
+        cdef double x # Extracted into cdef so that Cython uses C math instead of Python math
+        cdef double y
+        cdef double z
+        if isinstance(other, Vector3):
+            x = other.x
+            y = other.y
+            z = other.z
+        elif isinstance(other, (float, int)):
+            x = y = z = other
+        else:
+            return NotImplemented
+
+        return new_vector3(self.x // x, self.y // y, self.z // z) # Cython compiles floordiv into C
+
+    def __mod__(self, other):
+        # self % other
+        cdef double x # Extracted into cdef so that Cython uses C math instead of Python math
+        cdef double y
+        cdef double z
+        if isinstance(other, Vector3):
+            x = other.x
+            y = other.y
+            z = other.z
+        elif isinstance(other, (float, int)):
+            x = y = z = other
+        else:
+            return NotImplemented
+
+        return new_vector3(self.x % x, self.y % y, self.z % z) # Cython compiles modulo into C
+
+    def __divmod__(self, other):
+        # divmod(self, other)
+        cdef double x
+        cdef double y
+        cdef double z
+        if isinstance(other, Vector3):
+            x = other.x
+            y = other.y
+            z = other.z
+        elif isinstance(other, (float, int)):
+            x = y = z = other
+        else:
+            return NotImplemented
+
+        cdef double x_fdiv = self.x // x # Cython doesn't have a divmod variant for C
+        cdef double x_mod = self.x % x   # We calculate these separately to avoid using Python's divmod
+        cdef double y_fdiv = self.y // y
+        cdef double y_mod = self.y % y
+        cdef double z_fdiv = self.z // z
+        cdef double z_mod = self.z % z
+        return (new_vector3(x_fdiv, y_fdiv, z_fdiv), new_vector3(x_mod, y_mod, z_mod))
+
+    def __neg__(self):
+        # -self
+        return new_vector3(-self.x, -self.y, -self.z)
+
+    def __abs__(self):
+        # abs(self)
+        return new_vector3(fabs(self.x), fabs(self.y), fabs(self.z))
+
+    def __eq__(self, Vector3 other):
+        # self == other
+        return self.x == other.x and self.y == other.y and self.z == other.z
+
+    def __iter__(self):
+        # iter(self)
+        return iter((self.x, self.y, self.z))
+
+    def __hash__(self):
+        # Same as hash((self.x, self.y, self.z))
+        return hash3(self.x, self.y, self.z)
+
+    @property
+    def magnitude(self):
+        return magnitude3(self.x, self.y, self.z)
+
+    @property
+    def normalized(self):
+        cdef double magnitude = magnitude3(self.x, self.y, self.z)
+        if magnitude == 0.0:
+            return _zero
+        return new_vector3(self.x / magnitude, self.y / magnitude, self.z / magnitude)
+
+    @staticmethod
+    def dot(Vector3 a, Vector3 b):
+        return (a.x * b.x) + (a.y * b.y) + (a.z * b.z)
+
+    @staticmethod
+    def cross(Vector3 a, Vector3 b):
+        return new_vector3(
+            (a.y * b.z) - (a.z * b.y),
+            (a.z * b.x) - (a.x * b.z),
+            (a.x * b.y) - (a.y * b.x)
+        )
+
+    @staticmethod
+    def lerp(Vector3 a, Vector3 b, double t):
+        if t < 0.0: # clamp01 substitute
+            t = 0.0
+        elif t > 1.0:
+            t = 1.0
+
+        return new_vector3(a.x + ((b.x - a.x) * t), a.y + ((b.y - a.y) * t), a.z + ((b.z - a.z) * t))
+
+    @staticmethod
+    def lerp_unclamped(Vector3 a, Vector3 b, double t):
+        return new_vector3(a.x + ((b.x - a.x) * t), a.y + ((b.y - a.y) * t), a.z + ((b.z - a.z) * t))
+
+    @staticmethod
+    def move_towards(Vector3 current, Vector3 target, double max_distance_delta):
+        cdef double to_vector_x = target.x - current.x
+        cdef double to_vector_y = target.y - current.y
+        cdef double to_vector_z = target.z - current.z
+
+        cdef double dist = magnitude3(to_vector_x, to_vector_y, to_vector_z)
+
+        if dist == 0 or (max_distance_delta >= 0 and dist <= max_distance_delta):
+            return target
+
+        return new_vector3(
+            current.x + to_vector_x / dist * max_distance_delta,
+            current.y + to_vector_y / dist * max_distance_delta,
+            current.z + to_vector_z / dist * max_distance_delta
+        )
+
+    @staticmethod
+    def smooth_damp(Vector3 current, Vector3 target, MVector3 current_velocity, double smooth_time, double delta_time, double max_speed = <double>INFINITY):
+        # Heavy inspiration from https://github.com/Unity-Technologies/UnityCsReference/blob/2023.2/Runtime/Export/Math/Vector3.cs#L97
+
+        smooth_time = max(0.0001, smooth_time)
+        cdef double omega = 2.0 / smooth_time
+
+        cdef double x = omega * delta_time
+        cdef double exp = 1.0 / (1.0 + x + 0.48 * x * x + 0.235 * x * x * x)
+
+        cdef double change_x = current.x - target.x
+        cdef double change_y = current.y - target.y
+        cdef double change_z = current.z - target.z
+        cdef Vector3 original_to = target
+
+        cdef double max_change = max_speed * smooth_time
+        cdef double dist = magnitude3(change_x, change_y, change_z)
+        if dist > max_change:
+            change_x = change_x / dist * max_change
+            change_y = change_y / dist * max_change
+            change_z = change_z / dist * max_change
+
+        cdef double target_x = current.x - change_x
+        cdef double target_y = current.y - change_y
+        cdef double target_z = current.z - change_z
+
+        cdef double temp_x = (current_velocity.x + omega * change_x) * delta_time
+        cdef double temp_y = (current_velocity.y + omega * change_y) * delta_time
+        cdef double temp_z = (current_velocity.z + omega * change_z) * delta_time
+
+        current_velocity.x = (current_velocity.x - omega * temp_x) * exp
+        current_velocity.y = (current_velocity.y - omega * temp_y) * exp
+        current_velocity.z = (current_velocity.z - omega * temp_z) * exp
+
+        cdef double output_x = target_x + (change_x + temp_x) * exp
+        cdef double output_y = target_y + (change_y + temp_y) * exp
+        cdef double output_z = target_z + (change_z + temp_z) * exp
+
+        cdef double orig_minus_current_x = original_to.x - current.x
+        cdef double orig_minus_current_y = original_to.y - current.y
+        cdef double orig_minus_current_z = original_to.z - current.z
+        cdef double out_minus_orig_x = output_x - original_to.x
+        cdef double out_minus_orig_y = output_y - original_to.y
+        cdef double out_minus_orig_z = output_z - original_to.z
+
+        if (orig_minus_current_x * out_minus_orig_x + orig_minus_current_y * out_minus_orig_y + orig_minus_current_z * out_minus_orig_z) > 0:
+            output_x = original_to.x
+            output_y = original_to.y
+            output_z = original_to.z
+
+            current_velocity.x = (output_x - original_to.x) / delta_time
+            current_velocity.y = (output_y - original_to.y) / delta_time
+            current_velocity.z = (output_z - original_to.z) / delta_time
+
+        return new_vector3(output_x, output_y, output_z)
+
+    @staticmethod
+    def reflect(Vector3 vector, Vector3 normal):
+        cdef double factor = -2.0 * ((normal.x * vector.x) + (normal.y * vector.y) + (normal.z * vector.z))
+        return new_vector3(factor * normal.x + vector.x, factor * normal.y + vector.y, factor * normal.z + vector.z)
+
+    @staticmethod
+    def angle(Vector3 _from, Vector3 _to):
+        return _Vector3Angle(_from, _to)
+
+    @staticmethod
+    def signed_angle(Vector3 _from, Vector3 _to, Vector3 axis):
+        cdef double unsigned_angle = _Vector3Angle(_from, _to)
+        cdef double cross_x = (_from.y * _to.z) - (_from.z * _to.y)
+        cdef double cross_y = (_from.z * _to.x) - (_from.x * _to.z)
+        cdef double cross_z = (_from.x * _to.y) - (_from.y * _to.x)
+        if ((axis.x * cross_x) + (axis.y * cross_y) + (axis.z * cross_z)) < 0.0:
+            return -unsigned_angle
+        else:
+            return unsigned_angle
+
+    @staticmethod
+    def distance(Vector3 a, Vector3 b):
+        return magnitude3(a.x - b.x, a.y - b.y, a.z - b.z)
+
+    @staticmethod
+    def min(Vector3 a, Vector3 b):
+        return new_vector3(min(a.x, b.x), min(a.y, b.y), min(a.z, b.z))
+
+    @staticmethod
+    def max(Vector3 a, Vector3 b):
+        return new_vector3(max(a.x, b.x), max(a.y, b.y), max(a.z, b.z))
+
+    @staticmethod
+    def from_buffer(const double[:, ::1] buffer):
+        check_triples(buffer.shape[1])
+        cdef Py_ssize_t i
+        return [new_vector3(buffer[i, 0], buffer[i, 1], buffer[i, 2]) for i in range(buffer.shape[0])]
+
+    @staticmethod
+    def to_buffer(vectors, out = None):
+        if not isinstance(vectors, (list, tuple)):
+            vectors = list(vectors)
+        cdef Py_ssize_t length = len(vectors)
+
+        if out is None:
+            from .vector3_array import Vector3Array # Imported lazily, vector3_array depends on this module.
+            out = Vector3Array.zeros(length)
+        cdef double[:, ::1] view = out
+        check_triples(view.shape[1])
+        check_length(length, view.shape[0])
+
+        cdef Py_ssize_t i
+        cdef Vector3 vec
+        for i in range(length):
+            vec = <Vector3?>vectors[i]
+            view[i, 0] = vec.x
+            view[i, 1] = vec.y
+            view[i, 2] = vec.z
+        return out
+
+    def to_tuple(self):
+        return (self.x, self.y, self.z)
+
+    def to_dict(self):
+        return {"x": self.x, "y": self.y, "z": self.z}
+
+_zero = Vector3.zero
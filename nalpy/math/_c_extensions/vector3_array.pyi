@@ -0,0 +1,146 @@
+from typing import Any, Iterable, Iterator, Self, SupportsIndex, TypeAlias, overload
+from typing_extensions import Buffer
+from .vector3 import Vector3
+
+_VectorOperand: TypeAlias = Vector3Array | Vector3 | Buffer | Iterable[Vector3 | tuple[float, float, float]]
+"""A single ``Vector3`` that is broadcast, an ``(n, 3)`` contiguous buffer of doubles or an iterable of vectors."""
+_DoubleOperand: TypeAlias = float | Buffer
+"""A single float that is broadcast or a one-dimensional contiguous buffer of doubles."""
+
+class Vector3Array:
+    """
+    A mutable, fixed-length array of three-dimensional vectors stored as contiguous ``(x, y, z)`` double triples.
+
+    Arithmetic is done elementwise in C without creating any per-element Python objects.
+    The right-hand operand can be another ``Vector3Array`` of the same length or a single ``Vector3`` (or a scalar for ``*``, ``/``, ``//`` and ``%``) that is broadcast over the whole array.
+
+    Supports the buffer protocol with shape ``(len(self), 3)`` and format ``"d"`` so that for example NumPy can view the data without copying.
+
+    NOTE: Division by zero follows IEEE 754 and results in ``inf`` or ``nan`` instead of raising ``ZeroDivisionError``.
+    """
+
+    def __init__(self, vectors: Iterable[Vector3 | tuple[float, float, float]] = ()) -> None: ...
+
+    @staticmethod
+    def zeros(length: int) -> Vector3Array:
+        """Create a new array of ``length`` zero vectors."""
+        ...
+
+    @staticmethod
+    def from_buffer(buffer: Buffer) -> Vector3Array:
+        """Create a new array by copying a contiguous ``(n, 3)`` buffer of doubles, for example a NumPy array of shape ``(n, 3)``."""
+        ...
+
+    def __len__(self) -> int: ...
+
+    @overload
+    def __getitem__(self, index: SupportsIndex) -> Vector3: ...
+    @overload
+    def __getitem__(self, index: slice) -> Vector3Array:
+        """Slices are views that share memory with the original array. Only contiguous slices (step 1) are supported."""
+        ...
+
+    def __setitem__(self, index: SupportsIndex, value: Vector3 | tuple[float, float, float]) -> None: ...
+
+    def __iter__(self) -> Iterator[Vector3]: ...
+
+    def __repr__(self) -> str: ...
+
+    def __eq__(self, other: object) -> bool: ...
+
+    def __add__(self, other: Vector3Array | Vector3) -> Vector3Array: ...
+    def __radd__(self, other: Vector3Array | Vector3) -> Vector3Array: ...
+    def __iadd__(self, other: Vector3Array | Vector3) -> Self: ...
+
+    def __sub__(self, other: Vector3Array | Vector3) -> Vector3Array: ...
+    def __rsub__(self, other: Vector3Array | Vector3) -> Vector3Array: ...
+    def __isub__(self, other: Vector3Array | Vector3) -> Self: ...
+
+    def __mul__(self, other: Vector3Array | Vector3 | float | int) -> Vector3Array: ...
+    def __rmul__(self, other: Vector3Array | Vector3 | float | int) -> Vector3Array: ...
+    def __imul__(self, other: Vector3Array | Vector3 | float | int) -> Self: ...
+
+    def __truediv__(self, other: Vector3Array | Vector3 | float | int) -> Vector3Array: ...
+    def __rtruediv__(self, other: Vector3Array | Vector3 | float | int) -> Vector3Array: ...
+    def __itruediv__(self, other: Vector3Array | Vector3 | float | int) -> Self: ...
+
+    def __floordiv__(self, other: Vector3Array | Vector3 | float | int) -> Vector3Array: ...
+    def __rfloordiv__(self, other: Vector3Array | Vector3 | float | int) -> Vector3Array: ...
+    def __ifloordiv__(self, other: Vector3Array | Vector3 | float | int) -> Self: ...
+
+    def __mod__(self, other: Vector3Array | Vector3 | float | int) -> Vector3Array: ...
+    def __rmod__(self, other: Vector3Array | Vector3 | float | int) -> Vector3Array: ...
+    def __imod__(self, other: Vector3Array | Vector3 | float | int) -> Self: ...
+
+    def __neg__(self) -> Vector3Array: ...
+
+    def __abs__(self) -> Vector3Array: ...
+
+    def __buffer__(self, flags: int, /) -> memoryview: ...
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> Any:
+        """NumPy array of shape ``(len(self), 3)`` that shares memory with this array unless a copy is requested or required by ``dtype``. Raises ``ValueError`` if ``copy`` is ``False`` and ``dtype`` requires a copy."""
+        ...
+
+    @property
+    def normalized(self) -> Vector3Array:
+        """A copy of this array where every vector has a magnitude of 1. Zero vectors stay zero."""
+        ...
+
+    def normalize(self) -> None:
+        """Make every vector in this array keep its direction, but have a magnitude of 1. Operates in place."""
+        ...
+
+    def copy(self) -> Vector3Array:
+        """Make a new array that doesn't share memory with this array."""
+        ...
+
+    def to_list(self) -> list[Vector3]: ...
+
+    # Batched variants of the Vector3 static methods.
+    # Results are written into ``out`` if given (any writable contiguous buffer of the right shape, may be one of the inputs), otherwise a new buffer is allocated.
+    # Scalar results are returned as ``array.array("d")`` and vector results as ``Vector3Array``.
+    @staticmethod
+    def dot(a: _VectorOperand, b: _VectorOperand, out: Buffer | None = None) -> Buffer:
+        """Batched ``Vector3.dot``."""
+        ...
+
+    @staticmethod
+    def cross(a: _VectorOperand, b: _VectorOperand, out: Buffer | None = None) -> Buffer:
+        """Batched ``Vector3.cross``."""
+        ...
+
+    @staticmethod
+    def distance(a: _VectorOperand, b: _VectorOperand, out: Buffer | None = None) -> Buffer:
+        """Batched ``Vector3.distance``."""
+        ...
+
+    @staticmethod
+    def angle(_from: _VectorOperand, _to: _VectorOperand, out: Buffer | None = None) -> Buffer:
+        """Batched ``Vector3.angle``."""
+        ...
+
+    @staticmethod
+    def signed_angle(_from: _VectorOperand, _to: _VectorOperand, axis: _VectorOperand, out: Buffer | None = None) -> Buffer:
+        """Batched ``Vector3.signed_angle``."""
+        ...
+
+    @staticmethod
+    def lerp(a: _VectorOperand, b: _VectorOperand, t: _DoubleOperand, out: Buffer | None = None) -> Buffer:
+        """Batched ``Vector3.lerp``. ``t`` can be a single value or one value per vector."""
+        ...
+
+    @staticmethod
+    def lerp_unclamped(a: _VectorOperand, b: _VectorOperand, t: _DoubleOperand, out: Buffer | None = None) -> Buffer:
+        """Batched ``Vector3.lerp_unclamped``. ``t`` can be a single value or one value per vector."""
+        ...
+
+    @staticmethod
+    def move_towards(current: _VectorOperand, target: _VectorOperand, max_distance_delta: _DoubleOperand, out: Buffer | None = None) -> Buffer:
+        """Batched ``Vector3.move_towards``. ``max_distance_delta`` can be a single value or one value per vector."""
+        ...
+
+    @staticmethod
+    def reflect(vector: _VectorOperand, normal: _VectorOperand, out: Buffer | None = None) -> Buffer:
+        """Batched ``Vector3.reflect``."""
+        ...
@@ -0,0 +1,645 @@
+#cython: language_level=3
+
+cimport cython
+from cpython.buffer cimport PyBUF_FORMAT, PyBUF_ND, PyBUF_STRIDES, PyObject_CheckBuffer
+from cpython.mem cimport PyMem_Calloc, PyMem_Free
+from libc.math cimport fabs, acos
+from libc.string cimport memcpy
+
+from ._batch cimport DoubleOperand, double_operand, broadcast_length, resolve_length, check_length, check_triples, new_double_array, numpy_array
+from .functions cimport pyfloordiv, pymod
+from .vector3 cimport Vector3, new_vector3, magnitude3
+
+ctypedef enum _BinaryOp:
+    _OP_ADD
+    _OP_SUB
+    _OP_MUL
+    _OP_TRUEDIV
+    _OP_FLOORDIV
+    _OP_MOD
+
+cdef struct _VectorOperand:
+    const double* data
+    Py_ssize_t length # -1 when a single vector is broadcast
+    Py_ssize_t step # 0 when a single vector is broadcast
+    double scalar[3]
+
+cdef double _rad2deg = 180.0 / 3.14159265358979323846
+
+#region Construction
+cdef inline void _set_length(Vector3Array arr, Py_ssize_t length) noexcept:
+    arr._length = length
+    arr._shape[0] = length
+    arr._shape[1] = 3
+    arr._strides[0] = 3 * sizeof(double)
+    arr._strides[1] = sizeof(double)
+
+cdef Vector3Array _new_array(Py_ssize_t length):
+    # Zero-initialized. Always allocates at least one triple so that _data is never NULL.
+    if length < 0:
+        raise ValueError("Length must be non-negative.")
+
+    cdef Vector3Array arr = Vector3Array.__new__(Vector3Array)
+    arr._data = <double*>PyMem_Calloc(3 * (length if length > 0 else 1), sizeof(double))
+    if arr._data == NULL:
+        raise MemoryError()
+    _set_length(arr, length)
+    return arr
+
+cdef Vector3Array _new_view(double* data, Py_ssize_t length, object base):
+    cdef Vector3Array arr = Vector3Array.__new__(Vector3Array)
+    arr._data = data
+    arr._base = base
+    _set_length(arr, length)
+    return arr
+
+cdef Py_ssize_t _wrap_index(Py_ssize_t i, Py_ssize_t length) except -1:
+    if i < 0:
+        i += length
+    if i < 0 or i >= length:
+        raise IndexError("Vector3Array index out of range")
+    return i
+#endregion
+
+#region Kernels
+# out may alias a or b. A step of 0 broadcasts a single triple over the whole array.
+@cython.cdivision(True)
+cdef void _binary_kernel(_BinaryOp op, double* out, Py_ssize_t length, const double* a, Py_ssize_t a_step, const double* b, Py_ssize_t b_step) noexcept nogil:
+    cdef Py_ssize_t i, j
+    if op == _OP_ADD:
+        for i in range(length):
+            for j in range(3):
+                out[3 * i + j] = a[i * a_step + j] + b[i * b_step + j]
+    elif op == _OP_SUB:
+        for i in range(length):
+            for j in range(3):
+                out[3 * i + j] = a[i * a_step + j] - b[i * b_step + j]
+    elif op == _OP_MUL:
+        for i in range(length):
+            for j in range(3):
+                out[3 * i + j] = a[i * a_step + j] * b[i * b_step + j]
+    elif op == _OP_TRUEDIV:
+        for i in range(length):
+            for j in range(3):
+                out[3 * i + j] = a[i * a_step + j] / b[i * b_step + j]
+    elif op == _OP_FLOORDIV:
+        for i in range(length):
+            for j in range(3):
+                out[3 * i + j] = pyfloordiv(a[i * a_step + j], b[i * b_step + j])
+    elif op == _OP_MOD:
+        for i in range(length):
+            for j in range(3):
+                out[3 * i + j] = pymod(a[i * a_step + j], b[i * b_step + j])
+
+@cython.cdivision(True)
+cdef void _normalize_kernel(double* out, const double* a, Py_ssize_t length) noexcept nogil:
+    cdef Py_ssize_t i
+    cdef double magnitude
+    for i in range(length):
+        magnitude = magnitude3(a[3 * i], a[3 * i + 1], a[3 * i + 2])
+        if magnitude == 0.0:
+            out[3 * i] = 0.0
+            out[3 * i + 1] = 0.0
+            out[3 * i + 2] = 0.0
+        else:
+            out[3 * i] = a[3 * i] / magnitude
+            out[3 * i + 1] = a[3 * i + 1] / magnitude
+            out[3 * i + 2] = a[3 * i + 2] / magnitude
+
+cdef int _operand(object other, Py_ssize_t length, bint allow_scalar, double* storage, const double** data, Py_ssize_t* step) except -1:
+    # Returns 0 if the operation isn't implemented for the type of other.
+    cdef Vector3Array arr
+    cdef Vector3 vec
+    if isinstance(other, Vector3Array):
+        arr = <Vector3Array>other
+        if arr._length != length:
+            raise ValueError(f"Operands could not be broadcast together with lengths {length} and {arr._length}.")
+        data[0] = arr._data
+        step[0] = 3
+    elif isinstance(other, Vector3):
+        vec = <Vector3>other
+        storage[0] = vec.x
+        storage[1] = vec.y
+        storage[2] = vec.z
+        data[0] = storage
+        step[0] = 0
+    elif allow_scalar and isinstance(other, (float, int)):
+        storage[0] = storage[1] = storage[2] = other
+        data[0] = storage
+        step[0] = 0
+    else:
+        return 0
+    return 1
+
+cdef object _vector_operand(object obj, _VectorOperand* op):
+    # Accepts a Vector3, any (n, 3) contiguous buffer of doubles or an iterable of vectors.
+    # Returns the object that owns op.data. It must be kept alive while op is in use.
+    cdef Vector3 vec
+    cdef const double[:, ::1] view
+    if isinstance(obj, Vector3):
+        vec = <Vector3>obj
+        op.scalar[0] = vec.x
+        op.scalar[1] = vec.y
+        op.scalar[2] = vec.z
+        op.data = op.scalar
+        op.length = -1
+        op.step = 0
+        return None
+
+    if not PyObject_CheckBuffer(obj):
+        obj = Vector3Array(obj)
+
+    view = obj
+    check_triples(view.shape[1])
+    op.length = view.shape[0]
+    op.step = 3
+    op.data = &view[0, 0] if op.length > 0 else op.scalar
+    return view
+
+cdef double[:, ::1] _vector_output(object out, Py_ssize_t length):
+    cdef double[:, ::1] view = out
+    if view.shape[1] != 3:
+        raise ValueError(f"Expected an output buffer of shape (n, 3), got (n, {view.shape[1]}).")
+    check_length(length, view.shape[0])
+    return view
+
+@cython.cdivision(True)
+cdef inline double _angle(const double* a, const double* b) noexcept nogil:
+    cdef double denom = magnitude3(a[0], a[1], a[2]) * magnitude3(b[0], b[1], b[2]) # Multiply magnitudes
+    if denom == 0.0:
+        return 0.0
+
+    cdef double cos_val = ((a[0] * b[0]) + (a[1] * b[1]) + (a[2] * b[2])) / denom
+    if cos_val < -1.0: # Clamp to range [-1, 1]
+        cos_val = -1.0
+    elif cos_val > 1.0:
+        cos_val = 1.0
+
+    return acos(cos_val) * _rad2deg
+
+cdef object _binary(Vector3Array self, object other, _BinaryOp op, bint allow_scalar, bint reflected, bint inplace):
+    cdef double storage[3]
+    cdef const double* other_data
+    cdef Py_ssize_t other_step
+    if not _operand(other, self._length, allow_scalar, storage, &other_data, &other_step):
+        return NotImplemented
+
+    cdef Vector3Array out = self if inplace else _new_array(self._length)
+    with nogil:
+        if reflected:
+            _binary_kernel(op, out._data, self._length, other_data, other_step, self._data, 3)
+        else:
+            _binary_kernel(op, out._data, self._length, self._data, 3, other_data, other_step)
+    return out
+#endregion
+
+cdef class Vector3Array:
+    def __init__(self, vectors = ()):
+        # Vector3Array(vectors)
+        cdef list items = list(vectors)
+        cdef Py_ssize_t length = len(items)
+
+        if self._data != NULL: # Slices and exported buffers point into _data, it can't be replaced
+            raise RuntimeError("Vector3Array is already initialized.")
+        self._data = <double*>PyMem_Calloc(3 * (length if length > 0 else 1), sizeof(double))
+        if self._data == NULL:
+            raise MemoryError()
+        _set_length(self, length)
+
+        cdef Py_ssize_t i
+        cdef Vector3 vec
+        for i in range(length):
+            item = items[i]
+            if isinstance(item, Vector3):
+                vec = <Vector3>item
+                self._data[3 * i] = vec.x
+                self._data[3 * i + 1] = vec.y
+                self._data[3 * i + 2] = vec.z
+            else:
+                self._data[3 * i], self._data[3 * i + 1], self._data[3 * i + 2] = item
+
+    def __dealloc__(self):
+        if self._base is None:
+            PyMem_Free(self._data)
+
+    @staticmethod
+    def zeros(Py_ssize_t length):
+        return _new_array(length)
+
+    @staticmethod
+    def from_buffer(const double[:, ::1] buffer):
+        check_triples(buffer.shape[1])
+        cdef Vector3Array out = _new_array(buffer.shape[0])
+        if out._length > 0:
+            memcpy(out._data, &buffer[0, 0], out._length * 3 * sizeof(double))
+        return out
+
+    def __getbuffer__(self, Py_buffer* buffer, int flags):
+        buffer.buf = <void*>self._data
+        buffer.obj = self
+        buffer.len = self._length * 3 * sizeof(double)
+        buffer.readonly = 0
+        buffer.itemsize = sizeof(double)
+        buffer.format = NULL
+        if (flags & PyBUF_FORMAT) == PyBUF_FORMAT:
+            buffer.format = "d"
+        buffer.ndim = 2
+        buffer.shape = NULL
+        if (flags & PyBUF_ND) == PyBUF_ND:
+            buffer.shape = self._shape
+        buffer.strides = NULL
+        if (flags & PyBUF_STRIDES) == PyBUF_STRIDES:
+            buffer.strides = self._strides
+        buffer.suboffsets = NULL
+        buffer.internal = NULL
+
+    def __releasebuffer__(self, Py_buffer* buffer):
+        pass
+
+    def __array__(self, dtype = None, copy = None):
+        return numpy_array(self, dtype, copy)
+
+    def __len__(self):
+        # len(self)
+        return self._length
+
+    def __getitem__(self, index):
+        # self[index]
+        cdef Py_ssize_t start, stop, step
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._length)
+            if step != 1:
+                raise ValueError("Vector3Array slices must be contiguous.")
+            if stop < start:
+                stop = start
+            return _new_view(self._data + 3 * start, stop - start, self) # Slices share memory with self
+
+        cdef Py_ssize_t i = _wrap_index(index, self._length)
+        return new_vector3(self._data[3 * i], self._data[3 * i + 1], self._data[3 * i + 2])
+
+    def __setitem__(self, index, value):
+        # self[index] = value
+        cdef Py_ssize_t i = _wrap_index(index, self._length)
+        cdef Vector3 vec
+        if isinstance(value, Vector3):
+            vec = <Vector3>value
+            self._data[3 * i] = vec.x
+            self._data[3 * i + 1] = vec.y
+            self._data[3 * i + 2] = vec.z
+        else:
+            self._data[3 * i], self._data[3 * i + 1], self._data[3 * i + 2] = value
+
+    def __iter__(self):
+        # iter(self)
+        cdef Py_ssize_t i
+        for i in range(self._length):
+            yield new_vector3(self._data[3 * i], self._data[3 * i + 1], self._data[3 * i + 2])
+
+    def __repr__(self):
+        # repr(self)
+        return f"Vector3Array([{', '.join([repr(v) for v in self])}])"
+
+    def __eq__(self, other):
+        # self == other
+        if not isinstance(other, Vector3Array):
+            return NotImplemented
+
+        cdef Vector3Array arr = <Vector3Array>other
+        if arr._length != self._length:
+            return False
+
+        cdef Py_ssize_t i
+        for i in range(3 * self._length):
+            if self._data[i] != arr._data[i]:
+                return False
+        return True
+
+    # NOTE: Object is mutable, do not implement __hash__
+
+    #region Arithmetic
+    def __add__(self, other):
+        return _binary(self, other, _OP_ADD, False, False, False)
+
+    def __radd__(self, other):
+        return _binary(self, other, _OP_ADD, False, True, False)
+
+    def __iadd__(self, other):
+        return _binary(self, other, _OP_ADD, False, False, True)
+
+    def __sub__(self, other):
+        return _binary(self, other, _OP_SUB, False, False, False)
+
+    def __rsub__(self, other):
+        return _binary(self, other, _OP_SUB, False, True, False)
+
+    def __isub__(self, other):
+        return _binary(self, other, _OP_SUB, False, False, True)
+
+    def __mul__(self, other):
+        return _binary(self, other, _OP_MUL, True, False, False)
+
+    def __rmul__(self, other):
+        return _binary(self, other, _OP_MUL, True, True, False)
+
+    def __imul__(self, other):
+        return _binary(self, other, _OP_MUL, True, False, True)
+
+    def __truediv__(self, other):
+        return _binary(self, other, _OP_TRUEDIV, True, False, False)
+
+    def __rtruediv__(self, other):
+        return _binary(self, other, _OP_TRUEDIV, True, True, False)
+
+    def __itruediv__(self, other):
+        return _binary(self, other, _OP_TRUEDIV, True, False, True)
+
+    def __floordiv__(self, other):
+        return _binary(self, other, _OP_FLOORDIV, True, False, False)
+
+    def __rfloordiv__(self, other):
+        return _binary(self, other, _OP_FLOORDIV, True, True, False)
+
+    def __ifloordiv__(self, other):
+        return _binary(self, other, _OP_FLOORDIV, True, False, True)
+
+    def __mod__(self, other):
+        return _binary(self, other, _OP_MOD, True, False, False)
+
+    def __rmod__(self, other):
+        return _binary(self, other, _OP_MOD, True, True, False)
+
+    def __imod__(self, other):
+        return _binary(self, other, _OP_MOD, True, False, True)
+
+    def __neg__(self):
+        # -self
+        cdef Vector3Array out = _new_array(self._length)
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(3 * self._length):
+                out._data[i] = -self._data[i]
+        return out
+
+    def __abs__(self):
+        # abs(self)
+        cdef Vector3Array out = _new_array(self._length)
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(3 * self._length):
+                out._data[i] = fabs(self._data[i])
+        return out
+    #endregion
+
+    @property
+    def normalized(self):
+        cdef Vector3Array out = _new_array(self._length)
+        with nogil:
+            _normalize_kernel(out._data, self._data, self._length)
+        return out
+
+    def normalize(self):
+        with nogil:
+            _normalize_kernel(self._data, self._data, self._length)
+
+    def copy(self):
+        cdef Vector3Array out = _new_array(self._length)
+        memcpy(out._data, self._data, self._length * 3 * sizeof(double))
+        return out
+
+    def to_list(self):
+        cdef Py_ssize_t i
+        return [new_vector3(self._data[3 * i], self._data[3 * i + 1], self._data[3 * i + 2]) for i in range(self._length)]
+
+    #region Batched math
+    # The batched variants of the Vector3 static methods. Each vector argument can be a Vector3Array, an (n, 3) buffer of doubles or a single Vector3 that is broadcast.
+    # Results are written into out, which is allocated if not given.
+    @staticmethod
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def dot(a, b, out = None):
+        cdef _VectorOperand va, vb
+        keep_a = _vector_operand(a, &va)
+        keep_b = _vector_operand(b, &vb)
+        cdef Py_ssize_t n = resolve_length(broadcast_length(va.length, vb.length))
+        if out is None:
+            out = new_double_array(n)
+        cdef double[::1] out_view = out
+        check_length(n, out_view.shape[0])
+
+        cdef Py_ssize_t i
+        cdef const double* pa
+        cdef const double* pb
+        with nogil:
+            for i in range(n):
+                pa = va.data + i * va.step
+                pb = vb.data + i * vb.step
+                out_view[i] = (pa[0] * pb[0]) + (pa[1] * pb[1]) + (pa[2] * pb[2])
+        return out
+
+    @staticmethod
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def cross(a, b, out = None):
+        cdef _VectorOperand va, vb
+        keep_a = _vector_operand(a, &va)
+        keep_b = _vector_operand(b, &vb)
+        cdef Py_ssize_t n = resolve_length(broadcast_length(va.length, vb.length))
+        if out is None:
+            out = _new_array(n)
+        cdef double[:, ::1] out_view = _vector_output(out, n)
+
+        cdef Py_ssize_t i
+        cdef const double* pa
+        cdef const double* pb
+        cdef double x, y, z
+        with nogil:
+            for i in range(n):
+                pa = va.data + i * va.step
+                pb = vb.data + i * vb.step
+                x = (pa[1] * pb[2]) - (pa[2] * pb[1]) # Stored in case out aliases a or b
+                y = (pa[2] * pb[0]) - (pa[0] * pb[2])
+                z = (pa[0] * pb[1]) - (pa[1] * pb[0])
+                out_view[i, 0] = x
+                out_view[i, 1] = y
+                out_view[i, 2] = z
+        return out
+
+    @staticmethod
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def distance(a, b, out = None):
+        cdef _VectorOperand va, vb
+        keep_a = _vector_operand(a, &va)
+        keep_b = _vector_operand(b, &vb)
+        cdef Py_ssize_t n = resolve_length(broadcast_length(va.length, vb.length))
+        if out is None:
+            out = new_double_array(n)
+        cdef double[::1] out_view = out
+        check_length(n, out_view.shape[0])
+
+        cdef Py_ssize_t i
+        cdef const double* pa
+        cdef const double* pb
+        with nogil:
+            for i in range(n):
+                pa = va.data + i * va.step
+                pb = vb.data + i * vb.step
+                out_view[i] = magnitude3(pa[0] - pb[0], pa[1] - pb[1], pa[2] - pb[2])
+        return out
+
+    @staticmethod
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def angle(_from, _to, out = None):
+        cdef _VectorOperand va, vb
+        keep_a = _vector_operand(_from, &va)
+        keep_b = _vector_operand(_to, &vb)
+        cdef Py_ssize_t n = resolve_length(broadcast_length(va.length, vb.length))
+        if out is None:
+            out = new_double_array(n)
+        cdef double[::1] out_view = out
+        check_length(n, out_view.shape[0])
+
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(n):
+                out_view[i] = _angle(va.data + i * va.step, vb.data + i * vb.step)
+        return out
+
+    @staticmethod
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def signed_angle(_from, _to, axis, out = None):
+        cdef _VectorOperand va, vb, vx
+        keep_a = _vector_operand(_from, &va)
+        keep_b = _vector_operand(_to, &vb)
+        keep_x = _vector_operand(axis, &vx)
+        cdef Py_ssize_t n = resolve_length(broadcast_length(broadcast_length(va.length, vb.length), vx.length))
+        if out is None:
+            out = new_double_array(n)
+        cdef double[::1] out_view = out
+        check_length(n, out_view.shape[0])
+
+        cdef Py_ssize_t i
+        cdef const double* pa
+        cdef const double* pb
+        cdef const double* px
+        cdef double unsigned_angle, sign
+        with nogil:
+            for i in range(n):
+                pa = va.data + i * va.step
+                pb = vb.data + i * vb.step
+                px = vx.data + i * vx.step
+                unsigned_angle = _angle(pa, pb)
+                sign = (px[0] * ((pa[1] * pb[2]) - (pa[2] * pb[1]))) + (px[1] * ((pa[2] * pb[0]) - (pa[0] * pb[2]))) + (px[2] * ((pa[0] * pb[1]) - (pa[1] * pb[0])))
+                out_view[i] = -unsigned_angle if sign < 0.0 else unsigned_angle
+        return out
+
+    @staticmethod
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def lerp(a, b, t, out = None):
+        cdef _VectorOperand va, vb
+        cdef DoubleOperand vt
+        keep_a = _vector_operand(a, &va)
+        keep_b = _vector_operand(b, &vb)
+        keep_t = double_operand(t, &vt)
+        cdef Py_ssize_t n = resolve_length(broadcast_length(broadcast_length(va.length, vb.length), vt.length))
+        if out is None:
+            out = _new_array(n)
+        cdef double[:, ::1] out_view = _vector_output(out, n)
+
+        cdef Py_ssize_t i, j
+        cdef double ti
+        with nogil:
+            for i in range(n):
+                ti = vt.data[i * vt.step]
+                if ti < 0.0: # clamp01 substitute
+                    ti = 0.0
+                elif ti > 1.0:
+                    ti = 1.0
+                for j in range(3):
+                    out_view[i, j] = va.data[i * va.step + j] + ((vb.data[i * vb.step + j] - va.data[i * va.step + j]) * ti)
+        return out
+
+    @staticmethod
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def lerp_unclamped(a, b, t, out = None):
+        cdef _VectorOperand va, vb
+        cdef DoubleOperand vt
+        keep_a = _vector_operand(a, &va)
+        keep_b = _vector_operand(b, &vb)
+        keep_t = double_operand(t, &vt)
+        cdef Py_ssize_t n = resolve_length(broadcast_length(broadcast_length(va.length, vb.length), vt.length))
+        if out is None:
+            out = _new_array(n)
+        cdef double[:, ::1] out_view = _vector_output(out, n)
+
+        cdef Py_ssize_t i, j
+        cdef double ti
+        with nogil:
+            for i in range(n):
+                ti = vt.data[i * vt.step]
+                for j in range(3):
+                    out_view[i, j] = va.data[i * va.step + j] + ((vb.data[i * vb.step + j] - va.data[i * va.step + j]) * ti)
+        return out
+
+    @staticmethod
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    @cython.cdivision(True)
+    def move_towards(current, target, max_distance_delta, out = None):
+        cdef _VectorOperand vc, vt
+        cdef DoubleOperand vd
+        keep_c = _vector_operand(current, &vc)
+        keep_t = _vector_operand(target, &vt)
+        keep_d = double_operand(max_distance_delta, &vd)
+        cdef Py_ssize_t n = resolve_length(broadcast_length(broadcast_length(vc.length, vt.length), vd.length))
+        if out is None:
+            out = _new_array(n)
+        cdef double[:, ::1] out_view = _vector_output(out, n)
+
+        cdef Py_ssize_t i, j
+        cdef double to_vector[3]
+        cdef double dist, max_delta
+        with nogil:
+            for i in range(n):
+                for j in range(3):
+                    to_vector[j] = vt.data[i * vt.step + j] - vc.data[i * vc.step + j]
+                dist = magnitude3(to_vector[0], to_vector[1], to_vector[2])
+                max_delta = vd.data[i * vd.step]
+
+                if dist == 0 or (max_delta >= 0 and dist <= max_delta):
+                    for j in range(3):
+                        out_view[i, j] = vt.data[i * vt.step + j]
+                else:
+                    for j in range(3):
+                        out_view[i, j] = vc.data[i * vc.step + j] + to_vector[j] / dist * max_delta
+        return out
+
+    @staticmethod
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def reflect(vector, normal, out = None):
+        cdef _VectorOperand vv, vn
+        keep_v = _vector_operand(vector, &vv)
+        keep_n = _vector_operand(normal, &vn)
+        cdef Py_ssize_t n = resolve_length(broadcast_length(vv.length, vn.length))
+        if out is None:
+            out = _new_array(n)
+        cdef double[:, ::1] out_view = _vector_output(out, n)
+
+        cdef Py_ssize_t i, j
+        cdef const double* pv
+        cdef const double* pn
+        cdef double factor
+        with nogil:
+            for i in range(n):
+                pv = vv.data + i * vv.step
+                pn = vn.data + i * vn.step
+                factor = -2.0 * ((pn[0] * pv[0]) + (pn[1] * pv[1]) + (pn[2] * pv[2]))
+                for j in range(3):
+                    out_view[i, j] = factor * pn[j] + pv[j]
+        return out
+    #endregion
@@ -0,0 +1,16 @@
+#cython: language_level=3
+
+ctypedef long long int _V3I_int_t
+
+cdef class Vector3Int:
+    cdef readonly _V3I_int_t x
+    cdef readonly _V3I_int_t y
+    cdef readonly _V3I_int_t z
+
+cdef inline Vector3Int new_vector3_int(_V3I_int_t x, _V3I_int_t y, _V3I_int_t z):
+    # Vector3Int(x, y, z) without the overhead of calling __init__ through Python
+    cdef Vector3Int v = Vector3Int.__new__(Vector3Int)
+    v.x = x
+    v.y = y
+    v.z = z
+    return v
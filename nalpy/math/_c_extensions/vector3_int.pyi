@@ -0,0 +1,131 @@
+from typing import ClassVar, Iterable, Iterator, SupportsIndex, TypeVar, overload
+from typing_extensions import Buffer
+from .vector3 import Vector3
+from .vector3_int_buffer import Vector3IntBuffer
+
+_OutT = TypeVar("_OutT", bound=Buffer)
+
+class Vector3Int:
+    """An immutable three-dimensional vector with integer precision."""
+    zero: ClassVar[Vector3Int]
+    """Shorthand for ``Vector3Int(0, 0, 0)``"""
+    one: ClassVar[Vector3Int]
+    """Shorthand for ``Vector3Int(1, 1, 1)``"""
+    up: ClassVar[Vector3Int]
+    """A unit vector pointing up (vector j). Shorthand for ``Vector3Int(0, 1, 0)``"""
+    down: ClassVar[Vector3Int]
+    """A unit vector pointing down. Shorthand for ``Vector3Int(0, -1, 0)``"""
+    left: ClassVar[Vector3Int]
+    """A unit vector pointing left. Shorthand for ``Vector3Int(-1, 0, 0)``"""
+    right: ClassVar[Vector3Int]
+    """A unit vector pointing right (vector i). Shorthand for ``Vector3Int(1, 0, 0)``"""
+    forward: ClassVar[Vector3Int]
+    """A unit vector pointing forward (vector k). Shorthand for ``Vector3Int(0, 0, 1)``"""
+    back: ClassVar[Vector3Int]
+    """A unit vector pointing back. Shorthand for ``Vector3Int(0, 0, -1)``"""
+
+    def __init__(self, x: int, y: int, z: int) -> None: ...
+
+    def __getitem__(self, i: SupportsIndex) -> int: ...
+
+    @property
+    def x(self) -> int: ...
+
+    @property
+    def y(self) -> int: ...
+
+    @property
+    def z(self) -> int: ...
+
+    def __repr__(self) -> str: ...
+
+    def __len__(self) -> int: ...
+
+    def __add__(self, other: Vector3Int) -> Vector3Int: ...
+
+    def __sub__(self, other: Vector3Int) -> Vector3Int: ...
+
+    def __mul__(self, other: Vector3Int | int) -> Vector3Int: ...
+
+    def __rmul__(self, other: Vector3Int | int) -> Vector3Int: ...
+
+    def __truediv__(self, other: Vector3Int | int | float) -> Vector3: ...
+
+    def __floordiv__(self, other: Vector3Int | int) -> Vector3Int: ...
+
+    def __mod__(self, other: Vector3Int | int) -> Vector3Int: ...
+
+    def __divmod__(self, other: Vector3Int | int) -> tuple[Vector3Int, Vector3Int]: ...
+
+    def __neg__(self) -> Vector3Int: ...
+
+    def __abs__(self) -> Vector3Int: ...
+
+    def __eq__(self, other: Vector3Int) -> bool: ...
+
+    def __iter__(self) -> Iterator[int]: ...
+
+    def __hash__(self) -> int: ...
+
+    @property
+    def magnitude(self) -> float:
+        """The length of this vector."""
+        ...
+
+    @staticmethod
+    def distance(a: Vector3Int, b: Vector3Int) -> float:
+        """Returns the distance between a and b."""
+        ...
+
+    @staticmethod
+    def ceil(v: Vector3) -> Vector3Int:
+        """Create a new `Vector3Int` by ceiling the components of the given `Vector3`."""
+        ...
+
+    @staticmethod
+    def floor(v: Vector3) -> Vector3Int:
+        """Create a new `Vector3Int` by flooring the components of the given `Vector3`."""
+        ...
+
+    @staticmethod
+    def round(v: Vector3) -> Vector3Int:
+        """Create a new `Vector3Int` by rounding the components of the given `Vector3`."""
+        ...
+
+    @staticmethod
+    def trunc(v: Vector3) -> Vector3Int:
+        """Create a new `Vector3Int` by truncating the components of the given `Vector3`. Truncating is equivalent to `int(float_value)`."""
+        ...
+
+    @staticmethod
+    def min(a: Vector3Int, b: Vector3Int) -> Vector3Int:
+        """Create a new `Vector3Int` by selecting the smallest components of the two given `Vector3Int` instances."""
+        ...
+
+    @staticmethod
+    def max(a: Vector3Int, b: Vector3Int) -> Vector3Int:
+        """Create a new `Vector3Int` by selecting the largest components of the two given `Vector3Int` instances."""
+        ...
+
+    @staticmethod
+    def from_buffer(buffer: Buffer) -> list[Vector3Int]:
+        """Unpack a contiguous ``(n, 3)`` buffer of 64-bit integers into a list of `Vector3Int` instances."""
+        ...
+
+    @overload
+    @staticmethod
+    def to_buffer(vectors: Iterable[Vector3Int]) -> Vector3IntBuffer:
+        """Pack `Vector3Int` instances into a new `Vector3IntBuffer`."""
+        ...
+    @overload
+    @staticmethod
+    def to_buffer(vectors: Iterable[Vector3Int], out: _OutT) -> _OutT:
+        """Pack `Vector3Int` instances into ``out``, which must be a writable contiguous ``(n, 3)`` buffer of 64-bit integers."""
+        ...
+
+    def to_vector3(self) -> Vector3:
+        """`Vector3Int` to `Vector3` conversion."""
+        ...
+
+    def to_tuple(self) -> tuple[int, int, int]: ...
+    def to_dict(self) -> dict[str, int]: ...
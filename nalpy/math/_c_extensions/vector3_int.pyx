@@ -0,0 +1,246 @@
+#cython: language_level=3
+
+cimport cython
+from libc.math cimport ceil, floor, llround
+from libc.stdlib cimport llabs
+
+from ._batch cimport check_length, check_triples
+from ._hash cimport hash3
+from .vector3 cimport Vector3, new_vector3, magnitude3
+
+@cython.freelist(256)
+cdef class Vector3Int:
+    zero = new_vector3_int(0, 0, 0)
+    one = new_vector3_int(1, 1, 1)
+
+    up = new_vector3_int(0, 1, 0)
+    down = new_vector3_int(0, -1, 0)
+    left = new_vector3_int(-1, 0, 0)
+    right = new_vector3_int(1, 0, 0)
+    forward = new_vector3_int(0, 0, 1)
+    back = new_vector3_int(0, 0, -1)
+
+
+    def __init__(self, _V3I_int_t x, _V3I_int_t y, _V3I_int_t z):
+        # Vector3Int(x, y, z)
+        self.x = x
+        self.y = y
+        self.z = z
+
+    def __getitem__(self, Py_ssize_t i):
+        # self[i]
+        if i == 0:
+            return self.x
+        if i == 1:
+            return self.y
+        if i == 2:
+            return self.z
+
+        raise IndexError(i)
+
+    def __repr__(self):
+        # repr(self)
+        return f"Vector3Int({self.x}, {self.y}, {self.z})"
+
+    def __len__(self):
+        # len(self)
+        return 3
+
+    def __add__(self, Vector3Int other):
+        # self + other
+        return new_vector3_int(self.x + other.x, self.y + other.y, self.z + other.z)
+
+    def __sub__(self, Vector3Int other):
+        # self - other
+        return new_vector3_int(self.x - other.x, self.y - other.y, self.z - other.z)
+
+    def __mul__(self, other):
+        # self * other
+        cdef _V3I_int_t x # Extracted into cdef so that Cython uses C math instead of Python math
+        cdef _V3I_int_t y
+        cdef _V3I_int_t z
+        if isinstance(other, Vector3Int):
+            x = other.x
+            y = other.y
+            z = other.z
+        elif isinstance(other, int):
+            x = y = z = other
+        else:
+            return NotImplemented
+
+        return new_vector3_int(self.x * x, self.y * y, self.z * z)
+
+    def __rmul__(self, other):
+        # other * self
+        cdef _V3I_int_t x # Extracted into cdef so that Cython uses C math instead of Python math
+        cdef _V3I_int_t y
+        cdef _V3I_int_t z
+        if isinstance(other, Vector3Int):
+            x = other.x
+            y = other.y
+            z = other.z
+        elif isinstance(other, int):
+            x = y = z = other
+        else:
+            return NotImplemented
+
+        return new_vector3_int(self.x * x, self.y * y, self.z * z)
+
+    def __truediv__(self, other):
+        # self / other, NOTE: Returns Vector3
+        cdef double x
+        cdef double y
+        cdef double z
+        if isinstance(other, Vector3Int):
+            x = other.x
+            y = other.y
+            z = other.z
+        elif isinstance(other, (float, int)):
+            x = y = z = other
+        else:
+            return NotImplemented
+
+        return new_vector3(self.x / x, self.y / y, self.z / z)
+
+    def __floordiv__(self, other):
+        # self // other
+        cdef _V3I_int_t x
+        cdef _V3I_int_t y
+        cdef _V3I_int_t z
+        if isinstance(other, Vector3Int):
+            x = other.x
+            y = other.y
+            z = other.z
+        elif isinstance(other, int):
+            x = y = z = other
+        else:
+            return NotImplemented
+
+        return new_vector3_int(self.x // x, self.y // y, self.z // z)
+
+    def __mod__(self, other):
+        # self % other
+        cdef _V3I_int_t x
+        cdef _V3I_int_t y
+        cdef _V3I_int_t z
+        if isinstance(other, Vector3Int):
+            x = other.x
+            y = other.y
+            z = other.z
+        elif isinstance(other, int):
+            x = y = z = other
+        else:
+            return NotImplemented
+
+        return new_vector3_int(self.x % x, self.y % y, self.z % z)
+
+    def __divmod__(self, other):
+        # divmod(self, other)
+        cdef _V3I_int_t x
+        cdef _V3I_int_t y
+        cdef _V3I_int_t z
+        if isinstance(other, Vector3Int):
+            x = other.x
+            y = other.y
+            z = other.z
+        elif isinstance(other, int):
+            x = y = z = other
+        else:
+            return NotImplemented
+
+        cdef _V3I_int_t x_fdiv = self.x // x # Cython doesn't have a divmod variant for C
+        cdef _V3I_int_t x_mod = self.x % x   # We calculate these separately to avoid using Python's divmod
+        cdef _V3I_int_t y_fdiv = self.y // y
+        cdef _V3I_int_t y_mod = self.y % y
+        cdef _V3I_int_t z_fdiv = self.z // z
+        cdef _V3I_int_t z_mod = self.z % z
+        return (new_vector3_int(x_fdiv, y_fdiv, z_fdiv), new_vector3_int(x_mod, y_mod, z_mod))
+
+    def __neg__(self):
+        # -self
+        return new_vector3_int(-self.x, -self.y, -self.z)
+
+    def __abs__(self):
+        # abs(self)
+        return new_vector3_int(llabs(self.x), llabs(self.y), llabs(self.z))
+
+    def __eq__(self, Vector3Int other):
+        # self == other
+        return self.x == other.x and self.y == other.y and self.z == other.z
+
+    def __iter__(self):
+        # iter(self)
+        return iter((self.x, self.y, self.z))
+
+    def __hash__(self):
+        # Same as hash((self.x, self.y, self.z))
+        return hash3(self.x, self.y, self.z)
+
+    @property
+    def magnitude(self):
+        return magnitude3(<double>self.x, <double>self.y, <double>self.z)
+
+    @staticmethod
+    def distance(Vector3Int a, Vector3Int b):
+        return magnitude3(<double>(a.x - b.x), <double>(a.y - b.y), <double>(a.z - b.z))
+
+    @staticmethod
+    def ceil(Vector3 v):
+        return new_vector3_int(<_V3I_int_t>ceil(v.x), <_V3I_int_t>ceil(v.y), <_V3I_int_t>ceil(v.z))
+
+    @staticmethod
+    def floor(Vector3 v):
+        return new_vector3_int(<_V3I_int_t>floor(v.x), <_V3I_int_t>floor(v.y), <_V3I_int_t>floor(v.z))
+
+    @staticmethod
+    def round(Vector3 v):
+        return new_vector3_int(<_V3I_int_t>llround(v.x), <_V3I_int_t>llround(v.y), <_V3I_int_t>llround(v.z))
+
+    @staticmethod
+    def trunc(Vector3 v):
+        return new_vector3_int(<_V3I_int_t>v.x, <_V3I_int_t>v.y, <_V3I_int_t>v.z) # Casting floating point to integer truncates
+
+    @staticmethod
+    def min(Vector3Int a, Vector3Int b):
+        return new_vector3_int(min(a.x, b.x), min(a.y, b.y), min(a.z, b.z))
+
+    @staticmethod
+    def max(Vector3Int a, Vector3Int b):
+        return new_vector3_int(max(a.x, b.x), max(a.y, b.y), max(a.z, b.z))
+
+    @staticmethod
+    def from_buffer(const long long[:, ::1] buffer):
+        check_triples(buffer.shape[1])
+        cdef Py_ssize_t i
+        return [new_vector3_int(buffer[i, 0], buffer[i, 1], buffer[i, 2]) for i in range(buffer.shape[0])]
+
+    @staticmethod
+    def to_buffer(vectors, out = None):
+        if not isinstance(vectors, (list, tuple)):
+            vectors = list(vectors)
+        cdef Py_ssize_t length = len(vectors)
+
+        if out is None:
+            from .vector3_int_buffer import Vector3IntBuffer # Imported lazily, vector3_int_buffer depends on this module.
+            out = Vector3IntBuffer.zeros(length)
+        cdef long long[:, ::1] view = out
+        check_triples(view.shape[1])
+        check_length(length, view.shape[0])
+
+        cdef Py_ssize_t i
+        cdef Vector3Int vec
+        for i in range(length):
+            vec = <Vector3Int?>vectors[i]
+            view[i, 0] = vec.x
+            view[i, 1] = vec.y
+            view[i, 2] = vec.z
+        return out
+
+    def to_vector3(self):
+        return new_vector3(<double>self.x, <double>self.y, <double>self.z)
+
+    def to_tuple(self):
+        return (self.x, self.y, self.z)
+
+    def to_dict(self):
+        return {"x": self.x, "y": self.y, "z": self.z}
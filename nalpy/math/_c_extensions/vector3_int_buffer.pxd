@@ -0,0 +1,10 @@
+#cython: language_level=3
+
+cdef class Vector3IntBuffer:
+    cdef long long* _data # Interleaved x, y, z triples
+    cdef Py_ssize_t _length
+
+    cdef Py_ssize_t _shape[2]
+    cdef Py_ssize_t _strides[2]
+
+cdef Vector3IntBuffer new_vector3_int_buffer(Py_ssize_t length)
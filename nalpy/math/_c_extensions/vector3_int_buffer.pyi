@@ -0,0 +1,47 @@
+from typing import Any, Iterable, Iterator, SupportsIndex
+from typing_extensions import Buffer
+from .vector3_int import Vector3Int
+
+class Vector3IntBuffer:
+    """
+    A mutable, fixed-length array of `Vector3Int` stored as contiguous ``(x, y, z)`` triples of 64-bit integers.
+
+    Supports the buffer protocol with shape ``(len(self), 3)`` and format ``"q"`` so that for example NumPy can view the data without copying.
+    Unlike ``Vector3Array`` this type doesn't implement arithmetic, it is meant for moving vectors in and out of other libraries.
+    """
+
+    def __init__(self, vectors: Iterable[Vector3Int | tuple[int, int, int]] = ()) -> None: ...
+
+    @staticmethod
+    def zeros(length: int) -> Vector3IntBuffer:
+        """Create a new buffer of ``length`` zero vectors."""
+        ...
+
+    @staticmethod
+    def from_buffer(buffer: Buffer) -> Vector3IntBuffer:
+        """Create a new buffer by copying a contiguous ``(n, 3)`` buffer of 64-bit integers."""
+        ...
+
+    def __len__(self) -> int: ...
+
+    def __getitem__(self, index: SupportsIndex) -> Vector3Int: ...
+
+    def __setitem__(self, index: SupportsIndex, value: Vector3Int | tuple[int, int, int]) -> None: ...
+
+    def __iter__(self) -> Iterator[Vector3Int]: ...
+
+    def __repr__(self) -> str: ...
+
+    def __eq__(self, other: object) -> bool: ...
+
+    def __buffer__(self, flags: int, /) -> memoryview: ...
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> Any:
+        """NumPy array of shape ``(len(self), 3)`` that shares memory with this buffer unless a copy is requested or required by ``dtype``. Raises ``ValueError`` if ``copy`` is ``False`` and ``dtype`` requires a copy."""
+        ...
+
+    def copy(self) -> Vector3IntBuffer:
+        """Make a new buffer that doesn't share memory with this buffer."""
+        ...
+
+    def to_list(self) -> list[Vector3Int]: ...
@@ -0,0 +1,36 @@
+from typing import Iterable, TypeVar, overload
+from typing_extensions import Buffer
+from .mvector2 import MVector2
+from .mvector2_int import MVector2Int
+from .vector2 import Vector2
+from .vector2_array import Vector2Array
+from .vector2_int import Vector2Int
+from .vector2_int_buffer import Vector2IntBuffer
+
+_OutT = TypeVar("_OutT", bound=Buffer)
+_VectorT = TypeVar("_VectorT", bound=Vector2 | Vector2Int | MVector2 | MVector2Int)
+
+@overload
+def pack_vectors(vectors: Iterable[Vector2 | MVector2] | Iterable[Vector2Int | MVector2Int] | Vector2Array | Vector2IntBuffer, out: None = None, float32: bool = False) -> bytes:
+    """
+    Pack vectors into fixed-size binary records that `unpack_vectors` can read back.
+
+    Each record is ``x`` followed by ``y`` in native byte order: two 64-bit floats for `Vector2` and `MVector2`, two 64-bit integers for `Vector2Int` and `MVector2Int`.
+    Both take 16 bytes. If ``float32`` is ``True``, floating point vectors are stored as two 32-bit floats (8 bytes) instead. Integer vectors can't be stored as float32.
+
+    All vectors must be of the same kind as the first one. `Vector2Array` and `Vector2IntBuffer` are copied with a single memcpy.
+    """
+    ...
+@overload
+def pack_vectors(vectors: Iterable[Vector2 | MVector2] | Iterable[Vector2Int | MVector2Int] | Vector2Array | Vector2IntBuffer, out: _OutT, float32: bool = False) -> _OutT:
+    """Pack vectors into ``out``, which must be a writable contiguous byte buffer of exactly the packed size, e.g. a ``bytearray`` or a slice of a ``memoryview``."""
+    ...
+
+def unpack_vectors(data: Buffer, vector_type: type[_VectorT] = Vector2, float32: bool = False) -> list[_VectorT]:
+    """
+    Unpack records written by `pack_vectors` into a list of ``vector_type`` instances.
+    Subclasses of the vector types, such as `CheckedVector2Int`, are constructed by calling ``vector_type(x, y)``.
+
+    ``data`` must be a contiguous byte buffer such as ``bytes``, ``bytearray`` or a ``memoryview`` of bytes, and ``float32`` must match the value used when packing.
+    """
+    ...
@@ -0,0 +1,163 @@
+#cython: language_level=3
+
+cimport cython
+from cpython.bytes cimport PyBytes_FromStringAndSize, PyBytes_AS_STRING
+from libc.string cimport memcpy
+
+from ._batch cimport check_length
+from .mvector2 cimport MVector2, new_mvector2
+from .mvector2_int cimport MVector2Int, new_mvector2_int
+from .vector2 cimport Vector2, new_vector2
+from .vector2_array cimport Vector2Array
+from .vector2_int cimport Vector2Int, new_vector2_int
+from .vector2_int_buffer cimport Vector2IntBuffer
+
+# Records are x followed by y in native byte order: two float64 or two int64 (16 bytes), or two float32 (8 bytes).
+# Everything goes through memcpy because the records of a sliced memoryview aren't necessarily aligned.
+
+cdef inline Py_ssize_t _record_size(bint integer, bint float32) except -1:
+    if float32:
+        if integer:
+            raise ValueError("float32 records are only supported for Vector2 and MVector2.")
+        return 2 * sizeof(float)
+    return 2 * sizeof(double)
+
+cdef inline void _write_doubles(char* record, double x, double y, bint float32) noexcept nogil:
+    cdef double[2] d
+    cdef float[2] f
+    if float32:
+        f[0] = <float>x
+        f[1] = <float>y
+        memcpy(record, f, sizeof(f))
+    else:
+        d[0] = x
+        d[1] = y
+        memcpy(record, d, sizeof(d))
+
+cdef inline void _read_doubles(const char* record, double* x, double* y, bint float32) noexcept nogil:
+    cdef double[2] d
+    cdef float[2] f
+    if float32:
+        memcpy(f, record, sizeof(f))
+        x[0] = f[0]
+        y[0] = f[1]
+    else:
+        memcpy(d, record, sizeof(d))
+        x[0] = d[0]
+        y[0] = d[1]
+
+cdef object _output(object out, Py_ssize_t size, char** data):
+    # Returns the bytes to fill if out is None, otherwise keeps a view of out alive.
+    cdef unsigned char[::1] view
+    if out is None:
+        out = PyBytes_FromStringAndSize(NULL, size)
+        data[0] = PyBytes_AS_STRING(out)
+        return out
+
+    view = out
+    check_length(size, view.shape[0])
+    data[0] = <char*>&view[0] if size > 0 else NULL
+    return view
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef object _pack_buffer(object vectors, object out, bint float32):
+    # Vector2Array and Vector2IntBuffer already store their records contiguously
+    cdef bint integer = isinstance(vectors, Vector2IntBuffer)
+    cdef Py_ssize_t length = (<Vector2IntBuffer>vectors)._length if integer else (<Vector2Array>vectors)._length
+    cdef Py_ssize_t record = _record_size(integer, float32)
+    cdef char* data
+    keep_out = _output(out, length * record, &data)
+
+    cdef const double* source
+    cdef Py_ssize_t i
+    if integer:
+        memcpy(data, (<Vector2IntBuffer>vectors)._data, length * record)
+    elif not float32:
+        memcpy(data, (<Vector2Array>vectors)._data, length * record)
+    else:
+        source = (<Vector2Array>vectors)._data
+        with nogil:
+            for i in range(length):
+                _write_doubles(data + i * record, source[2 * i], source[2 * i + 1], True)
+    return out if out is not None else keep_out
+
+def pack_vectors(vectors, out = None, bint float32 = False):
+    if isinstance(vectors, (Vector2Array, Vector2IntBuffer)):
+        return _pack_buffer(vectors, out, float32)
+
+    if not isinstance(vectors, (list, tuple)):
+        vectors = list(vectors)
+    cdef Py_ssize_t length = len(vectors)
+
+    # The first vector decides the record type, the rest must match it
+    cdef bint integer = length > 0 and isinstance(vectors[0], (Vector2Int, MVector2Int))
+    cdef Py_ssize_t record = _record_size(integer, float32)
+    cdef char* data
+    keep_out = _output(out, length * record, &data)
+
+    cdef Py_ssize_t i
+    cdef long long[2] ints
+    for i in range(length):
+        v = vectors[i]
+        if integer:
+            if isinstance(v, Vector2Int):
+                ints[0] = (<Vector2Int>v).x
+                ints[1] = (<Vector2Int>v).y
+            elif isinstance(v, MVector2Int):
+                ints[0] = (<MVector2Int>v).x
+                ints[1] = (<MVector2Int>v).y
+            else:
+                raise TypeError(f"Expected Vector2Int or MVector2Int, got {type(v).__name__}.")
+            memcpy(data + i * record, ints, sizeof(ints))
+        elif isinstance(v, Vector2):
+            _write_doubles(data + i * record, (<Vector2>v).x, (<Vector2>v).y, float32)
+        elif isinstance(v, MVector2):
+            _write_doubles(data + i * record, (<MVector2>v).x, (<MVector2>v).y, float32)
+        else:
+            raise TypeError(f"Expected Vector2 or MVector2, got {type(v).__name__}.")
+    return out if out is not None else keep_out
+
+def unpack_vectors(data, vector_type = Vector2, bint float32 = False):
+    cdef bint integer
+    if isinstance(vector_type, type) and issubclass(vector_type, (Vector2, MVector2)):
+        integer = False
+    elif isinstance(vector_type, type) and issubclass(vector_type, (Vector2Int, MVector2Int)):
+        integer = True
+    else:
+        raise TypeError(f"Expected Vector2, Vector2Int, MVector2 or MVector2Int, got {vector_type!r}.")
+
+    cdef Py_ssize_t record = _record_size(integer, float32)
+    cdef const unsigned char[::1] view = data
+    cdef Py_ssize_t size = view.shape[0]
+    if size % record != 0:
+        raise ValueError(f"Buffer length {size} is not a multiple of the record size {record}.")
+
+    cdef Py_ssize_t length = size // record
+    cdef list out = [None] * length
+    if length == 0:
+        return out
+
+    cdef const char* source = <const char*>&view[0]
+    cdef Py_ssize_t i
+    cdef double x, y
+    cdef long long[2] ints
+    if integer:
+        for i in range(length):
+            memcpy(ints, source + i * record, sizeof(ints))
+            if vector_type is Vector2Int:
+                out[i] = new_vector2_int(ints[0], ints[1])
+            elif vector_type is MVector2Int:
+                out[i] = new_mvector2_int(ints[0], ints[1])
+            else: # Subclasses, for example CheckedVector2Int
+                out[i] = vector_type(ints[0], ints[1])
+    else:
+        for i in range(length):
+            _read_doubles(source + i * record, &x, &y, float32)
+            if vector_type is Vector2:
+                out[i] = new_vector2(x, y)
+            elif vector_type is MVector2:
+                out[i] = new_mvector2(x, y)
+            else:
+                out[i] = vector_type(x, y)
+    return out
@@ -1,6 +1,7 @@
 from typing import Final, Iterable, NamedTuple, Self, final
 
-from .. import Vector2Int, Rect
+from .. import Vector2Int
+from .rect import Rect
 
 
 @final
@@ -1,6 +1,6 @@
 from typing import NamedTuple, final
 
-from .. import Rect
+from .rect import Rect
 
 @final
 class RectOffset(NamedTuple):
@@ -1,6 +1,7 @@
 from typing import NamedTuple, final
 
-from .. import RectInt, RectOffset
+from .rect_int import RectInt
+from .rect_offset import RectOffset
 
 @final
 class RectOffsetInt(NamedTuple):
@@ -0,0 +1,15 @@
+# Vector2 math with bit-identical results on every platform, see nalpy/math/_c_extensions/deterministic.pyi
+
+from nalpy.math._c_extensions.deterministic import hypot as hypot
+from nalpy.math._c_extensions.deterministic import acos as acos
+from nalpy.math._c_extensions.deterministic import atan2 as atan2
+from nalpy.math._c_extensions.deterministic import round as round
+
+from nalpy.math._c_extensions.deterministic import magnitude as magnitude
+from nalpy.math._c_extensions.deterministic import normalized as normalized
+from nalpy.math._c_extensions.deterministic import distance as distance
+from nalpy.math._c_extensions.deterministic import angle as angle
+from nalpy.math._c_extensions.deterministic import signed_angle as signed_angle
+from nalpy.math._c_extensions.deterministic import move_towards as move_towards
+from nalpy.math._c_extensions.deterministic import smooth_damp as smooth_damp
+from nalpy.math._c_extensions.deterministic import round_vector as round_vector
@@ -1,14 +1,59 @@
+import sys
 from setuptools import setup, Extension, find_packages
 
+# Extensions using cython.parallel fall back to serial execution if compiled without OpenMP.
+if sys.platform == "win32":
+    openmp_compile_args: list[str] = ["/openmp"]
+    openmp_link_args: list[str] = []
+elif sys.platform == "darwin": # Apple Clang doesn't ship OpenMP
+    openmp_compile_args = []
+    openmp_link_args = []
+else:
+    openmp_compile_args = ["-fopenmp"]
+    openmp_link_args = ["-fopenmp"]
+
+# Disable floating point contraction so that a * b + c isn't fused into an FMA instruction on some compilers and CPUs but not on others.
+# Together with the portable functions of the deterministic extension this makes the Vector2 math bit-identical across platforms.
+if sys.platform == "win32":
+    deterministic_compile_args: list[str] = ["/fp:precise"] # MSVC only contracts with /fp:fast or /fp:contract
+else:
+    deterministic_compile_args = ["-ffp-contract=off"]
+
 setup(
     packages=find_packages(where=".", include=["nalpy*"]),
     ext_modules=[
-        Extension("nalpy.math._c_extensions.functions", ["nalpy/math/_c_extensions/functions.c"]),
-        Extension("nalpy.math._c_extensions.vector2", ["nalpy/math/_c_extensions/vector2.c"]),
+        Extension("nalpy.math._c_extensions.functions", ["nalpy/math/_c_extensions/functions.c"], extra_compile_args=deterministic_compile_args),
+        Extension("nalpy.math._c_extensions.vector2", ["nalpy/math/_c_extensions/vector2.c"], extra_compile_args=deterministic_compile_args),
         Extension("nalpy.math._c_extensions.vector2_int", ["nalpy/math/_c_extensions/vector2_int.c"]),
-        Extension("nalpy.math._c_extensions.mvector2", ["nalpy/math/_c_extensions/mvector2.c"]),
-        Extension("nalpy.math._c_extensions.mvector2_int", ["nalpy/math/_c_extensions/mvector2_int.c"])
+        Extension("nalpy.math._c_extensions.vector2_int_overflow", ["nalpy/math/_c_extensions/vector2_int_overflow.c"]),
+        Extension("nalpy.math._c_extensions.mvector2", ["nalpy/math/_c_extensions/mvector2.c"], extra_compile_args=deterministic_compile_args),
+        Extension("nalpy.math._c_extensions.mvector2_int", ["nalpy/math/_c_extensions/mvector2_int.c"]),
+        Extension("nalpy.math._c_extensions.deterministic", ["nalpy/math/_c_extensions/deterministic.c"], extra_compile_args=deterministic_compile_args),
+        Extension("nalpy.math._c_extensions.vector2_array", ["nalpy/math/_c_extensions/vector2_array.c"], extra_compile_args=deterministic_compile_args),
+        Extension("nalpy.math._c_extensions.vector2_int_buffer", ["nalpy/math/_c_extensions/vector2_int_buffer.c"]),
+        Extension("nalpy.math._c_extensions.vector_codec", ["nalpy/math/_c_extensions/vector_codec.c"]),
+        Extension("nalpy.math._c_extensions.vector3", ["nalpy/math/_c_extensions/vector3.c"]),
+        Extension("nalpy.math._c_extensions.vector3_int", ["nalpy/math/_c_extensions/vector3_int.c"]),
+        Extension("nalpy.math._c_extensions.mvector3", ["nalpy/math/_c_extensions/mvector3.c"]),
+        Extension("nalpy.math._c_extensions.mvector3_int", ["nalpy/math/_c_extensions/mvector3_int.c"]),
+        Extension("nalpy.math._c_extensions.vector3_array", ["nalpy/math/_c_extensions/vector3_array.c"]),
+        Extension("nalpy.math._c_extensions.vector3_int_buffer", ["nalpy/math/_c_extensions/vector3_int_buffer.c"]),
+        Extension("nalpy.math._c_extensions.matrix3x2", ["nalpy/math/_c_extensions/matrix3x2.c"]),
+        Extension("nalpy.math._c_extensions.matrix4x4", ["nalpy/math/_c_extensions/matrix4x4.c"]),
+        Extension("nalpy.math._c_extensions.quaternion", ["nalpy/math/_c_extensions/quaternion.c"]),
+        Extension("nalpy.math._c_extensions.quaternion_array", ["nalpy/math/_c_extensions/quaternion_array.c"]),
+        Extension("nalpy.math._c_extensions.rect", ["nalpy/math/_c_extensions/rect.c"]),
+        Extension("nalpy.math._c_extensions.rect_int", ["nalpy/math/_c_extensions/rect_int.c"]),
+        Extension("nalpy.math._c_extensions.rect_array", ["nalpy/math/_c_extensions/rect_array.c"]),
+        Extension("nalpy.math._c_extensions.rect_int_array", ["nalpy/math/_c_extensions/rect_int_array.c"]),
+        Extension("nalpy.math._c_extensions.rect_offset", ["nalpy/math/_c_extensions/rect_offset.c"]),
+        Extension("nalpy.math._c_extensions.rect_offset_int", ["nalpy/math/_c_extensions/rect_offset_int.c"]),
+        Extension("nalpy.math._c_extensions.path2", ["nalpy/math/_c_extensions/path2.c"]),
+        Extension("nalpy.math._c_extensions.spatial_index", ["nalpy/math/_c_extensions/spatial_index.c"]),
+        Extension("nalpy.math._c_extensions.sweep_and_prune", ["nalpy/math/_c_extensions/sweep_and_prune.c"]),
+        Extension("nalpy.math._c_extensions.sorted_values", ["nalpy/math/_c_extensions/sorted_values.c"]),
+        Extension("nalpy.math._c_extensions.reductions", ["nalpy/math/_c_extensions/reductions.c"], extra_compile_args=openmp_compile_args, extra_link_args=openmp_link_args)
     ],
-    package_data={"nalpy": ["py.typed"], "nalpy.math._c_extensions": ["*.pyi"]},
+    package_data={"nalpy": ["py.typed"], "nalpy.math._c_extensions": ["*.pyi", "*.pxd"]},
     zip_safe=False
 )
@@ -0,0 +1,30 @@
+from timeit import timeit
+from nalpy.math import Vector2, Vector2Int, MVector2, MVector2Int
+
+# Operations whose cost is dominated by allocating the result object.
+# The freelists are compiled in, so unlike performance.py this can't compare implementations side by side.
+# Run it before and after rebuilding the extensions and compare the printed ns per operation instead.
+setups: tuple[tuple[str, str], ...] = (
+    ("Vector2", "x = Vector2(69.0, 420.0); y = Vector2(-4.0, -5.0)"),
+    ("Vector2Int", "x = Vector2Int(69, 420); y = Vector2Int(-4, -5)"),
+    ("MVector2", "x = MVector2(69.0, 420.0); y = MVector2(-4.0, -5.0)"),
+    ("MVector2Int", "x = MVector2Int(69, 420); y = MVector2Int(-4, -5)")
+)
+commands: dict[str, tuple[str, ...]] = {
+    "Vector2": ("Vector2(69.0, 420.0)", "x + y", "-x", "x * 2", "x.normalized", "Vector2.lerp(x, y, 0.5)"),
+    "Vector2Int": ("x + y", "-x", "x * 2"),
+    "MVector2": ("MVector2(69.0, 420.0)", "MVector2.zero()", "x.copy()", "x.normalized"),
+    "MVector2Int": ("MVector2Int(69, 420)", "MVector2Int.zero()", "x.copy()")
+}
+
+n = 1_000_000
+runs = 7
+
+gbls = {"Vector2": Vector2, "Vector2Int": Vector2Int, "MVector2": MVector2, "MVector2Int": MVector2Int}
+
+for name, setup in setups:
+    print(name)
+    for cmd in commands[name]:
+        secs = min(timeit(cmd, setup=setup, globals=gbls, number=n) for _ in range(runs))
+        print(f"    {cmd}: {secs / n * 1e9:.1f} ns")
+    print(75 * "-")
@@ -0,0 +1,19 @@
+from array import array
+from timeit import timeit
+from nalpy.math import Vector2, Vector2Array
+
+n = 1_000_000
+runs = 5
+
+vectors = [Vector2(i, -i) for i in range(n)]
+packed = Vector2.to_buffer(vectors)
+
+glbls = {"vectors": vectors, "packed": packed, "Vector2": Vector2, "Vector2Array": Vector2Array, "array": array}
+for name, stmt in (
+    ("Python pack", "array('d', [c for v in vectors for c in v.to_tuple()])"),
+    ("Vector2.to_buffer", "Vector2.to_buffer(vectors)"),
+    ("Python unpack", "[Vector2(x, y) for x, y in memoryview(packed).tolist()]"),
+    ("Vector2.from_buffer", "Vector2.from_buffer(packed)")
+):
+    secs = min(timeit(stmt, globals=glbls, number=1) for _ in range(runs))
+    print(f"{name}: {secs * 1000:.1f} ms for {n} vectors")
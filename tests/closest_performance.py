@@ -0,0 +1,31 @@
+import random
+from array import array
+from timeit import timeit
+from nalpy import math
+
+random.seed(69420)
+grid = array("d", sorted(random.uniform(-1000.0, 1000.0) for _ in range(5_000)))
+queries = array("d", (random.uniform(-1100.0, 1100.0) for _ in range(1_000)))
+sorted_values = math.SortedValues(grid)
+grid_list = list(grid)
+
+runs = 3
+glbls = {"math": math, "grid": grid, "grid_list": grid_list, "queries": queries, "sorted_values": sorted_values}
+
+print(f"{len(queries)} queries against {len(grid)} candidates (best of {runs})")
+results: list[tuple[str, float]] = []
+for name, stmt in (
+    ("math.closest", "[math.closest(v, grid_list) for v in queries]"),
+    ("math.closest_many", "math.closest_many(queries, grid)"),
+    ("SortedValues.closest", "[sorted_values.closest(v) for v in queries]"),
+    ("SortedValues.closest_many", "sorted_values.closest_many(queries)"),
+    ("SortedValues construction", "math.SortedValues(grid)")
+):
+    secs = min(timeit(stmt, globals=glbls, number=1) for _ in range(runs))
+    results.append((name, secs))
+    print(f"{name}: {secs * 1e3:.3f} ms")
+
+print(75 * "-")
+base = results[0][1]
+for name, secs in results[1:4]:
+    print(f"{name} is {base / secs:.0f} times faster than math.closest")
@@ -0,0 +1,13 @@
+import math
+from timeit import timeit
+from nalpy.math import Vector2, deterministic
+
+number = 1_000_000
+
+a = Vector2(3.25, -7.5)
+b = Vector2(-1.0, 2.0)
+
+print(f"magnitude: Vector2 {timeit(lambda: a.magnitude, number=number) * 1000:.1f} ms, deterministic {timeit(lambda: deterministic.magnitude(a), number=number) * 1000:.1f} ms, Python {timeit(lambda: math.hypot(a.x, a.y), number=number) * 1000:.1f} ms")
+print(f"angle: Vector2 {timeit(lambda: Vector2.angle(a, b), number=number) * 1000:.1f} ms, deterministic {timeit(lambda: deterministic.angle(a, b), number=number) * 1000:.1f} ms")
+print(f"move_towards: Vector2 {timeit(lambda: Vector2.move_towards(a, b, 0.5), number=number) * 1000:.1f} ms, deterministic {timeit(lambda: deterministic.move_towards(a, b, 0.5), number=number) * 1000:.1f} ms")
+print(f"atan2: math {timeit(lambda: math.atan2(0.3, -0.7), number=number) * 1000:.1f} ms, deterministic {timeit(lambda: deterministic.atan2(0.3, -0.7), number=number) * 1000:.1f} ms")
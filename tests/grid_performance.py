@@ -0,0 +1,25 @@
+from timeit import timeit
+from nalpy.math import GridOrder, RectInt, Vector2Int, Vector2IntBuffer
+
+size = 2048 # Side of the scanned tile map
+runs = 3
+
+rect = RectInt(0, 0, size, size)
+out = Vector2IntBuffer.zeros(size * size)
+
+def generator(rect: RectInt): # RectInt.all_positions_within before the grid iterator
+    for y in range(rect.y, rect.y + rect.h):
+        for x in range(rect.x, rect.x + rect.w):
+            yield Vector2Int(x, y)
+
+glbls = {"rect": rect, "out": out, "generator": generator, "GridOrder": GridOrder}
+for name, stmt in (
+    ("Python generator", "for _ in generator(rect): pass"),
+    ("iter_positions row-major", "for _ in rect.iter_positions(): pass"),
+    ("iter_positions Hilbert", "for _ in rect.iter_positions(GridOrder.HILBERT): pass"),
+    ("positions_to_buffer row-major", "rect.positions_to_buffer(GridOrder.ROW_MAJOR, out)"),
+    ("positions_to_buffer Morton", "rect.positions_to_buffer(GridOrder.MORTON, out)"),
+    ("positions_to_buffer Hilbert", "rect.positions_to_buffer(GridOrder.HILBERT, out)")
+):
+    secs = min(timeit(stmt, globals=glbls, number=1) for _ in range(runs))
+    print(f"{name}: {secs * 1000:.2f} ms for {size}x{size} cells")
@@ -0,0 +1,30 @@
+from timeit import timeit
+from nalpy.math import Matrix3x2, Matrix4x4, Vector2, Vector2Array, Vector3, Vector3Array
+
+n = 1_000_000
+runs = 5
+
+points2 = [Vector2(i, -i) for i in range(n)]
+points3 = [Vector3(i, -i, 0.5 * i) for i in range(n)]
+packed2 = Vector2.to_buffer(points2)
+packed3 = Vector3.to_buffer(points3)
+out2 = Vector2Array.zeros(n)
+out3 = Vector3Array.zeros(n)
+
+m2 = Matrix3x2.trs(Vector2(5.0, -6.0), 33.0, Vector2(2.0, 0.5))
+m4 = Matrix4x4.rotate_y(33.0) * Matrix4x4.translate(Vector3(5.0, -6.0, 7.0))
+
+glbls = {
+    "points2": points2, "points3": points3, "packed2": packed2, "packed3": packed3,
+    "out2": out2, "out3": out3, "m2": m2, "m4": m4
+}
+for name, stmt in (
+    ("Matrix3x2 list transform_point", "[m2.transform_point(p) for p in points2]"),
+    ("Matrix3x2.transform_points", "m2.transform_points(packed2)"),
+    ("Matrix3x2.transform_points(out=)", "m2.transform_points(packed2, out=out2)"),
+    ("Matrix4x4 list transform_point", "[m4.transform_point(p) for p in points3]"),
+    ("Matrix4x4.transform_points", "m4.transform_points(packed3)"),
+    ("Matrix4x4.transform_points(out=)", "m4.transform_points(packed3, out=out3)")
+):
+    secs = min(timeit(stmt, globals=glbls, number=1) for _ in range(runs))
+    print(f"{name}: {secs * 1000:.1f} ms for {n} points")
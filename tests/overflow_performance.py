@@ -0,0 +1,19 @@
+from timeit import timeit
+from nalpy.math import Vector2Int, CheckedVector2Int, SaturatingVector2Int, _Legacy_Vector2Int
+
+number = 1_000_000
+
+types = {"Legacy": _Legacy_Vector2Int, "Vector2Int": Vector2Int, "CheckedVector2Int": CheckedVector2Int, "SaturatingVector2Int": SaturatingVector2Int}
+operations = {
+    "a + b": lambda a, b: a + b,
+    "a * 3": lambda a, b: a * 3,
+    "a // b": lambda a, b: a // b,
+    "-a": lambda a, b: -a,
+}
+
+for name, op in operations.items():
+    print(name)
+    for type_name, t in types.items():
+        a = t(123456, -654321)
+        b = t(17, -3)
+        print(f"  {type_name}: {timeit(lambda: op(a, b), number=number) * 1000:.1f} ms")
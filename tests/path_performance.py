@@ -0,0 +1,42 @@
+import math
+import random
+from array import array
+from itertools import accumulate
+from timeit import timeit
+from nalpy.math import Path2, Vector2
+
+n = 10_000
+samples = 10_000
+runs = 5
+random.seed(69420)
+
+points = [Vector2(i + random.random(), math.sin(i / 50.0) * 100.0) for i in range(n)]
+path = Path2(points)
+t = array("d", (i / (samples - 1) for i in range(samples)))
+query = Vector2(n / 2.0, 150.0)
+
+def python_closest(point: Vector2) -> Vector2:
+    best = points[0]
+    best_distance = Vector2.distance(point, best)
+    for a, b in zip(points, points[1:]):
+        ab = b - a
+        u = min(1.0, max(0.0, Vector2.dot(point - a, ab) / Vector2.dot(ab, ab)))
+        candidate = a + ab * u
+        distance = Vector2.distance(point, candidate)
+        if distance < best_distance:
+            best, best_distance = candidate, distance
+    return best
+
+glbls = {"points": points, "path": path, "t": t, "query": query, "Path2": Path2, "Vector2": Vector2, "accumulate": accumulate, "python_closest": python_closest}
+for name, stmt in (
+    ("Python cumulative lengths", "list(accumulate((Vector2.distance(a, b) for a, b in zip(points, points[1:])), initial=0.0))"),
+    ("Path2 construction", "Path2(points)"),
+    ("Python closest point", "python_closest(query)"),
+    ("Path2.closest_point", "path.closest_point(query)"),
+    ("Path2.sample loop", "[path.sample(x) for x in t]"),
+    ("Path2.sample_many", "path.sample_many(t)"),
+    ("Path2.resample", f"path.resample({samples})"),
+    ("Path2.simplify", "path.simplify(0.5)")
+):
+    secs = min(timeit(stmt, globals=glbls, number=1) for _ in range(runs))
+    print(f"{name}: {secs * 1000:.2f} ms for {n} points")
@@ -0,0 +1,29 @@
+import random
+from array import array
+from timeit import timeit
+from nalpy.math import Quaternion, QuaternionArray, Vector3
+
+n = 100_000 # Bones blended in a single frame
+runs = 5
+random.seed(69420)
+
+def random_rotation() -> Quaternion:
+    return Quaternion.from_euler(Vector3(random.uniform(-180.0, 180.0), random.uniform(-180.0, 180.0), random.uniform(-180.0, 180.0)))
+
+a = [random_rotation() for _ in range(n)]
+b = [random_rotation() for _ in range(n)]
+t = array("d", (random.random() for _ in range(n)))
+packed_a = QuaternionArray(a)
+packed_b = QuaternionArray(b)
+out = QuaternionArray.zeros(n)
+
+glbls = {"a": a, "b": b, "t": t, "packed_a": packed_a, "packed_b": packed_b, "out": out, "Quaternion": Quaternion}
+for name, stmt in (
+    ("Quaternion list slerp", "[Quaternion.slerp(x, y, w) for x, y, w in zip(a, b, t)]"),
+    ("Quaternion.slerp_many", "Quaternion.slerp_many(packed_a, packed_b, t)"),
+    ("Quaternion.slerp_many(out=)", "Quaternion.slerp_many(packed_a, packed_b, t, out=out)"),
+    ("Quaternion list nlerp", "[Quaternion.nlerp(x, y, w) for x, y, w in zip(a, b, t)]"),
+    ("Quaternion.nlerp_many(out=)", "Quaternion.nlerp_many(packed_a, packed_b, t, out=out)")
+):
+    secs = min(timeit(stmt, globals=glbls, number=1) for _ in range(runs))
+    print(f"{name}: {secs * 1000:.2f} ms for {n} quaternions")
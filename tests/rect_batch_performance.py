@@ -0,0 +1,44 @@
+import random
+from time import perf_counter
+from nalpy.math import RectInt, RectIntArray
+
+n = 50_000 # Dirty rects per frame
+runs = 7
+
+random.seed(0)
+rects = [RectInt(random.randint(-100, 1920), random.randint(-100, 1080), random.randint(1, 64), random.randint(1, 64)) for _ in range(n)]
+viewport = RectInt(0, 0, 1920, 1080)
+array = RectIntArray(rects)
+
+def best(func) -> float:
+    times: list[float] = []
+    for _ in range(runs):
+        start = perf_counter()
+        func()
+        times.append(perf_counter() - start)
+    return min(times)
+
+def python_clip() -> list[RectInt]:
+    out: list[RectInt] = []
+    for r in rects:
+        x = max(r.x, viewport.x)
+        y = max(r.y, viewport.y)
+        w = min(r.x + r.w, viewport.x + viewport.w) - x
+        h = min(r.y + r.h, viewport.y + viewport.h) - y
+        if w > 0 and h > 0:
+            out.append(RectInt(x, y, w, h))
+    return out
+
+def python_overlaps() -> list[bool]:
+    return [r.overlaps(viewport) for r in rects]
+
+print(f"{n} rects")
+print(f"clip: Python {best(python_clip) * 1000:.2f} ms, RectIntArray.clip_to {best(lambda: RectIntArray.clip_to(array, viewport)) * 1000:.2f} ms")
+print(f"overlaps: Python {best(python_overlaps) * 1000:.2f} ms, RectIntArray.overlaps_any {best(lambda: RectIntArray.overlaps_any(array, viewport)) * 1000:.2f} ms")
+print(f"area: Python {best(lambda: sum(r.w * r.h for r in rects)) * 1000:.2f} ms, RectIntArray.total_area {best(lambda: RectIntArray.total_area(array)) * 1000:.2f} ms")
+
+# Dirty rects are usually clustered around the few things that moved
+centers = [(random.randint(0, 1800), random.randint(0, 1000)) for _ in range(40)]
+dirty = RectIntArray([RectInt(cx + random.randint(-40, 40), cy + random.randint(-40, 40), random.randint(1, 32), random.randint(1, 32)) for cx, cy in random.choices(centers, k=n)])
+merged = RectIntArray.merge_overlapping(dirty)
+print(f"merge: {best(lambda: RectIntArray.merge_overlapping(dirty)) * 1000:.2f} ms, {len(dirty)} rects covering {RectIntArray.total_area(dirty)} pixels -> {len(merged)} rects covering {RectIntArray.total_area(merged)} pixels")
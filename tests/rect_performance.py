@@ -0,0 +1,35 @@
+from timeit import timeit
+from nalpy.math import Rect, RectInt, Vector2, Vector2Int
+from nalpy.math import _Legacy_Rect, _Legacy_RectInt # pyright: ignore [reportPrivateUsage]
+
+commands: tuple[str, ...] = (
+    "Rect(x, y, w, h)",
+    "a.overlaps(b)",
+    "a.contains(point)",
+    "a.xmax",
+    "a.center",
+    "a == b",
+    "hash(a)",
+    "x, y, w, h = a"
+)
+
+configurations: tuple[tuple[str, type, type, type], ...] = (
+    ("Old Rect", _Legacy_Rect, Vector2, float),
+    ("New Rect", Rect, Vector2, float),
+    ("Old RectInt", _Legacy_RectInt, Vector2Int, int),
+    ("New RectInt", RectInt, Vector2Int, int)
+)
+
+n = 1_000_000
+runs = 7
+
+for cmd in commands:
+    print(cmd)
+    for name, rect_type, vector_type, number_type in configurations:
+        if "center" in cmd and rect_type in (_Legacy_RectInt, RectInt):
+            continue # RectInt doesn't have a center
+        setup = "x, y, w, h = N(1), N(2), N(3), N(4); a = Rect(x, y, w, h); b = Rect(N(2), N(3), N(4), N(5)); point = V(N(2), N(3))"
+        gbls = {"Rect": rect_type, "V": vector_type, "N": number_type}
+        secs = min(timeit(cmd, setup=setup, globals=gbls, number=n) for _ in range(runs))
+        print(f"    {name}: {secs / n * 1e9:.1f} ns")
+    print(75 * "-")
@@ -0,0 +1,48 @@
+import random
+from array import array
+from fractions import Fraction
+from math import fsum
+from timeit import timeit
+from nalpy import math
+
+n = 10_000_000
+runs = 5
+
+random.seed(69420)
+# Ill-conditioned data: large magnitude range and lots of cancellation.
+values = array("d", (random.choice((-1.0, 1.0)) * random.random() * 10.0 ** random.randint(-12, 12) for _ in range(n)))
+
+exact = float(sum(map(Fraction, values[:100_000])))
+sample = values[:100_000]
+
+DELIM: str = 75 * "-"
+
+print("Accuracy (error against exact rational sum of 100 000 values)")
+for name, result in (
+    ("math.fsum", fsum(sample)),
+    ("nalpy.math.sum", math.sum(sample)),
+    ("nalpy.math.kahan_sum", math.kahan_sum(sample)),
+    ("builtins.sum", sum(sample))
+):
+    print(f"{name}: {abs(result - exact)}")
+print(DELIM)
+
+print(f"Throughput ({n} values, best of {runs})")
+glbls = {"values": values, "math": math, "fsum": fsum}
+results: list[tuple[str, float]] = []
+for name, stmt in (
+    ("math.fsum", "fsum(values)"),
+    ("nalpy.math.sum", "math.sum(values)"),
+    ("nalpy.math.kahan_sum", "math.kahan_sum(values)"),
+    ("nalpy.math.mean", "math.mean(values)"),
+    ("nalpy.math.variance", "math.variance(values)"),
+    ("nalpy.math.dot", "math.dot(values, values)")
+):
+    secs = min(timeit(stmt, globals=glbls, number=1) for _ in range(runs))
+    results.append((name, secs))
+    print(f"{name}: {secs} seconds ({n / secs / 1e6:.1f} M values / second)")
+
+fsum_secs = results[0][1]
+print(DELIM)
+for name, secs in results[1:]:
+    print(f"{name} is {fsum_secs / secs:.2f} times faster than math.fsum")
@@ -0,0 +1,25 @@
+import random
+from array import array
+from timeit import timeit
+from nalpy import math
+
+n = 10_000_000
+runs = 3
+
+random.seed(69420)
+values = array("d", (random.uniform(-1e6, 1e6) for _ in range(n)))
+out = array("d", bytes(8 * n))
+sample = values[:100_000]
+
+glbls = {"math": math, "values": values, "sample": sample, "out": out}
+
+print(f"Scalar functions ({len(sample)} values, best of {runs})")
+for stmt in ("[math.round_to_digits(x, 2) for x in sample]", "[math.round_to_nearest_n(x, 5) for x in sample]"):
+    secs = min(timeit(stmt, globals=glbls, number=1) for _ in range(runs))
+    print(f"{stmt}: {secs / len(sample) * 1e9:.1f} ns / value")
+print(75 * "-")
+
+print(f"Batched functions ({n} values, best of {runs})")
+for stmt in ("math.round_to_digits_many(values, 2, out=out)", "math.floor_to_nearest_n_to_digits_many(values, 5, 2, out=out)"):
+    secs = min(timeit(stmt, globals=glbls, number=1) for _ in range(runs))
+    print(f"{stmt}: {secs * 1e3:.1f} ms ({secs / n * 1e9:.2f} ns / value)")
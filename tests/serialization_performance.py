@@ -0,0 +1,24 @@
+import pickle
+from timeit import timeit
+from nalpy.math import Vector2, pack_vectors, unpack_vectors
+
+n = 1_000_000 # Vectors in a single frame sent to a worker process
+runs = 3
+
+vectors = [Vector2(i, -i) for i in range(n)]
+pickled = pickle.dumps(vectors, pickle.HIGHEST_PROTOCOL)
+packed = pack_vectors(vectors)
+packed32 = pack_vectors(vectors, float32=True)
+print(f"pickle: {len(pickled) / n:.1f} bytes per vector, pack_vectors: {len(packed) / n:.1f}, float32: {len(packed32) / n:.1f}")
+
+glbls = {"vectors": vectors, "pickled": pickled, "packed": packed, "packed32": packed32, "pickle": pickle, "pack_vectors": pack_vectors, "unpack_vectors": unpack_vectors}
+for name, stmt in (
+    ("pickle.dumps", "pickle.dumps(vectors, pickle.HIGHEST_PROTOCOL)"),
+    ("pickle.loads", "pickle.loads(pickled)"),
+    ("pack_vectors", "pack_vectors(vectors)"),
+    ("unpack_vectors", "unpack_vectors(packed)"),
+    ("pack_vectors float32", "pack_vectors(vectors, float32=True)"),
+    ("unpack_vectors float32", "unpack_vectors(packed32, float32=True)")
+):
+    secs = min(timeit(stmt, globals=glbls, number=1) for _ in range(runs))
+    print(f"{name}: {secs * 1000:.2f} ms for {n} vectors")
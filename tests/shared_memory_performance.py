@@ -0,0 +1,43 @@
+import os
+import sys
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+from time import perf_counter
+from nalpy.math import Vector2, Vector2Array
+
+n = 4_000_000 # Vectors in the shared simulation state
+steps = 20 # Simulation steps per run
+runs = 3
+max_processes = int(sys.argv[1]) if len(sys.argv) > 1 else (os.cpu_count() or 1)
+
+target = Vector2(100.0, 50.0)
+
+def step(args: tuple[str, int, int]) -> None:
+    # Attaches to the shared memory and updates a disjoint slice in place without copying
+    name, start, stop = args
+    shm = SharedMemory(name)
+    positions = Vector2Array.view(shm.buf)[start:stop]
+    for _ in range(steps):
+        Vector2Array.move_towards(positions, target, 0.01, positions)
+        positions *= 0.999
+    del positions
+    shm.close()
+
+if __name__ == "__main__":
+    shm = SharedMemory(create=True, size=16 * n)
+    try:
+        print(f"{os.cpu_count()} CPUs available")
+        for processes in range(1, max_processes + 1):
+            chunk = -(-n // processes)
+            tasks = [(shm.name, i, min(i + chunk, n)) for i in range(0, n, chunk)]
+            with Pool(processes) as pool:
+                pool.map(step, tasks) # Warm up the workers and fault in the shared pages
+                best = float("inf")
+                for _ in range(runs):
+                    start = perf_counter()
+                    pool.map(step, tasks)
+                    best = min(best, perf_counter() - start)
+            print(f"{processes} processes: {best * 1000:.2f} ms, {n * steps / best / 1e6:.1f} M vector updates per second")
+    finally:
+        shm.close()
+        shm.unlink()
@@ -0,0 +1,22 @@
+from timeit import timeit
+from nalpy.math import MVector2, Vector2, Vector2Array
+
+n = 50_000 # Followers updated in a single frame
+runs = 5
+
+currents = [Vector2(i, -i) for i in range(n)]
+velocities = [MVector2.zero() for _ in range(n)]
+target = Vector2(100.0, 50.0)
+packed = Vector2.to_buffer(currents)
+packed_velocities = Vector2Array.zeros(n)
+
+glbls = {
+    "currents": currents, "velocities": velocities, "target": target, "packed": packed, "packed_velocities": packed_velocities,
+    "Vector2": Vector2, "Vector2Array": Vector2Array
+}
+for name, stmt in (
+    ("Vector2.smooth_damp loop", "[Vector2.smooth_damp(c, target, v, 0.3, 0.016) for c, v in zip(currents, velocities)]"),
+    ("Vector2Array.smooth_damp_many", "Vector2Array.smooth_damp_many(packed, target, packed_velocities, 0.3, 0.016)")
+):
+    secs = min(timeit(stmt, globals=glbls, number=1) for _ in range(runs))
+    print(f"{name}: {secs * 1000:.2f} ms for {n} vectors")
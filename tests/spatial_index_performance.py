@@ -0,0 +1,41 @@
+import random
+from time import perf_counter
+from nalpy.math import QuadTree, Rect, SpatialHash, Vector2
+
+world = 10_000.0
+queries = 100
+random.seed(69420)
+
+query_rects = [Rect(random.uniform(0.0, world), random.uniform(0.0, world), 100.0, 100.0) for _ in range(queries)]
+query_points = [Vector2(random.uniform(0.0, world), random.uniform(0.0, world)) for _ in range(queries)]
+
+def best_of(func, runs: int = 3) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        start = perf_counter()
+        func()
+        best = min(best, perf_counter() - start)
+    return best
+
+DELIM: str = 75 * "-"
+
+for n in (1_000, 10_000, 100_000, 1_000_000):
+    rects = [Rect(random.uniform(0.0, world), random.uniform(0.0, world), random.uniform(0.0, 10.0), random.uniform(0.0, 10.0)) for _ in range(n)]
+    items = list(enumerate(rects))
+    print(f"{n} objects, {queries} queries")
+
+    # Brute force gets slow quickly, only measure a few queries at large sizes.
+    brute_queries = query_rects[:max(1, queries * 1_000 // n)]
+    brute = best_of(lambda: [[i for i, r in items if q.overlaps(r)] for q in brute_queries], runs=1) / len(brute_queries)
+    print(f"    brute force overlaps: {brute * 1e6:.1f} us / query")
+
+    for name, create in (("QuadTree", lambda: QuadTree(Rect(0.0, 0.0, world, world))), ("SpatialHash", lambda: SpatialHash(50.0))):
+        index = create()
+        start = perf_counter()
+        index.insert_many(items)
+        build = perf_counter() - start
+
+        query = best_of(lambda: [index.query_rect(q) for q in query_rects]) / queries
+        nearest = best_of(lambda: [index.nearest(p, 10) for p in query_points]) / queries
+        print(f"    {name}: build {build * 1e3:.1f} ms, query_rect {query * 1e6:.1f} us / query ({brute / query:.0f}x brute force), nearest(k=10) {nearest * 1e6:.1f} us / query")
+    print(DELIM)
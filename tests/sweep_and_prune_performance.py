@@ -0,0 +1,48 @@
+import random
+from time import perf_counter
+from nalpy.math import Rect, SpatialHash, SweepAndPrune
+
+frames = 10
+random.seed(69420)
+
+DELIM: str = 75 * "-"
+
+for n in (10_000, 100_000):
+    world = 100.0 * n ** 0.5 # Keeps the density and the amount of overlaps per rect the same for every n
+    rects = [Rect(random.uniform(0.0, world), random.uniform(0.0, world), random.uniform(1.0, 10.0), random.uniform(1.0, 10.0)) for _ in range(n)]
+    velocities = [(random.uniform(-1.0, 1.0), random.uniform(-1.0, 1.0)) for _ in range(n)]
+
+    movement: list[list[tuple[int, Rect]]] = []
+    for _ in range(frames):
+        rects = [Rect(r.x + vx, r.y + vy, r.w, r.h) for r, (vx, vy) in zip(rects, velocities)]
+        movement.append(list(enumerate(rects)))
+    print(f"{n} moving rects, {frames} frames")
+
+    sap = SweepAndPrune()
+    start = perf_counter()
+    sap.insert_many(enumerate(rects))
+    sap.pop_events()
+    print(f"    SweepAndPrune build: {(perf_counter() - start) * 1e3:.1f} ms, {len(sap.pairs())} overlapping pairs")
+
+    events = 0
+    start = perf_counter()
+    for items in movement:
+        sap.update_many(items)
+        began, ended = sap.pop_events()
+        events += len(began) + len(ended)
+    print(f"    SweepAndPrune update: {(perf_counter() - start) / frames * 1e3:.1f} ms / frame, {events / frames:.0f} events / frame")
+
+    start = perf_counter()
+    for key in range(0, n, 2):
+        sap.remove(key)
+    sap.pop_events()
+    print(f"    SweepAndPrune remove half: {(perf_counter() - start) * 1e3:.1f} ms")
+
+    # Rebuilding a spatial index and querying every rect against it
+    start = perf_counter()
+    for items in movement:
+        index = SpatialHash(10.0)
+        index.insert_many(items)
+        pairs = [(i, j) for i, r in items for j in index.query_rect(r) if i < j]
+    print(f"    SpatialHash rebuild and query: {(perf_counter() - start) / frames * 1e3:.1f} ms / frame")
+    print(DELIM)
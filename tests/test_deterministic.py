@@ -0,0 +1,176 @@
+import json
+import math
+import random
+import sys
+import unittest
+from decimal import Decimal, ROUND_HALF_UP
+from pathlib import Path
+from typing import Any, Callable
+
+from nalpy.math import Vector2, MVector2, lerp, smooth_step
+from nalpy.math import deterministic
+
+# Golden values are stored as float.hex() so that every bit is compared.
+# Regenerate with `python tests/test_deterministic.py --regenerate` only when a result is meant to change.
+CORPUS_PATH = Path(__file__).with_name("deterministic_golden.json")
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, float):
+        return value.hex()
+    if isinstance(value, (Vector2, MVector2)):
+        return [value.x.hex(), value.y.hex()]
+    if isinstance(value, (tuple, list)):
+        return [_encode(v) for v in value]
+    if hasattr(value, "x"): # Vector2Int
+        return [value.x, value.y]
+    return value
+
+
+def _smooth_damp(current: Vector2, target: Vector2, velocity: Vector2, smooth_time: float, delta_time: float, max_speed: float) -> tuple[Vector2, MVector2]:
+    v = MVector2(velocity.x, velocity.y)
+    return deterministic.smooth_damp(current, target, v, smooth_time, delta_time, max_speed), v
+
+
+# Functions of the golden corpus and how to generate their arguments.
+# The regular Vector2 and functions versions are included to catch floating point contraction.
+FUNCTIONS: dict[str, tuple[Callable[..., Any], str]] = {
+    "hypot": (deterministic.hypot, "ff"),
+    "acos": (deterministic.acos, "c"),
+    "atan2": (deterministic.atan2, "ff"),
+    "round": (deterministic.round, "f"),
+    "magnitude": (deterministic.magnitude, "v"),
+    "normalized": (deterministic.normalized, "v"),
+    "distance": (deterministic.distance, "vv"),
+    "angle": (deterministic.angle, "vv"),
+    "signed_angle": (deterministic.signed_angle, "vv"),
+    "move_towards": (deterministic.move_towards, "vvf"),
+    "smooth_damp": (_smooth_damp, "vvvttf"),
+    "round_vector": (deterministic.round_vector, "v"),
+    "Vector2.dot": (Vector2.dot, "vv"),
+    "Vector2.lerp_unclamped": (Vector2.lerp_unclamped, "vvf"),
+    "Vector2.reflect": (Vector2.reflect, "vv"),
+    "lerp": (lerp, "fft"),
+    "smooth_step": (smooth_step, "fft"),
+}
+
+SPECIAL_FLOATS = (0.0, -0.0, 1.0, -1.0, 0.5, -0.5, 2.5, 1e-310, -1e300, 0.49999999999999994, math.pi, math.inf, -math.inf, math.nan)
+
+
+def _random_argument(rng: random.Random, kind: str) -> Any:
+    if kind == "f":
+        if rng.random() < 0.2:
+            return rng.choice(SPECIAL_FLOATS)
+        return rng.uniform(-1.0, 1.0) * 2.0 ** rng.randint(-40, 40)
+    if kind == "c":
+        return rng.choice((1.0, -1.0, 0.0, 0.5, -0.5, 1e-20)) if rng.random() < 0.2 else rng.uniform(-1.0, 1.0)
+    if kind == "t":
+        return rng.uniform(0.0, 1.0)
+    return Vector2(rng.uniform(-1000.0, 1000.0), rng.uniform(-1000.0, 1000.0))
+
+
+def _result(func: Callable[..., Any], args: list[Any]) -> Any:
+    try:
+        return _encode(func(*args))
+    except (ValueError, OverflowError) as e:
+        return type(e).__name__
+
+
+def _generate_corpus() -> dict[str, list[list[Any]]]:
+    rng = random.Random(1337)
+    corpus: dict[str, list[list[Any]]] = {}
+    for name, (func, kinds) in FUNCTIONS.items():
+        cases: list[list[Any]] = []
+        for _ in range(100):
+            args = [_random_argument(rng, kind) for kind in kinds]
+            cases.append([_encode(args), _result(func, args)])
+        corpus[name] = cases
+    return corpus
+
+
+def _write_corpus(corpus: dict[str, list[list[Any]]]) -> None:
+    # One case per line to keep diffs readable
+    functions = [f"{json.dumps(name)}: [\n" + ",\n".join(json.dumps(case) for case in cases) + "\n]" for name, cases in corpus.items()]
+    with open(CORPUS_PATH, "w") as f:
+        f.write("{\n" + ",\n".join(functions) + "\n}\n")
+
+
+def _decode_argument(value: Any) -> Any:
+    if isinstance(value, list):
+        return Vector2(float.fromhex(value[0]), float.fromhex(value[1]))
+    return float.fromhex(value)
+
+
+class GoldenValues(unittest.TestCase):
+    def test_corpus(self):
+        with open(CORPUS_PATH) as f:
+            corpus: dict[str, list[list[Any]]] = json.load(f)
+
+        self.assertEqual(set(corpus), set(FUNCTIONS))
+        for name, cases in corpus.items():
+            func = FUNCTIONS[name][0]
+            for args, expected in cases:
+                decoded = [_decode_argument(a) for a in args]
+                with self.subTest(function=name, args=args):
+                    self.assertEqual(_result(func, decoded), expected)
+
+
+class Accuracy(unittest.TestCase):
+    def assertUlpsEqual(self, a: float, b: float, ulps: int = 1):
+        if math.isnan(b):
+            self.assertTrue(math.isnan(a))
+            return
+        if a == b: # Also infinities
+            self.assertEqual(math.copysign(1.0, a), math.copysign(1.0, b))
+            return
+        self.assertLessEqual(abs(a - b), ulps * math.ulp(b), f"{a!r} != {b!r}")
+
+    def test_against_math(self):
+        rng = random.Random(42)
+        for _ in range(20_000):
+            e = rng.randint(-300, 300)
+            x = rng.uniform(-1.0, 1.0) * 2.0 ** e
+            y = rng.uniform(-1.0, 1.0) * 2.0 ** rng.randint(e - 60, e + 60)
+            c = rng.uniform(-1.0, 1.0)
+            self.assertUlpsEqual(deterministic.hypot(x, y), math.hypot(x, y))
+            self.assertUlpsEqual(deterministic.atan2(y, x), math.atan2(y, x))
+            self.assertUlpsEqual(deterministic.acos(c), math.acos(c))
+
+    def test_special_values(self):
+        for y in SPECIAL_FLOATS:
+            for x in SPECIAL_FLOATS:
+                self.assertUlpsEqual(deterministic.hypot(x, y), math.hypot(x, y))
+                self.assertUlpsEqual(deterministic.atan2(y, x), math.atan2(y, x))
+
+        for c in (1.0, -1.0, 0.0, -0.0, 0.5, -0.5, 1e-300):
+            self.assertUlpsEqual(deterministic.acos(c), math.acos(c), 0)
+        self.assertRaises(ValueError, lambda: deterministic.acos(1.5))
+        self.assertTrue(math.isnan(deterministic.acos(math.nan)))
+
+    def test_round(self):
+        for x in (0.5, -0.5, 1.5, 2.5, -2.5, 0.49999999999999994, 4503599627370497.0, -0.0, 1e300):
+            self.assertEqual(deterministic.round(x), int(Decimal(x).to_integral_value(ROUND_HALF_UP))) # Decimal rounds half away from zero
+        self.assertRaises(ValueError, lambda: deterministic.round(math.nan))
+        self.assertRaises(OverflowError, lambda: deterministic.round(math.inf))
+        self.assertRaises(OverflowError, lambda: deterministic.round_vector(Vector2(1e19, 0.0)))
+
+    def test_vectors(self):
+        # Same results as the regular versions up to rounding
+        rng = random.Random(7)
+        for _ in range(1000):
+            a = Vector2(rng.uniform(-100.0, 100.0), rng.uniform(-100.0, 100.0))
+            b = Vector2(rng.uniform(-100.0, 100.0), rng.uniform(-100.0, 100.0))
+            self.assertAlmostEqual(deterministic.magnitude(a), a.magnitude, places=12)
+            self.assertAlmostEqual(deterministic.distance(a, b), Vector2.distance(a, b), places=12)
+            self.assertAlmostEqual(deterministic.signed_angle(a, b), Vector2.signed_angle(a, b), places=9)
+            self.assertAlmostEqual(Vector2.distance(deterministic.move_towards(a, b, 1.0), Vector2.move_towards(a, b, 1.0)), 0.0, places=12)
+
+        self.assertEqual(deterministic.normalized(Vector2.zero), Vector2.zero)
+        self.assertEqual(deterministic.move_towards(Vector2.zero, Vector2.one, 5.0), Vector2.one)
+
+
+if __name__ == '__main__':
+    if "--regenerate" in sys.argv:
+        _write_corpus(_generate_corpus())
+    else:
+        unittest.main()
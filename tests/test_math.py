@@ -1,4 +1,8 @@
+import pickle
+import statistics
 import unittest
+from array import array
+from math import fsum as pyfsum
 
 from nalpy import math
 
@@ -248,6 +252,30 @@ class Rounding(unittest.TestCase):
         self.assertAlmostEqual(math.ceil_to_nearest_n(-6.001, 3), -6)
 
 
+    def test_to_digits(self):
+        self.assertEqual(math.round_to_digits(69.4269, 2), 69.43)
+        self.assertEqual(math.round_to_digits(-69.425, 2), -69.43)
+        self.assertEqual(math.round_to_digits(1234.5, -2), 1200.0)
+        self.assertEqual(math.floor_to_digits(69.4269, 2), 69.42)
+        self.assertEqual(math.floor_to_digits(-69.4269, 2), -69.43)
+        self.assertEqual(math.ceil_to_digits(69.4211, 2), 69.43)
+        self.assertEqual(math.ceil_to_digits(-69.4269, 2), -69.42)
+        self.assertEqual(str(math.round_to_digits(-0.001, 2)), "0.0")
+
+        self.assertEqual(math.round_to_nearest_n_to_digits(1.234, 5, 2), 1.25)
+        self.assertEqual(math.floor_to_nearest_n_to_digits(1.234, 5, 2), 1.2)
+        self.assertEqual(math.ceil_to_nearest_n_to_digits(1.201, 5, 2), 1.25)
+        self.assertEqual(math.round_to_nearest_n_to_digits(1.234, 0, 2), 0.0)
+
+    def test_nearest_n_types(self):
+        self.assertIsInstance(math.round_to_nearest_n(15.5, 3), int)
+        self.assertIsInstance(math.floor_to_nearest_n(15.5, 3), int)
+        self.assertIsInstance(math.ceil_to_nearest_n(15.5, 3), int)
+        self.assertEqual(math.round_to_nearest_n(15.5, 2.5), 15.0)
+        self.assertIsInstance(math.round_to_nearest_n(15.5, 2.5), float)
+        self.assertEqual(math.round_to_nearest_n(15.5, 0), 0)
+
+
 class Interpolation(unittest.TestCase):
     def test_lerp(self):
         self.assertAlmostEqual(math.lerp(0, 1, 0.5), 0.5)
@@ -305,5 +333,170 @@ class Arithmetic(unittest.TestCase):
         self.assertRaises(TypeError, lambda: math.kahan_sum([0.1, 0.2, 0.3, 0.4, object(), 0.6, 0.7])) # type: ignore
         self.assertRaises(TypeError, lambda: math.kahan_sum(None for _ in range(10))) # type: ignore
 
+    def test_sum(self):
+        self.assertEqual(math.sum([0.1 for _ in range(10)]), 1.0)
+        self.assertEqual(math.sum(0.1 for _ in range(10)), 1.0) # Iterable fallback
+        self.assertEqual(math.sum(array("d", [1e100, 1.0, -1e100, 1.0])), 2.0)
+        self.assertEqual(math.sum([]), 0.0)
+
+        values = array("d", (((-1) ** i) * (0.1 + i * 1e-7) for i in range(100_000))) # Spans multiple blocks
+        self.assertEqual(math.sum(values), pyfsum(values))
+
+        self.assertEqual(math.sum([1e308, 1e308]), float("inf"))
+        self.assertEqual(math.sum([float("-inf"), 1.0]), float("-inf"))
+        self.assertTrue(math.isnan(math.sum([float("inf"), float("-inf")])))
+        self.assertRaises(TypeError, lambda: math.sum([0.1, None])) # type: ignore
+        self.assertRaises(ValueError, lambda: math.sum(array("f", [0.1]))) # type: ignore
+
+    def test_statistics(self):
+        values = array("d", (1e9 + (i % 7) * 0.5 for i in range(50_000)))
+        self.assertAlmostEqual(math.mean(values), statistics.fmean(values))
+        self.assertAlmostEqual(math.variance(values), statistics.pvariance(values))
+        self.assertAlmostEqual(math.variance(values, ddof=1), statistics.variance(values))
+
+        self.assertEqual(math.mean([2.0, 4.0]), 3.0)
+        self.assertEqual(math.variance([2.0, 4.0]), 1.0)
+        self.assertRaises(ValueError, lambda: math.mean([]))
+        self.assertRaises(ValueError, lambda: math.variance([1.0], ddof=1))
+
+    def test_dot_norm(self):
+        self.assertEqual(math.dot([1.0, 2.0, 3.0], [4.0, 5.0, 6.0]), 32.0)
+        self.assertEqual(math.dot([1e100, 1.0, -1e100], [1.0, 1.0, 1.0]), 1.0)
+        self.assertEqual(math.norm([3.0, 4.0]), 5.0)
+        self.assertEqual(math.norm([]), 0.0)
+        self.assertEqual(math.norm([0.0, -0.0]), 0.0)
+
+        # Squares overflow or underflow without scaling
+        for scale in (1e200, 1e-200, 5e-324, 1e308):
+            values = [scale, scale, -scale]
+            self.assertEqual(math.norm(values), math.hypot(*values))
+        self.assertEqual(math.norm(array("d", [1e300] * 100_000)), math.hypot(*[1e300] * 100_000))
+
+        self.assertEqual(math.norm([1.0, float("inf"), float("nan")]), float("inf"))
+        self.assertTrue(math.isnan(math.norm([1.0, float("nan")])))
+        self.assertRaises(ValueError, lambda: math.dot([1.0], [1.0, 2.0]))
+
+    def test_compensated_stats(self):
+        values = [1e9 + (i % 7) * 0.5 for i in range(50_000)]
+
+        stats = math.CompensatedStats()
+        for v in values[:1000]:
+            stats.add(v)
+        stats.extend(array("d", values[1000:30_000]))
+        stats.merge(math.CompensatedStats(values[30_000:])) # Iterable fallback
+
+        self.assertEqual(stats.count, len(values))
+        self.assertEqual(stats.sum, pyfsum(values))
+        self.assertAlmostEqual(stats.mean, statistics.fmean(values))
+        self.assertAlmostEqual(stats.variance(), statistics.pvariance(values))
+        self.assertAlmostEqual(stats.variance(ddof=1), statistics.variance(values))
+
+        restored = pickle.loads(pickle.dumps(stats))
+        self.assertEqual((restored.count, restored.sum, restored.mean, restored.variance()), (stats.count, stats.sum, stats.mean, stats.variance()))
+
+        empty = math.CompensatedStats()
+        self.assertEqual(empty.count, 0)
+        self.assertEqual(empty.sum, 0.0)
+        self.assertRaises(ValueError, lambda: empty.mean)
+        self.assertRaises(ValueError, lambda: empty.variance())
+
+
+class Buffers(unittest.TestCase):
+    values: tuple[float, ...] = (-69.420, -1.0, 0.0, 0.25, 0.5, 0.75, 1.0, 3.5, 420.69)
+
+    def test_matches_scalar(self):
+        values = array("d", self.values)
+        for batched, scalar, args in (
+            (math.remap_many, math.remap, (values, -2.0, 4.0, 10.0, 20.0)),
+            (math.remap01_many, math.remap01, (values, -2.0, 4.0)),
+            (math.clamp_many, math.clamp, (values, -0.5, 2.0)),
+            (math.clamp01_many, math.clamp01, (values,)),
+            (math.delta_angle_many, math.delta_angle, (values, 42.0)),
+            (math.sign_many, math.sign, (values,)),
+            (math.lerp_many, math.lerp, (-5.0, 5.0, values)),
+            (math.lerp_unclamped_many, math.lerp_unclamped, (-5.0, 5.0, values)),
+            (math.inverse_lerp_many, math.inverse_lerp, (-5.0, 5.0, values)),
+            (math.smooth_step_many, math.smooth_step, (-5.0, 5.0, values)),
+            (math.move_towards_many, math.move_towards, (values, 0.5, 0.3)),
+            (math.ping_pong_many, math.ping_pong, (values, 2.0))
+        ):
+            expected = [scalar(*(a if isinstance(a, float) else a[i] for a in args)) for i in range(len(values))]
+            self.assertEqual(list(batched(*args)), expected, batched.__name__)
+
+    def test_broadcast(self):
+        a = array("d", [0.0, 10.0])
+        b = array("d", [10.0, 20.0])
+        self.assertEqual(list(math.lerp_many(a, b, 0.5)), [5.0, 15.0])
+        self.assertEqual(list(math.lerp_many(a, b, array("d", [0.0, 1.0]))), [0.0, 20.0])
+        self.assertEqual(list(math.lerp_many(a, b, memoryview(array("d", [0.5, 0.5])))), [5.0, 15.0])
+
+        self.assertRaises(ValueError, lambda: math.lerp_many(0.0, 1.0, 0.5))
+        self.assertRaises(ValueError, lambda: math.lerp_many(a, b, array("d", [0.5])))
+        self.assertRaises(ValueError, lambda: math.lerp_many(a, b, array("f", [0.5, 0.5])))
+
+    def test_out(self):
+        values = array("d", [-1.0, 0.5, 2.0])
+        out = array("d", [0.0, 0.0, 0.0])
+        self.assertIs(math.clamp01_many(values, out=out), out)
+        self.assertEqual(list(out), [0.0, 0.5, 1.0])
+        self.assertEqual(list(values), [-1.0, 0.5, 2.0])
+
+        math.clamp01_many(values, out=values) # In place
+        self.assertEqual(list(values), [0.0, 0.5, 1.0])
+
+        self.assertRaises(ValueError, lambda: math.clamp01_many(values, out=array("d", [0.0])))
+
+    def test_rounding(self):
+        values = array("d", self.values + (-0.001, 2.675, 1e300))
+        for batched, scalar, args in (
+            (math.round_to_nearest_n_many, math.round_to_nearest_n, (3.0,)),
+            (math.floor_to_nearest_n_many, math.floor_to_nearest_n, (0.25,)),
+            (math.ceil_to_nearest_n_many, math.ceil_to_nearest_n, (-2.0,)),
+            (math.round_to_digits_many, math.round_to_digits, (2,)),
+            (math.floor_to_digits_many, math.floor_to_digits, (-1,)),
+            (math.ceil_to_digits_many, math.ceil_to_digits, (1,)),
+            (math.round_to_nearest_n_to_digits_many, math.round_to_nearest_n_to_digits, (5, 2)),
+            (math.floor_to_nearest_n_to_digits_many, math.floor_to_nearest_n_to_digits, (5, 2)),
+            (math.ceil_to_nearest_n_to_digits_many, math.ceil_to_nearest_n_to_digits, (5, 2))
+        ):
+            expected = [float(scalar(v, *args)) for v in values]
+            self.assertEqual(list(batched(values, *args)), expected, batched.__name__)
+
+        self.assertEqual(list(math.round_to_nearest_n_many(values, 0)), [0.0] * len(values))
+        out = array("d", values)
+        self.assertIs(math.round_to_digits_many(out, 1, out=out), out)
+        self.assertEqual(out[0], -69.4)
+
+    def test_closest_furthest(self):
+        candidates = [3.0, -1.0, 7.5, 2.0, 7.5, -4.25, 0.0]
+        values = array("d", [-10.0, -1.0, 0.5, 1.0, 2.5, 5.0, 5.25, 100.0])
+        for batched, scalar in ((math.closest_many, math.closest), (math.furthest_many, math.furthest)):
+            expected = [scalar(v, candidates) for v in values]
+            self.assertEqual(list(batched(values, candidates)), expected)
+            self.assertEqual(list(batched(values, array("d", candidates))), expected)
+
+        sorted_values = math.SortedValues(candidates)
+        self.assertEqual(list(sorted_values), sorted(candidates))
+        self.assertEqual(len(sorted_values), len(candidates))
+        self.assertEqual(sorted_values[-1], 7.5)
+        for v in values:
+            self.assertEqual(abs(sorted_values.closest(v) - v), abs(math.closest(v, candidates) - v))
+            self.assertEqual(abs(sorted_values.furthest(v) - v), abs(math.furthest(v, candidates) - v))
+        self.assertEqual(list(sorted_values.closest_many(values)), [sorted_values.closest(v) for v in values])
+        self.assertEqual(list(sorted_values.furthest_many(values)), [sorted_values.furthest(v) for v in values])
+
+        # Ties go to the smaller candidate
+        self.assertEqual(sorted_values.closest(1.0), 0.0)
+        self.assertEqual(math.SortedValues([2.0, -2.0]).furthest(0.0), -2.0)
+
+        self.assertRaises(ValueError, lambda: math.closest_many(values, []))
+        self.assertRaises(ValueError, lambda: math.SortedValues([]))
+        self.assertRaises(ValueError, lambda: math.SortedValues([1.0, math.NAN]))
+        self.assertRaises(IndexError, lambda: sorted_values[7])
+
+        uninitialized = math.SortedValues.__new__(math.SortedValues)
+        self.assertEqual(list(uninitialized), [0.0])
+        self.assertEqual(uninitialized.closest(3.0), 0.0)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,179 @@
+import pickle
+import random
+import unittest
+from array import array
+
+from nalpy.math import Matrix3x2, Matrix4x4, Rect, Vector2, Vector2Array, Vector3, Vector3Array
+
+
+class TestMatrix3x2(unittest.TestCase):
+    def assertVectorAlmostEqual(self, a: Vector2, b: Vector2):
+        self.assertAlmostEqual(a.x, b.x)
+        self.assertAlmostEqual(a.y, b.y)
+
+    def test_basics(self):
+        m = Matrix3x2(1.0, 2.0, 3.0, 4.0, 5.0, 6.0)
+        self.assertEqual(m.to_tuple(), (1.0, 2.0, 3.0, 4.0, 5.0, 6.0))
+        self.assertEqual((m[0, 1], m[1, 0], m[2, 1]), (2.0, 3.0, 6.0))
+        self.assertRaises(IndexError, lambda: m[3, 0])
+        self.assertEqual(m.translation, Vector2(5.0, 6.0))
+        self.assertEqual(m.determinant, -2.0)
+        self.assertEqual(repr(m), "Matrix3x2(1.0, 2.0, 3.0, 4.0, 5.0, 6.0)")
+        self.assertEqual(hash(m), hash(Matrix3x2(*m.to_tuple())))
+        self.assertEqual(pickle.loads(pickle.dumps(m)), m)
+
+        self.assertTrue(Matrix3x2.identity.is_identity)
+        self.assertFalse(m.is_identity)
+        self.assertEqual(m * Matrix3x2.identity, m)
+        self.assertEqual(Matrix3x2.identity * m, m)
+
+        self.assertRaises(TypeError, lambda: m * None)
+        self.assertRaises(TypeError, lambda: m * 2.0)
+        self.assertNotEqual(m, None)
+        self.assertNotEqual(m, m.to_tuple())
+
+    def test_constructors(self):
+        p = Vector2(2.0, -3.0)
+        self.assertEqual(Matrix3x2.translate(Vector2(1.0, 1.0)).transform_point(p), Vector2(3.0, -2.0))
+        self.assertEqual(Matrix3x2.translate(Vector2(1.0, 1.0)).transform_vector(p), p)
+        self.assertEqual(Matrix3x2.scale(2.0).transform_point(p), Vector2(4.0, -6.0))
+        self.assertEqual(Matrix3x2.scale(Vector2(2.0, 0.5)).transform_point(p), Vector2(4.0, -1.5))
+        self.assertVectorAlmostEqual(Matrix3x2.rotate(90.0).transform_point(Vector2.right), Vector2.up)
+        self.assertVectorAlmostEqual(Matrix3x2.rotate(-90.0).transform_point(Vector2.right), Vector2.down)
+
+        trs = Matrix3x2.trs(Vector2(5.0, 6.0), 30.0, Vector2(2.0, 0.5))
+        composed = Matrix3x2.scale(Vector2(2.0, 0.5)) * Matrix3x2.rotate(30.0) * Matrix3x2.translate(Vector2(5.0, 6.0))
+        for a, b in zip(trs.to_tuple(), composed.to_tuple()):
+            self.assertAlmostEqual(a, b)
+
+    def test_composition_order(self):
+        # a * b applies a first
+        p = Vector2(1.0, 0.0)
+        move_then_scale = Matrix3x2.translate(Vector2(1.0, 0.0)) * Matrix3x2.scale(3.0)
+        scale_then_move = Matrix3x2.scale(3.0) * Matrix3x2.translate(Vector2(1.0, 0.0))
+        self.assertEqual(move_then_scale.transform_point(p), Vector2(6.0, 0.0))
+        self.assertEqual(scale_then_move.transform_point(p), Vector2(4.0, 0.0))
+
+    def test_inverse(self):
+        m = Matrix3x2.trs(Vector2(5.0, -6.0), 123.0, Vector2(2.0, 0.25))
+        p = Vector2(3.5, 7.25)
+        self.assertVectorAlmostEqual(m.inverse.transform_point(m.transform_point(p)), p)
+        for a, b in zip((m * m.inverse).to_tuple(), Matrix3x2.identity.to_tuple()):
+            self.assertAlmostEqual(a, b)
+        self.assertRaises(ValueError, lambda: Matrix3x2.scale(Vector2(1.0, 0.0)).inverse)
+
+    def test_transform_rect(self):
+        self.assertEqual(Matrix3x2.translate(Vector2(1.0, 2.0)).transform_rect(Rect(0.0, 0.0, 3.0, 4.0)), Rect(1.0, 2.0, 3.0, 4.0))
+        self.assertEqual(Matrix3x2.scale(-1.0).transform_rect(Rect(1.0, 1.0, 2.0, 2.0)), Rect(-3.0, -3.0, 2.0, 2.0))
+
+        rotated = Matrix3x2.rotate(45.0).transform_rect(Rect(-1.0, -1.0, 2.0, 2.0))
+        half_diagonal = 2.0 ** 0.5
+        for a, b in zip(rotated, (-half_diagonal, -half_diagonal, 2 * half_diagonal, 2 * half_diagonal)):
+            self.assertAlmostEqual(a, b)
+
+    def test_transform_points(self):
+        random.seed(69420)
+        m = Matrix3x2.trs(Vector2(5.0, -6.0), 33.0, Vector2(2.0, 0.25))
+        points = [Vector2(random.uniform(-100.0, 100.0), random.uniform(-100.0, 100.0)) for _ in range(100)]
+        packed = Vector2Array(points)
+
+        self.assertEqual(m.transform_points(packed).to_list(), [m.transform_point(p) for p in points])
+        self.assertEqual(m.transform_points(points).to_list(), [m.transform_point(p) for p in points])
+        self.assertEqual(m.transform_vectors(memoryview(packed)).to_list(), [m.transform_vector(p) for p in points])
+
+        self.assertIs(m.transform_points(packed, out=packed), packed) # In place
+        self.assertEqual(packed.to_list(), [m.transform_point(p) for p in points])
+
+        self.assertEqual(len(m.transform_points([])), 0)
+        self.assertRaises(ValueError, lambda: m.transform_points(packed, Vector2Array.zeros(1)))
+        self.assertRaises(ValueError, lambda: m.transform_points(memoryview(array("d", [1.0, 2.0, 3.0])).cast("B").cast("d", (1, 3))))
+
+
+class TestMatrix4x4(unittest.TestCase):
+    def assertMatrixAlmostEqual(self, a: Matrix4x4, b: Matrix4x4):
+        for x, y in zip(a.to_tuple(), b.to_tuple()):
+            self.assertAlmostEqual(x, y)
+
+    def assertVectorAlmostEqual(self, a: Vector3, b: Vector3):
+        self.assertAlmostEqual(a.x, b.x)
+        self.assertAlmostEqual(a.y, b.y)
+        self.assertAlmostEqual(a.z, b.z)
+
+    def test_basics(self):
+        values = tuple(float(i) for i in range(16))
+        m = Matrix4x4(*values)
+        self.assertEqual(m.to_tuple(), values)
+        self.assertEqual((m[0, 3], m[3, 0], m[2, 1]), (3.0, 12.0, 9.0))
+        self.assertRaises(IndexError, lambda: m[4, 0])
+        self.assertEqual(m.translation, Vector3(12.0, 13.0, 14.0))
+        self.assertEqual(m.transpose[0, 3], 12.0)
+        self.assertEqual(m.transpose.transpose, m)
+        self.assertEqual(pickle.loads(pickle.dumps(m)), m)
+        self.assertEqual(m * Matrix4x4.identity, m)
+        self.assertTrue(Matrix4x4.identity.is_identity)
+
+        self.assertRaises(TypeError, lambda: m * None)
+        self.assertRaises(TypeError, lambda: m * Matrix3x2.identity)
+        self.assertNotEqual(m, None)
+        self.assertNotEqual(m, Matrix3x2.identity)
+
+    def test_constructors(self):
+        p = Vector3(1.0, 2.0, 3.0)
+        self.assertEqual(Matrix4x4.translate(Vector3(1.0, 1.0, 1.0)).transform_point(p), Vector3(2.0, 3.0, 4.0))
+        self.assertEqual(Matrix4x4.translate(Vector3(1.0, 1.0, 1.0)).transform_vector(p), p)
+        self.assertEqual(Matrix4x4.scale(Vector3(2.0, 3.0, 4.0)).transform_point(p), Vector3(2.0, 6.0, 12.0))
+
+        # Counterclockwise rotations follow the right-hand rule
+        self.assertVectorAlmostEqual(Matrix4x4.rotate_x(90.0).transform_point(Vector3.up), Vector3.forward)
+        self.assertVectorAlmostEqual(Matrix4x4.rotate_y(90.0).transform_point(Vector3.forward), Vector3.right)
+        self.assertVectorAlmostEqual(Matrix4x4.rotate_z(90.0).transform_point(Vector3.right), Vector3.up)
+
+    def test_determinant(self):
+        def laplace(rows: list[list[float]]) -> float:
+            if len(rows) == 1:
+                return rows[0][0]
+            return sum((-1) ** c * rows[0][c] * laplace([row[:c] + row[c + 1:] for row in rows[1:]]) for c in range(len(rows)))
+
+        random.seed(69420)
+        for _ in range(20):
+            values = [random.uniform(-5.0, 5.0) for _ in range(16)]
+            self.assertAlmostEqual(Matrix4x4(*values).determinant, laplace([values[r * 4:r * 4 + 4] for r in range(4)]))
+        self.assertEqual(Matrix4x4.scale(Vector3(2.0, 3.0, 4.0)).determinant, 24.0)
+
+    def test_inverse(self):
+        random.seed(69420)
+        for _ in range(20):
+            m = Matrix4x4(*(random.uniform(-5.0, 5.0) for _ in range(16)))
+            self.assertMatrixAlmostEqual(m * m.inverse, Matrix4x4.identity)
+            self.assertMatrixAlmostEqual(m.inverse * m, Matrix4x4.identity)
+
+        self.assertRaises(ValueError, lambda: Matrix4x4.scale(Vector3(1.0, 0.0, 1.0)).inverse)
+
+    def test_projection(self):
+        # A matrix that copies z into w divides the point by its depth
+        perspective = Matrix4x4(
+            1.0, 0.0, 0.0, 0.0,
+            0.0, 1.0, 0.0, 0.0,
+            0.0, 0.0, 1.0, 1.0,
+            0.0, 0.0, 0.0, 0.0
+        )
+        self.assertEqual(perspective.transform_point(Vector3(4.0, 2.0, 2.0)), Vector3(2.0, 1.0, 1.0))
+        self.assertEqual(perspective.transform_points([Vector3(4.0, 2.0, 2.0)]).to_list(), [Vector3(2.0, 1.0, 1.0)])
+        self.assertEqual(perspective.transform_vector(Vector3(4.0, 2.0, 2.0)), Vector3(4.0, 2.0, 2.0))
+
+    def test_transform_points(self):
+        random.seed(69420)
+        m = Matrix4x4.scale(Vector3(2.0, 0.5, 1.0)) * Matrix4x4.rotate_y(33.0) * Matrix4x4.translate(Vector3(5.0, -6.0, 7.0))
+        points = [Vector3(random.uniform(-100.0, 100.0), random.uniform(-100.0, 100.0), random.uniform(-100.0, 100.0)) for _ in range(100)]
+        packed = Vector3Array(points)
+
+        self.assertEqual(m.transform_points(packed).to_list(), [m.transform_point(p) for p in points])
+        self.assertEqual(m.transform_vectors(points).to_list(), [m.transform_vector(p) for p in points])
+
+        self.assertIs(m.transform_points(packed, out=packed), packed) # In place
+        self.assertEqual(packed.to_list(), [m.transform_point(p) for p in points])
+        self.assertRaises(ValueError, lambda: m.transform_points(packed, Vector3Array.zeros(1)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+import math
+import random
+import unittest
+from array import array
+
+from nalpy.math import Path2, Vector2, Vector2Array
+
+
+def brute_force_closest(points: list[Vector2], point: Vector2) -> Vector2:
+    best = points[0]
+    for a, b in zip(points, points[1:]):
+        ab = b - a
+        sqr_length = Vector2.dot(ab, ab)
+        u = 0.0 if sqr_length == 0.0 else min(1.0, max(0.0, Vector2.dot(point - a, ab) / sqr_length))
+        candidate = a + ab * u
+        if Vector2.distance(point, candidate) < Vector2.distance(point, best):
+            best = candidate
+    return best
+
+
+class BasicFunctionality(unittest.TestCase):
+    def test_construct(self):
+        points = [Vector2(0.0, 0.0), Vector2(3.0, 0.0), Vector2(3.0, 4.0)]
+        for source in (points, [(0.0, 0.0), (3.0, 0.0), (3.0, 4.0)], Vector2Array(points), memoryview(Vector2Array(points))):
+            path = Path2(source)
+            self.assertEqual(list(path), points)
+
+        self.assertEqual(len(path), 3)
+        self.assertEqual(path[-1], Vector2(3.0, 4.0))
+        self.assertRaises(IndexError, lambda: path[3])
+        self.assertEqual(path.points.to_list(), points)
+        self.assertEqual(repr(Path2([Vector2(1.0, 2.0)])), "Path2([Vector2(1.0, 2.0)])")
+
+        self.assertRaises(ValueError, Path2, [])
+
+        uninitialized = Path2.__new__(Path2)
+        self.assertEqual(list(uninitialized), [Vector2.zero])
+        self.assertEqual(uninitialized.length, 0.0)
+        self.assertEqual(uninitialized.sample(0.5), Vector2.zero)
+        self.assertRaises(ValueError, Path2, memoryview(array("d", [1.0, 2.0, 3.0])).cast("B").cast("d", (1, 3)))
+
+    def test_lengths(self):
+        path = Path2([Vector2(0.0, 0.0), Vector2(3.0, 0.0), Vector2(3.0, 4.0), Vector2(3.0, 4.0)])
+        self.assertEqual(path.length, 7.0)
+        self.assertEqual(list(path.cumulative_lengths), [0.0, 3.0, 7.0, 7.0])
+        self.assertEqual(Path2([Vector2.one]).length, 0.0)
+
+        random.seed(69420)
+        points = [Vector2(random.uniform(-100.0, 100.0), random.uniform(-100.0, 100.0)) for _ in range(100)]
+        self.assertAlmostEqual(Path2(points).length, sum(Vector2.distance(a, b) for a, b in zip(points, points[1:])))
+
+
+class Sampling(unittest.TestCase):
+    path = Path2([Vector2(0.0, 0.0), Vector2(3.0, 0.0), Vector2(3.0, 3.0), Vector2(3.0, 3.0), Vector2(5.0, 3.0)])
+
+    def test_sample(self):
+        self.assertEqual(self.path.sample(0.0), Vector2(0.0, 0.0))
+        self.assertEqual(self.path.sample(0.25), Vector2(2.0, 0.0))
+        self.assertEqual(self.path.sample(0.375), Vector2(3.0, 0.0))
+        self.assertEqual(self.path.sample(0.5), Vector2(3.0, 1.0))
+        self.assertEqual(self.path.sample(0.875), Vector2(4.0, 3.0))
+        self.assertEqual(self.path.sample(1.0), Vector2(5.0, 3.0))
+
+        # Clamped
+        self.assertEqual(self.path.sample(-1.0), Vector2(0.0, 0.0))
+        self.assertEqual(self.path.sample(2.0), Vector2(5.0, 3.0))
+
+        # Degenerate paths
+        self.assertEqual(Path2([Vector2.one]).sample(0.5), Vector2.one)
+        self.assertEqual(Path2([Vector2.one, Vector2.one]).sample(0.5), Vector2.one)
+
+    def test_sample_many(self):
+        t = array("d", [i / 99 for i in range(100)])
+        self.assertEqual(self.path.sample_many(t).to_list(), [self.path.sample(x) for x in t])
+
+        out = Vector2Array.zeros(100)
+        self.assertIs(self.path.sample_many(t, out), out)
+        self.assertEqual(out.to_list(), [self.path.sample(x) for x in t])
+        self.assertRaises(ValueError, self.path.sample_many, t, Vector2Array.zeros(1))
+        self.assertRaises(ValueError, self.path.sample_many, 0.5)
+
+    def test_resample(self):
+        resampled = self.path.resample(9)
+        self.assertEqual(len(resampled), 9)
+        self.assertEqual(resampled[0], self.path[0])
+        self.assertEqual(resampled[-1], self.path[-1])
+        self.assertAlmostEqual(resampled.length, self.path.length)
+        points = list(resampled)
+        for a, b in zip(points, points[1:]):
+            self.assertAlmostEqual(Vector2.distance(a, b), 1.0)
+
+        self.assertRaises(ValueError, self.path.resample, 1)
+
+
+class Queries(unittest.TestCase):
+    def test_closest(self):
+        path = Path2([Vector2(0.0, 0.0), Vector2(4.0, 0.0), Vector2(4.0, 4.0)])
+        self.assertEqual(path.closest_point(Vector2(2.0, 1.0)), Vector2(2.0, 0.0))
+        self.assertEqual(path.closest_point(Vector2(6.0, 2.0)), Vector2(4.0, 2.0))
+        self.assertEqual(path.closest_point(Vector2(-1.0, -1.0)), Vector2(0.0, 0.0))
+        self.assertEqual(path.closest_point(Vector2(5.0, 9.0)), Vector2(4.0, 4.0))
+
+        self.assertEqual(path.closest_t(Vector2(2.0, -3.0)), 0.25)
+        self.assertEqual(path.closest_t(Vector2(6.0, 2.0)), 0.75)
+        self.assertEqual(path.closest_t(Vector2(9.0, 9.0)), 1.0)
+        self.assertEqual(Path2([Vector2.one]).closest_t(Vector2.zero), 0.0)
+        self.assertEqual(Path2([Vector2.one]).closest_point(Vector2.zero), Vector2.one)
+
+    def test_closest_random(self):
+        random.seed(69420)
+        points = [Vector2(random.uniform(-100.0, 100.0), random.uniform(-100.0, 100.0)) for _ in range(50)]
+        path = Path2(points)
+        for _ in range(100):
+            query = Vector2(random.uniform(-150.0, 150.0), random.uniform(-150.0, 150.0))
+            closest = path.closest_point(query)
+            expected = brute_force_closest(points, query)
+            self.assertAlmostEqual(Vector2.distance(query, closest), Vector2.distance(query, expected))
+
+            sampled = path.sample(path.closest_t(query))
+            self.assertAlmostEqual(sampled.x, closest.x)
+            self.assertAlmostEqual(sampled.y, closest.y)
+
+
+class Simplify(unittest.TestCase):
+    def test_collinear(self):
+        path = Path2([Vector2(float(i), 0.0) for i in range(10)])
+        self.assertEqual(list(path.simplify(0.0)), [Vector2(0.0, 0.0), Vector2(9.0, 0.0)])
+
+    def test_tolerance(self):
+        path = Path2([Vector2(0.0, 0.0), Vector2(1.0, 0.1), Vector2(2.0, -0.1), Vector2(3.0, 5.0), Vector2(4.0, 6.0), Vector2(5.0, 7.0)])
+        self.assertEqual(list(path.simplify(0.5)), [Vector2(0.0, 0.0), Vector2(2.0, -0.1), Vector2(3.0, 5.0), Vector2(5.0, 7.0)])
+        self.assertEqual(len(path.simplify(0.0)), 5) # The last three points are collinear
+        self.assertEqual(list(path.simplify(100.0)), [Vector2(0.0, 0.0), Vector2(5.0, 7.0)])
+
+        self.assertEqual(list(Path2([Vector2.one]).simplify(1.0)), [Vector2.one])
+        self.assertRaises(ValueError, path.simplify, -1.0)
+        self.assertRaises(ValueError, path.simplify, math.nan)
+
+    def test_circle(self):
+        # Every removed point must be within tolerance of the simplified path
+        circle = [Vector2(math.cos(i / 100.0), math.sin(i / 100.0)) for i in range(629)]
+        simplified = Path2(circle).simplify(0.01)
+        self.assertLess(len(simplified), 50)
+        self.assertEqual(simplified[0], circle[0])
+        self.assertEqual(simplified[-1], circle[-1])
+        for point in circle:
+            self.assertLessEqual(Vector2.distance(point, simplified.closest_point(point)), 0.01)
+
+        # Long paths don't overflow the stack
+        zigzag = Path2([Vector2(float(i), float(i % 2)) for i in range(10_000)])
+        self.assertEqual(len(zigzag.simplify(0.1)), 10_000)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,194 @@
+import pickle
+import random
+import unittest
+from array import array
+
+from nalpy.math import Matrix4x4, Quaternion, QuaternionArray, Vector3
+
+
+def random_rotation() -> Quaternion:
+    return Quaternion.from_euler(Vector3(random.uniform(-180.0, 180.0), random.uniform(-180.0, 180.0), random.uniform(-180.0, 180.0)))
+
+
+class TestQuaternion(unittest.TestCase):
+    def assertVectorAlmostEqual(self, a: Vector3, b: Vector3):
+        self.assertAlmostEqual(a.x, b.x)
+        self.assertAlmostEqual(a.y, b.y)
+        self.assertAlmostEqual(a.z, b.z)
+
+    def assertSameRotation(self, a: Quaternion, b: Quaternion):
+        # q and -q represent the same rotation
+        self.assertAlmostEqual(abs(Quaternion.dot(a, b)), 1.0)
+
+    def setUp(self):
+        random.seed(69420)
+
+    def test_basics(self):
+        q = Quaternion(1.0, 2.0, 3.0, 4.0)
+        self.assertEqual(q.to_tuple(), (1.0, 2.0, 3.0, 4.0))
+        self.assertEqual(tuple(q), (1.0, 2.0, 3.0, 4.0))
+        self.assertEqual((q[0], q[3], len(q)), (1.0, 4.0, 4))
+        self.assertRaises(IndexError, lambda: q[4])
+        self.assertEqual(repr(q), "Quaternion(1.0, 2.0, 3.0, 4.0)")
+        self.assertEqual(hash(q), hash((1.0, 2.0, 3.0, 4.0)))
+        self.assertEqual(pickle.loads(pickle.dumps(q)), q)
+        self.assertEqual(-q, Quaternion(-1.0, -2.0, -3.0, -4.0))
+        self.assertEqual(Quaternion.dot(q, q), 30.0)
+        self.assertAlmostEqual(q.normalized.magnitude, 1.0)
+        self.assertEqual(Quaternion(0.0, 0.0, 0.0, 0.0).normalized, Quaternion.identity)
+
+    def test_rotation_direction(self):
+        # Same directions as the Matrix4x4 rotations
+        self.assertVectorAlmostEqual(Quaternion.from_axis_angle(Vector3.right, 90.0) * Vector3.up, Vector3.forward)
+        self.assertVectorAlmostEqual(Quaternion.from_axis_angle(Vector3.up, 90.0) * Vector3.forward, Vector3.right)
+        self.assertVectorAlmostEqual(Quaternion.from_axis_angle(Vector3.forward, 90.0) * Vector3.right, Vector3.up)
+        self.assertVectorAlmostEqual(Quaternion.from_axis_angle(Vector3(0.0, 5.0, 0.0), 90.0) * Vector3.forward, Vector3.right) # Axis is normalized
+        self.assertRaises(ValueError, Quaternion.from_axis_angle, Vector3.zero, 90.0)
+
+        for _ in range(20):
+            q = random_rotation()
+            v = Vector3(random.uniform(-10.0, 10.0), random.uniform(-10.0, 10.0), random.uniform(-10.0, 10.0))
+            self.assertVectorAlmostEqual(q * v, q.to_matrix().transform_point(v))
+
+    def test_multiplication(self):
+        a = Quaternion.from_axis_angle(Vector3.up, 90.0)
+        b = Quaternion.from_axis_angle(Vector3.right, 90.0)
+        v = Vector3(1.0, 2.0, 3.0)
+        self.assertVectorAlmostEqual((a * b) * v, a * (b * v)) # b first, then a
+        self.assertEqual(Quaternion.identity * a, a)
+
+        # Matrix composition order is reversed
+        m = (a * b).to_matrix()
+        expected = b.to_matrix() * a.to_matrix()
+        for x, y in zip(m.to_tuple(), expected.to_tuple()):
+            self.assertAlmostEqual(x, y)
+
+        self.assertRaises(TypeError, lambda: v * a)
+
+    def test_inverse(self):
+        for _ in range(20):
+            q = random_rotation()
+            self.assertSameRotation(q * q.inverse, Quaternion.identity)
+        self.assertEqual(Quaternion(0.0, 0.0, 2.0, 0.0).inverse, Quaternion(0.0, 0.0, -0.5, 0.0))
+        self.assertRaises(ValueError, lambda: Quaternion(0.0, 0.0, 0.0, 0.0).inverse)
+
+    def test_euler(self):
+        for _ in range(50):
+            euler = Vector3(random.uniform(-89.0, 89.0), random.uniform(-180.0, 180.0), random.uniform(-180.0, 180.0))
+            q = Quaternion.from_euler(euler)
+            expected = Quaternion.from_axis_angle(Vector3.up, euler.y) * Quaternion.from_axis_angle(Vector3.right, euler.x) * Quaternion.from_axis_angle(Vector3.forward, euler.z)
+            self.assertSameRotation(q, expected)
+
+            result = q.to_euler()
+            for a, b in zip(result, euler):
+                self.assertGreaterEqual(a, 0.0)
+                self.assertLess(a, 360.0)
+                self.assertAlmostEqual(a, b % 360.0, delta=1e-9)
+
+        self.assertEqual(Quaternion.identity.to_euler(), Vector3.zero)
+
+    def test_euler_gimbal_lock(self):
+        for x in (90.0, -90.0):
+            q = Quaternion.from_euler(Vector3(x, 10.0, 20.0))
+            result = q.to_euler()
+            self.assertEqual(result.z, 0.0)
+            self.assertAlmostEqual(result.x, x % 360.0)
+            self.assertSameRotation(Quaternion.from_euler(result), q)
+
+    def test_angle(self):
+        a = Quaternion.from_axis_angle(Vector3.up, 10.0)
+        b = Quaternion.from_axis_angle(Vector3.up, 130.0)
+        self.assertAlmostEqual(Quaternion.angle(a, b), 120.0)
+        self.assertAlmostEqual(Quaternion.angle(a, -b), 120.0)
+        self.assertEqual(Quaternion.angle(a, a), 0.0)
+
+    def test_slerp(self):
+        a = Quaternion.identity
+        b = Quaternion.from_axis_angle(Vector3.up, 120.0)
+        self.assertSameRotation(Quaternion.slerp(a, b, 0.0), a)
+        self.assertSameRotation(Quaternion.slerp(a, b, 1.0), b)
+        self.assertSameRotation(Quaternion.slerp(a, b, 2.0), b)
+        self.assertSameRotation(Quaternion.slerp_unclamped(a, b, 1.5), Quaternion.from_axis_angle(Vector3.up, 180.0))
+
+        # Constant angular velocity
+        for t in (0.1, 0.25, 0.5, 0.9):
+            self.assertAlmostEqual(Quaternion.angle(a, Quaternion.slerp(a, b, t)), 120.0 * t)
+            self.assertAlmostEqual(Quaternion.slerp(a, b, t).magnitude, 1.0)
+
+        # Shortest path
+        self.assertAlmostEqual(Quaternion.angle(a, Quaternion.slerp(a, -b, 0.5)), 60.0)
+
+        # Nearly identical rotations
+        c = Quaternion.from_axis_angle(Vector3.up, 1e-3)
+        self.assertAlmostEqual(Quaternion.angle(a, Quaternion.slerp(a, c, 0.5)), 0.5e-3)
+
+    def test_nlerp(self):
+        a = Quaternion.identity
+        b = Quaternion.from_axis_angle(Vector3.up, 120.0)
+        self.assertSameRotation(Quaternion.nlerp(a, b, 0.5), Quaternion.slerp(a, b, 0.5)) # Symmetric at the middle
+        self.assertAlmostEqual(Quaternion.nlerp(a, b, 0.3).magnitude, 1.0)
+        self.assertSameRotation(Quaternion.nlerp(a, b, -1.0), a)
+        self.assertAlmostEqual(Quaternion.angle(a, Quaternion.nlerp(a, -b, 0.5)), 60.0)
+
+
+class TestQuaternionBatch(unittest.TestCase):
+    def setUp(self):
+        random.seed(69420)
+        self.a = [random_rotation() for _ in range(100)]
+        self.b = [random_rotation() for _ in range(100)]
+        self.t = [random.uniform(-0.25, 1.25) for _ in range(100)]
+
+    def test_slerp_many(self):
+        expected = [Quaternion.slerp(a, b, t) for a, b, t in zip(self.a, self.b, self.t)]
+        result = Quaternion.slerp_many(QuaternionArray(self.a), QuaternionArray(self.b), array("d", self.t))
+        self.assertIsInstance(result, QuaternionArray)
+        self.assertEqual(result.to_list(), expected) # Bit-for-bit identical
+        self.assertEqual(Quaternion.slerp_many(self.a, self.b, array("d", self.t)).to_list(), expected)
+
+        self.assertEqual(Quaternion.slerp_many(self.a, Quaternion.identity, 0.5).to_list(), [Quaternion.slerp(a, Quaternion.identity, 0.5) for a in self.a])
+        self.assertEqual(Quaternion.slerp_many(Quaternion.identity, self.b[0], array("d", self.t)).to_list(), [Quaternion.slerp(Quaternion.identity, self.b[0], t) for t in self.t])
+
+    def test_nlerp_many(self):
+        expected = [Quaternion.nlerp(a, b, t) for a, b, t in zip(self.a, self.b, self.t)]
+        self.assertEqual(Quaternion.nlerp_many(self.a, self.b, array("d", self.t)).to_list(), expected)
+
+    def test_out(self):
+        expected = [Quaternion.slerp(a, b, 0.3) for a, b in zip(self.a, self.b)]
+        packed = QuaternionArray(self.a)
+        self.assertIs(Quaternion.slerp_many(packed, self.b, 0.3, out=packed), packed) # In place
+        self.assertEqual(packed.to_list(), expected)
+
+        self.assertRaises(ValueError, Quaternion.slerp_many, self.a, self.b, 0.3, QuaternionArray.zeros(1))
+        self.assertRaises(ValueError, Quaternion.slerp_many, self.a, self.b[:10], 0.3)
+        self.assertRaises(ValueError, Quaternion.slerp_many, Quaternion.identity, Quaternion.identity, 0.3)
+        self.assertEqual(len(Quaternion.slerp_many([], [], 0.5)), 0)
+
+    def test_array(self):
+        arr = QuaternionArray(self.a[:3])
+        self.assertEqual(len(arr), 3)
+        self.assertEqual(arr[-1], self.a[2])
+        self.assertEqual(list(arr), self.a[:3])
+        self.assertEqual(QuaternionArray.from_buffer(arr), arr)
+        self.assertEqual(Quaternion.from_buffer(arr), self.a[:3])
+        self.assertEqual(Quaternion.to_buffer(self.a[:3]), arr)
+        self.assertEqual(memoryview(arr).shape, (3, 4))
+
+        view = arr[1:]
+        view[0] = (0.0, 0.0, 0.0, 2.0)
+        self.assertEqual(arr[1], Quaternion(0.0, 0.0, 0.0, 2.0))
+        self.assertEqual(arr.normalized[1], Quaternion.identity)
+        self.assertEqual(arr.copy(), arr)
+
+        self.assertEqual(QuaternionArray.identity(2).to_list(), [Quaternion.identity, Quaternion.identity])
+        zeros = QuaternionArray.zeros(2)
+        zeros.normalize()
+        self.assertEqual(zeros, QuaternionArray.identity(2))
+        self.assertRaises(IndexError, lambda: arr[3])
+
+        # Re-initializing would free the memory that the view points into
+        self.assertRaises(RuntimeError, lambda: arr.__init__([]))
+        self.assertEqual(view[0], Quaternion(0.0, 0.0, 0.0, 2.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
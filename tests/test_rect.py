@@ -0,0 +1,273 @@
+import pickle
+import random
+import unittest
+
+from nalpy.math import GridOrder, MVector2, MVector2Int, Rect, RectArray, RectInt, RectIntArray, RectOffset, RectOffsetInt, Vector2, Vector2Array, Vector2Int, Vector2IntBuffer
+from nalpy.math import _Legacy_Rect, _Legacy_RectInt, _Legacy_RectOffset, _Legacy_RectOffsetInt # pyright: ignore [reportPrivateUsage]
+
+
+class TupleCompatibility(unittest.TestCase):
+    def test_tuple(self):
+        r = Rect(1.0, 2.0, 3.0, 4.0)
+        self.assertEqual(len(r), 4)
+        self.assertEqual(tuple(r), (1.0, 2.0, 3.0, 4.0))
+        self.assertEqual(r[0], 1.0)
+        self.assertEqual(r[-1], 4.0)
+        self.assertEqual(r[1:3], (2.0, 3.0))
+        self.assertRaises(IndexError, lambda: r[4])
+
+        x, y, w, h = RectInt(5, 6, 7, 8)
+        self.assertEqual((x, y, w, h), (5, 6, 7, 8))
+
+    def test_equals(self):
+        self.assertEqual(Rect(1.0, 2.0, 3.0, 4.0), Rect(1.0, 2.0, 3.0, 4.0))
+        self.assertNotEqual(Rect(1.0, 2.0, 3.0, 4.0), Rect(1.0, 2.0, 3.0, 5.0))
+        self.assertEqual(Rect(1.0, 2.0, 3.0, 4.0), (1.0, 2.0, 3.0, 4.0))
+        self.assertEqual((1, 2, 3, 4), RectInt(1, 2, 3, 4))
+        self.assertEqual(RectOffset(1.0, 2.0, 3.0, 4.0), _Legacy_RectOffset(1.0, 2.0, 3.0, 4.0))
+        self.assertNotEqual(RectOffsetInt(1, 2, 3, 4), (1, 2, 3))
+
+    def test_hash(self):
+        self.assertEqual(hash(Rect(1.0, 2.0, 3.0, 4.0)), hash((1.0, 2.0, 3.0, 4.0)))
+        self.assertEqual(hash(RectInt(1, 2, 3, 4)), hash(_Legacy_RectInt(1, 2, 3, 4)))
+        self.assertEqual(len({RectInt(1, 2, 3, 4), (1, 2, 3, 4)}), 1)
+
+    def test_namedtuple_helpers(self):
+        r = RectInt(1, 2, 3, 4)
+        self.assertEqual(RectInt._fields, _Legacy_RectInt._fields)
+        self.assertEqual(r._asdict(), _Legacy_RectInt(1, 2, 3, 4)._asdict())
+        self.assertEqual(r._replace(w=10), RectInt(1, 2, 10, 4))
+        self.assertRaises(ValueError, lambda: r._replace(z=10))
+        self.assertEqual(RectOffset(1.0, 2.0, 3.0, 4.0).to_float_dict(), {"left": 1.0, "right": 2.0, "top": 3.0, "bottom": 4.0})
+
+    def test_repr(self):
+        self.assertEqual(repr(Rect(1.0, 2.0, 3.0, 4.0)), "Rect(1.0, 2.0, 3.0, 4.0)")
+        self.assertEqual(repr(RectInt(1, 2, 3, 4)), "RectInt(1, 2, 3, 4)")
+        self.assertEqual(repr(RectOffsetInt(1, 2, 3, 4)), repr(_Legacy_RectOffsetInt(1, 2, 3, 4)))
+
+    def test_pickle(self):
+        for value in (Rect(1.5, 2.0, 3.0, 4.0), RectInt(1, 2, 3, 4), RectOffset(1.0, 2.0, 3.0, 4.0), RectOffsetInt(1, 2, 3, 4)):
+            self.assertEqual(pickle.loads(pickle.dumps(value)), value)
+
+
+class MatchesLegacy(unittest.TestCase):
+    rects: tuple[tuple[float, float, float, float], ...] = ((0.0, 0.0, 10.0, 5.0), (-2.5, 3.25, 4.0, 0.0), (1.0, 1.0, 1.0, 1.0), (9.0, 4.0, 3.0, 3.0))
+    points: tuple[Vector2, ...] = (Vector2(0.0, 0.0), Vector2(10.0, 5.0), Vector2(9.999, 4.999), Vector2(-1.0, 3.25), Vector2(1.5, 1.5))
+
+    def test_rect(self):
+        for values in self.rects:
+            new = Rect(*values)
+            old = _Legacy_Rect(*values)
+            for attr in ("center", "xcenter", "ycenter", "min", "xmin", "ymin", "max", "xmax", "ymax", "position", "size"):
+                self.assertEqual(getattr(new, attr), getattr(old, attr), attr)
+            self.assertEqual(new.to_int_tuple(), old.to_int_tuple())
+
+            for point in self.points:
+                self.assertEqual(new.contains(point), old.contains(point))
+                self.assertEqual(new.contains(MVector2(point.x, point.y)), old.contains(point))
+                self.assertEqual(Rect.normalized_to_point(new, point), _Legacy_Rect.normalized_to_point(old, point))
+                self.assertEqual(Rect.point_to_normalized(new, point), _Legacy_Rect.point_to_normalized(old, point))
+            for other in self.rects:
+                self.assertEqual(new.overlaps(Rect(*other)), old.overlaps(_Legacy_Rect(*other)))
+                self.assertEqual(new.overlaps(_Legacy_Rect(*other)), old.overlaps(_Legacy_Rect(*other)))
+
+        self.assertIs(Rect.zero(), Rect.zero())
+        self.assertEqual(Rect.from_center(Vector2(1.0, 1.0), Vector2(2.0, 4.0)), _Legacy_Rect.from_center(Vector2(1.0, 1.0), Vector2(2.0, 4.0)))
+        self.assertEqual(Rect.from_min_max_vectors(Vector2(1.0, 1.0), Vector2(2.0, 4.0)), Rect(1.0, 1.0, 1.0, 3.0))
+        self.assertEqual(Rect.from_pos(Vector2(1.0, 1.0), Vector2(2.0, 4.0)), Rect(1.0, 1.0, 2.0, 4.0))
+        self.assertEqual(Rect(0.5, 1.5, 2.5, -0.5).to_int_tuple(), (0, 2, 2, 0))
+
+    def test_rect_int(self):
+        for values in self.rects:
+            new = RectInt(*map(int, values))
+            old = _Legacy_RectInt(*map(int, values))
+            for attr in ("min", "xmin", "ymin", "max", "xmax", "ymax", "position", "size"):
+                self.assertEqual(getattr(new, attr), getattr(old, attr), attr)
+            self.assertEqual(list(new.all_positions_within), list(old.all_positions_within))
+            self.assertEqual(new.to_rect(), old.to_rect())
+
+            for point in self.points:
+                self.assertEqual(new.contains(Vector2Int.trunc(point)), old.contains(Vector2Int.trunc(point)))
+                self.assertEqual(new.contains(MVector2Int(*Vector2Int.trunc(point))), old.contains(Vector2Int.trunc(point)))
+                self.assertEqual(new.contains(point), old.contains(point))
+            for other in self.rects:
+                other_values = tuple(map(int, other))
+                self.assertEqual(new.overlaps(RectInt(*other_values)), old.overlaps(_Legacy_RectInt(*other_values)))
+                self.assertEqual(new.overlaps(Rect(*other)), old.overlaps(_Legacy_Rect(*other)))
+                self.assertEqual(new.clamped_to_bounds(RectInt(*other_values)), old.clamped_to_bounds(_Legacy_RectInt(*other_values)))
+
+        self.assertIs(RectInt.zero(), RectInt.zero())
+        self.assertEqual(RectInt.from_min_max_vectors(Vector2Int(1, 1), Vector2Int(2, 4)), RectInt(1, 1, 1, 3))
+
+    def test_offsets(self):
+        offset = RectOffset(1.0, 2.5, 3.0, 0.5)
+        old_offset = _Legacy_RectOffset(1.0, 2.5, 3.0, 0.5)
+        self.assertEqual((offset.horizontal, offset.vertical), (old_offset.horizontal, old_offset.vertical))
+        self.assertEqual(offset.to_int_tuple(), old_offset.to_int_tuple())
+
+        offset_int = RectOffsetInt(1, 2, 3, 4)
+        old_offset_int = _Legacy_RectOffsetInt(1, 2, 3, 4)
+        self.assertEqual(offset_int.to_rect_offset(), old_offset_int.to_rect_offset())
+        self.assertEqual(offset_int.to_int_tuple(), old_offset_int.to_int_tuple())
+
+        for values in self.rects:
+            self.assertEqual(offset.add(Rect(*values)), old_offset.add(_Legacy_Rect(*values)))
+            self.assertEqual(offset.remove(Rect(*values)), old_offset.remove(_Legacy_Rect(*values)))
+
+            int_values = tuple(map(int, values))
+            self.assertEqual(offset_int.add(RectInt(*int_values)), old_offset_int.add(_Legacy_RectInt(*int_values)))
+            self.assertEqual(offset_int.remove(RectInt(*int_values)), old_offset_int.remove(_Legacy_RectInt(*int_values)))
+
+
+class GridIteration(unittest.TestCase):
+    def positions(self, rect: RectInt, order: GridOrder) -> list[tuple[int, int]]:
+        return [(v.x - rect.x, v.y - rect.y) for v in rect.iter_positions(order)]
+
+    def test_orders(self):
+        rect = RectInt(10, -5, 2, 2)
+        self.assertEqual(self.positions(rect, GridOrder.ROW_MAJOR), [(0, 0), (1, 0), (0, 1), (1, 1)])
+        self.assertEqual(self.positions(rect, GridOrder.COLUMN_MAJOR), [(0, 0), (0, 1), (1, 0), (1, 1)])
+        self.assertEqual(self.positions(rect, GridOrder.MORTON), [(0, 0), (1, 0), (0, 1), (1, 1)])
+        self.assertEqual(self.positions(rect, GridOrder.HILBERT), [(0, 0), (0, 1), (1, 1), (1, 0)])
+
+        self.assertEqual(
+            self.positions(RectInt(0, 0, 4, 4), GridOrder.HILBERT),
+            [(0, 0), (1, 0), (1, 1), (0, 1), (0, 2), (0, 3), (1, 3), (1, 2), (2, 2), (2, 3), (3, 3), (3, 2), (3, 1), (2, 1), (2, 0), (3, 0)]
+        )
+        self.assertEqual(self.positions(RectInt(0, 0, 4, 2), GridOrder.MORTON), [(0, 0), (1, 0), (0, 1), (1, 1), (2, 0), (3, 0), (2, 1), (3, 1)])
+        self.assertEqual(self.positions(RectInt(0, 0, 3, 2), GridOrder.HILBERT), [(0, 0), (1, 0), (1, 1), (0, 1), (2, 1), (2, 0)]) # The 4x4 curve without the cells outside of the rect
+
+        self.assertEqual(list(rect.all_positions_within), list(rect.iter_positions()))
+        self.assertEqual(list(rect.iter_positions(1)), list(rect.iter_positions(GridOrder.COLUMN_MAJOR)))
+        self.assertRaises(ValueError, lambda: rect.iter_positions(4))
+        self.assertRaises(TypeError, lambda: rect.iter_positions("hilbert"))
+
+    def test_every_cell_once(self):
+        for w, h in ((1, 1), (7, 3), (1, 9), (16, 16), (33, 5)):
+            rect = RectInt(-3, 4, w, h)
+            expected = sorted((x, y) for x in range(w) for y in range(h))
+            for order in GridOrder:
+                cells = self.positions(rect, order)
+                self.assertEqual(sorted(cells), expected, order)
+
+        cells = self.positions(RectInt(0, 0, 32, 32), GridOrder.HILBERT)
+        for (ax, ay), (bx, by) in zip(cells, cells[1:]):
+            self.assertEqual(abs(ax - bx) + abs(ay - by), 1) # Consecutive cells are neighbours
+
+    def test_empty(self):
+        for rect in (RectInt(0, 0, 0, 5), RectInt(0, 0, 5, 0), RectInt(0, 0, -2, 3)):
+            for order in GridOrder:
+                self.assertEqual(list(rect.iter_positions(order)), [])
+                self.assertEqual(len(rect.positions_to_buffer(order)), 0)
+
+    def test_iterator(self):
+        it = RectInt(0, 0, 3, 2).iter_positions()
+        self.assertIs(iter(it), it)
+        self.assertEqual(it.__length_hint__(), 6)
+        self.assertEqual(next(it), Vector2Int(0, 0))
+        self.assertEqual(it.__length_hint__(), 5)
+        self.assertEqual(len(list(it)), 5)
+        self.assertRaises(StopIteration, lambda: next(it))
+
+    def test_buffer(self):
+        rect = RectInt(-2, 3, 5, 4)
+        for order in GridOrder:
+            buffer = rect.positions_to_buffer(order)
+            self.assertIsInstance(buffer, Vector2IntBuffer)
+            self.assertEqual(buffer.to_list(), list(rect.iter_positions(order)))
+
+        out = Vector2IntBuffer.zeros(20)
+        self.assertIs(rect.positions_to_buffer(GridOrder.HILBERT, out), out)
+        self.assertEqual(out, rect.positions_to_buffer(GridOrder.HILBERT))
+        self.assertRaises(ValueError, lambda: rect.positions_to_buffer(GridOrder.ROW_MAJOR, Vector2IntBuffer.zeros(19)))
+
+    def test_too_many_cells(self):
+        huge = RectInt(0, 0, 2 ** 32, 2 ** 32) # w * h doesn't fit into a 64-bit integer
+        for order in GridOrder:
+            self.assertRaises(OverflowError, lambda: huge.positions_to_buffer(order))
+            self.assertRaises(OverflowError, lambda: huge.positions_to_buffer(order, Vector2IntBuffer.zeros(0)))
+            self.assertRaises(OverflowError, lambda: huge.iter_positions(order))
+        self.assertRaises(OverflowError, lambda: huge.all_positions_within)
+
+
+class RectArrays(unittest.TestCase):
+    def test_container(self):
+        arr = RectIntArray([RectInt(0, 0, 10, 10), (5, 5, 10, 10)])
+        self.assertEqual(len(arr), 2)
+        self.assertEqual(arr[-1], RectInt(5, 5, 10, 10))
+        self.assertEqual(memoryview(arr).shape, (2, 4))
+        self.assertEqual(memoryview(arr).format, "q")
+        self.assertEqual(RectIntArray.from_buffer(arr), arr)
+
+        view = arr[1:]
+        view[0] = RectInt(1, 2, 3, 4)
+        self.assertEqual(arr[1], RectInt(1, 2, 3, 4))
+        self.assertEqual(RectArray([(0.5, 0.5, 1.0, 2.0)]).to_list(), [Rect(0.5, 0.5, 1.0, 2.0)])
+
+        # Re-initializing would free the memory that the view points into
+        self.assertRaises(RuntimeError, lambda: arr.__init__([]))
+        self.assertRaises(RuntimeError, lambda: RectArray.zeros(1).__init__([]))
+        self.assertEqual(view[0], RectInt(1, 2, 3, 4))
+
+    def test_intersect_and_union(self):
+        a = RectIntArray([RectInt(0, 0, 10, 10), RectInt(5, 5, 10, 10), RectInt(20, 20, 1, 1)])
+        bounds = RectInt(2, 2, 5, 5)
+        self.assertEqual(RectIntArray.intersect(a, bounds).to_list(), [RectInt(2, 2, 5, 5), RectInt(5, 5, 2, 2), RectInt(20, 20, 0, 0)])
+        self.assertEqual(RectIntArray.union(a, bounds).to_list(), [RectInt(0, 0, 10, 10), RectInt(2, 2, 13, 13), RectInt(2, 2, 19, 19)])
+        self.assertEqual(RectIntArray.union(a, RectInt(-5, -5, 0, 3)), a) # Empty rects are ignored
+
+        out = a.copy()
+        self.assertIs(RectIntArray.intersect(out, bounds, out), out)
+        self.assertEqual(out, RectIntArray.intersect(a, bounds))
+        self.assertRaises(ValueError, lambda: RectIntArray.intersect(a, a[:2]))
+
+        b = RectArray([Rect(0.0, 0.0, 1.0, 1.0)])
+        self.assertEqual(RectArray.intersect(b, Rect(0.5, 0.25, 2.0, 2.0))[0], Rect(0.5, 0.25, 0.5, 0.75))
+
+    def test_clip_to(self):
+        rects = [RectInt(-5, -5, 10, 10), RectInt(50, 50, 10, 10), RectInt(90, 10, 20, 5)]
+        clipped = RectIntArray.clip_to(rects, RectInt(0, 0, 100, 100))
+        self.assertEqual(clipped.to_list(), [RectInt(0, 0, 5, 5), RectInt(50, 50, 10, 10), RectInt(90, 10, 10, 5)])
+        self.assertEqual(len(RectIntArray.clip_to(rects, RectInt(200, 200, 10, 10))), 0)
+
+    def test_queries(self):
+        rects = RectArray([Rect(0.0, 0.0, 1.0, 1.0), Rect(5.0, 5.0, 2.0, 2.0), Rect(0.0, 0.0, -1.0, 1.0)])
+        self.assertEqual(list(RectArray.area(rects)), [1.0, 4.0, 0.0])
+        self.assertEqual(RectArray.total_area(rects), 5.0)
+        self.assertEqual(list(RectArray.contains_points(rects, Vector2(0.5, 0.5))), [1, 0, 0])
+        self.assertEqual(list(RectArray.contains_points(rects, Vector2Array([(1.0, 0.5), (6.0, 6.0), (0.0, 0.0)]))), [0, 1, 0])
+        self.assertEqual(list(RectIntArray.contains_points([RectInt(0, 0, 2, 2)], Vector2IntBuffer([(1, 1)]))), [1])
+
+    def test_overlaps_any(self):
+        rng = random.Random(1)
+        def random_rect():
+            return RectInt(rng.randint(0, 50), rng.randint(0, 50), rng.randint(-2, 12), rng.randint(-2, 12))
+
+        for _ in range(100):
+            rects = [random_rect() for _ in range(20)]
+            others = [random_rect() for _ in range(rng.randint(0, 10))]
+            expected = [any(r.overlaps(o) for o in others) for r in rects]
+            self.assertEqual([bool(b) for b in RectIntArray.overlaps_any(rects, others)], expected)
+            self.assertEqual(
+                [bool(b) for b in RectArray.overlaps_any([r.to_rect() for r in rects], [o.to_rect() for o in others])],
+                expected
+            )
+
+    def test_merge_overlapping(self):
+        merged = RectIntArray.merge_overlapping([RectInt(0, 0, 10, 10), RectInt(5, 5, 10, 10), RectInt(20, 20, 1, 1), RectInt(3, 3, 0, 5)])
+        self.assertEqual(merged.to_list(), [RectInt(0, 0, 15, 15), RectInt(20, 20, 1, 1)])
+
+        rng = random.Random(2)
+        for _ in range(50):
+            rects = [RectInt(rng.randint(0, 40), rng.randint(0, 40), rng.randint(-1, 10), rng.randint(-1, 10)) for _ in range(30)]
+            merged = RectIntArray.merge_overlapping(rects).to_list()
+            for i, a in enumerate(merged):
+                for b in merged[i + 1:]:
+                    self.assertFalse(a.overlaps(b))
+            for r in rects: # Every covered cell stays covered
+                for p in r.iter_positions():
+                    self.assertTrue(any(m.contains(p) for m in merged))
+
+
+if __name__ == '__main__':
+    unittest.main()
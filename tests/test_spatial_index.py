@@ -0,0 +1,142 @@
+import random
+import unittest
+
+from nalpy.math import QuadTree, Rect, RectInt, SpatialHash, SpatialIndex, Vector2, Vector2Int
+
+
+def _distance(shape: Rect | Vector2, p: Vector2) -> float:
+    if isinstance(shape, Vector2):
+        return Vector2.distance(shape, p)
+    dx = max(shape.x - p.x, 0.0, p.x - shape.xmax)
+    dy = max(shape.y - p.y, 0.0, p.y - shape.ymax)
+    return (dx * dx + dy * dy) ** 0.5
+
+def _overlaps(query: Rect, shape: Rect | Vector2) -> bool:
+    if isinstance(shape, Vector2):
+        return query.contains(shape)
+    return query.overlaps(shape)
+
+def _contains(shape: Rect | Vector2, p: Vector2) -> bool:
+    if isinstance(shape, Vector2):
+        return shape == p
+    return shape.contains(p)
+
+
+class _SpatialIndexTests:
+    def create(self) -> SpatialIndex:
+        raise NotImplementedError()
+
+    def setUp(self):
+        rng = random.Random(69420)
+        self.shapes: dict[int, Rect | Vector2] = {}
+        for i in range(1000):
+            x = rng.uniform(-100.0, 100.0)
+            y = rng.uniform(-100.0, 100.0)
+            if i % 3 == 0:
+                self.shapes[i] = Vector2(x, y)
+            elif i % 50 == 1: # Large and partially outside of the quadtree bounds
+                self.shapes[i] = Rect(x, y, rng.uniform(0.0, 150.0), rng.uniform(0.0, 150.0))
+            else:
+                self.shapes[i] = Rect(x, y, rng.uniform(0.0, 5.0), rng.uniform(0.0, 5.0))
+
+        self.index = self.create()
+        self.index.insert_many(self.shapes.items())
+
+        self.queries = [Rect(rng.uniform(-120.0, 120.0), rng.uniform(-120.0, 120.0), rng.uniform(0.0, 30.0), rng.uniform(0.0, 30.0)) for _ in range(50)]
+        self.points = [Vector2(rng.uniform(-120.0, 120.0), rng.uniform(-120.0, 120.0)) for _ in range(50)]
+
+    def assertMatchesBruteForce(self):
+        self.assertEqual(len(self.index), len(self.shapes))
+        for q in self.queries:
+            self.assertEqual(sorted(self.index.query_rect(q)), sorted(k for k, s in self.shapes.items() if _overlaps(q, s)))
+        for p in self.points:
+            self.assertEqual(sorted(self.index.query_point(p)), sorted(k for k, s in self.shapes.items() if _contains(s, p)))
+            self.assertEqual(sorted(self.index.query_radius(p, 10.0)), sorted(k for k, s in self.shapes.items() if _distance(s, p) <= 10.0))
+
+            nearest = self.index.nearest(p, 10)
+            expected = sorted(_distance(s, p) for s in self.shapes.values())[:10]
+            self.assertEqual(len(nearest), len(expected))
+            for key, distance in zip(nearest, expected):
+                self.assertAlmostEqual(_distance(self.shapes[key], p), distance)
+
+    def test_queries(self):
+        self.assertMatchesBruteForce()
+
+    def test_remove_and_update(self):
+        rng = random.Random(1234)
+        for key in range(0, 1000, 4):
+            self.index.remove(key)
+            del self.shapes[key]
+        for key in range(1, 1000, 4):
+            shape = Rect(rng.uniform(-100.0, 100.0), rng.uniform(-100.0, 100.0), 2.0, 2.0)
+            self.index.update(key, shape)
+            self.shapes[key] = shape
+        self.assertMatchesBruteForce()
+
+        self.assertRaises(KeyError, self.index.remove, 0)
+        self.assertRaises(KeyError, self.index.update, 0, Vector2.zero)
+
+    def test_container(self):
+        self.assertIn(5, self.index)
+        self.assertNotIn(-1, self.index)
+        self.assertEqual(set(self.index), set(self.shapes))
+        self.assertIs(self.index.get(5), self.shapes[5])
+        self.assertRaises(KeyError, self.index.get, -1)
+
+        self.index.insert("a", RectInt(1, 2, 3, 4))
+        self.index.insert("a", Vector2Int(5, 6)) # Replaces
+        self.assertEqual(self.index.get("a"), Vector2Int(5, 6))
+        self.assertIn("a", self.index.query_point(Vector2Int(5, 6)))
+
+        self.index.clear()
+        self.assertEqual(len(self.index), 0)
+        self.assertEqual(self.index.query_rect(Rect(-1000.0, -1000.0, 2000.0, 2000.0)), [])
+        self.assertEqual(self.index.nearest(Vector2.zero, 5), [])
+
+    def test_edges(self):
+        index = self.create()
+        index.insert("rect", Rect(0.0, 0.0, 10.0, 10.0))
+        index.insert("point", Vector2(10.0, 10.0))
+        index.insert("huge", Rect(-1e300, -1e300, 2e300, 2e300))
+        index.insert("inf", Rect(0.0, 0.0, float("inf"), 1.0))
+
+        # Half-open like Rect.overlaps and Rect.contains
+        self.assertEqual(sorted(index.query_rect(Rect(10.0, 10.0, 1.0, 1.0))), ["huge", "point"])
+        self.assertEqual(sorted(index.query_point(Vector2(0.0, 0.0))), ["huge", "inf", "rect"])
+        self.assertEqual(sorted(index.query_point(Vector2(10.0, 10.0))), ["huge", "point"])
+        self.assertEqual(index.nearest(Vector2(10.0, 11.0), 4)[-1], "inf")
+        self.assertEqual(len(index.query_rect(Rect(-1e308, -1e308, 1.7e308, 1.7e308))), 4)
+
+        self.assertRaises(TypeError, index.insert, "x", (1.0, 2.0, 3.0, 4.0))
+        self.assertRaises(ValueError, index.query_radius, Vector2.zero, -1.0)
+        self.assertRaises(ValueError, index.nearest, Vector2.zero, -1)
+
+
+class TestQuadTree(_SpatialIndexTests, unittest.TestCase):
+    def create(self) -> SpatialIndex:
+        return QuadTree(Rect(-100.0, -100.0, 200.0, 200.0), max_items=4)
+
+class TestSpatialHash(_SpatialIndexTests, unittest.TestCase):
+    def create(self) -> SpatialIndex:
+        return SpatialHash(8.0)
+
+class TestSpatialIndex(unittest.TestCase):
+    def test_abstract(self):
+        self.assertRaises(TypeError, SpatialIndex)
+        self.assertRaises(TypeError, lambda: SpatialIndex.__new__(SpatialIndex))
+        self.assertRaises(TypeError, type("Subclass", (SpatialIndex,), {}))
+        self.assertIsInstance(type("Subclass", (QuadTree,), {})(Rect.zero()), SpatialIndex)
+        self.assertRaises(ValueError, SpatialHash, 0.0)
+        self.assertRaises(ValueError, QuadTree, Rect.zero(), max_items=0)
+
+    def test_uninitialized(self):
+        for index in (QuadTree.__new__(QuadTree), SpatialHash.__new__(SpatialHash)):
+            index.insert(1, Vector2(0.0, 0.0))
+            index.insert(2, Rect(5.0, 5.0, 1.0, 1.0))
+            self.assertEqual(index.query_point(Vector2(0.0, 0.0)), [1])
+            self.assertEqual(sorted(index.query_rect(Rect(-10.0, -10.0, 20.0, 20.0))), [1, 2])
+            self.assertEqual(index.nearest(Vector2(5.0, 5.0)), [2])
+
+
+if __name__ == "__main__":
+    unittest.main()
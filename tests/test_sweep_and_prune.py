@@ -0,0 +1,104 @@
+import random
+import unittest
+
+from nalpy.math import Rect, RectInt, SweepAndPrune
+
+
+def _pairs(rects: dict[int, Rect]) -> set[frozenset[int]]:
+    keys = list(rects)
+    return {frozenset((a, b)) for i, a in enumerate(keys) for b in keys[i + 1:] if rects[a].overlaps(rects[b])}
+
+
+class TestSweepAndPrune(unittest.TestCase):
+    def setUp(self):
+        self.rng = random.Random(69420)
+        self.rects: dict[int, Rect] = {}
+        self.sap = SweepAndPrune()
+        self.known: set[frozenset[int]] = set()
+
+    def random_rect(self) -> Rect:
+        # Integer coordinates so that touching edges are common, some negative sizes
+        return Rect(float(self.rng.randint(0, 60)), float(self.rng.randint(0, 60)), float(self.rng.randint(-3, 10)), float(self.rng.randint(-3, 10)))
+
+    def assertMatchesBruteForce(self):
+        began, ended = self.sap.pop_events()
+        for pair in ended:
+            self.assertIn(frozenset(pair), self.known)
+            self.known.remove(frozenset(pair))
+        for pair in began:
+            self.assertNotIn(frozenset(pair), self.known)
+            self.known.add(frozenset(pair))
+
+        expected = _pairs(self.rects)
+        self.assertEqual(self.known, expected)
+        self.assertEqual({frozenset(pair) for pair in self.sap.pairs()}, expected)
+
+    def test_events(self):
+        for count in (200, 1, 5): # Bulk insertion rebuilds, small insertions are sorted in
+            for _ in range(count):
+                key = self.rng.randrange(10_000)
+                self.rects[key] = self.random_rect()
+                self.sap.insert(key, self.rects[key])
+            self.assertMatchesBruteForce()
+
+        for _ in range(30):
+            for key, r in self.rects.items():
+                self.rects[key] = Rect(r.x + self.rng.randint(-2, 2), r.y + self.rng.randint(-2, 2), r.w, r.h)
+            self.sap.update_many(self.rects.items())
+            for key in self.rng.sample(list(self.rects), 3):
+                self.sap.remove(key)
+                del self.rects[key]
+            for _ in range(3):
+                key = self.rng.randrange(10_000, 20_000)
+                self.rects[key] = self.random_rect()
+                self.sap.insert(key, self.rects[key])
+            self.assertMatchesBruteForce()
+
+        # Batch despawn, removed slots are reused only after the next flush
+        for key in self.rng.sample(list(self.rects), len(self.rects) // 2):
+            self.sap.remove(key)
+            del self.rects[key]
+        for _ in range(10):
+            key = self.rng.randrange(20_000, 30_000)
+            self.rects[key] = self.random_rect()
+            self.sap.insert(key, self.rects[key])
+        self.assertMatchesBruteForce()
+
+    def test_edges(self):
+        self.sap.insert("a", Rect(0.0, 0.0, 1.0, 1.0))
+        self.sap.insert("b", Rect(1.0, 0.0, 1.0, 1.0)) # Touching
+        self.sap.insert("c", Rect(0.5, 0.5, 0.0, 0.0)) # Zero-sized, inside of a
+        self.sap.insert("d", Rect(1.0, 2.0, -1.0, -1.5)) # Negative size, not normalized like in Rect.overlaps
+        self.sap.insert("e", Rect(-20.0, -20.0, 40.0, 40.0)) # Spans d on both axes
+        self.assertEqual(sorted(map(sorted, self.sap.pairs())), [["a", "c"], ["a", "e"], ["b", "e"], ["c", "e"], ["d", "e"]])
+
+        self.sap.update("b", Rect(0.75, 0.0, 1.0, 1.0))
+        began, ended = self.sap.pop_events()
+        self.assertIn(("a", "b"), [tuple(sorted(p)) for p in began])
+        self.assertEqual(ended, [])
+
+        self.sap.remove("a")
+        began, ended = self.sap.pop_events()
+        self.assertEqual(began, [])
+        self.assertEqual(sorted(map(sorted, ended)), [["a", "b"], ["a", "c"], ["a", "e"]])
+
+    def test_container(self):
+        self.sap.insert_many([(1, Rect(0.0, 0.0, 1.0, 1.0)), (2, RectInt(0, 0, 2, 2))])
+        self.assertEqual(len(self.sap), 2)
+        self.assertIn(2, self.sap)
+        self.assertEqual(sorted(self.sap), [1, 2])
+        self.assertEqual(self.sap.get(2), RectInt(0, 0, 2, 2))
+
+        self.assertRaises(KeyError, lambda: self.sap.update(3, Rect(0.0, 0.0, 1.0, 1.0)))
+        self.assertRaises(KeyError, lambda: self.sap.remove(3))
+        self.assertRaises(TypeError, lambda: self.sap.insert(3, (0.0, 0.0, 1.0, 1.0)))
+        self.assertRaises(ValueError, lambda: self.sap.insert(3, Rect(float("nan"), 0.0, 1.0, 1.0)))
+
+        self.sap.clear()
+        self.assertEqual(len(self.sap), 0)
+        self.assertEqual(self.sap.pop_events(), ([], []))
+        self.assertEqual(self.sap.pairs(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
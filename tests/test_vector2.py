@@ -1,6 +1,10 @@
+import copy
+import pickle
 import unittest
 
-from nalpy.math import Vector2
+from array import array
+
+from nalpy.math import Vector2, MVector2, Vector2Array, pack_vectors, unpack_vectors
 
 
 class BasicFunctionality(unittest.TestCase):
@@ -84,6 +88,9 @@ class BasicFunctionality(unittest.TestCase):
         self.assertEqual(Vector2.left,  Vector2(-1.0, 0.0))
         self.assertEqual(Vector2.right, Vector2(1.0, 0.0))
 
+        self.assertIs(Vector2.zero.normalized, Vector2.zero)
+        self.assertIs(type(Vector2.one + Vector2.one), Vector2)
+
     def test_repr(self):
         self.assertEqual(repr(Vector2(2.0, 2.0)), f"Vector2(2.0, 2.0)")
         self.assertEqual(repr(Vector2(2.4, 3.075)), f"Vector2(2.4, 3.075)")
@@ -248,6 +255,71 @@ class BasicFunctionality(unittest.TestCase):
         self.assertEqual(Vector2.max(a, b3), Vector2(2.0, 5.0))
         self.assertEqual(Vector2.max(a, b4), Vector2(10.0, 10.0))
 
+    def test_buffer_conversion(self):
+        vectors = [Vector2(1.5, -2.0), Vector2(3.0, 4.25), Vector2.zero]
+        packed = Vector2.to_buffer(vectors)
+        self.assertIsInstance(packed, Vector2Array)
+        self.assertEqual(memoryview(packed).tolist(), [[1.5, -2.0], [3.0, 4.25], [0.0, 0.0]])
+        self.assertEqual(Vector2.from_buffer(packed), vectors)
+        self.assertEqual(Vector2.from_buffer(memoryview(array("d", [5.0, 6.0])).cast("B").cast("d", (1, 2))), [Vector2(5.0, 6.0)])
+
+        out = Vector2Array.zeros(3)
+        self.assertIs(Vector2.to_buffer(iter(vectors), out), out)
+        self.assertEqual(out, packed)
+
+        self.assertEqual(MVector2.from_buffer(packed), [MVector2(1.5, -2.0), MVector2(3.0, 4.25), MVector2(0.0, 0.0)])
+        self.assertEqual(MVector2.to_buffer(MVector2.from_buffer(packed)), packed)
+
+        self.assertEqual(len(Vector2.to_buffer([])), 0)
+        self.assertRaises(TypeError, lambda: Vector2.to_buffer([(1.0, 2.0)]))
+        self.assertRaises(TypeError, lambda: Vector2.to_buffer([None]))
+        self.assertRaises(ValueError, lambda: Vector2.to_buffer(vectors, Vector2Array.zeros(2)))
+
+    def test_pickle_and_copy(self):
+        v = Vector2(1.5, -2.25)
+        self.assertEqual(pickle.loads(pickle.dumps(v)), v)
+        self.assertIs(copy.copy(v), v)
+        self.assertIs(copy.deepcopy(v), v)
+
+        m = MVector2(1.5, -2.25)
+        self.assertEqual(pickle.loads(pickle.dumps(m)), m)
+        for c in (copy.copy(m), copy.deepcopy(m)):
+            self.assertEqual(c, m)
+            self.assertIsNot(c, m)
+
+        vectors = [Vector2(i, -i) for i in range(100)]
+        self.assertEqual(pickle.loads(pickle.dumps(vectors)), vectors)
+
+    def test_packing(self):
+        vectors = [Vector2(1.5, -2.0), Vector2(3.0, 4.25), Vector2.zero]
+        packed = pack_vectors(vectors)
+        self.assertIsInstance(packed, bytes)
+        self.assertEqual(len(packed), 16 * len(vectors))
+        self.assertEqual(packed, array("d", [1.5, -2.0, 3.0, 4.25, 0.0, 0.0]).tobytes())
+        self.assertEqual(unpack_vectors(packed), vectors)
+        self.assertEqual(unpack_vectors(bytearray(packed), MVector2), [MVector2(1.5, -2.0), MVector2(3.0, 4.25), MVector2(0.0, 0.0)])
+        self.assertEqual(pack_vectors(Vector2Array(vectors)), packed)
+        self.assertEqual(pack_vectors([MVector2(1.5, -2.0), Vector2(3.0, 4.25), MVector2(0.0, 0.0)]), packed)
+
+        packed32 = pack_vectors(vectors, float32=True)
+        self.assertEqual(packed32, array("f", [1.5, -2.0, 3.0, 4.25, 0.0, 0.0]).tobytes())
+        self.assertEqual(unpack_vectors(packed32, float32=True), vectors)
+        self.assertEqual(pack_vectors(Vector2Array(vectors), float32=True), packed32)
+        self.assertEqual(unpack_vectors(pack_vectors([Vector2(0.1, 0.0)], float32=True), float32=True)[0].x, 0.10000000149011612)
+
+        frame = bytearray(4 + len(packed)) # Unaligned destination inside a larger frame
+        view = memoryview(frame)[4:]
+        self.assertIs(pack_vectors(vectors, view), view)
+        self.assertEqual(unpack_vectors(view), vectors)
+        self.assertRaises(ValueError, lambda: pack_vectors(vectors, bytearray(len(packed) + 1)))
+        self.assertRaises(BufferError, lambda: pack_vectors(vectors, bytes(len(packed)))) # Read-only
+
+        self.assertEqual(pack_vectors([]), b"")
+        self.assertEqual(unpack_vectors(b""), [])
+        self.assertRaises(ValueError, lambda: unpack_vectors(packed[:-1]))
+        self.assertRaises(TypeError, lambda: pack_vectors([Vector2.one, (1.0, 2.0)]))
+        self.assertRaises(TypeError, lambda: unpack_vectors(packed, tuple))
+
     def test_interpolation(self):
         a = Vector2(2, 4)
         b = Vector2(14.5, 7.85)
@@ -0,0 +1,309 @@
+import mmap
+import unittest
+from array import array
+from multiprocessing.shared_memory import SharedMemory
+
+from nalpy.math import MVector2, Vector2, Vector2Array
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class BasicFunctionality(unittest.TestCase):
+    def test_construct(self):
+        a = Vector2Array([Vector2(1.0, 2.0), (3.0, 4.0)])
+        self.assertEqual(len(a), 2)
+        self.assertEqual(a.to_list(), [Vector2(1.0, 2.0), Vector2(3.0, 4.0)])
+
+        self.assertEqual(len(Vector2Array()), 0)
+        self.assertEqual(Vector2Array.zeros(3).to_list(), [Vector2.zero] * 3)
+        self.assertRaises(ValueError, lambda: Vector2Array.zeros(-1))
+
+    def test_index(self):
+        a = Vector2Array([Vector2(1.0, 2.0), Vector2(3.0, 4.0)])
+        self.assertEqual(a[0], Vector2(1.0, 2.0))
+        self.assertEqual(a[-1], Vector2(3.0, 4.0))
+        self.assertRaises(IndexError, lambda: a[2])
+        self.assertRaises(IndexError, lambda: a[-3])
+
+        a[0] = Vector2(5.0, 6.0)
+        a[1] = (7.0, 8.0)
+        self.assertEqual(list(a), [Vector2(5.0, 6.0), Vector2(7.0, 8.0)])
+
+    def test_slice_is_view(self):
+        a = Vector2Array([Vector2(1.0, 1.0), Vector2(2.0, 2.0), Vector2(3.0, 3.0)])
+        view = a[1:]
+        self.assertEqual(len(view), 2)
+        view += Vector2(10.0, 10.0)
+        self.assertEqual(a.to_list(), [Vector2(1.0, 1.0), Vector2(12.0, 12.0), Vector2(13.0, 13.0)])
+
+        self.assertEqual(len(a[5:]), 0)
+        self.assertRaises(ValueError, lambda: a[::2])
+
+    def test_reinit(self):
+        # Re-initializing would free the memory that slices and exported buffers point into
+        a = Vector2Array([Vector2(1.0, 2.0), Vector2(3.0, 4.0)])
+        view = a[1:]
+        self.assertRaises(RuntimeError, lambda: a.__init__([]))
+        self.assertRaises(RuntimeError, lambda: Vector2Array.zeros(2).__init__([]))
+        self.assertRaises(RuntimeError, lambda: Vector2Array.view(bytearray(32)).__init__([]))
+        self.assertEqual(list(view), [Vector2(3.0, 4.0)])
+
+    def test_equals(self):
+        a = Vector2Array([Vector2(1.0, 2.0)])
+        self.assertEqual(a, Vector2Array([Vector2(1.0, 2.0)]))
+        self.assertNotEqual(a, Vector2Array([Vector2(1.0, 3.0)]))
+        self.assertNotEqual(a, Vector2Array())
+        self.assertNotEqual(a, [Vector2(1.0, 2.0)])
+
+    def test_buffer(self):
+        a = Vector2Array([Vector2(1.0, 2.0), Vector2(3.0, 4.0)])
+        view = memoryview(a)
+        self.assertEqual(view.format, "d")
+        self.assertEqual(view.shape, (2, 2))
+        self.assertEqual(view.tolist(), [[1.0, 2.0], [3.0, 4.0]])
+
+        view[1, 0] = 69.0 # No copy
+        self.assertEqual(a[1], Vector2(69.0, 4.0))
+
+        copied = Vector2Array.from_buffer(view)
+        self.assertEqual(copied, a)
+        copied[0] = Vector2.zero
+        self.assertEqual(a[0], Vector2(1.0, 2.0))
+        self.assertRaises(ValueError, lambda: Vector2Array.from_buffer(memoryview(array("d", [1.0, 2.0, 3.0])).cast("B").cast("d", (1, 3))))
+
+    def test_view(self):
+        memory = bytearray(16 * 4)
+        a = Vector2Array.view(memory)
+        self.assertEqual(len(a), 4)
+        a[1] = Vector2(1.5, -2.0)
+        self.assertEqual(memory[16:32], array("d", [1.5, -2.0]).tobytes()) # No copy
+
+        b = Vector2Array.view(memoryview(memory), 2, 16)
+        self.assertEqual(b.to_list(), [Vector2(1.5, -2.0), Vector2.zero])
+        b += Vector2.one
+        self.assertEqual(a.to_list(), [Vector2.zero, Vector2(2.5, -1.0), Vector2.one, Vector2.zero])
+        Vector2Array.move_towards(b[1:], Vector2(5.0, 1.0), 10.0, b[1:])
+        self.assertEqual(a[2], Vector2(5.0, 1.0))
+
+        self.assertEqual(len(Vector2Array.view(memory, offset=len(memory))), 0)
+        self.assertEqual(len(Vector2Array.view(bytearray(20))), 1) # Trailing bytes are ignored
+        self.assertRaises(ValueError, lambda: Vector2Array.view(memory, 5))
+        self.assertRaises(ValueError, lambda: Vector2Array.view(memory, offset=-8))
+        self.assertRaises(ValueError, lambda: Vector2Array.view(memory, 1, offset=4)) # Unaligned
+        self.assertRaises(BufferError, lambda: Vector2Array.view(bytes(16))) # Read-only
+
+    def test_view_shared_memory(self):
+        shm = SharedMemory(create=True, size=16 * 100)
+        try:
+            a = Vector2Array.view(shm.buf)
+            a[:] # Slices of views keep the buffer alive as well
+            other = SharedMemory(shm.name) # Attached like a worker process would
+            b = Vector2Array.view(other.buf)[50:]
+            b += Vector2(1.0, 2.0)
+            self.assertEqual(a[49], Vector2.zero)
+            self.assertEqual(a[50], Vector2(1.0, 2.0))
+            self.assertRaises(BufferError, shm.close) # Exported while a is alive
+            del a, b
+            other.close()
+        finally:
+            shm.close()
+            shm.unlink()
+
+        with mmap.mmap(-1, 16 * 8) as m:
+            c = Vector2Array.view(m)
+            c[7] = Vector2(3.0, 4.0)
+            self.assertEqual(m[-16:], array("d", [3.0, 4.0]).tobytes())
+            del c
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed.")
+    def test_numpy(self):
+        a = Vector2Array([Vector2(1.0, 2.0), Vector2(3.0, 4.0)])
+        arr = numpy.asarray(a)
+        self.assertEqual(arr.shape, (2, 2))
+        arr[0, 0] = 69.0 # No copy
+        self.assertEqual(a[0], Vector2(69.0, 2.0))
+        self.assertEqual(Vector2Array.from_buffer(arr * 2), a * 2)
+
+        # NumPy 2 copy semantics
+        self.assertFalse(numpy.shares_memory(a.__array__(copy=True), arr))
+        self.assertTrue(numpy.shares_memory(a.__array__(copy=False), arr))
+        self.assertEqual(a.__array__(numpy.float32).dtype, numpy.float32)
+        self.assertRaises(ValueError, lambda: a.__array__(numpy.float32, copy=False))
+        self.assertTrue(numpy.shares_memory(a.__array__(numpy.float64, copy=False), arr))
+
+
+class Arithmetic(unittest.TestCase):
+    vectors: tuple[Vector2, ...] = (Vector2(3.5, -7.25), Vector2(-10.0, 10.0), Vector2(0.0, 2.0), Vector2(6.9, 4.2))
+    others: tuple[Vector2, ...] = (Vector2(2.0, 3.0), Vector2(3.0, -4.0), Vector2(-1.5, 5.0), Vector2(0.5, 0.25))
+
+    def assertElementwise(self, result: Vector2Array, expected: list[Vector2]):
+        self.assertIsInstance(result, Vector2Array)
+        self.assertEqual(result.to_list(), expected)
+
+    def test_matches_vector2(self):
+        a = Vector2Array(self.vectors)
+        b = Vector2Array(self.others)
+        pairs = tuple(zip(self.vectors, self.others))
+
+        self.assertElementwise(a + b, [x + y for x, y in pairs])
+        self.assertElementwise(a - b, [x - y for x, y in pairs])
+        self.assertElementwise(a * b, [x * y for x, y in pairs])
+        self.assertElementwise(a / b, [x / y for x, y in pairs])
+        self.assertElementwise(a // b, [x // y for x, y in pairs])
+        self.assertElementwise(a % b, [x % y for x, y in pairs])
+        self.assertElementwise(-a, [-x for x in self.vectors])
+        self.assertElementwise(abs(a), [abs(x) for x in self.vectors])
+        self.assertElementwise(a.normalized, [x.normalized for x in self.vectors])
+
+    def test_broadcast(self):
+        a = Vector2Array(self.vectors)
+        v = Vector2(3.0, -2.0)
+
+        self.assertElementwise(a + v, [x + v for x in self.vectors])
+        self.assertElementwise(a - v, [x - v for x in self.vectors])
+        self.assertElementwise(v + a, [v + x for x in self.vectors])
+        self.assertElementwise(v - a, [v - x for x in self.vectors])
+        self.assertElementwise(a * v, [x * v for x in self.vectors])
+        self.assertElementwise(v * a, [v * x for x in self.vectors])
+        self.assertElementwise(a // v, [x // v for x in self.vectors])
+        self.assertElementwise(a % v, [x % v for x in self.vectors])
+
+        self.assertElementwise(a * 2, [x * 2 for x in self.vectors])
+        self.assertElementwise(2.0 * a, [2.0 * x for x in self.vectors])
+        self.assertElementwise(a / 4, [x / 4 for x in self.vectors])
+        self.assertElementwise(a // 3, [x // 3 for x in self.vectors])
+        self.assertElementwise(a % -3, [x % -3 for x in self.vectors])
+
+        self.assertRaises(TypeError, lambda: a + 2)
+        self.assertRaises(TypeError, lambda: v + 2)
+        self.assertRaises(TypeError, lambda: v - None)
+        self.assertRaises(ValueError, lambda: a + Vector2Array.zeros(1))
+
+    def test_inplace(self):
+        a = Vector2Array(self.vectors)
+        b = a
+        a *= 2
+        a -= Vector2.one
+        self.assertIs(a, b)
+        self.assertElementwise(a, [x * 2 - Vector2.one for x in self.vectors])
+
+        a.normalize()
+        self.assertElementwise(a, [(x * 2 - Vector2.one).normalized for x in self.vectors])
+
+    def test_division_by_zero(self):
+        a = Vector2Array([Vector2(1.0, -1.0)])
+        self.assertEqual((a / 0)[0], Vector2(float("inf"), float("-inf")))
+
+
+class BatchedMath(unittest.TestCase):
+    a: tuple[Vector2, ...] = (Vector2(3.4, 7.6), Vector2(-1.0, 0.0), Vector2(0.0, 0.0), Vector2(5.5, -2.25))
+    b: tuple[Vector2, ...] = (Vector2(5.77, 3.22), Vector2(0.0, 1.0), Vector2(1.0, 1.0), Vector2(-4.0, -8.0))
+
+    def test_scalar_results(self):
+        a = Vector2Array(self.a)
+        b = Vector2Array(self.b)
+        for batched, single in (
+            (Vector2Array.dot, Vector2.dot),
+            (Vector2Array.distance, Vector2.distance),
+            (Vector2Array.angle, Vector2.angle),
+            (Vector2Array.signed_angle, Vector2.signed_angle)
+        ):
+            self.assertEqual(list(batched(a, b)), [single(x, y) for x, y in zip(self.a, self.b)])
+            self.assertEqual(list(batched(a, Vector2.up)), [single(x, Vector2.up) for x in self.a])
+            self.assertEqual(list(batched(Vector2.up, b)), [single(Vector2.up, y) for y in self.b])
+
+    def test_vector_results(self):
+        a = Vector2Array(self.a)
+        b = Vector2Array(self.b)
+        pairs = tuple(zip(self.a, self.b))
+
+        self.assertEqual(Vector2Array.lerp(a, b, 0.75).to_list(), [Vector2.lerp(x, y, 0.75) for x, y in pairs])
+        self.assertEqual(Vector2Array.lerp(a, b, 1.5).to_list(), [Vector2.lerp(x, y, 1.5) for x, y in pairs])
+        self.assertEqual(Vector2Array.lerp_unclamped(a, b, -1.5).to_list(), [Vector2.lerp_unclamped(x, y, -1.5) for x, y in pairs])
+        self.assertEqual(Vector2Array.move_towards(a, b, 2.5).to_list(), [Vector2.move_towards(x, y, 2.5) for x, y in pairs])
+        self.assertEqual(Vector2Array.perpendicular(a).to_list(), [Vector2.perpendicular(x) for x in self.a])
+        self.assertEqual(Vector2Array.reflect(a, b).to_list(), [Vector2.reflect(x, y) for x, y in pairs])
+
+        t = array("d", [-1.0, 0.25, 0.5, 2.0])
+        self.assertEqual(Vector2Array.lerp(a, b, t).to_list(), [Vector2.lerp(x, y, ti) for (x, y), ti in zip(pairs, t)])
+
+    def test_operands(self):
+        vectors = [(0.0, 0.0), (3.0, 4.0)]
+        self.assertEqual(list(Vector2Array.distance(vectors, Vector2.zero)), [0.0, 5.0])
+        self.assertEqual(list(Vector2Array.distance(memoryview(Vector2Array(vectors)), Vector2.zero)), [0.0, 5.0])
+
+        self.assertRaises(ValueError, lambda: Vector2Array.dot(Vector2.one, Vector2.one))
+        self.assertRaises(ValueError, lambda: Vector2Array.dot(Vector2Array(vectors), Vector2Array.zeros(3)))
+        self.assertRaises(ValueError, lambda: Vector2Array.lerp(Vector2Array(vectors), Vector2.one, array("d", [0.5])))
+
+    def test_out(self):
+        a = Vector2Array([Vector2(3.0, 4.0), Vector2(6.0, 8.0)])
+        out = array("d", [0.0, 0.0])
+        self.assertIs(Vector2Array.distance(a, Vector2.zero, out), out)
+        self.assertEqual(list(out), [5.0, 10.0])
+        self.assertRaises(ValueError, lambda: Vector2Array.distance(a, Vector2.zero, array("d", [0.0])))
+
+        self.assertIs(Vector2Array.perpendicular(a, out=a), a) # In place
+        self.assertEqual(a.to_list(), [Vector2(-4.0, 3.0), Vector2(-8.0, 6.0)])
+
+    def test_smooth_damp_many(self):
+        targets = Vector2Array(self.b)
+        smooth_times = array("d", [0.3, 0.05, 1.0, 0.0])
+        max_speeds = array("d", [float("inf"), 20.0, 0.5, 3.0])
+
+        current = Vector2Array(self.a)
+        velocity = Vector2Array.zeros(len(self.a))
+        singles = list(self.a)
+        velocities = [MVector2.zero() for _ in self.a]
+        for _ in range(50):
+            self.assertIsNone(Vector2Array.smooth_damp_many(current, targets, velocity, smooth_times, 0.016, max_speeds))
+            singles = [Vector2.smooth_damp(c, t, v, s, 0.016, m) for c, t, v, s, m in zip(singles, self.b, velocities, smooth_times, max_speeds)]
+
+            # Bit-for-bit identical to the single vector method
+            self.assertEqual(current.to_list(), singles)
+            self.assertEqual(velocity.to_list(), [Vector2(v.x, v.y) for v in velocities])
+
+    def test_smooth_damp_many_reference(self):
+        # Computed with Python floats, the intermediate values must not be rounded to single precision.
+        def reference(current: Vector2, target: Vector2, velocity: list[float], smooth_time: float, delta_time: float) -> Vector2:
+            omega = 2.0 / smooth_time
+            x = omega * delta_time
+            exp = 1.0 / (1.0 + x + 0.48 * x * x + 0.235 * x * x * x)
+            change_x = current.x - target.x
+            change_y = current.y - target.y
+            temp_x = (velocity[0] + omega * change_x) * delta_time
+            temp_y = (velocity[1] + omega * change_y) * delta_time
+            velocity[0] = (velocity[0] - omega * temp_x) * exp
+            velocity[1] = (velocity[1] - omega * temp_y) * exp
+            return Vector2(target.x + (change_x + temp_x) * exp, target.y + (change_y + temp_y) * exp)
+
+        expected_velocity = [0.0, 0.0]
+        expected = reference(Vector2(3.4, 7.6), Vector2(5.77, 3.22), expected_velocity, 0.3, 0.016)
+
+        current = Vector2Array([Vector2(3.4, 7.6)])
+        velocity = Vector2Array.zeros(1)
+        Vector2Array.smooth_damp_many(current, Vector2(5.77, 3.22), velocity, 0.3, 0.016)
+        self.assertAlmostEqual(current[0].x, expected.x, places=14)
+        self.assertAlmostEqual(current[0].y, expected.y, places=14)
+        self.assertAlmostEqual(velocity[0].x, expected_velocity[0], places=14)
+        self.assertAlmostEqual(velocity[0].y, expected_velocity[1], places=14)
+
+    def test_smooth_damp_many_operands(self):
+        current = Vector2Array(self.a)
+        velocity = array("d", [0.0] * (2 * len(self.a)))
+        self.assertRaises(ValueError, Vector2Array.smooth_damp_many, current, Vector2.zero, velocity, 0.3, 0.016) # Velocity is not (n, 2)
+
+        velocity_view = memoryview(velocity).cast("B").cast("d", (len(self.a), 2))
+        Vector2Array.smooth_damp_many(current, Vector2.zero, velocity_view, 0.3, 0.016)
+        self.assertNotEqual(list(velocity), [0.0] * (2 * len(self.a)))
+
+        self.assertRaises(ValueError, Vector2Array.smooth_damp_many, current, Vector2Array.zeros(1), Vector2Array.zeros(len(self.a)), 0.3, 0.016)
+        self.assertRaises(ValueError, Vector2Array.smooth_damp_many, current, Vector2.zero, Vector2Array.zeros(1), 0.3, 0.016)
+        self.assertRaises(ValueError, Vector2Array.smooth_damp_many, current, Vector2.zero, Vector2Array.zeros(len(self.a)), array("d", [0.3]), 0.016)
+
+
+if __name__ == '__main__':
+    unittest.main()
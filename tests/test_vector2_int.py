@@ -1,6 +1,10 @@
+import copy
+import pickle
 import unittest
 
-from nalpy.math import Vector2Int, Vector2
+from array import array
+
+from nalpy.math import Vector2Int, Vector2, MVector2Int, Vector2IntBuffer, CheckedVector2Int, SaturatingVector2Int, pack_vectors, unpack_vectors
 
 
 class BasicFunctionality(unittest.TestCase):
@@ -241,5 +245,155 @@ class BasicFunctionality(unittest.TestCase):
         self.assertEqual(Vector2Int(69, -420).to_vector2(), Vector2(69.0, -420.0))
         self.assertEqual(Vector2Int(-24, -42).to_vector2(), Vector2(-24.0, -42.0))
 
+    def test_buffer_conversion(self):
+        vectors = [Vector2Int(1, -2), Vector2Int(2 ** 62, -(2 ** 62)), Vector2Int.zero]
+        packed = Vector2Int.to_buffer(vectors)
+        self.assertIsInstance(packed, Vector2IntBuffer)
+        view = memoryview(packed)
+        self.assertEqual((view.format, view.shape), ("q", (3, 2)))
+        self.assertEqual(view.tolist(), [[1, -2], [2 ** 62, -(2 ** 62)], [0, 0]])
+        self.assertEqual(Vector2Int.from_buffer(packed), vectors)
+
+        self.assertEqual(MVector2Int.from_buffer(packed), [MVector2Int(1, -2), MVector2Int(2 ** 62, -(2 ** 62)), MVector2Int(0, 0)])
+        self.assertEqual(MVector2Int.to_buffer(MVector2Int.from_buffer(packed)), packed)
+
+        self.assertEqual(memoryview(Vector2Int.to_buffer([])).shape, (0, 2))
+        self.assertRaises(TypeError, lambda: Vector2Int.to_buffer([Vector2(1.0, 2.0)]))
+        self.assertRaises(ValueError, lambda: Vector2Int.from_buffer(memoryview(Vector2.to_buffer([Vector2.one]))))
+
+    def test_pickle_and_copy(self):
+        v = Vector2Int(2 ** 62, -3)
+        self.assertEqual(pickle.loads(pickle.dumps(v)), v)
+        self.assertIs(copy.copy(v), v)
+        self.assertIs(copy.deepcopy(v), v)
+
+        m = MVector2Int(2 ** 62, -3)
+        self.assertEqual(pickle.loads(pickle.dumps(m)), m)
+        for c in (copy.copy(m), copy.deepcopy(m)):
+            self.assertEqual(c, m)
+            self.assertIsNot(c, m)
+
+    def test_packing(self):
+        vectors = [Vector2Int(1, -2), Vector2Int(2 ** 62, -(2 ** 62)), Vector2Int.zero]
+        packed = pack_vectors(vectors)
+        self.assertEqual(len(packed), 16 * len(vectors))
+        self.assertEqual(packed, array("q", [1, -2, 2 ** 62, -(2 ** 62), 0, 0]).tobytes())
+        self.assertEqual(unpack_vectors(packed, Vector2Int), vectors)
+        self.assertEqual(unpack_vectors(packed, MVector2Int), [MVector2Int(1, -2), MVector2Int(2 ** 62, -(2 ** 62)), MVector2Int(0, 0)])
+        self.assertEqual(pack_vectors(Vector2IntBuffer(vectors)), packed)
+
+        self.assertRaises(ValueError, lambda: pack_vectors(vectors, float32=True))
+        self.assertRaises(ValueError, lambda: unpack_vectors(packed, Vector2Int, float32=True))
+        self.assertRaises(TypeError, lambda: pack_vectors([Vector2Int.one, Vector2.one]))
+
+    def test_int_buffer(self):
+        buffer = Vector2IntBuffer([Vector2Int(1, 2), (3, 4)])
+        self.assertEqual(len(buffer), 2)
+        self.assertEqual(buffer[-1], Vector2Int(3, 4))
+        self.assertRaises(IndexError, lambda: buffer[2])
+
+        buffer[0] = Vector2Int(5, 6)
+        self.assertEqual(list(buffer), [Vector2Int(5, 6), Vector2Int(3, 4)])
+        self.assertEqual(Vector2IntBuffer.from_buffer(buffer), buffer)
+        self.assertIsNot(buffer.copy(), buffer)
+        self.assertEqual(Vector2IntBuffer.zeros(2).to_list(), [Vector2Int.zero] * 2)
+
+        view = memoryview(buffer)
+        self.assertRaises(RuntimeError, lambda: buffer.__init__([])) # Would free the memory of view
+        self.assertEqual(view.tolist(), [[5, 6], [3, 4]])
+
+
+class OverflowPolicies(unittest.TestCase):
+    MAX = 2 ** 63 - 1
+    MIN = -(2 ** 63)
+
+    def test_matches_python_ints(self):
+        # Results that fit are identical to the unbounded Python results for every policy
+        values = (0, 1, -1, 7, -7, 3, -3, 2 ** 31, -(2 ** 31) + 5)
+        for t in (Vector2Int, CheckedVector2Int, SaturatingVector2Int):
+            for a in values:
+                for b in values:
+                    v = t(a, b)
+                    w = Vector2Int(b, a)
+                    self.assertEqual(v + w, Vector2Int(a + b, b + a))
+                    self.assertEqual(v - w, Vector2Int(a - b, b - a))
+                    self.assertEqual(v * w, Vector2Int(a * b, b * a))
+                    self.assertEqual(-v, Vector2Int(-a, -b))
+                    self.assertEqual(abs(v), Vector2Int(abs(a), abs(b)))
+                    if a != 0 and b != 0:
+                        self.assertEqual(v // w, Vector2Int(a // b, b // a))
+                        self.assertEqual(v % w, Vector2Int(a % b, b % a))
+                        self.assertEqual(divmod(v, w), (Vector2Int(a // b, b // a), Vector2Int(a % b, b % a)))
+
+    def test_result_types(self):
+        for t in (CheckedVector2Int, SaturatingVector2Int):
+            v = t(3, 4)
+            for result in (v + Vector2Int.one, Vector2Int.one + v, v - Vector2Int.one, Vector2Int.one - v, v * 2, 2 * v, v // 2, v % 2, -v, abs(v), *divmod(v, 2), t.min(v, v), t.round(Vector2(1.5, 2.5)), t.zero):
+                self.assertIs(type(result), t)
+            self.assertIsInstance(v, Vector2Int)
+            self.assertEqual(v, Vector2Int(3, 4))
+            self.assertEqual(hash(v), hash(Vector2Int(3, 4)))
+            self.assertEqual(repr(v), f"{t.__name__}(3, 4)")
+
+            copied = pickle.loads(pickle.dumps(v))
+            self.assertIs(type(copied), t)
+            self.assertEqual(copied, v)
+
+            packed = pack_vectors([v, Vector2Int(5, 6)])
+            self.assertEqual(packed, pack_vectors([Vector2Int(3, 4), Vector2Int(5, 6)]))
+            self.assertEqual(pack_vectors([Vector2Int(5, 6), v]), pack_vectors([Vector2Int(5, 6), Vector2Int(3, 4)]))
+            unpacked = unpack_vectors(packed, t)
+            self.assertEqual(unpacked, [v, Vector2Int(5, 6)])
+            self.assertTrue(all(type(u) is t for u in unpacked))
+
+            self.assertRaises(ZeroDivisionError, lambda: v // 0)
+            self.assertRaises(ZeroDivisionError, lambda: v % Vector2Int(1, 0))
+            self.assertRaises(ValueError, lambda: t.floor(Vector2(float("nan"), 0.0)))
+
+    def test_checked(self):
+        big = CheckedVector2Int(self.MAX, self.MIN)
+        self.assertRaises(OverflowError, lambda: big + Vector2Int(1, 0))
+        self.assertRaises(OverflowError, lambda: Vector2Int(0, -1) + big)
+        self.assertRaises(OverflowError, lambda: big - Vector2Int(0, 1))
+        self.assertRaises(OverflowError, lambda: big * 2)
+        self.assertRaises(OverflowError, lambda: -big)
+        self.assertRaises(OverflowError, lambda: abs(big))
+        self.assertRaises(OverflowError, lambda: big // -1)
+        self.assertRaises(OverflowError, lambda: CheckedVector2Int.round(Vector2(1e19, 0.0)))
+        self.assertEqual(big % -1, Vector2Int.zero)
+        self.assertEqual(big - Vector2Int(1, -1), Vector2Int(self.MAX - 1, self.MIN + 1))
+
+        # Operands that don't fit into a C integer only raise when the result doesn't fit either
+        self.assertRaises(OverflowError, lambda: CheckedVector2Int(2, 2) * 2 ** 70)
+        self.assertRaises(OverflowError, lambda: -(2 ** 70) * CheckedVector2Int(2, 0))
+        self.assertEqual(CheckedVector2Int(0, 0) * 2 ** 70, Vector2Int.zero)
+        self.assertEqual(CheckedVector2Int(5, -5) // 2 ** 70, Vector2Int(0, -1))
+        self.assertRaises(OverflowError, lambda: CheckedVector2Int(5, 0) % -(2 ** 70))
+        self.assertEqual(divmod(CheckedVector2Int(5, 0), 2 ** 70), (Vector2Int(0, 0), Vector2Int(5, 0)))
+
+        # Plain Vector2Int keeps wrapping around
+        self.assertEqual(Vector2Int(self.MAX, 0) + Vector2Int(1, 0), Vector2Int(self.MIN, 0))
+
+    def test_saturating(self):
+        big = SaturatingVector2Int(self.MAX, self.MIN)
+        self.assertEqual(big + Vector2Int(1, -1), big)
+        self.assertEqual(big - Vector2Int(-1, 1), big)
+        self.assertEqual(big * 2, big)
+        self.assertEqual(big * -2, Vector2Int(self.MIN, self.MAX))
+        self.assertEqual(-big, Vector2Int(-self.MAX, self.MAX))
+        self.assertEqual(abs(big), Vector2Int(self.MAX, self.MAX))
+        self.assertEqual(big // -1, Vector2Int(-self.MAX, self.MAX))
+        self.assertEqual(big % -1, Vector2Int.zero)
+        self.assertEqual(SaturatingVector2Int.round(Vector2(1e19, float("-inf"))), Vector2Int(self.MAX, self.MIN))
+
+        # Operands that don't fit into a C integer saturate like the results
+        self.assertEqual(SaturatingVector2Int(2, -2) * 2 ** 70, Vector2Int(self.MAX, self.MIN))
+        self.assertEqual(2 ** 70 * SaturatingVector2Int(-1, 0), Vector2Int(self.MIN, 0))
+        self.assertEqual(SaturatingVector2Int(5, -5) // 2 ** 70, Vector2Int(0, -1))
+        self.assertEqual(SaturatingVector2Int(5, -5) % 2 ** 70, Vector2Int(5, self.MAX))
+        self.assertEqual(divmod(SaturatingVector2Int(5, -5), -(2 ** 70)), (Vector2Int(-1, 0), Vector2Int(self.MIN, -5)))
+        for result in (SaturatingVector2Int.one * 2 ** 70, 2 ** 70 * SaturatingVector2Int.one, SaturatingVector2Int.one // 2 ** 70, *divmod(SaturatingVector2Int.one, 2 ** 70)):
+            self.assertIs(type(result), SaturatingVector2Int)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,240 @@
+import unittest
+
+from array import array
+
+from nalpy.math import Vector3, MVector3, Vector3Array, Vector3Int, MVector3Int, Vector3IntBuffer
+
+
+class BasicFunctionality(unittest.TestCase):
+    def test_index(self):
+        v = Vector3(3.5, 7.25, -1.0)
+        self.assertEqual((v[0], v[1], v[2]), (3.5, 7.25, -1.0))
+        self.assertEqual((v.x, v.y, v.z), (3.5, 7.25, -1.0))
+        self.assertRaises(IndexError, lambda: v[3])
+        self.assertEqual(len(v), 3)
+        self.assertEqual(tuple(v), (3.5, 7.25, -1.0))
+
+    def test_equals(self):
+        v = Vector3(3.0, 3.0, 3.0)
+        self.assertEqual(v, Vector3(3, 3, 3))
+        self.assertNotEqual(v, Vector3(3.0, 3.0, 2.0))
+        self.assertNotEqual(v, None)
+        self.assertRaises(TypeError, lambda: v == (3.0, 3.0, 3.0))
+
+    def test_hash(self):
+        test_values: tuple[tuple[float, float, float], ...] = (
+            (69, 420, 1),
+            (420, 69, 1),
+            (69.420, 420.420, -0.5),
+            (0, 0, 0),
+            (-1, -1, -1),
+            (float("inf"), float("-inf"), 0.0)
+        )
+
+        # Vector3 hash should match tuple hash
+        for v in test_values:
+            self.assertEqual(hash(v), hash(Vector3(*v)), f"hash({v}) != hash({Vector3(*v)})")
+
+    def test_constants(self):
+        self.assertEqual(Vector3.zero,    Vector3(0.0, 0.0, 0.0))
+        self.assertEqual(Vector3.one,     Vector3(1.0, 1.0, 1.0))
+        self.assertEqual(Vector3.up,      Vector3(0.0, 1.0, 0.0))
+        self.assertEqual(Vector3.down,    Vector3(0.0, -1.0, 0.0))
+        self.assertEqual(Vector3.left,    Vector3(-1.0, 0.0, 0.0))
+        self.assertEqual(Vector3.right,   Vector3(1.0, 0.0, 0.0))
+        self.assertEqual(Vector3.forward, Vector3(0.0, 0.0, 1.0))
+        self.assertEqual(Vector3.back,    Vector3(0.0, 0.0, -1.0))
+
+        self.assertIs(Vector3.zero.normalized, Vector3.zero)
+        self.assertEqual(repr(Vector3(2.4, 3.075, 1.0)), "Vector3(2.4, 3.075, 1.0)")
+
+    def test_operators(self):
+        a = Vector3(10.0, -10.0, 5.5)
+        b = Vector3(3.0, 5.0, 2.0)
+        self.assertEqual(a + b, Vector3(13.0, -5.0, 7.5))
+        self.assertEqual(a - b, Vector3(7.0, -15.0, 3.5))
+        self.assertEqual(a * 2, Vector3(20.0, -20.0, 11.0))
+        self.assertEqual(2.0 * a, a * 2)
+        self.assertEqual(a * b, Vector3(30.0, -50.0, 11.0))
+        self.assertEqual(a / 2, Vector3(5.0, -5.0, 2.75))
+        self.assertEqual(a // b, Vector3(3.0, -2.0, 2.0))
+        self.assertEqual(a % b, Vector3(1.0, 0.0, 1.5))
+        self.assertEqual(divmod(a, b), (a // b, a % b))
+        self.assertEqual(-a, Vector3(-10.0, 10.0, -5.5))
+        self.assertEqual(abs(a), Vector3(10.0, 10.0, 5.5))
+        self.assertRaises(ZeroDivisionError, lambda: a // Vector3(1.0, 1.0, 0.0))
+
+    def test_math(self):
+        a = Vector3(1.0, 2.0, 3.0)
+        b = Vector3(4.0, 5.0, 6.0)
+        self.assertEqual(Vector3.dot(a, b), 32.0)
+        self.assertEqual(Vector3.cross(a, b), Vector3(-3.0, 6.0, -3.0))
+        self.assertEqual(Vector3.cross(Vector3.right, Vector3.up), Vector3.forward)
+        self.assertEqual(Vector3.dot(Vector3.cross(a, b), a), 0.0)
+
+        self.assertEqual(Vector3(2.0, 3.0, 6.0).magnitude, 7.0)
+        self.assertEqual(Vector3.distance(a, Vector3(3.0, 5.0, 9.0)), 7.0)
+        self.assertAlmostEqual(Vector3(4.5, 3.42, -1.0).normalized.magnitude, 1.0)
+        self.assertEqual(Vector3(1e200, 1e200, 1e200).magnitude, 1.7320508075688772e200) # No overflow
+
+        self.assertEqual(Vector3.min(a, Vector3(0.0, 5.0, 1.0)), Vector3(0.0, 2.0, 1.0))
+        self.assertEqual(Vector3.max(a, Vector3(0.0, 5.0, 1.0)), Vector3(1.0, 5.0, 3.0))
+        self.assertEqual(Vector3.reflect(Vector3(1.0, -1.0, 2.0), Vector3.up), Vector3(1.0, 1.0, 2.0))
+
+    def test_angle(self):
+        self.assertEqual(Vector3.angle(Vector3.right, Vector3.up), 90.0)
+        self.assertEqual(Vector3.angle(Vector3.right, Vector3.back), 90.0)
+        self.assertAlmostEqual(Vector3.angle(Vector3.right, Vector3(1.0, 1.0, 0.0)), 45.0)
+        self.assertEqual(Vector3.angle(Vector3.zero, Vector3.up), 0.0)
+
+        self.assertEqual(Vector3.signed_angle(Vector3.right, Vector3.up, Vector3.forward), 90.0)
+        self.assertEqual(Vector3.signed_angle(Vector3.right, Vector3.up, Vector3.back), -90.0)
+        self.assertEqual(Vector3.signed_angle(Vector3.right, Vector3.down, Vector3.forward), -90.0)
+
+    def test_interpolation(self):
+        a = Vector3(2.0, 4.0, -1.0)
+        b = Vector3(14.5, 7.85, 3.0)
+        self.assertEqual(Vector3.lerp(a, b, 0.5), Vector3(8.25, 5.925, 1.0))
+        self.assertEqual(Vector3.lerp(a, b, -10.0), a)
+        self.assertEqual(Vector3.lerp(a, b, 10.0), b)
+        self.assertEqual(Vector3.lerp_unclamped(a, b, 10.0), Vector3(127.0, 42.5, 39.0))
+
+        self.assertEqual(Vector3.move_towards(Vector3.zero, Vector3(2.0, 3.0, 6.0), 3.5), Vector3(1.0, 1.5, 3.0))
+        self.assertEqual(Vector3.move_towards(Vector3.zero, Vector3(2.0, 3.0, 6.0), 100.0), Vector3(2.0, 3.0, 6.0))
+
+    def test_smooth_damp(self):
+        # Without movement in z the result must match the 2D implementation
+        from nalpy.math import Vector2, MVector2
+        velocity3 = MVector3.zero()
+        velocity2 = MVector2.zero()
+        current3 = Vector3(0.0, 0.0, 5.0)
+        current2 = Vector2(0.0, 0.0)
+        for _ in range(10):
+            current3 = Vector3.smooth_damp(current3, Vector3(10.0, -4.0, 5.0), velocity3, 0.3, 0.016, 20.0)
+            current2 = Vector2.smooth_damp(current2, Vector2(10.0, -4.0), velocity2, 0.3, 0.016, 20.0)
+            self.assertAlmostEqual(current3.x, current2.x, places=5)
+            self.assertAlmostEqual(current3.y, current2.y, places=5)
+            self.assertEqual(current3.z, 5.0)
+            self.assertAlmostEqual(velocity3.x, velocity2.x, places=4)
+        self.assertEqual(velocity3.z, 0.0)
+
+        # Never overshoots
+        velocity = MVector3.zero()
+        current = Vector3.zero
+        for _ in range(200):
+            current = Vector3.smooth_damp(current, Vector3.one, velocity, 0.1, 0.05)
+            self.assertLessEqual(current.x, 1.0)
+        self.assertAlmostEqual(current.x, 1.0)
+
+    def test_buffer_conversion(self):
+        vectors = [Vector3(1.5, -2.0, 0.5), Vector3(3.0, 4.25, -1.0), Vector3.zero]
+        packed = Vector3.to_buffer(vectors)
+        self.assertIsInstance(packed, Vector3Array)
+        self.assertEqual(memoryview(packed).tolist(), [[1.5, -2.0, 0.5], [3.0, 4.25, -1.0], [0.0, 0.0, 0.0]])
+        self.assertEqual(Vector3.from_buffer(packed), vectors)
+        self.assertEqual(MVector3.from_buffer(packed), [MVector3(*v) for v in vectors])
+        self.assertEqual(MVector3.to_buffer(MVector3.from_buffer(packed)), packed)
+
+        self.assertRaises(ValueError, lambda: Vector3.from_buffer(memoryview(array("d", [1.0, 2.0])).cast("B").cast("d", (1, 2))))
+        self.assertRaises(ValueError, lambda: Vector3.to_buffer(vectors, Vector3Array.zeros(2)))
+        self.assertRaises(TypeError, lambda: Vector3.to_buffer([(1.0, 2.0, 3.0)]))
+
+    def test_converters(self):
+        v = Vector3(1.0, 2.0, 3.0)
+        self.assertEqual(v.to_tuple(), (1.0, 2.0, 3.0))
+        self.assertEqual(v.to_dict(), {"x": 1.0, "y": 2.0, "z": 3.0})
+
+
+class Mutable(unittest.TestCase):
+    def test_inplace(self):
+        v = MVector3(1.0, 2.0, 3.0)
+        ref = v
+        v += Vector3.one
+        v -= MVector3(0.5, 0.5, 0.5)
+        v *= 2
+        v /= Vector3(1.0, 2.0, 4.0)
+        self.assertIs(v, ref)
+        self.assertEqual(v, MVector3(3.0, 2.5, 1.75))
+
+        v.z = 0.0
+        v //= 2
+        self.assertEqual(v.to_immutable(), Vector3(1.0, 1.0, 0.0))
+        v %= 0.75
+        self.assertEqual(v.to_tuple(), (0.25, 0.25, 0.0))
+
+    def test_normalize(self):
+        v = MVector3(2.0, 3.0, 6.0)
+        self.assertEqual(v.magnitude, 7.0)
+        n = v.normalized
+        self.assertIsNot(n, v)
+        v.normalize()
+        self.assertEqual(v, n)
+        self.assertEqual(v.to_immutable(), Vector3(2.0, 3.0, 6.0).normalized)
+
+        zero = MVector3.zero()
+        zero.normalize()
+        self.assertEqual(zero, MVector3.zero())
+        self.assertEqual(MVector3.from_immutable(Vector3.forward), MVector3.forward())
+
+
+class Integer(unittest.TestCase):
+    def test_basic(self):
+        v = Vector3Int(3, -4, 12)
+        self.assertEqual(tuple(v), (3, -4, 12))
+        self.assertEqual(hash(v), hash((3, -4, 12)))
+        self.assertEqual(v.magnitude, 13.0)
+        self.assertEqual(Vector3Int.distance(v, Vector3Int.zero), 13.0)
+        self.assertEqual(repr(v), "Vector3Int(3, -4, 12)")
+        self.assertEqual(v.to_vector3(), Vector3(3.0, -4.0, 12.0))
+
+    def test_operators(self):
+        a = Vector3Int(10, -10, 7)
+        b = Vector3Int(3, 4, 2)
+        self.assertEqual(a + b, Vector3Int(13, -6, 9))
+        self.assertEqual(a - b, Vector3Int(7, -14, 5))
+        self.assertEqual(a * b, Vector3Int(30, -40, 14))
+        self.assertEqual(2 * a, Vector3Int(20, -20, 14))
+        self.assertEqual(a / 2, Vector3(5.0, -5.0, 3.5))
+        self.assertEqual(a // b, Vector3Int(3, -3, 3))
+        self.assertEqual(a % b, Vector3Int(1, 2, 1))
+        self.assertEqual(divmod(a, 3), (a // 3, a % 3))
+        self.assertEqual(abs(-a), Vector3Int(10, 10, 7))
+        self.assertRaises(TypeError, lambda: a * 2.0)
+
+    def test_rounding(self):
+        v = Vector3(-1.5, 2.5, 0.4)
+        self.assertEqual(Vector3Int.ceil(v), Vector3Int(-1, 3, 1))
+        self.assertEqual(Vector3Int.floor(v), Vector3Int(-2, 2, 0))
+        self.assertEqual(Vector3Int.round(v), Vector3Int(-2, 3, 0))
+        self.assertEqual(Vector3Int.trunc(v), Vector3Int(-1, 2, 0))
+
+    def test_mutable(self):
+        v = MVector3Int(1, 2, 3)
+        v += Vector3Int.one
+        v -= MVector3Int(1, 1, 1)
+        v *= 3
+        v //= Vector3Int(1, 2, 4)
+        v %= 4
+        self.assertEqual(v, MVector3Int(3, 3, 2))
+        self.assertEqual(v.to_immutable(), Vector3Int(3, 3, 2))
+        self.assertEqual(MVector3Int.max(v, MVector3Int.forward()), MVector3Int(3, 3, 2))
+
+    def test_buffer_conversion(self):
+        vectors = [Vector3Int(1, -2, 3), Vector3Int(2 ** 62, -(2 ** 62), 0)]
+        packed = Vector3Int.to_buffer(vectors)
+        self.assertIsInstance(packed, Vector3IntBuffer)
+        view = memoryview(packed)
+        self.assertEqual((view.format, view.shape), ("q", (2, 3)))
+        self.assertEqual(Vector3Int.from_buffer(packed), vectors)
+        self.assertEqual(MVector3Int.to_buffer(MVector3Int.from_buffer(packed)), packed)
+        self.assertEqual(memoryview(Vector3Int.to_buffer([])).shape, (0, 3))
+
+        buffer = Vector3IntBuffer([Vector3Int(1, 2, 3), (4, 5, 6)])
+        buffer[0] = (7, 8, 9)
+        self.assertEqual(buffer.to_list(), [Vector3Int(7, 8, 9), Vector3Int(4, 5, 6)])
+        self.assertEqual(Vector3IntBuffer.from_buffer(buffer.copy()), buffer)
+        self.assertRaises(RuntimeError, lambda: buffer.__init__([])) # Would free the memory of exported buffers
+
+
+if __name__ == '__main__':
+    unittest.main()
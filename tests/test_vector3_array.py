@@ -0,0 +1,137 @@
+import unittest
+from array import array
+
+from nalpy.math import Vector3, Vector3Array
+
+
+class BasicFunctionality(unittest.TestCase):
+    def test_construct(self):
+        a = Vector3Array([Vector3(1.0, 2.0, 3.0), (4.0, 5.0, 6.0)])
+        self.assertEqual(len(a), 2)
+        self.assertEqual(a.to_list(), [Vector3(1.0, 2.0, 3.0), Vector3(4.0, 5.0, 6.0)])
+        self.assertEqual(Vector3Array.zeros(3).to_list(), [Vector3.zero] * 3)
+        self.assertRaises(ValueError, lambda: Vector3Array.zeros(-1))
+
+    def test_index(self):
+        a = Vector3Array([Vector3(1.0, 2.0, 3.0), Vector3(4.0, 5.0, 6.0)])
+        self.assertEqual(a[-1], Vector3(4.0, 5.0, 6.0))
+        self.assertRaises(IndexError, lambda: a[2])
+
+        a[0] = (7.0, 8.0, 9.0)
+        self.assertEqual(a[0], Vector3(7.0, 8.0, 9.0))
+
+        view = a[1:]
+        view += Vector3.one
+        self.assertEqual(a[1], Vector3(5.0, 6.0, 7.0))
+        self.assertRaises(ValueError, lambda: a[::2])
+
+    def test_reinit(self):
+        # Re-initializing would free the memory that slices and exported buffers point into
+        a = Vector3Array([Vector3(1.0, 2.0, 3.0), Vector3(4.0, 5.0, 6.0)])
+        view = a[1:]
+        self.assertRaises(RuntimeError, lambda: a.__init__([]))
+        self.assertRaises(RuntimeError, lambda: Vector3Array.zeros(2).__init__([]))
+        self.assertEqual(list(view), [Vector3(4.0, 5.0, 6.0)])
+
+    def test_buffer(self):
+        a = Vector3Array([Vector3(1.0, 2.0, 3.0)])
+        view = memoryview(a)
+        self.assertEqual((view.format, view.shape), ("d", (1, 3)))
+        view[0, 2] = 69.0 # No copy
+        self.assertEqual(a[0], Vector3(1.0, 2.0, 69.0))
+
+        self.assertEqual(Vector3Array.from_buffer(view), a)
+        self.assertRaises(ValueError, lambda: Vector3Array.from_buffer(memoryview(array("d", [1.0, 2.0])).cast("B").cast("d", (1, 2))))
+
+
+class Arithmetic(unittest.TestCase):
+    vectors: tuple[Vector3, ...] = (Vector3(3.5, -7.25, 1.0), Vector3(-10.0, 10.0, 0.0), Vector3(0.0, 2.0, -4.5), Vector3(0.0, 0.0, 0.0))
+    others: tuple[Vector3, ...] = (Vector3(2.0, 3.0, 4.0), Vector3(3.0, -4.0, 0.5), Vector3(-1.5, 5.0, 2.0), Vector3(0.5, 0.25, 1.0))
+
+    def test_matches_vector3(self):
+        a = Vector3Array(self.vectors)
+        b = Vector3Array(self.others)
+        pairs = tuple(zip(self.vectors, self.others))
+
+        self.assertEqual((a + b).to_list(), [x + y for x, y in pairs])
+        self.assertEqual((a - b).to_list(), [x - y for x, y in pairs])
+        self.assertEqual((a * b).to_list(), [x * y for x, y in pairs])
+        self.assertEqual((a / b).to_list(), [x / y for x, y in pairs])
+        self.assertEqual((a // b).to_list(), [x // y for x, y in pairs])
+        self.assertEqual((a % b).to_list(), [x % y for x, y in pairs])
+        self.assertEqual((-a).to_list(), [-x for x in self.vectors])
+        self.assertEqual(abs(a).to_list(), [abs(x) for x in self.vectors])
+        self.assertEqual(a.normalized.to_list(), [x.normalized for x in self.vectors])
+
+    def test_broadcast(self):
+        a = Vector3Array(self.vectors)
+        v = Vector3(3.0, -2.0, 0.5)
+        self.assertEqual((a + v).to_list(), [x + v for x in self.vectors])
+        self.assertEqual((a - v).to_list(), [x - v for x in self.vectors])
+        self.assertEqual((v + a).to_list(), [v + x for x in self.vectors])
+        self.assertEqual((v - a).to_list(), [v - x for x in self.vectors])
+        self.assertEqual((2.0 * a).to_list(), [2.0 * x for x in self.vectors])
+        self.assertEqual((a % -3).to_list(), [x % -3 for x in self.vectors])
+        self.assertRaises(TypeError, lambda: a + 2)
+        self.assertRaises(TypeError, lambda: v - None)
+        self.assertRaises(ValueError, lambda: a + Vector3Array.zeros(1))
+
+    def test_inplace(self):
+        a = Vector3Array(self.vectors)
+        b = a
+        a *= 2
+        a -= Vector3.one
+        a.normalize()
+        self.assertIs(a, b)
+        self.assertEqual(a.to_list(), [(x * 2 - Vector3.one).normalized for x in self.vectors])
+
+
+class BatchedMath(unittest.TestCase):
+    a: tuple[Vector3, ...] = (Vector3(3.4, 7.6, -1.0), Vector3(-1.0, 0.0, 0.0), Vector3(0.0, 0.0, 0.0), Vector3(5.5, -2.25, 3.0))
+    b: tuple[Vector3, ...] = (Vector3(5.77, 3.22, 2.0), Vector3(0.0, 1.0, 0.0), Vector3(1.0, 1.0, 1.0), Vector3(-4.0, -8.0, 0.5))
+
+    def test_scalar_results(self):
+        a = Vector3Array(self.a)
+        b = Vector3Array(self.b)
+        for batched, single in (
+            (Vector3Array.dot, Vector3.dot),
+            (Vector3Array.distance, Vector3.distance),
+            (Vector3Array.angle, Vector3.angle)
+        ):
+            self.assertEqual(list(batched(a, b)), [single(x, y) for x, y in zip(self.a, self.b)])
+            self.assertEqual(list(batched(a, Vector3.up)), [single(x, Vector3.up) for x in self.a])
+
+        self.assertEqual(list(Vector3Array.signed_angle(a, b, Vector3.forward)), [Vector3.signed_angle(x, y, Vector3.forward) for x, y in zip(self.a, self.b)])
+        self.assertEqual(list(Vector3Array.signed_angle(a, Vector3.up, b)), [Vector3.signed_angle(x, Vector3.up, y) for x, y in zip(self.a, self.b)])
+
+    def test_vector_results(self):
+        a = Vector3Array(self.a)
+        b = Vector3Array(self.b)
+        pairs = tuple(zip(self.a, self.b))
+
+        self.assertEqual(Vector3Array.cross(a, b).to_list(), [Vector3.cross(x, y) for x, y in pairs])
+        self.assertEqual(Vector3Array.lerp(a, b, 1.5).to_list(), [Vector3.lerp(x, y, 1.5) for x, y in pairs])
+        self.assertEqual(Vector3Array.lerp_unclamped(a, b, -1.5).to_list(), [Vector3.lerp_unclamped(x, y, -1.5) for x, y in pairs])
+        self.assertEqual(Vector3Array.move_towards(a, b, 2.5).to_list(), [Vector3.move_towards(x, y, 2.5) for x, y in pairs])
+        self.assertEqual(Vector3Array.reflect(a, b).to_list(), [Vector3.reflect(x, y) for x, y in pairs])
+
+        t = array("d", [-1.0, 0.25, 0.5, 2.0])
+        self.assertEqual(Vector3Array.lerp(a, b, t).to_list(), [Vector3.lerp(x, y, ti) for (x, y), ti in zip(pairs, t)])
+
+    def test_out(self):
+        a = Vector3Array([Vector3(2.0, 3.0, 6.0), Vector3(4.0, 6.0, 12.0)])
+        out = array("d", [0.0, 0.0])
+        self.assertIs(Vector3Array.distance(a, Vector3.zero, out), out)
+        self.assertEqual(list(out), [7.0, 14.0])
+        self.assertRaises(ValueError, lambda: Vector3Array.distance(a, Vector3.zero, array("d", [0.0])))
+
+        b = Vector3Array([Vector3.right, Vector3.up])
+        self.assertIs(Vector3Array.cross(b, Vector3.forward, out=b), b) # In place
+        self.assertEqual(b.to_list(), [Vector3.down, Vector3.right])
+
+        self.assertEqual(list(Vector3Array.distance([(0.0, 0.0, 0.0), (2.0, 3.0, 6.0)], Vector3.zero)), [0.0, 7.0])
+        self.assertRaises(ValueError, lambda: Vector3Array.dot(Vector3.one, Vector3.one))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,29 @@
+from timeit import timeit
+from nalpy.math import Vector2, Vector2Array, Vector3, Vector3Array
+
+n = 1_000_000
+runs = 5
+
+vectors2 = [Vector2(i, -i) for i in range(n)]
+vectors3 = [Vector3(i, -i, 0.5 * i) for i in range(n)]
+packed2 = Vector2.to_buffer(vectors2)
+packed3 = Vector3.to_buffer(vectors3)
+
+glbls = {
+    "vectors2": vectors2, "vectors3": vectors3, "packed2": packed2, "packed3": packed3,
+    "Vector2": Vector2, "Vector2Array": Vector2Array, "Vector3": Vector3, "Vector3Array": Vector3Array
+}
+for name, stmt in (
+    ("Vector2 list add", "[v + Vector2.one for v in vectors2]"),
+    ("Vector2Array add", "packed2 + Vector2.one"),
+    ("Vector3 list add", "[v + Vector3.one for v in vectors3]"),
+    ("Vector3Array add", "packed3 + Vector3.one"),
+    ("Vector3 list normalized", "[v.normalized for v in vectors3]"),
+    ("Vector3Array normalized", "packed3.normalized"),
+    ("Vector3 list cross", "[Vector3.cross(v, Vector3.up) for v in vectors3]"),
+    ("Vector3Array.cross", "Vector3Array.cross(packed3, Vector3.up)"),
+    ("Vector3 list distance", "[Vector3.distance(v, Vector3.one) for v in vectors3]"),
+    ("Vector3Array.distance", "Vector3Array.distance(packed3, Vector3.one)")
+):
+    secs = min(timeit(stmt, globals=glbls, number=1) for _ in range(runs))
+    print(f"{name}: {secs * 1000:.1f} ms for {n} vectors")